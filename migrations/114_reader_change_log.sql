@@ -0,0 +1,100 @@
+-- Row-level change log behind conditional GET (ETag / 304) and ?since=
+-- deltas on the IRIS reader feeds: places, characters, factions, zones and
+-- the narrative outline.
+--
+-- Every write to a feed's source tables (the commit path, Orrery ticks,
+-- asset uploads, new-story resets) upserts one row per affected feed row,
+-- stamped with the writer's 64-bit transaction id. Readers fingerprint the
+-- log for ETags and use pg_snapshot_xmin() as a commit-order-safe "since"
+-- horizon, so no shared counter row is locked by concurrent writers.
+
+CREATE TABLE IF NOT EXISTS reader_changes (
+    feed TEXT NOT NULL
+        CHECK (feed IN ('places', 'characters', 'factions', 'zones', 'outline')),
+    row_id BIGINT NOT NULL,
+    changed_xid BIGINT NOT NULL,
+    PRIMARY KEY (feed, row_id)
+);
+
+COMMENT ON TABLE reader_changes IS
+    'Latest writing transaction per reader-feed row; drives gateway ETags and ?since= deltas.';
+COMMENT ON COLUMN reader_changes.row_id IS
+    'Feed row key as served on the wire (outline rows are keyed by chunk id).';
+COMMENT ON COLUMN reader_changes.changed_xid IS
+    'pg_current_xact_id() of the last transaction that inserted, updated or deleted the row.';
+
+CREATE INDEX IF NOT EXISTS ix_reader_changes_feed_xid
+    ON reader_changes (feed, changed_xid);
+
+CREATE OR REPLACE FUNCTION note_reader_change()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    feed_name TEXT := TG_ARGV[0];
+    key_column TEXT := TG_ARGV[1];
+    old_key BIGINT;
+    new_key BIGINT;
+    writer BIGINT := pg_current_xact_id()::text::bigint;
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        EXECUTE format('SELECT ($1).%I', key_column) INTO old_key USING OLD;
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        EXECUTE format('SELECT ($1).%I', key_column) INTO new_key USING NEW;
+    END IF;
+
+    IF old_key IS NOT NULL AND old_key IS DISTINCT FROM new_key THEN
+        INSERT INTO reader_changes (feed, row_id, changed_xid)
+        VALUES (feed_name, old_key, writer)
+        ON CONFLICT (feed, row_id) DO UPDATE SET changed_xid = EXCLUDED.changed_xid;
+    END IF;
+    IF new_key IS NOT NULL THEN
+        INSERT INTO reader_changes (feed, row_id, changed_xid)
+        VALUES (feed_name, new_key, writer)
+        ON CONFLICT (feed, row_id) DO UPDATE SET changed_xid = EXCLUDED.changed_xid;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+COMMENT ON FUNCTION note_reader_change() IS
+    'AFTER ROW trigger body: TG_ARGV[0] is the reader feed, TG_ARGV[1] the column holding the feed row key.';
+
+DROP TRIGGER IF EXISTS reader_changes_places ON places;
+CREATE TRIGGER reader_changes_places
+AFTER INSERT OR UPDATE OR DELETE ON places
+FOR EACH ROW EXECUTE FUNCTION note_reader_change('places', 'id');
+
+DROP TRIGGER IF EXISTS reader_changes_characters ON characters;
+CREATE TRIGGER reader_changes_characters
+AFTER INSERT OR UPDATE OR DELETE ON characters
+FOR EACH ROW EXECUTE FUNCTION note_reader_change('characters', 'id');
+
+-- The cast pane serves each character's display portrait inline.
+DROP TRIGGER IF EXISTS reader_changes_characters ON assets.character_images;
+CREATE TRIGGER reader_changes_characters
+AFTER INSERT OR UPDATE OR DELETE ON assets.character_images
+FOR EACH ROW EXECUTE FUNCTION note_reader_change('characters', 'character_id');
+
+DROP TRIGGER IF EXISTS reader_changes_factions ON factions;
+CREATE TRIGGER reader_changes_factions
+AFTER INSERT OR UPDATE OR DELETE ON factions
+FOR EACH ROW EXECUTE FUNCTION note_reader_change('factions', 'id');
+
+DROP TRIGGER IF EXISTS reader_changes_zones ON zones;
+CREATE TRIGGER reader_changes_zones
+AFTER INSERT OR UPDATE OR DELETE ON zones
+FOR EACH ROW EXECUTE FUNCTION note_reader_change('zones', 'id');
+
+-- Outline rows come from chunk_metadata, filtered by the playable-narrative
+-- predicate on narrative_chunks.authorial_directives.
+DROP TRIGGER IF EXISTS reader_changes_outline ON chunk_metadata;
+CREATE TRIGGER reader_changes_outline
+AFTER INSERT OR UPDATE OR DELETE ON chunk_metadata
+FOR EACH ROW EXECUTE FUNCTION note_reader_change('outline', 'chunk_id');
+
+DROP TRIGGER IF EXISTS reader_changes_outline ON narrative_chunks;
+CREATE TRIGGER reader_changes_outline
+AFTER INSERT OR UPDATE OR DELETE ON narrative_chunks
+FOR EACH ROW EXECUTE FUNCTION note_reader_change('outline', 'id');
@@ -0,0 +1,10 @@
+-- Viewport-bounded map reads: /api/map/places?bbox= and the
+-- /api/map/tiles/{z}/{x}/{y} vector tiles filter places with a planar
+-- lng/lat envelope on coordinates::geometry, which this expression index
+-- serves. The gateway warns once per slot when it is missing.
+
+CREATE INDEX IF NOT EXISTS ix_places_coordinates_geometry
+    ON places USING GIST ((coordinates::geometry));
+
+COMMENT ON INDEX ix_places_coordinates_geometry IS
+    'Supports viewport (bbox and vector-tile) place lookups so map cost follows the viewport, not world size.';
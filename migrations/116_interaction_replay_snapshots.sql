@@ -0,0 +1,32 @@
+-- Replay snapshots for interaction threads: InteractionService.replay folds
+-- from the latest snapshot instead of the start of interaction_events, and
+-- records a new one every REPLAY_SNAPSHOT_INTERVAL folded events
+-- (nexus/interactions/replay.py). Snapshots are derived data; the event
+-- ledger stays authoritative and this table may be truncated at any time.
+
+CREATE TABLE IF NOT EXISTS interaction_replay_snapshots (
+    interaction_id UUID NOT NULL
+        REFERENCES interactions(id) ON DELETE RESTRICT,
+    interaction_revision BIGINT NOT NULL CHECK (interaction_revision >= 1),
+    last_event_id BIGINT NOT NULL
+        REFERENCES interaction_events(id) ON DELETE RESTRICT,
+    fold_version INTEGER NOT NULL CHECK (fold_version >= 1),
+    state JSONB NOT NULL CHECK (jsonb_typeof(state) = 'object'),
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (interaction_id, interaction_revision)
+);
+
+COMMENT ON TABLE interaction_replay_snapshots IS
+    'Derived replay fold checkpoints; replay resumes after last_event_id instead of refolding the whole ledger.';
+COMMENT ON COLUMN interaction_replay_snapshots.interaction_id IS
+    'Interaction thread whose replay state this snapshot captures.';
+COMMENT ON COLUMN interaction_replay_snapshots.interaction_revision IS
+    'Interaction revision in effect after last_event_id; one snapshot per revision.';
+COMMENT ON COLUMN interaction_replay_snapshots.last_event_id IS
+    'Last interaction_events id folded into state; replay continues with later ids.';
+COMMENT ON COLUMN interaction_replay_snapshots.fold_version IS
+    'Replay fold version that wrote state; other versions are ignored and rebuilt.';
+COMMENT ON COLUMN interaction_replay_snapshots.state IS
+    'Folded status, revision, lease, membership history, grants, and transition types.';
+COMMENT ON COLUMN interaction_replay_snapshots.created_at IS
+    'Time this snapshot was written or last advanced within its revision.';
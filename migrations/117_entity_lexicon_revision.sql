@@ -0,0 +1,139 @@
+-- Monotonic revision for the per-slot entity lexicon: character names,
+-- summaries and aliases, place names and zones, faction names and summaries
+-- (nexus/memory/entity_lexicon.py). Presence audits, roster reads and LORE's
+-- entity detection share one compiled lexicon per slot and reload it only
+-- when this counter moves.
+--
+-- The triggers bump on every write that can change a lexicon record, so the
+-- commit handler, trait compiler, Retrograde maturation, tag manifests and
+-- new-story resets all invalidate without an explicit call. Per-turn state
+-- columns (current_activity, current_location, emotional_state) are left out
+-- so ordinary commits keep the cache warm. The counter row is locked by the
+-- bumping transaction until commit, which orders revisions by commit.
+
+CREATE TABLE IF NOT EXISTS entity_lexicon_revision (
+    singleton BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (singleton),
+    revision BIGINT NOT NULL DEFAULT 0 CHECK (revision >= 0),
+    bumped_xid BIGINT,
+    bumped_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+COMMENT ON TABLE entity_lexicon_revision IS
+    'Single-row revision counter for entity names, aliases and summaries; cached lexicons reload when it changes.';
+COMMENT ON COLUMN entity_lexicon_revision.revision IS
+    'Incremented once per row write that inserts, deletes or changes a lexicon record.';
+COMMENT ON COLUMN entity_lexicon_revision.bumped_xid IS
+    'pg_current_xact_id() of the last bumping transaction; readers inside it do not cache their uncommitted view.';
+
+INSERT INTO entity_lexicon_revision (singleton) VALUES (TRUE)
+ON CONFLICT (singleton) DO NOTHING;
+
+-- Slots cloned or restored from a template carry schema_migrations but not
+-- this row, so the bump creates it when it is missing (readers treat a
+-- missing row as revision 0).
+CREATE OR REPLACE FUNCTION bump_entity_lexicon_revision()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    INSERT INTO entity_lexicon_revision (singleton, revision, bumped_xid, bumped_at)
+    VALUES (TRUE, 1, pg_current_xact_id()::text::bigint, NOW())
+    ON CONFLICT (singleton) DO UPDATE
+    SET revision = entity_lexicon_revision.revision + 1,
+        bumped_xid = EXCLUDED.bumped_xid,
+        bumped_at = EXCLUDED.bumped_at;
+    RETURN NULL;
+END;
+$$;
+
+COMMENT ON FUNCTION bump_entity_lexicon_revision() IS
+    'AFTER trigger body: advances entity_lexicon_revision for any lexicon-visible write.';
+
+DROP TRIGGER IF EXISTS entity_lexicon_characters ON characters;
+CREATE TRIGGER entity_lexicon_characters
+AFTER INSERT OR DELETE ON characters
+FOR EACH ROW EXECUTE FUNCTION bump_entity_lexicon_revision();
+
+DROP TRIGGER IF EXISTS entity_lexicon_characters_update ON characters;
+CREATE TRIGGER entity_lexicon_characters_update
+AFTER UPDATE OF id, name, summary ON characters
+FOR EACH ROW
+WHEN (
+    OLD.id IS DISTINCT FROM NEW.id
+    OR OLD.name IS DISTINCT FROM NEW.name
+    OR OLD.summary IS DISTINCT FROM NEW.summary
+)
+EXECUTE FUNCTION bump_entity_lexicon_revision();
+
+DROP TRIGGER IF EXISTS entity_lexicon_character_aliases ON character_aliases;
+CREATE TRIGGER entity_lexicon_character_aliases
+AFTER INSERT OR UPDATE OR DELETE ON character_aliases
+FOR EACH ROW EXECUTE FUNCTION bump_entity_lexicon_revision();
+
+DROP TRIGGER IF EXISTS entity_lexicon_places ON places;
+CREATE TRIGGER entity_lexicon_places
+AFTER INSERT OR DELETE ON places
+FOR EACH ROW EXECUTE FUNCTION bump_entity_lexicon_revision();
+
+DROP TRIGGER IF EXISTS entity_lexicon_places_update ON places;
+CREATE TRIGGER entity_lexicon_places_update
+AFTER UPDATE OF id, name, type, zone ON places
+FOR EACH ROW
+WHEN (
+    OLD.id IS DISTINCT FROM NEW.id
+    OR OLD.name IS DISTINCT FROM NEW.name
+    OR OLD.type IS DISTINCT FROM NEW.type
+    OR OLD.zone IS DISTINCT FROM NEW.zone
+)
+EXECUTE FUNCTION bump_entity_lexicon_revision();
+
+DROP TRIGGER IF EXISTS entity_lexicon_factions ON factions;
+CREATE TRIGGER entity_lexicon_factions
+AFTER INSERT OR DELETE ON factions
+FOR EACH ROW EXECUTE FUNCTION bump_entity_lexicon_revision();
+
+DROP TRIGGER IF EXISTS entity_lexicon_factions_update ON factions;
+CREATE TRIGGER entity_lexicon_factions_update
+AFTER UPDATE OF id, name, summary ON factions
+FOR EACH ROW
+WHEN (
+    OLD.id IS DISTINCT FROM NEW.id
+    OR OLD.name IS DISTINCT FROM NEW.name
+    OR OLD.summary IS DISTINCT FROM NEW.summary
+)
+EXECUTE FUNCTION bump_entity_lexicon_revision();
+
+-- TRUNCATE skips row triggers; new-story resets that truncate still bump.
+DROP TRIGGER IF EXISTS entity_lexicon_truncate ON characters;
+CREATE TRIGGER entity_lexicon_truncate
+AFTER TRUNCATE ON characters
+FOR EACH STATEMENT EXECUTE FUNCTION bump_entity_lexicon_revision();
+
+DROP TRIGGER IF EXISTS entity_lexicon_truncate ON character_aliases;
+CREATE TRIGGER entity_lexicon_truncate
+AFTER TRUNCATE ON character_aliases
+FOR EACH STATEMENT EXECUTE FUNCTION bump_entity_lexicon_revision();
+
+DROP TRIGGER IF EXISTS entity_lexicon_truncate ON places;
+CREATE TRIGGER entity_lexicon_truncate
+AFTER TRUNCATE ON places
+FOR EACH STATEMENT EXECUTE FUNCTION bump_entity_lexicon_revision();
+
+DROP TRIGGER IF EXISTS entity_lexicon_truncate ON factions;
+CREATE TRIGGER entity_lexicon_truncate
+AFTER TRUNCATE ON factions
+FOR EACH STATEMENT EXECUTE FUNCTION bump_entity_lexicon_revision();
+
+-- Fire even under session_replication_role = replica (bulk loads and fixture
+-- seeding), which would otherwise leave cached lexicons silently stale.
+ALTER TABLE characters ENABLE ALWAYS TRIGGER entity_lexicon_characters;
+ALTER TABLE characters ENABLE ALWAYS TRIGGER entity_lexicon_characters_update;
+ALTER TABLE characters ENABLE ALWAYS TRIGGER entity_lexicon_truncate;
+ALTER TABLE character_aliases ENABLE ALWAYS TRIGGER entity_lexicon_character_aliases;
+ALTER TABLE character_aliases ENABLE ALWAYS TRIGGER entity_lexicon_truncate;
+ALTER TABLE places ENABLE ALWAYS TRIGGER entity_lexicon_places;
+ALTER TABLE places ENABLE ALWAYS TRIGGER entity_lexicon_places_update;
+ALTER TABLE places ENABLE ALWAYS TRIGGER entity_lexicon_truncate;
+ALTER TABLE factions ENABLE ALWAYS TRIGGER entity_lexicon_factions;
+ALTER TABLE factions ENABLE ALWAYS TRIGGER entity_lexicon_factions_update;
+ALTER TABLE factions ENABLE ALWAYS TRIGGER entity_lexicon_truncate;
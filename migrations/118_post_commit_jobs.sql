@@ -0,0 +1,61 @@
+-- Durable post-commit outbox (nexus/api/post_commit_jobs.py). The sync
+-- commit transaction enqueues follow-up work for the accepted chunk
+-- (summaries, chunk embedding, the presence audit, correspondence
+-- compaction) atomically with the chunk insert; a per-slot runner leases,
+-- runs and retries the jobs after the accept response has returned. A
+-- process death mid-job leaves an expired lease that the next drain resumes.
+
+CREATE TABLE IF NOT EXISTS post_commit_jobs (
+    id              bigserial PRIMARY KEY,
+    kind            text NOT NULL CHECK (
+        kind IN (
+            'summary',
+            'chunk_embedding',
+            'presence_audit',
+            'correspondence_compaction'
+        )
+    ),
+    idempotency_key text NOT NULL CHECK (idempotency_key <> ''),
+    chunk_id        bigint NOT NULL REFERENCES narrative_chunks(id),
+    payload         jsonb NOT NULL DEFAULT '{}'::jsonb
+        CHECK (jsonb_typeof(payload) = 'object'),
+    state           orrery_job_state NOT NULL DEFAULT 'queued',
+    attempts        integer NOT NULL DEFAULT 0 CHECK (attempts >= 0),
+    available_at    timestamptz NOT NULL DEFAULT now(),
+    lease_until     timestamptz,
+    locked_by       text,
+    lease_nonce     uuid,
+    last_error      text,
+    created_at      timestamptz NOT NULL DEFAULT now(),
+    updated_at      timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_post_commit_jobs_kind_key
+    ON post_commit_jobs (kind, idempotency_key);
+CREATE INDEX IF NOT EXISTS ix_post_commit_jobs_state_available
+    ON post_commit_jobs (state, available_at);
+
+COMMENT ON TABLE post_commit_jobs IS
+    'Transactional outbox for follow-up work on accepted chunks, drained by the per-slot post-commit job runner.';
+COMMENT ON COLUMN post_commit_jobs.kind IS
+    'Handler that runs the job: summary, chunk_embedding, presence_audit, or correspondence_compaction.';
+COMMENT ON COLUMN post_commit_jobs.idempotency_key IS
+    'Per-kind identity of the work; a second enqueue of the same key is a no-op.';
+COMMENT ON COLUMN post_commit_jobs.chunk_id IS
+    'Chunk the work is about (the accepted chunk, or the chunk to embed).';
+COMMENT ON COLUMN post_commit_jobs.payload IS
+    'Handler arguments captured at enqueue time.';
+COMMENT ON COLUMN post_commit_jobs.state IS
+    'queued -> leased -> succeeded | failed. Failures below the handler attempt cap requeue with exponential backoff.';
+COMMENT ON COLUMN post_commit_jobs.attempts IS
+    'Lease count. Incremented when a runner leases the job.';
+COMMENT ON COLUMN post_commit_jobs.available_at IS
+    'Earliest time a runner may lease the job (retry backoff).';
+COMMENT ON COLUMN post_commit_jobs.lease_until IS
+    'Current lease expiry; an expired lease is re-leased by the next drain.';
+COMMENT ON COLUMN post_commit_jobs.locked_by IS
+    'Runner identity (host:pid) holding the current lease.';
+COMMENT ON COLUMN post_commit_jobs.lease_nonce IS
+    'Fencing token for the current lease; completion writes must present it.';
+COMMENT ON COLUMN post_commit_jobs.last_error IS
+    'Most recent handler failure, kept for nexus jobs.';
@@ -0,0 +1,51 @@
+-- Hierarchical narrative summaries (scripts/summarize_narrative.py). Episode
+-- summaries are built from scene-window digests and season summaries from the
+-- stored episode summaries, so no request ever carries a whole season of
+-- prose. Each level records the content hash of its inputs; a level whose
+-- inputs hash the same as last time is reused instead of re-summarized.
+-- Closed windows are digested by a post-commit job as chunks are accepted.
+
+CREATE TABLE IF NOT EXISTS scene_window_digests (
+    season        integer NOT NULL,
+    episode       integer NOT NULL,
+    window_index  integer NOT NULL CHECK (window_index >= 0),
+    content_hash  text NOT NULL CHECK (content_hash <> ''),
+    chunk_ids     bigint[] NOT NULL,
+    digest        jsonb NOT NULL CHECK (jsonb_typeof(digest) = 'object'),
+    model         text NOT NULL,
+    input_tokens  integer,
+    output_tokens integer,
+    updated_at    timestamptz NOT NULL DEFAULT now(),
+    PRIMARY KEY (season, episode, window_index)
+);
+
+COMMENT ON TABLE scene_window_digests IS
+    'Digest of a fixed-size window of consecutive scenes; the input to episode summaries.';
+COMMENT ON COLUMN scene_window_digests.window_index IS
+    'Zero-based window position in the episode (chunk id order, summaries.scene_window_size chunks per window).';
+COMMENT ON COLUMN scene_window_digests.content_hash IS
+    'sha256 over the window''s chunk ids and raw text; a mismatch re-digests the window.';
+COMMENT ON COLUMN scene_window_digests.chunk_ids IS
+    'Chunks the digest covers, in order.';
+
+ALTER TABLE episodes ADD COLUMN IF NOT EXISTS summary_source_hash text;
+ALTER TABLE seasons ADD COLUMN IF NOT EXISTS summary_source_hash text;
+
+COMMENT ON COLUMN episodes.summary_source_hash IS
+    'Hash of the scene-window digests the summary was built from; NULL for summaries built from raw chunks.';
+COMMENT ON COLUMN seasons.summary_source_hash IS
+    'Hash of the episode summaries the summary was built from; NULL for summaries built from raw chunks.';
+
+ALTER TABLE post_commit_jobs DROP CONSTRAINT IF EXISTS post_commit_jobs_kind_check;
+ALTER TABLE post_commit_jobs ADD CONSTRAINT post_commit_jobs_kind_check CHECK (
+    kind IN (
+        'summary',
+        'summary_digest',
+        'chunk_embedding',
+        'presence_audit',
+        'correspondence_compaction'
+    )
+);
+
+COMMENT ON COLUMN post_commit_jobs.kind IS
+    'Handler that runs the job: summary, summary_digest, chunk_embedding, presence_audit, or correspondence_compaction.';
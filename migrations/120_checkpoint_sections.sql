@@ -0,0 +1,50 @@
+-- Content-addressed checkpoint sections (nexus/agents/orrery/reconstruction.py).
+-- A checkpoint used to store one full JSONB copy of the mutable state surface
+-- per row, so every interval checkpoint repeated every unchanged section. New
+-- checkpoints store each section body once in state_checkpoint_sections, keyed
+-- by the sha256 of its canonical jsonb text, and keep only a section -> hash
+-- map on the checkpoint row. Rows captured before this migration keep their
+-- inline state document; state_checkpoint_document() reads both shapes.
+
+CREATE TABLE IF NOT EXISTS state_checkpoint_sections (
+    section_hash text PRIMARY KEY CHECK (section_hash ~ '^[0-9a-f]{64}$'),
+    body         jsonb NOT NULL,
+    created_at   timestamptz NOT NULL DEFAULT now()
+);
+
+COMMENT ON TABLE state_checkpoint_sections IS
+    'Checkpoint section bodies, stored once per distinct content and shared by every checkpoint that captured it.';
+COMMENT ON COLUMN state_checkpoint_sections.section_hash IS
+    'Hex sha256 of body::text (jsonb canonical text).';
+
+ALTER TABLE state_checkpoints ADD COLUMN IF NOT EXISTS section_hashes jsonb;
+ALTER TABLE state_checkpoints ALTER COLUMN state DROP NOT NULL;
+ALTER TABLE state_checkpoints DROP CONSTRAINT IF EXISTS state_checkpoints_document_check;
+ALTER TABLE state_checkpoints ADD CONSTRAINT state_checkpoints_document_check CHECK (
+    (state IS NULL) <> (section_hashes IS NULL)
+    AND (section_hashes IS NULL OR jsonb_typeof(section_hashes) = 'object')
+);
+
+COMMENT ON COLUMN state_checkpoints.state IS
+    'Inline checkpoint document; set only on checkpoints captured before migration 120.';
+COMMENT ON COLUMN state_checkpoints.section_hashes IS
+    'Map of section name to state_checkpoint_sections.section_hash; read the document with state_checkpoint_document().';
+
+CREATE OR REPLACE FUNCTION state_checkpoint_document(
+    inline_state jsonb,
+    section_hashes jsonb
+) RETURNS jsonb
+LANGUAGE sql STABLE AS $$
+    SELECT coalesce(
+        inline_state,
+        (
+            SELECT coalesce(jsonb_object_agg(entry.key, blob.body), '{}'::jsonb)
+            FROM jsonb_each_text(section_hashes) AS entry
+            JOIN state_checkpoint_sections blob
+              ON blob.section_hash = entry.value
+        )
+    )
+$$;
+
+COMMENT ON FUNCTION state_checkpoint_document(jsonb, jsonb) IS
+    'Reassemble a checkpoint document from state_checkpoints (state, section_hashes).';
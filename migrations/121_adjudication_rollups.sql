@@ -0,0 +1,294 @@
+-- Incrementally maintained adjudication-history rollups
+-- (nexus/agents/orrery/history.py). The history payload used to re-read the
+-- whole of orrery_adjudication_log and orrery_resolutions and recompute defer
+-- streaks in Python on every call, which grows without bound as a slot ages.
+-- Triggers on both ledgers now keep three derived tables current inside the
+-- writing transaction (the tick commit):
+--
+--   orrery_adjudication_template_rollups  ruling counts per template, action
+--                                         and adjudication source
+--   orrery_adjudication_proposal_rollups  per-proposal counts, current defer
+--                                         streak and last ruling
+--   orrery_adjudication_defer_streaks     every defer streak with its outcome
+--
+-- A proposal's rollup and streaks are recomputed from that proposal's own
+-- ledger rows whenever one of them changes, so out-of-order and deleted rows
+-- stay exact. Streak order is (tick, log rows before the tick's committed
+-- resolution, log id), the order history.py has always used.
+
+CREATE TABLE IF NOT EXISTS orrery_adjudication_template_rollups (
+    template_id                   text NOT NULL,
+    action                        text NOT NULL
+        CHECK (action IN ('defer', 'replace', 'void')),
+    adjudication_source           text NOT NULL,
+    rulings                       bigint NOT NULL DEFAULT 0 CHECK (rulings >= 0),
+    rulings_with_subject          bigint NOT NULL DEFAULT 0,
+    replaced_with_delta_committed bigint NOT NULL DEFAULT 0,
+    PRIMARY KEY (template_id, action, adjudication_source)
+);
+
+COMMENT ON TABLE orrery_adjudication_template_rollups IS
+    'Trigger-maintained orrery_adjudication_log counts per (template, action, source).';
+COMMENT ON COLUMN orrery_adjudication_template_rollups.rulings_with_subject IS
+    'Rulings carrying actor_entity_id (the post-063 epoch).';
+COMMENT ON COLUMN orrery_adjudication_template_rollups.replaced_with_delta_committed IS
+    'Replace rulings that materialized a resolution (applied_resolution_id set).';
+
+CREATE TABLE IF NOT EXISTS orrery_adjudication_proposal_rollups (
+    proposal_id     text PRIMARY KEY,
+    template_id     text NOT NULL,
+    actor_entity_id bigint,
+    defers          integer NOT NULL,
+    replaces        integer NOT NULL,
+    voids           integer NOT NULL,
+    commits         integer NOT NULL,
+    current_streak  integer NOT NULL CHECK (current_streak >= 0),
+    last_event      text NOT NULL
+        CHECK (last_event IN ('defer', 'replace', 'void', 'committed')),
+    last_tick       bigint NOT NULL,
+    last_log_id     bigint
+);
+
+COMMENT ON TABLE orrery_adjudication_proposal_rollups IS
+    'Trigger-maintained per-proposal adjudication summary (template_id:binding_hash).';
+COMMENT ON COLUMN orrery_adjudication_proposal_rollups.actor_entity_id IS
+    'First committed resolution actor, else first logged ruling actor.';
+COMMENT ON COLUMN orrery_adjudication_proposal_rollups.current_streak IS
+    'Length of the open defer streak; 0 when the last event was not a defer.';
+COMMENT ON COLUMN orrery_adjudication_proposal_rollups.last_event IS
+    'Latest ruling or committed resolution; last_log_id is NULL for committed.';
+
+CREATE INDEX IF NOT EXISTS ix_orrery_adjudication_proposal_rollups_template_id
+    ON orrery_adjudication_proposal_rollups (template_id);
+
+CREATE TABLE IF NOT EXISTS orrery_adjudication_defer_streaks (
+    proposal_id  text NOT NULL,
+    start_tick   bigint NOT NULL,
+    start_log_id bigint NOT NULL,
+    end_tick     bigint NOT NULL,
+    end_log_id   bigint NOT NULL,
+    length       integer NOT NULL CHECK (length > 0),
+    outcome      text NOT NULL
+        CHECK (outcome IN ('ratified', 'replace', 'void', 'open')),
+    outcome_tick bigint,
+    PRIMARY KEY (proposal_id, start_log_id)
+);
+
+COMMENT ON TABLE orrery_adjudication_defer_streaks IS
+    'Trigger-maintained runs of consecutive defer rulings per proposal and what ended them.';
+COMMENT ON COLUMN orrery_adjudication_defer_streaks.outcome IS
+    'ratified (a committed resolution), replace, void, or open while nothing has ended the run.';
+
+-- Per-proposal recompute and the recent-rulings page read the ledgers by
+-- proposal and by tick.
+CREATE INDEX IF NOT EXISTS ix_orrery_adjudication_log_proposal_tick
+    ON orrery_adjudication_log (proposal_id, tick_chunk_id, id);
+CREATE INDEX IF NOT EXISTS ix_orrery_adjudication_log_rulings
+    ON orrery_adjudication_log (tick_chunk_id DESC, id DESC)
+    WHERE action IN ('defer', 'void');
+CREATE INDEX IF NOT EXISTS ix_orrery_adjudication_log_applied_replace
+    ON orrery_adjudication_log (applied_resolution_id)
+    WHERE action = 'replace';
+CREATE INDEX IF NOT EXISTS ix_orrery_resolutions_template_binding
+    ON orrery_resolutions (template_id, binding_hash, tick_chunk_id);
+
+CREATE OR REPLACE FUNCTION refresh_orrery_adjudication_proposal(target text)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    -- proposal_id is template_id:binding_hash and binding hashes never
+    -- contain ':'.
+    target_template text := regexp_replace(target, ':[^:]*$', '');
+    target_binding text := regexp_replace(target, '^.*:', '');
+BEGIN
+    DELETE FROM orrery_adjudication_defer_streaks WHERE proposal_id = target;
+    DELETE FROM orrery_adjudication_proposal_rollups WHERE proposal_id = target;
+
+    WITH events AS (
+        SELECT tick_chunk_id AS tick, 0 AS kind, id AS log_id,
+               action AS event, template_id, actor_entity_id
+        FROM orrery_adjudication_log
+        WHERE proposal_id = target
+        UNION ALL
+        SELECT tick_chunk_id, 1, NULL::bigint, 'committed', template_id,
+               actor_entity_id
+        FROM orrery_resolutions
+        WHERE template_id = target_template AND binding_hash = target_binding
+    ),
+    ordered AS (
+        SELECT events.*,
+               row_number() OVER (ORDER BY tick, kind, log_id) AS position
+        FROM events
+    ),
+    runs AS (
+        SELECT position - row_number() OVER (ORDER BY position) AS run, position
+        FROM ordered
+        WHERE event = 'defer'
+    ),
+    streaks AS (
+        SELECT min(position) AS first_position,
+               max(position) AS last_position,
+               count(*) AS length
+        FROM runs
+        GROUP BY run
+    ),
+    stored_streaks AS (
+        INSERT INTO orrery_adjudication_defer_streaks (
+            proposal_id, start_tick, start_log_id, end_tick, end_log_id,
+            length, outcome, outcome_tick
+        )
+        SELECT target, opener.tick, opener.log_id, closer.tick, closer.log_id,
+               streaks.length,
+               coalesce(
+                   CASE ender.event
+                       WHEN 'committed' THEN 'ratified'
+                       ELSE ender.event
+                   END,
+                   'open'
+               ),
+               ender.tick
+        FROM streaks
+        JOIN ordered opener ON opener.position = streaks.first_position
+        JOIN ordered closer ON closer.position = streaks.last_position
+        LEFT JOIN ordered ender ON ender.position = streaks.last_position + 1
+        RETURNING outcome, length
+    )
+    INSERT INTO orrery_adjudication_proposal_rollups (
+        proposal_id, template_id, actor_entity_id, defers, replaces, voids,
+        commits, current_streak, last_event, last_tick, last_log_id
+    )
+    SELECT target,
+           coalesce(
+               (array_agg(template_id ORDER BY position DESC)
+                   FILTER (WHERE kind = 0))[1],
+               target_template
+           ),
+           coalesce(
+               (array_agg(actor_entity_id ORDER BY position)
+                   FILTER (WHERE kind = 1 AND actor_entity_id IS NOT NULL))[1],
+               (array_agg(actor_entity_id ORDER BY position)
+                   FILTER (WHERE kind = 0 AND actor_entity_id IS NOT NULL))[1]
+           ),
+           count(*) FILTER (WHERE event = 'defer'),
+           count(*) FILTER (WHERE event = 'replace'),
+           count(*) FILTER (WHERE event = 'void'),
+           count(*) FILTER (WHERE event = 'committed'),
+           coalesce(
+               (SELECT length FROM stored_streaks WHERE outcome = 'open'), 0
+           ),
+           (array_agg(event ORDER BY position DESC))[1],
+           (array_agg(tick ORDER BY position DESC))[1],
+           (array_agg(log_id ORDER BY position DESC))[1]
+    FROM ordered
+    HAVING count(*) > 0;
+END;
+$$;
+
+COMMENT ON FUNCTION refresh_orrery_adjudication_proposal(text) IS
+    'Recompute one proposal''s rollup row and defer streaks from its ledger rows.';
+
+CREATE OR REPLACE FUNCTION note_orrery_adjudication_ruling()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        UPDATE orrery_adjudication_template_rollups
+        SET rulings = rulings - 1,
+            rulings_with_subject = rulings_with_subject
+                - (OLD.actor_entity_id IS NOT NULL)::int,
+            replaced_with_delta_committed = replaced_with_delta_committed
+                - (OLD.action = 'replace'
+                   AND OLD.applied_resolution_id IS NOT NULL)::int
+        WHERE template_id = OLD.template_id
+          AND action = OLD.action
+          AND adjudication_source = OLD.adjudication_source;
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        INSERT INTO orrery_adjudication_template_rollups AS rollup (
+            template_id, action, adjudication_source, rulings,
+            rulings_with_subject, replaced_with_delta_committed
+        ) VALUES (
+            NEW.template_id, NEW.action, NEW.adjudication_source, 1,
+            (NEW.actor_entity_id IS NOT NULL)::int,
+            (NEW.action = 'replace' AND NEW.applied_resolution_id IS NOT NULL)::int
+        )
+        ON CONFLICT (template_id, action, adjudication_source) DO UPDATE
+        SET rulings = rollup.rulings + EXCLUDED.rulings,
+            rulings_with_subject = rollup.rulings_with_subject
+                + EXCLUDED.rulings_with_subject,
+            replaced_with_delta_committed = rollup.replaced_with_delta_committed
+                + EXCLUDED.replaced_with_delta_committed;
+    END IF;
+
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM refresh_orrery_adjudication_proposal(OLD.proposal_id);
+    END IF;
+    IF TG_OP = 'INSERT'
+       OR (TG_OP = 'UPDATE' AND NEW.proposal_id IS DISTINCT FROM OLD.proposal_id)
+    THEN
+        PERFORM refresh_orrery_adjudication_proposal(NEW.proposal_id);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION note_orrery_resolution_ruling()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM refresh_orrery_adjudication_proposal(
+            OLD.template_id || ':' || OLD.binding_hash
+        );
+    END IF;
+    IF TG_OP = 'INSERT'
+       OR (TG_OP = 'UPDATE'
+           AND (NEW.template_id, NEW.binding_hash)
+               IS DISTINCT FROM (OLD.template_id, OLD.binding_hash))
+    THEN
+        PERFORM refresh_orrery_adjudication_proposal(
+            NEW.template_id || ':' || NEW.binding_hash
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+-- Backfill from the existing ledgers before the triggers take over.
+TRUNCATE orrery_adjudication_template_rollups,
+         orrery_adjudication_proposal_rollups,
+         orrery_adjudication_defer_streaks;
+
+INSERT INTO orrery_adjudication_template_rollups (
+    template_id, action, adjudication_source, rulings, rulings_with_subject,
+    replaced_with_delta_committed
+)
+SELECT template_id, action, adjudication_source, count(*),
+       count(actor_entity_id),
+       count(*) FILTER (
+           WHERE action = 'replace' AND applied_resolution_id IS NOT NULL
+       )
+FROM orrery_adjudication_log
+GROUP BY template_id, action, adjudication_source;
+
+SELECT refresh_orrery_adjudication_proposal(proposal_id)
+FROM (
+    SELECT proposal_id FROM orrery_adjudication_log
+    UNION
+    SELECT template_id || ':' || binding_hash FROM orrery_resolutions
+) proposals;
+
+DROP TRIGGER IF EXISTS orrery_adjudication_rollups ON orrery_adjudication_log;
+CREATE TRIGGER orrery_adjudication_rollups
+AFTER INSERT OR UPDATE OR DELETE ON orrery_adjudication_log
+FOR EACH ROW EXECUTE FUNCTION note_orrery_adjudication_ruling();
+
+DROP TRIGGER IF EXISTS orrery_adjudication_rollups ON orrery_resolutions;
+CREATE TRIGGER orrery_adjudication_rollups
+AFTER INSERT OR DELETE OR UPDATE OF tick_chunk_id, template_id, binding_hash,
+    actor_entity_id
+ON orrery_resolutions
+FOR EACH ROW EXECUTE FUNCTION note_orrery_resolution_ruling();
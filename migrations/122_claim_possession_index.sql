@@ -0,0 +1,224 @@
+-- Incrementally maintained claim-possession index for Epistemics hydration
+-- (nexus/agents/orrery/epistemics.py). Hydration used to rebuild possession
+-- every tick from claims, world_events, world_event_entities and
+-- claim_awareness with a three-way UNION and a lateral subject expansion,
+-- a cost that grows with every mint, account variant and revelation.
+--
+-- claim_possession_index holds one row per (entity, claim, tier):
+--
+--   tier = 'subject'                      the entity is an actor, target or
+--                                         listed participant of the claim's
+--                                         anchoring world event
+--   tier = participant/witness/told/      the entity holds a claim_awareness
+--          granted                        row for the claim
+--
+-- Each row carries the anchor-visibility inputs hydration filters on (the
+-- event's tick chunk, the acquisition chunk and wall-clock time) plus the
+-- claim's scope, so an entity universe resolves with index lookups alone.
+-- Triggers keep it current inside the writing transaction, which covers
+-- mint_claim_for_event, account variants, record_revelation, awareness
+-- minting, promote_claim_scope and checkpoint restores alike.
+
+CREATE TABLE IF NOT EXISTS claim_possession_index (
+    entity_id                  bigint NOT NULL,
+    claim_id                   bigint NOT NULL REFERENCES claims(id)
+                                   ON DELETE CASCADE,
+    tier                       text NOT NULL
+        CHECK (tier IN ('subject', 'participant', 'witness', 'told', 'granted')),
+    acquired_at                timestamptz,
+    acquired_chunk_id          bigint,
+    event_chunk_id             bigint NOT NULL,
+    scope                      text NOT NULL
+        CHECK (scope IN ('common', 'bounded', 'private')),
+    channel                    text,
+    immediate_source_entity_id bigint,
+    PRIMARY KEY (entity_id, claim_id, tier)
+);
+
+CREATE INDEX IF NOT EXISTS ix_claim_possession_index_claim
+    ON claim_possession_index (claim_id, tier);
+
+COMMENT ON TABLE claim_possession_index IS
+    'Trigger-maintained claim possession by entity: event subjects and awareness knowers.';
+COMMENT ON COLUMN claim_possession_index.tier IS
+    'subject for event participants, else the claim_awareness source_tier.';
+COMMENT ON COLUMN claim_possession_index.acquired_at IS
+    'claim_awareness.created_at; NULL for subject rows.';
+COMMENT ON COLUMN claim_possession_index.acquired_chunk_id IS
+    'claim_awareness.source_chunk_id; NULL for subject rows.';
+COMMENT ON COLUMN claim_possession_index.event_chunk_id IS
+    'world_events.tick_chunk_id of the claim''s anchoring event.';
+COMMENT ON COLUMN claim_possession_index.scope IS
+    'Copy of claims.scope, rewritten when the claim is promoted.';
+
+-- Rebuild one claim's subject rows and re-stamp its knower rows with the
+-- claim's current scope and event chunk.
+CREATE OR REPLACE FUNCTION refresh_claim_possession_subjects(target bigint)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    DELETE FROM claim_possession_index
+    WHERE claim_id = target AND tier = 'subject';
+
+    INSERT INTO claim_possession_index (
+        entity_id, claim_id, tier, event_chunk_id, scope
+    )
+    SELECT DISTINCT subjects.entity_id, c.id, 'subject', we.tick_chunk_id,
+           c.scope
+    FROM claims c
+    JOIN world_events we ON we.id = c.world_event_id
+    JOIN LATERAL (
+        SELECT we.actor_entity_id AS entity_id
+        WHERE we.actor_entity_id IS NOT NULL
+        UNION
+        SELECT we.target_entity_id AS entity_id
+        WHERE we.target_entity_id IS NOT NULL
+        UNION
+        SELECT wee.entity_id
+        FROM world_event_entities wee
+        WHERE wee.event_id = we.id
+    ) subjects ON true
+    WHERE c.id = target;
+
+    UPDATE claim_possession_index p
+    SET event_chunk_id = we.tick_chunk_id,
+        scope = c.scope
+    FROM claims c
+    JOIN world_events we ON we.id = c.world_event_id
+    WHERE c.id = target
+      AND p.claim_id = target
+      AND p.tier <> 'subject'
+      AND (p.event_chunk_id, p.scope) IS DISTINCT FROM (we.tick_chunk_id, c.scope);
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION note_claim_possession_awareness()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        DELETE FROM claim_possession_index
+        WHERE entity_id = OLD.knower_entity_id
+          AND claim_id = OLD.claim_id
+          AND tier = OLD.source_tier;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO claim_possession_index (
+            entity_id, claim_id, tier, acquired_at, acquired_chunk_id,
+            event_chunk_id, scope, channel, immediate_source_entity_id
+        )
+        SELECT NEW.knower_entity_id, c.id, NEW.source_tier, NEW.created_at,
+               NEW.source_chunk_id, we.tick_chunk_id, c.scope, NEW.channel,
+               NEW.immediate_source_entity_id
+        FROM claims c
+        JOIN world_events we ON we.id = c.world_event_id
+        WHERE c.id = NEW.claim_id
+        ON CONFLICT (entity_id, claim_id, tier) DO UPDATE
+        SET acquired_at = EXCLUDED.acquired_at,
+            acquired_chunk_id = EXCLUDED.acquired_chunk_id,
+            event_chunk_id = EXCLUDED.event_chunk_id,
+            scope = EXCLUDED.scope,
+            channel = EXCLUDED.channel,
+            immediate_source_entity_id = EXCLUDED.immediate_source_entity_id;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION note_claim_possession_claim()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    -- Deleted claims cascade through the foreign key.
+    PERFORM refresh_claim_possession_subjects(NEW.id);
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION note_claim_possession_event()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM refresh_claim_possession_subjects(c.id)
+    FROM claims c
+    WHERE c.world_event_id = NEW.id;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION note_claim_possession_event_entity()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM refresh_claim_possession_subjects(c.id)
+        FROM claims c
+        WHERE c.world_event_id = OLD.event_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM refresh_claim_possession_subjects(c.id)
+        FROM claims c
+        WHERE c.world_event_id = NEW.event_id;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+-- Backfill from the existing ledgers before the triggers take over.
+TRUNCATE claim_possession_index;
+
+INSERT INTO claim_possession_index (
+    entity_id, claim_id, tier, event_chunk_id, scope
+)
+SELECT DISTINCT subjects.entity_id, c.id, 'subject', we.tick_chunk_id, c.scope
+FROM claims c
+JOIN world_events we ON we.id = c.world_event_id
+JOIN LATERAL (
+    SELECT we.actor_entity_id AS entity_id
+    WHERE we.actor_entity_id IS NOT NULL
+    UNION
+    SELECT we.target_entity_id AS entity_id
+    WHERE we.target_entity_id IS NOT NULL
+    UNION
+    SELECT wee.entity_id
+    FROM world_event_entities wee
+    WHERE wee.event_id = we.id
+) subjects ON true;
+
+INSERT INTO claim_possession_index (
+    entity_id, claim_id, tier, acquired_at, acquired_chunk_id,
+    event_chunk_id, scope, channel, immediate_source_entity_id
+)
+SELECT ca.knower_entity_id, c.id, ca.source_tier, ca.created_at,
+       ca.source_chunk_id, we.tick_chunk_id, c.scope, ca.channel,
+       ca.immediate_source_entity_id
+FROM claim_awareness ca
+JOIN claims c ON c.id = ca.claim_id
+JOIN world_events we ON we.id = c.world_event_id;
+
+ANALYZE claim_possession_index;
+
+DROP TRIGGER IF EXISTS claim_possession_index ON claim_awareness;
+CREATE TRIGGER claim_possession_index
+AFTER INSERT OR UPDATE OR DELETE ON claim_awareness
+FOR EACH ROW EXECUTE FUNCTION note_claim_possession_awareness();
+
+DROP TRIGGER IF EXISTS claim_possession_index ON claims;
+CREATE TRIGGER claim_possession_index
+AFTER INSERT OR UPDATE OF world_event_id, scope ON claims
+FOR EACH ROW EXECUTE FUNCTION note_claim_possession_claim();
+
+DROP TRIGGER IF EXISTS claim_possession_index ON world_events;
+CREATE TRIGGER claim_possession_index
+AFTER UPDATE OF tick_chunk_id, actor_entity_id, target_entity_id ON world_events
+FOR EACH ROW EXECUTE FUNCTION note_claim_possession_event();
+
+DROP TRIGGER IF EXISTS claim_possession_index ON world_event_entities;
+CREATE TRIGGER claim_possession_index
+AFTER INSERT OR UPDATE OR DELETE ON world_event_entities
+FOR EACH ROW EXECUTE FUNCTION note_claim_possession_event_entity();
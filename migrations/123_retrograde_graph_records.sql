@@ -0,0 +1,44 @@
+-- Persisted R3 candidate graphs for Retrograde replay verification
+-- (nexus/agents/orrery/retrograde_graph_replay.py). Seed-generation packets
+-- were never stored: the graph a wizard run or maturation job actually
+-- handed Skald lived only in memory or in an operator's --output file, so
+-- nothing could later prove that build_candidate_graph still rebuilds it.
+--
+-- Each row keeps the graph next to the pruned builder inputs that produced
+-- it (retrograde_graph.candidate_graph_build_inputs) and the canonical hash
+-- of the graph at write time. `nexus retrograde-verify-graphs` rebuilds every
+-- row from build_inputs and reports hash drift per schema_version.
+
+CREATE TABLE IF NOT EXISTS retrograde_graph_records (
+    id                bigserial PRIMARY KEY,
+    source            text NOT NULL
+        CHECK (source IN ('wizard', 'maturation')),
+    maturation_job_id bigint REFERENCES orrery_maturation_jobs(id)
+                          ON DELETE SET NULL,
+    schema_version    integer NOT NULL,
+    graph_hash        text NOT NULL,
+    build_inputs      jsonb NOT NULL
+        CHECK (jsonb_typeof(build_inputs) = 'object'),
+    graph             jsonb NOT NULL CHECK (jsonb_typeof(graph) = 'object'),
+    recorded_at       timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS ix_retrograde_graph_records_schema_version
+    ON retrograde_graph_records (schema_version, id);
+
+COMMENT ON TABLE retrograde_graph_records IS
+    'R3 candidate graphs as handed to Skald, with the inputs needed to rebuild them for determinism checks.';
+COMMENT ON COLUMN retrograde_graph_records.source IS
+    'wizard (cold-start persist_retrograde_history) or maturation (runtime stub maturation commit).';
+COMMENT ON COLUMN retrograde_graph_records.maturation_job_id IS
+    'orrery_maturation_jobs row that consumed the graph; NULL for wizard graphs.';
+COMMENT ON COLUMN retrograde_graph_records.schema_version IS
+    'retrograde_graph.GRAPH_SCHEMA_VERSION of the stored graph.';
+COMMENT ON COLUMN retrograde_graph_records.graph_hash IS
+    'retrograde_graph.canonical_graph_hash of graph: sha256 of key-sorted compact JSON.';
+COMMENT ON COLUMN retrograde_graph_records.build_inputs IS
+    'retrograde_graph.candidate_graph_build_inputs payload; weight maps are ordered pairs because jsonb reorders keys.';
+COMMENT ON COLUMN retrograde_graph_records.graph IS
+    'The candidate graph exactly as the seed-generation request carried it.';
+COMMENT ON COLUMN retrograde_graph_records.recorded_at IS
+    'Time the consuming persistence transaction wrote this row.';
@@ -66,6 +66,68 @@ def calculate_chunk_tokens(text: str) -> int:
     return len(tokens)
 
 
+def calculate_chunk_tokens_batch(texts: List[str]) -> List[int]:
+    """
+    Calculate precise token counts for many texts with one encoding lookup.
+
+    calculate_chunk_tokens resolves the Apex encoding from nexus.toml on every
+    call; callers sizing a whole candidate set (context packing) use this
+    instead.
+
+    Args:
+        texts: Texts to tokenize
+
+    Returns:
+        Exact token counts, in input order
+    """
+    if not texts:
+        return []
+    encoding = get_apex_model_encoding()
+    return [len(tokens) for tokens in encoding.encode_batch(list(texts))]
+
+
+_ENCODING_UNAVAILABLE = False
+
+
+def estimate_chunk_tokens_batch(texts: List[str]) -> List[int]:
+    """
+    Token counts for budgeting, falling back to a word heuristic offline.
+
+    tiktoken fetches its encoding files on first use. When that fails (no
+    network, no cache) budget callers fall back to words * 1.25 rather than
+    failing the turn; the failure is remembered so later calls skip the fetch.
+
+    Args:
+        texts: Texts to size
+
+    Returns:
+        Token counts, in input order
+    """
+    global _ENCODING_UNAVAILABLE
+    if not _ENCODING_UNAVAILABLE:
+        try:
+            return calculate_chunk_tokens_batch(texts)
+        except Exception as exc:
+            _ENCODING_UNAVAILABLE = True
+            logger.warning(
+                f"Token encoding unavailable, estimating from word counts: {exc}"
+            )
+    return [int(len(text.split()) * 1.25) for text in texts]
+
+
+def estimate_chunk_tokens(text: str) -> int:
+    """
+    Single-text form of estimate_chunk_tokens_batch.
+
+    Args:
+        text: Text to size
+
+    Returns:
+        Token count
+    """
+    return estimate_chunk_tokens_batch([text])[0]
+
+
 def select_warm_slice(all_chunk_ids: List[int], span: int) -> List[int]:
     """
     Select the most recent N chunk IDs for warm slice.
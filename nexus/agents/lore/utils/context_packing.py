@@ -0,0 +1,245 @@
+"""
+Context Packing for LORE
+
+Chooses which optional context items reach the storyteller when they do not
+all fit. Every candidate (narrative chunk, Retrograde summary, featured
+entity, relationship, event, threat) carries a tokenizer-accurate size and a
+relevance utility; protected candidates (baseline entities) are hard
+constraints. The optional candidates are packed as a bounded multi-class
+0/1 knapsack: maximize total utility subject to the shared token capacity
+and optional per-class token limits.
+
+All operations are deterministic - no LLM inference required.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger("nexus.lore.context_packing")
+
+# Token capacity is quantized into at most this many DP cells. Item sizes
+# are rounded up to the cell size, so a packing never exceeds the real
+# capacity; the rounding slack is filled afterwards by utility density.
+PACK_RESOLUTION = 1024
+
+# Among packings of equal utility, prefer the one that uses more tokens.
+_TOKEN_TIE_BREAK = 1e-7
+
+# Featured-entity tiers from trim_structured_with_baseline_protection:
+# present characters, setting places, other characters, other places,
+# factions, relationships, events, threats. Each tier is worth twice the
+# next, so a lower tier only displaces a higher one when it buys more.
+FEATURED_TIER_UTILITY: Dict[int, float] = {
+    1: 128.0,
+    2: 64.0,
+    3: 32.0,
+    4: 16.0,
+    5: 8.0,
+    6: 4.0,
+    7: 2.0,
+    8: 1.0,
+}
+
+
+@dataclass(frozen=True)
+class PackCandidate:
+    """One item competing for context tokens."""
+
+    key: Hashable
+    kind: str
+    tokens: int
+    utility: float
+    item: Any = field(default=None, compare=False, repr=False)
+    required: bool = False
+
+
+@dataclass
+class PackResult:
+    """Outcome of a packing: the kept candidates in input order."""
+
+    selected: List[PackCandidate]
+    capacity: int
+
+    @property
+    def tokens(self) -> int:
+        return sum(candidate.tokens for candidate in self.selected)
+
+    @property
+    def utility(self) -> float:
+        return sum(candidate.utility for candidate in self.selected)
+
+    @property
+    def required_tokens(self) -> int:
+        return sum(c.tokens for c in self.selected if c.required)
+
+    @property
+    def overflow(self) -> int:
+        """Tokens by which the protected candidates alone exceed capacity."""
+        return max(0, self.required_tokens - self.capacity)
+
+    def items(self, kind: Optional[str] = None) -> List[Any]:
+        return [c.item for c in self.selected if kind is None or c.kind == kind]
+
+
+def chunk_utility(chunk: Mapping[str, Any], rank: int) -> float:
+    """Relevance of a retrieved memory: its search score, else rank decay."""
+    score = chunk.get("score")
+    if isinstance(score, (int, float)) and not isinstance(score, bool) and score > 0:
+        return float(score)
+    return 1.0 / (1 + rank)
+
+
+def _ceil_div(numerator: int, denominator: int) -> int:
+    return -(-numerator // denominator)
+
+
+def _solve_class(
+    weights: Sequence[int], values: Sequence[float], cap: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """0/1 knapsack for one class: best value at each budget, plus take table."""
+    best = np.zeros(cap + 1)
+    take = np.zeros((len(weights), cap + 1), dtype=bool)
+    for index, (weight, value) in enumerate(zip(weights, values)):
+        if weight > cap:
+            continue
+        candidate = best[: cap + 1 - weight] + value
+        improved = candidate > best[weight:]
+        take[index, weight:] = improved
+        best[weight:] = np.where(improved, candidate, best[weight:])
+    return best, take
+
+
+def _class_members(take: np.ndarray, weights: Sequence[int], budget: int) -> List[int]:
+    members = []
+    for index in range(len(weights) - 1, -1, -1):
+        if take[index, budget]:
+            members.append(index)
+            budget -= weights[index]
+    return members
+
+
+def pack_candidates(
+    candidates: Sequence[PackCandidate],
+    capacity: int,
+    *,
+    class_limits: Optional[Mapping[str, int]] = None,
+    resolution: int = PACK_RESOLUTION,
+) -> PackResult:
+    """
+    Select candidates that maximize utility within ``capacity`` tokens.
+
+    Args:
+        candidates: Everything competing for the budget. ``required``
+            candidates are always kept, even when they alone overflow
+            (``PackResult.overflow`` reports it; callers decide how to warn).
+        capacity: Token capacity shared by all classes
+        class_limits: Optional token ceilings per ``kind``; protected
+            candidates count against their class ceiling too
+        resolution: Number of DP cells the free capacity is quantized into
+
+    Returns:
+        PackResult with the kept candidates in input order
+    """
+    limits = dict(class_limits or {})
+    required = [c for c in candidates if c.required]
+    free = capacity - sum(c.tokens for c in required)
+    for candidate in required:
+        if candidate.kind in limits:
+            limits[candidate.kind] -= candidate.tokens
+
+    eligible = [
+        c
+        for c in candidates
+        if not c.required
+        and c.utility > 0
+        and c.tokens <= min(free, limits.get(c.kind, free))
+    ]
+    if free <= 0 or not eligible:
+        return PackResult(selected=required, capacity=capacity)
+
+    unit = max(1, _ceil_div(free, max(1, resolution)))
+    cells = free // unit
+
+    # Without class ceilings every candidate shares one knapsack; with them
+    # each class is solved on its own and the classes are then combined.
+    groups: Dict[str, List[PackCandidate]] = {}
+    for candidate in eligible:
+        group = candidate.kind if limits else ""
+        groups.setdefault(group, []).append(candidate)
+
+    total = np.zeros(cells + 1)
+    plans = []
+    for group, members in groups.items():
+        weights = [_ceil_div(c.tokens, unit) for c in members]
+        values = [c.utility + _TOKEN_TIE_BREAK * c.tokens for c in members]
+        cap = min(cells, limits[group] // unit) if group in limits else cells
+        best, take = _solve_class(weights, values, cap)
+        combined = total.copy()
+        budget_for_class = np.zeros(cells + 1, dtype=np.int64)
+        for spent in range(1, cap + 1):
+            candidate = total[: cells + 1 - spent] + best[spent]
+            improved = candidate > combined[spent:]
+            combined[spent:] = np.where(improved, candidate, combined[spent:])
+            budget_for_class[spent:][improved] = spent
+        total = combined
+        plans.append((members, weights, take, budget_for_class))
+
+    chosen = set()
+    remaining_cells = cells
+    for members, weights, take, budget_for_class in reversed(plans):
+        spent = int(budget_for_class[remaining_cells])
+        remaining_cells -= spent
+        for index in _class_members(take, weights, spent):
+            chosen.add(id(members[index]))
+
+    # Fill the rounding slack with whatever else still fits, best density first.
+    used = sum(c.tokens for c in eligible if id(c) in chosen)
+    class_used: Dict[str, int] = {}
+    for c in eligible:
+        if id(c) in chosen:
+            class_used[c.kind] = class_used.get(c.kind, 0) + c.tokens
+    leftovers = sorted(
+        (c for c in eligible if id(c) not in chosen),
+        key=lambda c: c.utility / max(1, c.tokens),
+        reverse=True,
+    )
+    for c in leftovers:
+        within_class = class_used.get(c.kind, 0) + c.tokens <= limits.get(c.kind, free)
+        if used + c.tokens <= free and within_class:
+            chosen.add(id(c))
+            used += c.tokens
+            class_used[c.kind] = class_used.get(c.kind, 0) + c.tokens
+
+    selected = [c for c in candidates if c.required or id(c) in chosen]
+    return PackResult(selected=selected, capacity=capacity)
+
+
+def greedy_pack(
+    candidates: Sequence[PackCandidate], capacity: int, *, stop_at_overflow: bool
+) -> PackResult:
+    """
+    The pre-packing behavior, kept for benchmarks and comparisons.
+
+    Protected candidates are kept; the rest are taken in the given order,
+    either stopping at the first one that does not fit (Phase 2 retrieval)
+    or skipping it and trying the next (featured-entity first fit).
+    """
+    selected = [c for c in candidates if c.required]
+    used = sum(c.tokens for c in selected)
+    for candidate in candidates:
+        if candidate.required:
+            continue
+        if used + candidate.tokens > capacity:
+            if stop_at_overflow:
+                break
+            continue
+        selected.append(candidate)
+        used += candidate.tokens
+    order = {id(c): index for index, c in enumerate(candidates)}
+    selected.sort(key=lambda c: order[id(c)])
+    return PackResult(selected=selected, capacity=capacity)
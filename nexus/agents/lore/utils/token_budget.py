@@ -6,7 +6,8 @@ Handles dynamic token budget calculation and allocation.
 
 import logging
 from typing import Dict, Any, Optional, List, Tuple
-from .chunk_operations import calculate_chunk_tokens
+from .chunk_operations import calculate_chunk_tokens, calculate_chunk_tokens_batch
+from .context_packing import FEATURED_TIER_UTILITY, PackCandidate, pack_candidates
 
 logger = logging.getLogger("nexus.lore.token_budget")
 
@@ -382,20 +383,9 @@ class TokenBudgetManager:
 
         return True
 
-    def estimate_entity_tokens(self, entity: Dict[str, Any]) -> int:
-        """
-        Estimate token count for an entity dictionary.
-
-        Args:
-            entity: Entity dictionary with various text fields
-
-        Returns:
-            Estimated token count
-        """
-        # Check if already calculated
-        if "token_count" in entity and isinstance(entity["token_count"], int):
-            return entity["token_count"]
-
+    @staticmethod
+    def _entity_token_text(entity: Dict[str, Any]) -> str:
+        """The text an entity contributes, as counted for its token size."""
         # Collect all text content from entity
         text_candidates = []
         for key in (
@@ -417,10 +407,53 @@ class TokenBudgetManager:
             summary = entity.get("summary", "")
             text_candidates.append(f"{name}: {summary}")
 
-        tokens = calculate_chunk_tokens("\n".join(text_candidates))
+        return "\n".join(text_candidates)
+
+    def estimate_entity_tokens(self, entity: Dict[str, Any]) -> int:
+        """
+        Estimate token count for an entity dictionary.
+
+        Args:
+            entity: Entity dictionary with various text fields
+
+        Returns:
+            Estimated token count
+        """
+        # Check if already calculated
+        if "token_count" in entity and isinstance(entity["token_count"], int):
+            return entity["token_count"]
+
+        tokens = calculate_chunk_tokens(self._entity_token_text(entity))
         entity["token_count"] = tokens
         return tokens
 
+    def prime_entity_tokens(self, entities: List[Dict[str, Any]]) -> None:
+        """Count every uncounted entity in one tokenizer pass."""
+        pending = [
+            entity
+            for entity in entities
+            if not isinstance(entity.get("token_count"), int)
+        ]
+        counts = calculate_chunk_tokens_batch(
+            [self._entity_token_text(entity) for entity in pending]
+        )
+        for entity, tokens in zip(pending, counts):
+            entity["token_count"] = tokens
+
+    @staticmethod
+    def _structured_entities(entity_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        entities: List[Dict[str, Any]] = []
+        for entity_type in ("characters", "locations", "factions"):
+            tiered = entity_data.get(entity_type, {})
+            if isinstance(tiered, dict):
+                entities.extend(tiered.get("baseline", []))
+                entities.extend(tiered.get("featured", []))
+            else:
+                entities.extend(tiered)
+        for category in ("relationships", "events", "threats"):
+            entities.extend(entity_data.get(category, []))
+        return entities
+
     def calculate_structured_tokens_by_tier(
         self, entity_data: Dict[str, Any]
     ) -> Tuple[int, int]:
@@ -435,6 +468,7 @@ class TokenBudgetManager:
         """
         baseline_tokens = 0
         featured_tokens = 0
+        self.prime_entity_tokens(self._structured_entities(entity_data))
 
         # Count baseline entity tokens (CANNOT be trimmed - protected)
         for entity_type in ("characters", "locations", "factions"):
@@ -475,8 +509,9 @@ class TokenBudgetManager:
         Trim structured entity data to fit budget while PROTECTING baseline entities.
 
         Baseline entities (minimal tracking fields for ALL entities) are never trimmed.
-        Featured entities are trimmed by priority:
-        - Priority 0: Season/episode summaries (if present)
+        Featured entities are packed (context_packing.pack_candidates) to
+        maximize total priority utility within the remaining tokens; each
+        tier is worth twice the next (FEATURED_TIER_UTILITY):
         - Priority 1: Characters with "present" reference
         - Priority 2: Places with "setting" reference
         - Priority 3: Characters with other references
@@ -543,65 +578,50 @@ class TokenBudgetManager:
             }
             return trimmed_data
 
-        # Collect all trimmable items with priorities
-        trimmable_items: List[Tuple[str, str, Any, int, int]] = (
-            []
-        )  # (category, type, entity, tokens, priority)
+        # Every featured item competes for the remaining tokens; its utility
+        # comes from its priority tier.
+        candidates: List[PackCandidate] = []
+
+        def add(category: str, entity: Dict[str, Any], priority: int) -> None:
+            candidates.append(
+                PackCandidate(
+                    key=(category, len(candidates)),
+                    kind=category,
+                    tokens=self.estimate_entity_tokens(entity),
+                    utility=FEATURED_TIER_UTILITY[priority],
+                    item=entity,
+                )
+            )
 
-        # Characters
         for char in entity_data.get("characters", {}).get("featured", []):
-            tokens = self.estimate_entity_tokens(char)
             ref_type = char.get("reference_type", "unknown")
-            priority = 1 if ref_type == "present" else 3
-            trimmable_items.append(("characters", "featured", char, tokens, priority))
-
-        # Places
+            add("characters", char, 1 if ref_type == "present" else 3)
         for place in entity_data.get("locations", {}).get("featured", []):
-            tokens = self.estimate_entity_tokens(place)
             ref_type = place.get("reference_type", "unknown")
-            priority = 2 if ref_type == "setting" else 4
-            trimmable_items.append(("locations", "featured", place, tokens, priority))
-
-        # Factions
+            add("locations", place, 2 if ref_type == "setting" else 4)
         for faction in entity_data.get("factions", {}).get("featured", []):
-            tokens = self.estimate_entity_tokens(faction)
-            trimmable_items.append(("factions", "featured", faction, tokens, 5))
-
-        # Relationships
+            add("factions", faction, 5)
         for rel in entity_data.get("relationships", []):
-            tokens = self.estimate_entity_tokens(rel)
-            trimmable_items.append(("relationships", "relationship", rel, tokens, 6))
-
-        # Events
+            add("relationships", rel, 6)
         for event in entity_data.get("events", []):
-            tokens = self.estimate_entity_tokens(event)
-            trimmable_items.append(("events", "event", event, tokens, 7))
-
-        # Threats
+            add("events", event, 7)
         for threat in entity_data.get("threats", []):
-            tokens = self.estimate_entity_tokens(threat)
-            trimmable_items.append(("threats", "threat", threat, tokens, 8))
-
-        # Sort by priority (lower is better), then by token count (larger
-        # first to maximize utilization).
-        trimmable_items.sort(key=lambda x: (x[4], -x[3]))
+            add("threats", threat, 8)
 
-        # Keep items until budget exhausted
-        current_tokens = 0
+        packed = pack_candidates(candidates, available_for_featured)
+        current_tokens = packed.tokens
         kept_items: Dict[str, List[Dict[str, Any]]] = {
-            "characters": [],
-            "locations": [],
-            "factions": [],
-            "relationships": [],
-            "events": [],
-            "threats": [],
+            category: packed.items(category)
+            for category in (
+                "characters",
+                "locations",
+                "factions",
+                "relationships",
+                "events",
+                "threats",
+            )
         }
 
-        for category, item_type, entity, tokens, priority in trimmable_items:
-            if current_tokens + tokens <= available_for_featured:
-                current_tokens += tokens
-                kept_items[category].append(entity)
-
         # Build trimmed entity data
         trimmed_data = {
             "characters": {
@@ -621,7 +641,7 @@ class TokenBudgetManager:
             "threats": kept_items["threats"],
         }
 
-        trimmed_count = len(trimmable_items) - sum(
+        trimmed_count = len(candidates) - sum(
             len(items) for items in kept_items.values()
         )
         trimmed_tokens = featured_tokens - current_tokens
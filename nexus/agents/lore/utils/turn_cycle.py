@@ -15,6 +15,7 @@ from nexus.agents.orrery.player_identity import canonical_player_character_id
 from nexus.memory.context_state import memory_identity
 from nexus.memory.manager import resolve_storyteller_prompt_overhead_tokens
 from nexus.memory.retrieval_coverage import coerce_chunk_id
+from nexus.telemetry.sql_profile import recorded_sql_profile
 
 logger = logging.getLogger("nexus.lore.turn_cycle")
 
@@ -882,7 +883,7 @@ class TurnCycleManager:
         bleed_settings = OrreryBleedSettings.model_validate(
             orrery_settings.get("bleed", {})
         )
-        with self.lore.memnon.Session() as session:
+        with self.lore.memnon.Session() as session, recorded_sql_profile("tick"):
             anchor_chunk_id = self._orrery_anchor_chunk_id(session, turn_context)
             turn_context.ambient_pacing_allowed = (
                 shared_ambient_pacing_allows(
@@ -11,6 +11,8 @@ from sqlalchemy import create_engine, Column, Table, MetaData, text, inspect
 from sqlalchemy.dialects.postgresql import UUID, BYTEA, ARRAY, JSONB
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
+from nexus.telemetry.sql_profile import instrument_engine_if_enabled
+
 logger = logging.getLogger("nexus.memnon.db_schema")
 
 # Define SQL Alchemy Base
@@ -113,7 +115,7 @@ class DatabaseManager:
             SQLAlchemy engine instance
         """
         try:
-            engine = create_engine(self.db_url)
+            engine = instrument_engine_if_enabled(create_engine(self.db_url))
 
             # Verify connection
             connection = engine.connect()
@@ -0,0 +1,208 @@
+"""Length-bucketed batch embedding for MEMNON's sentence-transformer models.
+
+Embedding one text per ``encode`` call pays the model's fixed per-call
+overhead for every text, while one large unsorted batch pads every row to
+the longest text in it. The helpers here sort texts by token length
+(longest first, per model tokenizer), cut the sorted run into buckets whose
+padded size fits a per-device token budget, and embed each bucket with a
+single ``generate_embeddings_batch`` call. Short texts therefore travel in
+large batches and long texts in small ones.
+
+Vectors come back grouped by bucket so callers can upsert each bucket with
+one ``unnest`` statement via :func:`upsert_bucket_vectors`.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger("nexus.memnon.embedding_batches")
+
+# Padded tokens (rows x longest row) per encode call. CPU attention cost grows
+# with the padded batch, so the CPU budget stays small enough to keep batches
+# cache-friendly; accelerators amortize launch overhead over larger batches.
+CPU_BATCH_TOKEN_BUDGET = 8192
+ACCELERATOR_BATCH_TOKEN_BUDGET = 32768
+MAX_BATCH_SIZE = 64
+
+
+@dataclass(frozen=True)
+class EmbeddedBucket:
+    """Vectors for one length bucket, aligned with ``indices`` into the input."""
+
+    model: str
+    indices: tuple[int, ...]
+    max_tokens: int
+    vectors: List[List[float]]
+
+    @property
+    def dimensions(self) -> int:
+        return len(self.vectors[0])
+
+
+def embedding_token_lengths(model: Any, texts: Sequence[str]) -> List[int]:
+    """Token length of each text under ``model``'s tokenizer.
+
+    Lengths are truncated at the model's ``max_seq_length`` because encoding
+    truncates there too. Models without a tokenizer fall back to whitespace
+    word counts, which preserve the ordering that bucketing needs.
+    """
+    tokenizer = getattr(model, "tokenizer", None)
+    if tokenizer is not None:
+        max_length = getattr(model, "max_seq_length", None)
+        try:
+            encoded = tokenizer(
+                list(texts),
+                truncation=max_length is not None,
+                max_length=max_length,
+            )
+            return [max(1, len(ids)) for ids in encoded["input_ids"]]
+        except Exception as exc:  # pragma: no cover - tokenizer-specific
+            logger.debug(f"Falling back to word counts for bucketing: {exc}")
+    return [max(1, len(text.split())) for text in texts]
+
+
+def batch_token_budget(model: Any) -> int:
+    """Padded-token budget for one encode call on ``model``'s device."""
+    device = str(getattr(model, "device", "cpu"))
+    if device.startswith("cpu"):
+        return CPU_BATCH_TOKEN_BUDGET
+    return ACCELERATOR_BATCH_TOKEN_BUDGET
+
+
+def length_buckets(
+    lengths: Sequence[int],
+    *,
+    token_budget: int = CPU_BATCH_TOKEN_BUDGET,
+    max_batch_size: int = MAX_BATCH_SIZE,
+) -> List[tuple[int, ...]]:
+    """Group input indices into padding-minimizing batches.
+
+    Indices are visited longest first (ties in input order). A bucket closes
+    when one more row would push ``rows x longest`` past ``token_budget`` or
+    the row count past ``max_batch_size``; a single over-budget text still
+    gets a bucket of its own.
+    """
+    if token_budget <= 0 or max_batch_size <= 0:
+        raise ValueError("token_budget and max_batch_size must be positive")
+    order = sorted(range(len(lengths)), key=lambda index: (-lengths[index], index))
+    buckets: List[tuple[int, ...]] = []
+    current: List[int] = []
+    for index in order:
+        # Descending order: the bucket's first row is its longest.
+        longest = lengths[current[0]] if current else lengths[index]
+        if current and (
+            len(current) >= max_batch_size
+            or (len(current) + 1) * longest > token_budget
+        ):
+            buckets.append(tuple(current))
+            current = []
+        current.append(index)
+    if current:
+        buckets.append(tuple(current))
+    return buckets
+
+
+def embed_in_length_buckets(
+    manager: Any,
+    texts: Sequence[str],
+    model_names: Sequence[str],
+    *,
+    keys: Sequence[Any],
+    subject: str,
+    token_budget: Optional[int] = None,
+    max_batch_size: int = MAX_BATCH_SIZE,
+) -> Dict[str, List[EmbeddedBucket]]:
+    """Embed every text under every model, one encode call per bucket.
+
+    Args:
+        manager: An ``EmbeddingManager`` (or anything exposing
+            ``generate_embeddings_batch``; ``get_model`` is optional).
+        texts: Non-empty texts to embed.
+        model_names: Loaded model keys to embed under.
+        keys: Caller identifiers aligned with ``texts``, used in errors.
+        subject: Human label for the texts in error messages.
+        token_budget: Override for :func:`batch_token_budget`.
+        max_batch_size: Upper bound on rows per encode call.
+
+    Returns:
+        Buckets per model name, in encode order.
+
+    Raises:
+        RuntimeError: If any bucket fails to embed or returns the wrong number
+            of vectors. Nothing is partially returned.
+    """
+    get_model = getattr(manager, "get_model", None)
+    results: Dict[str, List[EmbeddedBucket]] = {}
+    for model_name in model_names:
+        model = get_model(model_name) if callable(get_model) else None
+        lengths = embedding_token_lengths(model, texts)
+        budget = token_budget or batch_token_budget(model)
+        buckets: List[EmbeddedBucket] = []
+        for indices in length_buckets(
+            lengths, token_budget=budget, max_batch_size=max_batch_size
+        ):
+            vectors = manager.generate_embeddings_batch(
+                [texts[index] for index in indices],
+                model_name,
+                batch_size=len(indices),
+            )
+            if not vectors or len(vectors) != len(indices):
+                failed = [keys[index] for index in indices]
+                raise RuntimeError(
+                    f"Embedding generation failed for {subject} {failed} "
+                    f"with model {model_name}; "
+                    "embedding_generated_at remains NULL for retry"
+                )
+            if len({len(vector) for vector in vectors}) != 1:
+                raise RuntimeError(
+                    f"Model {model_name} returned mixed vector dimensions "
+                    f"for {subject} batch"
+                )
+            buckets.append(
+                EmbeddedBucket(
+                    model=model_name,
+                    indices=indices,
+                    max_tokens=lengths[indices[0]],
+                    vectors=vectors,
+                )
+            )
+        results[model_name] = buckets
+    return results
+
+
+def upsert_bucket_vectors(
+    cursor: Any,
+    table_name: str,
+    owner_column: str,
+    owner_ids: Sequence[int],
+    bucket: EmbeddedBucket,
+) -> None:
+    """Upsert one bucket's vectors with a single ``unnest`` statement.
+
+    ``owner_ids`` is aligned with the caller's input texts; the bucket's
+    indices select this bucket's rows. ``table_name`` and ``owner_column``
+    must come from the trusted dimension-table helpers, never user input.
+    """
+    dimensions = bucket.dimensions
+    cursor.execute(
+        f"""
+        INSERT INTO {table_name}
+            ({owner_column}, model, embedding, created_at)
+        SELECT item.owner_id, %s, item.embedding::vector({dimensions}), NOW()
+        FROM unnest(%s::bigint[], %s::text[]) AS item(owner_id, embedding)
+        ON CONFLICT ({owner_column}, model) DO UPDATE
+        SET embedding = EXCLUDED.embedding,
+            created_at = EXCLUDED.created_at
+        """,
+        (
+            bucket.model,
+            [int(owner_ids[index]) for index in bucket.indices],
+            [
+                "[" + ",".join(str(number) for number in vector) + "]"
+                for vector in bucket.vectors
+            ],
+        ),
+    )
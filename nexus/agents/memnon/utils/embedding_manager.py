@@ -247,7 +247,7 @@ class EmbeddingManager:
             return None
 
     def generate_embeddings_batch(
-        self, texts: List[str], model_key: str
+        self, texts: List[str], model_key: str, batch_size: Optional[int] = None
     ) -> Optional[List[List[float]]]:
         """
         Generate embeddings for a batch of texts using the specified model.
@@ -255,6 +255,8 @@ class EmbeddingManager:
         Args:
             texts: List of texts to embed.
             model_key: Key of the model to use.
+            batch_size: Rows per forward pass; defaults to the model's own
+                default (32 for SentenceTransformer).
 
         Returns:
             List of embeddings, or None if the model is not found or embedding fails.
@@ -280,7 +282,10 @@ class EmbeddingManager:
             )
 
         try:
-            embeddings = model.encode(valid_texts)
+            if batch_size is None:
+                embeddings = model.encode(valid_texts)
+            else:
+                embeddings = model.encode(valid_texts, batch_size=batch_size)
             return [emb.tolist() for emb in embeddings]
         except Exception as e:
             logger.error(
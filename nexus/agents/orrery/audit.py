@@ -36,6 +36,7 @@ from typing import Any, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from sqlalchemy import text
 
+from nexus.agents.orrery.cognition import load_orrery_cognition
 from nexus.agents.orrery.communication import (
     CommunicationGraph,
     communication_graph_for_settings,
@@ -43,8 +44,6 @@ from nexus.agents.orrery.communication import (
 from nexus.agents.orrery.epistemics import (
     CLAIM_SCOPES,
     SOURCE_TIERS,
-    coerce_epistemics_policy,
-    load_epistemics_policy,
 )
 from nexus.agents.orrery.explain import StackExplanation, explain_stack
 from nexus.agents.orrery.needs import (
@@ -83,11 +82,6 @@ from nexus.agents.orrery.resolver import (
 )
 from nexus.agents.orrery.substrate import (
     Bindings,
-    coerce_branch_selection,
-    coerce_habituation,
-    coerce_package_selection,
-    coerce_project_policy,
-    configure_project_magnitudes,
     CONSTRAINED_TAGS,
     DRAMATIC_CONTACT_TAGS,
     DRIVE_BAND_ORDER,
@@ -541,16 +535,20 @@ def explain_dry_run(
     sandbox stack carries a diff against its baseline twin.
     """
 
-    need_tuning = coerce_need_tuning(sunhelm_settings)
-    selection = coerce_branch_selection(selection_settings)
-    habituation = coerce_habituation(habituation_settings)
-    package_selection = coerce_package_selection(package_selection_settings)
-    project_policy = coerce_project_policy(project_settings)
-    epistemics_policy = (
-        load_epistemics_policy()
-        if epistemics_settings is None
-        else coerce_epistemics_policy(epistemics_settings)
+    cognition = load_orrery_cognition(
+        templates,
+        sunhelm_settings=sunhelm_settings,
+        selection_settings=selection_settings,
+        habituation_settings=habituation_settings,
+        package_selection_settings=package_selection_settings,
+        project_settings=project_settings,
+        epistemics_settings=epistemics_settings,
     )
+    need_tuning = cognition.need_tuning
+    selection = cognition.selection
+    habituation = cognition.habituation
+    package_selection = cognition.package_selection
+    epistemics_policy = cognition.epistemics_policy
     state = hydrate_world_state(
         session,
         anchor_chunk_id=anchor_chunk_id,
@@ -565,35 +563,19 @@ def explain_dry_run(
         mood_settings=mood_settings,
     )
 
-    templates_list = list(configure_project_magnitudes(templates, project_policy))
-    actor_only_templates = [
-        t for t in templates_list if t.required_slots == _ACTOR_ONLY_SLOTS
-    ]
-    actor_target_templates = [
-        t for t in templates_list if t.required_slots == _ACTOR_TARGET_SLOTS
-    ]
-    actor_faction_templates = [
-        t for t in templates_list if t.required_slots == _ACTOR_FACTION_SLOTS
-    ]
-    actor_target_faction_templates = [
-        t for t in templates_list if t.required_slots == _ACTOR_TARGET_FACTION_SLOTS
-    ]
-    supported_slot_signatures = (
-        _ACTOR_ONLY_SLOTS,
-        _ACTOR_TARGET_SLOTS,
-        _ACTOR_FACTION_SLOTS,
-        _ACTOR_TARGET_FACTION_SLOTS,
-    )
-    unsupported = [
-        t for t in templates_list if t.required_slots not in supported_slot_signatures
-    ]
-    if unsupported:
+    stacks = cognition.stacks
+    templates_list = list(stacks.templates)
+    actor_only_templates = stacks.actor_only
+    actor_target_templates = stacks.actor_target
+    actor_faction_templates = stacks.actor_faction
+    actor_target_faction_templates = stacks.actor_target_faction
+    if stacks.unsupported:
         raise ValueError(
             "Orrery audit resolver does not yet compose bindings for "
             "required_slots="
             + ", ".join(
                 f"{t.id}:{tuple(s.value for s in t.required_slots)}"
-                for t in unsupported
+                for t in stacks.unsupported
             )
         )
 
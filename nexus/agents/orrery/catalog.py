@@ -25,6 +25,7 @@ from __future__ import annotations
 import argparse
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Iterable, List, Mapping, Tuple
 
@@ -49,10 +50,18 @@ AUTO_GEN_HEADER = (
 # ---------------------------------------------------------------------------
 
 _PREDICATE_PARSERS: List[Tuple[re.Pattern, Callable[[re.Match], str]]] = []
+# Every pattern opens with its literal kind and an escaped paren, so the kind
+# prefix of a name selects the only entry that can fullmatch it.
+_PARSERS_BY_KIND: dict[str, Tuple[re.Pattern, Callable[[re.Match], str]]] = {}
 
 
 def _register(pattern: str, formatter: Callable[[re.Match], str]) -> None:
-    _PREDICATE_PARSERS.append((re.compile(pattern), formatter))
+    kind = pattern.split("\\(", 1)[0]
+    if kind in _PARSERS_BY_KIND:
+        raise ValueError(f"Predicate kind {kind!r} already has a registered parser")
+    entry = (re.compile(pattern), formatter)
+    _PREDICATE_PARSERS.append(entry)
+    _PARSERS_BY_KIND[kind] = entry
 
 
 def _slot(value: str) -> str:
@@ -512,6 +521,7 @@ _register(
 )
 
 
+@lru_cache(maxsize=4096)
 def _render_predicate_name(name: str) -> str:
     """Convert a substrate ``__name__`` into prose-friendly text."""
 
@@ -519,7 +529,9 @@ def _render_predicate_name(name: str) -> str:
         return "*(always)*"
     if name == "NEVER":
         return "*(never)*"
-    for pattern, formatter in _PREDICATE_PARSERS:
+    entry = _PARSERS_BY_KIND.get(name.split("(", 1)[0])
+    if entry is not None:
+        pattern, formatter = entry
         match = pattern.fullmatch(name)
         if match:
             return formatter(match)
@@ -0,0 +1,271 @@
+"""Process-resident Orrery cognition reused across consecutive ticks.
+
+Everything a tick derives from static inputs — the configured template
+stacks with their predicate closures, the parsed selection, habituation,
+project, Sunhelm and Epistemics policies, and the dashboard catalog — is
+identical from one tick to the next until settings, the in-process tag and
+event vocabulary, or the template tuple change. LORE's ``resolve_orrery``
+and the worker call the resolver once per tick in a long-lived process, so
+:func:`load_orrery_cognition` builds that bundle once and serves it from a
+process-level cache keyed by :func:`cognition_digest`.
+
+Invalidation is by key, never by time: any change to a settings payload,
+to the config file an omitted payload falls back to, to the vocabulary, or
+to the identity of a template yields a new digest and a fresh build. The
+cache holds only derived values, never world state, so serving a stale
+entry is impossible without a digest collision.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from hashlib import sha256
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional, Tuple
+
+from nexus.agents.orrery.epistemics import (
+    EpistemicsPolicy,
+    coerce_epistemics_policy,
+    load_epistemics_policy,
+)
+from nexus.agents.orrery.event_vocabulary import known_event_types
+from nexus.agents.orrery.needs import NeedTuning, coerce_need_tuning
+from nexus.agents.orrery.pair_tag_registry import PAIR_TAG_SEED
+from nexus.agents.orrery.substrate import (
+    BranchSelection,
+    HabituationPolicy,
+    PackageSelection,
+    ProjectPolicy,
+    Slot,
+    Template,
+    coerce_branch_selection,
+    coerce_habituation,
+    coerce_package_selection,
+    coerce_project_policy,
+    configure_project_magnitudes,
+)
+from nexus.agents.orrery.tag_constants import CANONICAL_TAGS
+
+_ACTOR_ONLY_SLOTS: Tuple[Slot, ...] = (Slot.ACTOR,)
+_ACTOR_TARGET_SLOTS: Tuple[Slot, ...] = (Slot.ACTOR, Slot.TARGET)
+_ACTOR_FACTION_SLOTS: Tuple[Slot, ...] = (Slot.ACTOR, Slot.FACTION)
+_ACTOR_TARGET_FACTION_SLOTS: Tuple[Slot, ...] = (
+    Slot.ACTOR,
+    Slot.TARGET,
+    Slot.FACTION,
+)
+_SUPPORTED_SLOT_SIGNATURES = (
+    _ACTOR_ONLY_SLOTS,
+    _ACTOR_TARGET_SLOTS,
+    _ACTOR_FACTION_SLOTS,
+    _ACTOR_TARGET_FACTION_SLOTS,
+)
+
+# A process normally alternates between at most a couple of configurations
+# (the live tick and a dashboard what-if); anything beyond this is churn.
+_RESIDENT_LIMIT = 8
+_resident_cognition: dict[str, "OrreryCognition"] = {}
+_resident_catalogs: dict[str, tuple[dict[str, Any], tuple[Template, ...]]] = {}
+_vocabulary_digest: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class TemplateStacks:
+    """Project-configured templates partitioned by slot signature."""
+
+    templates: tuple[Template, ...]
+    actor_only: tuple[Template, ...]
+    actor_target: tuple[Template, ...]
+    actor_faction: tuple[Template, ...]
+    actor_target_faction: tuple[Template, ...]
+    unsupported: tuple[Template, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class OrreryCognition:
+    """Static per-tick inputs resolved once per configuration digest."""
+
+    digest: str
+    stacks: TemplateStacks
+    need_tuning: NeedTuning
+    selection: Optional[BranchSelection]
+    habituation: HabituationPolicy
+    package_selection: Optional[PackageSelection]
+    project_policy: ProjectPolicy
+    epistemics_policy: EpistemicsPolicy
+    # Strong references keep every digested template id() live and unique.
+    source_templates: tuple[Template, ...] = field(repr=False)
+
+
+def build_template_stacks(
+    templates: Iterable[Template], project_policy: ProjectPolicy
+) -> TemplateStacks:
+    """Apply project magnitudes and split the stack by slot signature."""
+
+    configured = configure_project_magnitudes(templates, project_policy)
+
+    def with_slots(slots: Tuple[Slot, ...]) -> tuple[Template, ...]:
+        return tuple(t for t in configured if t.required_slots == slots)
+
+    return TemplateStacks(
+        templates=configured,
+        actor_only=with_slots(_ACTOR_ONLY_SLOTS),
+        actor_target=with_slots(_ACTOR_TARGET_SLOTS),
+        actor_faction=with_slots(_ACTOR_FACTION_SLOTS),
+        actor_target_faction=with_slots(_ACTOR_TARGET_FACTION_SLOTS),
+        unsupported=tuple(
+            t for t in configured if t.required_slots not in _SUPPORTED_SLOT_SIGNATURES
+        ),
+    )
+
+
+def _settings_payload(raw: Any) -> Any:
+    if hasattr(raw, "model_dump"):
+        return raw.model_dump(mode="json")
+    return raw
+
+
+def _config_file_version() -> list[Any]:
+    """Identity of the config file that omitted payloads are loaded from."""
+
+    from nexus.config.loader import RUNTIME_CONFIG_ENV
+
+    path = Path(os.environ.get(RUNTIME_CONFIG_ENV, "nexus.toml"))
+    try:
+        stat = path.stat()
+    except OSError:
+        return [str(path), None, None]
+    return [str(path.resolve()), stat.st_mtime_ns, stat.st_size]
+
+
+def _vocabulary_version() -> str:
+    """Digest of the in-process tag, pair-tag and event vocabulary."""
+
+    global _vocabulary_digest
+    if _vocabulary_digest is None:
+        lines = [
+            *(f"alias:{alias}={tag}" for alias, tag in sorted(CANONICAL_TAGS.items())),
+            *(f"pair:{row[0]}" for row in sorted(PAIR_TAG_SEED)),
+            *(f"event:{name}" for name in sorted(known_event_types())),
+        ]
+        _vocabulary_digest = sha256("\n".join(lines).encode("utf-8")).hexdigest()
+    return _vocabulary_digest
+
+
+def cognition_digest(templates: Iterable[Template], settings: Mapping[str, Any]) -> str:
+    """Stable key over templates, settings payloads and vocabulary.
+
+    Templates are keyed by object identity as well as id and priority: their
+    predicate closures cannot be hashed by content, and a rebuilt template
+    tuple must never be served another tuple's configured stacks.
+    """
+
+    payload = {
+        "settings": {
+            name: _settings_payload(value) for name, value in sorted(settings.items())
+        },
+        "templates": [
+            [template.id, template.priority, id(template)] for template in templates
+        ],
+        "vocabulary": _vocabulary_version(),
+    }
+    if settings.get("epistemics") is None:
+        payload["config_file"] = _config_file_version()
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=repr)
+    return sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def load_orrery_cognition(
+    templates: Iterable[Template],
+    *,
+    sunhelm_settings: Optional[Any] = None,
+    selection_settings: Optional[Any] = None,
+    habituation_settings: Optional[Any] = None,
+    package_selection_settings: Optional[Any] = None,
+    project_settings: Optional[Any] = None,
+    epistemics_settings: Optional[Any] = None,
+) -> OrreryCognition:
+    """Return resident cognition for these inputs, building it on a miss.
+
+    ``epistemics_settings=None`` keeps the resolver's contract of loading
+    ``[orrery.epistemics]`` from the config file; the file's path, mtime and
+    size join the digest so an edited file is re-read on the next tick.
+    """
+
+    source_templates = tuple(templates)
+    settings = {
+        "sunhelm": sunhelm_settings,
+        "selection": selection_settings,
+        "habituation": habituation_settings,
+        "package_selection": package_selection_settings,
+        "projects": project_settings,
+        "epistemics": epistemics_settings,
+    }
+    digest = cognition_digest(source_templates, settings)
+    cognition = _resident_cognition.get(digest)
+    if cognition is not None:
+        return cognition
+
+    project_policy = coerce_project_policy(project_settings)
+    cognition = OrreryCognition(
+        digest=digest,
+        stacks=build_template_stacks(source_templates, project_policy),
+        need_tuning=coerce_need_tuning(sunhelm_settings),
+        selection=coerce_branch_selection(selection_settings),
+        habituation=coerce_habituation(habituation_settings),
+        package_selection=coerce_package_selection(package_selection_settings),
+        project_policy=project_policy,
+        epistemics_policy=(
+            load_epistemics_policy()
+            if epistemics_settings is None
+            else coerce_epistemics_policy(epistemics_settings)
+        ),
+        source_templates=source_templates,
+    )
+    if len(_resident_cognition) >= _RESIDENT_LIMIT:
+        _resident_cognition.clear()
+    _resident_cognition[digest] = cognition
+    return cognition
+
+
+def resident_catalog(
+    templates: Iterable[Template],
+    *,
+    sunhelm_settings: Optional[Any] = None,
+    promote_settings: Optional[Mapping[str, Any]] = None,
+) -> dict[str, Any]:
+    """Return the dashboard template catalog, built once per digest.
+
+    The payload is shared between callers and must be treated as read-only.
+    """
+
+    from nexus.agents.orrery.audit import build_catalog
+
+    source_templates = tuple(templates)
+    digest = cognition_digest(
+        source_templates,
+        {"sunhelm": sunhelm_settings, "promote": promote_settings, "epistemics": {}},
+    )
+    resident = _resident_catalogs.get(digest)
+    if resident is None:
+        catalog = build_catalog(
+            source_templates,
+            sunhelm_settings=sunhelm_settings,
+            promote_settings=promote_settings,
+        )
+        if len(_resident_catalogs) >= _RESIDENT_LIMIT:
+            _resident_catalogs.clear()
+        # Keep the templates alive so their digested id()s stay unique.
+        resident = _resident_catalogs[digest] = (catalog, source_templates)
+    return resident[0]
+
+
+def clear_orrery_cognition() -> None:
+    """Drop every resident entry, e.g. after reloading template modules."""
+
+    global _vocabulary_digest
+    _resident_cognition.clear()
+    _resident_catalogs.clear()
+    _vocabulary_digest = None
@@ -5,6 +5,11 @@ events by event id, cooperative events by event id, then co-presence pairs by
 their ordered entity ids.  Every calculation uses :class:`~decimal.Decimal`,
 and the appliers write the final numeric value once per existing directed edge.
 
+Only edges whose endpoints a producer names can move, so the drains load just
+those candidate edges (:func:`relationship_drift_candidate_edges`) rather than
+the whole relationship graph, and write every planned edge in one batched
+``UPDATE ... FROM (VALUES ...)`` per page.
+
 Co-presence is intentionally sampled only when this drain runs.  It compares
 the current locations at the accepted tick with the preceding primary-layer
 world time; it does not reconstruct arrivals, departures, or dwell intervals
@@ -21,6 +26,7 @@ import json
 from typing import Any, Mapping, Optional, Sequence
 
 from nexus.agents.orrery.db_rows import row_get as _row_get
+from nexus.agents.orrery.entity_arrays import copresence_pair_arrays
 from nexus.agents.orrery.epistemics import (
     ClaimParticipant,
     mechanical_claim_summary,
@@ -44,6 +50,7 @@ RUNG_SCALE = Decimal("5.5")
 VALENCE_QUANTUM = Decimal("1E-12")
 MAX_VALENCE = ONE - VALENCE_QUANTUM
 PLANNER_PRECISION = 40
+VALENCE_UPDATE_PAGE_SIZE = 500
 
 EdgeKey = tuple[int, int]
 
@@ -252,6 +259,36 @@ def plan_relationship_drift(
         return RelationshipDriftPlan(edges=plans)
 
 
+def relationship_drift_candidate_edges(
+    *,
+    project_milestones: Sequence[ProjectMilestone],
+    events: Sequence[DriftEvent],
+    copresence_pairs: Sequence[CopresencePair],
+    elapsed_hours: Decimal,
+    settings: OrreryDriftSettings,
+) -> tuple[EdgeKey, ...]:
+    """Return every directed edge :func:`plan_relationship_drift` could move.
+
+    Planning over just these edges yields the same plan as planning over the
+    whole graph; co-presence contributes nothing when no capped time elapsed.
+    """
+
+    pairs: set[EdgeKey] = set()
+    for milestone in project_milestones:
+        pairs.update(
+            _directed_edges(milestone.actor_entity_id, milestone.target_entity_id)
+        )
+    producing_types = {*settings.hostile_events, *settings.cooperative_events}
+    for event in events:
+        if event.event_type in producing_types:
+            pairs.update(_directed_edges(event.actor_entity_id, event.target_entity_id))
+    capped_hours = min(max(elapsed_hours, ZERO), settings.copresence_max_hours_per_tick)
+    if capped_hours != ZERO:
+        for pair in copresence_pairs:
+            pairs.update(_directed_edges(*pair.ordered()))
+    return tuple(sorted(pairs))
+
+
 def drain_relationship_drift_sync(
     cur: Any,
     *,
@@ -273,12 +310,18 @@ def drain_relationship_drift_sync(
     previous_world_time = _previous_primary_world_time_sync(
         cur, tick_chunk_id=tick_chunk_id
     )
+    producers = {
+        "project_milestones": _project_milestones_sync(cur, tick_chunk_id),
+        "events": _drift_events_sync(cur, tick_chunk_id, config),
+        "copresence_pairs": _copresence_pairs_sync(cur),
+        "elapsed_hours": _elapsed_hours(previous_world_time, world_time),
+    }
     plan = plan_relationship_drift(
-        relationships=_relationships_sync(cur),
-        project_milestones=_project_milestones_sync(cur, tick_chunk_id),
-        events=_drift_events_sync(cur, tick_chunk_id, config),
-        copresence_pairs=_copresence_pairs_sync(cur),
-        elapsed_hours=_elapsed_hours(previous_world_time, world_time),
+        relationships=_relationships_sync(
+            cur,
+            relationship_drift_candidate_edges(**producers, settings=config),
+        ),
+        **producers,
         settings=config,
     )
     result = _apply_plan_sync(
@@ -318,12 +361,18 @@ async def drain_relationship_drift_async(
     previous_world_time = await _previous_primary_world_time_async(
         conn, tick_chunk_id=tick_chunk_id
     )
+    producers = {
+        "project_milestones": await _project_milestones_async(conn, tick_chunk_id),
+        "events": await _drift_events_async(conn, tick_chunk_id, config),
+        "copresence_pairs": await _copresence_pairs_async(conn),
+        "elapsed_hours": _elapsed_hours(previous_world_time, world_time),
+    }
     plan = plan_relationship_drift(
-        relationships=await _relationships_async(conn),
-        project_milestones=await _project_milestones_async(conn, tick_chunk_id),
-        events=await _drift_events_async(conn, tick_chunk_id, config),
-        copresence_pairs=await _copresence_pairs_async(conn),
-        elapsed_hours=_elapsed_hours(previous_world_time, world_time),
+        relationships=await _relationships_async(
+            conn,
+            relationship_drift_candidate_edges(**producers, settings=config),
+        ),
+        **producers,
         settings=config,
     )
     result = await _apply_plan_async(
@@ -502,18 +551,49 @@ def _timedelta_seconds(value: timedelta) -> Decimal:
     )
 
 
-def _relationships_sync(cur: Any) -> dict[EdgeKey, Decimal]:
-    cur.execute(
-        """
-        SELECT source.entity_id AS source_entity_id,
-               target.entity_id AS target_entity_id,
-               relation.valence_current
-        FROM character_relationships relation
-        JOIN characters source ON source.id = relation.character1_id
-        JOIN characters target ON target.id = relation.character2_id
-        ORDER BY source.entity_id, target.entity_id
-        """
-    )
+_RELATIONSHIPS_SQL = """
+    SELECT source.entity_id AS source_entity_id,
+           target.entity_id AS target_entity_id,
+           relation.valence_current
+    FROM {candidates}
+    JOIN characters source ON source.entity_id = candidate.source_entity_id
+    JOIN characters target ON target.entity_id = candidate.target_entity_id
+    JOIN character_relationships relation
+      ON relation.character1_id = source.id
+     AND relation.character2_id = target.id
+    ORDER BY source.entity_id, target.entity_id
+"""
+
+_ALL_RELATIONSHIPS_SQL = """
+    SELECT source.entity_id AS source_entity_id,
+           target.entity_id AS target_entity_id,
+           relation.valence_current
+    FROM character_relationships relation
+    JOIN characters source ON source.id = relation.character1_id
+    JOIN characters target ON target.id = relation.character2_id
+    ORDER BY source.entity_id, target.entity_id
+"""
+
+
+def _relationships_sync(
+    cur: Any, edges: Optional[Sequence[EdgeKey]] = None
+) -> dict[EdgeKey, Decimal]:
+    """Load existing edge valences; ``edges`` restricts the load to candidates."""
+
+    if edges is None:
+        cur.execute(_ALL_RELATIONSHIPS_SQL)
+    elif not edges:
+        return {}
+    else:
+        cur.execute(
+            _RELATIONSHIPS_SQL.format(
+                candidates=(
+                    "unnest(%s::bigint[], %s::bigint[]) "
+                    "AS candidate(source_entity_id, target_entity_id)"
+                )
+            ),
+            ([edge[0] for edge in edges], [edge[1] for edge in edges]),
+        )
     return {
         (
             int(_row_get(row, "source_entity_id", 0)),
@@ -523,18 +603,24 @@ def _relationships_sync(cur: Any) -> dict[EdgeKey, Decimal]:
     }
 
 
-async def _relationships_async(conn: Any) -> dict[EdgeKey, Decimal]:
-    rows = await conn.fetch(
-        """
-        SELECT source.entity_id AS source_entity_id,
-               target.entity_id AS target_entity_id,
-               relation.valence_current
-        FROM character_relationships relation
-        JOIN characters source ON source.id = relation.character1_id
-        JOIN characters target ON target.id = relation.character2_id
-        ORDER BY source.entity_id, target.entity_id
-        """
-    )
+async def _relationships_async(
+    conn: Any, edges: Optional[Sequence[EdgeKey]] = None
+) -> dict[EdgeKey, Decimal]:
+    if edges is None:
+        rows = await conn.fetch(_ALL_RELATIONSHIPS_SQL)
+    elif not edges:
+        return {}
+    else:
+        rows = await conn.fetch(
+            _RELATIONSHIPS_SQL.format(
+                candidates=(
+                    "unnest($1::bigint[], $2::bigint[]) "
+                    "AS candidate(source_entity_id, target_entity_id)"
+                )
+            ),
+            [edge[0] for edge in edges],
+            [edge[1] for edge in edges],
+        )
     return {
         (
             int(row["source_entity_id"]),
@@ -709,6 +795,57 @@ async def _copresence_pairs_async(conn: Any) -> tuple[CopresencePair, ...]:
     )
 
 
+def copresence_pairs_from_state(state: Any) -> tuple[CopresencePair, ...]:
+    """Return ``_COPRESENCE_SQL``'s pairs, in its order, from a ``WorldState``.
+
+    Drains keep reading copresence in SQL; this is the in-memory form for
+    callers that already hold a hydrated state.
+    """
+
+    first, second = copresence_pair_arrays(state.entity_arrays())
+    return tuple(
+        CopresencePair(first_id, second_id)
+        for first_id, second_id in zip(first.tolist(), second.tolist())
+    )
+
+
+_VALENCE_UPDATE_SQL = """
+    UPDATE character_relationships relation
+    SET valence_current = planned.valence
+    FROM (VALUES {values}) AS planned(source_entity_id, target_entity_id, valence),
+         characters source,
+         characters target
+    WHERE source.entity_id = planned.source_entity_id
+      AND target.entity_id = planned.target_entity_id
+      AND relation.character1_id = source.id
+      AND relation.character2_id = target.id
+    RETURNING source.entity_id AS source_entity_id,
+              target.entity_id AS target_entity_id
+"""
+
+
+def _require_updated_edges(
+    page: Sequence[PlannedEdgeDrift], rows: Sequence[Any]
+) -> None:
+    """Fail the drain unless every planned edge of the page was written once."""
+
+    written = sorted(
+        (
+            int(_row_get(row, "source_entity_id", 0)),
+            int(_row_get(row, "target_entity_id", 1)),
+        )
+        for row in rows
+    )
+    planned = [(edge.source_entity_id, edge.target_entity_id) for edge in page]
+    if written != planned:
+        missing = sorted(set(planned) - set(written))
+        described = ", ".join(f"{source}->{target}" for source, target in missing)
+        raise RuntimeError(
+            "Relationship edge disappeared during drift application: "
+            f"{described or f'{len(rows)} rows written for {len(planned)} edges'}"
+        )
+
+
 def _apply_plan_sync(
     cur: Any,
     *,
@@ -717,30 +854,28 @@ def _apply_plan_sync(
     world_time: datetime,
     epistemics_settings: Any,
 ) -> RelationshipDriftDrainResult:
-    updated_edges = []
     event_ids = []
     claim_ids = []
-    for edge in plan.edges:
+    for start in range(0, len(plan.edges), VALENCE_UPDATE_PAGE_SIZE):
+        page = plan.edges[start : start + VALENCE_UPDATE_PAGE_SIZE]
+        values = ", ".join(["(%s::bigint, %s::bigint, %s::numeric)"] * len(page))
         cur.execute(
-            """
-            UPDATE character_relationships relation
-            SET valence_current = %s
-            FROM characters source, characters target
-            WHERE relation.character1_id = source.id
-              AND relation.character2_id = target.id
-              AND source.entity_id = %s
-              AND target.entity_id = %s
-            """,
-            (edge.new_valence, edge.source_entity_id, edge.target_entity_id),
+            _VALENCE_UPDATE_SQL.format(values=values),
+            [
+                value
+                for edge in page
+                for value in (
+                    edge.source_entity_id,
+                    edge.target_entity_id,
+                    edge.new_valence,
+                )
+            ],
         )
-        if cur.rowcount != 1:
-            raise RuntimeError(
-                "Relationship edge disappeared during drift application: "
-                f"{edge.source_entity_id}->{edge.target_entity_id}"
-            )
-        updated_edges.append((edge.source_entity_id, edge.target_entity_id))
-        if not edge.is_milestone:
-            continue
+        _require_updated_edges(page, cur.fetchall())
+    updated_edges = [
+        (edge.source_entity_id, edge.target_entity_id) for edge in plan.edges
+    ]
+    for edge in plan.milestones:
         event_id, claim_id = _emit_milestone_sync(
             cur,
             edge=edge,
@@ -766,32 +901,32 @@ async def _apply_plan_async(
     world_time: datetime,
     epistemics_settings: Any,
 ) -> RelationshipDriftDrainResult:
-    updated_edges = []
     event_ids = []
     claim_ids = []
-    for edge in plan.edges:
-        status = await conn.execute(
-            """
-            UPDATE character_relationships relation
-            SET valence_current = $1
-            FROM characters source, characters target
-            WHERE relation.character1_id = source.id
-              AND relation.character2_id = target.id
-              AND source.entity_id = $2
-              AND target.entity_id = $3
-            """,
-            edge.new_valence,
-            edge.source_entity_id,
-            edge.target_entity_id,
+    for start in range(0, len(plan.edges), VALENCE_UPDATE_PAGE_SIZE):
+        page = plan.edges[start : start + VALENCE_UPDATE_PAGE_SIZE]
+        values = ", ".join(
+            f"(${3 * index + 1}::bigint, ${3 * index + 2}::bigint, "
+            f"${3 * index + 3}::numeric)"
+            for index in range(len(page))
         )
-        if status != "UPDATE 1":
-            raise RuntimeError(
-                "Relationship edge disappeared during drift application: "
-                f"{edge.source_entity_id}->{edge.target_entity_id}"
-            )
-        updated_edges.append((edge.source_entity_id, edge.target_entity_id))
-        if not edge.is_milestone:
-            continue
+        rows = await conn.fetch(
+            _VALENCE_UPDATE_SQL.format(values=values),
+            *[
+                value
+                for edge in page
+                for value in (
+                    edge.source_entity_id,
+                    edge.target_entity_id,
+                    edge.new_valence,
+                )
+            ],
+        )
+        _require_updated_edges(page, rows)
+    updated_edges = [
+        (edge.source_entity_id, edge.target_entity_id) for edge in plan.edges
+    ]
+    for edge in plan.milestones:
         event_id, claim_id = await _emit_milestone_async(
             conn,
             edge=edge,
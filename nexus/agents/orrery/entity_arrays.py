@@ -0,0 +1,282 @@
+"""Array-backed projections of the Orrery entity universe and their kernels.
+
+The scalar paths walk ``WorldState`` mappings one entity at a time:
+``count_co_located`` rescans every location per evaluation, need hydration
+calls ``need_applies_to_tags`` and ``effective_debt_score`` per row, and
+present-need pressure calls ``severity_for_debt`` per actor and need. At
+large casts those loops dominate. This module projects the same data into
+NumPy arrays once and evaluates it in bulk:
+
+- :class:`EntityArrays` — dense location codes, in-transit flags and
+  per-vocabulary tag bitsets for every located entity of one state.
+  ``WorldState.entity_arrays`` builds it lazily and caches it on the
+  immutable snapshot, so a derived state always re-projects.
+- :func:`copresence_pair_arrays` — every co-located, non-travelling pair,
+  ordered as ``drift._COPRESENCE_SQL`` orders them.
+- :func:`need_applicability`, :func:`accrue_need_debts` and
+  :func:`need_severity_levels` — the bulk forms of ``need_applies_to_tags``,
+  ``effective_debt_score`` and ``severity_for_debt``.
+
+Every kernel performs the scalar path's float64 operations in the same order
+and returns identical values; ``tests/test_orrery/test_entity_arrays.py``
+checks that on randomized inputs.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping, Optional, Sequence
+
+import numpy as np
+
+from nexus.agents.orrery.needs import (
+    NEED_IMMUNITY_TAGS,
+    NEED_SEVERITY_LEVELS,
+    NEED_TYPES,
+    NeedTuning,
+    normalize_need_type,
+)
+
+NEED_INDEX: Mapping[str, int] = {need: index for index, need in enumerate(NEED_TYPES)}
+_NO_LOCATION = -1
+_IMMUNITY_VOCABULARY: tuple[str, ...] = tuple(
+    sorted(set().union(*NEED_IMMUNITY_TAGS.values()))
+)
+
+
+def need_type_index(need_type: str) -> int:
+    """Column of ``need_type`` in need arrays; unsupported types raise."""
+
+    index = NEED_INDEX.get(need_type)
+    if index is None:
+        index = NEED_INDEX[normalize_need_type(need_type)]
+    return index
+
+
+def tag_bitsets(
+    entity_ids: Sequence[int],
+    tags_by_entity: Mapping[int, Iterable[str]],
+    vocabulary: Sequence[str],
+) -> np.ndarray:
+    """One ``uint64`` per entity with bit ``i`` set when it holds ``vocabulary[i]``."""
+
+    if len(vocabulary) > 64:
+        raise ValueError(
+            f"tag_bitsets packs at most 64 tags per word, got {len(vocabulary)}"
+        )
+    bit_for = {tag: 1 << position for position, tag in enumerate(vocabulary)}
+    wanted = frozenset(bit_for)
+    words = [0] * len(entity_ids)
+    for row, entity_id in enumerate(entity_ids):
+        tags = tags_by_entity.get(entity_id)
+        if not tags:
+            continue
+        word = 0
+        for tag in wanted.intersection(tags):
+            word |= bit_for[tag]
+        words[row] = word
+    return np.array(words, dtype=np.uint64)
+
+
+def _tag_mask(vocabulary: Sequence[str], tags: Iterable[str]) -> np.uint64:
+    position = {tag: index for index, tag in enumerate(vocabulary)}
+    mask = 0
+    for tag in tags:
+        mask |= 1 << position[tag]
+    return np.uint64(mask)
+
+
+@dataclass(frozen=True, slots=True)
+class EntityArrays:
+    """Located entities of one ``WorldState`` as parallel arrays.
+
+    Row ``i`` describes ``entity_ids[i]``; rows follow ascending entity id.
+    ``location_codes`` are dense per-state codes (equal codes mean equal
+    location ids) with ``-1`` for a ``None`` location.
+    """
+
+    entity_ids: np.ndarray
+    location_codes: np.ndarray
+    in_transit: np.ndarray
+    row_of: Mapping[int, int]
+    tags: Mapping[int, frozenset[str]] = field(repr=False)
+    ephemeral_tags: Mapping[int, frozenset[str]] = field(repr=False)
+    _cache: dict[Any, Any] = field(default_factory=dict, repr=False, compare=False)
+
+    def tag_bits(
+        self, vocabulary: Sequence[str], *, ephemeral: bool = False
+    ) -> np.ndarray:
+        """Cached :func:`tag_bitsets` over durable or ephemeral tags."""
+
+        key = ("tag_bits", tuple(vocabulary), ephemeral)
+        bits = self._cache.get(key)
+        if bits is None:
+            bits = tag_bitsets(
+                self.entity_ids.tolist(),
+                self.ephemeral_tags if ephemeral else self.tags,
+                vocabulary,
+            )
+            self._cache[key] = bits
+        return bits
+
+    def has_tag(self, tag: str, *, ephemeral: bool = False) -> np.ndarray:
+        """Boolean column: which rows hold ``tag``."""
+
+        return self.tag_bits((tag,), ephemeral=ephemeral) != 0
+
+    def co_located_count(
+        self,
+        entity_id: int,
+        *,
+        with_tag: Optional[str] = None,
+        with_ephemeral: Optional[str] = None,
+    ) -> int:
+        """Other non-travelling entities at ``entity_id``'s location.
+
+        Filters match ``substrate.count_co_located``. Per-location counts are
+        built once per filter and reused by every later call.
+        """
+
+        key = ("co_located", with_tag or None, with_ephemeral or None)
+        cached = self._cache.get(key)
+        if cached is None:
+            eligible = (self.location_codes != _NO_LOCATION) & ~self.in_transit
+            if with_tag:
+                eligible &= self.has_tag(with_tag)
+            if with_ephemeral:
+                eligible &= self.has_tag(with_ephemeral, ephemeral=True)
+            counts = np.bincount(
+                self.location_codes[eligible],
+                minlength=int(self.location_codes.max(initial=_NO_LOCATION)) + 1,
+            )
+            cached = self._cache[key] = (eligible, counts)
+        eligible, counts = cached
+        row = self.row_of[entity_id]
+        code = self.location_codes[row]
+        if code == _NO_LOCATION:
+            return 0
+        return int(counts[code]) - int(eligible[row])
+
+
+def project_entity_arrays(state: Any) -> EntityArrays:
+    """Project ``state.locations``/``travel_states``/tags into arrays."""
+
+    entity_ids = sorted(state.locations)
+    location_code: dict[Any, int] = {}
+    codes = []
+    in_transit = []
+    travel_states = state.travel_states
+    for entity_id in entity_ids:
+        location_id = state.locations[entity_id]
+        if location_id is None:
+            codes.append(_NO_LOCATION)
+        else:
+            codes.append(location_code.setdefault(location_id, len(location_code)))
+        travel_state = travel_states.get(entity_id)
+        in_transit.append(bool(travel_state and travel_state.is_in_transit))
+    return EntityArrays(
+        entity_ids=np.array(entity_ids, dtype=np.int64),
+        location_codes=np.array(codes, dtype=np.int64),
+        in_transit=np.array(in_transit, dtype=bool),
+        row_of={entity_id: row for row, entity_id in enumerate(entity_ids)},
+        tags=state.tags,
+        ephemeral_tags=state.ephemeral_tags,
+    )
+
+
+def copresence_pair_arrays(arrays: EntityArrays) -> tuple[np.ndarray, np.ndarray]:
+    """``(first, second)`` entity ids of every co-located pair, ``first < second``.
+
+    Pairs are ordered by ``(first, second)``, the ``_COPRESENCE_SQL`` order.
+    """
+
+    present = (arrays.location_codes != _NO_LOCATION) & ~arrays.in_transit
+    ids = arrays.entity_ids[present]
+    codes = arrays.location_codes[present]
+    order = np.lexsort((ids, codes))
+    ids = ids[order]
+    codes = codes[order]
+    size = len(ids)
+    if size < 2:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    starts = np.flatnonzero(np.diff(codes)) + 1
+    bounds = np.concatenate(([0], starts, [size]))
+    group_end = np.repeat(bounds[1:], np.diff(bounds))
+    # Row p pairs with every later row of its location group.
+    partners = group_end - np.arange(size) - 1
+    first_rows = np.repeat(np.arange(size), partners)
+    offsets = np.arange(len(first_rows)) - np.repeat(
+        np.cumsum(partners) - partners, partners
+    )
+    first = ids[first_rows]
+    second = ids[first_rows + 1 + offsets]
+    order = np.lexsort((second, first))
+    return first[order], second[order]
+
+
+def need_applicability(
+    entity_ids: Sequence[int], tags_by_entity: Mapping[int, Iterable[str]]
+) -> np.ndarray:
+    """``(entities, needs)`` mask of :func:`needs.need_applies_to_tags`."""
+
+    bits = tag_bitsets(entity_ids, tags_by_entity, _IMMUNITY_VOCABULARY)
+    masks = np.array(
+        [
+            _tag_mask(_IMMUNITY_VOCABULARY, NEED_IMMUNITY_TAGS[need])
+            for need in NEED_TYPES
+        ],
+        dtype=np.uint64,
+    )
+    return (bits[:, None] & masks[None, :]) == 0
+
+
+def accrual_rates(tuning: NeedTuning) -> np.ndarray:
+    """Per-need accrual rates in ``NEED_TYPES`` order."""
+
+    return np.array([tuning.accrual_rates[need] for need in NEED_TYPES])
+
+
+def severity_thresholds(tuning: NeedTuning) -> np.ndarray:
+    """``(needs, 4)`` thresholds; column ``level - 1`` holds that level's floor."""
+
+    by_level = {level: name for level, name in NEED_SEVERITY_LEVELS}
+    return np.array(
+        [
+            [
+                tuning.severity_thresholds[need][by_level[level]]
+                for level in (1, 2, 3, 4)
+            ]
+            for need in NEED_TYPES
+        ]
+    )
+
+
+def accrue_need_debts(
+    debt_scores: np.ndarray, elapsed_seconds: np.ndarray, rates: np.ndarray
+) -> np.ndarray:
+    """Bulk :func:`needs.effective_debt_score`.
+
+    ``elapsed_seconds`` is ``0.0`` where either timestamp is missing and
+    ``rates`` is each row's accrual rate.
+    """
+
+    with np.errstate(invalid="ignore", over="ignore"):
+        hours = np.where(elapsed_seconds > 0, elapsed_seconds / 3600.0, 0.0)
+        accrued = np.where(hours > 0, debt_scores + hours * rates, debt_scores)
+        # max(0.0, x): 0.0 unless x is strictly positive (NaN included).
+        return np.where(accrued > 0.0, accrued, 0.0)
+
+
+def need_severity_levels(debt_scores: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """Bulk :func:`needs.severity_for_debt` as levels, ``0`` for no severity.
+
+    ``debt_scores`` is ``(entities, needs)``; ``thresholds`` is from
+    :func:`severity_thresholds`. Like the scalar path, the highest level
+    whose threshold is met wins even if thresholds are not monotonic.
+    """
+
+    levels = np.zeros(debt_scores.shape, dtype=np.int8)
+    for level in (1, 2, 3, 4):
+        levels = np.where(debt_scores >= thresholds[:, level - 1], level, levels)
+    return levels
@@ -52,6 +52,7 @@ class EpistemicsPolicy:
     enabled: bool = False
     claim_event_types: frozenset[str] = frozenset()
     aware_roles: frozenset[str] = frozenset()
+    hydration_parity_check: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -136,6 +137,7 @@ def coerce_epistemics_policy(raw: Any) -> EpistemicsPolicy:
         enabled=bool(raw.get("enabled", True)),
         claim_event_types=frozenset(event_types),
         aware_roles=frozenset(aware_roles),
+        hydration_parity_check=bool(raw.get("hydration_parity_check", False)),
     )
 
 
@@ -965,6 +967,7 @@ def load_epistemics_hydration(
     entity_ids: Iterable[int],
     recent_event_ids: Iterable[int],
     anchor_chunk_id: Optional[int],
+    parity_check: bool = False,
 ) -> EpistemicsHydration:
     """Hydrate anchor-visible claim possession for an explicit entity universe.
 
@@ -977,6 +980,11 @@ def load_epistemics_hydration(
     are loaded on separate axes, so neither can multiply the other. No
     predicate performs follow-up SQL. ``None`` retains the unbounded
     current-table view for direct callers without a historical anchor.
+
+    Possession is read from ``claim_possession_index`` (migration 122) when
+    the schema has it, so cost follows the universe rather than the claim
+    ledger; older schemas use the ledger joins. ``parity_check`` also runs
+    the ledger joins and raises if the index disagrees with them.
     """
 
     universe = tuple(sorted({int(entity_id) for entity_id in entity_ids}))
@@ -995,7 +1003,9 @@ def load_epistemics_hydration(
             text(
                 """
                 /* orrery:epistemics_hydration:backstory_availability */
-                SELECT to_regclass('backstory_secrets') IS NOT NULL AS available
+                SELECT to_regclass('backstory_secrets') IS NOT NULL AS available,
+                       to_regclass('claim_possession_index') IS NOT NULL
+                           AS possession_index_available
                 """
             )
         )
@@ -1003,6 +1013,9 @@ def load_epistemics_hydration(
         .first()
     )
     backstory_available = bool(availability and availability["available"])
+    possession_index_available = bool(
+        availability and availability.get("possession_index_available")
+    )
     # A pre-091 schema cannot contain latent backstory bindings. Rendering a
     # literal false keeps all divergence shapes loud until the table exists.
     latent_secret_flag = (
@@ -1070,88 +1083,242 @@ def load_epistemics_hydration(
             possessed_claim_knowledge_by_entity={},
         )
 
-    claims_query = text(
-        f"""
-        /* orrery:epistemics_hydration:claims */
-        WITH anchor AS (
-            SELECT created_at
-            FROM narrative_chunks
-            WHERE id = :anchor_chunk_id
+    possession = {
+        "latent_secret_flag": latent_secret_flag,
+        "universe": universe,
+        "anchor_chunk_id": anchor_chunk_id,
+    }
+    claims, awareness_rows = _load_claim_possession(
+        session, indexed=possession_index_available, **possession
+    )
+    if parity_check and possession_index_available:
+        ledger_claims, ledger_awareness = _load_claim_possession(
+            session, indexed=False, **possession
+        )
+        claim_drift = sorted(
+            claim_id
+            for claim_id in claims.keys() | ledger_claims.keys()
+            if claims.get(claim_id) != ledger_claims.get(claim_id)
+        )
+        awareness_drift = sorted(
+            key
+            for key in awareness_rows.keys() | ledger_awareness.keys()
+            if awareness_rows.get(key) != ledger_awareness.get(key)
+        )
+        if claim_drift or awareness_drift:
+            raise RuntimeError(
+                "claim_possession_index disagrees with the claim ledgers for "
+                f"claims {claim_drift} and (claim, knower) pairs "
+                f"{awareness_drift}; re-run "
+                "migrations/122_claim_possession_index.sql to rebuild it"
+            )
+
+    awareness: dict[int, set[int]] = {}
+    for claim_id, knower_id in awareness_rows:
+        # Event-level knowledge intentionally collapses sibling possession;
+        # claim_knowledge below preserves the exact possessed account id.
+        awareness.setdefault(knower_id, set()).add(
+            int(claims[claim_id]["world_event_id"])
+        )
+
+    claim_knowledge: dict[int, list[ClaimKnowledge]] = {}
+    for (claim_id, knower_id), row in sorted(awareness_rows.items()):
+        claim = claims[claim_id]
+        immediate_source = row["immediate_source_entity_id"]
+        claim_knowledge.setdefault(knower_id, []).append(
+            ClaimKnowledge(
+                claim_id=claim_id,
+                world_event_id=int(claim["world_event_id"]),
+                scope=str(claim["scope"]),
+                source_tier=str(row["source_tier"]),
+                about_entity_ids=frozenset(claim["about_entity_ids"]),
+                channel=(str(row["channel"]) if row["channel"] is not None else None),
+                immediate_source_entity_id=(
+                    int(immediate_source) if immediate_source is not None else None
+                ),
+            )
+        )
+
+    common_claims = tuple(
+        ClaimKnowledge(
+            claim_id=claim_id,
+            world_event_id=int(claim["world_event_id"]),
+            scope="common",
+            source_tier="common",
+            about_entity_ids=frozenset(claim["about_entity_ids"]),
+        )
+        for claim_id, claim in sorted(claims.items())
+        if claim["scope"] == "common"
+    )
+    explicit_claims = {
+        entity_id: tuple(records) for entity_id, records in claim_knowledge.items()
+    }
+    return EpistemicsHydration(
+        claimed_event_scopes=scopes,
+        awareness_by_entity={
+            entity_id: frozenset(events) for entity_id, events in awareness.items()
+        },
+        claim_knowledge_by_entity=explicit_claims,
+        common_claim_knowledge=common_claims,
+        possessed_claim_knowledge_by_entity=_merge_possessed_claim_knowledge(
+            universe,
+            explicit_claims=explicit_claims,
+            common_claims=common_claims,
         ),
-        relevant_claim_ids AS (
-            SELECT c.id AS claim_id
-            FROM claims c
-            JOIN world_events we ON we.id = c.world_event_id
-            WHERE (:anchor_chunk_id IS NULL
-                   OR we.tick_chunk_id <= :anchor_chunk_id)
-              AND (we.actor_entity_id = ANY(:entity_ids)
-                   OR we.target_entity_id = ANY(:entity_ids))
-            UNION
-            SELECT c.id AS claim_id
-            FROM claims c
-            JOIN world_event_entities wee ON wee.event_id = c.world_event_id
-            JOIN world_events we ON we.id = c.world_event_id
-            WHERE (:anchor_chunk_id IS NULL
-                   OR we.tick_chunk_id <= :anchor_chunk_id)
-              AND wee.entity_id = ANY(:entity_ids)
-            UNION
-            SELECT ca.claim_id
-            FROM claim_awareness ca
-            JOIN claims c ON c.id = ca.claim_id
-            JOIN world_events we ON we.id = c.world_event_id
-            WHERE c.scope <> 'common'
-              AND ca.knower_entity_id = ANY(:entity_ids)
-              AND (:anchor_chunk_id IS NULL
-                   OR we.tick_chunk_id <= :anchor_chunk_id)
-              -- Mirror replay.py's claim-awareness readmission visibility.
-              AND (
+    )
+
+
+# Mirror replay.py's claim-awareness readmission visibility over the index's
+# copies of claim_awareness.source_chunk_id and created_at.
+_INDEXED_AWARENESS_VISIBLE = """(
                   :anchor_chunk_id IS NULL
-                  OR (ca.source_chunk_id IS NOT NULL
-                      AND ca.source_chunk_id <= :anchor_chunk_id)
-                  OR (ca.source_chunk_id IS NULL
-                      AND ca.created_at <= (SELECT created_at FROM anchor))
-              )
-        ),
-        claim_entities AS (
-            SELECT relevant.claim_id, subjects.entity_id
+                  OR (p.acquired_chunk_id IS NOT NULL
+                      AND p.acquired_chunk_id <= :anchor_chunk_id)
+                  OR (p.acquired_chunk_id IS NULL
+                      AND p.acquired_at <= (SELECT created_at FROM anchor))
+              )"""
+
+
+def _load_claim_possession(
+    session: Any,
+    *,
+    indexed: bool,
+    latent_secret_flag: str,
+    universe: tuple[int, ...],
+    anchor_chunk_id: Optional[int],
+) -> tuple[dict[int, dict[str, Any]], dict[tuple[int, int], dict[str, Any]]]:
+    """Load relevant claims and universe awareness rows keyed by claim/knower.
+
+    ``indexed`` reads ``claim_possession_index``; otherwise the claim,
+    event and awareness ledgers are joined directly. Both shapes agree.
+    """
+
+    if indexed:
+        claims_query = text(
+            f"""
+            /* orrery:epistemics_hydration:indexed_claims */
+            WITH anchor AS (
+                SELECT created_at
+                FROM narrative_chunks
+                WHERE id = :anchor_chunk_id
+            ),
+            relevant_claim_ids AS (
+                SELECT DISTINCT p.claim_id
+                FROM claim_possession_index p
+                WHERE p.entity_id = ANY(:entity_ids)
+                  AND (:anchor_chunk_id IS NULL
+                       OR p.event_chunk_id <= :anchor_chunk_id)
+                  AND (
+                      p.tier = 'subject'
+                      OR (p.scope <> 'common' AND {_INDEXED_AWARENESS_VISIBLE})
+                  )
+            )
+            SELECT c.id AS claim_id,
+                   c.world_event_id,
+                   c.scope,
+                   {latent_secret_flag} AS is_latent_backstory_secret,
+                   COALESCE(
+                       about.about_entity_ids,
+                       ARRAY[]::bigint[]
+                   ) AS about_entity_ids
             FROM relevant_claim_ids relevant
             JOIN claims c ON c.id = relevant.claim_id
-            JOIN world_events we ON we.id = c.world_event_id
-            JOIN LATERAL (
-                SELECT we.actor_entity_id AS entity_id
-                WHERE we.actor_entity_id IS NOT NULL
+            LEFT JOIN LATERAL (
+                SELECT array_agg(subject.entity_id ORDER BY subject.entity_id)
+                           AS about_entity_ids
+                FROM claim_possession_index subject
+                WHERE subject.claim_id = c.id
+                  AND subject.tier = 'subject'
+            ) about ON true
+            WHERE c.scope <> 'common'
+               OR COALESCE(about.about_entity_ids, ARRAY[]::bigint[])
+                  && CAST(:entity_ids AS bigint[])
+            ORDER BY c.id
+            """
+        )
+    else:
+        claims_query = text(
+            f"""
+            /* orrery:epistemics_hydration:claims */
+            WITH anchor AS (
+                SELECT created_at
+                FROM narrative_chunks
+                WHERE id = :anchor_chunk_id
+            ),
+            relevant_claim_ids AS (
+                SELECT c.id AS claim_id
+                FROM claims c
+                JOIN world_events we ON we.id = c.world_event_id
+                WHERE (:anchor_chunk_id IS NULL
+                       OR we.tick_chunk_id <= :anchor_chunk_id)
+                  AND (we.actor_entity_id = ANY(:entity_ids)
+                       OR we.target_entity_id = ANY(:entity_ids))
                 UNION
-                SELECT we.target_entity_id AS entity_id
-                WHERE we.target_entity_id IS NOT NULL
+                SELECT c.id AS claim_id
+                FROM claims c
+                JOIN world_event_entities wee ON wee.event_id = c.world_event_id
+                JOIN world_events we ON we.id = c.world_event_id
+                WHERE (:anchor_chunk_id IS NULL
+                       OR we.tick_chunk_id <= :anchor_chunk_id)
+                  AND wee.entity_id = ANY(:entity_ids)
                 UNION
-                SELECT wee.entity_id
-                FROM world_event_entities wee
-                WHERE wee.event_id = we.id
-            ) subjects ON true
-        ),
-        about_by_claim AS (
-            SELECT claim_id,
-                   array_agg(entity_id ORDER BY entity_id) AS about_entity_ids
-            FROM claim_entities
-            GROUP BY claim_id
+                SELECT ca.claim_id
+                FROM claim_awareness ca
+                JOIN claims c ON c.id = ca.claim_id
+                JOIN world_events we ON we.id = c.world_event_id
+                WHERE c.scope <> 'common'
+                  AND ca.knower_entity_id = ANY(:entity_ids)
+                  AND (:anchor_chunk_id IS NULL
+                       OR we.tick_chunk_id <= :anchor_chunk_id)
+                  -- Mirror replay.py's claim-awareness readmission visibility.
+                  AND (
+                      :anchor_chunk_id IS NULL
+                      OR (ca.source_chunk_id IS NOT NULL
+                          AND ca.source_chunk_id <= :anchor_chunk_id)
+                      OR (ca.source_chunk_id IS NULL
+                          AND ca.created_at <= (SELECT created_at FROM anchor))
+                  )
+            ),
+            claim_entities AS (
+                SELECT relevant.claim_id, subjects.entity_id
+                FROM relevant_claim_ids relevant
+                JOIN claims c ON c.id = relevant.claim_id
+                JOIN world_events we ON we.id = c.world_event_id
+                JOIN LATERAL (
+                    SELECT we.actor_entity_id AS entity_id
+                    WHERE we.actor_entity_id IS NOT NULL
+                    UNION
+                    SELECT we.target_entity_id AS entity_id
+                    WHERE we.target_entity_id IS NOT NULL
+                    UNION
+                    SELECT wee.entity_id
+                    FROM world_event_entities wee
+                    WHERE wee.event_id = we.id
+                ) subjects ON true
+            ),
+            about_by_claim AS (
+                SELECT claim_id,
+                       array_agg(entity_id ORDER BY entity_id) AS about_entity_ids
+                FROM claim_entities
+                GROUP BY claim_id
+            )
+            SELECT c.id AS claim_id,
+                   c.world_event_id,
+                   c.scope,
+                   {latent_secret_flag} AS is_latent_backstory_secret,
+                   COALESCE(
+                       about.about_entity_ids,
+                       ARRAY[]::bigint[]
+                   ) AS about_entity_ids
+            FROM relevant_claim_ids relevant
+            JOIN claims c ON c.id = relevant.claim_id
+            LEFT JOIN about_by_claim about ON about.claim_id = c.id
+            WHERE c.scope <> 'common'
+               OR COALESCE(about.about_entity_ids, ARRAY[]::bigint[])
+                  && CAST(:entity_ids AS bigint[])
+            ORDER BY c.id
+            """
         )
-        SELECT c.id AS claim_id,
-               c.world_event_id,
-               c.scope,
-               {latent_secret_flag} AS is_latent_backstory_secret,
-               COALESCE(
-                   about.about_entity_ids,
-                   ARRAY[]::bigint[]
-               ) AS about_entity_ids
-        FROM relevant_claim_ids relevant
-        JOIN claims c ON c.id = relevant.claim_id
-        LEFT JOIN about_by_claim about ON about.claim_id = c.id
-        WHERE c.scope <> 'common'
-           OR COALESCE(about.about_entity_ids, ARRAY[]::bigint[])
-              && CAST(:entity_ids AS bigint[])
-        ORDER BY c.id
-        """
-    )
     claims: dict[int, dict[str, Any]] = {}
     hydrated_scope_rows: dict[int, list[tuple[str, bool]]] = {}
     for row in session.execute(
@@ -1179,9 +1346,32 @@ def load_epistemics_hydration(
     for event_id, sibling_rows in hydrated_scope_rows.items():
         _merge_sibling_scope(event_id=event_id, rows=sibling_rows)
 
-    awareness: dict[int, set[int]] = {}
     awareness_rows: dict[tuple[int, int], dict[str, Any]] = {}
-    if claims:
+    if not claims:
+        return claims, awareness_rows
+    if indexed:
+        awareness_query = text(
+            f"""
+            /* orrery:epistemics_hydration:indexed_awareness */
+            WITH anchor AS (
+                SELECT created_at
+                FROM narrative_chunks
+                WHERE id = :anchor_chunk_id
+            )
+            SELECT p.claim_id,
+                   p.entity_id AS knower_entity_id,
+                   p.tier AS source_tier,
+                   p.channel,
+                   p.immediate_source_entity_id
+            FROM claim_possession_index p
+            WHERE p.entity_id = ANY(:entity_ids)
+              AND p.claim_id = ANY(:claim_ids)
+              AND p.tier <> 'subject'
+              AND {_INDEXED_AWARENESS_VISIBLE}
+            ORDER BY p.claim_id, p.entity_id
+            """
+        )
+    else:
         awareness_query = text(
             """
             /* orrery:epistemics_hydration:awareness */
@@ -1209,30 +1399,21 @@ def load_epistemics_hydration(
             ORDER BY ca.claim_id, ca.knower_entity_id
             """
         )
-        awareness_results = session.execute(
-            awareness_query,
-            {
-                "claim_ids": sorted(claims),
-                "entity_ids": list(universe),
-                "anchor_chunk_id": anchor_chunk_id,
-            },
-        ).mappings()
-    else:
-        awareness_results = ()
-
-    for row in awareness_results:
+    for row in session.execute(
+        awareness_query,
+        {
+            "claim_ids": sorted(claims),
+            "entity_ids": list(universe),
+            "anchor_chunk_id": anchor_chunk_id,
+        },
+    ).mappings():
         claim_id = int(row["claim_id"])
-        event_id = int(claims[claim_id]["world_event_id"])
-        knower_entity_id = row["knower_entity_id"]
-        knower_id = int(knower_entity_id)
+        knower_id = int(row["knower_entity_id"])
         source_tier = str(row["source_tier"])
         if source_tier not in SOURCE_TIERS:
             raise ValueError(
                 f"Claim {claim_id} has unknown awareness tier {source_tier!r}"
             )
-        # Event-level knowledge intentionally collapses sibling possession;
-        # claim_knowledge below preserves the exact possessed account id.
-        awareness.setdefault(knower_id, set()).add(event_id)
         awareness_rows.setdefault(
             (claim_id, knower_id),
             {
@@ -1241,52 +1422,7 @@ def load_epistemics_hydration(
                 "immediate_source_entity_id": row["immediate_source_entity_id"],
             },
         )
-
-    claim_knowledge: dict[int, list[ClaimKnowledge]] = {}
-    for (claim_id, knower_id), row in sorted(awareness_rows.items()):
-        claim = claims[claim_id]
-        immediate_source = row["immediate_source_entity_id"]
-        claim_knowledge.setdefault(knower_id, []).append(
-            ClaimKnowledge(
-                claim_id=claim_id,
-                world_event_id=int(claim["world_event_id"]),
-                scope=str(claim["scope"]),
-                source_tier=str(row["source_tier"]),
-                about_entity_ids=frozenset(claim["about_entity_ids"]),
-                channel=(str(row["channel"]) if row["channel"] is not None else None),
-                immediate_source_entity_id=(
-                    int(immediate_source) if immediate_source is not None else None
-                ),
-            )
-        )
-
-    common_claims = tuple(
-        ClaimKnowledge(
-            claim_id=claim_id,
-            world_event_id=int(claim["world_event_id"]),
-            scope="common",
-            source_tier="common",
-            about_entity_ids=frozenset(claim["about_entity_ids"]),
-        )
-        for claim_id, claim in sorted(claims.items())
-        if claim["scope"] == "common"
-    )
-    explicit_claims = {
-        entity_id: tuple(records) for entity_id, records in claim_knowledge.items()
-    }
-    return EpistemicsHydration(
-        claimed_event_scopes=scopes,
-        awareness_by_entity={
-            entity_id: frozenset(events) for entity_id, events in awareness.items()
-        },
-        claim_knowledge_by_entity=explicit_claims,
-        common_claim_knowledge=common_claims,
-        possessed_claim_knowledge_by_entity=_merge_possessed_claim_knowledge(
-            universe,
-            explicit_claims=explicit_claims,
-            common_claims=common_claims,
-        ),
-    )
+    return claims, awareness_rows
 
 
 def _merge_possessed_claim_knowledge(
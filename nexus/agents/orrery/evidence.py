@@ -33,15 +33,24 @@ The one name-unrecoverable input is ``recent_event``'s ``changed_fields``
 filter (the name carries only a ``,fields`` marker). No builtin template uses
 it; when it appears, ``result`` is ``None`` and the caller skips the
 cross-check rather than pretending to a verdict it cannot recompute.
+
+Cost: a full-tick explain resolves thousands of leaves, most of them repeats.
+Leaf names are parsed once (:func:`_parse_leaf` caches the match, dispatching
+on the kind prefix straight to its one catalog pattern), and
+:func:`resolve_evidence_batch` resolves every distinct leaf of a stack for one
+binding set in a single pass that shares per-entity derived data (current tag
+sets, place classes, travel state) across resolvers.
 """
 
 from __future__ import annotations
 
 import re
-from dataclasses import asdict
-from typing import Any, Callable, Mapping, Optional
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Hashable, Iterable, Mapping, Optional
 
-from nexus.agents.orrery.catalog import _PREDICATE_PARSERS
+from nexus.agents.orrery.catalog import _PARSERS_BY_KIND
 from nexus.agents.orrery.status_family import (
     STATUS_LEVEL_RANKS,
     STATUS_TAG_PREFIX,
@@ -95,6 +104,35 @@ _Resolver = Callable[["re.Match[str]", WorldState, Bindings], "dict[str, Any]"]
 _RESOLVERS: dict[str, _Resolver] = {}
 
 
+@dataclass(slots=True)
+class _Derivations:
+    """Per-entity values several resolvers read, memoized for one batch.
+
+    Scoped to a single ``state`` object: helpers fall back to a direct read
+    whenever the active scope belongs to a different state.
+    """
+
+    state: WorldState
+    tables: dict[str, dict[Hashable, Any]] = field(default_factory=dict)
+
+
+_derivations: ContextVar[Optional[_Derivations]] = ContextVar(
+    "orrery_evidence_derivations", default=None
+)
+
+
+def _derived(
+    state: WorldState, table: str, key: Hashable, compute: Callable[[], Any]
+) -> Any:
+    scope = _derivations.get()
+    if scope is None or scope.state is not state:
+        return compute()
+    memo = scope.tables.setdefault(table, {})
+    if key not in memo:
+        memo[key] = compute()
+    return memo[key]
+
+
 def _resolver(kind: str) -> Callable[[_Resolver], _Resolver]:
     def _register(func: _Resolver) -> _Resolver:
         _RESOLVERS[kind] = func
@@ -111,8 +149,12 @@ def _entity(bindings: Bindings, slot_name: str) -> Optional[int]:
 def _current_tags(state: WorldState, entity_id: Optional[int]) -> frozenset[str]:
     if entity_id is None:
         return frozenset()
-    return state.tags.get(entity_id, frozenset()) | state.ephemeral_tags.get(
-        entity_id, frozenset()
+    return _derived(
+        state,
+        "current_tags",
+        entity_id,
+        lambda: state.tags.get(entity_id, frozenset())
+        | state.ephemeral_tags.get(entity_id, frozenset()),
     )
 
 
@@ -708,11 +750,18 @@ def _has_need_debt_at_or_above(
 def _place_classes(state: WorldState, place_id: Optional[int]) -> dict[str, Any]:
     if place_id is None:
         return {"place_id": None, "semantic_classes": [], "legacy_class": None}
-    return {
-        "place_id": place_id,
-        "semantic_classes": sorted(state.location_classes.get(place_id, frozenset())),
-        "legacy_class": state.location_class.get(place_id),
-    }
+    return _derived(
+        state,
+        "place_classes",
+        place_id,
+        lambda: {
+            "place_id": place_id,
+            "semantic_classes": sorted(
+                state.location_classes.get(place_id, frozenset())
+            ),
+            "legacy_class": state.location_class.get(place_id),
+        },
+    )
 
 
 @_resolver("in_location_class")
@@ -911,8 +960,12 @@ def _has_established_partner_co_located(
 def _travel_state(state: WorldState, entity_id: Optional[int]) -> Optional[dict]:
     if entity_id is None:
         return None
-    travel = state.travel_states.get(entity_id)
-    return asdict(travel) if travel is not None else None
+
+    def _read() -> Optional[dict]:
+        travel = state.travel_states.get(entity_id)
+        return asdict(travel) if travel is not None else None
+
+    return _derived(state, "travel_state", entity_id, _read)
 
 
 @_resolver("is_in_transit")
@@ -2013,6 +2066,17 @@ def resolve_evidence(
     if name == "NEVER":
         return _evidence("never", params={}, entities={}, observed={}, result=False)
 
+    resolver, match = _parse_leaf(name)
+    return resolver(match, state, bindings)
+
+
+@lru_cache(maxsize=4096)
+def _parse_leaf(name: str) -> tuple[_Resolver, "re.Match[str]"]:
+    """Return the resolver and parsed match for one leaf name, once per name.
+
+    The match is shared across calls; resolvers only read its groups.
+    """
+
     kind = name.split("(", 1)[0]
     resolver = _RESOLVERS.get(kind)
     if resolver is None:
@@ -2020,11 +2084,32 @@ def resolve_evidence(
             f"No evidence resolver for predicate kind {kind!r} (leaf {name!r}); "
             "add one to nexus/agents/orrery/evidence.py"
         )
-    for pattern, _formatter in _PREDICATE_PARSERS:
-        match = pattern.fullmatch(name)
-        if match is not None:
-            return resolver(match, state, bindings)
-    raise EvidenceResolutionError(
-        f"Leaf {name!r} matched no catalog parser; the __name__ grammar and "
-        "catalog._PREDICATE_PARSERS have drifted"
-    )
+    entry = _PARSERS_BY_KIND.get(kind)
+    match = entry[0].fullmatch(name) if entry is not None else None
+    if match is None:
+        raise EvidenceResolutionError(
+            f"Leaf {name!r} matched no catalog parser; the __name__ grammar and "
+            "catalog._PREDICATE_PARSERS have drifted"
+        )
+    return resolver, match
+
+
+def resolve_evidence_batch(
+    names: Iterable[str], state: WorldState, bindings: Bindings
+) -> dict[str, dict[str, Any]]:
+    """Resolve every distinct leaf name for one binding set in a single pass.
+
+    Equivalent to calling :func:`resolve_evidence` per name, but repeated
+    leaves resolve once and per-entity derived data is read once for the
+    whole batch. Payloads for a repeated name are the same object.
+    """
+
+    resolved: dict[str, dict[str, Any]] = {}
+    token = _derivations.set(_Derivations(state))
+    try:
+        for name in names:
+            if name not in resolved:
+                resolved[name] = resolve_evidence(name, state, bindings)
+    finally:
+        _derivations.reset(token)
+    return resolved
@@ -4,6 +4,10 @@ from __future__ import annotations
 
 from typing import Any, Sequence
 
+from nexus.agents.memnon.utils.embedding_batches import (
+    embed_in_length_buckets,
+    upsert_bucket_vectors,
+)
 from nexus.agents.memnon.utils.embedding_tables import (
     ensure_character_experience_embedding_table,
 )
@@ -38,18 +42,18 @@ def embed_character_experiences(
 ) -> list[dict[str, Any]]:
     """Embed rendered recollections and stamp only after every vector upsert.
 
-    Every active-model embedding is generated before the write transaction.
-    Dimension tables, all model vectors, and every ironman timestamp then land
-    in one transaction. A generation or write failure leaves the entire input
+    Every active-model embedding is generated before the write transaction,
+    in length-bucketed batches. Dimension tables, each bucket's vectors (one
+    upsert per bucket), and every ironman timestamp then land in one
+    transaction. A generation or write failure leaves the entire input
     set unstamped and retryable.
     """
     requested_ids = _normalized_experience_ids(experience_ids)
     if not requested_ids:
         return []
 
-    from nexus.agents.memnon.utils.embedding_manager import EmbeddingManager
     from nexus.agents.orrery.retrograde_embedding import (
-        active_memnon_embedding_model_dimensions,
+        active_memnon_embedding_manager,
     )
     from nexus.api.db_pool import get_connection
 
@@ -76,55 +80,28 @@ def embed_character_experiences(
             f"Character experiences are not rendered in {dbname}: {unrendered}"
         )
 
-    memnon_settings = _memnon_settings()
-    configured = list(active_memnon_embedding_model_dimensions())
-    manager = EmbeddingManager(settings=memnon_settings)
-    model_names = manager.get_available_models()
-    if set(model_names) != set(configured):
-        raise RuntimeError(
-            "Active MEMNON embedding model load did not match configuration; "
-            f"configured={sorted(configured)}, loaded={sorted(model_names)}"
-        )
-
-    generated: dict[int, list[tuple[str, list[float]]]] = {}
-    for experience_id in requested_ids:
-        model_embeddings: list[tuple[str, list[float]]] = []
-        for model_name in model_names:
-            embedding = manager.generate_embedding(
-                str(experiences[experience_id]), model_name
-            )
-            if not embedding:
-                raise RuntimeError(
-                    "Embedding generation failed for character experience "
-                    f"{experience_id} with model {model_name}; "
-                    "embedding_generated_at remains NULL for retry"
-                )
-            model_embeddings.append((model_name, embedding))
-        generated[experience_id] = model_embeddings
+    manager, model_names = active_memnon_embedding_manager(_memnon_settings())
+    buckets = embed_in_length_buckets(
+        manager,
+        [str(experiences[experience_id]) for experience_id in requested_ids],
+        model_names,
+        keys=requested_ids,
+        subject="character experiences",
+    )
 
     with get_connection(dbname, dict_cursor=True) as conn:
         with conn.cursor() as cursor:
             ensured: dict[int, str] = {}
-            for experience_id, model_embeddings in generated.items():
-                for model_name, embedding in model_embeddings:
-                    dimensions = len(embedding)
-                    table_name = ensured.get(dimensions)
+            for model_name in model_names:
+                for bucket in buckets[model_name]:
+                    table_name = ensured.get(bucket.dimensions)
                     if table_name is None:
                         table_name = ensure_character_experience_embedding_table(
-                            cursor, dimensions
+                            cursor, bucket.dimensions
                         )
-                        ensured[dimensions] = table_name
-                    value = "[" + ",".join(str(number) for number in embedding) + "]"
-                    cursor.execute(
-                        f"""
-                        INSERT INTO {table_name}
-                            (experience_id, model, embedding, created_at)
-                        VALUES (%s, %s, %s::vector({dimensions}), NOW())
-                        ON CONFLICT (experience_id, model) DO UPDATE
-                        SET embedding = EXCLUDED.embedding,
-                            created_at = EXCLUDED.created_at
-                        """,
-                        (experience_id, model_name, value),
+                        ensured[bucket.dimensions] = table_name
+                    upsert_bucket_vectors(
+                        cursor, table_name, "experience_id", requested_ids, bucket
                     )
             cursor.execute(
                 """
@@ -146,13 +123,18 @@ def embed_character_experiences(
                     "Character experience embedding stamp count did not match "
                     f"request ({len(stamped)} of {len(requested_ids)})"
                 )
+    dimensions = sorted(
+        {
+            bucket.dimensions
+            for model_buckets in buckets.values()
+            for bucket in model_buckets
+        }
+    )
     return [
         {
             "experience_id": experience_id,
-            "models": [model for model, _embedding in generated[experience_id]],
-            "dimensions": sorted(
-                {len(embedding) for _model, embedding in generated[experience_id]}
-            ),
+            "models": list(model_names),
+            "dimensions": dimensions,
             "embedding_generated_at": stamped[experience_id].isoformat(),
         }
         for experience_id in requested_ids
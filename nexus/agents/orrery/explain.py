@@ -20,6 +20,9 @@ Design notes
 * **Whole-stack output.** :func:`explain_stack` returns an explanation for every
   template (priority-ordered, winner flagged), so the dashboard can show the
   winner *and* the shadowed packages that would also have fired.
+* **Batched evidence.** Leaf evidence for a whole stack is resolved once per
+  binding set through :func:`resolve_evidence_batch` and looked up by name
+  while tracing, so a leaf shared by many templates is recomputed once.
 """
 
 from __future__ import annotations
@@ -28,7 +31,7 @@ from dataclasses import dataclass, field
 from typing import Any, Iterable, List, Mapping, Optional, Tuple
 
 from nexus.agents.orrery.catalog import _render_predicate_name
-from nexus.agents.orrery.evidence import resolve_evidence
+from nexus.agents.orrery.evidence import resolve_evidence, resolve_evidence_batch
 from nexus.agents.orrery.resolver import _materialize_project_delta
 from nexus.agents.orrery.substrate import (
     Bindings,
@@ -213,14 +216,44 @@ class StackExplanation:
         }
 
 
+def _template_leaf_names(templates: Iterable[Template]) -> List[str]:
+    """Every gate and branch leaf name across ``templates``, first-seen order."""
+
+    names: dict[str, None] = {}
+
+    # A direct walk rather than _condition_tree_leaves: this runs once per
+    # binding set, and nested generators cost more than the lookups they feed.
+    def _walk(condition: Condition) -> None:
+        if isinstance(condition, CompoundCondition):
+            for child in condition.children:
+                _walk(child)
+        else:
+            names[getattr(condition, "__name__", None) or repr(condition)] = None
+
+    for template in templates:
+        _walk(template.package_gate)
+        for branch in template.branches:
+            _walk(branch.conditions)
+    return list(names)
+
+
 def trace_condition(
-    condition: Condition, state: WorldState, bindings: Bindings
+    condition: Condition,
+    state: WorldState,
+    bindings: Bindings,
+    *,
+    evidence: Optional[Mapping[str, Mapping[str, Any]]] = None,
 ) -> ConditionTrace:
-    """Walk a condition tree exhaustively, recording each node's truth value."""
+    """Walk a condition tree exhaustively, recording each node's truth value.
+
+    ``evidence`` is a precomputed :func:`resolve_evidence_batch` result for
+    the same state and bindings; leaves missing from it resolve directly.
+    """
 
     if isinstance(condition, CompoundCondition):
         children = tuple(
-            trace_condition(child, state, bindings) for child in condition.children
+            trace_condition(child, state, bindings, evidence=evidence)
+            for child in condition.children
         )
         if condition.op == "AND":
             result = all(child.result for child in children)
@@ -240,21 +273,23 @@ def trace_condition(
 
     name = getattr(condition, "__name__", repr(condition))
     result = bool(condition(state, bindings))
-    evidence = resolve_evidence(name, state, bindings)
+    payload = evidence.get(name) if evidence is not None else None
+    if payload is None:
+        payload = resolve_evidence(name, state, bindings)
     # Evidence recomputes its own verdict from the parsed name; a mismatch
     # means the factory closure and the evidence resolver have drifted.
     # evidence["result"] is None only for name-unrecoverable filters
     # (recent_event's changed_fields marker), where no cross-check is possible.
-    if evidence["result"] is not None and bool(evidence["result"]) != result:
+    if payload["result"] is not None and bool(payload["result"]) != result:
         raise AssertionError(
             f"evidence/predicate divergence for {name!r}: predicate returned "
-            f"{result}, evidence recomputed {evidence['result']}"
+            f"{result}, evidence recomputed {payload['result']}"
         )
     return ConditionTrace(
         raw=name,
         prose=_render_predicate_name(name),
         result=result,
-        evidence=evidence,
+        evidence=payload,
     )
 
 
@@ -265,6 +300,7 @@ def explain_template(
     selection: Optional[BranchSelection] = None,
     *,
     digest: Optional[str] = None,
+    evidence: Optional[Mapping[str, Mapping[str, Any]]] = None,
 ) -> TemplateExplanation:
     """Produce a full audit record for one template against one binding set.
 
@@ -275,12 +311,20 @@ def explain_template(
     considered, so the traces become exhaustive. A direct call owns and
     verifies its binding digest; :func:`explain_stack` supplies the digest and
     routes completion verification through :func:`select_package` instead.
+    Likewise a direct call batch-resolves its own leaf evidence, while
+    :func:`explain_stack` passes one batch for the whole stack.
     """
 
     verify_at_completion = digest is None
     if digest is None:
         digest = binding_hash(bindings)
-    gate_trace = trace_condition(template.package_gate, state, bindings)
+    if evidence is None:
+        evidence = resolve_evidence_batch(
+            _template_leaf_names((template,)), state, bindings
+        )
+    gate_trace = trace_condition(
+        template.package_gate, state, bindings, evidence=evidence
+    )
     gate_passed = bool(template.package_gate(state, bindings))
 
     branch_traces: List[BranchTrace] = []
@@ -327,7 +371,9 @@ def explain_template(
                     )
                 )
                 continue
-            branch_trace = trace_condition(branch.conditions, state, bindings)
+            branch_trace = trace_condition(
+                branch.conditions, state, bindings, evidence=evidence
+            )
             affinity = None
             mood = active_mood(state, bindings)
             if (
@@ -434,6 +480,7 @@ def explain_stack(
         digest=digest,
     )
     ordered = stack_order(templates_tuple, state, bindings, habituation)
+    evidence = resolve_evidence_batch(_template_leaf_names(ordered), state, bindings)
     explanations = tuple(
         explain_template(
             template,
@@ -441,6 +488,7 @@ def explain_stack(
             bindings,
             selection,
             digest=digest,
+            evidence=evidence,
         )
         for template in ordered
     )
@@ -12,10 +12,17 @@ Epoch honesty: rows written before migration 063 lack ``actor_entity_id`` /
 ``bindings`` on the log, and prompt exposures / scene pressures exist only for
 ticks committed after 063. The payload's ``epoch`` block quantifies exactly
 how much of the ledger is enriched rather than implying full coverage.
+
+Cost: migration 121 keeps per-template counts, per-proposal state, and every
+defer streak in rollup tables maintained by triggers inside the tick commit,
+so the live payload no longer rescans the log. Replay cuts (``through_tick``
+before the newest ledger row) recompute from the log with the same event
+order.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, List, Optional
 
@@ -82,33 +89,331 @@ def _streaks_for_proposal(
     return streaks
 
 
-def adjudication_history(
-    session: Any,
-    *,
-    template_id: Optional[str] = None,
-    through_tick: Optional[int] = None,
-    recent_rulings_limit: Optional[int] = None,
+@dataclass(slots=True)
+class _Ledger:
+    """The ruling- and resolution-derived blocks of the history payload."""
+
+    log_rows: int
+    log_rows_with_subject: int
+    committed_resolutions: int
+    actions: dict[str, int]
+    sources: dict[str, int]
+    templates: dict[str, dict[str, Any]]
+    defer_streaks: List[dict[str, Any]]
+    recent_rulings: List[dict[str, Any]]
+    actor_entity_ids: set[int]
+
+
+def _template_entry(
+    templates: dict[str, dict[str, Any]], template_id: str
 ) -> dict[str, Any]:
-    """Return the adjudication-history payload for one slot.
+    return templates.setdefault(
+        template_id,
+        {
+            "actions": {action: {} for action in _ACTIONS},
+            "committed": 0,
+            "promoted": 0,
+            "promotion_skipped": 0,
+            "promotion_pending": 0,
+            "narrated": 0,
+            "replaced_with_delta_committed": 0,
+        },
+    )
 
-    Read-only. ``template_id`` narrows every block to one package;
-    ``through_tick`` excludes later outcomes during replay/regeneration.
+
+def _finish_templates(templates: dict[str, dict[str, Any]]) -> None:
+    for entry in templates.values():
+        # Ratification is by omission and leaves no log row; a committed
+        # resolution is a ratification unless a replace-with-delta produced it.
+        entry["ratified_committed"] = (
+            entry["committed"] - entry["replaced_with_delta_committed"]
+        )
+
+
+def _sort_recent_rulings(
+    recent_rulings: List[dict[str, Any]], limit: Optional[int]
+) -> List[dict[str, Any]]:
+    recent_rulings.sort(
+        key=lambda row: (
+            -row["tick_chunk_id"],
+            0 if row["outcome"] == "ratified" else 1,
+            -row["source_id"],
+        )
+    )
+    return recent_rulings if limit is None else recent_rulings[:limit]
+
+
+def _rollups_cover(session: Any, through_tick: Optional[int]) -> bool:
+    """Whether the rollups describe the ledger as of ``through_tick``.
+
+    The rollup tables (migration 121) are maintained by triggers in the
+    writing transaction, so they always reflect every committed ruling and
+    resolution. They answer unbounded queries and any cut at or past the
+    newest ledger tick — the live storyteller and backstage reads. A replay
+    cut that excludes later rows falls back to the log.
     """
 
-    if through_tick is not None and through_tick <= 0:
-        raise ValueError("through_tick must be positive")
-    if recent_rulings_limit is not None and recent_rulings_limit <= 0:
-        raise ValueError("recent_rulings_limit must be positive")
+    if through_tick is None:
+        return True
+    row = (
+        session.execute(
+            text(
+                """
+                /* orrery_history:rollup_coverage */
+                SELECT NOT EXISTS (
+                           SELECT 1 FROM orrery_adjudication_log
+                           WHERE tick_chunk_id > :through_tick
+                       )
+                       AND NOT EXISTS (
+                           SELECT 1 FROM orrery_resolutions
+                           WHERE tick_chunk_id > :through_tick
+                       ) AS covered
+                """
+            ),
+            {"through_tick": through_tick},
+        )
+        .mappings()
+        .first()
+    )
+    return bool(row and row["covered"])
+
+
+def _ledger_from_rollups(
+    session: Any,
+    *,
+    template_id: Optional[str],
+    recent_rulings_limit: Optional[int],
+) -> _Ledger:
+    """Read the payload's ledger blocks from the maintained rollups.
+
+    Cost is proportional to templates, proposals, streaks, and the requested
+    page of recent rulings rather than to the full log.
+    """
 
-    filters: list[str] = []
     params: dict[str, Any] = {}
     if template_id:
-        filters.append("template_id = :template_id")
         params["template_id"] = template_id
-    if through_tick is not None:
-        filters.append("tick_chunk_id <= :through_tick")
-        params["through_tick"] = through_tick
-    template_clause = f"WHERE {' AND '.join(filters)}" if filters else ""
+
+    def template_filter(alias: str, keyword: str = "WHERE") -> str:
+        return f"{keyword} {alias}.template_id = :template_id" if template_id else ""
+
+    templates: dict[str, dict[str, Any]] = {}
+    actions: dict[str, int] = {action: 0 for action in _ACTIONS}
+    sources: dict[str, int] = {}
+    log_rows = log_rows_with_subject = 0
+    for row in session.execute(
+        text(
+            f"""
+            /* orrery_history:template_rollups */
+            SELECT template_id, action, adjudication_source, rulings,
+                   rulings_with_subject, replaced_with_delta_committed
+            FROM orrery_adjudication_template_rollups rollup
+            WHERE rollup.rulings > 0 {template_filter("rollup", "AND")}
+            """
+        ),
+        params,
+    ).mappings():
+        rulings = int(row["rulings"])
+        entry = _template_entry(templates, row["template_id"])
+        entry["actions"][row["action"]][row["adjudication_source"]] = rulings
+        entry["replaced_with_delta_committed"] += int(
+            row["replaced_with_delta_committed"]
+        )
+        actions[row["action"]] += rulings
+        sources[row["adjudication_source"]] = (
+            sources.get(row["adjudication_source"], 0) + rulings
+        )
+        log_rows += rulings
+        log_rows_with_subject += int(row["rulings_with_subject"])
+
+    committed_resolutions = 0
+    for row in session.execute(
+        text(
+            f"""
+            /* orrery_history:resolution_funnel */
+            SELECT template_id,
+                   count(*) AS committed,
+                   count(*) FILTER (
+                       WHERE promotion_status = 'promoted'
+                   ) AS promoted,
+                   count(*) FILTER (
+                       WHERE promotion_status = 'skipped'
+                   ) AS promotion_skipped,
+                   count(*) FILTER (
+                       WHERE narration_status = 'succeeded'
+                   ) AS narrated
+            FROM orrery_resolutions resolution
+            {template_filter("resolution")}
+            GROUP BY template_id
+            """
+        ),
+        params,
+    ).mappings():
+        entry = _template_entry(templates, row["template_id"])
+        entry["committed"] += int(row["committed"])
+        entry["promoted"] += int(row["promoted"])
+        entry["promotion_skipped"] += int(row["promotion_skipped"])
+        entry["promotion_pending"] += (
+            int(row["committed"]) - int(row["promoted"]) - int(row["promotion_skipped"])
+        )
+        entry["narrated"] += int(row["narrated"])
+        committed_resolutions += int(row["committed"])
+    _finish_templates(templates)
+
+    streak_rows = session.execute(
+        text(
+            f"""
+            /* orrery_history:defer_streak_rollups */
+            SELECT streak.proposal_id, proposal.template_id,
+                   proposal.actor_entity_id, streak.length, streak.start_tick,
+                   streak.end_tick, streak.outcome, streak.outcome_tick
+            FROM orrery_adjudication_defer_streaks streak
+            JOIN orrery_adjudication_proposal_rollups proposal
+              ON proposal.proposal_id = streak.proposal_id
+            {template_filter("proposal")}
+            ORDER BY streak.start_tick, streak.start_log_id
+            """
+        ),
+        params,
+    ).mappings()
+    defer_streaks = [dict(row) for row in streak_rows]
+    defer_streaks.sort(key=lambda item: (-item["length"], item["proposal_id"]))
+
+    actor_entity_ids = {
+        int(row["actor_entity_id"])
+        for row in session.execute(
+            text(
+                f"""
+                /* orrery_history:proposal_actors */
+                SELECT DISTINCT proposal.actor_entity_id
+                FROM orrery_adjudication_proposal_rollups proposal
+                WHERE proposal.actor_entity_id IS NOT NULL
+                      {template_filter("proposal", "AND")}
+                """
+            ),
+            params,
+        ).mappings()
+    }
+
+    page_params = dict(params)
+    page_clause = ""
+    if recent_rulings_limit is not None:
+        page_clause = "LIMIT :limit"
+        page_params["limit"] = recent_rulings_limit
+    ruling_rows = session.execute(
+        text(
+            f"""
+            /* orrery_history:recent_ruling_page */
+            SELECT * FROM (
+                SELECT 'ratified' AS outcome, resolution.tick_chunk_id,
+                       0 AS outcome_order, resolution.id AS source_id,
+                       resolution.template_id || ':' || resolution.binding_hash
+                           AS proposal_id,
+                       resolution.template_id, resolution.brief AS summary,
+                       resolution.state_delta, NULL::text AS note
+                FROM orrery_resolutions resolution
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM orrery_adjudication_log replaced
+                    WHERE replaced.action = 'replace'
+                      AND replaced.applied_resolution_id = resolution.id
+                      {template_filter("replaced", "AND")}
+                ) {template_filter("resolution", "AND")}
+                UNION ALL
+                SELECT CASE ruling.action
+                           WHEN 'defer' THEN 'deferred' ELSE 'voided'
+                       END,
+                       ruling.tick_chunk_id, 1, ruling.id, ruling.proposal_id,
+                       ruling.template_id, NULL, ruling.original_state_delta,
+                       ruling.skald_note
+                FROM orrery_adjudication_log ruling
+                WHERE ruling.action IN ('defer', 'void')
+                      {template_filter("ruling", "AND")}
+            ) rulings
+            ORDER BY tick_chunk_id DESC, outcome_order, source_id DESC
+            {page_clause}
+            """
+        ),
+        page_params,
+    ).mappings()
+    recent_rulings = [
+        {
+            "outcome": row["outcome"],
+            "tick_chunk_id": row["tick_chunk_id"],
+            "source_id": row["source_id"],
+            "proposal_id": row["proposal_id"],
+            "template_id": row["template_id"],
+            "summary": row["summary"],
+            "state_delta": row["state_delta"],
+            "note": row["note"],
+            "consecutive_deferrals": 0,
+        }
+        for row in ruling_rows
+    ]
+
+    deferred_ids = [
+        ruling["source_id"]
+        for ruling in recent_rulings
+        if ruling["outcome"] == "deferred"
+    ]
+    if deferred_ids:
+        # A deferral's count is its position inside the streak that holds it;
+        # streak bounds make that an indexed range count per ruling.
+        positions = session.execute(
+            text(
+                """
+                /* orrery_history:deferral_positions */
+                SELECT ruling.id, count(earlier.id) AS consecutive
+                FROM orrery_adjudication_log ruling
+                JOIN orrery_adjudication_defer_streaks streak
+                  ON streak.proposal_id = ruling.proposal_id
+                 AND (ruling.tick_chunk_id, ruling.id)
+                     >= (streak.start_tick, streak.start_log_id)
+                 AND (ruling.tick_chunk_id, ruling.id)
+                     <= (streak.end_tick, streak.end_log_id)
+                JOIN orrery_adjudication_log earlier
+                  ON earlier.proposal_id = ruling.proposal_id
+                 AND (earlier.tick_chunk_id, earlier.id)
+                     >= (streak.start_tick, streak.start_log_id)
+                 AND (earlier.tick_chunk_id, earlier.id)
+                     <= (ruling.tick_chunk_id, ruling.id)
+                WHERE ruling.id = ANY(CAST(:ruling_ids AS bigint[]))
+                GROUP BY ruling.id
+                """
+            ),
+            {"ruling_ids": deferred_ids},
+        ).mappings()
+        consecutive = {int(row["id"]): int(row["consecutive"]) for row in positions}
+        for ruling in recent_rulings:
+            if ruling["outcome"] == "deferred":
+                ruling["consecutive_deferrals"] = consecutive.get(
+                    int(ruling["source_id"]), 0
+                )
+
+    return _Ledger(
+        log_rows=log_rows,
+        log_rows_with_subject=log_rows_with_subject,
+        committed_resolutions=committed_resolutions,
+        actions=actions,
+        sources=sources,
+        templates=templates,
+        defer_streaks=defer_streaks,
+        recent_rulings=recent_rulings,
+        actor_entity_ids=actor_entity_ids,
+    )
+
+
+def _ledger_from_log(
+    session: Any,
+    *,
+    template_clause: str,
+    params: dict[str, Any],
+    recent_rulings_limit: Optional[int],
+) -> _Ledger:
+    """Recompute the payload's ledger blocks from the raw ledgers.
+
+    Used for replay cuts the rollups cannot answer; every ``through_tick``
+    filter in ``template_clause`` applies to the rows read here.
+    """
 
     log_rows = [
         dict(row)
@@ -149,60 +454,11 @@ def adjudication_history(
         ).mappings()
     ]
 
-    exposure_stats = session.execute(
-        text(
-            f"""
-            /* orrery_history:exposures */
-            SELECT kind,
-                   count(*) AS rows,
-                   min(tick_chunk_id) AS earliest_tick
-            FROM orrery_prompt_exposures
-            {template_clause}
-            GROUP BY kind
-            """
-        ),
-        params,
-    ).mappings()
-    exposures = {
-        row["kind"]: {"rows": row["rows"], "earliest_tick": row["earliest_tick"]}
-        for row in exposure_stats
-    }
-
-    pressure_stats = (
-        session.execute(
-            text(
-                f"""
-                /* orrery_history:scene_pressures */
-                SELECT count(*) AS rows, min(tick_chunk_id) AS earliest_tick
-                FROM orrery_scene_pressures
-                {template_clause}
-                """
-            ),
-            params,
-        )
-        .mappings()
-        .one()
-    )
-
     # --- Per-template action and funnel aggregation -------------------------
     templates: dict[str, dict[str, Any]] = {}
 
-    def _template_entry(entry_template_id: str) -> dict[str, Any]:
-        return templates.setdefault(
-            entry_template_id,
-            {
-                "actions": {action: {} for action in _ACTIONS},
-                "committed": 0,
-                "promoted": 0,
-                "promotion_skipped": 0,
-                "promotion_pending": 0,
-                "narrated": 0,
-                "replaced_with_delta_committed": 0,
-            },
-        )
-
     for row in log_rows:
-        entry = _template_entry(row["template_id"])
+        entry = _template_entry(templates, row["template_id"])
         sources = entry["actions"][row["action"]]
         sources[row["adjudication_source"]] = (
             sources.get(row["adjudication_source"], 0) + 1
@@ -211,7 +467,7 @@ def adjudication_history(
             entry["replaced_with_delta_committed"] += 1
 
     for row in resolution_rows:
-        entry = _template_entry(row["template_id"])
+        entry = _template_entry(templates, row["template_id"])
         entry["committed"] += 1
         if row["promotion_status"] == "promoted":
             entry["promoted"] += 1
@@ -222,12 +478,7 @@ def adjudication_history(
         if row["narration_status"] == "succeeded":
             entry["narrated"] += 1
 
-    for entry in templates.values():
-        # Ratification is by omission and leaves no log row; a committed
-        # resolution is a ratification unless a replace-with-delta produced it.
-        entry["ratified_committed"] = (
-            entry["committed"] - entry["replaced_with_delta_committed"]
-        )
+    _finish_templates(templates)
 
     # --- Defer streaks -------------------------------------------------------
     commits_by_proposal: dict[str, List[tuple[int, str]]] = {}
@@ -274,25 +525,26 @@ def adjudication_history(
         for row in log_rows
         if row["action"] == "replace" and row["applied_resolution_id"] is not None
     }
-    ruling_timelines: dict[str, list[tuple[int, int, str, Optional[int]]]] = {}
+    ruling_timelines: dict[str, list[tuple[int, int, int]]] = {}
     for row in log_rows:
         ruling_timelines.setdefault(row["proposal_id"], []).append(
-            (row["tick_chunk_id"], 0, row["action"], row["id"])
+            (row["tick_chunk_id"], 0, row["id"])
         )
     for row in resolution_rows:
         proposal_id = f"{row['template_id']}:{row['binding_hash']}"
         ruling_timelines.setdefault(proposal_id, []).append(
-            (row["tick_chunk_id"], 1, "committed", None)
+            (row["tick_chunk_id"], 1, 0)
         )
 
+    # Same event order as the streaks (and the rollup triggers): by tick,
+    # rulings before that tick's committed resolution, rulings by id.
+    action_by_log_id = {row["id"]: row["action"] for row in log_rows}
     deferral_counts: dict[int, int] = {}
     for proposal_events in ruling_timelines.values():
         consecutive = 0
-        for _tick, _order, action, log_id in sorted(proposal_events):
-            if action == "defer":
+        for _tick, order, log_id in sorted(proposal_events):
+            if order == 0 and action_by_log_id[log_id] == "defer":
                 consecutive += 1
-                if log_id is None:
-                    raise RuntimeError("Deferred ruling is missing its ledger id")
                 deferral_counts[log_id] = consecutive
             else:
                 consecutive = 0
@@ -330,15 +582,112 @@ def adjudication_history(
                 "consecutive_deferrals": deferral_counts.get(row["id"], 0),
             }
         )
-    recent_rulings.sort(
-        key=lambda row: (
-            -row["tick_chunk_id"],
-            0 if row["outcome"] == "ratified" else 1,
-            -row["source_id"],
+
+    totals_actions: dict[str, int] = {action: 0 for action in _ACTIONS}
+    totals_sources: dict[str, int] = {}
+    for row in log_rows:
+        totals_actions[row["action"]] += 1
+        totals_sources[row["adjudication_source"]] = (
+            totals_sources.get(row["adjudication_source"], 0) + 1
         )
+
+    return _Ledger(
+        log_rows=len(log_rows),
+        log_rows_with_subject=sum(
+            1 for row in log_rows if row["actor_entity_id"] is not None
+        ),
+        committed_resolutions=len(resolution_rows),
+        actions=totals_actions,
+        sources=totals_sources,
+        templates=templates,
+        defer_streaks=defer_streaks,
+        recent_rulings=_sort_recent_rulings(recent_rulings, recent_rulings_limit),
+        actor_entity_ids={
+            actor_id for actor_id in actor_by_proposal.values() if actor_id is not None
+        },
+    )
+
+
+def adjudication_history(
+    session: Any,
+    *,
+    template_id: Optional[str] = None,
+    through_tick: Optional[int] = None,
+    recent_rulings_limit: Optional[int] = None,
+) -> dict[str, Any]:
+    """Return the adjudication-history payload for one slot.
+
+    Read-only. ``template_id`` narrows every block to one package;
+    ``through_tick`` excludes later outcomes during replay/regeneration.
+    Ruling blocks come from the trigger-maintained rollups unless
+    ``through_tick`` cuts off later ledger rows, in which case they are
+    recomputed from the log.
+    """
+
+    if through_tick is not None and through_tick <= 0:
+        raise ValueError("through_tick must be positive")
+    if recent_rulings_limit is not None and recent_rulings_limit <= 0:
+        raise ValueError("recent_rulings_limit must be positive")
+
+    filters: list[str] = []
+    params: dict[str, Any] = {}
+    if template_id:
+        filters.append("template_id = :template_id")
+        params["template_id"] = template_id
+    if through_tick is not None:
+        filters.append("tick_chunk_id <= :through_tick")
+        params["through_tick"] = through_tick
+    template_clause = f"WHERE {' AND '.join(filters)}" if filters else ""
+
+    if _rollups_cover(session, through_tick):
+        ledger = _ledger_from_rollups(
+            session,
+            template_id=template_id,
+            recent_rulings_limit=recent_rulings_limit,
+        )
+    else:
+        ledger = _ledger_from_log(
+            session,
+            template_clause=template_clause,
+            params=params,
+            recent_rulings_limit=recent_rulings_limit,
+        )
+    recent_rulings = ledger.recent_rulings
+
+    exposure_stats = session.execute(
+        text(
+            f"""
+            /* orrery_history:exposures */
+            SELECT kind,
+                   count(*) AS rows,
+                   min(tick_chunk_id) AS earliest_tick
+            FROM orrery_prompt_exposures
+            {template_clause}
+            GROUP BY kind
+            """
+        ),
+        params,
+    ).mappings()
+    exposures = {
+        row["kind"]: {"rows": row["rows"], "earliest_tick": row["earliest_tick"]}
+        for row in exposure_stats
+    }
+
+    pressure_stats = (
+        session.execute(
+            text(
+                f"""
+                /* orrery_history:scene_pressures */
+                SELECT count(*) AS rows, min(tick_chunk_id) AS earliest_tick
+                FROM orrery_scene_pressures
+                {template_clause}
+                """
+            ),
+            params,
+        )
+        .mappings()
+        .one()
     )
-    if recent_rulings_limit is not None:
-        recent_rulings = recent_rulings[:recent_rulings_limit]
 
     if through_tick is not None and recent_rulings:
         ruling_ticks = sorted({row["tick_chunk_id"] for row in recent_rulings})
@@ -371,37 +720,25 @@ def adjudication_history(
             ruling["turn_offset"] = turn_offsets[ruling["tick_chunk_id"]]
 
     # --- Names and epoch honesty --------------------------------------------
-    entity_ids = {
-        actor_id for actor_id in actor_by_proposal.values() if actor_id is not None
-    }
+    entity_ids = ledger.actor_entity_ids
     entity_names = _load_entity_names(session, entity_ids) if entity_ids else {}
-    for streak in defer_streaks:
+    for streak in ledger.defer_streaks:
         streak["actor_name"] = (
             _entity_label(streak["actor_entity_id"], entity_names)
             if streak["actor_entity_id"] is not None
             else None
         )
 
-    enriched_log_rows = sum(1 for row in log_rows if row["actor_entity_id"] is not None)
-
-    totals_actions: dict[str, int] = {action: 0 for action in _ACTIONS}
-    totals_sources: dict[str, int] = {}
-    for row in log_rows:
-        totals_actions[row["action"]] += 1
-        totals_sources[row["adjudication_source"]] = (
-            totals_sources.get(row["adjudication_source"], 0) + 1
-        )
-
     return {
         "template_filter": template_id,
         "totals": {
-            "log_rows": len(log_rows),
-            "actions": totals_actions,
-            "sources": totals_sources,
-            "committed_resolutions": len(resolution_rows),
+            "log_rows": ledger.log_rows,
+            "actions": ledger.actions,
+            "sources": ledger.sources,
+            "committed_resolutions": ledger.committed_resolutions,
         },
-        "templates": templates,
-        "defer_streaks": defer_streaks,
+        "templates": ledger.templates,
+        "defer_streaks": ledger.defer_streaks,
         "recent_rulings": recent_rulings,
         "exposures": {
             "resolution": exposures.get(
@@ -421,8 +758,8 @@ def adjudication_history(
         "epoch": {
             # Pre-063 rows have no subject; consumers must not read absence
             # of actor_entity_id as "no actor".
-            "log_rows_with_subject": enriched_log_rows,
-            "log_rows_total": len(log_rows),
+            "log_rows_with_subject": ledger.log_rows_with_subject,
+            "log_rows_total": ledger.log_rows,
             "exposure_logging_since_tick": min(
                 (
                     block["earliest_tick"]
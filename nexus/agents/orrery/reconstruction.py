@@ -204,22 +204,124 @@ def _checkpoint_document_sql(included_sections: list[str]) -> str:
     return "SELECT " + " || ".join(f"jsonb_build_object({part})" for part in parts)
 
 
-def _included_checkpoint_sections_sync(cur: Any) -> list[str]:
-    included: list[str] = []
-    for section in CHECKPOINT_SECTIONS:
-        additive_table = _ADDITIVE_CHECKPOINT_TABLES.get(section)
-        if additive_table is not None:
-            cur.execute(
-                "SELECT to_regclass(%s) AS checkpoint_table",
-                (additive_table,),
-            )
-            if row_get(cur.fetchone(), "checkpoint_table", 0) is None:
-                # A genuinely pre-migration schema produces a pre-migration
-                # checkpoint document. Replay treats the absent key as the
-                # explicit cross-era compatibility boundary.
-                continue
-        included.append(section)
-    return included
+def _checkpoint_capture_sql(
+    included_sections: list[str],
+    *,
+    sectioned: bool,
+    chunk_param: str,
+    label_param: str,
+) -> str:
+    """Build the one statement that captures and stores a checkpoint.
+
+    The document never leaves the server, and because the capture is a single
+    INSERT ... SELECT it keeps the one-snapshot guarantee of
+    :func:`_checkpoint_document_sql`. With ``sectioned`` (migration 120) each
+    top-level key is stored once in ``state_checkpoint_sections`` under the
+    sha256 of its jsonb text and the checkpoint row keeps only the
+    section -> hash map, so a section unchanged since an earlier checkpoint
+    costs no new storage. Without it the full document is stored inline, as
+    checkpoints were before the migration.
+    """
+
+    document_sql = _checkpoint_document_sql(included_sections)
+    if not sectioned:
+        return f"""
+        INSERT INTO state_checkpoints (chunk_id, label, state)
+        SELECT {chunk_param}, {label_param}, document.state
+        FROM ({document_sql} AS state) document
+        ON CONFLICT (chunk_id, label) DO NOTHING
+        RETURNING id
+        """
+    return f"""
+    WITH document AS ({document_sql} AS state),
+    sections AS (
+        SELECT entry.key AS section,
+               entry.value AS body,
+               encode(sha256(convert_to(entry.value::text, 'UTF8')), 'hex')
+                   AS section_hash
+        FROM document, jsonb_each(document.state) AS entry
+    ),
+    stored AS (
+        INSERT INTO state_checkpoint_sections (section_hash, body)
+        SELECT DISTINCT ON (section_hash) section_hash, body FROM sections
+        ON CONFLICT (section_hash) DO NOTHING
+    )
+    INSERT INTO state_checkpoints (chunk_id, label, section_hashes)
+    SELECT {chunk_param}, {label_param}, jsonb_object_agg(section, section_hash)
+    FROM sections
+    ON CONFLICT (chunk_id, label) DO NOTHING
+    RETURNING id
+    """
+
+
+# Which additive tables exist, and whether the section store does, is fixed
+# for a given schema, so the to_regclass probe runs once per (database,
+# search path, applied-migration ledger) rather than on every capture.
+# Applying a migration or switching to a shadow schema probes again. The
+# ledger is read through query_to_xml so that a schema without
+# schema_migrations yields a NULL ledger instead of failing to plan; such
+# schemas are probed on every capture.
+_CHECKPOINT_SCHEMA_KEY_SQL = (
+    "SELECT current_database() AS database_name, "
+    "current_schemas(true)::text AS search_path, "
+    "CASE WHEN to_regclass('schema_migrations') IS NOT NULL THEN "
+    "query_to_xml('SELECT count(*) AS applied, max(version) AS latest "
+    "FROM schema_migrations', false, true, '')::text END AS ledger"
+)
+_CHECKPOINT_SECTION_STORE = "state_checkpoint_sections"
+_CHECKPOINT_PROBE_SQL = (
+    "SELECT coalesce(array_agg(name), ARRAY[]::text[]) AS present "
+    "FROM unnest({names}::text[]) AS name "
+    "WHERE to_regclass(name) IS NOT NULL"
+)
+_CHECKPOINT_PROBE_NAMES = [
+    *_ADDITIVE_CHECKPOINT_TABLES.values(),
+    _CHECKPOINT_SECTION_STORE,
+]
+_checkpoint_schema_cache: dict[tuple[Any, ...], tuple[list[str], bool]] = {}
+
+
+def _checkpoint_schema(present: Any) -> tuple[list[str], bool]:
+    """Included sections and section-store availability from a probe."""
+
+    tables = set(present or ())
+    # A genuinely pre-migration schema produces a pre-migration checkpoint
+    # document. Replay treats the absent key as the explicit cross-era
+    # compatibility boundary.
+    included = [
+        section
+        for section in CHECKPOINT_SECTIONS
+        if _ADDITIVE_CHECKPOINT_TABLES.get(section) in (None, *tables)
+    ]
+    return included, _CHECKPOINT_SECTION_STORE in tables
+
+
+def _checkpoint_schema_sync(cur: Any) -> tuple[list[str], bool]:
+    cur.execute(_CHECKPOINT_SCHEMA_KEY_SQL)
+    row = cur.fetchone()
+    key = tuple(row.values()) if hasattr(row, "keys") else tuple(row)
+    cached = _checkpoint_schema_cache.get(key)
+    if cached is None:
+        cur.execute(
+            _CHECKPOINT_PROBE_SQL.format(names="%s"), (_CHECKPOINT_PROBE_NAMES,)
+        )
+        cached = _checkpoint_schema(row_get(cur.fetchone(), "present", 0))
+        if key[-1] is not None:
+            _checkpoint_schema_cache[key] = cached
+    return cached
+
+
+async def _checkpoint_schema_async(conn: Any) -> tuple[list[str], bool]:
+    key = tuple(await conn.fetchrow(_CHECKPOINT_SCHEMA_KEY_SQL))
+    cached = _checkpoint_schema_cache.get(key)
+    if cached is None:
+        present = await conn.fetchval(
+            _CHECKPOINT_PROBE_SQL.format(names="$1"), _CHECKPOINT_PROBE_NAMES
+        )
+        cached = _checkpoint_schema(present)
+        if key[-1] is not None:
+            _checkpoint_schema_cache[key] = cached
+    return cached
 
 
 def capture_state_checkpoint_sync(
@@ -233,19 +335,15 @@ def capture_state_checkpoint_sync(
     (idempotent re-commit)."""
 
     _validate_label(label)
-    included = _included_checkpoint_sections_sync(cur)
-    cur.execute(_checkpoint_document_sql(included))
-    row = cur.fetchone()
-    document = row[0] if not hasattr(row, "keys") else list(row.values())[0]
-    state = document if isinstance(document, dict) else json.loads(document)
+    included, sectioned = _checkpoint_schema_sync(cur)
     cur.execute(
-        """
-        INSERT INTO state_checkpoints (chunk_id, label, state)
-        VALUES (%s, %s, %s::jsonb)
-        ON CONFLICT (chunk_id, label) DO NOTHING
-        RETURNING id
-        """,
-        (chunk_id, label, json.dumps(state)),
+        _checkpoint_capture_sql(
+            included,
+            sectioned=sectioned,
+            chunk_param="%s::bigint",
+            label_param="%s::text",
+        ),
+        (chunk_id, label),
     )
     row = cur.fetchone()
     return row_get(row, "id", 0) if row else None
@@ -258,27 +356,16 @@ async def capture_state_checkpoint_async(
     label: str,
 ) -> Optional[int]:
     _validate_label(label)
-    included: list[str] = []
-    for section in CHECKPOINT_SECTIONS:
-        additive_table = _ADDITIVE_CHECKPOINT_TABLES.get(section)
-        if (
-            additive_table is not None
-            and await conn.fetchval("SELECT to_regclass($1)", additive_table) is None
-        ):
-            continue
-        included.append(section)
-    document = await conn.fetchval(_checkpoint_document_sql(included))
-    state = document if isinstance(document, dict) else json.loads(document)
+    included, sectioned = await _checkpoint_schema_async(conn)
     return await conn.fetchval(
-        """
-        INSERT INTO state_checkpoints (chunk_id, label, state)
-        VALUES ($1, $2, $3::jsonb)
-        ON CONFLICT (chunk_id, label) DO NOTHING
-        RETURNING id
-        """,
+        _checkpoint_capture_sql(
+            included,
+            sectioned=sectioned,
+            chunk_param="$1::bigint",
+            label_param="$2::text",
+        ),
         chunk_id,
         label,
-        json.dumps(state),
     )
 
 
@@ -683,7 +683,9 @@ class _Replayer:
         if base_checkpoint_id is not None:
             self.cur.execute(
                 """
-                SELECT id, chunk_id, created_at, state FROM state_checkpoints
+                SELECT id, chunk_id, created_at,
+                       state_checkpoint_document(state, section_hashes)
+                FROM state_checkpoints
                 WHERE id = %s
                 """,
                 (base_checkpoint_id,),
@@ -691,7 +693,9 @@ class _Replayer:
         else:
             self.cur.execute(
                 """
-                SELECT id, chunk_id, created_at, state FROM state_checkpoints
+                SELECT id, chunk_id, created_at,
+                       state_checkpoint_document(state, section_hashes)
+                FROM state_checkpoints
                 WHERE chunk_id IS NOT NULL AND chunk_id <= %s
                 ORDER BY chunk_id DESC, id DESC
                 LIMIT 1
@@ -761,8 +765,18 @@ class _Replayer:
             return
         base_ids = base_state.get(MATURATION_JOBS_CONTROL_KEY)
         self.cur.execute(
-            "SELECT state -> %s FROM state_checkpoints WHERE id = %s",
-            (MATURATION_JOBS_CONTROL_KEY, self.target_checkpoint_id),
+            """
+            SELECT coalesce(sc.state -> %s, section.body)
+            FROM state_checkpoints sc
+            LEFT JOIN state_checkpoint_sections section
+              ON section.section_hash = sc.section_hashes ->> %s
+            WHERE sc.id = %s
+            """,
+            (
+                MATURATION_JOBS_CONTROL_KEY,
+                MATURATION_JOBS_CONTROL_KEY,
+                self.target_checkpoint_id,
+            ),
         )
         row = self.cur.fetchone()
         target_ids = _as_document(_row_value(row, 0)) if row else None
@@ -3276,7 +3290,11 @@ def _section_key_fn(section: str) -> Any:
 
 
 def _load_checkpoint_state(cur: Any, checkpoint_id: int) -> dict[str, Any]:
-    cur.execute("SELECT state FROM state_checkpoints WHERE id = %s", (checkpoint_id,))
+    cur.execute(
+        "SELECT state_checkpoint_document(state, section_hashes) "
+        "FROM state_checkpoints WHERE id = %s",
+        (checkpoint_id,),
+    )
     state = _as_document(_row_value(cur.fetchone(), 0))
     state.setdefault("entities", [])
     state.setdefault("character_project_states", [])
@@ -3286,7 +3304,11 @@ def _load_checkpoint_state(cur: Any, checkpoint_id: int) -> dict[str, Any]:
 
 
 def _missing_checkpoint_sections(cur: Any, checkpoint_id: int) -> set[str]:
-    cur.execute("SELECT state FROM state_checkpoints WHERE id = %s", (checkpoint_id,))
+    # Only the keys matter; the section map names them without loading bodies.
+    cur.execute(
+        "SELECT coalesce(section_hashes, state) FROM state_checkpoints WHERE id = %s",
+        (checkpoint_id,),
+    )
     state = _as_document(_row_value(cur.fetchone(), 0))
     return set(CHECKPOINT_SECTIONS) - set(state)
 
@@ -9,17 +9,27 @@ from datetime import datetime, timezone
 import logging
 from typing import Any, Iterable, Mapping, Optional, Protocol, Sequence, Tuple, TypeVar
 
+import numpy as np
 from sqlalchemy import text
 
 from nexus.agents.orrery.ambient import AmbientSceneSeed, build_ambient_scene_seeds
+from nexus.agents.orrery.cognition import load_orrery_cognition
 from nexus.agents.orrery.communication import (
     CommunicationGraph,
     communication_graph_for_settings,
 )
+from nexus.agents.orrery.entity_arrays import (
+    accrual_rates,
+    accrue_need_debts,
+    need_applicability,
+    need_severity_levels,
+    need_type_index,
+    severity_thresholds,
+    tag_bitsets,
+)
 from nexus.agents.orrery.epistemics import (
     coerce_epistemics_policy,
     load_epistemics_hydration,
-    load_epistemics_policy,
 )
 from nexus.agents.orrery.player_identity import canonical_player_character_id
 from nexus.agents.orrery.reciprocal import (
@@ -35,13 +45,8 @@ from nexus.agents.orrery.weather import (
 )
 from nexus.agents.orrery.substrate import (
     PackageSelection,
-    ProjectPolicy,
     ProjectState,
-    coerce_branch_selection,
-    coerce_habituation,
-    coerce_package_selection,
     coerce_project_policy,
-    configure_project_magnitudes,
     Bindings,
     EventRecord,
     INTIMACY_SUPPRESSOR_TAGS,
@@ -50,6 +55,7 @@ from nexus.agents.orrery.substrate import (
     RoutineAnchor,
     Slot,
     Template,
+    TickEvaluationContext,
     TravelState,
     WorldState,
     active_mood,
@@ -57,12 +63,11 @@ from nexus.agents.orrery.substrate import (
     evaluate_stack,
 )
 from nexus.agents.orrery.needs import (
+    NEED_SEVERITY_LEVELS,
     NEED_SEVERITY_PREFIX,
+    NEED_TYPES,
     NeedTuning,
     coerce_need_tuning,
-    effective_debt_score,
-    need_applies_to_tags,
-    severity_for_debt,
 )
 from nexus.agents.orrery.tag_activity import active_entity_tag_at_world_time_sql
 
@@ -662,6 +667,7 @@ def hydrate_world_state(
                 event.event_id for event in recent_events if event.event_id is not None
             ),
             anchor_chunk_id=anchor_chunk_id,
+            parity_check=epistemics_policy.hydration_parity_check,
         )
     communication_graph = communication_graph_for_settings(
         session, contagion_settings, world_time=world_time
@@ -2195,16 +2201,6 @@ def compose_actor_target_routes(
     )
 
 
-_ACTOR_ONLY_SLOTS: Tuple[Slot, ...] = (Slot.ACTOR,)
-_ACTOR_TARGET_SLOTS: Tuple[Slot, ...] = (Slot.ACTOR, Slot.TARGET)
-_ACTOR_FACTION_SLOTS: Tuple[Slot, ...] = (Slot.ACTOR, Slot.FACTION)
-_ACTOR_TARGET_FACTION_SLOTS: Tuple[Slot, ...] = (
-    Slot.ACTOR,
-    Slot.TARGET,
-    Slot.FACTION,
-)
-
-
 @dataclass(frozen=True)
 class FanoutPolicy:
     """Per-actor cap on two-party drafts ([orrery.fanout]).
@@ -2365,19 +2361,21 @@ def resolve_dry_run(
 ) -> OrreryTickProposal:
     """Hydrate, bind, and evaluate Orrery packages without database writes."""
 
-    need_tuning = coerce_need_tuning(sunhelm_settings)
-    selection = coerce_branch_selection(selection_settings)
-    habituation = coerce_habituation(habituation_settings)
-    package_selection: Optional[PackageSelection] = coerce_package_selection(
-        package_selection_settings
+    cognition = load_orrery_cognition(
+        templates,
+        sunhelm_settings=sunhelm_settings,
+        selection_settings=selection_settings,
+        habituation_settings=habituation_settings,
+        package_selection_settings=package_selection_settings,
+        project_settings=project_settings,
+        epistemics_settings=epistemics_settings,
     )
-    project_policy: ProjectPolicy = coerce_project_policy(project_settings)
+    need_tuning = cognition.need_tuning
+    selection = cognition.selection
+    habituation = cognition.habituation
+    package_selection: Optional[PackageSelection] = cognition.package_selection
     fanout = _coerce_fanout(fanout_settings)
-    epistemics_policy = (
-        load_epistemics_policy()
-        if epistemics_settings is None
-        else coerce_epistemics_policy(epistemics_settings)
-    )
+    epistemics_policy = cognition.epistemics_policy
     state = hydrate_world_state(
         session,
         anchor_chunk_id=anchor_chunk_id,
@@ -2391,35 +2389,26 @@ def resolve_dry_run(
         weather_settings=weather_settings,
         mood_settings=mood_settings,
     )
-
-    templates_list = list(configure_project_magnitudes(templates, project_policy))
-    actor_only_templates = [
-        t for t in templates_list if t.required_slots == _ACTOR_ONLY_SLOTS
-    ]
-    actor_target_templates = [
-        t for t in templates_list if t.required_slots == _ACTOR_TARGET_SLOTS
-    ]
-    actor_faction_templates = [
-        t for t in templates_list if t.required_slots == _ACTOR_FACTION_SLOTS
-    ]
-    actor_target_faction_templates = [
-        t for t in templates_list if t.required_slots == _ACTOR_TARGET_FACTION_SLOTS
-    ]
-    supported_slot_signatures = (
-        _ACTOR_ONLY_SLOTS,
-        _ACTOR_TARGET_SLOTS,
-        _ACTOR_FACTION_SLOTS,
-        _ACTOR_TARGET_FACTION_SLOTS,
-    )
-    unsupported = [
-        t for t in templates_list if t.required_slots not in supported_slot_signatures
-    ]
-    if unsupported:
+    # Every stack below reads this one state; tick_memo shares binding
+    # digests and package-gate outcomes across them.
+    tick_context = (
+        TickEvaluationContext(state, verify=package_selection.memo_parity_check)
+        if package_selection is not None and package_selection.tick_memo
+        else None
+    )
+
+    stacks = cognition.stacks
+    templates_list = list(stacks.templates)
+    actor_only_templates = stacks.actor_only
+    actor_target_templates = stacks.actor_target
+    actor_faction_templates = stacks.actor_faction
+    actor_target_faction_templates = stacks.actor_target_faction
+    if stacks.unsupported:
         raise ValueError(
             "Orrery resolver does not yet compose bindings for required_slots="
             + ", ".join(
                 f"{t.id}:{tuple(s.value for s in t.required_slots)}"
-                for t in unsupported
+                for t in stacks.unsupported
             )
         )
 
@@ -2455,6 +2444,7 @@ def resolve_dry_run(
             selection,
             habituation,
             package_selection,
+            context=tick_context,
         )
         if resolution is not None and resolution.passes:
             drafts.append(_draft_from_resolution(resolution, state=state))
@@ -2481,6 +2471,7 @@ def resolve_dry_run(
                 selection,
                 habituation,
                 package_selection,
+                context=tick_context,
             )
             if resolution is not None and resolution.passes:
                 drafts.append(_draft_from_resolution(resolution, state=state))
@@ -2511,6 +2502,7 @@ def resolve_dry_run(
                     selection,
                     habituation,
                     package_selection,
+                    context=tick_context,
                 )
                 if resolution is not None and resolution.passes:
                     scene_pressure_results.append(resolution)
@@ -2535,6 +2527,7 @@ def resolve_dry_run(
                 selection,
                 habituation,
                 package_selection,
+                context=tick_context,
             )
             if resolution is not None and resolution.passes:
                 drafts.append(_draft_from_resolution(resolution, state=state))
@@ -2560,6 +2553,7 @@ def resolve_dry_run(
                 selection,
                 habituation,
                 package_selection,
+                context=tick_context,
             )
             if resolution is not None and resolution.passes:
                 drafts.append(_draft_from_resolution(resolution, state=state))
@@ -2591,9 +2585,12 @@ def resolve_dry_run(
                     selection,
                     habituation,
                     package_selection,
+                    context=tick_context,
                 )
                 if resolution is not None and resolution.passes:
                     scene_pressure_results.append(resolution)
+    if tick_context is not None:
+        logger.debug("Orrery tick evaluation memo: %s", tick_context.stats())
 
     drafts = _apply_pair_fanout_quota(
         drafts,
@@ -2829,7 +2826,7 @@ def _load_need_debt_scores(
 ) -> dict[tuple[int, str], float]:
     """Load effective need debt scores without mutating canonical state."""
 
-    scores: dict[tuple[int, str], float] = {}
+    rows: list[tuple[Any, str, Any, Optional[datetime]]] = []
     for row in session.execute(
         text(
             """
@@ -2846,20 +2843,43 @@ def _load_need_debt_scores(
             """
         )
     ).mappings():
-        need_type = str(row["need_type"])
-        if not need_applies_to_tags(
-            need_type,
-            tags_by_entity.get(row["character_entity_id"], frozenset()),
-        ):
-            continue
-        scores[(row["character_entity_id"], need_type)] = effective_debt_score(
-            need_type,
-            float(row["debt_score"] or 0.0),
-            last_evaluated_at=row["last_evaluated_at"],
-            current_world_time=current_world_time,
-            tuning=need_tuning,
+        rows.append(
+            (
+                row["character_entity_id"],
+                str(row["need_type"]),
+                row["debt_score"],
+                row["last_evaluated_at"],
+            )
+        )
+    if not rows:
+        return {}
+    entity_ids = sorted({entity_id for entity_id, _, _, _ in rows})
+    entity_row = {entity_id: index for index, entity_id in enumerate(entity_ids)}
+    need_columns = np.array([need_type_index(need_type) for _, need_type, _, _ in rows])
+    entity_rows = np.array([entity_row[entity_id] for entity_id, _, _, _ in rows])
+    applies = need_applicability(entity_ids, tags_by_entity)[entity_rows, need_columns]
+    elapsed_seconds = np.array(
+        [
+            (
+                (current_world_time - last_evaluated_at).total_seconds()
+                if last_evaluated_at is not None and current_world_time is not None
+                else 0.0
+            )
+            for _, _, _, last_evaluated_at in rows
+        ]
+    )
+    effective = accrue_need_debts(
+        np.array([float(debt_score or 0.0) for _, _, debt_score, _ in rows]),
+        elapsed_seconds,
+        accrual_rates(need_tuning)[need_columns],
+    )
+    return {
+        (entity_id, need_type): score
+        for (entity_id, need_type, _, _), keep, score in zip(
+            rows, applies.tolist(), effective.tolist()
         )
-    return scores
+        if keep
+    }
 
 
 def _weather_setting(settings: Any, name: str, default: Any = None) -> Any:
@@ -3161,50 +3181,45 @@ def _present_need_pressure_specs(
 ) -> tuple[dict[str, Any], ...]:
     """Build prompt-only pressure specs from present-character need debt."""
 
+    actor_ids = sorted(present_actor_ids)
+    if not actor_ids:
+        return ()
+    # Columns follow NEED_TYPES, the order severity_thresholds and
+    # need_type_index index by.
+    debt_scores = [
+        [state.need_debt_scores.get((actor_id, need), 0.0) for need in NEED_TYPES]
+        for actor_id in actor_ids
+    ]
+    levels = need_severity_levels(
+        np.array(debt_scores, dtype=float), severity_thresholds(need_tuning)
+    )
+    # Intimacy stays out of prompt pressure for actors with a suppressor tag.
+    suppressor_vocabulary = tuple(sorted(INTIMACY_SUPPRESSOR_TAGS))
+    suppressed = (
+        tag_bitsets(actor_ids, state.tags, suppressor_vocabulary)
+        | tag_bitsets(actor_ids, state.ephemeral_tags, suppressor_vocabulary)
+    ) != 0
+    levels[suppressed, need_type_index("intimacy")] = 0
+    severity_names = dict(NEED_SEVERITY_LEVELS)
     specs: list[dict[str, Any]] = []
-    for actor_id in sorted(present_actor_ids):
-        for need_type, prefix in NEED_SEVERITY_PREFIX.items():
-            if _present_need_pressure_suppressed(state, actor_id, need_type):
-                continue
-            debt_score = state.need_debt_scores.get((actor_id, need_type), 0.0)
-            severity = severity_for_debt(
-                need_type,
-                debt_score,
-                tuning=need_tuning,
-            )
-            if severity is None:
-                continue
-            level, severity_name = severity
-            if level < need_tuning.pressure.min_severity_level:
-                continue
-            specs.append(
-                {
-                    "actor_entity_id": actor_id,
-                    "need_type": need_type,
-                    "severity_prefix": prefix,
-                    "severity_level": level,
-                    "severity_name": severity_name,
-                    "debt_score": debt_score,
-                }
-            )
+    for row, column in np.argwhere(
+        levels >= max(need_tuning.pressure.min_severity_level, 1)
+    ).tolist():
+        need_type = NEED_TYPES[column]
+        level = int(levels[row, column])
+        specs.append(
+            {
+                "actor_entity_id": actor_ids[row],
+                "need_type": need_type,
+                "severity_prefix": NEED_SEVERITY_PREFIX[need_type],
+                "severity_level": level,
+                "severity_name": severity_names[level],
+                "debt_score": debt_scores[row][column],
+            }
+        )
     return tuple(specs)
 
 
-def _present_need_pressure_suppressed(
-    state: WorldState,
-    actor_id: int,
-    need_type: str,
-) -> bool:
-    """Return whether a present-character need should stay out of prompt pressure."""
-
-    if need_type != "intimacy":
-        return False
-    actor_tags = state.tags.get(actor_id, frozenset()) | state.ephemeral_tags.get(
-        actor_id, frozenset()
-    )
-    return bool(INTIMACY_SUPPRESSOR_TAGS & actor_tags)
-
-
 def _scene_pressure_from_need_spec(
     spec: Mapping[str, Any],
     entity_names: Mapping[int, str],
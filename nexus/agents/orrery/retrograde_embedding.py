@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
+import json
+import threading
 from typing import Any, Sequence
 
+from nexus.agents.memnon.utils.embedding_batches import (
+    embed_in_length_buckets,
+    upsert_bucket_vectors,
+)
 from nexus.agents.memnon.utils.embedding_tables import (
     ensure_retrograde_summary_embedding_table,
 )
 
+# Managers whose loaded models matched the active configuration, keyed by
+# manager class and settings. Models are already process-cached by
+# EmbeddingManager; this also skips re-walking the registry on every batch.
+_MANAGER_CACHE: dict[tuple[Any, str], tuple[Any, list[str]]] = {}
+_MANAGER_CACHE_LOCK = threading.Lock()
+
 
 def _normalized_summary_ids(summary_ids: Sequence[int]) -> list[int]:
     """Return unique positive summary ids while preserving caller order."""
@@ -46,15 +58,50 @@ def active_memnon_embedding_model_dimensions() -> dict[str, int]:
     return active_models
 
 
+def active_memnon_embedding_manager(
+    memnon_settings: dict[str, Any],
+) -> tuple[Any, list[str]]:
+    """Return a shared EmbeddingManager and its loaded active model names.
+
+    A manager is cached only once its loaded models match the configured
+    active set, so a failed load is retried by the next call.
+    """
+    from nexus.agents.memnon.utils import embedding_manager
+
+    manager_class = embedding_manager.EmbeddingManager
+    cache_key = (
+        manager_class,
+        json.dumps(memnon_settings, sort_keys=True, default=str),
+    )
+    with _MANAGER_CACHE_LOCK:
+        cached = _MANAGER_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        configured_active_models = list(active_memnon_embedding_model_dimensions())
+        manager = manager_class(settings=memnon_settings)
+        model_names = manager.get_available_models()
+        if set(model_names) != set(configured_active_models):
+            missing_models = sorted(set(configured_active_models) - set(model_names))
+            unexpected_models = sorted(set(model_names) - set(configured_active_models))
+            raise RuntimeError(
+                "Active MEMNON embedding model load did not match configuration; "
+                f"missing={missing_models}, unexpected={unexpected_models}"
+            )
+        cached = _MANAGER_CACHE[cache_key] = (manager, model_names)
+        return cached
+
+
 def embed_retrograde_summaries(
     dbname: str,
     summary_ids: Sequence[int],
 ) -> list[dict[str, Any]]:
     """Embed summaries into their own dimension-specific corpus.
 
-    All embeddings are generated before the write transaction begins. The
+    All embeddings are generated before the write transaction begins, one
+    encode call per length bucket and model (see ``embedding_batches``). The
     transaction then creates any newly discovered dimension tables, upserts
-    every active model's vector, and stamps ``embedding_generated_at``. If any
+    each bucket's vectors in one statement, and stamps
+    ``embedding_generated_at``. If any
     model generation or database write fails, no requested summary receives
     the ironman stamp and the whole set remains retryable.
 
@@ -75,7 +122,6 @@ def embed_retrograde_summaries(
     if not requested_ids:
         return []
 
-    from nexus.agents.memnon.utils.embedding_manager import EmbeddingManager
     from nexus.api.db_pool import get_connection
 
     with get_connection(dbname, dict_cursor=True) as conn:
@@ -98,58 +144,30 @@ def embed_retrograde_summaries(
     if missing_ids:
         raise RuntimeError(f"Retrograde summaries not found in {dbname}: {missing_ids}")
 
-    memnon_settings = _load_memnon_settings()
-    configured_active_models = list(active_memnon_embedding_model_dimensions())
-
-    embedding_manager = EmbeddingManager(settings=memnon_settings)
-    model_names = embedding_manager.get_available_models()
-    if set(model_names) != set(configured_active_models):
-        missing_models = sorted(set(configured_active_models) - set(model_names))
-        unexpected_models = sorted(set(model_names) - set(configured_active_models))
-        raise RuntimeError(
-            "Active MEMNON embedding model load did not match configuration; "
-            f"missing={missing_models}, unexpected={unexpected_models}"
-        )
-
-    generated: dict[int, list[tuple[str, list[float]]]] = {}
-    for summary_id in requested_ids:
-        text = summaries[summary_id]
-        model_embeddings: list[tuple[str, list[float]]] = []
-        for model_name in model_names:
-            embedding = embedding_manager.generate_embedding(text, model_name)
-            if not embedding:
-                raise RuntimeError(
-                    "Embedding generation failed for Retrograde summary "
-                    f"{summary_id} with model {model_name}; "
-                    "embedding_generated_at remains NULL for retry"
-                )
-            model_embeddings.append((model_name, embedding))
-        generated[summary_id] = model_embeddings
+    embedding_manager, model_names = active_memnon_embedding_manager(
+        _load_memnon_settings()
+    )
+    buckets = embed_in_length_buckets(
+        embedding_manager,
+        [summaries[summary_id] for summary_id in requested_ids],
+        model_names,
+        keys=requested_ids,
+        subject="Retrograde summaries",
+    )
 
     with get_connection(dbname, dict_cursor=True) as conn:
         with conn.cursor() as cursor:
             ensured_tables: dict[int, str] = {}
-            for summary_id, model_embeddings in generated.items():
-                for model_name, embedding in model_embeddings:
-                    dimensions = len(embedding)
-                    table_name = ensured_tables.get(dimensions)
+            for model_name in model_names:
+                for bucket in buckets[model_name]:
+                    table_name = ensured_tables.get(bucket.dimensions)
                     if table_name is None:
                         table_name = ensure_retrograde_summary_embedding_table(
-                            cursor, dimensions
+                            cursor, bucket.dimensions
                         )
-                        ensured_tables[dimensions] = table_name
-
-                    embedding_value = "[" + ",".join(str(x) for x in embedding) + "]"
-                    cursor.execute(
-                        f"""
-                        INSERT INTO {table_name}
-                            (summary_id, model, embedding, created_at)
-                        VALUES (%s, %s, %s::vector({dimensions}), NOW())
-                        ON CONFLICT (summary_id, model) DO UPDATE
-                        SET embedding = EXCLUDED.embedding,
-                            created_at = EXCLUDED.created_at
-                        """,
-                        (summary_id, model_name, embedding_value),
+                        ensured_tables[bucket.dimensions] = table_name
+                    upsert_bucket_vectors(
+                        cursor, table_name, "summary_id", requested_ids, bucket
                     )
 
             cursor.execute(
@@ -171,13 +189,18 @@ def embed_retrograde_summaries(
                     f"request ({len(stamped_at)} of {len(requested_ids)})"
                 )
 
+    dimensions = sorted(
+        {
+            bucket.dimensions
+            for model_buckets in buckets.values()
+            for bucket in model_buckets
+        }
+    )
     return [
         {
             "summary_id": summary_id,
-            "models": [model for model, _embedding in generated[summary_id]],
-            "dimensions": sorted(
-                {len(embedding) for _model, embedding in generated[summary_id]}
-            ),
+            "models": list(model_names),
+            "dimensions": dimensions,
             "embedding_generated_at": stamped_at[summary_id].isoformat(),
         }
         for summary_id in requested_ids
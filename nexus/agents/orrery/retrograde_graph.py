@@ -13,11 +13,15 @@ its own priors.
 Determinism contract: the RNG is keyed on stable identity material
 (slot/story/entity), the same discipline as branch selection's
 ``_selection_rng`` — identical inputs rebuild the identical graph, so
-dry-run packets and replays agree.
+dry-run packets and replays agree. ``candidate_graph_build_inputs``
+captures exactly what the builder reads, in a JSON-stable shape, so a
+persisted graph can be rebuilt later and compared by
+``canonical_graph_hash`` (``retrograde_graph_replay``).
 """
 
 from __future__ import annotations
 
+import json
 import random
 from hashlib import sha256
 from math import ceil
@@ -30,6 +34,11 @@ if TYPE_CHECKING:
 
 GRAPH_SCHEMA_VERSION = 2
 
+# Weight maps the builder iterates in order (``rng.choices`` over their
+# items). jsonb does not preserve object key order, so build inputs carry
+# them as ordered [key, weight] pairs.
+_ORDERED_WEIGHT_FIELDS = ("edge_kind_weights", "event_open_endpoint_weights")
+
 
 def _coerce_graph_settings(raw: Any) -> "OrreryRetrogradeGraphSettings":
     """[orrery.retrograde.graph] payload -> validated calibration settings."""
@@ -374,3 +383,93 @@ def build_candidate_graph(
             "claims_per_seed_max": 2,
         },
     }
+
+
+def candidate_graph_build_inputs(
+    *,
+    candidate_scaffolds: Mapping[str, Any],
+    vocabulary: SeedEligibleVocabulary,
+    weird: Mapping[str, Any],
+    generate_candidates: int,
+    rng_seed_material: str,
+    graph_settings: Any = None,
+    junction_count: int = 0,
+) -> dict[str, Any]:
+    """The subset of ``build_candidate_graph`` arguments the builder reads.
+
+    The result survives a JSON (or jsonb) round trip unchanged in meaning:
+    core cards and vocabulary are pruned to the fields sampling touches,
+    and order-sensitive weight maps become ordered pairs.
+    ``rebuild_candidate_graph`` accepts it back.
+    """
+
+    cfg = _coerce_graph_settings(graph_settings)
+    settings_payload = cfg.model_dump(mode="json")
+    for field_name in _ORDERED_WEIGHT_FIELDS:
+        settings_payload[field_name] = [
+            [key, weight] for key, weight in getattr(cfg, field_name).items()
+        ]
+    return {
+        "schema_version": GRAPH_SCHEMA_VERSION,
+        "candidate_scaffolds": {
+            "core_entities": [
+                {
+                    "kind": card.get("kind"),
+                    "role": card.get("role"),
+                    "name": card.get("name"),
+                }
+                for card in candidate_scaffolds.get("core_entities", ())
+            ]
+        },
+        "vocabulary": {
+            "relationship_types": list(vocabulary.get("relationship_types", ())),
+            "multi_entity_tag_definitions": [
+                {
+                    "tag": definition.get("tag"),
+                    "subject_kinds": list(definition.get("subject_kinds", ())),
+                    "object_kinds": list(definition.get("object_kinds", ())),
+                }
+                for definition in vocabulary.get("multi_entity_tag_definitions", ())
+            ],
+            "event_types": list(vocabulary.get("event_types", ())),
+            "event_type_categories": dict(
+                vocabulary.get("event_type_categories") or {}
+            ),
+        },
+        "weird": {key: weird.get(key) for key in ("raw", "raw_min", "raw_max")},
+        "generate_candidates": int(generate_candidates),
+        "rng_seed_material": rng_seed_material,
+        "graph_settings": settings_payload,
+        "junction_count": int(junction_count),
+    }
+
+
+def rebuild_candidate_graph(inputs: Mapping[str, Any]) -> dict[str, Any]:
+    """Rebuild a graph from ``candidate_graph_build_inputs`` output."""
+
+    settings_payload = dict(inputs["graph_settings"])
+    for field_name in _ORDERED_WEIGHT_FIELDS:
+        settings_payload[field_name] = {
+            str(key): float(weight) for key, weight in settings_payload[field_name]
+        }
+    weird = {key: value for key, value in inputs["weird"].items() if value is not None}
+    return build_candidate_graph(
+        candidate_scaffolds=inputs["candidate_scaffolds"],
+        vocabulary=inputs["vocabulary"],
+        weird=weird,
+        generate_candidates=int(inputs["generate_candidates"]),
+        rng_seed_material=str(inputs["rng_seed_material"]),
+        graph_settings=settings_payload,
+        junction_count=int(inputs["junction_count"]),
+    )
+
+
+def canonical_graph_hash(graph: Mapping[str, Any]) -> str:
+    """sha256 of the graph's key-sorted compact JSON encoding.
+
+    Key order is normalized away (jsonb reorders it); list order is not,
+    because node and edge order are part of what the seed determines.
+    """
+
+    encoded = json.dumps(graph, sort_keys=True, separators=(",", ":"))
+    return sha256(encoded.encode("utf-8")).hexdigest()
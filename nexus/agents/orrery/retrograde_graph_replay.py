@@ -0,0 +1,285 @@
+"""Bulk replay verification of persisted R3 candidate graphs.
+
+``build_candidate_graph`` promises that identical inputs rebuild the
+identical graph; dry-run packets, maturation retries and any future replay
+of Retrograde history lean on that. This module makes the promise checkable:
+
+- ``record_candidate_graph`` writes the graph a persistence transaction
+  consumed, its canonical hash and its pruned build inputs to
+  ``retrograde_graph_records`` (migration 123). Slots without the table
+  skip recording.
+- ``replay_graph_record`` rebuilds one record from its inputs and compares
+  canonical hashes, timing the build. It is a module-level function over
+  plain JSON data so ``ProcessPoolExecutor`` can run it in worker processes.
+- ``verify_graph_records`` replays a batch and reports drift grouped by the
+  stored ``GRAPH_SCHEMA_VERSION`` (drift on a retired version is expected
+  after a deliberate schema bump; drift on the current one is a regression)
+  plus build cost grouped by entity and vocabulary counts.
+
+``nexus retrograde-verify-graphs`` drives it for a slot and for packet files
+written by ``nexus retrograde-packet --output``.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+import json
+import logging
+from time import perf_counter
+from typing import Any, Mapping, Optional, Sequence
+
+from nexus.agents.orrery.retrograde_graph import (
+    GRAPH_SCHEMA_VERSION,
+    canonical_graph_hash,
+    rebuild_candidate_graph,
+)
+
+logger = logging.getLogger("nexus.orrery.retrograde_graph_replay")
+
+GRAPH_RECORD_SOURCES = frozenset({"wizard", "maturation"})
+
+
+def record_candidate_graph(
+    cur: Any,
+    *,
+    packet: Mapping[str, Any],
+    source: str,
+    maturation_job_id: Optional[int] = None,
+) -> Optional[int]:
+    """Persist the packet's candidate graph and build inputs; return the id.
+
+    Returns ``None`` without writing when the slot predates migration 123 or
+    the packet was built before requests carried ``candidate_graph_inputs``.
+    """
+
+    if source not in GRAPH_RECORD_SOURCES:
+        raise ValueError(f"Unknown Retrograde graph record source: {source!r}")
+    request = packet.get("seed_generation_request") or {}
+    graph = request.get("candidate_graph")
+    inputs = request.get("candidate_graph_inputs")
+    if not isinstance(graph, Mapping) or not isinstance(inputs, Mapping):
+        logger.debug("Retrograde packet carries no graph build inputs; not recorded")
+        return None
+    if not _graph_records_available(cur):
+        logger.debug("retrograde_graph_records is absent; graph not recorded")
+        return None
+    cur.execute(
+        """
+        /* orrery:retrograde:record_graph */
+        INSERT INTO retrograde_graph_records (
+            source, maturation_job_id, schema_version, graph_hash,
+            build_inputs, graph
+        )
+        VALUES (%s, %s, %s, %s, %s::jsonb, %s::jsonb)
+        RETURNING id
+        """,
+        (
+            source,
+            maturation_job_id,
+            int(graph.get("schema_version", GRAPH_SCHEMA_VERSION)),
+            canonical_graph_hash(graph),
+            json.dumps(inputs),
+            json.dumps(graph),
+        ),
+    )
+    return int(_row_value(cur.fetchone(), "id", 0))
+
+
+def load_graph_records(cur: Any) -> list[dict[str, Any]]:
+    """Every persisted graph record in the slot, oldest first."""
+
+    if not _graph_records_available(cur):
+        raise RuntimeError(
+            "retrograde_graph_records does not exist in this slot; apply "
+            "migration 123_retrograde_graph_records.sql first"
+        )
+    cur.execute(
+        """
+        /* orrery:retrograde:load_graph_records */
+        SELECT id, source, maturation_job_id, schema_version, graph_hash,
+               build_inputs, graph
+        FROM retrograde_graph_records
+        ORDER BY id
+        """
+    )
+    columns = (
+        "id",
+        "source",
+        "maturation_job_id",
+        "schema_version",
+        "graph_hash",
+        "build_inputs",
+        "graph",
+    )
+    return [
+        {column: _row_value(row, column, index) for index, column in enumerate(columns)}
+        for row in cur.fetchall()
+    ]
+
+
+def packet_graph_record(packet: Mapping[str, Any], *, label: str) -> dict[str, Any]:
+    """Shape a packet file's graph like a stored record for replay."""
+
+    request = packet.get("seed_generation_request") or {}
+    graph = request.get("candidate_graph") or {}
+    inputs = request.get("candidate_graph_inputs")
+    if inputs is None:
+        raise ValueError(
+            f"{label}: seed_generation_request has no candidate_graph_inputs; "
+            "rebuild the packet with the current retrograde-packet"
+        )
+    return {
+        "id": label,
+        "source": "packet_file",
+        "maturation_job_id": None,
+        "schema_version": int(graph.get("schema_version", 0)),
+        "graph_hash": canonical_graph_hash(graph),
+        "build_inputs": inputs,
+        "graph": graph,
+    }
+
+
+def replay_graph_record(record: Mapping[str, Any]) -> dict[str, Any]:
+    """Rebuild one record and compare it with the persisted graph.
+
+    ``status`` is ``match``, ``drift`` (rebuilt hash differs), ``corrupt``
+    (the stored graph no longer hashes to its recorded ``graph_hash``) or
+    ``error`` (the rebuild raised).
+    """
+
+    inputs = record["build_inputs"]
+    scaffolds = inputs.get("candidate_scaffolds") or {}
+    vocabulary = inputs.get("vocabulary") or {}
+    stored_hash = canonical_graph_hash(record["graph"])
+    result: dict[str, Any] = {
+        "id": record["id"],
+        "source": record["source"],
+        "schema_version": int(record["schema_version"]),
+        "stored_hash": stored_hash,
+        "rebuilt_hash": None,
+        "entity_count": len(scaffolds.get("core_entities") or ()),
+        "vocabulary_count": sum(
+            len(vocabulary.get(key) or ())
+            for key in (
+                "relationship_types",
+                "multi_entity_tag_definitions",
+                "event_types",
+            )
+        ),
+        "build_ms": None,
+        "error": None,
+    }
+    if stored_hash != record["graph_hash"]:
+        result["status"] = "corrupt"
+        return result
+    started = perf_counter()
+    try:
+        rebuilt = rebuild_candidate_graph(inputs)
+    except (KeyError, TypeError, ValueError) as exc:
+        result["status"] = "error"
+        result["error"] = f"{type(exc).__name__}: {exc}"
+        return result
+    result["build_ms"] = round((perf_counter() - started) * 1000, 3)
+    result["rebuilt_hash"] = canonical_graph_hash(rebuilt)
+    result["status"] = "match" if result["rebuilt_hash"] == stored_hash else "drift"
+    return result
+
+
+def verify_graph_records(
+    records: Sequence[Mapping[str, Any]],
+    *,
+    workers: int = 1,
+) -> dict[str, Any]:
+    """Replay ``records`` across ``workers`` processes and summarize.
+
+    ``workers=1`` replays in-process. Results keep input order.
+    ``mismatched`` splits into ``regressions`` (drift or corruption on the
+    current ``GRAPH_SCHEMA_VERSION``) and ``retired_mismatches`` (records
+    written under an older version, expected after a deliberate bump).
+    """
+
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    started = perf_counter()
+    if workers == 1 or len(records) <= 1:
+        results = [replay_graph_record(record) for record in records]
+    else:
+        chunksize = max(1, len(records) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(replay_graph_record, records, chunksize=chunksize))
+    elapsed_ms = (perf_counter() - started) * 1000
+
+    by_schema_version: dict[int, dict[str, int]] = {}
+    for result in results:
+        counts = by_schema_version.setdefault(
+            result["schema_version"],
+            {"records": 0, "match": 0, "drift": 0, "corrupt": 0, "error": 0},
+        )
+        counts["records"] += 1
+        counts[result["status"]] += 1
+    mismatched = [
+        result for result in results if result["status"] in {"drift", "corrupt"}
+    ]
+
+    return {
+        "current_schema_version": GRAPH_SCHEMA_VERSION,
+        "records": len(results),
+        "matched": sum(1 for result in results if result["status"] == "match"),
+        "workers": workers,
+        "elapsed_ms": round(elapsed_ms, 1),
+        "by_schema_version": {
+            str(version): counts
+            for version, counts in sorted(by_schema_version.items())
+        },
+        "mismatched": mismatched,
+        "regressions": [
+            result
+            for result in mismatched
+            if result["schema_version"] == GRAPH_SCHEMA_VERSION
+        ],
+        "retired_mismatches": [
+            result
+            for result in mismatched
+            if result["schema_version"] != GRAPH_SCHEMA_VERSION
+        ],
+        "errors": [result for result in results if result["status"] == "error"],
+        "build_profile": build_time_profile(results),
+        "results": results,
+    }
+
+
+def build_time_profile(results: Sequence[Mapping[str, Any]]) -> list[dict[str, Any]]:
+    """Rebuild cost grouped by (entity_count, vocabulary_count)."""
+
+    groups: dict[tuple[int, int], list[float]] = {}
+    for result in results:
+        if result["build_ms"] is None:
+            continue
+        key = (result["entity_count"], result["vocabulary_count"])
+        groups.setdefault(key, []).append(float(result["build_ms"]))
+    return [
+        {
+            "entity_count": entity_count,
+            "vocabulary_count": vocabulary_count,
+            "builds": len(timings),
+            "mean_ms": round(sum(timings) / len(timings), 3),
+            "max_ms": round(max(timings), 3),
+        }
+        for (entity_count, vocabulary_count), timings in sorted(groups.items())
+    ]
+
+
+def _graph_records_available(cur: Any) -> bool:
+    cur.execute(
+        """
+        /* orrery:retrograde:graph_records_available */
+        SELECT to_regclass('retrograde_graph_records') IS NOT NULL AS available
+        """
+    )
+    return bool(_row_value(cur.fetchone(), "available", 0))
+
+
+def _row_value(row: Any, key: str, index: int) -> Any:
+    if isinstance(row, Mapping):
+        return row[key]
+    return row[index]
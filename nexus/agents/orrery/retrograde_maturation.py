@@ -18,6 +18,10 @@ Two halves, one durable queue:
    never collide across jobs. The unique index on
    ``orrery_maturation_jobs.entity_id`` plus an already-connected guard make
    maturation idempotent per entity: a matured entity never re-matures.
+   With ``max_parallel_jobs > 1`` the leased batch runs through
+   ``retrograde_scheduler``: jobs with disjoint entity footprints overlap
+   their Skald calls on a bounded pool while loads and commits stay on the
+   drain connection in lease order, so the outcome matches a serial drain.
 
 Failures are loud and retryable: a failed job records ``last_error`` and
 requeues with a delay until the attempt cap, then stays ``failed`` and
@@ -31,9 +35,10 @@ import json
 import logging
 import os
 import time
+from concurrent.futures import Future
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Mapping, Optional, Sequence
+from typing import Any, ContextManager, Mapping, Optional, Sequence
 
 import psycopg2
 from psycopg2.extras import RealDictCursor
@@ -44,6 +49,7 @@ from nexus.agents.orrery.declaration_validation import (
     collect_new_entity_declaration_vocabulary_issues,
 )
 from nexus.agents.orrery.geo import resolve_zone_for_point, story_active_zone
+from nexus.agents.orrery.retrograde_graph_replay import record_candidate_graph
 from nexus.agents.orrery.retrograde_project_dependencies import (
     ProjectStartRelationship,
     load_project_start_relationships,
@@ -609,14 +615,21 @@ def drain_maturation_jobs_sync(
                         (row["job_id"],),
                     )
 
+        if cfg.max_parallel_jobs > 1 and len(rows) > 1:
+            return _drain_scheduled(
+                conn,
+                rows=rows,
+                cfg=cfg,
+                settings_dict=settings_dict,
+                settings=typed_settings,
+                slot=slot,
+            )
+
         matured = 0
         failed = 0
         for row in rows:
             try:
-                with usage_context(
-                    slot=(int(row["slot"]) if row.get("slot") is not None else None),
-                    run_id=str(row["job_id"]),
-                ):
+                with _job_usage(row):
                     _mature_one(
                         conn,
                         row=row,
@@ -628,27 +641,148 @@ def drain_maturation_jobs_sync(
                 matured += 1
             except Exception as exc:
                 failed += 1
-                with conn:
-                    with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                        _mark_maturation_failed(
-                            cur,
-                            row=row,
-                            error=str(exc),
-                            max_attempts=cfg.max_attempts,
-                            retry_delay_seconds=cfg.retry_delay_seconds,
-                        )
-                logger.exception(
-                    "Maturation job %s for %s %r failed",
-                    row["job_id"],
-                    row["entity_kind"],
-                    row["entity_name"],
-                )
+                _record_maturation_failure(conn, row=row, error=exc, cfg=cfg)
         return (matured, failed)
     finally:
         if owns_conn:
             conn.close()
 
 
+def _drain_scheduled(
+    conn: Any,
+    *,
+    rows: Sequence[Mapping[str, Any]],
+    cfg: OrreryRetrogradeMaturationSettings,
+    settings_dict: Mapping[str, Any],
+    settings: Settings,
+    slot: Optional[int],
+) -> tuple[int, int]:
+    """Run leased jobs as a footprint DAG with overlapping Skald stages.
+
+    Loading, persistence, embedding and every job-table write stay on
+    ``conn`` in this thread; only ``_generate_maturation`` runs on the pool.
+    """
+
+    from nexus.agents.orrery.retrograde_scheduler import (
+        load_maturation_job_footprints,
+        run_scheduled_jobs,
+    )
+
+    rows_by_id = {int(row["job_id"]): row for row in rows}
+    with conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            jobs = load_maturation_job_footprints(cur, rows)
+    counts = {"matured": 0, "failed": 0}
+
+    def start(job_id: int) -> Optional[_MaturationDraft]:
+        row = rows_by_id[job_id]
+        try:
+            with _job_usage(row):
+                draft = _prepare_maturation(
+                    conn,
+                    row=row,
+                    cfg=cfg,
+                    settings_dict=settings_dict,
+                    settings=settings,
+                    slot=slot,
+                )
+        except Exception as exc:
+            counts["failed"] += 1
+            _record_maturation_failure(conn, row=row, error=exc, cfg=cfg)
+            return None
+        if isinstance(draft, _MaturationDraft):
+            return draft
+        counts["matured"] += 1
+        return None
+
+    def generate(draft: _MaturationDraft) -> _MaturationGeneration:
+        # Usage context is thread-local; re-enter it on the pool thread.
+        with _job_usage(draft.row):
+            return _generate_maturation(draft, cfg=cfg)
+
+    def finish(
+        job_id: int,
+        draft: _MaturationDraft,
+        generation: "Future[_MaturationGeneration]",
+    ) -> None:
+        row = rows_by_id[job_id]
+        try:
+            with _job_usage(row):
+                _commit_maturation(
+                    conn,
+                    draft,
+                    generation.result(),
+                    cfg=cfg,
+                    settings=settings,
+                    slot=slot,
+                )
+            counts["matured"] += 1
+        except Exception as exc:
+            counts["failed"] += 1
+            _record_maturation_failure(conn, row=row, error=exc, cfg=cfg)
+
+    run_scheduled_jobs(
+        jobs,
+        start=start,
+        generate=generate,
+        finish=finish,
+        max_workers=min(cfg.max_parallel_jobs, len(jobs)),
+    )
+    return (counts["matured"], counts["failed"])
+
+
+def _job_usage(row: Mapping[str, Any]) -> ContextManager[None]:
+    return usage_context(
+        slot=(int(row["slot"]) if row.get("slot") is not None else None),
+        run_id=str(row["job_id"]),
+    )
+
+
+def _record_maturation_failure(
+    conn: Any,
+    *,
+    row: Mapping[str, Any],
+    error: Exception,
+    cfg: OrreryRetrogradeMaturationSettings,
+) -> None:
+    with conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            _mark_maturation_failed(
+                cur,
+                row=row,
+                error=str(error),
+                max_attempts=cfg.max_attempts,
+                retry_delay_seconds=cfg.retry_delay_seconds,
+            )
+    logger.exception(
+        "Maturation job %s for %s %r failed",
+        row["job_id"],
+        row["entity_kind"],
+        row["entity_name"],
+    )
+
+
+@dataclass
+class _MaturationDraft:
+    """A leased job's loaded inputs, ready for its Skald stages."""
+
+    row: Mapping[str, Any]
+    packet: dict[str, Any]
+    dbname: str
+    retrieval: OrreryRetrogradeRetrievalSettings
+    started: float
+
+
+@dataclass
+class _MaturationGeneration:
+    """Skald output for one draft; expansion is skipped when nothing needs it."""
+
+    seed_result: dict[str, Any]
+    seed_elapsed: float
+    expansion_result: Optional[dict[str, Any]] = None
+    expansion_elapsed: float = 0.0
+
+
 def _mature_one(
     conn: Any,
     *,
@@ -660,6 +794,38 @@ def _mature_one(
 ) -> dict[str, Any]:
     """Run the scoped Retrograde pipeline for one leased job."""
 
+    draft = _prepare_maturation(
+        conn,
+        row=row,
+        cfg=cfg,
+        settings_dict=settings_dict,
+        settings=settings,
+        slot=slot,
+    )
+    if not isinstance(draft, _MaturationDraft):
+        return draft
+    generation = _generate_maturation(draft, cfg=cfg)
+    return _commit_maturation(
+        conn,
+        draft,
+        generation,
+        cfg=cfg,
+        settings=settings,
+        slot=slot,
+    )
+
+
+def _prepare_maturation(
+    conn: Any,
+    *,
+    row: Mapping[str, Any],
+    cfg: OrreryRetrogradeMaturationSettings,
+    settings_dict: Mapping[str, Any],
+    settings: Settings,
+    slot: Optional[int],
+) -> dict[str, Any] | _MaturationDraft:
+    """Load a job's packet, or return its manifest when no generation is due."""
+
     from nexus.api.slot_utils import require_slot_dbname
 
     started = time.monotonic()
@@ -716,25 +882,79 @@ def _mature_one(
         setting=story_setting,
         settings=settings,
     )
+    return _MaturationDraft(
+        row=row,
+        packet=packet,
+        dbname=dbname,
+        retrieval=retrieval,
+        started=started,
+    )
+
+
+def _generate_maturation(
+    draft: _MaturationDraft,
+    *,
+    cfg: OrreryRetrogradeMaturationSettings,
+) -> _MaturationGeneration:
+    """Make the R4/R5 and R6 Skald calls for one draft; touches no database."""
 
     from nexus.agents.orrery.retrograde_seed_candidates import run_seed_stage
 
     seed_started = time.monotonic()
     seed_result = run_seed_stage(
-        packet=packet,
+        packet=draft.packet,
         model_name=cfg.model_ref,
         max_tokens=cfg.max_tokens,
     )
-    seed_elapsed = time.monotonic() - seed_started
-    seed_response = seed_result["seed_candidate_response"]
+    generation = _MaturationGeneration(
+        seed_result=seed_result,
+        seed_elapsed=time.monotonic() - seed_started,
+    )
+    if not _selected_seed_ids(generation) and not _geo_authoring_required(draft):
+        return generation
+
+    from nexus.agents.orrery.retrograde_expansion import generate_expansion_with_skald
+
+    expansion_started = time.monotonic()
+    generation.expansion_result = generate_expansion_with_skald(
+        packet=draft.packet,
+        seed_candidate_response=seed_result["seed_candidate_response"],
+        model_name=cfg.model_ref,
+        max_tokens=cfg.max_tokens,
+    )
+    generation.expansion_elapsed = time.monotonic() - expansion_started
+    return generation
+
 
-    selected_seed_ids = seed_response.get("selected_seed_ids") or []
-    geo_authoring = packet.get("geo_authoring")
-    geo_authoring_required = bool(
-        isinstance(geo_authoring, Mapping) and geo_authoring.get("required")
+def _selected_seed_ids(generation: _MaturationGeneration) -> list[Any]:
+    return (
+        generation.seed_result["seed_candidate_response"].get("selected_seed_ids") or []
     )
 
-    if not selected_seed_ids and not geo_authoring_required:
+
+def _geo_authoring_required(draft: _MaturationDraft) -> bool:
+    geo_authoring = draft.packet.get("geo_authoring")
+    return bool(isinstance(geo_authoring, Mapping) and geo_authoring.get("required"))
+
+
+def _commit_maturation(
+    conn: Any,
+    draft: _MaturationDraft,
+    generation: _MaturationGeneration,
+    *,
+    cfg: OrreryRetrogradeMaturationSettings,
+    settings: Settings,
+    slot: Optional[int],
+) -> dict[str, Any]:
+    """Persist one job's generated history and mark it succeeded."""
+
+    row = draft.row
+    seed_result = generation.seed_result
+    seed_response = seed_result["seed_candidate_response"]
+    selected_seed_ids = _selected_seed_ids(generation)
+    expansion_result = generation.expansion_result
+
+    if expansion_result is None:
         manifest = _base_manifest(row, cfg)
         manifest.update(
             {
@@ -742,13 +962,14 @@ def _mature_one(
                 "skipped": "no_seeds_selected",
                 "seed_model": seed_result["model"],
                 "timings_seconds": {
-                    "seed": round(seed_elapsed, 2),
-                    "total": round(time.monotonic() - started, 2),
+                    "seed": round(generation.seed_elapsed, 2),
+                    "total": round(time.monotonic() - draft.started, 2),
                 },
             }
         )
         with conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                _record_maturation_graph(cur, draft)
                 _mark_maturation_succeeded(cur, job_id=row["job_id"], manifest=manifest)
         logger.warning(
             "Maturation job %s: Skald selected no seeds for %r; entity stays "
@@ -758,17 +979,6 @@ def _mature_one(
         )
         return manifest
 
-    from nexus.agents.orrery.retrograde_expansion import generate_expansion_with_skald
-
-    expansion_started = time.monotonic()
-    expansion_result = generate_expansion_with_skald(
-        packet=packet,
-        seed_candidate_response=seed_response,
-        model_name=cfg.model_ref,
-        max_tokens=cfg.max_tokens,
-    )
-    expansion_elapsed = time.monotonic() - expansion_started
-
     expansion_payload = namespace_expansion_event_refs(
         expansion_result["retrograde_expansion_plan"],
         prefix=f"{MATURATION_EVENT_REF_PREFIX}_{row['job_id']}",
@@ -782,7 +992,8 @@ def _mature_one(
                     row=row,
                     expansion_payload=expansion_payload,
                 )
-                total_elapsed = time.monotonic() - started
+                _record_maturation_graph(cur, draft)
+                total_elapsed = time.monotonic() - draft.started
                 manifest = _base_manifest(row, cfg)
                 manifest.update(
                     {
@@ -792,8 +1003,8 @@ def _mature_one(
                         "seed_model": seed_result["model"],
                         "expansion_model": expansion_result["model"],
                         "timings_seconds": {
-                            "seed": round(seed_elapsed, 2),
-                            "expansion": round(expansion_elapsed, 2),
+                            "seed": round(generation.seed_elapsed, 2),
+                            "expansion": round(generation.expansion_elapsed, 2),
                             "total": round(total_elapsed, 2),
                         },
                         "budget_exceeded": total_elapsed > cfg.budget_seconds,
@@ -817,13 +1028,13 @@ def _mature_one(
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
             persistence = _persist_maturation_expansion(
                 cur,
-                packet=packet,
+                packet=draft.packet,
                 seed_response=seed_response,
                 expansion_payload=expansion_payload,
                 row=row,
                 slot=_slot_int(slot, row.get("slot")),
-                dbname=dbname,
-                summaries_enabled=retrieval.summaries_enabled,
+                dbname=draft.dbname,
+                summaries_enabled=draft.retrieval.summaries_enabled,
                 settings=settings,
             )
             _apply_maturation_coordinates(
@@ -831,8 +1042,9 @@ def _mature_one(
                 row=row,
                 expansion_payload=expansion_payload,
             )
+            _record_maturation_graph(cur, draft)
             persistence_elapsed = time.monotonic() - persistence_started
-            total_elapsed = time.monotonic() - started
+            total_elapsed = time.monotonic() - draft.started
             manifest = _base_manifest(row, cfg)
             manifest.update(
                 {
@@ -848,8 +1060,8 @@ def _mature_one(
                     ),
                     "embedding": {"status": "pending"},
                     "timings_seconds": {
-                        "seed": round(seed_elapsed, 2),
-                        "expansion": round(expansion_elapsed, 2),
+                        "seed": round(generation.seed_elapsed, 2),
+                        "expansion": round(generation.expansion_elapsed, 2),
                         "persistence": round(persistence_elapsed, 2),
                         "total": round(total_elapsed, 2),
                     },
@@ -881,8 +1093,19 @@ def _mature_one(
         conn,
         row=row,
         manifest=manifest,
-        dbname=dbname,
-        retrieval=retrieval,
+        dbname=draft.dbname,
+        retrieval=draft.retrieval,
+    )
+
+
+def _record_maturation_graph(cur: Any, draft: _MaturationDraft) -> None:
+    """Keep the R3 graph this job's Skald stages consumed for replay checks."""
+
+    record_candidate_graph(
+        cur,
+        packet=draft.packet,
+        source="maturation",
+        maturation_job_id=int(draft.row["job_id"]),
     )
 
 
@@ -321,6 +321,7 @@ def persist_retrograde_history(
         project_settings=settings.orrery.projects,
     )
     from nexus.agents.orrery.reconstruction import capture_state_checkpoint_sync
+    from nexus.agents.orrery.retrograde_graph_replay import record_candidate_graph
 
     prologue_chunk_id = manifest["prologue_anchor"]["chunk_id"]
     if prologue_chunk_id is None:
@@ -341,6 +342,9 @@ def persist_retrograde_history(
         "chunk_id": int(prologue_chunk_id),
         "label": "genesis",
     }
+    manifest["graph_record_id"] = record_candidate_graph(
+        cur, packet=bundle.packet, source="wizard"
+    )
     logger.info(
         "Retrograde persistence executed for slot %s: %s",
         bundle.slot,
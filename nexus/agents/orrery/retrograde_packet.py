@@ -9,7 +9,10 @@ from nexus.agents.orrery.retrograde_seed_candidates import (
     render_seed_generation_prompt,
     seed_candidate_response_schema,
 )
-from nexus.agents.orrery.retrograde_graph import build_candidate_graph
+from nexus.agents.orrery.retrograde_graph import (
+    build_candidate_graph,
+    candidate_graph_build_inputs,
+)
 from nexus.agents.orrery.retrograde_vocabulary import SeedEligibleVocabulary
 from nexus.config.settings_models import Settings
 
@@ -221,15 +224,16 @@ def build_seed_generation_request(
             if card.get("name")
         )
         rng_seed_material = f"retrograde_graph_v1:{core_names}"
-    candidate_graph = build_candidate_graph(
-        candidate_scaffolds=candidate_scaffolds,
-        vocabulary=vocabulary,
-        weird=weird,
-        generate_candidates=int(budget["generate_candidates"]),
-        rng_seed_material=rng_seed_material,
-        graph_settings=graph_settings,
-        junction_count=junction_count,
-    )
+    graph_arguments: dict[str, Any] = {
+        "candidate_scaffolds": candidate_scaffolds,
+        "vocabulary": vocabulary,
+        "weird": weird,
+        "generate_candidates": int(budget["generate_candidates"]),
+        "rng_seed_material": rng_seed_material,
+        "graph_settings": graph_settings,
+        "junction_count": junction_count,
+    }
+    candidate_graph = build_candidate_graph(**graph_arguments)
     trait_constraints = _materialize_trait_constraints(
         _mapping(candidate_scaffolds.get("trait_hooks")).get("constraints"),
         vocabulary=vocabulary,
@@ -248,6 +252,9 @@ def build_seed_generation_request(
         "mechanical_tag_policy": _mechanical_tag_policy(vocabulary),
         "coverage_functions": list(RETROGRADE_COVERAGE_FUNCTIONS),
         "candidate_graph": candidate_graph,
+        # Replay material for retrograde_graph_replay: rebuilding from these
+        # must reproduce candidate_graph byte-for-byte (canonical hash).
+        "candidate_graph_inputs": candidate_graph_build_inputs(**graph_arguments),
         "selection_rubric": _selection_rubric(level),
         "trait_constraints": trait_constraints,
         "protagonist_identity": dict(
@@ -0,0 +1,213 @@
+"""Dependency-aware concurrent execution for leased Retrograde jobs.
+
+A maturation drain leases several jobs at once, and each job spends nearly
+all of its wall time in sequential Skald round trips (R4 generation, R5
+selection, R6 expansion). Jobs about unrelated entities do not read each
+other's writes, so their Skald stages can overlap; jobs that touch a common
+entity cannot, because the earlier job's persisted history changes what the
+later job loads (its already-connected guard, its inbound project-start
+relationships, the scene it is anchored to).
+
+The scheduler therefore works from an entity *footprint* per job: the
+normalized refs of every entity the job reads or may write. A job waits for
+every earlier job (in lease order) whose footprint it shares; the rest of
+the DAG runs with a bounded thread pool. Only the generation step leaves the
+calling thread: ``start`` and ``finish`` run on the caller's thread, so all
+database reads and writes stay on the drain's connection, and ``finish``
+runs strictly in lease order so commit-time resolution (implied-entity
+creation, idempotency keys) sees the same world a serial drain would.
+
+Determinism: generation inputs are built by ``start`` after every
+predecessor has finished, and the R3 graph RNG is keyed on the packet's own
+identity material (``retrograde_graph._graph_rng``), never on scheduling
+order, so a concurrent drain produces the same packets and the same commits
+as a serial one.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Mapping, Optional, Sequence, TypeVar
+
+from nexus.agents.orrery.retrograde_project_dependencies import (
+    load_project_start_relationships,
+)
+from nexus.agents.orrery.retrograde_vocabulary import normalize_entity_ref
+
+Prepared = TypeVar("Prepared")
+Generated = TypeVar("Generated")
+
+
+@dataclass(frozen=True)
+class ScheduledJob:
+    """One leased job and the entity refs it reads or may write."""
+
+    key: int
+    footprint: frozenset[str]
+
+
+@dataclass
+class _Pending(Generic[Prepared, Generated]):
+    prepared: Prepared
+    future: "Future[Generated]"
+
+
+def plan_job_dependencies(
+    jobs: Sequence[ScheduledJob],
+) -> dict[int, tuple[int, ...]]:
+    """Map each job to the earlier jobs it must wait for.
+
+    Edges only ever point backwards in lease order, so the graph is acyclic
+    by construction and a serial drain is one of its topological orders.
+    """
+
+    dependencies: dict[int, tuple[int, ...]] = {}
+    for index, job in enumerate(jobs):
+        dependencies[job.key] = tuple(
+            earlier.key for earlier in jobs[:index] if earlier.footprint & job.footprint
+        )
+    return dependencies
+
+
+def run_scheduled_jobs(
+    jobs: Sequence[ScheduledJob],
+    *,
+    start: Callable[[int], Optional[Prepared]],
+    generate: Callable[[Prepared], Generated],
+    finish: Callable[[int, Prepared, "Future[Generated]"], None],
+    max_workers: int,
+) -> None:
+    """Run ``jobs`` as a dependency DAG with at most ``max_workers`` generating.
+
+    ``start(key)`` runs on the calling thread once every predecessor has
+    finished; it returns the generation input, or ``None`` when the job
+    completed without generation. ``generate`` runs on a pool thread.
+    ``finish(key, prepared, future)`` runs on the calling thread in lease
+    order and owns error handling: ``future.result()`` re-raises whatever
+    generation raised. An exception escaping ``start`` or ``finish`` aborts
+    the run after in-flight generation drains.
+    """
+
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+    dependencies = plan_job_dependencies(jobs)
+    started: set[int] = set()
+    done: set[int] = set()
+    pending: dict[int, _Pending[Prepared, Generated]] = {}
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="retrograde-job"
+    ) as pool:
+        for job in jobs:
+            # Start everything the finished set has unblocked, earliest
+            # first, so the pool works ahead while the head job generates.
+            for candidate in jobs:
+                if candidate.key in started or not done.issuperset(
+                    dependencies[candidate.key]
+                ):
+                    continue
+                started.add(candidate.key)
+                prepared = start(candidate.key)
+                if prepared is None:
+                    done.add(candidate.key)
+                else:
+                    pending[candidate.key] = _Pending(
+                        prepared, pool.submit(generate, prepared)
+                    )
+            head = pending.pop(job.key, None)
+            if head is not None:
+                finish(job.key, head.prepared, head.future)
+            done.add(job.key)
+
+
+def load_maturation_job_footprints(
+    cur: Any,
+    rows: Sequence[Mapping[str, Any]],
+) -> list[ScheduledJob]:
+    """Resolve the entity footprint of each leased maturation job.
+
+    A footprint covers the job's own entity, every entity its requesting
+    chunk references, the other endpoints of its declared pair-tag hints,
+    the subjects of its inbound project-start relationships, and any other
+    leased job's entity named in its requesting chunk. It is deliberately a
+    superset of what ``_load_job_context`` reads (no per-kind limit), so an
+    overlap the scheduler misses is one the serial pipeline could not have
+    observed either.
+    """
+
+    chunk_ids = sorted({int(row["requesting_chunk_id"]) for row in rows})
+    chunk_text: dict[int, str] = {}
+    chunk_refs: dict[int, set[str]] = {chunk_id: set() for chunk_id in chunk_ids}
+    if chunk_ids:
+        cur.execute(
+            """
+            /* orrery:maturation:footprint_chunks */
+            SELECT id, raw_text FROM narrative_chunks WHERE id = ANY(%s)
+            """,
+            (chunk_ids,),
+        )
+        for chunk in cur.fetchall():
+            chunk_text[int(_row_value(chunk, "id", 0))] = normalize_entity_ref(
+                str(_row_value(chunk, "raw_text", 1) or "")
+            )
+        cur.execute(
+            """
+            /* orrery:maturation:footprint_scene */
+            SELECT r.chunk_id, c.name
+            FROM chunk_character_references r
+            JOIN characters c ON c.id = r.character_id
+            WHERE r.chunk_id = ANY(%s)
+            UNION
+            SELECT r.chunk_id, p.name
+            FROM place_chunk_references r
+            JOIN places p ON p.id = r.place_id
+            WHERE r.chunk_id = ANY(%s)
+            UNION
+            SELECT r.chunk_id, f.name
+            FROM chunk_faction_references r
+            JOIN factions f ON f.id = r.faction_id
+            WHERE r.chunk_id = ANY(%s)
+            """,
+            (chunk_ids, chunk_ids, chunk_ids),
+        )
+        for ref in cur.fetchall():
+            chunk_refs[int(_row_value(ref, "chunk_id", 0))].add(
+                normalize_entity_ref(str(_row_value(ref, "name", 1)))
+            )
+
+    leased_names = {normalize_entity_ref(str(row["entity_name"])) for row in rows}
+    jobs: list[ScheduledJob] = []
+    for row in rows:
+        chunk_id = int(row["requesting_chunk_id"])
+        text = chunk_text.get(chunk_id, "")
+        footprint = {normalize_entity_ref(str(row["entity_name"]))}
+        footprint |= chunk_refs.get(chunk_id, set())
+        footprint |= {name for name in leased_names if name and name in text}
+        footprint |= _declared_hint_refs(row.get("declaration"))
+        footprint |= {
+            normalize_entity_ref(fact["subject_ref"])
+            for fact in load_project_start_relationships(
+                cur, object_entity_id=int(row["entity_id"])
+            )
+        }
+        jobs.append(
+            ScheduledJob(key=int(row["job_id"]), footprint=frozenset(footprint))
+        )
+    return jobs
+
+
+def _declared_hint_refs(declaration: Any) -> set[str]:
+    if not isinstance(declaration, Mapping):
+        return set()
+    return {
+        normalize_entity_ref(str(hint["other_entity_name"]))
+        for hint in declaration.get("pair_tag_hints") or ()
+        if isinstance(hint, Mapping) and hint.get("other_entity_name")
+    }
+
+
+def _row_value(row: Any, key: str, index: int) -> Any:
+    if isinstance(row, Mapping):
+        return row[key]
+    return row[index]
@@ -10,9 +10,21 @@ import json
 import math
 import random
 from types import MappingProxyType
-from typing import Any, Callable, Dict, Iterable, Literal, Mapping, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
 
 from nexus.agents.orrery.communication import CommunicationGraph
+from nexus.agents.orrery.entity_arrays import EntityArrays, project_entity_arrays
 from nexus.agents.orrery.epistemics import ClaimKnowledge
 from nexus.agents.orrery.needs import normalize_need_type
 from nexus.agents.orrery.status_family import (
@@ -400,6 +412,18 @@ class WorldState:
     _inbound_pair_tags_by_entity: Mapping[int, frozenset[str]] = field(
         init=False, repr=False, compare=False
     )
+    _entity_arrays: Optional[EntityArrays] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def entity_arrays(self) -> EntityArrays:
+        """Array projection of located entities, built on first use."""
+
+        arrays = self._entity_arrays
+        if arrays is None:
+            arrays = project_entity_arrays(self)
+            object.__setattr__(self, "_entity_arrays", arrays)
+        return arrays
 
     def __post_init__(self) -> None:
         """Build immutable derived reads for one canonical state snapshot."""
@@ -1253,19 +1277,9 @@ def count_co_located(
         location_id = state.locations.get(entity_id)
         if location_id is None:
             return False
-        count = 0
-        for other_id, other_location in state.locations.items():
-            if other_id == entity_id or other_location != location_id:
-                continue
-            if _is_in_transit(state, other_id):
-                continue
-            if with_tag and with_tag not in state.tags.get(other_id, frozenset()):
-                continue
-            if with_ephemeral and with_ephemeral not in state.ephemeral_tags.get(
-                other_id, frozenset()
-            ):
-                continue
-            count += 1
+        count = state.entity_arrays().co_located_count(
+            entity_id, with_tag=with_tag, with_ephemeral=with_ephemeral
+        )
         return count >= minimum
 
     filters = []
@@ -2693,6 +2707,220 @@ def binding_hash(bindings: Bindings) -> str:
     return sha256(encoded.encode("utf-8")).hexdigest()
 
 
+_UNBOUND = object()
+
+
+class _RecordingBindings(MutableMapping[Slot, Any]):
+    """Bindings view that records the slots a condition read, and their values.
+
+    Point reads (``[]``, ``get``, ``in``) record the slot, missing or not.
+    Anything that walks the whole mapping, and any write, makes the
+    evaluation unmemoizable; writes still go through to the real bindings so
+    the stack's completion check reports the contract violation.
+    """
+
+    __slots__ = ("_bindings", "reads", "opaque")
+
+    def __init__(self, bindings: Bindings) -> None:
+        self._bindings = bindings
+        self.reads: dict[Any, Any] = {}
+        self.opaque = False
+
+    def __getitem__(self, slot: Any) -> Any:
+        value = self._bindings.get(slot, _UNBOUND)
+        self.reads[slot] = value
+        if value is _UNBOUND:
+            raise KeyError(slot)
+        return value
+
+    def get(self, slot: Any, default: Any = None) -> Any:
+        value = self._bindings.get(slot, _UNBOUND)
+        self.reads[slot] = value
+        return default if value is _UNBOUND else value
+
+    def __contains__(self, slot: object) -> bool:
+        value = self._bindings.get(slot, _UNBOUND)
+        self.reads[slot] = value
+        return value is not _UNBOUND
+
+    def __setitem__(self, slot: Any, value: Any) -> None:
+        self.opaque = True
+        self._bindings[slot] = value
+
+    def __delitem__(self, slot: Any) -> None:
+        self.opaque = True
+        del self._bindings[slot]
+
+    def __iter__(self) -> Iterator[Any]:
+        self.opaque = True
+        return iter(self._bindings)
+
+    def __len__(self) -> int:
+        self.opaque = True
+        return len(self._bindings)
+
+
+# Evaluations a gate may record without a single hit before the context
+# stops memoizing it for the rest of the tick.
+_GATE_ADMISSION_PROBES = 8
+
+
+class _GateMemo:
+    """One package gate's outcomes, keyed by read-set then slot values."""
+
+    __slots__ = ("condition", "outcomes", "hits", "misses", "bypass")
+
+    def __init__(self, condition: Condition) -> None:
+        # Held so ``id(condition)`` cannot be reused within the tick.
+        self.condition = condition
+        self.outcomes: dict[Tuple[Any, ...], dict[Tuple[Any, ...], bool]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.bypass = False
+
+
+class TickEvaluationContext:
+    """Per-tick memo for binding digests and package-gate outcomes.
+
+    One resolver tick evaluates many stacks against a single immutable
+    :class:`WorldState`. Two pieces of that work repeat:
+
+    * ``binding_hash`` — each stack hashes its bindings on entry and again
+      at completion. Digests are memoized by bindings identity and reused
+      only while the mapping's items are unchanged, so the completion check
+      still catches a mutating predicate.
+    * package gates — routes that share an actor re-run the same gate
+      objects, and many gates settle on the actor alone (an ``AND`` that
+      fails its first actor leaf never reads TARGET). Outcomes are memoized
+      by ``(condition id, state, bindings projection)``, where the
+      projection is the values of the slots the gate actually read on a
+      previous evaluation. Conditions are deterministic over ``state`` and
+      the slots they read, so bindings that agree on that read-set take the
+      same path to the same outcome.
+
+    The context is bound to one state object. Passing any other state —
+    a rehydration or ``dataclass_replace`` derivation — drops every gate
+    outcome before evaluating, as does :meth:`invalidate`. Evaluations that
+    mutate or iterate bindings, or whose projection is unhashable, are not
+    memoized. A gate whose first ``_GATE_ADMISSION_PROBES`` recorded
+    evaluations never hit is evaluated directly for the rest of the tick.
+    With ``verify`` every memo hit is recomputed and a disagreement raises
+    ``RuntimeError``.
+
+    A lookup costs about as much as a builtin gate, so the resolver only
+    builds a context when ``[orrery.package_selection] tick_memo`` is set.
+    """
+
+    def __init__(self, state: WorldState, *, verify: bool = False) -> None:
+        self.verify = verify
+        self._state = state
+        self._digests: dict[int, Tuple[Bindings, Tuple[Any, ...], str]] = {}
+        self._gates: dict[int, _GateMemo] = {}
+        self.binding_hash_hits = 0
+        self.binding_hash_misses = 0
+        self.gate_hits = 0
+        self.gate_misses = 0
+        self.gate_uncached = 0
+        self.invalidations = 0
+
+    def invalidate(self) -> None:
+        """Drop every memoized gate outcome."""
+
+        self._gates.clear()
+        self.invalidations += 1
+
+    def binding_hash(self, bindings: Bindings) -> str:
+        """:func:`binding_hash`, reused while this mapping is unchanged."""
+
+        snapshot = tuple(bindings.items())
+        entry = self._digests.get(id(bindings))
+        if entry is not None and entry[0] is bindings and entry[1] == snapshot:
+            self.binding_hash_hits += 1
+            if self.verify and binding_hash(bindings) != entry[2]:
+                raise RuntimeError(
+                    "Memoized binding digest disagrees with binding_hash for "
+                    f"{snapshot!r}"
+                )
+            return entry[2]
+        self.binding_hash_misses += 1
+        digest = binding_hash(bindings)
+        self._digests[id(bindings)] = (bindings, snapshot, digest)
+        return digest
+
+    def package_gate(
+        self, condition: Condition, state: WorldState, bindings: Bindings
+    ) -> bool:
+        """Evaluate ``condition`` as a package gate through the memo."""
+
+        if state is not self._state:
+            self._state = state
+            self.invalidate()
+        memo = self._gates.get(id(condition))
+        if memo is None:
+            memo = self._gates[id(condition)] = _GateMemo(condition)
+        elif memo.bypass:
+            self.gate_uncached += 1
+            return bool(condition(state, bindings))
+        else:
+            get = bindings.get
+            for signature, outcomes in memo.outcomes.items():
+                projection = tuple([get(slot, _UNBOUND) for slot in signature])
+                try:
+                    outcome = outcomes.get(projection)
+                except TypeError:
+                    break
+                if outcome is None:
+                    continue
+                memo.hits += 1
+                self.gate_hits += 1
+                if self.verify and bool(condition(state, bindings)) != outcome:
+                    raise RuntimeError(
+                        "Memoized package gate "
+                        f"{getattr(condition, '__name__', condition)!r} "
+                        f"disagrees with re-evaluation for bindings {bindings!r}"
+                    )
+                return outcome
+
+        recording = _RecordingBindings(bindings)
+        outcome = bool(condition(state, recording))
+        projection = tuple(recording.reads.values())
+        try:
+            hash(projection)
+        except TypeError:
+            recording.opaque = True
+        if recording.opaque:
+            self.gate_uncached += 1
+            return outcome
+        self.gate_misses += 1
+        memo.misses += 1
+        if not memo.hits and memo.misses >= _GATE_ADMISSION_PROBES:
+            # Every probe differed on a slot it read: this gate separates
+            # the tick's bindings, so recording it further is pure overhead.
+            memo.bypass = True
+            memo.outcomes.clear()
+            return outcome
+        memo.outcomes.setdefault(tuple(recording.reads), {})[projection] = outcome
+        return outcome
+
+    def stats(self) -> dict[str, Any]:
+        """Hit counts and rates for the tick so far."""
+
+        digest_lookups = self.binding_hash_hits + self.binding_hash_misses
+        gate_lookups = self.gate_hits + self.gate_misses + self.gate_uncached
+        return {
+            "binding_hash_hits": self.binding_hash_hits,
+            "binding_hash_misses": self.binding_hash_misses,
+            "binding_hash_hit_rate": (
+                self.binding_hash_hits / digest_lookups if digest_lookups else 0.0
+            ),
+            "gate_hits": self.gate_hits,
+            "gate_misses": self.gate_misses,
+            "gate_uncached": self.gate_uncached,
+            "gate_hit_rate": self.gate_hits / gate_lookups if gate_lookups else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+
 @dataclass(frozen=True, slots=True)
 class BranchSelection:
     """Branch-selection policy, threaded from [orrery.selection] in nexus.toml.
@@ -2844,6 +3072,7 @@ def evaluate(
     selection: Optional[BranchSelection] = None,
     *,
     digest: Optional[str] = None,
+    context: Optional[TickEvaluationContext] = None,
 ) -> Resolution:
     """Evaluate one template and binding set against world state.
 
@@ -2852,12 +3081,19 @@ def evaluate(
     owns that operation and verifies the binding identity at completion. A
     caller that supplies ``digest`` must perform the same verification at its
     enclosing operation boundary, as :func:`select_package` does for stacks.
+    ``context`` routes the digest and the package gate through a tick memo.
     """
 
+    hasher = binding_hash if context is None else context.binding_hash
     verify_at_completion = digest is None
     if digest is None:
-        digest = binding_hash(bindings)
-    if not template.package_gate(state, bindings):
+        digest = hasher(bindings)
+    gate_passes = (
+        template.package_gate(state, bindings)
+        if context is None
+        else context.package_gate(template.package_gate, state, bindings)
+    )
+    if not gate_passes:
         resolution = Resolution(
             template_id=template.id,
             priority=template.priority,
@@ -2896,7 +3132,7 @@ def evaluate(
                 passes=False,
             )
 
-    if verify_at_completion and binding_hash(bindings) != digest:
+    if verify_at_completion and hasher(bindings) != digest:
         raise RuntimeError(
             f"Bindings were mutated during template evaluation for "
             f"{template.id!r}; this violates the substrate's pure-predicate contract"
@@ -2977,6 +3213,11 @@ class PackageSelection:
     window_points: float
     temperature: float
     exempt_bands: frozenset[str]
+    # Share binding digests and package-gate outcomes across one resolver
+    # tick's stacks through a TickEvaluationContext.
+    tick_memo: bool = False
+    # Debug: re-evaluate every memo hit and raise on disagreement.
+    memo_parity_check: bool = False
 
     def __post_init__(self) -> None:
         if self.mode not in ("argmax", "stochastic"):
@@ -3010,12 +3251,16 @@ def coerce_package_selection(raw: Any) -> Optional[PackageSelection]:
             window_points=float(raw["window_points"]),
             temperature=float(raw["temperature"]),
             exempt_bands=frozenset(raw["exempt_bands"]),
+            tick_memo=bool(raw.get("tick_memo", False)),
+            memo_parity_check=bool(raw.get("memo_parity_check", False)),
         )
     return PackageSelection(
         mode=str(raw.mode),
         window_points=float(raw.window_points),
         temperature=float(raw.temperature),
         exempt_bands=frozenset(raw.exempt_bands),
+        tick_memo=bool(getattr(raw, "tick_memo", False)),
+        memo_parity_check=bool(getattr(raw, "memo_parity_check", False)),
     )
 
 
@@ -3068,6 +3313,7 @@ def select_package(
     package_selection: Optional[PackageSelection] = None,
     *,
     digest: Optional[str] = None,
+    context: Optional[TickEvaluationContext] = None,
 ) -> PackageSelectionOutcome:
     """Choose one firing package through the production/explain authority.
 
@@ -3084,10 +3330,13 @@ def select_package(
     branch-selection calibration. Package gates and branch predicates must
     keep ``bindings`` immutable for the entire stack operation; this authority
     rehashes once at completion and raises loudly if that contract is violated.
+    A :class:`TickEvaluationContext` memoizes that rehash and package gates
+    across the stacks of one tick without changing any outcome.
     """
 
+    hasher = binding_hash if context is None else context.binding_hash
     if digest is None:
-        digest = binding_hash(bindings)
+        digest = hasher(bindings)
     habituation_policy = habituation or HabituationPolicy()
     ordered = stack_order(templates, state, bindings, habituation_policy)
     stochastic = (
@@ -3110,6 +3359,7 @@ def select_package(
             bindings,
             branch_selection,
             digest=digest,
+            context=context,
         )
         if not resolution.passes:
             continue
@@ -3168,7 +3418,7 @@ def select_package(
                         reason="window_softmax",
                     )
 
-    if binding_hash(bindings) != digest:
+    if hasher(bindings) != digest:
         stack_context = ", ".join(template.id for template in ordered) or "<empty>"
         raise RuntimeError(
             "Bindings were mutated during stack evaluation for Orrery templates "
@@ -3184,6 +3434,8 @@ def evaluate_stack(
     selection: Optional[BranchSelection] = None,
     habituation: Optional[HabituationPolicy] = None,
     package_selection: Optional[PackageSelection] = None,
+    *,
+    context: Optional[TickEvaluationContext] = None,
 ) -> Optional[Resolution]:
     """Evaluate a stack through the shared package-selection authority.
 
@@ -3192,7 +3444,9 @@ def evaluate_stack(
     identity once more at completion before returning a resolution.
     """
 
-    digest = binding_hash(bindings)
+    digest = (
+        binding_hash(bindings) if context is None else context.binding_hash(bindings)
+    )
     return select_package(
         templates,
         state,
@@ -3201,6 +3455,7 @@ def evaluate_stack(
         habituation,
         package_selection,
         digest=digest,
+        context=context,
     ).winner
 
 
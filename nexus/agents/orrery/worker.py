@@ -990,6 +990,7 @@ def _narration_worker_owner(slot: Optional[int]) -> str:
 def _connect_for_slot(slot: Optional[int]) -> Any:
     from nexus.api.db_pool import get_connect_timeout_seconds
     from nexus.api.slot_utils import require_slot_dbname
+    from nexus.telemetry.sql_profile import sql_profile_connect_kwargs
 
     dbname = require_slot_dbname(slot=slot)
     return psycopg2.connect(
@@ -1000,6 +1001,7 @@ def _connect_for_slot(slot: Optional[int]) -> Any:
         connect_timeout=int(
             os.environ.get("PGCONNECT_TIMEOUT") or get_connect_timeout_seconds()
         ),
+        **sql_profile_connect_kwargs(),
     )
 
 
@@ -10,7 +10,8 @@ Wire-format contract: identical to the retired Express layer — camelCase
 image rows, ``{"success": true, ...}`` envelopes, 400 for invalid file
 types, 413 for oversized files.
 
-Upload limits come from nexus.toml ``[api.uploads]``.
+Upload limits come from nexus.toml ``[api.uploads]``. Row reads and writes
+go through the slot's async pool so they never block the gateway event loop.
 """
 
 from __future__ import annotations
@@ -24,7 +25,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, File, HTTPException, UploadFile
 
-from nexus.api.db_pool import get_connection
+from nexus.api.db_pool import get_async_connection
 from nexus.api.reader_endpoints import resolve_dbname
 
 logger = logging.getLogger("nexus.api.asset_endpoints")
@@ -111,25 +112,24 @@ async def _read_bounded(upload: UploadFile, max_bytes: int) -> bytes:
     return contents
 
 
-def _fetch_images(
+async def _fetch_images(
     dbname: str, table: str, owner_column: str, owner_id: int
 ) -> List[Dict[str, Any]]:
-    with get_connection(dbname, dict_cursor=True) as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                f"""
-                SELECT id, {owner_column}, file_path, is_main, display_order,
-                       uploaded_at
-                FROM {table}
-                WHERE {owner_column} = %s
-                ORDER BY display_order
-                """,
-                (owner_id,),
-            )
-            return [dict(row) for row in cur.fetchall()]
+    async with get_async_connection(dbname) as conn:
+        rows = await conn.fetch(
+            f"""
+            SELECT id, {owner_column}, file_path, is_main, display_order,
+                   uploaded_at
+            FROM {table}
+            WHERE {owner_column} = $1
+            ORDER BY display_order
+            """,
+            owner_id,
+        )
+        return [dict(row) for row in rows]
 
 
-def _insert_image(
+async def _insert_image(
     dbname: str,
     table: str,
     owner_column: str,
@@ -138,57 +138,59 @@ def _insert_image(
     is_main: int,
     display_order: int,
 ) -> Dict[str, Any]:
-    with get_connection(dbname, dict_cursor=True) as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                f"""
-                INSERT INTO {table} ({owner_column}, file_path, is_main,
-                                     display_order)
-                VALUES (%s, %s, %s, %s)
-                RETURNING id, {owner_column}, file_path, is_main,
-                          display_order, uploaded_at
-                """,
-                (owner_id, file_path, is_main, display_order),
-            )
-            return dict(cur.fetchone())
+    async with get_async_connection(dbname) as conn:
+        row = await conn.fetchrow(
+            f"""
+            INSERT INTO {table} ({owner_column}, file_path, is_main,
+                                 display_order)
+            VALUES ($1, $2, $3, $4)
+            RETURNING id, {owner_column}, file_path, is_main,
+                      display_order, uploaded_at
+            """,
+            owner_id,
+            file_path,
+            is_main,
+            display_order,
+        )
+        return dict(row)
 
 
-def _set_main_image(
+async def _set_main_image(
     dbname: str, table: str, owner_column: str, owner_id: int, image_id: int
 ) -> None:
     """Promote one of the owner's images to main, atomically.
 
     The owner guard on the promotion prevents cross-owner mutation via an
     arbitrary image_id; when it matches nothing the whole transaction
-    (including the clear) rolls back via get_connection's error handling.
+    (including the clear) rolls back via get_async_connection's transaction.
     """
-    with get_connection(dbname) as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                f"UPDATE {table} SET is_main = 0 WHERE {owner_column} = %s",
-                (owner_id,),
-            )
-            cur.execute(
-                f"UPDATE {table} SET is_main = 1 "
-                f"WHERE id = %s AND {owner_column} = %s",
-                (image_id, owner_id),
+    async with get_async_connection(dbname) as conn:
+        await conn.execute(
+            f"UPDATE {table} SET is_main = 0 WHERE {owner_column} = $1",
+            owner_id,
+        )
+        status = await conn.execute(
+            f"UPDATE {table} SET is_main = 1 WHERE id = $1 AND {owner_column} = $2",
+            image_id,
+            owner_id,
+        )
+        # asyncpg reports the command tag ("UPDATE <n>") instead of rowcount.
+        if status.rsplit(" ", 1)[-1] == "0":
+            raise HTTPException(
+                status_code=404,
+                detail=f"Image {image_id} not found for this owner",
             )
-            if cur.rowcount == 0:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Image {image_id} not found for this owner",
-                )
 
 
-def _delete_image_row(
+async def _delete_image_row(
     dbname: str, table: str, owner_column: str, owner_id: int, image_id: int
 ) -> None:
-    with get_connection(dbname) as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                f"DELETE FROM {table} WHERE id = %s AND {owner_column} = %s",
-                (image_id, owner_id),
-            )
+    async with get_async_connection(dbname) as conn:
+        await conn.execute(
+            f"DELETE FROM {table} WHERE id = $1 AND {owner_column} = $2",
+            image_id,
+            owner_id,
+        )
 
 
 async def _handle_upload(
@@ -224,7 +226,7 @@ async def _handle_upload(
     # Current max display order, read from the same slot the rows are
     # written to (consulting the wrong database used to mis-flag a slot's
     # first portrait as non-main).
-    existing = _fetch_images(dbname, table, owner_column, owner_id)
+    existing = await _fetch_images(dbname, table, owner_column, owner_id)
     max_order = max((row["display_order"] for row in existing), default=-1)
 
     uploaded: List[Dict[str, Any]] = []
@@ -237,7 +239,7 @@ async def _handle_upload(
         is_main = 1 if not existing and not uploaded else 0
         max_order += 1
         try:
-            row = _insert_image(
+            row = await _insert_image(
                 dbname, table, owner_column, owner_id, relative_path, is_main, max_order
             )
         except Exception:
@@ -250,7 +252,7 @@ async def _handle_upload(
     return {"success": True, "images": uploaded}
 
 
-def _delete_image(
+async def _delete_image(
     dbname: str, table: str, owner_column: str, owner_id: int, image_id: int
 ) -> Dict[str, Any]:
     """Shared delete flow: remove the file (best effort), then the row.
@@ -259,7 +261,7 @@ def _delete_image(
     image_id belonging to a different owner is a 404, not a cross-owner
     mutation.
     """
-    images = _fetch_images(dbname, table, owner_column, owner_id)
+    images = await _fetch_images(dbname, table, owner_column, owner_id)
     image = next((row for row in images if row["id"] == image_id), None)
     if image is None:
         raise HTTPException(
@@ -273,7 +275,7 @@ def _delete_image(
         file_path.unlink()
     except OSError as exc:
         logger.warning("Could not delete image file %s: %s", file_path, exc)
-    _delete_image_row(dbname, table, owner_column, owner_id, image_id)
+    await _delete_image_row(dbname, table, owner_column, owner_id, image_id)
     return {"success": True}
 
 
@@ -288,7 +290,7 @@ async def get_character_images(
 ) -> List[Dict[str, Any]]:
     """All images for a character, ordered by display order."""
     dbname = resolve_dbname(slot)
-    rows = _fetch_images(
+    rows = await _fetch_images(
         dbname, "assets.character_images", "character_id", character_id
     )
     return [_image_row_payload(row, "characterId") for row in rows]
@@ -319,7 +321,7 @@ async def set_main_character_image(
 ) -> Dict[str, Any]:
     """Mark one image as the character's main portrait."""
     dbname = resolve_dbname(slot)
-    _set_main_image(
+    await _set_main_image(
         dbname, "assets.character_images", "character_id", character_id, image_id
     )
     return {"success": True}
@@ -331,7 +333,7 @@ async def delete_character_image(
 ) -> Dict[str, Any]:
     """Delete a character image (file and row)."""
     dbname = resolve_dbname(slot)
-    return _delete_image(
+    return await _delete_image(
         dbname, "assets.character_images", "character_id", character_id, image_id
     )
 
@@ -347,7 +349,7 @@ async def get_place_images(
 ) -> List[Dict[str, Any]]:
     """All images for a place, ordered by display order."""
     dbname = resolve_dbname(slot)
-    rows = _fetch_images(dbname, "assets.place_images", "place_id", place_id)
+    rows = await _fetch_images(dbname, "assets.place_images", "place_id", place_id)
     return [_image_row_payload(row, "placeId") for row in rows]
 
 
@@ -376,7 +378,7 @@ async def set_main_place_image(
 ) -> Dict[str, Any]:
     """Mark one image as the place's main image."""
     dbname = resolve_dbname(slot)
-    _set_main_image(dbname, "assets.place_images", "place_id", place_id, image_id)
+    await _set_main_image(dbname, "assets.place_images", "place_id", place_id, image_id)
     return {"success": True}
 
 
@@ -386,4 +388,6 @@ async def delete_place_image(
 ) -> Dict[str, Any]:
     """Delete a place image (file and row)."""
     dbname = resolve_dbname(slot)
-    return _delete_image(dbname, "assets.place_images", "place_id", place_id, image_id)
+    return await _delete_image(
+        dbname, "assets.place_images", "place_id", place_id, image_id
+    )
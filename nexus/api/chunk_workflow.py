@@ -26,6 +26,10 @@ from pydantic import BaseModel, Field
 
 from nexus.agents.orrery.reconstruction import playable_narrative_predicate
 from nexus.api.db_pool import get_connection
+from nexus.api.post_commit_jobs import (
+    enqueue_chunk_embedding,
+    kick_post_commit_jobs_for_dbname,
+)
 
 logger = logging.getLogger("nexus.api.chunk_workflow")
 
@@ -37,52 +41,34 @@ VALID_MODEL_PATTERN = re.compile(r"^[a-zA-Z0-9._-]+$")
 
 EmbeddingScheduler = Callable[[int], Optional[str]]
 
-# BackgroundTasks are intentionally in-process for issue #206's minimum viable
-# async handoff. This guard prevents duplicate queueing inside one API worker;
-# a durable cross-process queue remains follow-up scope.
-_queued_embedding_jobs: set[tuple[str, int]] = set()
-_queued_embedding_jobs_lock = threading.Lock()
-
 
 def build_embedding_scheduler(
     workflow: "ChunkWorkflow", add_task: Callable[..., Any]
 ) -> EmbeddingScheduler:
-    """Create a scheduler that queues embedding generation in a background runner."""
+    """Create a scheduler that queues embedding in the durable post-commit outbox.
 
-    def schedule_embedding(chunk_id: int) -> Optional[str]:
-        job_key = (workflow.dbname, chunk_id)
-        with _queued_embedding_jobs_lock:
-            if job_key in _queued_embedding_jobs:
-                logger.info(
-                    "Embedding generation already queued or running for chunk %s in %s",
-                    chunk_id,
-                    workflow.dbname,
-                )
-                return None
-            _queued_embedding_jobs.add(job_key)
+    The ``chunk_embedding`` job's idempotency key dedupes across API workers
+    and restarts; ``add_task`` only wakes the slot's job runner once the
+    response has been sent.
+    """
 
-        job_id = workflow.create_embedding_job_id(chunk_id)
-        try:
-            add_task(_run_scheduled_embedding, workflow, chunk_id, job_id, job_key)
-        except Exception:
-            with _queued_embedding_jobs_lock:
-                _queued_embedding_jobs.discard(job_key)
-            raise
-        return job_id
+    def schedule_embedding(chunk_id: int) -> Optional[str]:
+        with get_connection(workflow.dbname) as conn:
+            with conn.cursor() as cur:
+                job_id = enqueue_chunk_embedding(cur, chunk_id)
+        if job_id is None:
+            logger.info(
+                "Embedding generation already queued or running for chunk %s in %s",
+                chunk_id,
+                workflow.dbname,
+            )
+            return None
+        add_task(kick_post_commit_jobs_for_dbname, workflow.dbname)
+        return workflow.create_embedding_job_id(chunk_id)
 
     return schedule_embedding
 
 
-def _run_scheduled_embedding(
-    workflow: "ChunkWorkflow", chunk_id: int, job_id: str, job_key: tuple[str, int]
-) -> None:
-    try:
-        workflow.trigger_embedding_generation(chunk_id, job_id)
-    finally:
-        with _queued_embedding_jobs_lock:
-            _queued_embedding_jobs.discard(job_key)
-
-
 class ChunkState(str, Enum):
     """States for narrative chunk lifecycle.
 
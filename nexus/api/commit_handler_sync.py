@@ -44,12 +44,9 @@ from nexus.api.choice_handling import (
     selected_text_from_choice_object,
 )
 from nexus.api.db_converters import chronology_to_db_values
-from nexus.api.summary_triggers import (
-    SummaryTask,
-    plan_summary_tasks,
-    schedule_summary_generation,
-)
+from nexus.api.summary_triggers import SummaryTask, plan_summary_tasks
 from nexus.api.lore_adapter import compute_raw_text, split_staged_orrery_payload
+from nexus.api.post_commit_jobs import enqueue_accepted_chunk_jobs
 from nexus.api.presence_reconciliation import (
     read_character_roster_from_connection,
     reconcile_declared_character_mentions,
@@ -802,6 +799,26 @@ def commit_incubator_to_database_sync(
                                 chunk_id,
                             )
 
+            # Step 9.6: post-commit outbox. Scene digests, summaries,
+            # correspondence compaction and the presence audit commit or roll
+            # back with the chunk; the slot's job runner drains them after the
+            # response.
+            from nexus.api.presence_audit import presence_audit_enabled
+            from nexus.config import load_settings
+
+            with conn.cursor() as cur:
+                enqueue_accepted_chunk_jobs(
+                    cur,
+                    chunk_id=chunk_id,
+                    parent_chunk_id=incubator.get("parent_chunk_id"),
+                    summary_tasks=summary_tasks,
+                    compact_correspondence=(
+                        incubator.get("correspondence_writer_letter") is not None
+                    ),
+                    audit_presence=presence_audit_enabled(),
+                    digest_scenes=load_settings().summaries.digest_on_commit,
+                )
+
             # Step 10: Clear incubator
             with conn.cursor() as cur:
                 cur.execute(
@@ -819,69 +836,12 @@ def commit_incubator_to_database_sync(
         conn.rollback()  # Explicit rollback on error
         raise
 
-    if summary_tasks:
-        try:
-            schedule_summary_generation(summary_tasks, slot=slot)
-        except Exception as exc:  # pragma: no cover - defensive logging
-            logger.error(
-                "Failed to schedule summaries for session %s: %s", session_id, exc
-            )
-
-    if incubator.get("correspondence_writer_letter") is not None:
-        _compact_accepted_correspondence_best_effort(
-            conn,
-            accepting_chunk_id=chunk_id,
-        )
-
-    # Post-commit presence-roster drift audit (issue #567): read-only
-    # diagnostics over the committed chunk, outside the transaction.
-    # raw_text is the committed prose (storyteller text + enacted choice);
-    # the parent chunk id enables authored-exit accounting.
-    from nexus.api.presence_audit import audit_chunk_presence, presence_audit_enabled
-
-    if presence_audit_enabled():
-        audit_chunk_presence(
-            conn,
-            chunk_id,
-            raw_text,
-            parent_chunk_id=incubator.get("parent_chunk_id"),
-        )
-
     logger.info("Successfully committed chunk %s from session %s", chunk_id, session_id)
     if warning_sink is not None:
         warning_sink.extend(experience_warnings)
     return chunk_id
 
 
-def _compact_accepted_correspondence_best_effort(
-    conn: Any,
-    *,
-    accepting_chunk_id: int,
-) -> bool:
-    """Compact after acceptance without misreporting the durable commit.
-
-    Compaction is derived from the append-only accepted correspondence journal.
-    If the provider or persistence step fails, leaving the digest absent is a
-    deterministic retry marker: the next accepted correspondence turn plans
-    compaction from the same uncompacted exchanges. The accepted narrative and
-    cleared incubator must therefore remain a successful commit.
-    """
-
-    try:
-        return compact_accepted_correspondence_sync(
-            conn,
-            accepting_chunk_id=accepting_chunk_id,
-        )
-    except Exception:
-        logger.exception(
-            "Correspondence compaction failed after chunk %s was durably "
-            "accepted; leaving the uncompacted journal intact for retry on "
-            "the next accepted correspondence turn",
-            accepting_chunk_id,
-        )
-        return False
-
-
 def compact_accepted_correspondence_sync(
     conn: Any,
     *,
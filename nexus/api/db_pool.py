@@ -2,7 +2,9 @@
 Centralized database connection pooling for NEXUS API.
 
 This module provides thread-safe connection pooling to prevent
-database connection exhaustion and improve performance.
+database connection exhaustion and improve performance, plus an asyncpg
+pool per slot for ``async def`` route handlers that must not block the
+gateway event loop.
 
 Database connections are made to slot databases (save_01 through save_05).
 The active slot is determined by the NEXUS_SLOT environment variable,
@@ -11,23 +13,33 @@ or can be explicitly passed to connection functions.
 
 from __future__ import annotations
 
+import asyncio
 import functools
+import json
 import logging
 import os
-from contextlib import contextmanager
-from typing import Optional, Dict, Any
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Optional, Dict, Any, Tuple
 
+import asyncpg  # type: ignore[import-untyped]
 import psycopg2
 from psycopg2 import pool
 from psycopg2.extras import RealDictCursor
 
 from nexus.api.slot_utils import require_slot_dbname
+from nexus.telemetry.sql_profile import sql_profile_connect_kwargs
 
 logger = logging.getLogger("nexus.api.db_pool")
 
 # Global pool instances per database
 _pools: Dict[str, pool.ThreadedConnectionPool] = {}
 
+# Async pools per database, each tagged with the event loop that created it:
+# an asyncpg pool is bound to its loop, and TestClient or asyncio.run()
+# callers each bring a fresh one. The value is the creation task so that
+# concurrent first requests share one pool instead of racing to build two.
+_async_pools: Dict[str, Tuple[asyncio.AbstractEventLoop, "asyncio.Task[Any]"]] = {}
+
 # Pool configuration
 MIN_CONNECTIONS = 1
 MAX_CONNECTIONS = 10
@@ -82,6 +94,8 @@ def _get_connection_params(dbname: Optional[str] = None) -> Dict[str, Any]:
         "connect_timeout": int(
             os.environ.get("PGCONNECT_TIMEOUT") or get_connect_timeout_seconds()
         ),
+        # Empty unless [sql_profile] is enabled; then cursors feed the profiler.
+        **sql_profile_connect_kwargs(),
     }
 
 
@@ -176,6 +190,163 @@ def get_connection(dbname: Optional[str] = None, dict_cursor: bool = False):
             conn_pool.putconn(conn)
 
 
+async def _init_async_connection(conn: asyncpg.Connection) -> None:
+    """Decode json/jsonb to Python objects, matching psycopg2's behavior."""
+    for typename in ("json", "jsonb"):
+        await conn.set_type_codec(
+            typename,
+            encoder=json.dumps,
+            decoder=json.loads,
+            schema="pg_catalog",
+        )
+
+
+async def _create_async_pool(db_key: str) -> asyncpg.Pool:
+    params = _get_connection_params(db_key)
+    conn_pool = await asyncpg.create_pool(
+        database=params["dbname"],
+        user=params["user"],
+        host=params["host"],
+        port=int(params["port"]),
+        timeout=params["connect_timeout"],
+        min_size=MIN_CONNECTIONS,
+        max_size=MAX_CONNECTIONS,
+        init=_init_async_connection,
+    )
+    logger.info("Created async connection pool for database: %s", db_key)
+    return conn_pool
+
+
+def _discard_async_pool(db_key: str) -> None:
+    """Drop an async pool without awaiting (its loop may be gone)."""
+    entry = _async_pools.pop(db_key, None)
+    if entry is None:
+        return
+    task = entry[1]
+    if task.done() and not task.cancelled() and task.exception() is None:
+        task.result().terminate()
+
+
+async def _get_async_pool(dbname: Optional[str] = None) -> asyncpg.Pool:
+    """
+    Get or create the asyncpg pool for a database on the running loop.
+
+    Args:
+        dbname: Explicit database name (save_01 through save_05).
+                If not provided, uses NEXUS_SLOT env var.
+
+    Raises:
+        ValueError: If dbname is not a valid slot database
+        RuntimeError: If no slot can be determined
+    """
+    db_key = require_slot_dbname(dbname=dbname)
+    loop = asyncio.get_running_loop()
+
+    entry = _async_pools.get(db_key)
+    if entry is not None and entry[0] is not loop:
+        _discard_async_pool(db_key)
+        entry = None
+    if entry is None:
+        entry = (loop, loop.create_task(_create_async_pool(db_key)))
+        _async_pools[db_key] = entry
+
+    try:
+        # Shielded so a cancelled request does not abort the shared creation.
+        return await asyncio.shield(entry[1])
+    except Exception as e:
+        if _async_pools.get(db_key) is entry:
+            _async_pools.pop(db_key)
+        logger.error("Failed to create async pool for %s: %s", db_key, e)
+        raise
+
+
+@asynccontextmanager
+async def get_async_connection(
+    dbname: Optional[str] = None,
+) -> AsyncIterator[asyncpg.Connection]:
+    """
+    Get an asyncpg connection from the slot's async pool.
+
+    The connection runs inside a transaction that commits when the block
+    exits cleanly and rolls back on any exception, like
+    :func:`get_connection`. Queries use ``$1``-style placeholders and rows
+    are ``asyncpg.Record`` objects; json/jsonb columns decode to Python
+    objects.
+
+    Args:
+        dbname: Database name (save_01 through save_05).
+                If not provided, uses NEXUS_SLOT env var.
+
+    Raises:
+        ValueError: If dbname is not a valid slot database
+        RuntimeError: If no slot can be determined (NEXUS_SLOT not set)
+
+    Example:
+        async with get_async_connection("save_01") as conn:
+            rows = await conn.fetch("SELECT id, name FROM places")
+    """
+    conn_pool = await _get_async_pool(dbname)
+    async with conn_pool.acquire() as conn:
+        try:
+            async with conn.transaction():
+                yield conn
+        except asyncpg.PostgresError as e:
+            logger.error("Database operation failed: %s", e)
+            raise
+
+
+async def close_all_async_pools() -> None:
+    """Gracefully close every async pool; call on gateway shutdown."""
+    loop = asyncio.get_running_loop()
+    for db_key, (pool_loop, task) in list(_async_pools.items()):
+        if pool_loop is not loop or not task.done():
+            _discard_async_pool(db_key)
+            continue
+        _async_pools.pop(db_key)
+        if task.cancelled() or task.exception() is not None:
+            continue
+        try:
+            await task.result().close()
+            logger.info("Closed async connection pool for database: %s", db_key)
+        except Exception as e:
+            logger.error("Error closing async pool for %s: %s", db_key, e)
+
+
+def pool_stats() -> Dict[str, Dict[str, int]]:
+    """Snapshot connection use for every open pool, keyed by database.
+
+    ``sync_in_use``/``sync_open`` describe the psycopg2 pool and
+    ``async_in_use``/``async_open`` the asyncpg pool (zero until one has
+    been created on some loop); ``max`` is the per-pool ceiling. Reads only
+    counters, so load tools may sample it from another thread.
+    """
+    stats: Dict[str, Dict[str, int]] = {}
+    for db_key in sorted(set(_pools) | set(_async_pools)):
+        entry = {
+            "sync_in_use": 0,
+            "sync_open": 0,
+            "async_in_use": 0,
+            "async_open": 0,
+            "max": MAX_CONNECTIONS,
+        }
+        conn_pool = _pools.get(db_key)
+        if conn_pool is not None and not conn_pool.closed:
+            in_use = len(conn_pool._used)
+            entry["sync_in_use"] = in_use
+            entry["sync_open"] = in_use + len(conn_pool._pool)
+        async_entry = _async_pools.get(db_key)
+        if async_entry is not None:
+            task = async_entry[1]
+            if task.done() and not task.cancelled() and task.exception() is None:
+                async_pool = task.result()
+                entry["async_open"] = async_pool.get_size()
+                entry["async_in_use"] = (
+                    async_pool.get_size() - async_pool.get_idle_size()
+                )
+        stats[db_key] = entry
+    return stats
+
+
 def close_all_pools():
     """Close all connection pools and reset cached connection config.
 
@@ -192,6 +363,8 @@ def close_all_pools():
             logger.error("Error closing pool for %s: %s", db_key, e)
 
     _pools.clear()
+    for db_key in list(_async_pools):
+        _discard_async_pool(db_key)
     get_connect_timeout_seconds.cache_clear()
 
 
@@ -204,6 +377,7 @@ def close_pool(dbname: Optional[str] = None) -> None:
                 If not provided, uses NEXUS_SLOT env var.
     """
     db_key = require_slot_dbname(dbname=dbname)
+    _discard_async_pool(db_key)
     conn_pool = _pools.pop(db_key, None)
     if not conn_pool:
         return
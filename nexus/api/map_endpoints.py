@@ -0,0 +1,188 @@
+"""Viewport-bounded map reads: vector tiles and bbox place markers.
+
+``GET /api/places`` ships every place with full prose fields and GeoJSON,
+so its cost grows with the world as Retrograde and maturation add places
+and stubs. The routes here return only what is inside the viewport:
+
+* ``/api/map/tiles/{z}/{x}/{y}`` - a Mapbox vector tile (``ST_AsMVT``) with
+  a ``places`` layer carrying ``id``, ``name`` and ``type``.
+* ``/api/map/places?bbox=minLng,minLat,maxLng,maxLat`` - the same light
+  fields as JSON with GeoJSON geometry, for list/sidebar rendering.
+
+Detail fields stay lazy: the client fetches ``/api/places/{id}`` when a
+place is opened. Both routes filter on ``coordinates::geometry``, which
+migration 115 indexes; the first request per slot checks for that index
+and logs a warning if it is missing. Tiles carry the places feed ETag from
+``nexus.api.reader_revisions`` so unchanged tiles revalidate with 304.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from nexus.api.db_pool import get_async_connection
+from nexus.api.reader_endpoints import resolve_dbname
+from nexus.api.reader_revisions import (
+    REVISION_HEADER,
+    etag_matches,
+    probe_feed_revision,
+)
+
+logger = logging.getLogger("nexus.api.map_endpoints")
+
+router = APIRouter(prefix="/api/map", tags=["map"])
+
+MVT_MEDIA_TYPE = "application/vnd.mapbox-vector-tile"
+MAX_TILE_ZOOM = 22
+TILE_EXTENT = 4096
+TILE_BUFFER = 64
+
+SPATIAL_INDEX = "ix_places_coordinates_geometry"
+
+# Slots whose spatial index has been checked in this process.
+_index_checked: Set[str] = set()
+
+_TILE_SQL = f"""
+    WITH bounds AS (
+        SELECT ST_TileEnvelope($1, $2, $3) AS tile
+    ),
+    features AS (
+        SELECT
+            p.id,
+            p.name,
+            p.type::text AS type,
+            ST_AsMVTGeom(
+                ST_Transform(p.coordinates::geometry, 3857),
+                bounds.tile,
+                {TILE_EXTENT},
+                {TILE_BUFFER},
+                true
+            ) AS geom
+        FROM places p, bounds
+        WHERE p.coordinates IS NOT NULL
+          AND p.coordinates::geometry && ST_Transform(bounds.tile, 4326)
+    )
+    SELECT ST_AsMVT(features, 'places', {TILE_EXTENT}, 'geom', 'id')
+    FROM features
+    WHERE geom IS NOT NULL
+"""
+
+_BBOX_SQL = """
+    SELECT id, name, type::text AS type,
+           ST_AsGeoJSON(coordinates)::json AS geometry
+    FROM places
+    WHERE coordinates IS NOT NULL
+      AND ({envelopes})
+    ORDER BY id
+"""
+
+
+def parse_bbox(bbox: str) -> List[Tuple[float, float, float, float]]:
+    """Parse ``minLng,minLat,maxLng,maxLat`` into one or two envelopes.
+
+    A viewport crossing the antimeridian (``minLng > maxLng``) is split in
+    two so each envelope stays planar. Malformed boxes are a 400.
+    """
+    try:
+        min_lng, min_lat, max_lng, max_lat = (float(part) for part in bbox.split(","))
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail="bbox must be minLng,minLat,maxLng,maxLat",
+        )
+    if not (
+        -180 <= min_lng <= 180
+        and -180 <= max_lng <= 180
+        and -90 <= min_lat <= max_lat <= 90
+    ):
+        raise HTTPException(status_code=400, detail=f"bbox out of range: {bbox}")
+    if min_lng > max_lng:
+        return [(min_lng, min_lat, 180.0, max_lat), (-180.0, min_lat, max_lng, max_lat)]
+    return [(min_lng, min_lat, max_lng, max_lat)]
+
+
+def _validate_tile(z: int, x: int, y: int) -> None:
+    if not 0 <= z <= MAX_TILE_ZOOM:
+        raise HTTPException(
+            status_code=400, detail=f"Zoom must be between 0 and {MAX_TILE_ZOOM}"
+        )
+    limit = 1 << z
+    if not (0 <= x < limit and 0 <= y < limit):
+        raise HTTPException(
+            status_code=400, detail=f"Tile {z}/{x}/{y} is outside the tile grid"
+        )
+
+
+async def _check_spatial_index(conn: Any, dbname: str) -> None:
+    """Warn once per slot when the viewport index is missing."""
+    if dbname in _index_checked:
+        return
+    _index_checked.add(dbname)
+    if await conn.fetchval("SELECT to_regclass($1)", SPATIAL_INDEX) is None:
+        logger.warning(
+            "%s has no %s; map viewport queries will scan every place "
+            "(apply migration 115 with scripts/migrate.py)",
+            dbname,
+            SPATIAL_INDEX,
+        )
+
+
+@router.get("/tiles/{z}/{x}/{y}")
+async def get_map_tile(
+    request: Request, z: int, x: int, y: int, slot: Optional[int] = None
+) -> Response:
+    """Places inside one Web Mercator tile, encoded as a vector tile."""
+    _validate_tile(z, x, y)
+    dbname = resolve_dbname(slot)
+
+    headers: Dict[str, str] = {}
+    revision = await probe_feed_revision(dbname, "places")
+    if revision is not None:
+        headers = {
+            "ETag": revision.etag,
+            REVISION_HEADER: revision.token,
+            "Cache-Control": "no-cache",
+        }
+        if etag_matches(request.headers.get("if-none-match"), revision.etag):
+            return Response(status_code=304, headers=headers)
+
+    async with get_async_connection(dbname) as conn:
+        await _check_spatial_index(conn, dbname)
+        tile = await conn.fetchval(_TILE_SQL, z, x, y)
+    return Response(
+        content=bytes(tile or b""), media_type=MVT_MEDIA_TYPE, headers=headers
+    )
+
+
+@router.get("/places")
+async def get_map_places(bbox: str, slot: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Light place markers (id, name, type, geometry) inside a viewport."""
+    envelopes = parse_bbox(bbox)
+    dbname = resolve_dbname(slot)
+
+    params: List[float] = []
+    clauses = []
+    for envelope in envelopes:
+        start = len(params)
+        params.extend(envelope)
+        clauses.append(
+            "coordinates::geometry && ST_MakeEnvelope("
+            f"${start + 1}, ${start + 2}, ${start + 3}, ${start + 4}, 4326)"
+        )
+    async with get_async_connection(dbname) as conn:
+        await _check_spatial_index(conn, dbname)
+        rows = await conn.fetch(
+            _BBOX_SQL.format(envelopes=" OR ".join(clauses)), *params
+        )
+    return [
+        {
+            "id": row["id"],
+            "name": row["name"],
+            "type": row["type"],
+            "geometry": row["geometry"],
+        }
+        for row in rows
+    ]
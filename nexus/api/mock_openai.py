@@ -1,7 +1,9 @@
 """
 Mock OpenAI server for TEST model.
 
-Impersonates OpenAI API at /v1/chat/completions and /v1/responses.
+Impersonates OpenAI API at /v1/chat/completions and /v1/responses, plus the
+/v1/files and /v1/batches endpoints (batches answer each line with the
+/v1/responses mock and complete immediately).
 Queries mock database for test data - no inline caching.
 
 The mock database mirrors save_* schemas and contains:
@@ -13,16 +15,21 @@ Usage:
     poetry run uvicorn nexus.api.mock_openai:app --port 5102
 """
 
+import asyncio
 import json
 import logging
+import random
 import re
+import threading
+import time
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Awaitable, Callable, Dict, List, Optional, cast
 
 import psycopg2
-from fastapi import FastAPI
+from fastapi import FastAPI, File, Form, HTTPException, Request, Response, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from psycopg2.extras import RealDictCursor
 from pydantic import BaseModel
 
@@ -60,6 +67,165 @@ app.add_middleware(
 )
 
 
+class MockQuota:
+    """Provider-style quota and latency for /v1 requests (simulations only).
+
+    Requests and tokens (prompt bytes / 4 plus the output cap, OpenAI's own
+    estimate) are metered through buckets holding ``window_seconds`` of the
+    per-minute quota. Over-quota requests get a 429 with ``retry-after-ms``;
+    every response carries ``x-ratelimit-limit/remaining-*`` headers. With
+    neither quota set, only the latency applies.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        *,
+        window_seconds: float = 1.0,
+        latency_seconds: float = 0.0,
+        latency_jitter_seconds: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.window_seconds = window_seconds
+        self.latency_seconds = latency_seconds
+        self.latency_jitter_seconds = latency_jitter_seconds
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._updated = time.monotonic()
+        self._requests = self._capacity(requests_per_minute)
+        self._tokens = self._capacity(tokens_per_minute)
+        self.accepted = 0
+        self.rejected = 0
+
+    def _capacity(self, per_minute: Optional[float]) -> float:
+        return (per_minute or 0.0) * self.window_seconds / 60.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        if self.requests_per_minute:
+            self._requests = min(
+                self._capacity(self.requests_per_minute),
+                self._requests + elapsed * self.requests_per_minute / 60.0,
+            )
+        if self.tokens_per_minute:
+            self._tokens = min(
+                self._capacity(self.tokens_per_minute),
+                self._tokens + elapsed * self.tokens_per_minute / 60.0,
+            )
+
+    def admit(self, tokens: int) -> tuple[Optional[float], Dict[str, str]]:
+        """Charge one request; return (retry-after seconds or None, headers)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            waits = [0.0]
+            if self.requests_per_minute:
+                waits.append((1 - self._requests) * 60.0 / self.requests_per_minute)
+            if self.tokens_per_minute:
+                needed = min(tokens, self._capacity(self.tokens_per_minute))
+                waits.append((needed - self._tokens) * 60.0 / self.tokens_per_minute)
+            retry_after = max(waits)
+            if retry_after > 0:
+                self.rejected += 1
+            else:
+                retry_after = None
+                self.accepted += 1
+                self._requests -= 1
+                self._tokens -= tokens
+            headers: Dict[str, str] = {}
+            if self.requests_per_minute:
+                headers["x-ratelimit-limit-requests"] = str(
+                    int(self.requests_per_minute)
+                )
+                headers["x-ratelimit-remaining-requests"] = str(
+                    max(0, int(self._requests))
+                )
+            if self.tokens_per_minute:
+                headers["x-ratelimit-limit-tokens"] = str(int(self.tokens_per_minute))
+                headers["x-ratelimit-remaining-tokens"] = str(max(0, int(self._tokens)))
+            return retry_after, headers
+
+    def latency(self) -> float:
+        with self._lock:
+            jitter = self._random.uniform(0.0, self.latency_jitter_seconds)
+        return self.latency_seconds + jitter
+
+
+_mock_quota: Optional[MockQuota] = None
+
+
+def configure_mock_quota(quota: Optional[MockQuota]) -> None:
+    """Install (or with None, remove) the quota applied to /v1 requests."""
+    global _mock_quota
+    _mock_quota = quota
+
+
+_mock_narrative_words = 0
+_NARRATIVE_FILLER = (
+    "The mock scene lingers on rain, neon, and the small sounds of the city "
+    "while the deterministic narrator keeps time."
+).split()
+
+
+def configure_mock_narrative_words(words: int) -> None:
+    """Pad TEST narrative prose to ``words`` words (0 keeps the fixture text)."""
+    global _mock_narrative_words
+    _mock_narrative_words = max(0, words)
+
+
+def _padded_narrative(text: str) -> str:
+    missing = _mock_narrative_words - len(text.split())
+    if missing <= 0:
+        return text
+    filler = (_NARRATIVE_FILLER * (missing // len(_NARRATIVE_FILLER) + 1))[:missing]
+    return f"{text} {' '.join(filler)}"
+
+
+@app.middleware("http")
+async def apply_mock_quota(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    quota = _mock_quota
+    if quota is None or not request.url.path.startswith("/v1/"):
+        return await call_next(request)
+    body = await request.body()
+    output_cap = 0
+    try:
+        payload = json.loads(body) if body else {}
+    except ValueError:
+        payload = {}
+    if isinstance(payload, dict):
+        output_cap = next(
+            (
+                payload[name]
+                for name in ("max_output_tokens", "max_completion_tokens", "max_tokens")
+                if isinstance(payload.get(name), int)
+            ),
+            0,
+        )
+    retry_after, headers = quota.admit(len(body) // 4 + output_cap)
+    if retry_after is not None:
+        headers["retry-after-ms"] = str(int(retry_after * 1000) + 1)
+        return JSONResponse(
+            status_code=429,
+            content={
+                "error": {
+                    "message": "Mock rate limit reached",
+                    "type": "requests",
+                    "code": "rate_limit_exceeded",
+                }
+            },
+            headers=headers,
+        )
+    await asyncio.sleep(quota.latency())
+    response = await call_next(request)
+    response.headers.update(headers)
+    return response
+
+
 def get_mock_connection() -> psycopg2.extensions.connection:
     """Get connection to mock database."""
     settings = load_settings()
@@ -962,7 +1128,7 @@ def _mock_storyteller_response(prompt: str) -> Dict[str, Any]:
 
     adjudications = _mock_orrery_adjudications(prompt)
     response: Dict[str, Any] = {
-        "narrative": (
+        "narrative": _padded_narrative(
             "[TEST MODE] The scene advances under deterministic mock control. "
             "Orrery pressure is acknowledged structurally, while the prose remains "
             "simple enough for integration tests to inspect."
@@ -1215,6 +1381,154 @@ async def responses_create(request: ResponsesRequest):
     }
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# Batch API (files + batches) for scripts/llm_batch.py
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_MOCK_FILES: Dict[str, Dict[str, Any]] = {}
+_MOCK_BATCHES: Dict[str, Dict[str, Any]] = {}
+
+
+def _file_object(file_id: str) -> Dict[str, Any]:
+    stored = _MOCK_FILES[file_id]
+    return {
+        "id": file_id,
+        "object": "file",
+        "bytes": len(stored["content"]),
+        "created_at": stored["created_at"],
+        "filename": stored["filename"],
+        "purpose": stored["purpose"],
+        "status": "processed",
+    }
+
+
+def _store_mock_file(content: bytes, filename: str, purpose: str) -> str:
+    file_id = f"file-mock-{uuid.uuid4().hex[:12]}"
+    _MOCK_FILES[file_id] = {
+        "content": content,
+        "filename": filename,
+        "purpose": purpose,
+        "created_at": int(time.time()),
+    }
+    return file_id
+
+
+class BatchCreateRequest(BaseModel):
+    """Request format for /v1/batches."""
+
+    input_file_id: str
+    endpoint: str
+    completion_window: str = "24h"
+    metadata: Optional[Dict[str, Any]] = None
+
+
+@app.post("/v1/files")
+async def files_create(file: UploadFile = File(...), purpose: str = Form(...)):
+    """Store an uploaded batch input file in memory."""
+    file_id = _store_mock_file(await file.read(), file.filename or "upload", purpose)
+    return _file_object(file_id)
+
+
+@app.get("/v1/files/{file_id}/content")
+async def files_content(file_id: str):
+    """Return a stored file's bytes (batch output files included)."""
+    if file_id not in _MOCK_FILES:
+        raise HTTPException(status_code=404, detail=f"No such file: {file_id}")
+    return Response(
+        content=_MOCK_FILES[file_id]["content"], media_type="application/jsonl"
+    )
+
+
+async def _run_batch_line(line: Dict[str, Any]) -> Dict[str, Any]:
+    """Answer one batch input line with the /v1/responses mock."""
+    custom_id = line.get("custom_id")
+    result: Dict[str, Any] = {
+        "id": f"batch-req-mock-{uuid.uuid4().hex[:8]}",
+        "custom_id": custom_id,
+        "response": None,
+        "error": None,
+    }
+    url = line.get("url")
+    if url != "/v1/responses":
+        result["error"] = {
+            "code": "invalid_url",
+            "message": f"Mock batches only support /v1/responses, not {url}",
+        }
+        return result
+    try:
+        body = await responses_create(ResponsesRequest(**(line.get("body") or {})))
+    except Exception as exc:  # validation errors become per-line failures
+        result["response"] = {
+            "status_code": 400,
+            "request_id": uuid.uuid4().hex,
+            "body": {"error": {"message": str(exc), "type": "invalid_request_error"}},
+        }
+        return result
+    result["response"] = {
+        "status_code": 200,
+        "request_id": uuid.uuid4().hex,
+        "body": body,
+    }
+    return result
+
+
+@app.post("/v1/batches")
+async def batches_create(request: BatchCreateRequest):
+    """Run a batch synchronously; it is already completed when returned."""
+    if request.input_file_id not in _MOCK_FILES:
+        raise HTTPException(
+            status_code=404, detail=f"No such file: {request.input_file_id}"
+        )
+    raw = _MOCK_FILES[request.input_file_id]["content"].decode("utf-8")
+    outputs = [
+        await _run_batch_line(json.loads(line))
+        for line in raw.splitlines()
+        if line.strip()
+    ]
+    failed = sum(
+        1
+        for out in outputs
+        if out["error"] or (out["response"] or {}).get("status_code") != 200
+    )
+    output_file_id = _store_mock_file(
+        "".join(json.dumps(out) + "\n" for out in outputs).encode("utf-8"),
+        "batch_output.jsonl",
+        "batch_output",
+    )
+    now = int(time.time())
+    batch_id = f"batch_mock_{uuid.uuid4().hex[:12]}"
+    _MOCK_BATCHES[batch_id] = {
+        "id": batch_id,
+        "object": "batch",
+        "endpoint": request.endpoint,
+        "errors": None,
+        "input_file_id": request.input_file_id,
+        "completion_window": request.completion_window,
+        "status": "completed",
+        "output_file_id": output_file_id,
+        "error_file_id": None,
+        "created_at": now,
+        "in_progress_at": now,
+        "completed_at": now,
+        "request_counts": {
+            "total": len(outputs),
+            "completed": len(outputs) - failed,
+            "failed": failed,
+        },
+        "metadata": request.metadata,
+    }
+    logger.info("[MOCK] Batch %s answered %d lines", batch_id, len(outputs))
+    return _MOCK_BATCHES[batch_id]
+
+
+@app.get("/v1/batches/{batch_id}")
+async def batches_retrieve(batch_id: str):
+    """Return a batch created by batches_create."""
+    if batch_id not in _MOCK_BATCHES:
+        raise HTTPException(status_code=404, detail=f"No such batch: {batch_id}")
+    return _MOCK_BATCHES[batch_id]
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -8,6 +8,7 @@ import json
 import logging
 import os
 import threading
+import time
 import uuid
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Literal
@@ -45,7 +46,6 @@ from nexus.api.choice_handling import (
     validate_choice_index,
 )
 from nexus.api.chunk_workflow import (
-    ChunkWorkflow,
     ChunkAcceptRequest,
     ChunkRejectRequest,
     EditPreviousRequest,
@@ -53,6 +53,11 @@ from nexus.api.chunk_workflow import (
     get_default_workflow,
 )
 from nexus.api.conversations import ConversationsClient
+from nexus.api.post_commit_jobs import (
+    enqueue_chunk_embedding,
+    kick_post_commit_jobs,
+    kick_post_commit_jobs_for_dbname,
+)
 from nexus.api.new_story_flow import (
     start_setup,
     resume_setup,
@@ -61,7 +66,8 @@ from nexus.api.new_story_flow import (
     activate_slot,
 )
 from nexus.api.slot_utils import all_slots, slot_dbname, require_slot_dbname
-from nexus.api.db_pool import get_connection
+from nexus.api.db_pool import close_all_async_pools, get_connection
+from nexus.api.rate_governor import aclose_governed_http_clients
 from nexus.api.narrative_generation import (
     generate_narrative_async,
     get_chunk_info,
@@ -81,6 +87,7 @@ from nexus.api.config_utils import (
 from nexus.api.asset_endpoints import router as asset_router
 from nexus.api.reader_endpoints import router as reader_router
 from nexus.api.local_models_endpoints import router as local_models_router
+from nexus.api.map_endpoints import router as map_router
 from nexus.api.secrets_endpoints import router as secrets_router
 from nexus.api.settings_endpoints import router as settings_router
 from nexus.api.slot_endpoints import router as slot_router
@@ -89,6 +96,10 @@ from nexus.api.runtime_status import register_runtime_status
 from nexus.api.static_ui import mount_ui
 from nexus.api.wizard_chat import router as wizard_chat_router
 from nexus.config import get_gateway_cors_allowed_origins
+from nexus.telemetry.sql_profile import (
+    recorded_sql_profile,
+    sql_profile_connect_kwargs,
+)
 
 logger = logging.getLogger("nexus.api.narrative")
 
@@ -132,9 +143,40 @@ app.include_router(setup_router)
 app.include_router(wizard_chat_router)
 app.include_router(reader_router)
 app.include_router(asset_router)
+app.include_router(map_router)
 app.include_router(local_models_router)
 
 
+@app.on_event("shutdown")
+async def _close_async_db_pools() -> None:
+    """Release the per-slot async pools behind the reader and asset routes."""
+    await close_all_async_pools()
+
+
+@app.on_event("shutdown")
+async def _close_governed_http_clients() -> None:
+    """Close the shared rate-governed clients behind pydantic-ai and OpenAI."""
+    await aclose_governed_http_clients()
+
+
+@app.on_event("shutdown")
+def _dispose_summary_db_managers() -> None:
+    """Dispose the engines the summary workers kept per slot database."""
+    from nexus.api.summary_triggers import dispose_db_managers
+
+    dispose_db_managers()
+
+
+@app.on_event("startup")
+def _resume_post_commit_jobs() -> None:
+    """Resume the active slot's post-commit jobs left by a previous process.
+
+    Other slots resume on their next accepted chunk.
+    """
+    if os.environ.get("NEXUS_SLOT"):
+        kick_post_commit_jobs(None)
+
+
 def _include_orrery_dev_router(target_app: FastAPI, settings: Any = None) -> None:
     """Register the audit-dashboard router iff [orrery.dashboard] enabled.
 
@@ -187,6 +229,10 @@ class ConnectionManager:
     def __init__(self):
         self.active_connections: List[WebSocket] = []
         self.session_progress: Dict[str, Dict] = {}
+        # Fan-out cost counters, read by scripts/load_test_turns.py.
+        self.broadcasts = 0
+        self.messages_sent = 0
+        self.broadcast_seconds = 0.0
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
@@ -199,8 +245,16 @@ class ConnectionManager:
         await websocket.send_text(message)
 
     async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            await connection.send_text(message)
+        started = time.perf_counter()
+        sent = 0
+        try:
+            for connection in self.active_connections:
+                await connection.send_text(message)
+                sent += 1
+        finally:
+            self.broadcasts += 1
+            self.messages_sent += sent
+            self.broadcast_seconds += time.perf_counter() - started
 
     async def send_progress(self, session_id: str, status: str, data: Dict = None):
         """Send progress update for a specific session"""
@@ -241,6 +295,7 @@ def get_db_connection(slot: Optional[int] = None):
         database=dbname,
         user=os.environ.get("PGUSER", "pythagor"),
         port=os.environ.get("PGPORT", "5432"),
+        **sql_profile_connect_kwargs(),
     )
 
 
@@ -509,7 +564,7 @@ def _trigger_locked_chunk_embedding(
     *, slot: Optional[int], parent_chunk_id: int
 ) -> None:
     """
-    Embed every locked chunk older than parent_chunk_id.
+    Queue embedding for every locked chunk older than parent_chunk_id.
 
     Continuing from chunk N creates a provisional successor, leaving chunk N
     undoable while every committed chunk before it is locked and must be
@@ -519,7 +574,9 @@ def _trigger_locked_chunk_embedding(
     therefore silently skipped playable chunks across those gaps.
     This catch-up form embeds every unembedded locked chunk except the
     intentionally unembedded Retrograde prologue anchor, healing any
-    previously skipped chunk on the next turn.
+    previously skipped chunk on the next turn. Each chunk becomes a durable
+    ``chunk_embedding`` job for the slot's post-commit runner, so a restart
+    mid-embedding resumes instead of waiting for the next catch-up.
     """
     if parent_chunk_id <= 1:
         return
@@ -556,6 +613,11 @@ def _trigger_locked_chunk_embedding(
                     (parent_chunk_id, json.dumps([RETROGRADE_PROLOGUE_MARKER])),
                 )
                 locked_chunk_ids = [row["id"] for row in cur.fetchall()]
+                queued = [
+                    locked_chunk_id
+                    for locked_chunk_id in locked_chunk_ids
+                    if enqueue_chunk_embedding(cur, locked_chunk_id) is not None
+                ]
 
         if not locked_chunk_ids:
             logger.info(
@@ -565,26 +627,16 @@ def _trigger_locked_chunk_embedding(
             )
             return
 
-        workflow = ChunkWorkflow(dbname)
-        for locked_chunk_id in locked_chunk_ids:
-            job_id = workflow.trigger_embedding_generation(locked_chunk_id)
-            if job_id:
-                logger.info(
-                    "Generated embeddings for locked chunk %s in %s (%s)",
-                    locked_chunk_id,
-                    dbname,
-                    job_id,
-                )
-            else:
-                logger.warning(
-                    "Embedding generation did not complete for locked chunk %s "
-                    "in %s",
-                    locked_chunk_id,
-                    dbname,
-                )
+        logger.info(
+            "Queued embedding for locked chunks %s in %s (%s already queued)",
+            queued,
+            dbname,
+            len(locked_chunk_ids) - len(queued),
+        )
+        kick_post_commit_jobs_for_dbname(dbname)
     except Exception as exc:
         logger.error(
-            "Error embedding locked chunks before %s for slot %s: %s",
+            "Error queueing locked chunk embedding before %s for slot %s: %s",
             parent_chunk_id,
             slot,
             exc,
@@ -702,17 +754,18 @@ def _resolve_and_approve_pending_sync(
             connection=conn,
             incubator_session_id=session_id,
         )
-        if warning_sink is None:
-            approved_chunk_id = commit_incubator_to_database_sync(
-                conn, session_id, slot
-            )
-        else:
-            approved_chunk_id = commit_incubator_to_database_sync(
-                conn,
-                session_id,
-                slot,
-                warning_sink=warning_sink,
-            )
+        with recorded_sql_profile("commit", slot=slot):
+            if warning_sink is None:
+                approved_chunk_id = commit_incubator_to_database_sync(
+                    conn, session_id, slot
+                )
+            else:
+                approved_chunk_id = commit_incubator_to_database_sync(
+                    conn,
+                    session_id,
+                    slot,
+                    warning_sink=warning_sink,
+                )
     except HTTPException:
         conn.rollback()
         raise
@@ -1256,9 +1309,11 @@ def _start_post_commit_orrery_work(
 
     The quick outbox drain is deliberately non-daemon so graceful server
     shutdown cannot strand it. ``_run_post_commit_orrery_work`` detaches only
-    the potentially multi-minute maturation drain.
+    the potentially multi-minute maturation drain. The commit's post-commit
+    jobs (summaries, audit, compaction) go to the slot's job runner.
     """
 
+    kick_post_commit_jobs(slot)
     try:
         thread = threading.Thread(
             target=_run_post_commit_orrery_work_safely,
@@ -1303,12 +1358,13 @@ def _approve_narrative_sync(
 
             try:
                 commit_warnings: List[Dict[str, Any]] = []
-                chunk_id = commit_incubator_to_database_sync(
-                    conn,
-                    session_id,
-                    slot,
-                    warning_sink=commit_warnings,
-                )
+                with recorded_sql_profile("commit", slot=slot):
+                    chunk_id = commit_incubator_to_database_sync(
+                        conn,
+                        session_id,
+                        slot,
+                        warning_sink=commit_warnings,
+                    )
                 result = {
                     "status": "committed",
                     "message": f"Narrative committed as chunk {chunk_id}",
@@ -102,6 +102,13 @@ def resolve_setup_model(
     return wizard_default_model
 
 
+def _keep_spare_slot() -> bool:
+    """Whether slot provisioning should use and refill the pre-cloned spare."""
+    from nexus.config import load_settings
+
+    return load_settings().wizard.keep_spare_slot
+
+
 def start_setup(slot_number: int, model: Optional[str] = None) -> str:
     """
     Start a new setup conversation for a slot.
@@ -129,7 +136,9 @@ def start_setup(slot_number: int, model: Optional[str] = None) -> str:
         logger.info("Database %s does not exist. Creating...", dbname)
         # NEXUS_template is the schema template database (empty tables, latest schema).
         # New slot databases are created by cloning this template's structure.
-        create_slot_schema_only(slot_number, source_db="NEXUS_template")
+        create_slot_schema_only(
+            slot_number, source_db="NEXUS_template", keep_spare=_keep_spare_slot()
+        )
 
     if model:
         # Preserve the explicit-override path without requiring config or a
@@ -462,7 +471,12 @@ def reset_setup(slot_number: int) -> None:
     close_pool(dbname)
 
     # Drop and recreate from template - handles all tables automatically
-    create_slot_schema_only(slot_number, source_db="NEXUS_template", force=True)
+    create_slot_schema_only(
+        slot_number,
+        source_db="NEXUS_template",
+        force=True,
+        keep_spare=_keep_spare_slot(),
+    )
 
     # Mark slot as inactive after reset
     upsert_slot(slot_number, is_active=False, dbname=dbname)
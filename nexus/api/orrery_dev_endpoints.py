@@ -23,11 +23,11 @@ from sqlalchemy.orm import Session
 
 from nexus.agents.orrery.audit import (
     CognitionTraceInputError,
-    build_catalog,
     cognition_trace,
     entity_context,
     explain_dry_run,
 )
+from nexus.agents.orrery.cognition import resident_catalog
 from nexus.agents.orrery.coverage import analyze_coverage, sample_anchor_ids
 from nexus.agents.orrery.history import adjudication_history
 from nexus.agents.orrery.overrides import (
@@ -424,7 +424,7 @@ async def get_catalog() -> dict[str, Any]:
     """Static template catalog: bands, pseudo-templates, families, event map."""
 
     orrery = _orrery_settings()
-    return build_catalog(
+    return resident_catalog(
         BUILTIN_TEMPLATES,
         sunhelm_settings=orrery.get("sunhelm"),
         promote_settings=orrery.get("promote"),
@@ -0,0 +1,805 @@
+"""Durable post-commit outbox and per-slot job runner.
+
+Accepting a chunk used to finish with a tail of follow-up work: summaries on
+an in-process thread pool, the presence audit and correspondence compaction
+inline on the request connection, and chunk embedding through FastAPI
+background tasks guarded by an in-memory set. The inline steps added to
+accept latency and a gateway restart silently dropped whatever was queued.
+
+Follow-ups are now rows in ``post_commit_jobs`` (migrations 118, 119). The sync
+commit transaction writes them with :func:`enqueue_accepted_chunk_jobs`, so
+they exist exactly when the chunk does, and accept latency is commit time.
+:func:`kick_post_commit_jobs` wakes the slot's :class:`SlotJobRunner`, which
+leases due rows (``FOR UPDATE SKIP LOCKED``), runs them through the typed
+:data:`HANDLERS` on a bounded pool with a per-kind concurrency cap, and
+requeues failures with exponential backoff until the handler's attempt cap.
+Each lease carries a nonce; completion writes present it, so a runner that
+outlives its lease cannot overwrite the next runner's result. A process that
+dies mid-job leaves an expired lease that the next drain picks up.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import threading
+import uuid
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence
+
+import psycopg2
+from psycopg2.extras import RealDictCursor
+
+logger = logging.getLogger("nexus.api.post_commit_jobs")
+
+JOB_STATES = ("queued", "leased", "succeeded", "failed")
+MAX_WORKERS = 3
+LEASE_SECONDS = 15 * 60
+MAX_BACKOFF_SECONDS = 60 * 60
+# Runners re-check at least this often while a foreign lease is outstanding.
+MIN_RESCHEDULE_SECONDS = 1.0
+# A drain that raised (database down, lease query failed) is retried after
+# this delay, doubling per consecutive failure up to MAX_BACKOFF_SECONDS.
+DRAIN_RETRY_SECONDS = 5.0
+# Set to "0" to leave jobs in the outbox instead of starting runner threads
+# (unit tests; processes that must not touch slot databases).
+RUNNER_ENV = "NEXUS_POST_COMMIT_RUNNER"
+
+Connect = Callable[[], Any]
+
+
+@dataclass(frozen=True)
+class PostCommitJob:
+    """One leased outbox row. ``attempts`` counts the current lease."""
+
+    id: int
+    kind: str
+    idempotency_key: str
+    chunk_id: int
+    payload: Mapping[str, Any]
+    attempts: int
+    lease_nonce: str
+
+
+@dataclass(frozen=True)
+class JobContext:
+    """Slot a handler runs against and a factory for its own connections."""
+
+    dbname: str
+    slot: Optional[int]
+    connect: Connect
+
+
+@dataclass(frozen=True)
+class JobHandler:
+    """Typed handler for one job kind plus its retry and concurrency policy."""
+
+    run: Callable[[PostCommitJob, JobContext], None]
+    max_attempts: int
+    backoff_seconds: int
+    concurrency: int = 1
+
+    def retry_delay(self, attempts: int) -> int:
+        """Seconds before the job is leasable again after failed lease N."""
+        return min(
+            self.backoff_seconds * 2 ** max(attempts - 1, 0), MAX_BACKOFF_SECONDS
+        )
+
+
+@dataclass
+class DrainResult:
+    """Outcome counts of one drain and when the outbox next needs a runner."""
+
+    succeeded: int = 0
+    retried: int = 0
+    failed: int = 0
+    lost_leases: int = 0
+    next_due_seconds: Optional[float] = None
+    by_kind: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    def record(self, kind: str, outcome: str) -> None:
+        setattr(self, outcome, getattr(self, outcome) + 1)
+        counts = self.by_kind.setdefault(kind, {})
+        counts[outcome] = counts.get(outcome, 0) + 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "succeeded": self.succeeded,
+            "retried": self.retried,
+            "failed": self.failed,
+            "lost_leases": self.lost_leases,
+            "next_due_seconds": self.next_due_seconds,
+            "by_kind": self.by_kind,
+        }
+
+
+# ============================================================================
+# Handlers
+# ============================================================================
+
+
+@contextmanager
+def _connection(ctx: JobContext) -> Iterator[Any]:
+    conn = ctx.connect()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def _chunk_column(ctx: JobContext, chunk_id: int, column: str) -> Any:
+    with _connection(ctx) as conn:
+        with conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"SELECT {column} FROM narrative_chunks WHERE id = %s",
+                    (chunk_id,),
+                )
+                row = cur.fetchone()
+    if row is None:
+        raise RuntimeError(f"Chunk {chunk_id} not found in {ctx.dbname}")
+    return row[0]
+
+
+def _run_summary(job: PostCommitJob, ctx: JobContext) -> None:
+    """Generate the episode/season summaries one accepted chunk triggered.
+
+    The tasks stay in one job because a season summary reads the episode
+    summary generated just before it. Generation records its own per-summary
+    failure markers, so the job completes once every task was attempted.
+    """
+    from nexus.api.summary_triggers import SummaryTask, schedule_summary_generation
+
+    tasks = [
+        SummaryTask(
+            kind=task["kind"],
+            season=int(task["season"]),
+            episode=None if task.get("episode") is None else int(task["episode"]),
+        )
+        for task in job.payload["tasks"]
+    ]
+    schedule_summary_generation(tasks, slot=ctx.slot, run_in_thread=False)
+
+
+def _run_summary_digest(job: PostCommitJob, ctx: JobContext) -> None:
+    """Digest the scene windows the accepted chunk closed.
+
+    Episode summaries are built from these digests, so keeping them current
+    as chunks land leaves only the trailing window for the episode boundary.
+    """
+    from nexus.api.summary_triggers import refresh_chunk_digests
+
+    refresh_chunk_digests(job.chunk_id, slot=ctx.slot)
+
+
+def _run_chunk_embedding(job: PostCommitJob, ctx: JobContext) -> None:
+    """Embed one locked chunk unless an earlier attempt already stamped it."""
+    from nexus.api.chunk_workflow import ChunkWorkflow
+
+    if _chunk_column(ctx, job.chunk_id, "embedding_generated_at") is not None:
+        logger.info(
+            "Chunk %s in %s already embedded; skipping job %s",
+            job.chunk_id,
+            ctx.dbname,
+            job.id,
+        )
+        return
+    workflow = ChunkWorkflow(ctx.dbname)
+    if workflow.trigger_embedding_generation(job.chunk_id) is None:
+        raise RuntimeError(
+            f"Embedding generation did not complete for chunk {job.chunk_id}"
+        )
+
+
+def _run_presence_audit(job: PostCommitJob, ctx: JobContext) -> None:
+    """Record the presence audit for the committed chunk's prose."""
+    from nexus.api import presence_audit
+
+    raw_text = _chunk_column(ctx, job.chunk_id, "raw_text")
+    with _connection(ctx) as conn:
+        presence_audit.audit_chunk_presence(
+            conn,
+            job.chunk_id,
+            raw_text or "",
+            parent_chunk_id=job.payload.get("parent_chunk_id"),
+        )
+
+
+def _run_correspondence_compaction(job: PostCommitJob, ctx: JobContext) -> None:
+    """Compact correspondence the accepted letter made eligible.
+
+    Compaction is idempotent; a stale plan raises and the job retries.
+    """
+    from nexus.api.commit_handler_sync import compact_accepted_correspondence_sync
+
+    with _connection(ctx) as conn:
+        compact_accepted_correspondence_sync(conn, accepting_chunk_id=job.chunk_id)
+
+
+HANDLERS: Dict[str, JobHandler] = {
+    "summary": JobHandler(
+        _run_summary, max_attempts=3, backoff_seconds=60, concurrency=1
+    ),
+    "summary_digest": JobHandler(
+        _run_summary_digest, max_attempts=3, backoff_seconds=60, concurrency=1
+    ),
+    "chunk_embedding": JobHandler(
+        _run_chunk_embedding, max_attempts=5, backoff_seconds=30, concurrency=1
+    ),
+    "presence_audit": JobHandler(
+        _run_presence_audit, max_attempts=3, backoff_seconds=10, concurrency=2
+    ),
+    "correspondence_compaction": JobHandler(
+        _run_correspondence_compaction,
+        max_attempts=5,
+        backoff_seconds=30,
+        concurrency=1,
+    ),
+}
+
+
+# ============================================================================
+# Enqueue
+# ============================================================================
+
+
+def enqueue_post_commit_job(
+    cur: Any,
+    *,
+    kind: str,
+    idempotency_key: str,
+    chunk_id: int,
+    payload: Optional[Mapping[str, Any]] = None,
+    requeue_finished: bool = False,
+) -> Optional[int]:
+    """Write one outbox row in the caller's transaction.
+
+    Returns the job id, or None when a job with the same key already exists.
+    ``requeue_finished`` resets a succeeded or failed job for the key instead,
+    for work whose result can be undone outside the outbox (a chunk whose
+    embedding stamp was cleared). Live jobs are never touched.
+    """
+
+    if kind not in HANDLERS:
+        raise ValueError(f"Unknown post-commit job kind: {kind}")
+    if requeue_finished:
+        on_conflict = """
+            DO UPDATE SET state = 'queued',
+                          attempts = 0,
+                          available_at = now(),
+                          lease_until = NULL,
+                          locked_by = NULL,
+                          lease_nonce = NULL,
+                          payload = EXCLUDED.payload,
+                          updated_at = now()
+            WHERE post_commit_jobs.state IN ('succeeded', 'failed')
+        """
+    else:
+        on_conflict = "DO NOTHING"
+    cur.execute(
+        f"""
+        /* post_commit:enqueue */
+        INSERT INTO post_commit_jobs (kind, idempotency_key, chunk_id, payload)
+        VALUES (%s, %s, %s, %s::jsonb)
+        ON CONFLICT (kind, idempotency_key) {on_conflict}
+        RETURNING id
+        """,
+        (kind, idempotency_key, chunk_id, json.dumps(dict(payload or {}))),
+    )
+    row = cur.fetchone()
+    if row is None:
+        return None
+    return int(row["id"] if isinstance(row, Mapping) else row[0])
+
+
+def summary_job_key(tasks: Sequence[Any]) -> str:
+    """Idempotency key for one chunk's summary tasks, e.g. ``S02E05+S02``."""
+    labels = []
+    for task in tasks:
+        label = f"S{int(task.season):02d}"
+        if task.episode is not None:
+            label += f"E{int(task.episode):02d}"
+        labels.append(label)
+    return "+".join(labels)
+
+
+def enqueue_accepted_chunk_jobs(
+    cur: Any,
+    *,
+    chunk_id: int,
+    parent_chunk_id: Optional[int],
+    summary_tasks: Sequence[Any],
+    compact_correspondence: bool,
+    audit_presence: bool,
+    digest_scenes: bool = False,
+) -> List[int]:
+    """Write the accepted chunk's follow-up jobs inside the commit transaction."""
+
+    job_ids = []
+    if digest_scenes:
+        job_ids.append(
+            enqueue_post_commit_job(
+                cur,
+                kind="summary_digest",
+                idempotency_key=str(chunk_id),
+                chunk_id=chunk_id,
+            )
+        )
+    if summary_tasks:
+        job_ids.append(
+            enqueue_post_commit_job(
+                cur,
+                kind="summary",
+                idempotency_key=summary_job_key(summary_tasks),
+                chunk_id=chunk_id,
+                payload={
+                    "tasks": [
+                        {
+                            "kind": task.kind,
+                            "season": task.season,
+                            "episode": task.episode,
+                        }
+                        for task in summary_tasks
+                    ]
+                },
+            )
+        )
+    if compact_correspondence:
+        job_ids.append(
+            enqueue_post_commit_job(
+                cur,
+                kind="correspondence_compaction",
+                idempotency_key=str(chunk_id),
+                chunk_id=chunk_id,
+            )
+        )
+    if audit_presence:
+        job_ids.append(
+            enqueue_post_commit_job(
+                cur,
+                kind="presence_audit",
+                idempotency_key=str(chunk_id),
+                chunk_id=chunk_id,
+                payload={"parent_chunk_id": parent_chunk_id},
+            )
+        )
+    return [job_id for job_id in job_ids if job_id is not None]
+
+
+def enqueue_chunk_embedding(cur: Any, chunk_id: int) -> Optional[int]:
+    """Queue embedding for a locked chunk; a cleared stamp re-arms a done job."""
+    return enqueue_post_commit_job(
+        cur,
+        kind="chunk_embedding",
+        idempotency_key=str(chunk_id),
+        chunk_id=chunk_id,
+        requeue_finished=True,
+    )
+
+
+# ============================================================================
+# Drain
+# ============================================================================
+
+
+def _runner_identity() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _slot_connector(dbname: str) -> Connect:
+    def connect() -> Any:
+        return psycopg2.connect(
+            host=os.environ.get("PGHOST", "localhost"),
+            database=dbname,
+            user=os.environ.get("PGUSER", "pythagor"),
+            port=os.environ.get("PGPORT", "5432"),
+        )
+
+    return connect
+
+
+def _lease_jobs(conn: Any, *, kind: str, limit: int) -> List[PostCommitJob]:
+    locked_by = _runner_identity()
+    with conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(
+                """
+                /* post_commit:lease */
+                SELECT j.id, j.kind, j.idempotency_key, j.chunk_id, j.payload,
+                       j.attempts
+                FROM post_commit_jobs j
+                WHERE j.kind = %s
+                  AND (
+                        (j.state = 'queued' AND j.available_at <= now())
+                     OR (
+                            j.state = 'leased'
+                            AND j.lease_until IS NOT NULL
+                            AND j.lease_until < now()
+                        )
+                  )
+                ORDER BY j.available_at, j.id
+                LIMIT %s
+                FOR UPDATE OF j SKIP LOCKED
+                """,
+                (kind, limit),
+            )
+            rows = cur.fetchall()
+            jobs = []
+            for row in rows:
+                nonce = str(uuid.uuid4())
+                cur.execute(
+                    """
+                    UPDATE post_commit_jobs
+                    SET state = 'leased',
+                        lease_until = now() + %s * interval '1 second',
+                        locked_by = %s,
+                        lease_nonce = %s::uuid,
+                        attempts = attempts + 1,
+                        updated_at = now()
+                    WHERE id = %s
+                    """,
+                    (LEASE_SECONDS, locked_by, nonce, row["id"]),
+                )
+                jobs.append(
+                    PostCommitJob(
+                        id=int(row["id"]),
+                        kind=row["kind"],
+                        idempotency_key=row["idempotency_key"],
+                        chunk_id=int(row["chunk_id"]),
+                        payload=row["payload"] or {},
+                        attempts=int(row["attempts"]) + 1,
+                        lease_nonce=nonce,
+                    )
+                )
+    return jobs
+
+
+def _finish_job(
+    conn: Any, job: PostCommitJob, handler: JobHandler, error: Optional[str]
+) -> str:
+    """Record one outcome under the job's lease; return the outcome name."""
+
+    if error is None:
+        outcome = "succeeded"
+        sql = """
+            UPDATE post_commit_jobs
+            SET state = 'succeeded', lease_until = NULL, updated_at = now()
+            WHERE id = %s AND state = 'leased' AND lease_nonce = %s::uuid
+        """
+        params: tuple = (job.id, job.lease_nonce)
+    elif job.attempts < handler.max_attempts:
+        outcome = "retried"
+        sql = """
+            UPDATE post_commit_jobs
+            SET state = 'queued',
+                available_at = now() + %s * interval '1 second',
+                lease_until = NULL,
+                last_error = %s,
+                updated_at = now()
+            WHERE id = %s AND state = 'leased' AND lease_nonce = %s::uuid
+        """
+        params = (handler.retry_delay(job.attempts), error, job.id, job.lease_nonce)
+    else:
+        outcome = "failed"
+        sql = """
+            UPDATE post_commit_jobs
+            SET state = 'failed',
+                lease_until = NULL,
+                last_error = %s,
+                updated_at = now()
+            WHERE id = %s AND state = 'leased' AND lease_nonce = %s::uuid
+        """
+        params = (error, job.id, job.lease_nonce)
+    with conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, params)
+            if cur.rowcount == 0:
+                logger.warning(
+                    "Post-commit job %s (%s) lost its lease before recording %s",
+                    job.id,
+                    job.kind,
+                    outcome,
+                )
+                return "lost_leases"
+    return outcome
+
+
+def _next_due_seconds(conn: Any) -> Optional[float]:
+    with conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                /* post_commit:next_due */
+                SELECT EXTRACT(EPOCH FROM min(
+                    CASE WHEN state = 'queued' THEN available_at ELSE lease_until END
+                ) - now())
+                FROM post_commit_jobs
+                WHERE state IN ('queued', 'leased')
+                """
+            )
+            row = cur.fetchone()
+    if row is None or row[0] is None:
+        return None
+    return max(float(row[0]), 0.0)
+
+
+def drain_post_commit_jobs_sync(
+    dbname: str,
+    *,
+    slot: Optional[int] = None,
+    connect: Optional[Connect] = None,
+    handlers: Optional[Mapping[str, JobHandler]] = None,
+    max_workers: int = MAX_WORKERS,
+    limit: Optional[int] = None,
+) -> DrainResult:
+    """Run due jobs until none are leasable; return outcomes and next due time.
+
+    Jobs are leased only when a worker and a slot under their kind's cap are
+    free, so a backlog behind a slow kind never sits on an expiring lease.
+    """
+
+    connect = connect or _slot_connector(dbname)
+    handlers = HANDLERS if handlers is None else handlers
+    ctx = JobContext(dbname=dbname, slot=slot, connect=connect)
+    result = DrainResult()
+    running: Dict[Future, PostCommitJob] = {}
+    per_kind: Counter = Counter()
+    leased_total = 0
+    conn = connect()
+    try:
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"post-commit-{dbname}"
+        ) as pool:
+            while True:
+                free = max_workers - len(running)
+                if limit is not None:
+                    free = min(free, limit - leased_total)
+                for kind, handler in handlers.items():
+                    want = min(free, handler.concurrency - per_kind[kind])
+                    if want <= 0:
+                        continue
+                    for job in _lease_jobs(conn, kind=kind, limit=want):
+                        per_kind[kind] += 1
+                        leased_total += 1
+                        free -= 1
+                        running[pool.submit(handler.run, job, ctx)] = job
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    per_kind[job.kind] -= 1
+                    error = future.exception()
+                    if error is not None:
+                        logger.warning(
+                            "Post-commit job %s (%s %s) attempt %s failed: %s",
+                            job.id,
+                            job.kind,
+                            job.idempotency_key,
+                            job.attempts,
+                            error,
+                        )
+                    outcome = _finish_job(
+                        conn,
+                        job,
+                        handlers[job.kind],
+                        None if error is None else f"{type(error).__name__}: {error}",
+                    )
+                    result.record(job.kind, outcome)
+        result.next_due_seconds = _next_due_seconds(conn)
+    finally:
+        conn.close()
+    return result
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+
+class SlotJobRunner:
+    """Background drain loop for one slot database.
+
+    :meth:`kick` is cheap and never blocks: kicks during a drain coalesce
+    into one more pass, and backoff retries are picked up by a timer set to
+    the outbox's next due time.
+    """
+
+    def __init__(
+        self,
+        dbname: str,
+        *,
+        slot: Optional[int] = None,
+        connect: Optional[Connect] = None,
+        handlers: Optional[Mapping[str, JobHandler]] = None,
+    ) -> None:
+        self.dbname = dbname
+        self.slot = slot
+        self._connect = connect
+        self._handlers = handlers
+        self._lock = threading.Lock()
+        self._wanted = False
+        self._thread: Optional[threading.Thread] = None
+        self._timer: Optional[threading.Timer] = None
+        self._failures = 0
+        self.last_result: Optional[DrainResult] = None
+
+    @property
+    def running(self) -> bool:
+        with self._lock:
+            return self._thread is not None
+
+    def kick(self) -> None:
+        with self._lock:
+            self._wanted = True
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._loop,
+                name=f"post-commit-runner-{self.dbname}",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _loop(self) -> None:
+        try:
+            while True:
+                with self._lock:
+                    if not self._wanted:
+                        self._thread = None
+                        return
+                    self._wanted = False
+                try:
+                    result = drain_post_commit_jobs_sync(
+                        self.dbname,
+                        slot=self.slot,
+                        connect=self._connect,
+                        handlers=self._handlers,
+                    )
+                except Exception:
+                    self._failures += 1
+                    delay = min(
+                        MAX_BACKOFF_SECONDS,
+                        DRAIN_RETRY_SECONDS * 2 ** (self._failures - 1),
+                    )
+                    logger.exception(
+                        "Post-commit job drain failed for %s; retrying in %.0fs",
+                        self.dbname,
+                        delay,
+                    )
+                    self._schedule(delay)
+                    continue
+                self._failures = 0
+                self.last_result = result
+                if result.next_due_seconds is not None:
+                    self._schedule(result.next_due_seconds)
+        finally:
+            # A BaseException out of a drain must not leave a dead thread
+            # registered, or every later kick would be a silent no-op.
+            with self._lock:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+
+    def _schedule(self, delay: float) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(max(delay, MIN_RESCHEDULE_SECONDS), self.kick)
+            self._timer.daemon = True
+            self._timer.start()
+
+
+_RUNNERS: Dict[str, SlotJobRunner] = {}
+_RUNNERS_LOCK = threading.Lock()
+
+
+def get_slot_job_runner(dbname: str) -> SlotJobRunner:
+    """Return the process-wide runner for a slot database."""
+    from nexus.api.slot_utils import VALID_DBNAMES
+
+    if dbname not in VALID_DBNAMES:
+        raise ValueError(f"Invalid slot database name: {dbname!r}")
+    with _RUNNERS_LOCK:
+        runner = _RUNNERS.get(dbname)
+        if runner is None:
+            runner = SlotJobRunner(dbname, slot=int(dbname.removeprefix("save_")))
+            _RUNNERS[dbname] = runner
+        return runner
+
+
+def runners_enabled() -> bool:
+    """Whether kicks start runner threads (``NEXUS_POST_COMMIT_RUNNER`` != "0")."""
+    return os.environ.get(RUNNER_ENV, "1") != "0"
+
+
+def kick_post_commit_jobs_for_dbname(dbname: str) -> None:
+    """Wake the runner for ``dbname``. Never raises: jobs wait for a later kick."""
+    if not runners_enabled():
+        logger.debug("Post-commit runners disabled; %s jobs stay queued", dbname)
+        return
+    try:
+        get_slot_job_runner(dbname).kick()
+    except Exception:
+        logger.exception("Could not start the post-commit job runner for %s", dbname)
+
+
+def kick_post_commit_jobs(slot: Optional[int]) -> None:
+    """Wake the runner for a slot (``NEXUS_SLOT`` when None)."""
+    from nexus.api.slot_utils import require_slot_dbname
+
+    try:
+        dbname = require_slot_dbname(slot=slot)
+    except Exception:
+        logger.exception("Could not resolve a post-commit job slot for %s", slot)
+        return
+    kick_post_commit_jobs_for_dbname(dbname)
+
+
+# ============================================================================
+# Status
+# ============================================================================
+
+
+def load_post_commit_status_sync(cur: Any) -> Dict[str, Any]:
+    """Return outbox counts by state and kind plus jobs worth a look."""
+
+    cur.execute(
+        """
+        /* post_commit:status */
+        SELECT kind, state::text AS state, count(*) AS jobs
+        FROM post_commit_jobs
+        GROUP BY kind, state
+        """
+    )
+    counts = {state: 0 for state in JOB_STATES}
+    by_kind: Dict[str, Dict[str, int]] = {
+        kind: {state: 0 for state in JOB_STATES} for kind in HANDLERS
+    }
+    for row in cur.fetchall():
+        if row["state"] not in counts:
+            continue
+        counts[row["state"]] += int(row["jobs"])
+        by_kind.setdefault(row["kind"], {state: 0 for state in JOB_STATES})[
+            row["state"]
+        ] += int(row["jobs"])
+    cur.execute(
+        """
+        SELECT id, kind, idempotency_key, chunk_id, state::text AS state,
+               attempts, available_at, lease_until, locked_by, last_error
+        FROM post_commit_jobs
+        WHERE state IN ('queued', 'leased', 'failed')
+        ORDER BY (state = 'failed'), id
+        LIMIT 50
+        """
+    )
+    jobs = [dict(row) for row in cur.fetchall()]
+    return {
+        "counts": counts,
+        "by_kind": by_kind,
+        "non_terminal_jobs": [job for job in jobs if job["state"] != "failed"],
+        "failed_jobs": [job for job in jobs if job["state"] == "failed"],
+    }
+
+
+def load_post_commit_status_for_slot_sync(slot: int) -> Dict[str, Any]:
+    """Return the post-commit outbox snapshot for one save slot."""
+    from nexus.api.slot_utils import require_slot_dbname
+
+    conn = _slot_connector(require_slot_dbname(slot=slot))()
+    try:
+        with conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                return load_post_commit_status_sync(cur)
+    finally:
+        conn.close()
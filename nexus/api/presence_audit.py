@@ -33,26 +33,11 @@ import logging
 from typing import Any, Dict, List, Optional
 
 from nexus.memory.entity_detector import EntityMatch, HighSpecificityEntityDetector
+from nexus.memory.entity_lexicon import get_entity_lexicon, get_entity_lexicon_async
 
 logger = logging.getLogger("nexus.api.presence_audit")
 
 
-def _character_only_detector(
-    character_rows: List[Any],
-    alias_rows: List[Any],
-) -> HighSpecificityEntityDetector:
-    """Build a detector from prefetched character/alias rows.
-
-    Mirrors HighSpecificityEntityDetector._load_characters' record shape
-    ({id, name, summary}). Places and factions stay unloaded — the presence
-    audit only diffs characters, so loading and regex-scanning them would be
-    pure waste on every commit (both orchestrators share this builder).
-    """
-    from nexus.api.presence_reconciliation import build_character_presence_detector
-
-    return build_character_presence_detector(character_rows, alias_rows)
-
-
 def diff_presence(
     entity_match: EntityMatch,
     accounted_character_ids: set[int],
@@ -110,8 +95,6 @@ def audit_chunk_presence(
     masking a failure.
     """
     try:
-        from psycopg2.extras import RealDictCursor
-
         with conn.cursor() as cur:
             cur.execute(
                 "SELECT character_id FROM chunk_character_references "
@@ -130,14 +113,9 @@ def audit_chunk_presence(
 
         active_detector = detector
         if active_detector is None:
-            with conn.cursor(cursor_factory=RealDictCursor) as dict_cur:
-                dict_cur.execute(
-                    "SELECT id, name, summary FROM characters " "WHERE name IS NOT NULL"
-                )
-                character_rows = dict_cur.fetchall()
-                dict_cur.execute("SELECT character_id, alias FROM character_aliases")
-                alias_rows = dict_cur.fetchall()
-            active_detector = _character_only_detector(character_rows, alias_rows)
+            # Character-only: the audit diffs characters, so places and
+            # factions would be pure regex waste on every commit.
+            active_detector = get_entity_lexicon(conn).character_detector
 
         entity_match = active_detector.detect_entities(prose)
         findings = diff_presence(entity_match, accounted, chunk_id=chunk_id)
@@ -176,13 +154,7 @@ async def audit_chunk_presence_async(
             )
             accounted |= {row["character_id"] for row in parent_rows}
 
-        character_rows = await conn.fetch(
-            "SELECT id, name, summary FROM characters WHERE name IS NOT NULL"
-        )
-        alias_rows = await conn.fetch(
-            "SELECT character_id, alias FROM character_aliases"
-        )
-        detector = _character_only_detector(list(character_rows), list(alias_rows))
+        detector = (await get_entity_lexicon_async(conn)).character_detector
         entity_match = detector.detect_entities(prose)
         findings = diff_presence(entity_match, accounted, chunk_id=chunk_id)
         _emit_findings(findings)
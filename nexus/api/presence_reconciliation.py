@@ -6,11 +6,9 @@ import asyncio
 from dataclasses import dataclass
 import logging
 import os
-import re
 from typing import Any, Collection, List, Literal, Mapping, Optional, Sequence
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
 
 from nexus.agents.logon.apex_schema import NewEntityDeclaration
 from nexus.agents.logon.skald_wire import (
@@ -22,7 +20,12 @@ from nexus.agents.logon.skald_wire import (
     _deduplicate_presence,
     _presence_key,
 )
-from nexus.memory.entity_detector import EntityMatch, HighSpecificityEntityDetector
+from nexus.memory.entity_detector import (
+    EntityMatch,
+    HighSpecificityEntityDetector,
+    word_boundary_pattern,
+)
+from nexus.memory.entity_lexicon import get_entity_lexicon
 from nexus.util.log_safety import quote_log_value
 
 
@@ -69,14 +72,15 @@ class _LongestMatchCharacterDetector(HighSpecificityEntityDetector):
         text_lower = text.lower()
         candidates: List[_CharacterMatchSpan] = []
         for lookup_key in self.character_lookup:
-            pattern = rf"\b{re.escape(lookup_key)}\b"
+            if lookup_key not in text_lower:
+                continue
             candidates.extend(
                 _CharacterMatchSpan(
                     lookup_key=lookup_key,
                     start=match.start(),
                     end=match.end(),
                 )
-                for match in re.finditer(pattern, text_lower)
+                for match in word_boundary_pattern(lookup_key).finditer(text_lower)
             )
 
         accepted_indices: set[int] = set()
@@ -144,17 +148,16 @@ def build_character_presence_detector(
 
 
 def read_character_roster_from_connection(conn: Any) -> CharacterRosterRows:
-    """Read the character roster through an existing psycopg2 transaction."""
+    """Read the character roster through an existing psycopg2 transaction.
 
-    with conn.cursor(cursor_factory=RealDictCursor) as cur:
-        cur.execute("SELECT id, name, summary FROM characters WHERE name IS NOT NULL")
-        character_rows = cur.fetchall()
-        cur.execute("SELECT character_id, alias FROM character_aliases")
-        alias_rows = cur.fetchall()
+    Rows come from the slot's shared entity lexicon, so an unchanged roster
+    costs two one-row revision reads instead of two full-table scans.
+    """
 
+    lexicon = get_entity_lexicon(conn)
     return CharacterRosterRows(
-        characters=list(character_rows),
-        aliases=list(alias_rows),
+        characters=list(lexicon.named_characters),
+        aliases=list(lexicon.aliases),
     )
 
 
@@ -24,6 +24,7 @@ from pydantic_ai.providers.anthropic import (
 from pydantic_ai.providers.openai import OpenAIProvider as PydanticOpenAIProvider
 
 from nexus.api.native_structured_output import AnthropicJsonSchemaTransformer
+from nexus.api.rate_governor import governed_async_http_client
 from nexus.config import get_openai_compatible_endpoint
 from nexus.config.loader import (
     get_native_structured_output_override,
@@ -47,7 +48,10 @@ def build_pydantic_ai_model_with_provider(model: str) -> tuple[Model, str]:
         raise ValueError(f"Unknown provider for model {model!r}")
     if provider == "openai":
         legacy_openai_provider = LegacyOpenAIProvider(model=model)
-        openai_provider = PydanticOpenAIProvider(api_key=legacy_openai_provider.api_key)
+        openai_provider = PydanticOpenAIProvider(
+            api_key=legacy_openai_provider.api_key,
+            http_client=governed_async_http_client(provider),
+        )
         return (
             OpenAIResponsesModel(model_name=model, provider=openai_provider),
             provider,
@@ -55,7 +59,8 @@ def build_pydantic_ai_model_with_provider(model: str) -> tuple[Model, str]:
     if provider == "anthropic":
         legacy_anthropic_provider = LegacyAnthropicProvider(model=model)
         anthropic_provider = PydanticAnthropicProvider(
-            api_key=legacy_anthropic_provider.api_key
+            api_key=legacy_anthropic_provider.api_key,
+            http_client=governed_async_http_client(provider),
         )
         override = get_native_structured_output_override(model)
         if override is not None:
@@ -96,11 +101,14 @@ def build_pydantic_ai_model_with_provider(model: str) -> tuple[Model, str]:
                 api_key=endpoint["api_key"],
                 base_url=endpoint["base_url"],
                 timeout=timeout,
+                http_client=governed_async_http_client(provider),
             )
         )
     else:
         compatible_provider = PydanticOpenAIProvider(
-            api_key=endpoint["api_key"], base_url=endpoint["base_url"]
+            api_key=endpoint["api_key"],
+            base_url=endpoint["base_url"],
+            http_client=governed_async_http_client(provider),
         )
     if endpoint["structured_transport"] == "chat_completions":
         return (
@@ -0,0 +1,571 @@
+"""
+Provider-aware rate governor for outbound LLM calls.
+
+One RateGovernor per (provider, model) meters calls through two token
+buckets - requests per minute and tokens per minute - and caps how many
+calls are in flight at once. Budgets start from [api.rate_limits] in
+nexus.toml and adapt to what the provider reports:
+
+- ``x-ratelimit-*`` / ``anthropic-ratelimit-*`` headers clamp the local
+  buckets to the provider's remaining balance, and supply any limit that
+  was not configured (a configured limit is a ceiling, never raised).
+- A 429 pauses every caller of that key until its ``retry-after`` has
+  passed and halves the refill rate, which recovers step by step on
+  success. Concurrent callers queue behind one pause instead of retrying
+  together.
+
+SDK clients are governed at the HTTP layer: ``governed_http_client`` and
+``governed_async_http_client`` return httpx clients whose transport takes
+a permit for every request (SDK-internal retries included), feeds each
+response back into the governor and returns the permit when the response
+is closed. Environment proxy settings still apply. Governors are process-local; the
+gateway, the Orrery worker and batch scripts converge through the
+provider's headers, which report the shared organization quota.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, fields
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+import json
+import logging
+import threading
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+import httpx
+
+from nexus.config import load_settings
+
+logger = logging.getLogger("nexus.api.rate_governor")
+
+ANY_MODEL = "*"
+
+# Penalty when a 429 carries no retry-after; doubles per consecutive 429.
+_DEFAULT_PENALTY_SECONDS = 1.0
+_MAX_PENALTY_SECONDS = 60.0
+# Refill-rate multiplier after 429s (halved per 429, floor below) and the
+# step by which each successful call restores it.
+_MIN_SCALE = 0.1
+_RECOVERY_STEP = 0.05
+# How often a caller waiting only for a free concurrency slot re-checks.
+_SLOT_POLL_SECONDS = 0.02
+# Request-size estimate, the same heuristic OpenAI uses for TPM accounting.
+_CHARS_PER_TOKEN = 4
+_MAX_OUTPUT_FIELDS = ("max_output_tokens", "max_completion_tokens", "max_tokens")
+
+_LIMIT_HEADERS = {
+    "requests": ("x-ratelimit-limit-requests", "anthropic-ratelimit-requests-limit"),
+    "tokens": ("x-ratelimit-limit-tokens", "anthropic-ratelimit-tokens-limit"),
+}
+_REMAINING_HEADERS = {
+    "requests": (
+        "x-ratelimit-remaining-requests",
+        "anthropic-ratelimit-requests-remaining",
+    ),
+    "tokens": (
+        "x-ratelimit-remaining-tokens",
+        "anthropic-ratelimit-tokens-remaining",
+    ),
+}
+
+
+@dataclass(frozen=True)
+class RateLimits:
+    """Budgets for one provider/model; ``None`` leaves a budget unmetered."""
+
+    requests_per_minute: Optional[float] = None
+    tokens_per_minute: Optional[float] = None
+    max_concurrency: Optional[int] = None
+
+
+@dataclass
+class GovernorStats:
+    """Counters for one governor, read by the simulation harness and logs."""
+
+    requests: int = 0
+    throttled: int = 0
+    waited_seconds: float = 0.0
+
+
+class _Bucket:
+    """Continuous token bucket holding at most one minute of budget."""
+
+    def __init__(self, per_minute: float, now: float) -> None:
+        self.per_minute = float(per_minute)
+        self.level = self.per_minute
+        self.updated = now
+
+    def refill(self, now: float, scale: float) -> None:
+        elapsed = max(0.0, now - self.updated)
+        self.level = min(
+            self.per_minute, self.level + elapsed * self.per_minute * scale / 60.0
+        )
+        self.updated = now
+
+    def delay_for(self, amount: float, scale: float) -> float:
+        # A request larger than the whole bucket goes once the bucket is
+        # full and leaves it in debt, rather than waiting forever.
+        shortfall = min(amount, self.per_minute) - self.level
+        if shortfall <= 0:
+            return 0.0
+        return shortfall * 60.0 / (self.per_minute * scale)
+
+    def resize(self, per_minute: float) -> None:
+        self.per_minute = float(per_minute)
+        self.level = min(self.level, self.per_minute)
+
+
+def _header_number(
+    headers: Mapping[str, str], names: Tuple[str, ...]
+) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value)
+        except ValueError:
+            logger.debug("Ignoring non-numeric %s header: %r", name, value)
+    return None
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> Optional[float]:
+    """Seconds a provider asked callers to wait, from retry-after(-ms)."""
+    lowered = {key.lower(): value for key, value in headers.items()}
+    milliseconds = _header_number(lowered, ("retry-after-ms",))
+    if milliseconds is not None:
+        return max(0.0, milliseconds / 1000.0)
+    value = lowered.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class Permit:
+    """One admitted call; release it when the provider has answered."""
+
+    def __init__(self, governor: "RateGovernor", tokens: int) -> None:
+        self.governor = governor
+        self.tokens = tokens
+        self._released = False
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> None:
+        self.governor.observe(status_code, headers)
+
+    def release(self) -> None:
+        if not self._released:
+            self._released = True
+            self.governor._release()
+
+    def __enter__(self) -> "Permit":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+
+class RateGovernor:
+    """Request, token and concurrency budgets for one provider/model."""
+
+    def __init__(
+        self,
+        provider: str,
+        model: str,
+        limits: RateLimits,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.provider = provider
+        self.model = model
+        self.limits = limits
+        self.stats = GovernorStats()
+        self._clock = clock
+        # A thread lock, not an asyncio.Lock: it is never held across an
+        # await, so one governor serves sync and async callers on any loop.
+        self._lock = threading.Lock()
+        self._slot_freed = threading.Condition(self._lock)
+        now = clock()
+        self._buckets: Dict[str, Optional[_Bucket]] = {
+            "requests": (
+                _Bucket(limits.requests_per_minute, now)
+                if limits.requests_per_minute
+                else None
+            ),
+            "tokens": (
+                _Bucket(limits.tokens_per_minute, now)
+                if limits.tokens_per_minute
+                else None
+            ),
+        }
+        self._configured = {
+            "requests": limits.requests_per_minute,
+            "tokens": limits.tokens_per_minute,
+        }
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._scale = 1.0
+        self._strikes = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _reserve(self, tokens: int) -> float:
+        """Admit a call now (returns 0) or return how long to wait. Lock held."""
+        now = self._clock()
+        if now < self._paused_until:
+            return self._paused_until - now
+        if (
+            self.limits.max_concurrency is not None
+            and self._in_flight >= self.limits.max_concurrency
+        ):
+            return _SLOT_POLL_SECONDS
+        amounts = {"requests": 1, "tokens": tokens}
+        delay = 0.0
+        for name, bucket in self._buckets.items():
+            if bucket is not None:
+                bucket.refill(now, self._scale)
+                delay = max(delay, bucket.delay_for(amounts[name], self._scale))
+        if delay > 0:
+            return delay
+        for name, bucket in self._buckets.items():
+            if bucket is not None:
+                bucket.level -= amounts[name]
+        self._in_flight += 1
+        self.stats.requests += 1
+        return 0.0
+
+    def try_acquire(self, tokens: int = 0) -> Optional[Permit]:
+        """Admit a call if every budget allows it right now."""
+        with self._lock:
+            if self._reserve(tokens) > 0:
+                return None
+        return Permit(self, tokens)
+
+    def acquire(self, tokens: int = 0) -> Permit:
+        """Block the calling thread until a call of ``tokens`` is admitted."""
+        started = self._clock()
+        with self._lock:
+            while True:
+                delay = self._reserve(tokens)
+                if delay <= 0:
+                    break
+                self._slot_freed.wait(delay)
+            self.stats.waited_seconds += self._clock() - started
+        return Permit(self, tokens)
+
+    async def acquire_async(self, tokens: int = 0) -> Permit:
+        """Wait without blocking the event loop until the call is admitted."""
+        started = self._clock()
+        while True:
+            with self._lock:
+                delay = self._reserve(tokens)
+                if delay <= 0:
+                    self.stats.waited_seconds += self._clock() - started
+                    return Permit(self, tokens)
+            await asyncio.sleep(delay)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._slot_freed.notify_all()
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Adapt budgets to one provider response."""
+        lowered = {key.lower(): value for key, value in headers.items()}
+        now = self._clock()
+        with self._lock:
+            for name in ("requests", "tokens"):
+                limit = _header_number(lowered, _LIMIT_HEADERS[name])
+                if limit:
+                    self._adopt_limit(name, limit, now)
+                remaining = _header_number(lowered, _REMAINING_HEADERS[name])
+                bucket = self._buckets[name]
+                if remaining is not None and bucket is not None:
+                    bucket.refill(now, self._scale)
+                    bucket.level = min(bucket.level, remaining)
+            if status_code == 429:
+                self._throttle(now, retry_after_seconds(lowered))
+            elif status_code < 400:
+                self._strikes = 0
+                self._scale = min(1.0, self._scale + _RECOVERY_STEP)
+
+    def _adopt_limit(self, name: str, limit: float, now: float) -> None:
+        configured = self._configured[name]
+        effective = min(configured, limit) if configured else limit
+        bucket = self._buckets[name]
+        if bucket is None:
+            self._buckets[name] = _Bucket(effective, now)
+        elif bucket.per_minute != effective:
+            bucket.refill(now, self._scale)
+            bucket.resize(effective)
+
+    def _throttle(self, now: float, retry_after: Optional[float]) -> None:
+        self._strikes += 1
+        self._scale = max(_MIN_SCALE, self._scale / 2)
+        self.stats.throttled += 1
+        if retry_after is None:
+            retry_after = min(
+                _MAX_PENALTY_SECONDS,
+                _DEFAULT_PENALTY_SECONDS * 2 ** (self._strikes - 1),
+            )
+        if now + retry_after > self._paused_until:
+            self._paused_until = now + retry_after
+            logger.warning(
+                "Rate limited by %s (%s); pausing calls for %.2fs",
+                self.provider,
+                self.model,
+                retry_after,
+            )
+
+
+_governors: Dict[Tuple[str, str], RateGovernor] = {}
+_registry_lock = threading.Lock()
+
+
+def _merge_limits(base: Any, override: Any) -> RateLimits:
+    values = {}
+    for spec in fields(RateLimits):
+        value = getattr(override, spec.name, None) if override else None
+        if value is None and base is not None:
+            value = getattr(base, spec.name, None)
+        values[spec.name] = value
+    return RateLimits(**values)
+
+
+def resolve_rate_limits(provider: str, model: str = ANY_MODEL) -> RateLimits:
+    """Configured budgets for ``provider``/``model`` from [api.rate_limits]."""
+    try:
+        settings = load_settings()
+    except Exception as exc:
+        logger.warning("Rate limits unavailable (%s); only adapting to headers", exc)
+        return RateLimits()
+    config = settings.api.rate_limits if settings.api else None
+    if config is None:
+        return RateLimits()
+    provider_entry = config.providers.get(provider)
+    model_entry = config.providers.get(f"{provider}/{model}")
+    return _merge_limits(_merge_limits(config.default, provider_entry), model_entry)
+
+
+def get_governor(provider: str, model: Optional[str] = None) -> RateGovernor:
+    """The shared governor for ``provider``/``model``, created on first use."""
+    key = (provider.lower(), model or ANY_MODEL)
+    with _registry_lock:
+        governor = _governors.get(key)
+        if governor is None:
+            governor = RateGovernor(key[0], key[1], resolve_rate_limits(*key))
+            _governors[key] = governor
+        return governor
+
+
+def register_governor(governor: RateGovernor) -> RateGovernor:
+    """Install a governor built with explicit limits (harnesses and tests)."""
+    with _registry_lock:
+        _governors[(governor.provider.lower(), governor.model)] = governor
+    return governor
+
+
+def reset_governors() -> None:
+    """Forget every governor so the next call re-reads [api.rate_limits]."""
+    with _registry_lock:
+        _governors.clear()
+
+
+def request_budget(request: httpx.Request) -> Tuple[Optional[str], int]:
+    """Model and estimated token cost (prompt size plus output cap) of a request."""
+    try:
+        body = request.content
+    except httpx.RequestNotRead:
+        return None, 0
+    if not body or "json" not in request.headers.get("content-type", ""):
+        return None, 0
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return None, 0
+    if not isinstance(payload, dict):
+        return None, 0
+    output_cap = next(
+        (
+            payload[name]
+            for name in _MAX_OUTPUT_FIELDS
+            if isinstance(payload.get(name), int)
+        ),
+        0,
+    )
+    model = payload.get("model")
+    return (
+        model if isinstance(model, str) else None,
+        len(body) // _CHARS_PER_TOKEN + output_cap,
+    )
+
+
+class _PermitStream(httpx.SyncByteStream):
+    """Response body that holds its call's permit until the body is closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, permit: Permit) -> None:
+        self._stream = stream
+        self._permit = permit
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._permit.release()
+
+
+class _AsyncPermitStream(httpx.AsyncByteStream):
+    """Async counterpart of :class:`_PermitStream`."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, permit: Permit) -> None:
+        self._stream = stream
+        self._permit = permit
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._permit.release()
+
+
+class GovernedTransport(httpx.BaseTransport):
+    """httpx transport that sends every request through its governor.
+
+    The permit is held until the response body is closed, so a streamed
+    response counts against ``max_concurrency`` for as long as it is read.
+    """
+
+    def __init__(
+        self, provider: str, transport: Optional[httpx.BaseTransport] = None
+    ) -> None:
+        self.provider = provider
+        self._transport = transport or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        model, tokens = request_budget(request)
+        permit = get_governor(self.provider, model).acquire(tokens)
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            permit.release()
+            raise
+        permit.observe(response.status_code, response.headers)
+        if response.is_closed:  # body already read in full (mock transports)
+            permit.release()
+        else:
+            response.stream = _PermitStream(response.stream, permit)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class GovernedAsyncTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`GovernedTransport`."""
+
+    def __init__(
+        self, provider: str, transport: Optional[httpx.AsyncBaseTransport] = None
+    ) -> None:
+        self.provider = provider
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        model, tokens = request_budget(request)
+        permit = await get_governor(self.provider, model).acquire_async(tokens)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            permit.release()
+            raise
+        permit.observe(response.status_code, response.headers)
+        if response.is_closed:  # body already read in full (mock transports)
+            permit.release()
+        else:
+            response.stream = _AsyncPermitStream(response.stream, permit)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _govern_transports(client: Any, wrap: Callable[[Any], Any]) -> None:
+    # httpx ignores environment proxies once ``transport=`` is passed, so
+    # let the client build its own transports (default plus proxy mounts)
+    # from trust_env/proxy and wrap each of them instead.
+    client._transport = wrap(client._transport)
+    client._mounts = {
+        pattern: None if transport is None else wrap(transport)
+        for pattern, transport in client._mounts.items()
+    }
+
+
+def governed_http_client(
+    provider: str, *, trust_env: bool = True, proxy: Optional[str] = None
+) -> httpx.Client:
+    """An httpx client for a sync SDK (``http_client=``) governed per model."""
+    client = httpx.Client(follow_redirects=True, trust_env=trust_env, proxy=proxy)
+    _govern_transports(client, lambda transport: GovernedTransport(provider, transport))
+    return client
+
+
+_async_clients: Dict[Tuple[str, bool, Optional[str]], httpx.AsyncClient] = {}
+
+
+def governed_async_http_client(
+    provider: str, *, trust_env: bool = True, proxy: Optional[str] = None
+) -> httpx.AsyncClient:
+    """An httpx client for an async SDK (``http_client=``) governed per model.
+
+    Like pydantic-ai's ``cached_async_http_client``, one client is shared per
+    provider (and proxy settings) rather than built per model, and a closed
+    one is replaced. :func:`aclose_governed_http_clients` closes them all.
+    """
+    key = (provider, trust_env, proxy)
+    with _registry_lock:
+        client = _async_clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                follow_redirects=True, trust_env=trust_env, proxy=proxy
+            )
+            _govern_transports(
+                client, lambda transport: GovernedAsyncTransport(provider, transport)
+            )
+            _async_clients[key] = client
+        return client
+
+
+async def aclose_governed_http_clients() -> None:
+    """Close every shared async client (application shutdown)."""
+    with _registry_lock:
+        clients = list(_async_clients.values())
+        _async_clients.clear()
+    for client in clients:
+        await client.aclose()
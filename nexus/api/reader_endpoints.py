@@ -11,6 +11,10 @@ served (camelCase keys, ``currentLocation`` coerced to a string, ``metadata``
 omitted when a chunk has none). The client code under ``ui/client/src`` is
 the consumer contract — do not change shapes here without updating it.
 
+The list feeds (outline, characters, places, zones, factions) answer
+``If-None-Match`` with 304 and accept ``?since=<revision>`` for deltas; see
+``nexus.api.reader_revisions``.
+
 Queries are written against the LIVE database schema (``psql -d save_NN -c
 '\\d+ <table>'``), not the retired Drizzle typings, which had drifted
 (e.g. ``characters.current_location`` is live bigint; the live ``factions``
@@ -21,12 +25,13 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 
 from nexus.agents.orrery.reconstruction import playable_narrative_predicate
-from nexus.api.db_pool import get_connection
+from nexus.api.db_pool import get_async_connection
+from nexus.api.reader_revisions import serve_feed
 from nexus.api.slot_utils import require_slot_dbname
 
 logger = logging.getLogger("nexus.api.reader_endpoints")
@@ -54,12 +59,17 @@ def resolve_dbname(slot: Optional[int]) -> str:
         raise HTTPException(status_code=500, detail=str(exc))
 
 
-def _fetch_all(dbname: str, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
-    """Run a read query against a slot database, returning dict rows."""
-    with get_connection(dbname, dict_cursor=True) as conn:
-        with conn.cursor() as cur:
-            cur.execute(query, params)
-            return [dict(row) for row in cur.fetchall()]
+async def _fetch_all(
+    dbname: str, query: str, params: tuple = ()
+) -> List[Dict[str, Any]]:
+    """Run a read query against a slot database, returning dict rows.
+
+    Goes through the slot's async pool so a slow read never stalls the
+    gateway event loop (and with it ``/ws/narrative`` progress frames).
+    Queries use asyncpg's ``$1``-style placeholders.
+    """
+    async with get_async_connection(dbname) as conn:
+        return [dict(row) for row in await conn.fetch(query, *params)]
 
 
 _CHUNK_SELECT = """
@@ -130,7 +140,7 @@ async def status() -> Dict[str, str]:
 async def get_seasons(slot: Optional[int] = None) -> List[Dict[str, Any]]:
     """All seasons, ordered by id."""
     dbname = resolve_dbname(slot)
-    rows = _fetch_all(dbname, "SELECT id, summary FROM seasons ORDER BY id")
+    rows = await _fetch_all(dbname, "SELECT id, summary FROM seasons ORDER BY id")
     return [{"id": row["id"], "summary": row["summary"]} for row in rows]
 
 
@@ -140,12 +150,12 @@ async def get_episodes(
 ) -> List[Dict[str, Any]]:
     """Episodes for a season, ordered by episode number."""
     dbname = resolve_dbname(slot)
-    rows = _fetch_all(
+    rows = await _fetch_all(
         dbname,
         """
         SELECT season, episode, chunk_span::text AS chunk_span, summary
         FROM episodes
-        WHERE season = %s
+        WHERE season = $1
         ORDER BY episode
         """,
         (season_id,),
@@ -165,7 +175,7 @@ async def get_episodes(
 async def get_latest_chunk(slot: Optional[int] = None) -> Dict[str, Any]:
     """The newest committed chunk (with metadata). 404 when none exist."""
     dbname = resolve_dbname(slot)
-    rows = _fetch_all(
+    rows = await _fetch_all(
         dbname,
         _CHUNK_SELECT
         + f"""
@@ -181,22 +191,34 @@ async def get_latest_chunk(slot: Optional[int] = None) -> Dict[str, Any]:
     return _chunk_payload(rows[0])
 
 
-@router.get("/api/narrative/outline")
-async def get_outline(slot: Optional[int] = None) -> List[Dict[str, Any]]:
-    """Story outline: metadata coordinates per committed chunk, story order.
+def _id_filter(column: str, ids: Optional[Sequence[int]], params: List[Any]) -> str:
+    """SQL condition restricting ``column`` to ``ids`` (TRUE when None).
 
-    Powers the right-rail story tree without shipping chunk prose.
+    Appends the id array to ``params`` so the placeholder number follows
+    whatever the caller has already bound.
     """
-    dbname = resolve_dbname(slot)
-    rows = _fetch_all(
+    if ids is None:
+        return "TRUE"
+    params.append(list(ids))
+    return f"{column} = ANY(${len(params)}::bigint[])"
+
+
+async def _load_outline(
+    dbname: str, ids: Optional[Sequence[int]] = None
+) -> List[Dict[str, Any]]:
+    params: List[Any] = []
+    id_filter = _id_filter("cm.chunk_id", ids, params)
+    rows = await _fetch_all(
         dbname,
         f"""
         SELECT cm.chunk_id, cm.season, cm.episode, cm.scene, cm.slug
         FROM chunk_metadata cm
         JOIN narrative_chunks nc ON nc.id = cm.chunk_id
         WHERE {playable_narrative_predicate()}
+          AND {id_filter}
         ORDER BY cm.chunk_id
         """,
+        tuple(params),
     )
     return [
         {
@@ -210,33 +232,47 @@ async def get_outline(slot: Optional[int] = None) -> List[Dict[str, Any]]:
     ]
 
 
+@router.get("/api/narrative/outline")
+async def get_outline(
+    request: Request, since: Optional[str] = None, slot: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Story outline: metadata coordinates per committed chunk, story order.
+
+    Powers the right-rail story tree without shipping chunk prose.
+    """
+    dbname = resolve_dbname(slot)
+    return await serve_feed(
+        request, dbname, "outline", since, lambda ids: _load_outline(dbname, ids)
+    )
+
+
 @router.get("/api/narrative/chunks/{chunk_id}/adjacent")
 async def get_adjacent_chunks(
     chunk_id: int, slot: Optional[int] = None
 ) -> Dict[str, Any]:
     """Previous and next committed chunks around a chunk id."""
     dbname = resolve_dbname(slot)
-    previous_rows = _fetch_all(
+    previous_rows = await _fetch_all(
         dbname,
         _CHUNK_SELECT
         + f"""
         FROM narrative_chunks nc
         JOIN chunk_metadata cm ON cm.chunk_id = nc.id
         WHERE {playable_narrative_predicate()}
-          AND nc.id < %s
+          AND nc.id < $1
         ORDER BY nc.id DESC
         LIMIT 1
         """,
         (chunk_id,),
     )
-    next_rows = _fetch_all(
+    next_rows = await _fetch_all(
         dbname,
         _CHUNK_SELECT
         + f"""
         FROM narrative_chunks nc
         JOIN chunk_metadata cm ON cm.chunk_id = nc.id
         WHERE {playable_narrative_predicate()}
-          AND nc.id > %s
+          AND nc.id > $1
         ORDER BY nc.id ASC
         LIMIT 1
         """,
@@ -257,24 +293,24 @@ async def get_chunk_context(
     Powers the reader's location header and the Session Ledger scene cast.
     """
     dbname = resolve_dbname(slot)
-    character_rows = _fetch_all(
+    character_rows = await _fetch_all(
         dbname,
         """
         SELECT c.id, c.name, ccr.reference::text AS reference
         FROM chunk_character_references ccr
         JOIN characters c ON c.id = ccr.character_id
-        WHERE ccr.chunk_id = %s
+        WHERE ccr.chunk_id = $1
         ORDER BY (ccr.reference = 'present') DESC, c.id ASC
         """,
         (chunk_id,),
     )
-    place_rows = _fetch_all(
+    place_rows = await _fetch_all(
         dbname,
         """
         SELECT p.id, p.name, pcr.reference_type::text AS reference_type
         FROM place_chunk_references pcr
         JOIN places p ON p.id = pcr.place_id
-        WHERE pcr.chunk_id = %s
+        WHERE pcr.chunk_id = $1
         ORDER BY (pcr.reference_type = 'setting') DESC, p.id ASC
         """,
         (chunk_id,),
@@ -305,27 +341,27 @@ async def get_chunks_by_season_and_episode(
 ) -> Dict[str, Any]:
     """Chunks for a season/episode with pagination."""
     dbname = resolve_dbname(slot)
-    rows = _fetch_all(
+    rows = await _fetch_all(
         dbname,
         _CHUNK_SELECT
         + f"""
         FROM narrative_chunks nc
         LEFT JOIN chunk_metadata cm ON cm.chunk_id = nc.id
         WHERE {playable_narrative_predicate()}
-          AND cm.season = %s AND cm.episode = %s
+          AND cm.season = $1 AND cm.episode = $2
         ORDER BY nc.id
-        LIMIT %s OFFSET %s
+        LIMIT $3 OFFSET $4
         """,
         (season_id, episode_id, limit, offset),
     )
-    count_rows = _fetch_all(
+    count_rows = await _fetch_all(
         dbname,
         f"""
         SELECT count(*) AS count
         FROM narrative_chunks nc
         LEFT JOIN chunk_metadata cm ON cm.chunk_id = nc.id
         WHERE {playable_narrative_predicate()}
-          AND cm.season = %s AND cm.episode = %s
+          AND cm.season = $1 AND cm.episode = $2
         """,
         (season_id, episode_id),
     )
@@ -343,14 +379,14 @@ async def get_chunk_by_id(chunk_id: int, slot: Optional[int] = None) -> Dict[str
     historical reading.
     """
     dbname = resolve_dbname(slot)
-    rows = _fetch_all(
+    rows = await _fetch_all(
         dbname,
         _CHUNK_SELECT
         + f"""
         FROM narrative_chunks nc
         JOIN chunk_metadata cm ON cm.chunk_id = nc.id
         WHERE {playable_narrative_predicate()}
-          AND nc.id = %s
+          AND nc.id = $1
         """,
         (chunk_id,),
     )
@@ -364,28 +400,21 @@ async def get_chunk_by_id(chunk_id: int, slot: Optional[int] = None) -> Dict[str
 # ---------------------------------------------------------------------------
 
 
-@router.get("/api/characters")
-async def get_characters(
-    startId: Optional[int] = None,
-    endId: Optional[int] = None,
-    slot: Optional[int] = None,
+async def _load_characters(
+    dbname: str,
+    ids: Optional[Sequence[int]] = None,
+    start_id: Optional[int] = None,
+    end_id: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
-    """All characters with resolved location name and display portrait.
-
-    The current-location place name is resolved server-side and each
-    character's display portrait (main first, then display order) is picked
-    in the same query so the cast pane needs no second fetch per row.
-    """
-    dbname = resolve_dbname(slot)
-    conditions = ["TRUE"]
     params: List[Any] = []
-    if startId is not None:
-        conditions.append("c.id >= %s")
-        params.append(startId)
-    if endId is not None:
-        conditions.append("c.id <= %s")
-        params.append(endId)
-    rows = _fetch_all(
+    conditions = [_id_filter("c.id", ids, params)]
+    if start_id is not None:
+        params.append(start_id)
+        conditions.append(f"c.id >= ${len(params)}")
+    if end_id is not None:
+        params.append(end_id)
+        conditions.append(f"c.id <= ${len(params)}")
+    rows = await _fetch_all(
         dbname,
         f"""
         SELECT
@@ -443,22 +472,46 @@ async def get_characters(
     ]
 
 
+@router.get("/api/characters")
+async def get_characters(
+    request: Request,
+    startId: Optional[int] = None,
+    endId: Optional[int] = None,
+    since: Optional[str] = None,
+    slot: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """All characters with resolved location name and display portrait.
+
+    The current-location place name is resolved server-side and each
+    character's display portrait (main first, then display order) is picked
+    in the same query so the cast pane needs no second fetch per row.
+    """
+    dbname = resolve_dbname(slot)
+    return await serve_feed(
+        request,
+        dbname,
+        "characters",
+        since,
+        lambda ids: _load_characters(dbname, ids, startId, endId),
+    )
+
+
 @router.get("/api/characters/{character_id}/relationships")
 async def get_character_relationships(
     character_id: int, slot: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """All relationship rows where the character appears on either side."""
     dbname = resolve_dbname(slot)
-    rows = _fetch_all(
+    rows = await _fetch_all(
         dbname,
         """
         SELECT character1_id, character2_id, relationship_type,
                emotional_valence, dynamic, recent_events, history,
                extra_data, created_at, updated_at
         FROM character_relationships
-        WHERE character1_id = %s OR character2_id = %s
+        WHERE character1_id = $1 OR character2_id = $1
         """,
-        (character_id, character_id),
+        (character_id,),
     )
     return [
         {
@@ -483,7 +536,7 @@ async def get_character_psychology(
 ) -> Dict[str, Any]:
     """Character psychology profile. 404 when absent."""
     dbname = resolve_dbname(slot)
-    rows = _fetch_all(
+    rows = await _fetch_all(
         dbname,
         """
         SELECT character_id, self_concept, behavior, cognitive_framework,
@@ -491,7 +544,7 @@ async def get_character_psychology(
                character_arc, secrets, validation_evidence,
                created_at, updated_at
         FROM character_psychology
-        WHERE character_id = %s
+        WHERE character_id = $1
         LIMIT 1
         """,
         (character_id,),
@@ -520,13 +573,14 @@ async def get_character_psychology(
 # ---------------------------------------------------------------------------
 
 
-@router.get("/api/places")
-async def get_places(slot: Optional[int] = None) -> List[Dict[str, Any]]:
-    """All places, with coordinates extracted as GeoJSON from PostGIS."""
-    dbname = resolve_dbname(slot)
-    rows = _fetch_all(
+async def _load_places(
+    dbname: str, ids: Optional[Sequence[int]] = None
+) -> List[Dict[str, Any]]:
+    params: List[Any] = []
+    id_filter = _id_filter("id", ids, params)
+    rows = await _fetch_all(
         dbname,
-        """
+        f"""
         SELECT
             id,
             name,
@@ -542,8 +596,10 @@ async def get_places(slot: Optional[int] = None) -> List[Dict[str, Any]]:
             updated_at,
             ST_AsGeoJSON(coordinates)::json AS geometry
         FROM places
+        WHERE {id_filter}
         ORDER BY id
         """,
+        tuple(params),
     )
     return [
         {
@@ -565,6 +621,31 @@ async def get_places(slot: Optional[int] = None) -> List[Dict[str, Any]]:
     ]
 
 
+@router.get("/api/places")
+async def get_places(
+    request: Request, since: Optional[str] = None, slot: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """All places, with coordinates extracted as GeoJSON from PostGIS."""
+    dbname = resolve_dbname(slot)
+    return await serve_feed(
+        request, dbname, "places", since, lambda ids: _load_places(dbname, ids)
+    )
+
+
+@router.get("/api/places/{place_id}")
+async def get_place(place_id: int, slot: Optional[int] = None) -> Dict[str, Any]:
+    """One place with its detail fields, loaded when the map opens it.
+
+    The viewport routes in ``nexus.api.map_endpoints`` ship only id, name,
+    type and geometry. 404 when absent.
+    """
+    dbname = resolve_dbname(slot)
+    rows = await _load_places(dbname, [place_id])
+    if not rows:
+        raise HTTPException(status_code=404, detail=f"Place {place_id} not found")
+    return rows[0]
+
+
 @router.get("/api/current-place")
 async def get_current_place(slot: Optional[int] = None) -> Dict[str, Any]:
     """The narrative's current location (read-only).
@@ -575,7 +656,7 @@ async def get_current_place(slot: Optional[int] = None) -> Dict[str, Any]:
     no setting references yet.
     """
     dbname = resolve_dbname(slot)
-    rows = _fetch_all(
+    rows = await _fetch_all(
         dbname,
         """
         SELECT pcr.place_id, p.name, pcr.chunk_id
@@ -593,17 +674,20 @@ async def get_current_place(slot: Optional[int] = None) -> Dict[str, Any]:
     return {"placeId": row["place_id"], "name": row["name"], "chunkId": row["chunk_id"]}
 
 
-@router.get("/api/zones")
-async def get_zones(slot: Optional[int] = None) -> List[Dict[str, Any]]:
-    """All zones, boundary served as GeoJSON (raw geometry is EWKB hex)."""
-    dbname = resolve_dbname(slot)
-    rows = _fetch_all(
+async def _load_zones(
+    dbname: str, ids: Optional[Sequence[int]] = None
+) -> List[Dict[str, Any]]:
+    params: List[Any] = []
+    id_filter = _id_filter("id", ids, params)
+    rows = await _fetch_all(
         dbname,
-        """
+        f"""
         SELECT id, name, summary, ST_AsGeoJSON(boundary)::json AS boundary
         FROM zones
+        WHERE {id_filter}
         ORDER BY id
         """,
+        tuple(params),
     )
     return [
         {
@@ -616,18 +700,32 @@ async def get_zones(slot: Optional[int] = None) -> List[Dict[str, Any]]:
     ]
 
 
-@router.get("/api/factions")
-async def get_factions(slot: Optional[int] = None) -> List[Dict[str, Any]]:
-    """All factions (live schema: the Drizzle-era columns were dropped)."""
+@router.get("/api/zones")
+async def get_zones(
+    request: Request, since: Optional[str] = None, slot: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """All zones, boundary served as GeoJSON (raw geometry is EWKB hex)."""
     dbname = resolve_dbname(slot)
-    rows = _fetch_all(
+    return await serve_feed(
+        request, dbname, "zones", since, lambda ids: _load_zones(dbname, ids)
+    )
+
+
+async def _load_factions(
+    dbname: str, ids: Optional[Sequence[int]] = None
+) -> List[Dict[str, Any]]:
+    params: List[Any] = []
+    id_filter = _id_filter("id", ids, params)
+    rows = await _fetch_all(
         dbname,
-        """
+        f"""
         SELECT id, name, summary, primary_location, extra_data,
                created_at, updated_at
         FROM factions
+        WHERE {id_filter}
         ORDER BY id
         """,
+        tuple(params),
     )
     return [
         {
@@ -641,3 +739,14 @@ async def get_factions(slot: Optional[int] = None) -> List[Dict[str, Any]]:
         }
         for row in rows
     ]
+
+
+@router.get("/api/factions")
+async def get_factions(
+    request: Request, since: Optional[str] = None, slot: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """All factions (live schema: the Drizzle-era columns were dropped)."""
+    dbname = resolve_dbname(slot)
+    return await serve_feed(
+        request, dbname, "factions", since, lambda ids: _load_factions(dbname, ids)
+    )
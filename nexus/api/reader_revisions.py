@@ -0,0 +1,214 @@
+"""Conditional GET and ``?since=`` deltas for the IRIS reader feeds.
+
+The Map and Characters panes re-fetch ``/api/places``, ``/api/characters``,
+``/api/factions``, ``/api/zones`` and ``/api/narrative/outline`` on every
+navigation, although those rows only change when something writes the slot.
+Migration 114 installs ``reader_changes``: AFTER ROW triggers on each feed's
+source tables record the writing transaction id per feed row, so every
+writer (the chunk commit path, Orrery ticks, asset uploads, new-story
+resets) invalidates without an explicit bump and without a shared counter
+row for concurrent writers to lock.
+
+Two values are derived from that log per request:
+
+* an ETag - a fingerprint of the feed's change rows. Any committed write
+  either adds a row or restamps one with a new transaction id, so the
+  fingerprint moves exactly when the served rows can have changed; a match
+  is answered with 304 before the feed query (and its ``ST_AsGeoJSON``)
+  runs.
+* a revision token ``<db oid>.<xmin>`` - the reader's snapshot horizon.
+  Every transaction that can commit after the read has an id at or above
+  that horizon, so ``?since=<token>`` returning rows stamped ``>= xmin``
+  never misses a late commit (it may resend a few rows, which is harmless).
+  The database oid makes tokens from a dropped and recreated slot fall back
+  to a full payload instead of a wrong delta.
+
+Slots without migration 114 are served exactly as before, minus the
+conditional headers.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from nexus.api.db_pool import get_async_connection
+
+logger = logging.getLogger("nexus.api.reader_revisions")
+
+REVISION_HEADER = "X-Nexus-Revision"
+
+# Change-log feeds each served feed depends on. The cast pane resolves the
+# current-location place name inline, so a place rename changes it too.
+FEED_SOURCES: Dict[str, List[str]] = {
+    "places": ["places"],
+    "characters": ["characters", "places"],
+    "factions": ["factions"],
+    "zones": ["zones"],
+    "outline": ["outline"],
+}
+
+_CHANGED_ROWS_SQL = """
+    SELECT row_id FROM reader_changes WHERE feed = $1 AND changed_xid >= $2
+"""
+
+# Characters whose resolved location name moved with a place write.
+_CHANGED_CHARACTER_LOCATIONS_SQL = """
+    UNION
+    SELECT c.id
+    FROM characters c
+    JOIN reader_changes rc
+      ON rc.feed = 'places' AND rc.row_id = c.current_location
+    WHERE rc.changed_xid >= $2
+"""
+
+_PROBE_SQL = """
+    SELECT
+        (SELECT oid FROM pg_database WHERE datname = current_database())::bigint
+            AS db_oid,
+        pg_snapshot_xmin(pg_current_snapshot())::text::bigint AS horizon,
+        count(*) AS changes,
+        COALESCE(max(changed_xid), 0) AS newest,
+        COALESCE(sum(changed_xid), 0)::text AS checksum
+    FROM reader_changes
+    WHERE feed = ANY($1::text[])
+"""
+
+FeedLoader = Callable[[Optional[Sequence[int]]], Awaitable[List[Dict[str, Any]]]]
+
+
+@dataclass(frozen=True)
+class FeedRevision:
+    """One feed's change-log state as seen by a single read."""
+
+    feed: str
+    db_oid: int
+    horizon: int
+    fingerprint: str
+
+    @property
+    def token(self) -> str:
+        """Opaque ``?since=`` value for deltas after this read."""
+        return f"{self.db_oid}.{self.horizon}"
+
+    @property
+    def etag(self) -> str:
+        return f'W/"{self.feed}-{self.fingerprint}"'
+
+    def since_horizon(self, since: str) -> Optional[int]:
+        """Horizon encoded in a ``since`` token, or None if it is unusable.
+
+        Malformed tokens, tokens from another database incarnation and
+        tokens from the future all degrade to a full payload.
+        """
+        db_oid, _, horizon = since.partition(".")
+        try:
+            parsed_oid, parsed_horizon = int(db_oid), int(horizon)
+        except ValueError:
+            return None
+        if parsed_oid != self.db_oid or parsed_horizon > self.horizon:
+            return None
+        return parsed_horizon
+
+
+async def probe_feed_revision(dbname: str, feed: str) -> Optional[FeedRevision]:
+    """Read a feed's revision; None when the slot predates migration 114."""
+    async with get_async_connection(dbname) as conn:
+        if await conn.fetchval("SELECT to_regclass('reader_changes')") is None:
+            return None
+        row = await conn.fetchrow(_PROBE_SQL, FEED_SOURCES[feed])
+    digest = hashlib.sha1(
+        f"{row['db_oid']}:{row['changes']}:{row['newest']}:{row['checksum']}".encode()
+    ).hexdigest()[:16]
+    return FeedRevision(
+        feed=feed,
+        db_oid=row["db_oid"],
+        horizon=row["horizon"],
+        fingerprint=digest,
+    )
+
+
+async def changed_row_ids(dbname: str, feed: str, horizon: int) -> List[int]:
+    """Feed row keys written by any transaction at or after ``horizon``."""
+    query = _CHANGED_ROWS_SQL
+    if feed == "characters":
+        query += _CHANGED_CHARACTER_LOCATIONS_SQL
+    async with get_async_connection(dbname) as conn:
+        rows = await conn.fetch(query, feed, horizon)
+    return sorted(row["row_id"] for row in rows)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak If-None-Match comparison (RFC 9110 section 13.1.2)."""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def _json(content: Any, headers: Dict[str, str]) -> JSONResponse:
+    return JSONResponse(content=jsonable_encoder(content), headers=headers)
+
+
+async def serve_feed(
+    request: Request,
+    dbname: str,
+    feed: str,
+    since: Optional[str],
+    load: FeedLoader,
+) -> Response:
+    """Answer a reader feed request as a 304, a delta, or a full payload.
+
+    ``load(None)`` must return the full feed; ``load(ids)`` only the rows
+    whose wire ``id`` is in ``ids``. The revision is probed before any rows
+    are read, so the ETag and token never claim a newer state than the
+    payload they travel with.
+    """
+    revision = await probe_feed_revision(dbname, feed)
+    if revision is None:
+        rows = await load(None)
+        if since is None:
+            return _json(rows, {})
+        return _json(
+            {"revision": None, "full": True, "changed": rows, "removed": []}, {}
+        )
+
+    headers = {
+        "ETag": revision.etag,
+        REVISION_HEADER: revision.token,
+        # Browsers revalidate every time instead of serving a stale heuristic.
+        "Cache-Control": "no-cache",
+    }
+    if since is None:
+        if etag_matches(request.headers.get("if-none-match"), revision.etag):
+            return Response(status_code=304, headers=headers)
+        return _json(await load(None), headers)
+
+    del headers["ETag"]
+    horizon = revision.since_horizon(since)
+    if horizon is None:
+        changed, removed = await load(None), []
+    else:
+        ids = await changed_row_ids(dbname, feed, horizon)
+        changed = await load(ids) if ids else []
+        present = {row["id"] for row in changed}
+        removed = [row_id for row_id in ids if row_id not in present]
+    return _json(
+        {
+            "revision": revision.token,
+            "full": horizon is None,
+            "changed": changed,
+            "removed": removed,
+        },
+        headers,
+    )
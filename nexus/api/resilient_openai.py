@@ -20,9 +20,9 @@ from nexus.api.retry_handler import (
     RetryConfig,
     OPENAI_RETRY_CONFIG,
     calculate_backoff_delay,
-    openai_rate_limiter,
     openai_circuit_breaker,
 )
+from nexus.api.rate_governor import governed_async_http_client, governed_http_client
 
 logger = logging.getLogger("nexus.api.resilient_openai")
 
@@ -33,7 +33,7 @@ class ResilientOpenAI:
 
     This class proxies all calls to the underlying OpenAI client and adds:
     - Exponential backoff retries for transient failures
-    - Rate limiting protection
+    - Provider/model rate governance (nexus.api.rate_governor)
     - Circuit breaker pattern for service degradation
     - Detailed logging of retry attempts
     """
@@ -47,7 +47,11 @@ class ResilientOpenAI:
             config: Optional retry configuration (uses OPENAI_RETRY_CONFIG by default)
         """
         self.config = config or OPENAI_RETRY_CONFIG
-        self._client = openai.OpenAI(api_key=api_key)
+        # Rate limiting happens in the HTTP transport, so every attempt
+        # (including the SDK's own retries) waits on the shared governor.
+        self._client = openai.OpenAI(
+            api_key=api_key, http_client=governed_http_client("openai")
+        )
 
     def __getattr__(self, name: str) -> Any:
         """
@@ -89,9 +93,6 @@ class ResilientOpenAI:
                         if not openai_circuit_breaker._should_attempt_reset():
                             raise RuntimeError(f"Circuit breaker is OPEN for OpenAI API")
 
-                    # Apply rate limiting
-                    openai_rate_limiter.wait_if_needed()
-
                     # Make the actual API call
                     result = func(*args, **kwargs)
 
@@ -179,9 +180,6 @@ class ResilientWrapper:
 
             for attempt in range(self._config.max_retries + 1):
                 try:
-                    # Apply rate limiting
-                    openai_rate_limiter.wait_if_needed()
-
                     # Make the actual API call
                     return func(*args, **kwargs)
 
@@ -229,7 +227,9 @@ class AsyncResilientOpenAI:
             config: Optional retry configuration (uses OPENAI_RETRY_CONFIG by default)
         """
         self.config = config or OPENAI_RETRY_CONFIG
-        self._client = openai.AsyncOpenAI(api_key=api_key)
+        self._client = openai.AsyncOpenAI(
+            api_key=api_key, http_client=governed_async_http_client("openai")
+        )
 
     def __getattr__(self, name: str) -> Any:
         """
@@ -262,9 +262,6 @@ class AsyncResilientOpenAI:
                         if not openai_circuit_breaker._should_attempt_reset():
                             raise RuntimeError(f"Circuit breaker is OPEN for OpenAI API")
 
-                    # Apply async rate limiting
-                    await openai_rate_limiter.wait_if_needed_async()
-
                     # Make the actual API call
                     result = await func(*args, **kwargs)
 
@@ -344,9 +341,6 @@ class AsyncResilientWrapper:
 
             for attempt in range(self._config.max_retries + 1):
                 try:
-                    # Apply async rate limiting
-                    await openai_rate_limiter.wait_if_needed_async()
-
                     # Make the actual API call
                     return await func(*args, **kwargs)
 
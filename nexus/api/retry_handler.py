@@ -68,41 +68,6 @@ EMBEDDING_RETRY_CONFIG = RetryConfig(
 )
 
 
-class RateLimiter:
-    """Simple rate limiter for API calls."""
-
-    def __init__(self, calls_per_minute: int = 60):
-        self.calls_per_minute = calls_per_minute
-        self.min_interval = 60.0 / calls_per_minute
-        self.last_call_time = 0.0
-        self._lock = asyncio.Lock() if asyncio.get_event_loop().is_running() else None
-
-    async def wait_if_needed_async(self) -> None:
-        """Async version of rate limiting."""
-        if self._lock:
-            async with self._lock:
-                current_time = time.time()
-                time_since_last_call = current_time - self.last_call_time
-                if time_since_last_call < self.min_interval:
-                    wait_time = self.min_interval - time_since_last_call
-                    await asyncio.sleep(wait_time)
-                self.last_call_time = time.time()
-
-    def wait_if_needed(self) -> None:
-        """Synchronous version of rate limiting."""
-        current_time = time.time()
-        time_since_last_call = current_time - self.last_call_time
-        if time_since_last_call < self.min_interval:
-            wait_time = self.min_interval - time_since_last_call
-            time.sleep(wait_time)
-        self.last_call_time = time.time()
-
-
-# Global rate limiters
-openai_rate_limiter = RateLimiter(calls_per_minute=50)  # Conservative default
-embedding_rate_limiter = RateLimiter(calls_per_minute=30)
-
-
 def calculate_backoff_delay(
     attempt: int,
     config: RetryConfig,
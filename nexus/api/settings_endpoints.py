@@ -12,14 +12,19 @@ PATCH accepts a typed subset of safe-to-edit keys and persists them through
 against the Pydantic Settings model and preserves comments/formatting via
 tomlkit. Keys outside this subset (active embedding model, test database
 suffix, reranker paths, ...) are intentionally not writable from the UI.
+
+File reads and the read-merge-write run in the threadpool so a slow disk
+never stalls the gateway event loop during a turn.
 """
 
 import logging
 import re
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
 
 from fastapi import APIRouter, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 # Python 3.11+ ships tomllib; mirror the loader's fallback for older runtimes.
@@ -45,6 +50,10 @@ NEXUS_TOML = Path("nexus.toml")
 
 ThemeId = Literal["veil", "gilded", "vector"]
 
+# Serializes the read-merge-write in patch_settings now that it runs off the
+# event loop (which used to serialize it implicitly).
+_SETTINGS_WRITE_LOCK = threading.Lock()
+
 
 class FontSlotsPatch(BaseModel):
     """Partial font slot update for one theme.
@@ -241,24 +250,31 @@ async def head_settings() -> Response:
     Raises - and therefore returns 500 - if the config file is unreadable,
     matching the retired Express behavior.
     """
-    _read_raw_settings()
+    await run_in_threadpool(_read_raw_settings)
     return Response(status_code=200)
 
 
 @router.get("")
 async def get_settings() -> Dict[str, Any]:
     """Serve the full settings payload for the React client."""
-    return _build_payload(_read_raw_settings())
+    return _build_payload(await run_in_threadpool(_read_raw_settings))
+
+
+def _save_and_reload(updates: Dict[str, Any]) -> Dict[str, Any]:
+    """Persist updates and re-read nexus.toml under the write lock."""
+    with _SETTINGS_WRITE_LOCK:
+        save_settings(updates, path=NEXUS_TOML)
+        return _read_raw_settings()
 
 
 @router.patch("")
 async def patch_settings(patch: SettingsPatchRequest) -> Dict[str, Any]:
     """Persist a safe-subset settings update and return the fresh payload.
 
-    Concurrency posture: save_settings does an unlocked read-merge-write on
-    nexus.toml. That is safe for the deployed shape - a single-operator app
-    on a single-worker uvicorn process, where the event loop serializes
-    handlers. Running this API with multiple workers would reintroduce a
+    Concurrency posture: save_settings does a read-merge-write on
+    nexus.toml, serialized here by an in-process lock. That is safe for the
+    deployed shape - a single-operator app on a single-worker uvicorn
+    process. Running this API with multiple workers would reintroduce a
     lost-update race and would need file locking here first.
     """
     updates = _updates_from_patch(patch)
@@ -266,11 +282,11 @@ async def patch_settings(patch: SettingsPatchRequest) -> Dict[str, Any]:
         raise HTTPException(status_code=400, detail="No supported settings provided")
 
     try:
-        save_settings(updates, path=NEXUS_TOML)
+        raw = await run_in_threadpool(_save_and_reload, updates)
     except ValidationError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
 
     logger.info("Applied settings update: %s", sorted(updates))
-    return _build_payload(_read_raw_settings())
+    return _build_payload(raw)
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Callable, List, Literal, Optional, Sequence
+from typing import Callable, Dict, List, Literal, Optional, Sequence
 
 from nexus.api.slot_utils import slot_dbname
 
@@ -20,6 +21,11 @@ from scripts.summarize_narrative import (
 logger = logging.getLogger("nexus.api.summary_triggers")
 _EXECUTOR = ThreadPoolExecutor(max_workers=2)
 
+# One DatabaseManager (and so one engine pool) per database URL, shared by
+# every summary task and digest job against that database.
+_db_managers: Dict[Optional[str], DatabaseManager] = {}
+_db_managers_lock = threading.Lock()
+
 
 @dataclass(frozen=True)
 class SummaryTask:
@@ -110,6 +116,84 @@ def schedule_summary_generation(
         runner()
 
 
+def refresh_chunk_digests(
+    chunk_id: int,
+    *,
+    slot: Optional[int] = None,
+    model_candidates: Optional[Sequence[str]] = None,
+    db_manager_factory: Optional[Callable[[], DatabaseManager]] = None,
+    generator_cls: Callable[..., SummaryGenerator] = SummaryGenerator,
+) -> int:
+    """
+    Digest the closed scene windows of a committed chunk's episode.
+
+    Runs inline (the post-commit job runner owns threading and retries) and
+    raises on failure so the job is retried. Windows already digested with
+    the same content are skipped, so replays are cheap.
+
+    Returns:
+        Number of windows whose digests are now current.
+    """
+    db_manager = _open_db_manager(slot, db_manager_factory)
+    position = db_manager.get_chunk_position(chunk_id)
+    if position is None:
+        logger.info("Chunk %s has no season/episode yet; nothing to digest", chunk_id)
+        return 0
+    season, episode = position
+    models = [
+        m for m in _coalesce_models(model_candidates) if _summary_model_is_registered(m)
+    ]
+    if not models:
+        raise ValueError(
+            "No narrative summary model is declared in nexus.toml's "
+            "[global.model.api_models] registry"
+        )
+    generator = generator_cls(
+        model=models[0],
+        db_manager=db_manager,
+        overwrite=False,
+        verbose=False,
+        save_prompt=False,
+        prompt_on_conflict=False,
+    )
+    return len(generator.refresh_scene_digests(season, episode))
+
+
+def _open_db_manager(
+    slot: Optional[int],
+    db_manager_factory: Optional[Callable[[], DatabaseManager]],
+) -> DatabaseManager:
+    if db_manager_factory:
+        return db_manager_factory()
+    db_url = None
+    if slot:
+        dbname = slot_dbname(slot)
+        user = os.environ.get("DB_USER", "pythagor")
+        password = os.environ.get("DB_PASSWORD", "")
+        host = os.environ.get("DB_HOST", "localhost")
+        port = os.environ.get("DB_PORT", "5432")
+
+        if password:
+            db_url = f"postgresql://{user}:{password}@{host}:{port}/{dbname}"
+        else:
+            db_url = f"postgresql://{user}@{host}:{port}/{dbname}"
+
+    with _db_managers_lock:
+        db_manager = _db_managers.get(db_url)
+        if db_manager is None:
+            db_manager = _db_managers[db_url] = DatabaseManager(db_url=db_url)
+    return db_manager
+
+
+def dispose_db_managers() -> None:
+    """Dispose the cached summary database engines (for shutdown and tests)."""
+    with _db_managers_lock:
+        managers = list(_db_managers.values())
+        _db_managers.clear()
+    for db_manager in managers:
+        db_manager.engine.dispose()
+
+
 def _run_summary_generation(
     tasks: Sequence[SummaryTask],
     model_candidates: Sequence[str],
@@ -119,23 +203,7 @@ def _run_summary_generation(
     generator_cls: Callable[..., SummaryGenerator] = SummaryGenerator,
 ) -> None:
     try:
-        if db_manager_factory:
-            db_manager = db_manager_factory()
-        else:
-            db_url = None
-            if slot:
-                dbname = slot_dbname(slot)
-                user = os.environ.get("DB_USER", "pythagor")
-                password = os.environ.get("DB_PASSWORD", "")
-                host = os.environ.get("DB_HOST", "localhost")
-                port = os.environ.get("DB_PORT", "5432")
-
-                if password:
-                    db_url = f"postgresql://{user}:{password}@{host}:{port}/{dbname}"
-                else:
-                    db_url = f"postgresql://{user}@{host}:{port}/{dbname}"
-
-            db_manager = DatabaseManager(db_url=db_url)
+        db_manager = _open_db_manager(slot, db_manager_factory)
     except Exception as exc:  # pragma: no cover - defensive logging
         logger.error(
             "Unable to start summary generation; database init failed: %s", exc
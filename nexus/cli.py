@@ -14,6 +14,7 @@ Commands:
     nexus retrograde-expand-seeds  Call Skald for non-mutating R6 expansion
     nexus retrograde-apply-expansion --slot N  Dry-run Retrograde persistence
     nexus retrograde-embed-history --slot N  Sync Retrograde summary retrieval
+    nexus retrograde-verify-graphs --slot N  Replay stored Retrograde graphs
     nexus record-revelation --slot N  Grant awareness of an existing claim
     nexus faction-audit --slot N  Dry-run legacy faction column migration audit
     nexus faction-manifest --slot N  Build reviewed faction migration manifest
@@ -565,6 +566,85 @@ def _print_retrograde_transition(retrograde: Dict[str, Any]) -> None:
         print(f"  timing {timing.get('stage')}: {timing.get('seconds'):.1f}s")
 
 
+def _print_interaction_audit(payload: Dict[str, Any]) -> None:
+    """Print an interaction replay parity audit in a compact CLI format."""
+
+    audit = payload.get("interaction_audit") or {}
+    print("Counters:")
+    for key in (
+        "interactions",
+        "matched",
+        "events_folded",
+        "snapshots_used",
+        "snapshots_written",
+    ):
+        print(f"  {key}: {audit.get(key, 0)}")
+    mismatched = audit.get("mismatched") or []
+    if mismatched:
+        print()
+        print("Replay differs from live state:")
+        for item in mismatched[:20]:
+            print(f"  - {item['interaction_id']}: {', '.join(item['fields'])}")
+    errors = audit.get("errors") or []
+    if errors:
+        print()
+        print("Replay errors:")
+        for item in errors[:20]:
+            print(f"  - {item['interaction_id']}: {item['error']}")
+
+
+def _print_retrograde_graph_verification(payload: Dict[str, Any]) -> None:
+    """Print a Retrograde candidate-graph replay audit."""
+
+    audit = payload.get("retrograde_graph_verification") or {}
+    print("Counters:")
+    for key in ("records", "matched", "workers", "elapsed_ms"):
+        print(f"  {key}: {audit.get(key, 0)}")
+    print(f"  current_schema_version: {audit.get('current_schema_version')}")
+    by_version = audit.get("by_schema_version") or {}
+    if by_version:
+        print()
+        print("By graph schema version:")
+        for version, counts in by_version.items():
+            print(
+                f"  - v{version}: {counts['match']}/{counts['records']} match, "
+                f"drift={counts['drift']}, corrupt={counts['corrupt']}, "
+                f"errors={counts['error']}"
+            )
+    profile = audit.get("build_profile") or []
+    if profile:
+        print()
+        print("Build time (entities x vocabulary):")
+        for row in profile:
+            print(
+                f"  - {row['entity_count']} x {row['vocabulary_count']}: "
+                f"mean={row['mean_ms']}ms max={row['max_ms']}ms "
+                f"({row['builds']} builds)"
+            )
+    for key, heading in (
+        ("regressions", "Rebuilt graph differs from stored graph:"),
+        (
+            "retired_mismatches",
+            "Rebuilt graph differs on a retired schema version (informational):",
+        ),
+    ):
+        mismatched = audit.get(key) or []
+        if mismatched:
+            print()
+            print(heading)
+            for item in mismatched[:20]:
+                print(
+                    f"  - {item['source']} {item['id']} "
+                    f"(v{item['schema_version']}): {item['status']}"
+                )
+    errors = audit.get("errors") or []
+    if errors:
+        print()
+        print("Rebuild errors:")
+        for item in errors[:20]:
+            print(f"  - {item['source']} {item['id']}: {item['error']}")
+
+
 def _print_faction_audit(payload: Dict[str, Any]) -> None:
     """Print a dry-run faction table migration audit in a compact CLI format."""
 
@@ -917,6 +997,10 @@ def emit_output(payload: Dict[str, Any], as_json: bool, truncate: bool = False)
         _print_usage(payload)
         return
 
+    if payload.get("sql_profile"):
+        _print_sql_profile(payload)
+        return
+
     # Display message/storyteller text
     message = payload.get("message") or payload.get("storyteller_text")
     if message:
@@ -947,10 +1031,18 @@ def emit_output(payload: Dict[str, Any], as_json: bool, truncate: bool = False)
         _print_retrograde_embed_history(payload)
         print()
 
+    if payload.get("retrograde_graph_verification"):
+        _print_retrograde_graph_verification(payload)
+        print()
+
     if payload.get("retrograde"):
         _print_retrograde_transition(payload["retrograde"])
         print()
 
+    if payload.get("interaction_audit"):
+        _print_interaction_audit(payload)
+        print()
+
     if payload.get("faction_audit"):
         _print_faction_audit(payload)
         print()
@@ -2193,6 +2285,46 @@ def run_retrograde_embed_history(args: argparse.Namespace) -> Dict[str, Any]:
     }
 
 
+def run_retrograde_verify_graphs(args: argparse.Namespace) -> Dict[str, Any]:
+    """Rebuild every stored Retrograde candidate graph and compare hashes."""
+
+    from nexus.agents.orrery.retrograde_graph_replay import (
+        load_graph_records,
+        packet_graph_record,
+        verify_graph_records,
+    )
+    from nexus.api.db_pool import get_connection
+    from nexus.api.slot_utils import slot_dbname
+
+    dbname = slot_dbname(args.slot)
+    try:
+        with get_connection(dbname, dict_cursor=True) as conn:
+            with conn.cursor() as cur:
+                cur.execute("SET TRANSACTION READ ONLY")
+                records = load_graph_records(cur)
+        for path in args.packet or ():
+            records.append(
+                packet_graph_record(_load_retrograde_packet_file(path), label=str(path))
+            )
+        audit = verify_graph_records(records, workers=args.workers)
+    except (OSError, ValueError, RuntimeError) as exc:
+        return {"success": False, "error": str(exc)}
+
+    return {
+        "success": True,
+        "message": (
+            f"Retrograde graph replay for slot {args.slot}: "
+            f"{audit['matched']}/{audit['records']} rebuild identically."
+        ),
+        "slot": args.slot,
+        "dbname": dbname,
+        "retrograde_graph_verification": audit,
+        # Drift on a retired schema version is expected after a deliberate
+        # bump and is reported, not failed.
+        "failed_policy": bool(audit["regressions"] or audit["errors"]),
+    }
+
+
 def run_record_revelation(
     args: argparse.Namespace, *, connection: Optional[Any] = None
 ) -> Dict[str, Any]:
@@ -2342,6 +2474,36 @@ def run_faction_audit(args: argparse.Namespace) -> Dict[str, Any]:
     }
 
 
+def run_audit_interactions(args: argparse.Namespace) -> Dict[str, Any]:
+    """Check interaction replay against live state for every thread in a slot."""
+
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.orm import Session
+
+    from nexus.api.slot_utils import get_slot_db_url
+    from nexus.interactions import audit_interactions
+
+    engine = create_engine(get_slot_db_url(slot=args.slot))
+    try:
+        with Session(engine) as session, session.begin():
+            if not args.checkpoint:
+                session.execute(text("SET TRANSACTION READ ONLY"))
+            audit = audit_interactions(session, checkpoint=args.checkpoint)
+    finally:
+        engine.dispose()
+
+    return {
+        "success": True,
+        "message": (
+            f"Interaction replay audit for slot {args.slot}: "
+            f"{audit['matched']}/{audit['interactions']} match live state."
+        ),
+        "slot": args.slot,
+        "interaction_audit": audit,
+        "failed_policy": bool(audit["mismatched"] or audit["errors"]),
+    }
+
+
 def run_faction_manifest(args: argparse.Namespace) -> Dict[str, Any]:
     """Build a read-only faction migration manifest from the audit output."""
 
@@ -3059,19 +3221,120 @@ def run_usage(args: argparse.Namespace) -> Dict[str, Any]:
 
 
 def run_jobs(args: argparse.Namespace) -> Dict[str, Any]:
-    """Return the durable Retrograde maturation queue for one slot."""
+    """Return the durable maturation and post-commit queues for one slot."""
 
     from nexus.agents.orrery.retrograde_maturation import (
         load_maturation_status_for_slot_sync,
     )
+    from nexus.api.post_commit_jobs import (
+        drain_post_commit_jobs_sync,
+        load_post_commit_status_for_slot_sync,
+    )
+    from nexus.api.slot_utils import require_slot_dbname
 
+    post_commit: Dict[str, Any] = {}
+    if getattr(args, "drain", False):
+        post_commit["drained"] = drain_post_commit_jobs_sync(
+            require_slot_dbname(slot=args.slot), slot=args.slot
+        ).as_dict()
+    post_commit.update(load_post_commit_status_for_slot_sync(args.slot))
     return {
         "success": True,
         "slot": args.slot,
         **load_maturation_status_for_slot_sync(args.slot),
+        "post_commit": post_commit,
     }
 
 
+def run_sql_profile(args: argparse.Namespace) -> Dict[str, Any]:
+    """Rank SQL statement tags for a live Orrery tick or recorded scopes."""
+
+    from nexus.telemetry.sql_profile import (
+        load_profile_reports,
+        summarize_profile_reports,
+    )
+
+    if args.recorded:
+        try:
+            reports = load_profile_reports(args.day)
+        except ValueError as exc:
+            return {"success": False, "error": str(exc)}
+        return {
+            "success": True,
+            "sql_profile": summarize_profile_reports(
+                reports, scope=args.scope, slot=args.slot
+            ),
+        }
+    return {"success": True, "sql_profile": _profile_orrery_tick(args)}
+
+
+def _profile_orrery_tick(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run one dry-run Orrery tick on a slot under the SQL profiler.
+
+    The tick uses the same resolver inputs as LORE's Orrery phase and never
+    writes; the session is rolled back after optional EXPLAIN plans run.
+    """
+
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.orm import Session
+
+    from nexus.agents.orrery.resolver import resolve_dry_run
+    from nexus.agents.orrery.templates import BUILTIN_TEMPLATES
+    from nexus.api.slot_utils import get_slot_db_url
+    from nexus.config import load_settings_as_dict
+    from nexus.telemetry.sql_profile import (
+        enrich_report,
+        explain_slowest,
+        instrument_engine,
+        load_pg_stat_statements,
+        sql_profile,
+    )
+
+    orrery_settings = load_settings_as_dict().get("orrery") or {}
+    binding_settings = orrery_settings.get("binding") or {}
+    engine = instrument_engine(create_engine(get_slot_db_url(slot=args.slot)))
+    try:
+        with Session(engine) as session:
+            anchor_chunk_id = args.anchor
+            if anchor_chunk_id is None:
+                anchor_chunk_id = session.execute(
+                    text("SELECT max(id) FROM narrative_chunks")
+                ).scalar_one()
+            with sql_profile("tick", slot=args.slot) as profile:
+                resolve_dry_run(
+                    session,
+                    BUILTIN_TEMPLATES,
+                    anchor_chunk_id=anchor_chunk_id,
+                    window_chunks=int(binding_settings.get("window_chunks", 30)),
+                    sunhelm_settings=orrery_settings.get("sunhelm"),
+                    selection_settings=orrery_settings.get("selection"),
+                    habituation_settings=orrery_settings.get("habituation"),
+                    package_selection_settings=orrery_settings.get("package_selection"),
+                    project_settings=orrery_settings.get("projects"),
+                    epistemics_settings=orrery_settings.get("epistemics"),
+                    fanout_settings=orrery_settings.get("fanout"),
+                    contagion_settings=orrery_settings.get("contagion"),
+                    weather_settings=orrery_settings.get("weather"),
+                    mood_settings=orrery_settings.get("mood"),
+                    composition_settings=orrery_settings.get("composition"),
+                    ambient_settings=orrery_settings.get("ambient"),
+                )
+            report = profile.report()
+            report["anchor_chunk_id"] = anchor_chunk_id
+            dbapi_connection = session.connection().connection
+            with dbapi_connection.cursor() as cur:
+                plans = (
+                    explain_slowest(profile, cur, limit=args.explain)
+                    if args.explain
+                    else None
+                )
+                pg_stat = load_pg_stat_statements(cur) if args.pg_stat else None
+            session.rollback()
+    finally:
+        engine.dispose()
+    return enrich_report(report, pg_stat=pg_stat, plans=plans)
+
+
 def _run_with_cli_usage(
     args: argparse.Namespace,
     command: Callable[[argparse.Namespace], Dict[str, Any]],
@@ -3140,6 +3403,64 @@ def _print_usage(payload: Dict[str, Any]) -> None:
             )
 
 
+def _print_sql_profile(payload: Dict[str, Any]) -> None:
+    """Render a ranked per-tag SQL profile as an aligned table."""
+
+    profile = payload["sql_profile"]
+    if "scopes" in profile:
+        print(
+            f"Recorded SQL profile: {profile['scopes']:,} scope(s), "
+            f"{profile['statements']:,} statements, {profile['sql_ms']:.1f} ms SQL"
+        )
+    else:
+        print(
+            f"SQL profile ({profile['scope']}, anchor chunk "
+            f"{profile.get('anchor_chunk_id')}): {profile['statements']:,} "
+            f"statements, {profile['sql_ms']:.1f} ms SQL of "
+            f"{profile['elapsed_ms']:.1f} ms wall"
+        )
+    rows = profile.get("tags") or []
+    if not rows:
+        print("  (no statements recorded)")
+        return
+    header = ("TAG", "CALLS", "ROWS", "TOTAL_MS", "MEAN_MS", "MAX_MS", "SHARE")
+    values = [
+        (
+            row["tag"],
+            row["calls"],
+            row["rows"],
+            f"{row['total_ms']:.1f}",
+            f"{row['mean_ms']:.2f}",
+            f"{row['max_ms']:.2f}",
+            f"{row['share'] * 100:.1f}%",
+        )
+        for row in rows
+    ]
+    widths = [
+        max(len(str(row[index])) for row in [header] + values)
+        for index in range(len(header))
+    ]
+    for row in [header] + values:
+        print(
+            "  "
+            + "  ".join(
+                str(cell).ljust(widths[index]) for index, cell in enumerate(row)
+            )
+        )
+    for row in rows:
+        plan = row.get("plan")
+        if isinstance(plan, dict) and "Execution Time" in plan:
+            top = plan.get("Plan", {})
+            print(
+                f"  plan {row['tag']}: {top.get('Node Type', '?')} "
+                f"exec={plan['Execution Time']:.2f}ms "
+                f"shared_hit={top.get('Shared Hit Blocks', 0)} "
+                f"shared_read={top.get('Shared Read Blocks', 0)}"
+            )
+        elif isinstance(plan, dict) and plan.get("error"):
+            print(f"  plan {row['tag']}: error {plan['error']}")
+
+
 def _add_global_output_args(parser: argparse.ArgumentParser) -> None:
     """Accept global output flags after a subcommand without resetting them."""
 
@@ -3191,6 +3512,7 @@ Examples:
   nexus retrograde-apply-expansion --slot 5 --packet packet.json ...
   nexus retrograde-embed-history --slot 5  Dry-run Retrograde retrieval sync
   nexus retrograde-embed-history --slot 5 --execute
+  nexus retrograde-verify-graphs --slot 5 --workers 4
   nexus record-revelation --slot 2 --claim-id 7 --knower 42
   nexus faction-audit --slot 2  Dry-run faction column migration audit
   nexus faction-manifest --slot 2  Build faction migration manifest
@@ -3281,11 +3603,53 @@ Examples:
 
     jobs_parser = subparsers.add_parser(
         "jobs",
-        help="Show durable Retrograde maturation job state for one slot",
+        help="Show durable maturation and post-commit job state for one slot",
     )
     jobs_parser.add_argument(
         "--slot", type=int, required=True, help="Slot number (1-5)"
     )
+    jobs_parser.add_argument(
+        "--drain",
+        action="store_true",
+        help="Run due post-commit jobs in this process before reporting",
+    )
+
+    sql_profile_parser = subparsers.add_parser(
+        "sql-profile",
+        help="Rank SQL statement tags for a dry-run Orrery tick or recorded scopes",
+    )
+    sql_profile_parser.add_argument("--slot", type=int, help="Slot number (1-5)")
+    sql_profile_parser.add_argument(
+        "--anchor",
+        type=int,
+        help="Anchor chunk id for the live tick (default: latest chunk)",
+    )
+    sql_profile_parser.add_argument(
+        "--explain",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Attach EXPLAIN (ANALYZE, BUFFERS) plans for the N slowest read tags",
+    )
+    sql_profile_parser.add_argument(
+        "--pg-stat",
+        action="store_true",
+        help="Cross-reference pg_stat_statements history per tag",
+    )
+    sql_profile_parser.add_argument(
+        "--recorded",
+        action="store_true",
+        help="Summarize scopes recorded with [sql_profile] enabled instead",
+    )
+    sql_profile_parser.add_argument(
+        "--day",
+        help="UTC day of recorded profiles in YYYY-MM-DD format (with --recorded)",
+    )
+    sql_profile_parser.add_argument(
+        "--scope",
+        choices=("tick", "commit"),
+        help="Only summarize one recorded scope kind (with --recorded)",
+    )
 
     # load command
     load_parser = subparsers.add_parser("load", help="Display current slot state")
@@ -3578,6 +3942,33 @@ Examples:
         ),
     )
 
+    # retrograde-verify-graphs command
+    retrograde_verify_parser = subparsers.add_parser(
+        "retrograde-verify-graphs",
+        help=(
+            "Rebuild stored Retrograde candidate graphs and report hash drift "
+            "by graph schema version"
+        ),
+    )
+    retrograde_verify_parser.add_argument(
+        "--slot", type=int, required=True, help="Slot number (1-5)"
+    )
+    retrograde_verify_parser.add_argument(
+        "--packet",
+        type=Path,
+        action="append",
+        help=(
+            "Also replay the graph in a retrograde-packet --output file; "
+            "may be repeated."
+        ),
+    )
+    retrograde_verify_parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for graph rebuilds (default: CPU count).",
+    )
+
     revelation_parser = subparsers.add_parser(
         "record-revelation",
         help="Grant told or manual awareness of an existing claim",
@@ -3614,6 +4005,20 @@ Examples:
         "--slot", type=int, required=True, help="Slot number (1-5)"
     )
 
+    # audit-interactions command
+    audit_interactions_parser = subparsers.add_parser(
+        "audit-interactions",
+        help="Check interaction replay against live state for every thread",
+    )
+    audit_interactions_parser.add_argument(
+        "--slot", type=int, required=True, help="Slot number (1-5)"
+    )
+    audit_interactions_parser.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="Also record replay snapshots for threads with long event tails",
+    )
+
     # faction-manifest command
     faction_manifest_parser = subparsers.add_parser(
         "faction-manifest",
@@ -3828,8 +4233,10 @@ def main() -> int:
         "retrograde-packet",
         "retrograde-apply-expansion",
         "retrograde-embed-history",
+        "retrograde-verify-graphs",
         "record-revelation",
         "faction-audit",
+        "audit-interactions",
         "faction-manifest",
         "faction-apply",
         "character-manifest",
@@ -3858,6 +4265,25 @@ def main() -> int:
             emit_error("Slot must be between 1 and 5", args.json)
             return 1
 
+    if args.command == "sql-profile":
+        if args.slot is None and not args.recorded:
+            emit_error("--slot is required unless using --recorded", args.json)
+            return 1
+        if args.slot is not None and (args.slot < 1 or args.slot > 5):
+            emit_error("Slot must be between 1 and 5", args.json)
+            return 1
+        if args.explain < 0:
+            emit_error("--explain must be zero or a positive integer", args.json)
+            return 1
+        if args.day is not None:
+            from nexus.telemetry.usage import validate_usage_day
+
+            try:
+                validate_usage_day(args.day)
+            except ValueError as exc:
+                emit_error(str(exc), args.json)
+                return 1
+
     if args.command in ("up", "restart") and args.slot is not None:
         if args.slot < 1 or args.slot > 5:
             emit_error("Slot must be between 1 and 5", args.json)
@@ -3898,6 +4324,8 @@ def main() -> int:
         result = run_usage(args)
     elif args.command == "jobs":
         result = run_jobs(args)
+    elif args.command == "sql-profile":
+        result = run_sql_profile(args)
     elif args.command == "load":
         result = run_load(args)
     elif args.command == "continue":
@@ -3922,10 +4350,14 @@ def main() -> int:
         result = run_retrograde_apply_expansion(args)
     elif args.command == "retrograde-embed-history":
         result = run_retrograde_embed_history(args)
+    elif args.command == "retrograde-verify-graphs":
+        result = run_retrograde_verify_graphs(args)
     elif args.command == "record-revelation":
         result = run_record_revelation(args)
     elif args.command == "faction-audit":
         result = run_faction_audit(args)
+    elif args.command == "audit-interactions":
+        result = run_audit_interactions(args)
     elif args.command == "faction-manifest":
         result = run_faction_manifest(args)
     elif args.command == "faction-apply":
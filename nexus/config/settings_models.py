@@ -632,6 +632,32 @@ class UsageSettings(BaseModel):
         return value
 
 
+class SqlProfileSettings(BaseModel):
+    """Per-tag SQL statement profiling configuration."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    enabled: bool = Field(
+        default=False,
+        description=(
+            "Whether gateway turns, commits and worker ticks record per-tag "
+            "SQL profiles"
+        ),
+    )
+    profile_dir: str = Field(
+        default=".nexus/runtime/sql_profile",
+        description=(
+            "Profile JSONL directory; relative paths resolve against the "
+            "repository root"
+        ),
+    )
+    log_top: int = Field(
+        default=5,
+        ge=0,
+        description="Number of top-ranked tags echoed in each SQL_PROFILE log line",
+    )
+
+
 class RuntimeSettings(BaseModel):
     """Managed runtime configuration (nexus up / down / status / logs)."""
 
@@ -1631,6 +1657,20 @@ class OrreryPackageSelectionSettings(BaseModel):
             "candidate in that band passes."
         ),
     )
+    tick_memo: bool = Field(
+        default=False,
+        description=(
+            "Memoize binding digests and package-gate outcomes across the "
+            "stacks of one resolver tick."
+        ),
+    )
+    memo_parity_check: bool = Field(
+        default=False,
+        description=(
+            "Debug: with tick_memo, re-evaluate every memo hit and raise if "
+            "the memo disagrees with a fresh evaluation."
+        ),
+    )
 
 
 class OrreryProjectSettings(BaseModel):
@@ -1810,6 +1850,13 @@ class OrreryEpistemicsSettings(BaseModel):
             "world_event_entities roles that receive awareness when a claim is minted."
         ),
     )
+    hydration_parity_check: bool = Field(
+        default=False,
+        description=(
+            "Also hydrate possession from the claim ledgers and fail if "
+            "claim_possession_index disagrees."
+        ),
+    )
 
     @field_validator("claim_event_types")
     @classmethod
@@ -2323,6 +2370,16 @@ class OrreryRetrogradeMaturationSettings(BaseModel):
         ge=1,
         description="Maximum queued maturation jobs leased per worker drain.",
     )
+    max_parallel_jobs: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Leased jobs whose Skald stages may run concurrently within one "
+            "drain. Jobs that share an entity footprint still run in lease "
+            "order and every commit lands in lease order, so results match "
+            "a serial drain. 1 keeps the serial drain."
+        ),
+    )
     max_attempts: int = Field(
         default=3,
         ge=1,
@@ -3163,6 +3220,27 @@ class SummariesSettings(BaseModel):
         gt=0,
         description="Maximum output tokens for season summaries.",
     )
+    digest_max_output_tokens: int = Field(
+        default=800,
+        gt=0,
+        description="Maximum output tokens for one scene-window digest.",
+    )
+    scene_window_size: int = Field(
+        default=8,
+        ge=2,
+        description=(
+            "Consecutive chunks per scene-window digest. Episode summaries are "
+            "built from these digests rather than from raw chunks."
+        ),
+    )
+    digest_on_commit: bool = Field(
+        default=True,
+        description=(
+            "Digest each scene window as soon as its last chunk is accepted "
+            "(post-commit job), so the episode summary only digests the "
+            "final partial window."
+        ),
+    )
     request_token_budget: int = Field(
         default=30000,
         gt=0,
@@ -3183,11 +3261,12 @@ class SummariesSettings(BaseModel):
         largest_output = max(
             self.episode_max_output_tokens,
             self.season_max_output_tokens,
+            self.digest_max_output_tokens,
         )
         if self.request_token_budget <= largest_output:
             raise ValueError(
-                "summaries.request_token_budget must exceed both summary "
-                "max-output-token settings"
+                "summaries.request_token_budget must exceed every summary "
+                "max-output-token setting"
             )
         return self
 
@@ -3239,6 +3318,13 @@ class WizardSettings(BaseModel):
     enable_streaming: bool = Field(
         default=True, description="Enable wizard streaming endpoint"
     )
+    keep_spare_slot: bool = Field(
+        default=False,
+        description=(
+            "Keep one pre-cloned NEXUS_template spare database ready so a new "
+            "or reset slot is provisioned with a rename"
+        ),
+    )
     trait_inputs: WizardTraitInputsSettings = Field(
         default_factory=WizardTraitInputsSettings,
         description="Transition-time trait input derivation settings",
@@ -3307,6 +3393,43 @@ class APIUploadsSettings(BaseModel):
     )
 
 
+class APIRateLimitEntry(BaseModel):
+    """Budgets for one provider or provider/model; unset fields inherit."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    requests_per_minute: Optional[int] = Field(
+        default=None, ge=1, description="Request budget per minute"
+    )
+    tokens_per_minute: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Token budget per minute (prompt size plus output cap)",
+    )
+    max_concurrency: Optional[int] = Field(
+        default=None, ge=1, description="Maximum calls in flight at once"
+    )
+
+
+class APIRateLimitSettings(BaseModel):
+    """Outbound LLM call governor budgets (nexus/api/rate_governor.py)."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    default: APIRateLimitEntry = Field(
+        default_factory=APIRateLimitEntry,
+        description="Budgets for providers without their own entry",
+    )
+    providers: Dict[str, APIRateLimitEntry] = Field(
+        default_factory=dict,
+        description=(
+            "Entries keyed by provider (openai) or provider/model "
+            "(openai/gpt-4.1); unset fields fall back to the provider entry, "
+            "then default"
+        ),
+    )
+
+
 class APISettings(BaseModel):
     """Top-level API settings."""
 
@@ -3324,6 +3447,9 @@ class APISettings(BaseModel):
     uploads: Optional[APIUploadsSettings] = Field(
         default=None, description="Image upload limits"
     )
+    rate_limits: Optional[APIRateLimitSettings] = Field(
+        default=None, description="Outbound LLM call budgets"
+    )
 
 
 # =============================================================================
@@ -3573,6 +3699,10 @@ class Settings(BaseModel):
         default_factory=UsageSettings,
         description="Provider-reported API token telemetry settings",
     )
+    sql_profile: SqlProfileSettings = Field(
+        default_factory=SqlProfileSettings,
+        description="Per-tag SQL statement profiling settings",
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -33,6 +33,7 @@ from nexus.interactions.service import (
     TrustedHandler,
     UntrustedHandlerError,
     UnknownExecutorTransition,
+    audit_interactions,
 )
 
 __all__ = [
@@ -61,4 +62,5 @@ __all__ = [
     "TrustedHandler",
     "UntrustedHandlerError",
     "UnknownExecutorTransition",
+    "audit_interactions",
 ]
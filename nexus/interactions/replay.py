@@ -0,0 +1,296 @@
+"""Incremental replay fold and snapshot storage for interaction threads.
+
+Replay used to re-read the whole ``interaction_events`` ledger and validate
+every payload into Pydantic models. :class:`ReplayFold` instead folds raw
+event payloads (JSON values as stored) into plain state and validates once,
+when :meth:`ReplayFold.to_model` builds the :class:`ReplayedInteraction`.
+The fold state round-trips through ``interaction_replay_snapshots``, keyed
+by ``interaction_revision``, so a replay starts from the latest snapshot and
+folds only the events appended after it.
+
+Snapshots are derived data: the ledger stays authoritative, a snapshot from
+another :data:`REPLAY_FOLD_VERSION` is ignored, and dropping the table only
+costs the next replay a full fold.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from nexus.interactions.models import (
+    InteractionEventType,
+    InteractionStatus,
+    ReplayedInteraction,
+)
+
+# Bump whenever the fold or its snapshot shape changes; older snapshots are
+# then ignored and rebuilt from the ledger.
+REPLAY_FOLD_VERSION = 1
+# Events folded past the latest snapshot before replay records a new one.
+REPLAY_SNAPSHOT_INTERVAL = 200
+
+_GRANT_FIELDS = (
+    "id",
+    "participant_entity_id",
+    "action",
+    "envelope_hash",
+    "continuation_id",
+    "interaction_revision",
+    "granted",
+    "granted_at",
+    "expires_at",
+    "revoked_at",
+)
+_TERMINAL_STATUS = {
+    InteractionEventType.COMPLETED.value: InteractionStatus.COMPLETED.value,
+    InteractionEventType.STOPPED.value: InteractionStatus.STOPPED.value,
+    InteractionEventType.INTERRUPTED.value: InteractionStatus.INTERRUPTED.value,
+}
+
+LATEST_SNAPSHOTS_SQL = """
+    SELECT DISTINCT ON (interaction_id)
+           interaction_id, interaction_revision, last_event_id, state
+    FROM interaction_replay_snapshots
+    WHERE fold_version = :fold_version
+    ORDER BY interaction_id, interaction_revision DESC, last_event_id DESC
+"""
+
+
+@dataclass
+class ReplayFold:
+    """Replay state for one interaction after ``last_event_id``.
+
+    Timestamps stay ISO-8601 strings exactly as the ledger stores them;
+    ``events_folded`` counts events applied since the fold was created or
+    restored from a snapshot.
+    """
+
+    status: str = InteractionStatus.PROPOSED.value
+    revision: int = 1
+    lease_until: str | None = None
+    memberships: dict[int, dict[str, Any]] = field(default_factory=dict)
+    grants: dict[int, dict[str, Any]] = field(default_factory=dict)
+    transitions: list[str] = field(default_factory=list)
+    last_event_id: int = 0
+    events_folded: int = 0
+
+    @classmethod
+    def from_snapshot(cls, last_event_id: int, state: dict[str, Any]) -> ReplayFold:
+        return cls(
+            status=state["status"],
+            revision=int(state["revision"]),
+            lease_until=state["lease_until"],
+            memberships={
+                int(item["membership_id"]): dict(item) for item in state["memberships"]
+            },
+            grants={int(item["id"]): dict(item) for item in state["grants"]},
+            transitions=list(state["transitions"]),
+            last_event_id=last_event_id,
+        )
+
+    def snapshot_state(self) -> dict[str, Any]:
+        return {
+            "status": self.status,
+            "revision": self.revision,
+            "lease_until": self.lease_until,
+            "memberships": [self.memberships[key] for key in sorted(self.memberships)],
+            "grants": [self.grants[key] for key in sorted(self.grants)],
+            "transitions": self.transitions,
+        }
+
+    def apply(
+        self, event_id: int, event_type: str, revision: int, payload: dict[str, Any]
+    ) -> None:
+        """Fold one ledger event (in ``id`` order) into the state."""
+        self.revision = int(revision)
+        if event_type == InteractionEventType.PROPOSED.value:
+            for item in payload["memberships"]:
+                self.memberships[int(item["membership_id"])] = dict(item)
+        elif event_type == InteractionEventType.AUTHORIZED.value:
+            if payload["state"] == "granted":
+                grant = {key: payload[key] for key in _GRANT_FIELDS}
+                self.grants[int(grant["id"])] = grant
+            else:
+                for grant_id in payload["grant_ids"]:
+                    self.grants[int(grant_id)]["revoked_at"] = payload["revoked_at"]
+        elif event_type == InteractionEventType.MEMBERSHIP_JOINED.value:
+            self.memberships[int(payload["membership_id"])] = dict(payload)
+        elif event_type == InteractionEventType.MEMBERSHIP_LEFT.value:
+            self._close_membership(payload)
+        elif event_type == InteractionEventType.LEASE_TOUCHED.value:
+            self.lease_until = payload["lease_until"]
+        elif event_type == InteractionEventType.STARTED.value:
+            self.status = InteractionStatus.IN_PROGRESS.value
+            self.lease_until = payload["lease_until"]
+        elif event_type == InteractionEventType.TRANSITIONED.value:
+            self.status = InteractionStatus.IN_PROGRESS.value
+            self.transitions.append(str(payload["transition_type"]))
+        elif event_type in _TERMINAL_STATUS:
+            self.status = _TERMINAL_STATUS[event_type]
+            self.lease_until = None
+        for closed in payload.get("closed_memberships", ()):
+            self._close_membership(closed)
+        self.last_event_id = int(event_id)
+        self.events_folded += 1
+
+    def _close_membership(self, closed: dict[str, Any]) -> None:
+        membership = self.memberships[int(closed["membership_id"])]
+        membership["left_at"] = closed["left_at"]
+        membership["left_revision"] = int(closed["left_revision"])
+
+    def to_model(self, interaction_id: UUID) -> ReplayedInteraction:
+        """Validate the folded state once into the public replay model."""
+        memberships = [self.memberships[key] for key in sorted(self.memberships)]
+        return ReplayedInteraction.model_validate(
+            {
+                "interaction_id": interaction_id,
+                "status": self.status,
+                "revision": self.revision,
+                "active_participant_entity_ids": tuple(
+                    item["participant_entity_id"]
+                    for item in memberships
+                    if item.get("left_at") is None
+                ),
+                "membership_history": memberships,
+                "grants": [self.grants[key] for key in sorted(self.grants)],
+                "transition_types": tuple(self.transitions),
+                "lease_until": self.lease_until,
+            }
+        )
+
+
+def load_replay_fold(session: Session, interaction_id: UUID) -> ReplayFold | None:
+    """Fold one interaction from its latest snapshot; None without a proposal."""
+    snapshot = (
+        session.execute(
+            text(
+                """
+                SELECT last_event_id, state
+                FROM interaction_replay_snapshots
+                WHERE interaction_id = :interaction_id
+                  AND fold_version = :fold_version
+                ORDER BY interaction_revision DESC, last_event_id DESC
+                LIMIT 1
+                """
+            ),
+            {"interaction_id": interaction_id, "fold_version": REPLAY_FOLD_VERSION},
+        )
+        .mappings()
+        .one_or_none()
+    )
+    fold = (
+        ReplayFold.from_snapshot(int(snapshot["last_event_id"]), snapshot["state"])
+        if snapshot is not None
+        else None
+    )
+    rows = session.execute(
+        text(
+            """
+            SELECT id, event_type, interaction_revision, payload
+            FROM interaction_events
+            WHERE interaction_id = :interaction_id AND id > :after
+            ORDER BY id
+            """
+        ),
+        {
+            "interaction_id": interaction_id,
+            "after": fold.last_event_id if fold is not None else 0,
+        },
+    )
+    for event_id, event_type, revision, payload in rows:
+        if fold is None:
+            if event_type != InteractionEventType.PROPOSED.value:
+                return None
+            fold = ReplayFold()
+        fold.apply(event_id, event_type, revision, payload)
+    return fold
+
+
+def load_transition_types(session: Session, interaction_id: UUID) -> tuple[str, ...]:
+    """Read transition types from the latest snapshot plus the ledger tail."""
+    snapshot = (
+        session.execute(
+            text(
+                """
+                SELECT last_event_id, state -> 'transitions' AS transitions
+                FROM interaction_replay_snapshots
+                WHERE interaction_id = :interaction_id
+                  AND fold_version = :fold_version
+                ORDER BY interaction_revision DESC, last_event_id DESC
+                LIMIT 1
+                """
+            ),
+            {"interaction_id": interaction_id, "fold_version": REPLAY_FOLD_VERSION},
+        )
+        .mappings()
+        .one_or_none()
+    )
+    transitions = list(snapshot["transitions"]) if snapshot is not None else []
+    transitions.extend(
+        str(payload["transition_type"])
+        for payload in session.execute(
+            text(
+                """
+                SELECT payload
+                FROM interaction_events
+                WHERE interaction_id = :interaction_id
+                  AND event_type = 'transitioned'
+                  AND id > :after
+                ORDER BY id
+                """
+            ),
+            {
+                "interaction_id": interaction_id,
+                "after": int(snapshot["last_event_id"]) if snapshot is not None else 0,
+            },
+        ).scalars()
+    )
+    return tuple(transitions)
+
+
+def save_replay_snapshot(
+    session: Session, interaction_id: UUID, fold: ReplayFold
+) -> None:
+    """Record ``fold`` as the snapshot for its revision.
+
+    Callers must hold a lock on the interaction row that excludes writers
+    (``FOR SHARE`` or stronger) so that no lower event id can still commit
+    behind ``last_event_id``. A later fold at the same revision (lease
+    touches, cleanup events) replaces the earlier snapshot.
+    """
+    session.execute(
+        text(
+            """
+            INSERT INTO interaction_replay_snapshots (
+                interaction_id, interaction_revision, last_event_id,
+                fold_version, state
+            ) VALUES (
+                :interaction_id, :revision, :last_event_id,
+                :fold_version, CAST(:state AS JSONB)
+            )
+            ON CONFLICT (interaction_id, interaction_revision) DO UPDATE
+            SET last_event_id = EXCLUDED.last_event_id,
+                fold_version = EXCLUDED.fold_version,
+                state = EXCLUDED.state,
+                created_at = NOW()
+            WHERE interaction_replay_snapshots.last_event_id
+                      < EXCLUDED.last_event_id
+               OR interaction_replay_snapshots.fold_version
+                      <> EXCLUDED.fold_version
+            """
+        ),
+        {
+            "interaction_id": interaction_id,
+            "revision": fold.revision,
+            "last_event_id": fold.last_event_id,
+            "fold_version": REPLAY_FOLD_VERSION,
+            "state": json.dumps(fold.snapshot_state()),
+        },
+    )
+    fold.events_folded = 0
@@ -50,6 +50,15 @@ from nexus.interactions.models import (
     ReplayedInteraction,
     TimelineAnchor,
 )
+from nexus.interactions.replay import (
+    LATEST_SNAPSHOTS_SQL,
+    REPLAY_FOLD_VERSION,
+    REPLAY_SNAPSHOT_INTERVAL,
+    ReplayFold,
+    load_replay_fold,
+    load_transition_types,
+    save_replay_snapshot,
+)
 
 
 class InteractionError(RuntimeError):
@@ -1077,119 +1086,32 @@ class InteractionService:
             interaction = self._locked_row(session, interaction_id)
             memberships = self._membership_states(session, interaction_id)
             grants = self._grant_states(session, interaction_id)
-            transitions = tuple(
-                str(payload["transition_type"])
-                for payload in session.execute(
-                    text(
-                        """
-                        SELECT payload
-                        FROM interaction_events
-                        WHERE interaction_id = :interaction_id
-                          AND event_type = 'transitioned'
-                        ORDER BY id
-                        """
-                    ),
-                    {"interaction_id": interaction_id},
-                ).scalars()
-            )
+            transitions = load_transition_types(session, interaction_id)
             return self._state_model(interaction, memberships, grants, transitions)
 
     def replay(self, interaction_id: UUID) -> ReplayedInteraction:
-        """Reconstruct status, membership history, grants, lease, and transitions."""
-        events = self.history(interaction_id)
-        if not events or events[0].event_type is not InteractionEventType.PROPOSED:
-            raise InteractionStateError("interaction has no valid proposed event")
-        memberships: dict[int, MembershipHistoryState] = {}
-        grants: dict[int, AuthorizationGrantState] = {}
-        transitions: list[str] = []
-        status = InteractionStatus.PROPOSED
-        revision = 1
-        lease_until: datetime | None = None
-        for event in events:
-            revision = event.interaction_revision
-            payload = event.payload
-            if event.event_type is InteractionEventType.PROPOSED:
-                for item in payload["memberships"]:
-                    membership_state = MembershipHistoryState.model_validate(item)
-                    memberships[membership_state.membership_id] = membership_state
-            elif event.event_type is InteractionEventType.AUTHORIZED:
-                if payload["state"] == "granted":
-                    grant_state = AuthorizationGrantState.model_validate(
-                        {
-                            key: payload[key]
-                            for key in (
-                                "id",
-                                "participant_entity_id",
-                                "action",
-                                "envelope_hash",
-                                "continuation_id",
-                                "interaction_revision",
-                                "granted",
-                                "granted_at",
-                                "expires_at",
-                                "revoked_at",
-                            )
-                        }
-                    )
-                    grants[grant_state.id] = grant_state
-                else:
-                    revoked_at = datetime.fromisoformat(payload["revoked_at"])
-                    for grant_id in payload["grant_ids"]:
-                        grants[int(grant_id)] = grants[int(grant_id)].model_copy(
-                            update={"revoked_at": revoked_at}
-                        )
-            elif event.event_type is InteractionEventType.MEMBERSHIP_JOINED:
-                membership_state = MembershipHistoryState.model_validate(payload)
-                memberships[membership_state.membership_id] = membership_state
-            elif event.event_type is InteractionEventType.MEMBERSHIP_LEFT:
-                membership_id = int(payload["membership_id"])
-                memberships[membership_id] = memberships[membership_id].model_copy(
-                    update={
-                        "left_at": datetime.fromisoformat(payload["left_at"]),
-                        "left_revision": int(payload["left_revision"]),
-                    }
-                )
-            elif event.event_type is InteractionEventType.LEASE_TOUCHED:
-                lease_until = datetime.fromisoformat(payload["lease_until"])
-            elif event.event_type is InteractionEventType.STARTED:
-                status = InteractionStatus.IN_PROGRESS
-                lease_until = datetime.fromisoformat(payload["lease_until"])
-            elif event.event_type is InteractionEventType.TRANSITIONED:
-                status = InteractionStatus.IN_PROGRESS
-                transitions.append(str(payload["transition_type"]))
-            elif event.event_type is InteractionEventType.COMPLETED:
-                status = InteractionStatus.COMPLETED
-                lease_until = None
-            elif event.event_type is InteractionEventType.STOPPED:
-                status = InteractionStatus.STOPPED
-                lease_until = None
-            elif event.event_type is InteractionEventType.INTERRUPTED:
-                status = InteractionStatus.INTERRUPTED
-                lease_until = None
-            if "closed_memberships" in payload:
-                for closed in payload["closed_memberships"]:
-                    membership_id = int(closed["membership_id"])
-                    memberships[membership_id] = memberships[membership_id].model_copy(
-                        update={
-                            "left_at": datetime.fromisoformat(closed["left_at"]),
-                            "left_revision": int(closed["left_revision"]),
-                        }
-                    )
-        membership_values = tuple(memberships[key] for key in sorted(memberships))
-        return ReplayedInteraction(
-            interaction_id=interaction_id,
-            status=status,
-            revision=revision,
-            active_participant_entity_ids=tuple(
-                state.participant_entity_id
-                for state in membership_values
-                if state.left_at is None
-            ),
-            membership_history=membership_values,
-            grants=tuple(grants[key] for key in sorted(grants)),
-            transition_types=tuple(transitions),
-            lease_until=lease_until,
-        )
+        """Reconstruct status, membership history, grants, lease, and transitions.
+
+        Folds from the latest replay snapshot and records a new one once
+        ``REPLAY_SNAPSHOT_INTERVAL`` events have been folded past it.
+        """
+        with self._session_factory() as session, session.begin():
+            # FOR SHARE waits out in-flight commands, so every event id below
+            # the ledger tail has committed before a snapshot can cover it.
+            if (
+                session.execute(
+                    text("SELECT 1 FROM interactions WHERE id = :id FOR SHARE"),
+                    {"id": interaction_id},
+                ).scalar_one_or_none()
+                is None
+            ):
+                raise InteractionNotFound(f"interaction {interaction_id} was not found")
+            fold = load_replay_fold(session, interaction_id)
+            if fold is None:
+                raise InteractionStateError("interaction has no valid proposed event")
+            if fold.events_folded >= REPLAY_SNAPSHOT_INTERVAL:
+                save_replay_snapshot(session, interaction_id, fold)
+            return fold.to_model(interaction_id)
 
     def _execute_status_change(
         self,
@@ -1855,3 +1777,149 @@ class InteractionService:
             transition_types=transitions,
             lease_until=interaction["lease_until"],
         )
+
+
+def audit_interactions(session: Session, *, checkpoint: bool = False) -> dict[str, Any]:
+    """Check replay against live state for every interaction in one pass.
+
+    Live rows, latest snapshots, and every ledger event past them are read
+    with one set-based query each, then folded per interaction. Transition
+    types exist only in the ledger, so live state takes the replayed ones.
+    With ``checkpoint``, interactions are share-locked and a snapshot is
+    recorded wherever ``REPLAY_SNAPSHOT_INTERVAL`` or more events were folded.
+    """
+    if checkpoint:
+        session.execute(text("SELECT id FROM interactions ORDER BY id FOR SHARE"))
+    interactions = {
+        row["id"]: dict(row)
+        for row in session.execute(
+            text(
+                """
+                SELECT id, status, revision, lease_until
+                FROM interactions
+                ORDER BY id
+                """
+            )
+        ).mappings()
+    }
+    memberships: dict[UUID, list[MembershipHistoryState]] = {
+        interaction_id: [] for interaction_id in interactions
+    }
+    for row in session.execute(
+        text(
+            """
+            SELECT interaction_id, id AS membership_id, participant_entity_id,
+                   joined_at, joined_revision, left_at, left_revision
+            FROM interaction_participants
+            ORDER BY interaction_id, id
+            """
+        )
+    ).mappings():
+        values = dict(row)
+        memberships[values.pop("interaction_id")].append(
+            MembershipHistoryState.model_validate(values)
+        )
+    grants: dict[UUID, list[AuthorizationGrantState]] = {
+        interaction_id: [] for interaction_id in interactions
+    }
+    for row in session.execute(
+        text(
+            """
+            SELECT interaction_id, id, participant_entity_id, action,
+                   envelope_hash, continuation_id, interaction_revision,
+                   granted, granted_at, expires_at, revoked_at
+            FROM interaction_authorizations
+            ORDER BY interaction_id, id
+            """
+        )
+    ).mappings():
+        values = dict(row)
+        grants[values.pop("interaction_id")].append(
+            AuthorizationGrantState.model_validate(values)
+        )
+
+    params = {"fold_version": REPLAY_FOLD_VERSION}
+    folds = {
+        row["interaction_id"]: ReplayFold.from_snapshot(
+            int(row["last_event_id"]), row["state"]
+        )
+        for row in session.execute(text(LATEST_SNAPSHOTS_SQL), params).mappings()
+    }
+    snapshots_used = len(folds)
+    errors: dict[UUID, str] = {}
+    events_folded = 0
+    for interaction_id, event_id, event_type, revision, payload in session.execute(
+        text(
+            f"""
+            WITH latest AS ({LATEST_SNAPSHOTS_SQL})
+            SELECT e.interaction_id, e.id, e.event_type,
+                   e.interaction_revision, e.payload
+            FROM interaction_events e
+            LEFT JOIN latest s ON s.interaction_id = e.interaction_id
+            WHERE e.id > COALESCE(s.last_event_id, 0)
+            ORDER BY e.interaction_id, e.id
+            """
+        ),
+        params,
+    ):
+        if interaction_id in errors:
+            continue
+        fold = folds.get(interaction_id)
+        if fold is None:
+            if event_type != InteractionEventType.PROPOSED.value:
+                errors[interaction_id] = "interaction has no valid proposed event"
+                continue
+            fold = folds[interaction_id] = ReplayFold()
+        try:
+            fold.apply(event_id, event_type, revision, payload)
+        except (KeyError, TypeError, ValueError) as exc:
+            errors[interaction_id] = f"event {event_id} cannot be replayed: {exc!r}"
+            continue
+        events_folded += 1
+
+    mismatches: list[dict[str, Any]] = []
+    snapshots_written = 0
+    for interaction_id, interaction in interactions.items():
+        fold = folds.get(interaction_id)
+        if fold is None:
+            errors.setdefault(interaction_id, "interaction has no valid proposed event")
+        if interaction_id in errors:
+            continue
+        try:
+            replayed = fold.to_model(interaction_id)
+        except ValidationError as exc:
+            errors[interaction_id] = f"replayed state is invalid: {exc}"
+            continue
+        live = InteractionService._state_model(
+            interaction,
+            tuple(memberships[interaction_id]),
+            tuple(grants[interaction_id]),
+            replayed.transition_types,
+        )
+        if replayed != live:
+            mismatches.append(
+                {
+                    "interaction_id": str(interaction_id),
+                    "fields": [
+                        name
+                        for name in ReplayedInteraction.model_fields
+                        if getattr(replayed, name) != getattr(live, name)
+                    ],
+                }
+            )
+        if checkpoint and fold.events_folded >= REPLAY_SNAPSHOT_INTERVAL:
+            save_replay_snapshot(session, interaction_id, fold)
+            snapshots_written += 1
+
+    return {
+        "interactions": len(interactions),
+        "matched": len(interactions) - len(mismatches) - len(errors),
+        "mismatched": mismatches,
+        "errors": [
+            {"interaction_id": str(interaction_id), "error": error}
+            for interaction_id, error in sorted(errors.items(), key=lambda e: str(e[0]))
+        ],
+        "events_folded": events_folded,
+        "snapshots_used": snapshots_used,
+        "snapshots_written": snapshots_written,
+    }
@@ -6,15 +6,38 @@ just exact matches against characters (including aliases), places, and factions.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence
 
 from sqlalchemy import text as sql_text
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=65536)
+def word_boundary_pattern(key: str) -> "re.Pattern[str]":
+    """Compiled ``\\b<key>\\b`` pattern, shared by every detector instance.
+
+    Slots hold thousands of names; the ``re`` module's own cache keeps 512
+    patterns, so uncached per-name searches recompiled most of them on every
+    call.
+    """
+    return re.compile(r"\b" + re.escape(key) + r"\b")
+
+
+def mentions(key: str, text_lower: str) -> bool:
+    """Whether ``key`` occurs in ``text_lower`` as a whole word.
+
+    The substring test is a necessary condition for the word-boundary match,
+    so it rejects almost every name without running a regex.
+    """
+    return (
+        key in text_lower and word_boundary_pattern(key).search(text_lower) is not None
+    )
+
+
 @dataclass
 class EntityMatch:
     """Results from entity detection."""
@@ -69,6 +92,52 @@ class HighSpecificityEntityDetector:
         if self.db:
             self._load_entities()
 
+    @classmethod
+    def from_rows(
+        cls,
+        *,
+        characters: Sequence[Any],
+        aliases: Sequence[Any],
+        places: Sequence[Any],
+        factions: Sequence[Any],
+    ) -> "HighSpecificityEntityDetector":
+        """Build a detector from prefetched mapping rows (see EntityLexicon).
+
+        Records match the shapes the ``_load_*`` methods produce.
+        """
+        detector = cls(db_connection=None)
+        by_id: Dict[Any, Dict[str, Any]] = {}
+        for row in characters:
+            record = {
+                "id": row["id"],
+                "name": row["name"],
+                "summary": row["summary"][:100] if row["summary"] else None,
+            }
+            by_id[row["id"]] = record
+            detector.character_lookup[row["name"].lower()] = record
+        for row in aliases:
+            if row["character_id"] in by_id:
+                detector.character_lookup[row["alias"].lower()] = by_id[
+                    row["character_id"]
+                ]
+        for row in places:
+            record = {
+                "id": row["id"],
+                "name": row["name"],
+                "type": row["type"],
+                "zone": row["zone"],
+            }
+            detector.place_lookup[row["name"].lower()] = record
+            if not row["name"].lower().startswith("the "):
+                detector.place_lookup[f"the {row['name'].lower()}"] = record
+        for row in factions:
+            detector.faction_lookup[row["name"].lower()] = {
+                "id": row["id"],
+                "name": row["name"],
+                "summary": row["summary"],
+            }
+        return detector
+
     def _load_entities(self) -> None:
         """Load all entities from database for matching."""
         try:
@@ -193,8 +262,7 @@ class HighSpecificityEntityDetector:
         for name_or_alias, char_record in self.character_lookup.items():
             # Use word boundaries for exact matching
             # This prevents matching "alex" in "alexander" or "complex"
-            pattern = r"\b" + re.escape(name_or_alias) + r"\b"
-            if re.search(pattern, text_lower):
+            if mentions(name_or_alias, text_lower):
                 found_characters[char_record["id"]] = char_record
                 logger.debug(
                     "Detected character: %s (id=%d)",
@@ -204,8 +272,7 @@ class HighSpecificityEntityDetector:
 
         # Check each place name
         for place_name, place_record in self.place_lookup.items():
-            pattern = r"\b" + re.escape(place_name) + r"\b"
-            if re.search(pattern, text_lower):
+            if mentions(place_name, text_lower):
                 found_places[place_record["id"]] = place_record
                 logger.debug(
                     "Detected place: %s (id=%d)",
@@ -215,8 +282,7 @@ class HighSpecificityEntityDetector:
 
         # Check each faction name
         for faction_name, faction_record in self.faction_lookup.items():
-            pattern = r"\b" + re.escape(faction_name) + r"\b"
-            if re.search(pattern, text_lower):
+            if mentions(faction_name, text_lower):
                 found_factions[faction_record["id"]] = faction_record
                 logger.debug(
                     "Detected faction: %s (id=%d)",
@@ -0,0 +1,299 @@
+"""Per-slot entity lexicon shared by detectors, roster reads and LORE.
+
+The presence audit, presence reconciliation and ContextMemoryManager each
+used to re-read the character, alias, place and faction tables on every turn
+or commit and rebuild their own detectors and lookup maps. An
+:class:`EntityLexicon` holds those rows once per slot, together with the
+detectors and normalized-name maps derived from them, and is reused until
+the slot's ``entity_lexicon_revision`` counter (migration 117) moves.
+
+Triggers bump the counter for every insert, delete or rename of a lexicon
+record, so no writer has to invalidate explicitly. Per-turn character state
+(activity, location, emotional state) is not part of the lexicon and does not
+invalidate it.
+
+Freshness rules:
+
+* A reader checks the revision before loading rows, so a write racing the
+  load can only make a cached lexicon newer than its revision, never older.
+* A reader inside the transaction that bumped the counter sees uncommitted
+  rows; that view is returned but never cached.
+* Slots without migration 117 get a freshly loaded, uncached lexicon.
+
+Lexicon records and detectors are shared between callers and must be
+treated as read-only.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+
+from nexus.memory.entity_detector import HighSpecificityEntityDetector
+
+logger = logging.getLogger("nexus.memory.entity_lexicon")
+
+SECOND_PERSON_ALIASES = ("You", "Your", "Yours", "Yourself")
+
+_PROBE_SQL = """
+    SELECT current_database() AS dbname,
+           (SELECT oid FROM pg_database
+            WHERE datname = current_database())::bigint AS db_oid,
+           to_regclass('entity_lexicon_revision') IS NOT NULL AS tracked,
+           pg_current_xact_id_if_assigned()::text AS current_xid
+"""
+_REVISION_SQL = """
+    SELECT revision, bumped_xid FROM entity_lexicon_revision WHERE singleton
+"""
+_CHARACTERS_SQL = "SELECT id, name, summary FROM characters ORDER BY name, id"
+_ALIASES_SQL = """
+    SELECT character_id, alias FROM character_aliases ORDER BY character_id, alias
+"""
+_PLACES_SQL = """
+    SELECT id, name, type, zone FROM places WHERE name IS NOT NULL ORDER BY id
+"""
+_FACTIONS_SQL = """
+    SELECT id, name, summary FROM factions WHERE name IS NOT NULL ORDER BY id
+"""
+
+# Latest committed lexicon per slot database name.
+_LEXICONS: Dict[str, "EntityLexicon"] = {}
+_LEXICONS_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class EntityLexicon:
+    """Entity rows for one slot at one lexicon revision.
+
+    ``revision`` is ``(database oid, counter)``; the oid keeps a slot that was
+    dropped and re-cloned from a template from matching its predecessor.
+    ``None`` marks an uncached lexicon.
+    """
+
+    revision: Optional[Tuple[int, int]]
+    characters: Tuple[Dict[str, Any], ...]
+    aliases: Tuple[Dict[str, Any], ...]
+    places: Tuple[Dict[str, Any], ...]
+    factions: Tuple[Dict[str, Any], ...]
+
+    @classmethod
+    def from_rows(
+        cls,
+        revision: Optional[Tuple[int, int]],
+        *,
+        characters: Sequence[Any],
+        aliases: Sequence[Any],
+        places: Sequence[Any],
+        factions: Sequence[Any],
+    ) -> EntityLexicon:
+        return cls(
+            revision=revision,
+            characters=tuple(dict(row) for row in characters),
+            aliases=tuple(dict(row) for row in aliases),
+            places=tuple(dict(row) for row in places),
+            factions=tuple(dict(row) for row in factions),
+        )
+
+    @cached_property
+    def named_characters(self) -> Tuple[Dict[str, Any], ...]:
+        return tuple(row for row in self.characters if row["name"] is not None)
+
+    @cached_property
+    def _characters_by_id(self) -> Dict[int, Dict[str, Any]]:
+        return {int(row["id"]): row for row in self.characters}
+
+    def character_name(self, character_id: int) -> Optional[str]:
+        row = self._characters_by_id.get(int(character_id))
+        return None if row is None or not row["name"] else str(row["name"])
+
+    @cached_property
+    def character_detector(self) -> HighSpecificityEntityDetector:
+        """Longest-match character-only detector used by the presence paths."""
+        from nexus.api.presence_reconciliation import (
+            build_character_presence_detector,
+        )
+
+        return build_character_presence_detector(self.named_characters, self.aliases)
+
+    @cached_property
+    def entity_detector(self) -> HighSpecificityEntityDetector:
+        """Character, place and faction detector used by LORE divergence."""
+        return HighSpecificityEntityDetector.from_rows(
+            characters=self.named_characters,
+            aliases=self.aliases,
+            places=self.places,
+            factions=self.factions,
+        )
+
+    @cached_property
+    def _aliases_by_name(self) -> Dict[str, Tuple[str, ...]]:
+        by_character: Dict[int, List[str]] = {}
+        for row in self.aliases:
+            aliases = by_character.setdefault(int(row["character_id"]), [])
+            if row["alias"] is not None and row["alias"] not in aliases:
+                aliases.append(row["alias"])
+        lookup: Dict[str, Tuple[str, ...]] = {}
+        for row in self.named_characters:
+            aliases = list(by_character.get(int(row["id"]), ()))
+            if row["name"] not in aliases:
+                aliases.append(row["name"])
+            lookup[str(row["name"]).lower()] = tuple(aliases)
+        return lookup
+
+    def alias_lookup(self, player_character_name: str) -> Dict[str, List[str]]:
+        """Lowercase character name -> aliases, as ``load_aliases_from_db``.
+
+        The player character also answers to the second-person aliases.
+        """
+        lookup = {key: list(aliases) for key, aliases in self._aliases_by_name.items()}
+        player_aliases = lookup.setdefault(
+            player_character_name.lower(), [player_character_name]
+        )
+        for alias in SECOND_PERSON_ALIASES:
+            if alias not in player_aliases:
+                player_aliases.append(alias)
+        return lookup
+
+    @cached_property
+    def place_names(self) -> Dict[str, str]:
+        """Lowercase place name (with and without a leading "the ") -> name."""
+        lookup: Dict[str, str] = {}
+        for row in self.places:
+            name = row["name"]
+            if not name:
+                continue
+            key = name.lower()
+            lookup[key] = name
+            if key.startswith("the "):
+                lookup[key[4:]] = name
+        return lookup
+
+
+def _revision_stamp(
+    probe: Dict[str, Any], revision_row: Optional[Dict[str, Any]]
+) -> Optional[Tuple[int, int]]:
+    """Cacheable revision, or None when the reader must not use the cache.
+
+    A tracked slot without the counter row (cloned from a template before any
+    bump) is at revision 0; the first bump inserts the row at 1.
+    """
+    if not probe["tracked"]:
+        return None
+    if revision_row is None:
+        return int(probe["db_oid"]), 0
+    current_xid = probe["current_xid"]
+    bumped_xid = revision_row["bumped_xid"]
+    if current_xid is not None and bumped_xid is not None:
+        if int(current_xid) == int(bumped_xid):
+            return None
+    return int(probe["db_oid"]), int(revision_row["revision"])
+
+
+def _cached(dbname: str, stamp: Optional[Tuple[int, int]]) -> Optional[EntityLexicon]:
+    if stamp is None:
+        return None
+    lexicon = _LEXICONS.get(dbname)
+    if lexicon is not None and lexicon.revision == stamp:
+        return lexicon
+    return None
+
+
+def _remember(dbname: str, lexicon: EntityLexicon) -> EntityLexicon:
+    """Cache ``lexicon`` unless a newer revision of the same database is held."""
+    if lexicon.revision is None:
+        return lexicon
+    with _LEXICONS_LOCK:
+        current = _LEXICONS.get(dbname)
+        if (
+            current is None
+            or current.revision is None
+            or current.revision[0] != lexicon.revision[0]
+            or current.revision[1] < lexicon.revision[1]
+        ):
+            _LEXICONS[dbname] = lexicon
+            logger.debug(
+                "Entity lexicon for %s cached at revision %s: %d characters, "
+                "%d aliases, %d places, %d factions",
+                dbname,
+                lexicon.revision[1],
+                len(lexicon.characters),
+                len(lexicon.aliases),
+                len(lexicon.places),
+                len(lexicon.factions),
+            )
+    return lexicon
+
+
+def _fetch(executor: Any, sql: str) -> List[Dict[str, Any]]:
+    """Run ``sql`` on a psycopg2 connection or a SQLAlchemy connection/session."""
+    if hasattr(executor, "cursor") and not hasattr(executor, "execute"):
+        from psycopg2.extras import RealDictCursor
+
+        with executor.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(sql)
+            return [dict(row) for row in cur.fetchall()]
+    return [dict(row) for row in executor.execute(text(sql)).mappings()]
+
+
+def _load(executor: Any) -> EntityLexicon:
+    probe = _fetch(executor, _PROBE_SQL)[0]
+    revision_rows = _fetch(executor, _REVISION_SQL) if probe["tracked"] else []
+    stamp = _revision_stamp(probe, revision_rows[0] if revision_rows else None)
+    cached = _cached(probe["dbname"], stamp)
+    if cached is not None:
+        return cached
+    return _remember(
+        probe["dbname"],
+        EntityLexicon.from_rows(
+            stamp,
+            characters=_fetch(executor, _CHARACTERS_SQL),
+            aliases=_fetch(executor, _ALIASES_SQL),
+            places=_fetch(executor, _PLACES_SQL),
+            factions=_fetch(executor, _FACTIONS_SQL),
+        ),
+    )
+
+
+def get_entity_lexicon(db: Any) -> EntityLexicon:
+    """Return the slot's current lexicon, reloading only on a revision change.
+
+    Args:
+        db: A psycopg2 connection, or a SQLAlchemy engine, connection or
+            session. Reads run inside the caller's transaction; an engine
+            gets one short-lived connection.
+    """
+    if hasattr(db, "connect") and not hasattr(db, "execute"):
+        with db.connect() as connection:
+            return _load(connection)
+    return _load(db)
+
+
+async def get_entity_lexicon_async(conn: Any) -> EntityLexicon:
+    """Asyncpg twin of :func:`get_entity_lexicon`."""
+    probe = dict(await conn.fetchrow(_PROBE_SQL))
+    revision_row = await conn.fetchrow(_REVISION_SQL) if probe["tracked"] else None
+    stamp = _revision_stamp(probe, dict(revision_row) if revision_row else None)
+    cached = _cached(probe["dbname"], stamp)
+    if cached is not None:
+        return cached
+    return _remember(
+        probe["dbname"],
+        EntityLexicon.from_rows(
+            stamp,
+            characters=await conn.fetch(_CHARACTERS_SQL),
+            aliases=await conn.fetch(_ALIASES_SQL),
+            places=await conn.fetch(_PLACES_SQL),
+            factions=await conn.fetch(_FACTIONS_SQL),
+        ),
+    )
+
+
+def clear_entity_lexicon_cache() -> None:
+    """Drop every cached lexicon (tests and slot resets)."""
+    with _LEXICONS_LOCK:
+        _LEXICONS.clear()
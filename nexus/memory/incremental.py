@@ -5,6 +5,16 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from nexus.agents.lore.utils.chunk_operations import (
+    estimate_chunk_tokens,
+    estimate_chunk_tokens_batch,
+)
+from nexus.agents.lore.utils.context_packing import (
+    PackCandidate,
+    chunk_utility,
+    pack_candidates,
+)
+
 from .context_state import (
     ContextStateManager,
     MemoryIdentity,
@@ -127,10 +137,6 @@ class IncrementalRetriever:
         if not self.memnon or not user_input or budget <= 0:
             return [], 0
 
-        collected: List[Dict[str, object]] = []
-        collected_ids: Set[MemoryIdentity] = set()
-        tokens_used = 0
-
         # Check if we have query iterations remaining
         if self.query_memory.remaining_iterations("pass2") <= 0:
             logger.debug("Pass 2 query budget exhausted; cannot do raw input retrieval")
@@ -158,30 +164,53 @@ class IncrementalRetriever:
         self.query_memory.record("pass2", query)
 
         # Process retrieved chunks
+        fresh: List[Dict[str, Any]] = []
+        seen_ids: Set[MemoryIdentity] = set()
         for chunk in result.get("results", []):
             identity, normalized = _normalize_retrieval_memory(chunk)
             if identity is None:
                 continue
 
             # Skip if already in context or duplicated in this result set.
-            if identity in collected_ids or self.context_state.is_chunk_known(identity):
+            if identity in seen_ids or self.context_state.is_chunk_known(identity):
                 continue
 
-            # Check token budget
-            estimated_tokens = self._estimate_tokens(normalized.get("text", ""))
-            if tokens_used + estimated_tokens > budget:
-                logger.debug(
-                    "Token budget reached while processing raw input memory %s",
-                    identity,
-                )
-                return collected, tokens_used
-
-            collected.append(normalized)
-            collected_ids.add(identity)
-            tokens_used += estimated_tokens
+            fresh.append(normalized)
+            seen_ids.add(identity)
 
-            if tokens_used >= budget:
-                return collected, tokens_used
+        # Pack by relevance rather than stopping at the first chunk that
+        # overflows: a long high-ranked chunk no longer shuts out the
+        # shorter relevant ones behind it.
+        token_counts = estimate_chunk_tokens_batch(
+            [str(memory.get("text", "")) for memory in fresh]
+        )
+        packed = pack_candidates(
+            [
+                PackCandidate(
+                    key=rank,
+                    kind=(
+                        "retrograde_summary"
+                        if is_retrograde_summary(memory)
+                        else "chunk"
+                    ),
+                    tokens=tokens,
+                    utility=chunk_utility(memory, rank),
+                    item=memory,
+                )
+                for rank, (memory, tokens) in enumerate(zip(fresh, token_counts))
+            ],
+            budget,
+        )
+        # Only packed memories are collected; ``seen_ids`` is dedup for this
+        # result set, so memories the budget dropped stay retrievable later.
+        collected: List[Dict[str, object]] = packed.items()
+        tokens_used = packed.tokens
+        if len(collected) < len(fresh):
+            logger.debug(
+                "Token budget kept %d of %d raw input memories",
+                len(collected),
+                len(fresh),
+            )
 
         logger.info(
             "Raw input retrieval collected %d chunks using %d tokens",
@@ -229,6 +258,5 @@ class IncrementalRetriever:
 
     # ------------------------------------------------------------------
     def _estimate_tokens(self, text: str) -> int:
-        # Fallback heuristic: words * 1.25 ≈ tokens
-        words = len(text.split())
-        return int(words * 1.25)
+        # Same tokenizer as the storyteller budget these tokens are spent from.
+        return estimate_chunk_tokens(text)
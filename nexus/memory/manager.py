@@ -8,10 +8,11 @@ import logging
 import re
 from collections import Counter
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set
 
 from sqlalchemy import text
 
+from nexus.agents.lore.utils.chunk_operations import estimate_chunk_tokens
 from nexus.agents.orrery.player_identity import canonical_player_character_id
 
 from .context_state import (
@@ -28,20 +29,11 @@ from .context_state import (
 from .correspondence import correspondence_settings, load_accepted_correspondence
 from .divergence import DivergenceDetector, DivergenceResult
 from .entity_detector import EntityMatch, HighSpecificityEntityDetector
+from .entity_lexicon import get_entity_lexicon
 from .incremental import IncrementalRetriever
 from .query_memory import QueryMemory
 from .retrieval_coverage import audit_retrieval_coverage, coerce_chunk_id
 
-load_aliases_from_db: Optional[Callable[[Any], Dict[str, List[str]]]]
-try:  # pragma: no cover - optional dependency during unit tests
-    from nexus.agents.memnon.utils.alias_search import (
-        load_aliases_from_db as _load_aliases_from_db,
-    )
-
-    load_aliases_from_db = _load_aliases_from_db
-except ImportError:  # pragma: no cover - fallback if module unavailable
-    load_aliases_from_db = None
-
 logger = logging.getLogger(__name__)
 
 _STORYTELLER_WIRE_CLASSES = frozenset({"openai", "anthropic", "local"})
@@ -358,7 +350,7 @@ class ContextMemoryManager:
                 getattr(self.memnon, "db_manager", None), "engine", None
             )
 
-        self.entity_detector = HighSpecificityEntityDetector(db_connection)
+        self.entity_detector = self._shared_entity_detector(db_connection)
         self.divergence_detector = DivergenceDetector(
             threshold=self.divergence_threshold
         )
@@ -1013,10 +1005,8 @@ class ContextMemoryManager:
     # Helper Methods
     # ------------------------------------------------------------------
     def _estimate_tokens(self, text: str) -> int:
-        """Estimate token count for text."""
-        # Simple heuristic: words * 1.25 ≈ tokens
-        words = len(text.split())
-        return int(words * 1.25)
+        """Count tokens with the storyteller's tokenizer."""
+        return estimate_chunk_tokens(text)
 
     def _coerce_chunk_id(self, chunk: Dict[str, Any]) -> Optional[int]:
         """Attempt to coerce a chunk identifier without logging noise."""
@@ -1078,10 +1068,23 @@ class ContextMemoryManager:
     # ------------------------------------------------------------------
     # Entity normalization helpers
     # ------------------------------------------------------------------
+    @staticmethod
+    def _shared_entity_detector(db_connection: Any) -> HighSpecificityEntityDetector:
+        """Return the slot lexicon's detector, shared until its revision moves."""
+
+        if db_connection is None:
+            return HighSpecificityEntityDetector(None)
+        try:
+            return get_entity_lexicon(db_connection).entity_detector
+        except Exception as exc:
+            raise RuntimeError(
+                "Failed to load entities for high-specificity divergence detection"
+            ) from exc
+
     def _initialize_entity_maps(self, memnon: Optional[object]) -> None:
         """Load alias and location metadata for canonical entity detection."""
 
-        if not memnon or load_aliases_from_db is None:  # pragma: no cover - defensive
+        if not memnon:  # pragma: no cover - defensive
             return
 
         engine = getattr(getattr(memnon, "db_manager", None), "engine", None)
@@ -1091,7 +1094,14 @@ class ContextMemoryManager:
         try:
             with engine.connect() as conn:
                 player_character_id = canonical_player_character_id(conn)
-                alias_lookup = load_aliases_from_db(conn)
+                lexicon = get_entity_lexicon(conn)
+                user_character_name = lexicon.character_name(player_character_id)
+                if not user_character_name:
+                    raise RuntimeError(
+                        "Canonical player character row "
+                        f"{player_character_id} has no name"
+                    )
+                alias_lookup = lexicon.alias_lookup(user_character_name)
 
                 for canonical_lc, aliases in alias_lookup.items():
                     self.alias_lookup[canonical_lc] = list(aliases)
@@ -1103,16 +1113,6 @@ class ContextMemoryManager:
                     for alias in aliases:
                         self.alias_inverse[alias.lower()] = canonical_lc
 
-                user_row = conn.execute(
-                    text("SELECT name FROM characters WHERE id = :id"),
-                    {"id": player_character_id},
-                ).fetchone()
-                if user_row is None or not user_row[0]:
-                    raise RuntimeError(
-                        "Canonical player character row "
-                        f"{player_character_id} has no name"
-                    )
-                user_character_name = str(user_row[0])
                 self.user_character_name = user_character_name
                 canonical = user_character_name.lower()
                 if canonical not in self.alias_lookup:
@@ -1123,15 +1123,7 @@ class ContextMemoryManager:
                 for pronoun in ("you", "your", "yours", "yourself"):
                     self.alias_inverse[pronoun] = canonical
 
-                place_rows = conn.execute(text("SELECT name FROM places")).fetchall()
-                for row in place_rows:
-                    name = row[0]
-                    if not name:
-                        continue
-                    key = name.lower()
-                    self.place_lookup[key] = name
-                    if key.startswith("the "):
-                        self.place_lookup[key[4:]] = name
+                self.place_lookup.update(lexicon.place_names)
 
         except RuntimeError:
             raise
@@ -1,9 +1,12 @@
 """NEXUS telemetry surfaces."""
 
+from .sql_profile import SqlProfile, recorded_sql_profile
 from .usage import UsageEvent, record_usage_event, summarize_usage, usage_context
 
 __all__ = [
+    "SqlProfile",
     "UsageEvent",
+    "recorded_sql_profile",
     "record_usage_event",
     "summarize_usage",
     "usage_context",
@@ -0,0 +1,749 @@
+"""Per-tag SQL statement profiling keyed on stable ``/* orrery:... */`` comments.
+
+Resolver and hydration statements carry a leading comment tag naming the
+query (``/* orrery:entity_activity */``). While a profile is active, every
+statement executed through an instrumented SQLAlchemy engine or a
+:class:`ProfilingConnection` cursor is attributed to that tag; untagged
+statements are bucketed by verb and first table (``sql:insert:world_events``)
+so the commit path's statements rank alongside the tagged hydration queries.
+
+Recording is scoped by a context variable, so instrumentation costs one
+lookup per statement when no profile is open and background threads never
+leak into a turn's numbers. Reports rank tags by total elapsed time and can
+be enriched with ``pg_stat_statements`` history and EXPLAIN plans for the
+slowest read statements.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import functools
+import json
+import logging
+import os
+from pathlib import Path
+import re
+from threading import Lock
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+
+import psycopg2
+import psycopg2.extensions
+from pydantic import BaseModel, ConfigDict
+
+from nexus.config import load_settings
+
+
+logger = logging.getLogger("nexus.sql_profile")
+
+_TAG_RE = re.compile(r"/\*\s*([a-z][a-z0-9_]*:[a-z0-9_.:-]+)\s*\*/", re.IGNORECASE)
+_LEADING_COMMENTS_RE = re.compile(r"^\s*(?:/\*.*?\*/\s*|--[^\n]*\n\s*)*", re.DOTALL)
+_VERB_TABLE_RE = re.compile(
+    r"^(?P<verb>insert\s+into|update|delete\s+from)\s+(?:only\s+)?"
+    r"(?P<table>\"?[a-z_][a-z0-9_.\"]*)",
+    re.IGNORECASE,
+)
+_FROM_TABLE_RE = re.compile(
+    r"\bfrom\s+(?P<table>\"?[a-z_][a-z0-9_.\"]*)", re.IGNORECASE
+)
+_READ_ONLY_RE = re.compile(r"^(?:select|with)\b", re.IGNORECASE)
+_WRITE_KEYWORD_RE = re.compile(
+    r"\b(?:insert|update|delete|merge|for\s+update|for\s+share)\b", re.IGNORECASE
+)
+
+_active_profile: ContextVar[Optional["SqlProfile"]] = ContextVar(
+    "nexus_sql_profile", default=None
+)
+
+
+class SqlProfileWriteError(RuntimeError):
+    """Raised when a finished profile cannot be appended durably."""
+
+
+def statement_tag(statement: str) -> str:
+    """Return the stable profiling label for one SQL statement.
+
+    The first ``/* namespace:name */`` comment wins. Untagged statements are
+    labeled ``sql:<verb>:<table>`` so repeated commit-path writes still
+    aggregate into one row instead of one row per literal statement.
+    """
+
+    match = _TAG_RE.search(statement)
+    if match:
+        return match.group(1).lower()
+
+    body = _LEADING_COMMENTS_RE.sub("", statement, count=1).lstrip()
+    verb_table = _VERB_TABLE_RE.match(body)
+    if verb_table:
+        verb = verb_table.group("verb").split()[0].lower()
+        table = verb_table.group("table").strip('"').lower()
+        return f"sql:{verb}:{table}"
+
+    words = body.split(None, 1)
+    verb = words[0].lower() if words else "empty"
+    if verb in ("select", "with"):
+        from_table = _FROM_TABLE_RE.search(body)
+        if from_table:
+            table = from_table.group("table").strip('"').lower()
+            return f"sql:{verb}:{table}"
+    return f"sql:{verb}"
+
+
+def is_explainable(statement: str) -> bool:
+    """Return whether EXPLAIN ANALYZE may re-run ``statement`` without writes."""
+
+    body = _LEADING_COMMENTS_RE.sub("", statement, count=1)
+    return bool(_READ_ONLY_RE.match(body)) and not _WRITE_KEYWORD_RE.search(body)
+
+
+@dataclass(slots=True)
+class SqlTagStats:
+    """Accumulated execution counters for one statement tag."""
+
+    tag: str
+    calls: int = 0
+    rows: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    errors: int = 0
+
+    def to_dict(self, total_sql_ms: float) -> dict[str, Any]:
+        """Return the JSON-serializable ranked-report row."""
+
+        return {
+            "tag": self.tag,
+            "calls": self.calls,
+            "rows": self.rows,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "errors": self.errors,
+            "share": (round(self.total_ms / total_sql_ms, 4) if total_sql_ms else 0.0),
+        }
+
+
+class SqlProfile:
+    """Thread-safe per-tag accumulator for one tick, turn or commit."""
+
+    def __init__(self, scope: str, *, slot: Optional[int] = None) -> None:
+        self.scope = scope
+        self.slot = slot
+        self.started_at = datetime.now(timezone.utc)
+        self._started = time.perf_counter()
+        self._elapsed_ms: Optional[float] = None
+        self._stats: Dict[str, SqlTagStats] = {}
+        # Slowest (statement, parameters, elapsed_ms) per tag. Kept in memory
+        # only: parameters can carry narrative text and never reach disk.
+        self._slowest: Dict[str, tuple[str, Any, float]] = {}
+        self._lock = Lock()
+
+    def record(
+        self,
+        statement: str,
+        parameters: Any,
+        elapsed_ms: float,
+        rowcount: Optional[int],
+        *,
+        failed: bool = False,
+    ) -> None:
+        """Attribute one executed statement to its tag."""
+
+        tag = statement_tag(statement)
+        with self._lock:
+            stats = self._stats.get(tag)
+            if stats is None:
+                stats = self._stats[tag] = SqlTagStats(tag)
+            stats.calls += 1
+            if rowcount is not None and rowcount > 0:
+                stats.rows += rowcount
+            stats.total_ms += elapsed_ms
+            if failed:
+                stats.errors += 1
+            if elapsed_ms >= stats.max_ms:
+                stats.max_ms = elapsed_ms
+                self._slowest[tag] = (statement, parameters, elapsed_ms)
+
+    def finish(self) -> None:
+        """Freeze wall-clock elapsed time for the profiled scope."""
+
+        if self._elapsed_ms is None:
+            self._elapsed_ms = (time.perf_counter() - self._started) * 1000.0
+
+    @property
+    def elapsed_ms(self) -> float:
+        if self._elapsed_ms is not None:
+            return self._elapsed_ms
+        return (time.perf_counter() - self._started) * 1000.0
+
+    def ranked(self) -> List[SqlTagStats]:
+        """Return tag stats ordered by total elapsed time, then call count."""
+
+        with self._lock:
+            stats = list(self._stats.values())
+        return sorted(stats, key=lambda item: (-item.total_ms, -item.calls, item.tag))
+
+    def slowest_statement(self, tag: str) -> Optional[tuple[str, Any, float]]:
+        """Return the slowest captured ``(statement, parameters, ms)`` for a tag."""
+
+        with self._lock:
+            return self._slowest.get(tag)
+
+    def report(self) -> dict[str, Any]:
+        """Return the ranked, JSON-serializable profile report."""
+
+        ranked = self.ranked()
+        total_sql_ms = sum(item.total_ms for item in ranked)
+        return {
+            "scope": self.scope,
+            "slot": self.slot,
+            "started_at": self.started_at.isoformat().replace("+00:00", "Z"),
+            "elapsed_ms": round(self.elapsed_ms, 3),
+            "sql_ms": round(total_sql_ms, 3),
+            "statements": sum(item.calls for item in ranked),
+            "tags": [item.to_dict(total_sql_ms) for item in ranked],
+        }
+
+
+def active_sql_profile() -> Optional[SqlProfile]:
+    """Return the profile currently collecting statements, if any."""
+
+    return _active_profile.get()
+
+
+@contextmanager
+def sql_profile(scope: str, *, slot: Optional[int] = None) -> Iterator[SqlProfile]:
+    """Collect every instrumented statement executed inside the block."""
+
+    profile = SqlProfile(scope, slot=slot)
+    token = _active_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _active_profile.reset(token)
+        profile.finish()
+
+
+@contextmanager
+def _suspended() -> Iterator[None]:
+    """Stop attributing statements while the profiler issues its own SQL."""
+
+    token = _active_profile.set(None)
+    try:
+        yield
+    finally:
+        _active_profile.reset(token)
+
+
+# ---------------------------------------------------------------------------
+# psycopg2 instrumentation
+# ---------------------------------------------------------------------------
+
+
+def _statement_text(query: Any, cursor: Any) -> str:
+    if isinstance(query, bytes):
+        return query.decode("utf-8", errors="replace")
+    if isinstance(query, str):
+        return query
+    as_string = getattr(query, "as_string", None)
+    if as_string is not None:
+        return as_string(cursor)
+    return str(query)
+
+
+class _ProfilingCursorMixin:
+    """Time ``execute``/``executemany`` when a profile is active."""
+
+    def execute(self, query: Any, vars: Any = None) -> Any:
+        profile = _active_profile.get()
+        if profile is None:
+            return super().execute(query, vars)  # type: ignore[misc]
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = super().execute(query, vars)  # type: ignore[misc]
+            failed = False
+            return result
+        finally:
+            profile.record(
+                _statement_text(query, self),
+                vars,
+                (time.perf_counter() - started) * 1000.0,
+                None if failed else self.rowcount,  # type: ignore[attr-defined]
+                failed=failed,
+            )
+
+    def executemany(self, query: Any, vars_list: Any) -> Any:
+        profile = _active_profile.get()
+        if profile is None:
+            return super().executemany(query, vars_list)  # type: ignore[misc]
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = super().executemany(query, vars_list)  # type: ignore[misc]
+            failed = False
+            return result
+        finally:
+            # executemany parameters are never explainable as one statement.
+            profile.record(
+                _statement_text(query, self),
+                None,
+                (time.perf_counter() - started) * 1000.0,
+                None if failed else self.rowcount,  # type: ignore[attr-defined]
+                failed=failed,
+            )
+
+
+@functools.lru_cache(maxsize=None)
+def profiling_cursor_class(base: type) -> type:
+    """Return a cached profiling subclass of a psycopg2 cursor factory."""
+
+    if issubclass(base, _ProfilingCursorMixin):
+        return base
+    return type(f"Profiling{base.__name__}", (_ProfilingCursorMixin, base), {})
+
+
+class ProfilingConnection(psycopg2.extensions.connection):
+    """psycopg2 connection whose cursors report to the active profile.
+
+    Call sites keep choosing their own ``cursor_factory`` (``RealDictCursor``
+    and friends); the requested factory is wrapped rather than replaced.
+    """
+
+    def cursor(self, *args: Any, **kwargs: Any) -> Any:
+        factory = (
+            kwargs.pop("cursor_factory", None)
+            or self.cursor_factory
+            or psycopg2.extensions.cursor
+        )
+        kwargs["cursor_factory"] = profiling_cursor_class(factory)
+        return super().cursor(*args, **kwargs)
+
+
+def sql_profile_connect_kwargs() -> dict[str, Any]:
+    """Extra ``psycopg2.connect`` kwargs enabling profiling when configured."""
+
+    if not _get_profile_config().enabled:
+        return {}
+    return {"connection_factory": ProfilingConnection}
+
+
+# ---------------------------------------------------------------------------
+# SQLAlchemy instrumentation
+# ---------------------------------------------------------------------------
+
+
+_ENGINE_START_KEY = "nexus_sql_profile_started"
+
+
+def _before_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    if _active_profile.get() is None:
+        return
+    conn.info.setdefault(_ENGINE_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    profile = _active_profile.get()
+    starts = conn.info.get(_ENGINE_START_KEY)
+    if profile is None or not starts:
+        return
+    elapsed_ms = (time.perf_counter() - starts.pop()) * 1000.0
+    profile.record(
+        statement,
+        None if executemany else parameters,
+        elapsed_ms,
+        getattr(cursor, "rowcount", None),
+    )
+
+
+def _handle_error(exception_context: Any) -> None:
+    profile = _active_profile.get()
+    conn = exception_context.connection
+    starts = conn.info.get(_ENGINE_START_KEY) if conn is not None else None
+    if profile is None or not starts or exception_context.statement is None:
+        return
+    elapsed_ms = (time.perf_counter() - starts.pop()) * 1000.0
+    profile.record(
+        exception_context.statement,
+        None,
+        elapsed_ms,
+        None,
+        failed=True,
+    )
+
+
+def instrument_engine(engine: Any) -> Any:
+    """Attach profiling listeners to a SQLAlchemy engine (idempotent)."""
+
+    from sqlalchemy import event
+
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+    return engine
+
+
+def instrument_session(session: Any) -> Any:
+    """Instrument the engine behind a SQLAlchemy session and return the session."""
+
+    instrument_engine(session.get_bind())
+    return session
+
+
+def instrument_engine_if_enabled(engine: Any) -> Any:
+    """Instrument ``engine`` only when ``[sql_profile] enabled`` is set."""
+
+    if _get_profile_config().enabled:
+        instrument_engine(engine)
+    return engine
+
+
+# ---------------------------------------------------------------------------
+# Enrichment: pg_stat_statements and EXPLAIN
+# ---------------------------------------------------------------------------
+
+
+_PG_STAT_STATEMENTS_SQL = """
+    SELECT query,
+           calls,
+           total_exec_time,
+           rows,
+           shared_blks_hit,
+           shared_blks_read
+    FROM pg_stat_statements
+    WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+"""
+
+
+def load_pg_stat_statements(cur: Any) -> dict[str, dict[str, Any]]:
+    """Aggregate server-side ``pg_stat_statements`` history per statement tag.
+
+    Returns an empty mapping when the extension is not installed in this
+    database; the live profile is still meaningful without it.
+    """
+
+    with _suspended():
+        cur.execute("SELECT to_regclass('pg_stat_statements') IS NOT NULL")
+        row = cur.fetchone()
+        available = row[0] if not isinstance(row, Mapping) else next(iter(row.values()))
+        if not available:
+            return {}
+        cur.execute(_PG_STAT_STATEMENTS_SQL)
+        rows = cur.fetchall()
+
+    history: dict[str, dict[str, Any]] = {}
+    for raw in rows:
+        query, calls, total_ms, row_count, hit, read = (
+            tuple(raw.values()) if isinstance(raw, Mapping) else tuple(raw)
+        )
+        entry = history.setdefault(
+            statement_tag(str(query)),
+            {
+                "calls": 0,
+                "total_ms": 0.0,
+                "rows": 0,
+                "shared_blks_hit": 0,
+                "shared_blks_read": 0,
+            },
+        )
+        entry["calls"] += int(calls or 0)
+        entry["total_ms"] += float(total_ms or 0.0)
+        entry["rows"] += int(row_count or 0)
+        entry["shared_blks_hit"] += int(hit or 0)
+        entry["shared_blks_read"] += int(read or 0)
+    for entry in history.values():
+        entry["total_ms"] = round(entry["total_ms"], 3)
+        entry["mean_ms"] = (
+            round(entry["total_ms"] / entry["calls"], 3) if entry["calls"] else 0.0
+        )
+    return history
+
+
+def explain_slowest(
+    profile: SqlProfile,
+    cur: Any,
+    *,
+    limit: int = 3,
+) -> dict[str, Any]:
+    """Return ``EXPLAIN (ANALYZE, BUFFERS)`` plans for the slowest read tags.
+
+    ``cur`` must be a DBAPI (psycopg2) cursor on the connection that ran the
+    profiled statements, because captured parameters are in driver format.
+    Each plan runs inside a savepoint that is always rolled back, so a plan
+    failure never poisons the caller's transaction. Write statements are
+    skipped: EXPLAIN ANALYZE executes what it plans.
+    """
+
+    plans: dict[str, Any] = {}
+    with _suspended():
+        for stats in profile.ranked():
+            if len(plans) >= limit:
+                break
+            sample = profile.slowest_statement(stats.tag)
+            if sample is None:
+                continue
+            statement, parameters, _elapsed = sample
+            if not is_explainable(statement):
+                continue
+            cur.execute("SAVEPOINT nexus_sql_profile_explain")
+            try:
+                cur.execute(
+                    "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + statement,
+                    parameters,
+                )
+                row = cur.fetchone()
+                plan = (
+                    row[0] if not isinstance(row, Mapping) else next(iter(row.values()))
+                )
+                plans[stats.tag] = plan[0] if isinstance(plan, list) else plan
+            except psycopg2.Error as exc:
+                plans[stats.tag] = {"error": str(exc).strip()}
+            finally:
+                cur.execute("ROLLBACK TO SAVEPOINT nexus_sql_profile_explain")
+                cur.execute("RELEASE SAVEPOINT nexus_sql_profile_explain")
+    return plans
+
+
+def enrich_report(
+    report: dict[str, Any],
+    *,
+    pg_stat: Optional[Mapping[str, Mapping[str, Any]]] = None,
+    plans: Optional[Mapping[str, Any]] = None,
+) -> dict[str, Any]:
+    """Attach server history and plans to matching ranked report rows."""
+
+    for row in report["tags"]:
+        if pg_stat is not None and row["tag"] in pg_stat:
+            row["pg_stat_statements"] = dict(pg_stat[row["tag"]])
+        if plans is not None and row["tag"] in plans:
+            row["plan"] = plans[row["tag"]]
+    return report
+
+
+# ---------------------------------------------------------------------------
+# Recorded profiling mode (gateway turns, commits, worker ticks)
+# ---------------------------------------------------------------------------
+
+
+class _ProfileConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    enabled: bool
+    profile_dir: Path
+    log_top: int
+
+
+_config: Optional[_ProfileConfig] = None
+_config_lock = Lock()
+
+
+def _repo_root() -> Path:
+    """The repository root; relative ``profile_dir`` values anchor here."""
+
+    return Path(__file__).resolve().parents[2]
+
+
+def _load_profile_config() -> _ProfileConfig:
+    settings = load_settings().sql_profile
+    profile_dir = Path(settings.profile_dir)
+    if not profile_dir.is_absolute():
+        profile_dir = _repo_root() / profile_dir
+    return _ProfileConfig(
+        enabled=settings.enabled,
+        profile_dir=profile_dir,
+        log_top=settings.log_top,
+    )
+
+
+def _get_profile_config() -> _ProfileConfig:
+    global _config
+    if _config is None:
+        with _config_lock:
+            if _config is None:
+                _config = _load_profile_config()
+    return _config
+
+
+def _reset_profile_config_cache() -> None:
+    """Reset the lazy config singleton for isolated tests."""
+
+    global _config
+    with _config_lock:
+        _config = None
+
+
+def sql_profiling_enabled() -> bool:
+    """Return whether ``[sql_profile] enabled`` is set in nexus.toml."""
+
+    return _get_profile_config().enabled
+
+
+def append_profile_report(report: Mapping[str, Any]) -> Path:
+    """Append one finished report to the day's profile ledger."""
+
+    config = _get_profile_config()
+    day = str(report["started_at"])[:10]
+    path = config.profile_dir / f"sql-profile-{day}.jsonl"
+    line = (json.dumps(report, separators=(",", ":")) + "\n").encode("utf-8")
+    try:
+        config.profile_dir.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_APPEND | os.O_CREAT | os.O_WRONLY, 0o600)
+        try:
+            written = os.write(fd, line)
+            if written != len(line):
+                raise SqlProfileWriteError(
+                    f"Short profile append to {path}: wrote {written} of "
+                    f"{len(line)} bytes"
+                )
+        finally:
+            os.close(fd)
+    except SqlProfileWriteError:
+        raise
+    except OSError as exc:
+        raise SqlProfileWriteError(
+            f"Failed to append SQL profile to {path}: {exc}"
+        ) from exc
+    return path
+
+
+@contextmanager
+def recorded_sql_profile(
+    scope: str, *, slot: Optional[int] = None
+) -> Iterator[Optional[SqlProfile]]:
+    """Profile one scope and append its report when profiling is enabled.
+
+    A no-op yielding ``None`` unless ``[sql_profile] enabled`` is set. Failed
+    scopes are recorded too; a ledger write failure is logged and never fails
+    the profiled work.
+    """
+
+    config = _get_profile_config()
+    if not config.enabled:
+        yield None
+        return
+
+    try:
+        with sql_profile(scope, slot=slot) as profile:
+            yield profile
+    finally:
+        _publish_profile(profile, config)
+
+
+def _publish_profile(profile: SqlProfile, config: _ProfileConfig) -> None:
+    report = profile.report()
+    try:
+        append_profile_report(report)
+    except SqlProfileWriteError:
+        logger.exception("Could not record SQL profile for scope %s", profile.scope)
+    top = ", ".join(
+        f"{row['tag']}={row['total_ms']:.1f}ms/{row['calls']}"
+        for row in report["tags"][: config.log_top]
+    )
+    logger.info(
+        "SQL_PROFILE scope=%s slot=%s statements=%s sql_ms=%.1f elapsed_ms=%.1f "
+        "top=[%s]",
+        profile.scope,
+        profile.slot if profile.slot is not None else "-",
+        report["statements"],
+        report["sql_ms"],
+        report["elapsed_ms"],
+        top,
+    )
+
+
+def load_profile_reports(
+    day: Optional[str] = None,
+    *,
+    profile_dir: Optional[Path] = None,
+) -> list[dict[str, Any]]:
+    """Read one UTC day of recorded profile reports."""
+
+    selected_day = day or datetime.now(timezone.utc).date().isoformat()
+    directory = (
+        Path(profile_dir)
+        if profile_dir is not None
+        else _get_profile_config().profile_dir
+    )
+    path = directory / f"sql-profile-{selected_day}.jsonl"
+    if not path.exists():
+        return []
+    reports: list[dict[str, Any]] = []
+    with path.open("r", encoding="utf-8") as handle:
+        for line_number, raw_line in enumerate(handle, start=1):
+            if not raw_line.strip():
+                continue
+            try:
+                reports.append(json.loads(raw_line))
+            except json.JSONDecodeError as exc:
+                raise ValueError(
+                    f"Malformed SQL profile in {path} at line {line_number}: {exc}"
+                ) from exc
+    return reports
+
+
+def summarize_profile_reports(
+    reports: Iterable[Mapping[str, Any]],
+    *,
+    scope: Optional[str] = None,
+    slot: Optional[int] = None,
+) -> dict[str, Any]:
+    """Merge recorded reports into one ranked per-tag summary.
+
+    ``calls_per_scope`` and ``ms_per_scope`` expose which tags grow as a slot
+    ages: compare summaries from an early and a late day.
+    """
+
+    merged: Dict[str, SqlTagStats] = {}
+    scopes = 0
+    elapsed_ms = 0.0
+    for report in reports:
+        if scope is not None and report.get("scope") != scope:
+            continue
+        if slot is not None and report.get("slot") != slot:
+            continue
+        scopes += 1
+        elapsed_ms += float(report.get("elapsed_ms") or 0.0)
+        for row in report.get("tags", ()):
+            stats = merged.setdefault(row["tag"], SqlTagStats(row["tag"]))
+            stats.calls += int(row["calls"])
+            stats.rows += int(row["rows"])
+            stats.total_ms += float(row["total_ms"])
+            stats.max_ms = max(stats.max_ms, float(row["max_ms"]))
+            stats.errors += int(row.get("errors", 0))
+
+    ranked = sorted(
+        merged.values(), key=lambda item: (-item.total_ms, -item.calls, item.tag)
+    )
+    total_sql_ms = sum(item.total_ms for item in ranked)
+    rows = []
+    for item in ranked:
+        row = item.to_dict(total_sql_ms)
+        row["calls_per_scope"] = round(item.calls / scopes, 3) if scopes else 0.0
+        row["ms_per_scope"] = round(item.total_ms / scopes, 3) if scopes else 0.0
+        rows.append(row)
+    return {
+        "scope": scope,
+        "slot": slot,
+        "scopes": scopes,
+        "elapsed_ms": round(elapsed_ms, 3),
+        "sql_ms": round(total_sql_ms, 3),
+        "statements": sum(item.calls for item in ranked),
+        "tags": rows,
+    }
@@ -83,6 +83,7 @@ from nexus.api.native_structured_output import (
     run_output_validator,
     structured_output_error_text,
 )
+from nexus.api.rate_governor import governed_http_client
 from nexus.telemetry.usage import record_anthropic_response
 
 # Configure logging
@@ -377,7 +378,11 @@ class AnthropicProvider(LLMProvider):
         self.model = self.model or self.DEFAULT_MODEL
 
         # Initialize the client
-        self.client = anthropic.Anthropic(api_key=self.api_key, timeout=self.timeout)
+        self.client = anthropic.Anthropic(
+            api_key=self.api_key,
+            timeout=self.timeout,
+            http_client=governed_http_client(self.usage_provider_name),
+        )
 
         # Log the model type and thinking status
         if self.thinking_enabled:
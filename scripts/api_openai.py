@@ -89,6 +89,7 @@ from nexus.api.native_structured_output import (
     run_output_validator,
     structured_output_error_text,
 )
+from nexus.api.rate_governor import governed_http_client
 from nexus.telemetry.usage import (
     provider_name_from_base_url,
     record_openai_response,
@@ -407,6 +408,7 @@ class OpenAIProvider(LLMProvider):
             logger.info(f"Using custom base URL: {self.base_url}")
         if self.request_timeout is not None:
             client_kwargs["timeout"] = self.request_timeout
+        client_kwargs["http_client"] = governed_http_client(self.usage_provider_name)
         self.client = openai.OpenAI(**client_kwargs)
 
         # Log the model type
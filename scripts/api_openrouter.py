@@ -38,6 +38,8 @@ except ImportError:
 import sqlalchemy as sa
 from sqlalchemy import create_engine
 
+from nexus.api.rate_governor import governed_http_client
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -262,7 +264,8 @@ class OpenRouterProvider(LLMProvider):
         # Initialize the client with OpenRouter base URL
         self.client = openai.OpenAI(
             api_key=self.api_key,
-            base_url=self.API_BASE
+            base_url=self.API_BASE,
+            http_client=governed_http_client("openrouter"),
         )
 
         # Log the configuration
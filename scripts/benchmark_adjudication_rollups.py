@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""Benchmark adjudication-history rollups against log recomputation.
+
+Clones ``NEXUS_template`` into a disposable database, plants a synthetic
+ledger (10^5 adjudications by default, spread over a few thousand proposals
+and chunks, plus periodic ratifying resolutions), rebuilds the rollups with
+migration 121's backfill, then reads the history blocks two ways:
+
+* log: :func:`_ledger_from_log`, the full scan plus Python streak walk every
+  call used to pay.
+* rollups: :func:`_ledger_from_rollups`, which the payload now reads.
+
+Both must agree. The commit-side price is reported as the time to insert one
+tick's rulings with the maintenance triggers enabled.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import asdict
+import os
+from pathlib import Path
+import sys
+from time import perf_counter
+from typing import Any, Callable
+from uuid import uuid4
+
+import psycopg2
+from psycopg2 import sql
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+# Benchmark this checkout, not whichever installed copy sys.path resolves.
+ROOT = Path(__file__).parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from nexus.agents.orrery.history import (  # noqa: E402
+    _ledger_from_log,
+    _ledger_from_rollups,
+)
+from scripts import new_story_setup  # noqa: E402
+
+MIGRATION = ROOT / "migrations" / "121_adjudication_rollups.sql"
+TEMPLATES = 12
+
+
+def _connect(dbname: str) -> Any:
+    """Open a direct PostgreSQL connection."""
+
+    return psycopg2.connect(
+        dbname=dbname,
+        user=os.environ.get("PGUSER", "pythagor"),
+        host=os.environ.get("PGHOST", "localhost"),
+        port=os.environ.get("PGPORT", "5432"),
+        connect_timeout=2,
+    )
+
+
+def plant_ledger(cur: Any, *, rulings: int, proposals: int, chunks: int) -> None:
+    """Insert a synthetic adjudication ledger without firing the triggers."""
+
+    cur.execute(
+        "ALTER TABLE orrery_adjudication_log "
+        "DISABLE TRIGGER orrery_adjudication_rollups"
+    )
+    cur.execute(
+        "ALTER TABLE orrery_resolutions DISABLE TRIGGER orrery_adjudication_rollups"
+    )
+    cur.execute(
+        """
+        INSERT INTO narrative_chunks (raw_text)
+        SELECT 'adjudication benchmark ' || n FROM generate_series(1, %s) n
+        """,
+        (chunks,),
+    )
+    cur.execute(
+        """
+        CREATE TEMP TABLE benchmark_ticks ON COMMIT DROP AS
+        SELECT id, row_number() OVER (ORDER BY id) - 1 AS n
+        FROM narrative_chunks WHERE raw_text LIKE 'adjudication benchmark %'
+        """
+    )
+    # Consecutive rulings go to consecutive proposals, so no proposal is
+    # ruled on twice in one tick; actions are ~70% defer, 20% replace, 10% void.
+    cur.execute(
+        """
+        INSERT INTO orrery_adjudication_log (
+            tick_chunk_id, proposal_id, template_id, binding_hash, action
+        )
+        SELECT tick.id,
+               'bench_' || (g %% %(proposals)s %% %(templates)s) || ':'
+                   || md5((g %% %(proposals)s)::text),
+               'bench_' || (g %% %(proposals)s %% %(templates)s),
+               md5((g %% %(proposals)s)::text),
+               (ARRAY['defer', 'defer', 'defer', 'defer', 'defer', 'defer',
+                      'defer', 'replace', 'replace', 'void'])[
+                   1 + abs(hashint4(g)) %% 10
+               ]
+        FROM generate_series(0, %(rulings)s - 1) g
+        JOIN benchmark_ticks tick
+          ON tick.n = g::bigint * %(chunks)s / %(rulings)s
+        """,
+        {
+            "rulings": rulings,
+            "proposals": proposals,
+            "templates": TEMPLATES,
+            "chunks": chunks,
+        },
+    )
+    cur.execute(
+        """
+        INSERT INTO orrery_resolutions (
+            tick_chunk_id, template_id, binding_hash, priority, state_delta,
+            brief
+        )
+        SELECT tick.id,
+               'bench_' || (p %% %(templates)s),
+               md5(p::text),
+               10,
+               '{}'::jsonb,
+               'benchmark ratification'
+        FROM generate_series(0, %(resolutions)s - 1) g
+        CROSS JOIN LATERAL (SELECT abs(hashint4(g + 7)) %% %(proposals)s AS p) pick
+        JOIN benchmark_ticks tick
+          ON tick.n = g::bigint * %(chunks)s / %(resolutions)s
+        ON CONFLICT DO NOTHING
+        """,
+        {
+            "resolutions": rulings // 10,
+            "proposals": proposals,
+            "templates": TEMPLATES,
+            "chunks": chunks,
+        },
+    )
+    cur.execute(
+        "ALTER TABLE orrery_adjudication_log ENABLE TRIGGER orrery_adjudication_rollups"
+    )
+    cur.execute(
+        "ALTER TABLE orrery_resolutions ENABLE TRIGGER orrery_adjudication_rollups"
+    )
+
+
+def _best_ms(fn: Callable[[], Any], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = perf_counter()
+        fn()
+        best = min(best, perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rulings", type=int, default=100_000)
+    parser.add_argument("--proposals", type=int, default=2_000)
+    parser.add_argument("--chunks", type=int, default=5_000)
+    parser.add_argument("--recent-limit", type=int, default=8)
+    parser.add_argument("--tick-rulings", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    dbname = f"qa_adjudication_rollups_{uuid4().hex[:8]}"
+    admin: Any = None
+    engine: Any = None
+    original_use_pool = new_story_setup.USE_POOL
+    try:
+        admin = _connect("postgres")
+        admin.autocommit = True
+        new_story_setup.USE_POOL = False
+        new_story_setup.initialize_slot_database(dbname, source_db="NEXUS_template")
+        with _connect(dbname) as conn:
+            with conn.cursor() as cur:
+                cur.execute(MIGRATION.read_text())
+                plant_ledger(
+                    cur,
+                    rulings=args.rulings,
+                    proposals=args.proposals,
+                    chunks=args.chunks,
+                )
+                started = perf_counter()
+                cur.execute(MIGRATION.read_text())
+                backfill_ms = (perf_counter() - started) * 1000
+                cur.execute("ANALYZE")
+
+        engine = create_engine(
+            "postgresql+psycopg2://", creator=lambda: _connect(dbname)
+        )
+        with Session(engine) as session:
+
+            def from_log() -> Any:
+                return _ledger_from_log(
+                    session,
+                    template_clause="",
+                    params={},
+                    recent_rulings_limit=args.recent_limit,
+                )
+
+            def from_rollups() -> Any:
+                return _ledger_from_rollups(
+                    session,
+                    template_id=None,
+                    recent_rulings_limit=args.recent_limit,
+                )
+
+            ledgers_match = asdict(from_log()) == asdict(from_rollups())
+            log_ms = _best_ms(from_log, args.repeats)
+            rollup_ms = _best_ms(from_rollups, args.repeats)
+
+        with _connect(dbname) as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT max(id) FROM narrative_chunks")
+                tick = cur.fetchone()[0]
+                started = perf_counter()
+                for index in range(args.tick_rulings):
+                    proposal = index * (args.proposals // args.tick_rulings)
+                    template = f"bench_{proposal % TEMPLATES}"
+                    cur.execute(
+                        """
+                        INSERT INTO orrery_adjudication_log (
+                            tick_chunk_id, proposal_id, template_id,
+                            binding_hash, action
+                        ) VALUES (%s, %s || ':' || md5(%s), %s, md5(%s), 'defer')
+                        """,
+                        (tick, template, str(proposal), template, str(proposal)),
+                    )
+                tick_ms = (perf_counter() - started) * 1000
+                conn.rollback()
+
+        print(
+            "\n".join(
+                [
+                    f"rulings={args.rulings}",
+                    f"proposals={args.proposals}",
+                    f"ledgers_match={ledgers_match}",
+                    f"log_recompute_ms={log_ms:.2f}",
+                    f"rollup_read_ms={rollup_ms:.2f}",
+                    f"speedup={log_ms / rollup_ms:.1f}x",
+                    f"backfill_ms={backfill_ms:.2f}",
+                    f"tick_insert_{args.tick_rulings}_rulings_ms={tick_ms:.2f}",
+                ]
+            )
+        )
+    finally:
+        new_story_setup.USE_POOL = original_use_pool
+        if engine is not None:
+            engine.dispose()
+        if admin is not None:
+            with admin.cursor() as cur:
+                cur.execute(
+                    "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+                    "WHERE datname = %s AND pid <> pg_backend_pid()",
+                    (dbname,),
+                )
+                cur.execute(
+                    sql.SQL("DROP DATABASE IF EXISTS {}").format(sql.Identifier(dbname))
+                )
+            admin.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""Benchmark indexed claim-possession hydration against the ledger joins.
+
+Clones ``NEXUS_template`` into a disposable database, plants a synthetic
+Epistemics ledger (5 x 10^4 claims by default over a few thousand entities,
+each with its event subjects and a handful of awareness rows), rebuilds
+``claim_possession_index`` with migration 122's backfill, then hydrates one
+tick's entity universe two ways:
+
+* ledger: the claims/world_events/world_event_entities/claim_awareness
+  UNION and lateral subject expansion hydration ran every tick before.
+* indexed: the ``claim_possession_index`` lookups hydration now runs.
+
+Both must agree. The write-side price is reported as the time to mint one
+tick's awareness rows with the maintenance triggers enabled.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+import random
+import sys
+from time import perf_counter
+from typing import Any, Callable
+from uuid import uuid4
+
+import psycopg2
+from psycopg2 import sql
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+# Benchmark this checkout, not whichever installed copy sys.path resolves.
+ROOT = Path(__file__).parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from nexus.agents.orrery.epistemics import (  # noqa: E402
+    _load_claim_possession,
+    load_epistemics_hydration,
+)
+from scripts import new_story_setup  # noqa: E402
+
+MIGRATION = ROOT / "migrations" / "122_claim_possession_index.sql"
+INDEXED_TABLES = (
+    "claim_awareness",
+    "claims",
+    "world_events",
+    "world_event_entities",
+)
+
+
+def _connect(dbname: str) -> Any:
+    """Open a direct PostgreSQL connection."""
+
+    return psycopg2.connect(
+        dbname=dbname,
+        user=os.environ.get("PGUSER", "pythagor"),
+        host=os.environ.get("PGHOST", "localhost"),
+        port=os.environ.get("PGPORT", "5432"),
+        connect_timeout=2,
+    )
+
+
+def _set_triggers(cur: Any, *, enabled: bool) -> None:
+    verb = "ENABLE" if enabled else "DISABLE"
+    for table in INDEXED_TABLES:
+        cur.execute(
+            sql.SQL("ALTER TABLE {} {} TRIGGER claim_possession_index").format(
+                sql.Identifier(table), sql.SQL(verb)
+            )
+        )
+
+
+def plant_ledger(cur: Any, *, claims: int, entities: int, chunks: int) -> None:
+    """Insert a synthetic claim ledger without firing the index triggers."""
+
+    _set_triggers(cur, enabled=False)
+    cur.execute(
+        """
+        INSERT INTO narrative_chunks (raw_text)
+        SELECT 'claim hydration benchmark ' || n FROM generate_series(1, %s) n
+        """,
+        (chunks,),
+    )
+    cur.execute(
+        """
+        CREATE TEMP TABLE benchmark_ticks ON COMMIT DROP AS
+        SELECT id, row_number() OVER (ORDER BY id) - 1 AS n
+        FROM narrative_chunks
+        WHERE raw_text LIKE 'claim hydration benchmark %'
+        """
+    )
+    cur.execute(
+        """
+        CREATE TEMP TABLE benchmark_entities ON COMMIT DROP AS
+        WITH inserted AS (
+            INSERT INTO entities (kind, is_active)
+            SELECT 'character', false FROM generate_series(1, %s)
+            RETURNING id
+        )
+        SELECT id, row_number() OVER (ORDER BY id) - 1 AS n FROM inserted
+        """,
+        (entities,),
+    )
+    cur.execute(
+        """
+        CREATE TEMP TABLE benchmark_events ON COMMIT DROP AS
+        WITH picks AS (
+            SELECT g,
+                   abs(hashint4(g)) %% %(entities)s AS actor_n,
+                   abs(hashint4(g + 1)) %% %(entities)s AS target_n
+            FROM generate_series(0, %(claims)s - 1) g
+        ),
+        inserted AS (
+            INSERT INTO world_events (
+                event_type, tick_chunk_id, actor_entity_id, target_entity_id,
+                world_layer, source, changed_fields, payload
+            )
+            SELECT 'threat_issued', tick.id, actor.id, target.id, 'primary',
+                   'resolver', '{}', jsonb_build_object('benchmark', picks.g)
+            FROM picks
+            JOIN benchmark_ticks tick
+              ON tick.n = picks.g::bigint * %(chunks)s / %(claims)s
+            JOIN benchmark_entities actor ON actor.n = picks.actor_n
+            JOIN benchmark_entities target ON target.n = picks.target_n
+            RETURNING id, tick_chunk_id, actor_entity_id, target_entity_id,
+                      (payload ->> 'benchmark')::bigint AS g
+        )
+        SELECT * FROM inserted
+        """,
+        {"claims": claims, "entities": entities, "chunks": chunks},
+    )
+    cur.execute(
+        """
+        INSERT INTO world_event_entities (event_id, role, entity_id)
+        SELECT id, 'actor', actor_entity_id FROM benchmark_events
+        UNION ALL
+        SELECT id, 'target', target_entity_id FROM benchmark_events
+        WHERE target_entity_id <> actor_entity_id
+        """
+    )
+    # ~10% common, ~20% private, the rest bounded.
+    cur.execute(
+        """
+        INSERT INTO claims (world_event_id, summary, scope, source_chunk_id)
+        SELECT id,
+               'benchmark claim ' || g,
+               (ARRAY['common', 'private', 'private', 'bounded', 'bounded',
+                      'bounded', 'bounded', 'bounded', 'bounded',
+                      'bounded'])[1 + abs(hashint4(g + 2)) % 10],
+               tick_chunk_id
+        FROM benchmark_events
+        """
+    )
+    # Both endpoints participate; two hashed listeners were told.
+    cur.execute(
+        """
+        INSERT INTO claim_awareness (
+            claim_id, knower_entity_id, source_tier, immediate_source_entity_id,
+            channel, source_chunk_id
+        )
+        SELECT c.id, knower.entity_id, knower.tier, knower.source_id,
+               knower.channel, e.tick_chunk_id
+        FROM claims c
+        JOIN benchmark_events e ON e.id = c.world_event_id
+        CROSS JOIN LATERAL (
+            SELECT e.actor_entity_id AS entity_id, 'participant' AS tier,
+                   NULL::bigint AS source_id, NULL::text AS channel
+            UNION
+            SELECT e.target_entity_id, 'participant', NULL, NULL
+            UNION
+            SELECT listener.id, 'told', e.actor_entity_id, 'dyad:associate'
+            FROM benchmark_entities listener
+            WHERE listener.n IN (
+                abs(hashint4(e.g + 3)) %% %(entities)s,
+                abs(hashint4(e.g + 4)) %% %(entities)s
+            )
+              AND listener.id NOT IN (e.actor_entity_id, e.target_entity_id)
+        ) knower
+        ON CONFLICT DO NOTHING
+        """,
+        {"entities": entities},
+    )
+    _set_triggers(cur, enabled=True)
+
+
+def _best_ms(fn: Callable[[], Any], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = perf_counter()
+        fn()
+        best = min(best, perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--claims", type=int, default=50_000)
+    parser.add_argument("--entities", type=int, default=3_000)
+    parser.add_argument("--chunks", type=int, default=5_000)
+    parser.add_argument("--universe", type=int, default=200)
+    parser.add_argument("--tick-awareness", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    dbname = f"qa_claim_hydration_{uuid4().hex[:8]}"
+    admin: Any = None
+    engine: Any = None
+    original_use_pool = new_story_setup.USE_POOL
+    try:
+        admin = _connect("postgres")
+        admin.autocommit = True
+        new_story_setup.USE_POOL = False
+        new_story_setup.initialize_slot_database(dbname, source_db="NEXUS_template")
+        with _connect(dbname) as conn:
+            with conn.cursor() as cur:
+                cur.execute(MIGRATION.read_text())
+                plant_ledger(
+                    cur,
+                    claims=args.claims,
+                    entities=args.entities,
+                    chunks=args.chunks,
+                )
+                started = perf_counter()
+                cur.execute(MIGRATION.read_text())
+                backfill_ms = (perf_counter() - started) * 1000
+                cur.execute("ANALYZE")
+                cur.execute(
+                    "SELECT id FROM entities WHERE kind = 'character' ORDER BY id"
+                )
+                entity_ids = [row[0] for row in cur.fetchall()]
+                cur.execute("SELECT max(id) FROM narrative_chunks")
+                anchor_chunk_id = cur.fetchone()[0]
+
+        universe = tuple(
+            sorted(random.Random(args.seed).sample(entity_ids, args.universe))
+        )
+        engine = create_engine(
+            "postgresql+psycopg2://", creator=lambda: _connect(dbname)
+        )
+        with Session(engine) as session:
+
+            def possession(indexed: bool) -> Any:
+                return _load_claim_possession(
+                    session,
+                    indexed=indexed,
+                    latent_secret_flag="false",
+                    universe=universe,
+                    anchor_chunk_id=anchor_chunk_id,
+                )
+
+            ledger = possession(False)
+            indexed = possession(True)
+            possession_match = ledger == indexed
+            ledger_ms = _best_ms(lambda: possession(False), args.repeats)
+            indexed_ms = _best_ms(lambda: possession(True), args.repeats)
+            hydration_ms = _best_ms(
+                lambda: load_epistemics_hydration(
+                    session,
+                    entity_ids=universe,
+                    recent_event_ids=(),
+                    anchor_chunk_id=anchor_chunk_id,
+                ),
+                args.repeats,
+            )
+
+        with _connect(dbname) as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT c.id, e.id
+                    FROM claims c
+                    CROSS JOIN LATERAL (
+                        SELECT id FROM entities
+                        WHERE kind = 'character'
+                        ORDER BY hashint4((id + c.id)::int)
+                        LIMIT 1
+                    ) e
+                    ORDER BY c.id DESC
+                    LIMIT %s
+                    """,
+                    (args.tick_awareness,),
+                )
+                grants = cur.fetchall()
+                started = perf_counter()
+                for claim_id, knower_id in grants:
+                    cur.execute(
+                        """
+                        INSERT INTO claim_awareness (
+                            claim_id, knower_entity_id, source_tier,
+                            source_chunk_id
+                        ) VALUES (%s, %s, 'granted', %s)
+                        ON CONFLICT DO NOTHING
+                        """,
+                        (claim_id, knower_id, anchor_chunk_id),
+                    )
+                tick_ms = (perf_counter() - started) * 1000
+                conn.rollback()
+
+        print(
+            "\n".join(
+                [
+                    f"claims={args.claims}",
+                    f"entities={args.entities}",
+                    f"universe={args.universe}",
+                    f"relevant_claims={len(indexed[0])}",
+                    f"awareness_rows={len(indexed[1])}",
+                    f"possession_match={possession_match}",
+                    f"ledger_possession_ms={ledger_ms:.2f}",
+                    f"indexed_possession_ms={indexed_ms:.2f}",
+                    f"speedup={ledger_ms / indexed_ms:.1f}x",
+                    f"indexed_hydration_ms={hydration_ms:.2f}",
+                    f"backfill_ms={backfill_ms:.2f}",
+                    f"tick_insert_{args.tick_awareness}_awareness_ms={tick_ms:.2f}",
+                ]
+            )
+        )
+    finally:
+        new_story_setup.USE_POOL = original_use_pool
+        if engine is not None:
+            engine.dispose()
+        if admin is not None:
+            with admin.cursor() as cur:
+                cur.execute(
+                    "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+                    "WHERE datname = %s AND pid <> pg_backend_pid()",
+                    (dbname,),
+                )
+                cur.execute(
+                    sql.SQL("DROP DATABASE IF EXISTS {}").format(sql.Identifier(dbname))
+                )
+            admin.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Benchmark per-tick Orrery setup with and without resident cognition.
+
+Times the static setup ``resolve_dry_run`` performs before hydration — the
+settings coercions, project-magnitude configuration of the builtin stack
+and the slot-signature partition — two ways, for LORE's shape (every
+``[orrery]`` payload supplied) and for the standalone shape that leaves
+``[orrery.epistemics]`` to the config file:
+
+* inline: the pre-cache path, rebuilt on every tick.
+* resident: :func:`load_orrery_cognition` after its first build, which
+  pays only the digest.
+
+Both must produce identical stacks and policies.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+from time import perf_counter
+from typing import Any, Callable, Mapping, Optional
+
+# Benchmark this checkout, not whichever installed copy sys.path resolves.
+ROOT = Path(__file__).parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from nexus.agents.orrery.cognition import (  # noqa: E402
+    OrreryCognition,
+    build_template_stacks,
+    clear_orrery_cognition,
+    load_orrery_cognition,
+)
+from nexus.agents.orrery.epistemics import (  # noqa: E402
+    coerce_epistemics_policy,
+    load_epistemics_policy,
+)
+from nexus.agents.orrery.needs import coerce_need_tuning  # noqa: E402
+from nexus.agents.orrery.substrate import (  # noqa: E402
+    coerce_branch_selection,
+    coerce_habituation,
+    coerce_package_selection,
+    coerce_project_policy,
+)
+from nexus.agents.orrery.templates import BUILTIN_TEMPLATES  # noqa: E402
+from nexus.config.loader import load_settings_as_dict  # noqa: E402
+
+
+def inline_setup(settings: Mapping[str, Optional[Any]]) -> tuple[Any, ...]:
+    """The per-tick setup every resolver call paid before the cache."""
+
+    project_policy = coerce_project_policy(settings["projects"])
+    return (
+        build_template_stacks(BUILTIN_TEMPLATES, project_policy),
+        coerce_need_tuning(settings["sunhelm"]),
+        coerce_branch_selection(settings["selection"]),
+        coerce_habituation(settings["habituation"]),
+        coerce_package_selection(settings["package_selection"]),
+        project_policy,
+        (
+            load_epistemics_policy()
+            if settings["epistemics"] is None
+            else coerce_epistemics_policy(settings["epistemics"])
+        ),
+    )
+
+
+def resident_setup(settings: Mapping[str, Optional[Any]]) -> OrreryCognition:
+    return load_orrery_cognition(
+        BUILTIN_TEMPLATES,
+        sunhelm_settings=settings["sunhelm"],
+        selection_settings=settings["selection"],
+        habituation_settings=settings["habituation"],
+        package_selection_settings=settings["package_selection"],
+        project_settings=settings["projects"],
+        epistemics_settings=settings["epistemics"],
+    )
+
+
+def _as_tuple(cognition: OrreryCognition) -> tuple[Any, ...]:
+    return (
+        cognition.stacks,
+        cognition.need_tuning,
+        cognition.selection,
+        cognition.habituation,
+        cognition.package_selection,
+        cognition.project_policy,
+        cognition.epistemics_policy,
+    )
+
+
+def _mean_ms(fn: Callable[[], Any], ticks: int, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = perf_counter()
+        for _ in range(ticks):
+            fn()
+        best = min(best, perf_counter() - started)
+    return best * 1000 / ticks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    orrery = load_settings_as_dict()["orrery"]
+    supplied = {
+        name: orrery.get(name)
+        for name in (
+            "sunhelm",
+            "selection",
+            "habituation",
+            "package_selection",
+            "projects",
+            "epistemics",
+        )
+    }
+    shapes = {"lore": supplied, "config_fallback": {**supplied, "epistemics": None}}
+    lines = [f"templates={len(BUILTIN_TEMPLATES)}", f"ticks={args.ticks}"]
+    for label, settings in shapes.items():
+        clear_orrery_cognition()
+        started = perf_counter()
+        cognition = resident_setup(settings)
+        first_build_ms = (perf_counter() - started) * 1000
+        matches = _as_tuple(cognition) == inline_setup(settings)
+        inline_ms = _mean_ms(lambda: inline_setup(settings), args.ticks, args.repeats)
+        resident_ms = _mean_ms(
+            lambda: resident_setup(settings), args.ticks, args.repeats
+        )
+        lines += [
+            f"{label}_setup_matches={matches}",
+            f"{label}_inline_ms_per_tick={inline_ms:.4f}",
+            f"{label}_resident_ms_per_tick={resident_ms:.4f}",
+            f"{label}_first_build_ms={first_build_ms:.2f}",
+            f"{label}_speedup={inline_ms / resident_ms:.1f}x",
+        ]
+    print("\n".join(lines))
+
+
+if __name__ == "__main__":
+    main()
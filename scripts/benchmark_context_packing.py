@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""Compare knapsack context packing with the greedy path on recorded turns.
+
+Reads stored turn contexts (``sessions/<session>/context/<turn>.json``, as
+written by the storyteller session manager) and, for each one, re-fits its
+candidates under a shrinking token capacity:
+
+* structured: featured entities, relationships, events and threats by tier
+  utility, baseline entities protected. Greedy is the old first fit in tier
+  order.
+* retrieval: retrieved passages (narrative chunks and Retrograde summaries)
+  by search score. Greedy is the old stop-at-first-overflow loop.
+
+The two families are reported separately because their utilities are on
+different scales. Sizes come from the storyteller tokenizer.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from statistics import mean
+import sys
+from time import perf_counter
+from typing import Any, Dict, Iterable, List
+
+# Benchmark this checkout, not whichever installed copy sys.path resolves.
+ROOT = Path(__file__).parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from nexus.agents.lore.utils.chunk_operations import (  # noqa: E402
+    calculate_chunk_tokens_batch,
+)
+from nexus.agents.lore.utils.context_packing import (  # noqa: E402
+    FEATURED_TIER_UTILITY,
+    PackCandidate,
+    chunk_utility,
+    greedy_pack,
+    pack_candidates,
+)
+from nexus.agents.lore.utils.token_budget import TokenBudgetManager  # noqa: E402
+from nexus.memory.context_state import is_retrograde_summary  # noqa: E402
+
+FRACTIONS = (0.9, 0.7, 0.5, 0.3)
+
+
+def _context_files(paths: Iterable[Path]) -> List[Path]:
+    files: List[Path] = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(path.glob("*/context/*.json")))
+            files.extend(sorted(path.glob("*.json")))
+        elif path.suffix == ".json":
+            files.append(path)
+    return files
+
+
+def _featured_priority(kind: str, entity: Dict[str, Any]) -> int:
+    reference = entity.get("reference_type")
+    if kind == "characters":
+        return 1 if reference == "present" else 3
+    if kind == "locations":
+        return 2 if reference == "setting" else 4
+    return 5
+
+
+def _structured_candidates(entity_data: Dict[str, Any]) -> List[PackCandidate]:
+    manager = TokenBudgetManager({})
+    candidates: List[PackCandidate] = []
+
+    def add(
+        kind: str, entity: Dict[str, Any], priority: int, required: bool = False
+    ) -> None:
+        candidates.append(
+            PackCandidate(
+                key=(kind, len(candidates)),
+                kind=kind,
+                tokens=manager.estimate_entity_tokens(entity),
+                utility=0.0 if required else FEATURED_TIER_UTILITY[priority],
+                item=entity,
+                required=required,
+            )
+        )
+
+    # Counts every entity in one tokenizer pass and caches token_count.
+    manager.calculate_structured_tokens_by_tier(entity_data)
+    for kind in ("characters", "locations", "factions"):
+        tiered = entity_data.get(kind, {})
+        if not isinstance(tiered, dict):
+            continue
+        for entity in tiered.get("baseline", []):
+            add(kind, entity, 0, required=True)
+        for entity in tiered.get("featured", []):
+            add(kind, entity, _featured_priority(kind, entity))
+    for kind, priority in (("relationships", 6), ("events", 7), ("threats", 8)):
+        for entity in entity_data.get(kind, []):
+            add(kind, entity, priority)
+    # The greedy path visits featured items by tier, larger first.
+    candidates.sort(key=lambda c: (-c.utility, -c.tokens))
+    return candidates
+
+
+def _retrieval_candidates(passages: List[Dict[str, Any]]) -> List[PackCandidate]:
+    counts = calculate_chunk_tokens_batch(
+        [str(passage.get("text", "")) for passage in passages]
+    )
+    return [
+        PackCandidate(
+            key=rank,
+            kind="retrograde_summary" if is_retrograde_summary(passage) else "chunk",
+            tokens=tokens,
+            utility=chunk_utility(passage, rank),
+            item=passage,
+        )
+        for rank, (passage, tokens) in enumerate(zip(passages, counts))
+    ]
+
+
+def _compare(
+    candidates: List[PackCandidate], stop_at_overflow: bool
+) -> List[Dict[str, float]]:
+    optional_tokens = sum(c.tokens for c in candidates if not c.required)
+    required_tokens = sum(c.tokens for c in candidates if c.required)
+    rows = []
+    for fraction in FRACTIONS:
+        capacity = required_tokens + int(optional_tokens * fraction)
+        greedy = greedy_pack(candidates, capacity, stop_at_overflow=stop_at_overflow)
+        started = perf_counter()
+        packed = pack_candidates(candidates, capacity)
+        elapsed_ms = (perf_counter() - started) * 1000
+        rows.append(
+            {
+                "fraction": fraction,
+                "greedy_utility": greedy.utility,
+                "packed_utility": packed.utility,
+                "greedy_utilization": greedy.tokens / capacity if capacity else 0.0,
+                "packed_utilization": packed.tokens / capacity if capacity else 0.0,
+                "solve_ms": elapsed_ms,
+            }
+        )
+    return rows
+
+
+def _print_family(label: str, rows: List[Dict[str, float]]) -> None:
+    if not rows:
+        print(f"{label}_turns=0")
+        return
+    for fraction in FRACTIONS:
+        subset = [row for row in rows if row["fraction"] == fraction]
+        greedy = sum(row["greedy_utility"] for row in subset)
+        packed = sum(row["packed_utility"] for row in subset)
+        prefix = f"{label}_at_{int(fraction * 100)}pct"
+        print(f"{prefix}_turns={len(subset)}")
+        print(
+            f"{prefix}_utility_gain={(packed / greedy - 1) * 100 if greedy else 0:.2f}%"
+        )
+        print(
+            f"{prefix}_utilization="
+            f"greedy:{mean(row['greedy_utilization'] for row in subset):.3f},"
+            f"packed:{mean(row['packed_utilization'] for row in subset):.3f}"
+        )
+        print(f"{prefix}_solve_ms_max={max(row['solve_ms'] for row in subset):.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        default=[ROOT / "sessions"],
+        help="Context JSON files, or directories of them (default: sessions/)",
+    )
+    args = parser.parse_args()
+
+    files = _context_files(args.paths)
+    if not files:
+        raise SystemExit("No recorded turn contexts found")
+
+    structured_rows: List[Dict[str, float]] = []
+    retrieval_rows: List[Dict[str, float]] = []
+    for path in files:
+        with path.open(encoding="utf-8") as handle:
+            payload = json.load(handle)
+        payload = payload.get("context_payload", payload)
+        entity_data = payload.get("entity_data")
+        if isinstance(entity_data, dict):
+            candidates = _structured_candidates(entity_data)
+            if any(not c.required for c in candidates):
+                structured_rows.extend(_compare(candidates, stop_at_overflow=False))
+        passages = (payload.get("retrieved_passages") or {}).get("results") or []
+        if passages:
+            retrieval_rows.extend(
+                _compare(_retrieval_candidates(passages), stop_at_overflow=True)
+            )
+
+    print(f"contexts={len(files)}")
+    _print_family("structured", structured_rows)
+    _print_family("retrieval", retrieval_rows)
+
+
+if __name__ == "__main__":
+    main()
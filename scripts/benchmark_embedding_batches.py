@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Benchmark length-bucketed batch embedding against the per-text loop.
+
+Builds a synthetic corpus whose lengths resemble rendered recollections and
+Retrograde summaries (mostly short, with a long tail) and embeds it three
+ways through a real ``EmbeddingManager``:
+
+* loop: one ``generate_embedding`` call per text, as the experience and
+  Retrograde embedding paths did before batching.
+* unsorted: one ``generate_embeddings_batch`` call at the model's default
+  batch size, in input order.
+* bucketed: ``embed_in_length_buckets`` (token-length sort, padded-token
+  budget per batch).
+
+Without ``--model`` the embedder is a small randomly initialized BERT with a
+word-level vocabulary, built offline in a temporary directory; CPU attention
+costs still scale with padding, so relative throughput carries over. Pass a
+local path or hub id to time a configured MEMNON model instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import random
+import sys
+import tempfile
+from time import perf_counter
+from typing import Any, Callable, List
+
+# Benchmark this checkout, not whichever installed copy sys.path resolves.
+ROOT = Path(__file__).parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from nexus.agents.memnon.utils.embedding_batches import (  # noqa: E402
+    embed_in_length_buckets,
+)
+from nexus.agents.memnon.utils.embedding_manager import (  # noqa: E402
+    EmbeddingManager,
+)
+
+MODEL_KEY = "bench-embed"
+VOCABULARY = [f"w{index}" for index in range(2000)]
+
+
+def synthetic_corpus(count: int, *, seed: int = 0) -> List[str]:
+    """Texts of 8-400 words, log-normally distributed around ~60 words."""
+    rng = random.Random(seed)
+    texts: List[str] = []
+    for _ in range(count):
+        words = min(400, max(8, int(rng.lognormvariate(4.0, 0.7))))
+        texts.append(" ".join(rng.choice(VOCABULARY) for _ in range(words)))
+    return texts
+
+
+def save_synthetic_model(directory: Path, *, hidden: int = 256, layers: int = 4) -> str:
+    """Write a random-weight SentenceTransformer to ``directory``."""
+    from sentence_transformers import SentenceTransformer
+    from sentence_transformers import models as st_models
+    from tokenizers import Tokenizer, models, pre_tokenizers
+    from transformers import BertConfig, BertModel, PreTrainedTokenizerFast
+
+    specials = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"]
+    vocab = {token: index for index, token in enumerate(specials + VOCABULARY)}
+    tokenizer = Tokenizer(models.WordLevel(vocab=vocab, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+    transformer_dir = directory / "transformer"
+    BertModel(
+        BertConfig(
+            vocab_size=len(vocab),
+            hidden_size=hidden,
+            num_hidden_layers=layers,
+            num_attention_heads=4,
+            intermediate_size=hidden * 4,
+            max_position_embeddings=512,
+        )
+    ).save_pretrained(transformer_dir)
+    PreTrainedTokenizerFast(
+        tokenizer_object=tokenizer,
+        unk_token="[UNK]",
+        pad_token="[PAD]",
+        cls_token="[CLS]",
+        sep_token="[SEP]",
+        mask_token="[MASK]",
+    ).save_pretrained(transformer_dir)
+    transformer = st_models.Transformer(str(transformer_dir), max_seq_length=512)
+    model = SentenceTransformer(
+        modules=[transformer, st_models.Pooling(hidden)], device="cpu"
+    )
+    model_dir = directory / "sentence-transformer"
+    model.save(str(model_dir))
+    return str(model_dir)
+
+
+def bench_manager(model_path: str) -> EmbeddingManager:
+    location = "local_path" if Path(model_path).is_dir() else "remote_path"
+    return EmbeddingManager(
+        settings={"models": {MODEL_KEY: {location: model_path, "is_active": True}}}
+    )
+
+
+def embed_loop(manager: EmbeddingManager, texts: List[str]) -> List[List[float]]:
+    return [manager.generate_embedding(text, MODEL_KEY) for text in texts]
+
+
+def embed_unsorted(manager: EmbeddingManager, texts: List[str]) -> List[List[float]]:
+    return manager.generate_embeddings_batch(texts, MODEL_KEY)
+
+
+def embed_bucketed(manager: EmbeddingManager, texts: List[str]) -> List[List[float]]:
+    vectors: List[Any] = [None] * len(texts)
+    buckets = embed_in_length_buckets(
+        manager,
+        texts,
+        [MODEL_KEY],
+        keys=list(range(len(texts))),
+        subject="benchmark texts",
+    )
+    for bucket in buckets[MODEL_KEY]:
+        for index, vector in zip(bucket.indices, bucket.vectors):
+            vectors[index] = vector
+    return vectors
+
+
+def max_abs_difference(left: List[List[float]], right: List[List[float]]) -> float:
+    return max(
+        abs(a - b) for row_a, row_b in zip(left, right) for a, b in zip(row_a, row_b)
+    )
+
+
+def _best_seconds(run: Callable[[], Any], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = perf_counter()
+        run()
+        best = min(best, perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--texts", type=int, default=512, help="Corpus size (default: 512)"
+    )
+    parser.add_argument(
+        "--model",
+        help="Local SentenceTransformer path or hub id (default: synthetic BERT)",
+    )
+    parser.add_argument("--repeats", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    import torch
+
+    torch.manual_seed(args.seed)
+    texts = synthetic_corpus(args.texts, seed=args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        model_path = args.model or save_synthetic_model(Path(directory))
+        manager = bench_manager(model_path)
+        if manager.get_available_models() != [MODEL_KEY]:
+            raise SystemExit(f"Could not load embedding model from {model_path}")
+
+        expected = embed_loop(manager, texts)
+        print(f"texts={len(texts)}")
+        print(f"threads={torch.get_num_threads()}")
+        for name, run in (
+            ("loop", embed_loop),
+            ("unsorted", embed_unsorted),
+            ("bucketed", embed_bucketed),
+        ):
+            seconds = _best_seconds(lambda: run(manager, texts), args.repeats)
+            difference = max_abs_difference(expected, run(manager, texts))
+            print(f"{name}_texts_per_sec={len(texts) / seconds:.1f}")
+            print(f"{name}_max_abs_diff={difference:.2e}")
+
+
+if __name__ == "__main__":
+    main()
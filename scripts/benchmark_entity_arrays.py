@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""Benchmark scalar versus array copresence and need-pressure computation.
+
+Builds seeded synthetic worlds of ``--entities`` characters (places, travel,
+tags, need rows) and times each per-tick computation two ways:
+
+* scalar: the per-entity loops the resolver ran before ``entity_arrays``
+  (reproduced here as reference implementations).
+* array: the ``WorldState.entity_arrays`` projection and its kernels, i.e.
+  what ``_load_need_debt_scores``, ``_present_need_pressure_specs``,
+  ``count_co_located`` and ``copresence_pairs_from_state`` now run.
+
+Sections are need hydration (applicability plus accrual over every need
+row), present-need pressure over ``--present`` actors, copresence pairs, and
+``count_co_located``'s count for ``--probes`` subjects. The array side pays
+for a fresh projection in every repeat. Both sides must produce identical
+output; no database is needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import random
+import sys
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+# Benchmark this checkout, not whichever installed copy sys.path resolves.
+ROOT = Path(__file__).parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from nexus.agents.orrery.drift import (  # noqa: E402
+    CopresencePair,
+    copresence_pairs_from_state,
+)
+from nexus.agents.orrery.needs import (  # noqa: E402
+    NEED_SEVERITY_PREFIX,
+    NEED_TYPES,
+    NeedTuning,
+    effective_debt_score,
+    need_applies_to_tags,
+    severity_for_debt,
+)
+from nexus.agents.orrery.resolver import (  # noqa: E402
+    _load_need_debt_scores,
+    _present_need_pressure_specs,
+)
+from nexus.agents.orrery.substrate import (  # noqa: E402
+    INTIMACY_SUPPRESSOR_TAGS,
+    TravelState,
+    WorldState,
+)
+
+TAGS = (
+    "leader",
+    "crowd",
+    "guard",
+    "virtual",
+    "libido_absent",
+    "inorganic",
+    "grieving",
+    "vow_of_celibacy",
+)
+NOW = datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+TUNING = NeedTuning.default()
+
+
+class _RowsSession:
+    """Just enough of a SQLAlchemy session to replay need rows."""
+
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.rows = rows
+
+    def execute(self, statement: Any, params: Any = None) -> "_RowsSession":
+        return self
+
+    def mappings(self) -> list[dict[str, Any]]:
+        return self.rows
+
+
+def synthetic_world(
+    entities: int, *, seed: int = 0
+) -> tuple[WorldState, list[dict[str, Any]]]:
+    """A seeded state and its ``character_need_states`` rows."""
+
+    rng = random.Random(seed)
+    ids = range(1, entities + 1)
+    places = max(2, entities // 12)
+    need_rows = [
+        {
+            "character_entity_id": entity,
+            "need_type": need,
+            "debt_score": rng.uniform(0.0, 20.0),
+            "last_evaluated_at": NOW - timedelta(minutes=rng.randint(0, 600)),
+        }
+        for entity in ids
+        for need in NEED_TYPES
+    ]
+    state = WorldState(
+        tags={entity: frozenset(rng.sample(TAGS, rng.randint(0, 2))) for entity in ids},
+        ephemeral_tags={
+            entity: frozenset({rng.choice(TAGS)})
+            for entity in ids
+            if rng.random() < 0.1
+        },
+        locations={
+            entity: None if rng.random() < 0.05 else 10_000 + rng.randrange(places)
+            for entity in ids
+        },
+        travel_states={
+            entity: TravelState(status="in_transit")
+            for entity in ids
+            if rng.random() < 0.08
+        },
+        need_debt_scores={
+            (row["character_entity_id"], row["need_type"]): row["debt_score"]
+            for row in need_rows
+        },
+    )
+    return state, need_rows
+
+
+def scalar_need_debt_scores(
+    rows: list[dict[str, Any]], tags_by_entity: dict[int, frozenset[str]]
+) -> dict[tuple[int, str], float]:
+    scores = {}
+    for row in rows:
+        need_type = str(row["need_type"])
+        if not need_applies_to_tags(
+            need_type, tags_by_entity.get(row["character_entity_id"], frozenset())
+        ):
+            continue
+        scores[(row["character_entity_id"], need_type)] = effective_debt_score(
+            need_type,
+            float(row["debt_score"] or 0.0),
+            last_evaluated_at=row["last_evaluated_at"],
+            current_world_time=NOW,
+            tuning=TUNING,
+        )
+    return scores
+
+
+def scalar_present_specs(
+    state: WorldState, present_actor_ids: set[int]
+) -> tuple[dict[str, Any], ...]:
+    specs = []
+    for actor_id in sorted(present_actor_ids):
+        actor_tags = state.tags.get(actor_id, frozenset()) | state.ephemeral_tags.get(
+            actor_id, frozenset()
+        )
+        for need_type, prefix in NEED_SEVERITY_PREFIX.items():
+            if need_type == "intimacy" and INTIMACY_SUPPRESSOR_TAGS & actor_tags:
+                continue
+            debt_score = state.need_debt_scores.get((actor_id, need_type), 0.0)
+            severity = severity_for_debt(need_type, debt_score, tuning=TUNING)
+            if severity is None or severity[0] < TUNING.pressure.min_severity_level:
+                continue
+            specs.append(
+                {
+                    "actor_entity_id": actor_id,
+                    "need_type": need_type,
+                    "severity_prefix": prefix,
+                    "severity_level": severity[0],
+                    "severity_name": severity[1],
+                    "debt_score": debt_score,
+                }
+            )
+    return tuple(specs)
+
+
+def _present(state: WorldState, entity_id: int) -> bool:
+    travel = state.travel_states.get(entity_id)
+    return state.locations.get(entity_id) is not None and not (
+        travel and travel.is_in_transit
+    )
+
+
+def scalar_copresence(state: WorldState) -> tuple[CopresencePair, ...]:
+    by_location: dict[int, list[int]] = {}
+    for entity_id in sorted(state.locations):
+        if _present(state, entity_id):
+            by_location.setdefault(state.locations[entity_id], []).append(entity_id)
+    pairs = [
+        (first, second)
+        for members in by_location.values()
+        for index, first in enumerate(members)
+        for second in members[index + 1 :]
+    ]
+    return tuple(CopresencePair(first, second) for first, second in sorted(pairs))
+
+
+def scalar_co_located_counts(
+    state: WorldState, probes: list[int], with_tag: Optional[str]
+) -> list[int]:
+    counts = []
+    for entity_id in probes:
+        location_id = state.locations[entity_id]
+        count = 0
+        for other_id, other_location in state.locations.items():
+            if other_id == entity_id or other_location != location_id:
+                continue
+            travel = state.travel_states.get(other_id)
+            if travel and travel.is_in_transit:
+                continue
+            if with_tag and with_tag not in state.tags.get(other_id, frozenset()):
+                continue
+            count += 1
+        counts.append(count)
+    return counts
+
+
+def array_co_located_counts(
+    state: WorldState, probes: list[int], with_tag: Optional[str]
+) -> list[int]:
+    arrays = state.entity_arrays()
+    return [
+        arrays.co_located_count(entity_id, with_tag=with_tag) for entity_id in probes
+    ]
+
+
+def _fresh(state: WorldState) -> WorldState:
+    object.__setattr__(state, "_entity_arrays", None)
+    return state
+
+
+def compare(
+    entities: int,
+    *,
+    repeats: int,
+    present: int = 64,
+    probes: int = 64,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Time scalar and array sections for one world size and check parity."""
+
+    state, need_rows = synthetic_world(entities, seed=seed)
+    rng = random.Random(seed + 1)
+    present_ids = set(rng.sample(range(1, entities + 1), min(present, entities)))
+    located = [entity for entity in sorted(state.locations) if _present(state, entity)]
+    probe_ids = rng.sample(located, min(probes, len(located)))
+    session = _RowsSession(need_rows)
+
+    sections: dict[str, tuple[Callable[[], Any], Callable[[], Any]]] = {
+        "needs": (
+            lambda: scalar_need_debt_scores(need_rows, state.tags),
+            lambda: _load_need_debt_scores(
+                session,
+                current_world_time=NOW,
+                need_tuning=TUNING,
+                tags_by_entity=state.tags,
+            ),
+        ),
+        "pressure": (
+            lambda: scalar_present_specs(state, present_ids),
+            lambda: _present_need_pressure_specs(
+                state, present_actor_ids=present_ids, need_tuning=TUNING
+            ),
+        ),
+        "copresence": (
+            lambda: scalar_copresence(state),
+            lambda: copresence_pairs_from_state(_fresh(state)),
+        ),
+        "co_located": (
+            lambda: scalar_co_located_counts(state, probe_ids, "crowd"),
+            lambda: array_co_located_counts(_fresh(state), probe_ids, "crowd"),
+        ),
+    }
+    identical = all(scalar() == array() for scalar, array in sections.values())
+
+    result: dict[str, Any] = {"entities": entities, "identical": identical}
+    scalar_total = array_total = 0.0
+    for name, (scalar, array) in sections.items():
+        scalar_ms = array_ms = float("inf")
+        for _ in range(repeats):
+            scalar_ms = min(scalar_ms, _best_ms(scalar, 1))
+            array_ms = min(array_ms, _best_ms(array, 1))
+        result[f"{name}_scalar_ms"] = scalar_ms
+        result[f"{name}_array_ms"] = array_ms
+        scalar_total += scalar_ms
+        array_total += array_ms
+    result["pairs"] = len(copresence_pairs_from_state(state))
+    result["tick_scalar_ms"] = scalar_total
+    result["tick_array_ms"] = array_total
+    result["speedup"] = scalar_total / array_total if array_total else 0.0
+    return result
+
+
+def _best_ms(fn: Callable[[], Any], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = perf_counter()
+        fn()
+        best = min(best, perf_counter() - started)
+    return best * 1000
+
+
+def _int_list(raw: str) -> list[int]:
+    return [int(value) for value in raw.split(",") if value]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=_int_list, default=[100, 1000, 10000])
+    parser.add_argument("--present", type=int, default=64)
+    parser.add_argument("--probes", type=int, default=64)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    for entities in args.entities:
+        result = compare(
+            entities,
+            repeats=args.repeats,
+            present=args.present,
+            probes=args.probes,
+        )
+        print(_result_line(result))
+
+
+def _result_line(result: dict[str, Any]) -> str:
+    sections = " ".join(
+        f"{name}_ms={result[f'{name}_scalar_ms']:.2f}/{result[f'{name}_array_ms']:.2f}"
+        for name in ("needs", "pressure", "copresence", "co_located")
+    )
+    return (
+        f"entities={result['entities']} pairs={result['pairs']} {sections} "
+        f"tick_scalar_ms={result['tick_scalar_ms']:.2f} "
+        f"tick_array_ms={result['tick_array_ms']:.2f} "
+        f"speedup={result['speedup']:.2f} identical={result['identical']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Benchmark the shared entity lexicon against per-call detector rebuilds.
+
+Builds a synthetic slot with thousands of characters, aliases, places and
+factions and times the in-process work each consumer repeats:
+
+* per turn: the presence audit's character detector plus LORE's divergence
+  detector, each scanning one narrative.
+* per commit: presence reconciliation's character detector scanning the
+  committed narrative.
+
+The legacy path rebuilds the detectors from rows and runs one uncompiled
+``re`` search per name, as the consumers did before the lexicon. The cached
+path reuses one :class:`EntityLexicon` whose detectors were built once. Row
+fetches are not timed here (no database is needed); on a live slot the
+cached path also replaces the full-table reads with a one-row revision read.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import random
+import re
+import sys
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Set
+
+# Benchmark this checkout, not whichever installed copy sys.path resolves.
+ROOT = Path(__file__).parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from nexus.api.presence_reconciliation import (  # noqa: E402
+    build_character_presence_detector,
+)
+from nexus.memory.entity_detector import HighSpecificityEntityDetector  # noqa: E402
+from nexus.memory.entity_lexicon import EntityLexicon  # noqa: E402
+
+SYLLABLES = ["ka", "ren", "vo", "li", "sha", "mor", "te", "dax", "qui", "sol", "ny"]
+FILLER = ["the", "rain", "neon", "slid", "past", "quietly", "and", "a", "door"]
+
+
+def _name(rng: random.Random, parts: int) -> str:
+    return " ".join(
+        "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).title()
+        for _ in range(parts)
+    )
+
+
+def synthetic_lexicon(
+    characters: int, places: int, factions: int, *, seed: int = 0
+) -> EntityLexicon:
+    """Lexicon with one alias per character and unique entity names."""
+    rng = random.Random(seed)
+    seen: Set[str] = set()
+
+    def unique(parts: int) -> str:
+        while True:
+            name = _name(rng, parts)
+            if name.lower() not in seen:
+                seen.add(name.lower())
+                return name
+
+    character_rows = [
+        {"id": index, "name": unique(2), "summary": f"Character {index} summary."}
+        for index in range(1, characters + 1)
+    ]
+    return EntityLexicon.from_rows(
+        (1, 1),
+        characters=character_rows,
+        aliases=[
+            {"character_id": row["id"], "alias": unique(1)} for row in character_rows
+        ],
+        places=[
+            {"id": index, "name": unique(2), "type": "site", "zone": 1}
+            for index in range(1, places + 1)
+        ],
+        factions=[
+            {"id": index, "name": unique(2), "summary": None}
+            for index in range(1, factions + 1)
+        ],
+    )
+
+
+def synthetic_narrative(
+    lexicon: EntityLexicon, *, words: int = 600, mentions: int = 8, seed: int = 0
+) -> str:
+    rng = random.Random(seed)
+    tokens = [rng.choice(FILLER) for _ in range(words)]
+    pool = [row["name"] for row in lexicon.characters + lexicon.places]
+    for name in rng.sample(pool, mentions):
+        tokens.insert(rng.randrange(len(tokens)), name)
+    return " ".join(tokens)
+
+
+def legacy_character_spans(lookup: Dict[str, Any], text_lower: str) -> Set[Any]:
+    """Presence detectors' old candidate scan: one ``re.finditer`` per key."""
+    found: Set[Any] = set()
+    for key, record in lookup.items():
+        for _match in re.finditer(rf"\b{re.escape(key)}\b", text_lower):
+            found.add(record["id"])
+    return found
+
+
+def legacy_mentions(lookup: Dict[str, Any], text_lower: str) -> Set[Any]:
+    """Divergence detector's old scan: one ``re.search`` per name."""
+    return {
+        record["id"]
+        for key, record in lookup.items()
+        if re.search(r"\b" + re.escape(key) + r"\b", text_lower)
+    }
+
+
+def legacy_turn(lexicon: EntityLexicon, narrative: str) -> None:
+    text_lower = narrative.lower()
+    presence = build_character_presence_detector(
+        lexicon.named_characters, lexicon.aliases
+    )
+    legacy_character_spans(presence.character_lookup, text_lower)
+    divergence = _fresh_entity_detector(lexicon)
+    legacy_mentions(divergence.character_lookup, text_lower)
+    legacy_mentions(divergence.place_lookup, text_lower)
+    legacy_mentions(divergence.faction_lookup, text_lower)
+
+
+def cached_turn(lexicon: EntityLexicon, narrative: str) -> None:
+    lexicon.character_detector.detect_entities(narrative)
+    lexicon.entity_detector.detect_entities(narrative)
+
+
+def legacy_commit(lexicon: EntityLexicon, narrative: str) -> None:
+    presence = build_character_presence_detector(
+        lexicon.named_characters, lexicon.aliases
+    )
+    legacy_character_spans(presence.character_lookup, narrative.lower())
+
+
+def cached_commit(lexicon: EntityLexicon, narrative: str) -> None:
+    lexicon.character_detector.detect_entities(narrative)
+
+
+def _fresh_entity_detector(lexicon: EntityLexicon) -> HighSpecificityEntityDetector:
+    return HighSpecificityEntityDetector.from_rows(
+        characters=lexicon.named_characters,
+        aliases=lexicon.aliases,
+        places=lexicon.places,
+        factions=lexicon.factions,
+    )
+
+
+def detections_match(lexicon: EntityLexicon, narrative: str) -> bool:
+    """Cached detectors find exactly what the legacy scans find."""
+    text_lower = narrative.lower()
+    detector = lexicon.entity_detector
+    entities = detector.detect_entities(narrative)
+    presence = lexicon.character_detector.detect_entities(narrative)
+    return (
+        {row["id"] for row in entities.characters}
+        == legacy_mentions(detector.character_lookup, text_lower)
+        and {row["id"] for row in entities.places}
+        == legacy_mentions(detector.place_lookup, text_lower)
+        and {row["id"] for row in entities.factions}
+        == legacy_mentions(detector.faction_lookup, text_lower)
+        and {row["id"] for row in presence.characters}
+        <= legacy_character_spans(
+            lexicon.character_detector.character_lookup, text_lower
+        )
+    )
+
+
+def _best_ms(run: Callable[[], Any], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = perf_counter()
+        run()
+        best = min(best, perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--characters", type=int, default=3000)
+    parser.add_argument("--places", type=int, default=1500)
+    parser.add_argument("--factions", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    lexicon = synthetic_lexicon(
+        args.characters, args.places, args.factions, seed=args.seed
+    )
+    narrative = synthetic_narrative(lexicon, seed=args.seed)
+    # The cached path builds its detectors once per lexicon revision.
+    cached_turn(lexicon, narrative)
+
+    print(f"characters={args.characters}")
+    print(f"places={args.places}")
+    print(f"factions={args.factions}")
+    print(f"detections_match={detections_match(lexicon, narrative)}")
+    results: List[str] = []
+    for name, legacy, cached in (
+        ("turn", legacy_turn, cached_turn),
+        ("commit", legacy_commit, cached_commit),
+    ):
+        legacy_ms = _best_ms(lambda: legacy(lexicon, narrative), args.repeats)
+        cached_ms = _best_ms(lambda: cached(lexicon, narrative), args.repeats)
+        results += [
+            f"{name}_legacy_ms={legacy_ms:.2f}",
+            f"{name}_cached_ms={cached_ms:.2f}",
+            f"{name}_saved_ms={legacy_ms - cached_ms:.2f}",
+        ]
+    print("\n".join(results))
+
+
+if __name__ == "__main__":
+    main()
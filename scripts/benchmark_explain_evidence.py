@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""Benchmark whole-tick explain with cached, batched leaf evidence.
+
+Builds a synthetic world (a cast spread over places, with durable and
+ephemeral tags drawn from the substrate's tag families, pair tags, trust,
+travel states and faction memberships), binds every actor to a co-located
+target, and runs :func:`explain_stack` over the builtin templates for each
+binding set two ways:
+
+* per_leaf: every leaf occurrence re-parses its name against the catalog
+  patterns in order, twice (evidence and prose), and recomputes its
+  evidence, as explain did before the parse caches and batch resolver.
+* batched: the shipped path — cached leaf parses and prose, and one
+  :func:`resolve_evidence_batch` per binding set.
+
+Both must produce identical audit payloads.
+"""
+
+from __future__ import annotations
+
+import argparse
+from contextlib import contextmanager
+from pathlib import Path
+import random
+import sys
+from time import perf_counter
+from typing import Any, Callable, Iterator, List
+
+# Benchmark this checkout, not whichever installed copy sys.path resolves.
+ROOT = Path(__file__).parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from nexus.agents.orrery import explain  # noqa: E402
+from nexus.agents.orrery.catalog import (  # noqa: E402
+    _PREDICATE_PARSERS,
+    _render_predicate_name,
+)
+from nexus.agents.orrery.evidence import (  # noqa: E402
+    _RESOLVERS,
+    EvidenceResolutionError,
+    _evidence,
+    _parse_leaf,
+)
+from nexus.agents.orrery.substrate import (  # noqa: E402
+    CONSTRAINED_TAGS,
+    FAME_TIER_RANKS,
+    HIDDEN_TAGS,
+    INTIMACY_SUPPRESSOR_TAGS,
+    PUBLIC_PLACE_CLASSES,
+    RESOURCES_TIER_RANKS,
+    Bindings,
+    Slot,
+    TravelState,
+    WorldState,
+)
+from nexus.agents.orrery.templates import BUILTIN_TEMPLATES  # noqa: E402
+
+TAG_POOL = sorted(
+    HIDDEN_TAGS
+    | CONSTRAINED_TAGS
+    | INTIMACY_SUPPRESSOR_TAGS
+    | {"public_role", "route_familiar"}
+)
+# Fame and resources are exclusive ladders: at most one rung per entity.
+LADDERS = [sorted(FAME_TIER_RANKS), sorted(RESOURCES_TIER_RANKS)]
+EPHEMERAL_POOL = ["grieving", "elated", "restless", "wound_2_moderate", "exhausted"]
+PAIR_TAG_POOL = ["contact:social", "contact:work", "hunting", "status:senior"]
+
+
+def synthetic_world(
+    characters: int, places: int, *, seed: int = 0
+) -> tuple[WorldState, List[Bindings]]:
+    """A synthetic world plus one actor/target/faction binding set per actor."""
+
+    rng = random.Random(seed)
+    ids = list(range(1, characters + 1))
+    place_ids = list(range(10_001, 10_001 + places))
+    faction_ids = [20_001, 20_002, 20_003]
+    classes = sorted(PUBLIC_PLACE_CLASSES | {"residence", "transit", "wilderness"})
+    locations = {entity: rng.choice(place_ids) for entity in ids}
+    trust: dict[tuple[int, int], int] = {}
+    pair_tags: dict[tuple[int, int], frozenset[str]] = {}
+    for source in ids:
+        for target in rng.sample(ids, min(6, characters)):
+            if target != source:
+                trust[(source, target)] = rng.randint(-3, 3)
+                pair_tags[(source, target)] = frozenset(
+                    rng.sample(PAIR_TAG_POOL, rng.randint(0, 2))
+                )
+    state = WorldState(
+        tags={
+            entity: frozenset(rng.sample(TAG_POOL, 3))
+            | {rng.choice(ladder) for ladder in LADDERS}
+            for entity in ids
+        },
+        ephemeral_tags={
+            entity: frozenset(rng.sample(EPHEMERAL_POOL, rng.randint(0, 2)))
+            for entity in ids
+        },
+        locations=locations,
+        trust=trust,
+        pair_tags=pair_tags,
+        faction_memberships={
+            entity: frozenset({rng.choice(faction_ids)}) for entity in ids
+        },
+        location_classes={
+            place: frozenset(rng.sample(classes, 2)) for place in place_ids
+        },
+        travel_states={
+            entity: TravelState(
+                status=rng.choice(["at_place", "in_transit"]),
+                destination_place_id=rng.choice(place_ids),
+                progress_ratio=rng.random(),
+                route_purpose=rng.choice(["socialize", "work", None]),
+                risk=rng.choice(["low", "moderate", "high"]),
+            )
+            for entity in rng.sample(ids, characters // 4)
+        },
+        need_debt_scores={(entity, "sleep"): rng.uniform(0, 24) for entity in ids},
+        time_of_day=rng.choice(["morning", "midday", "evening", "night"]),
+        current_tick=100,
+    )
+    by_place: dict[int, list[int]] = {}
+    for entity, place in locations.items():
+        by_place.setdefault(place, []).append(entity)
+    binding_sets: List[Bindings] = []
+    for actor in ids:
+        others = [other for other in by_place[locations[actor]] if other != actor]
+        binding_sets.append(
+            {
+                Slot.ACTOR: actor,
+                Slot.TARGET: rng.choice(others) if others else rng.choice(ids),
+                Slot.FACTION: rng.choice(faction_ids),
+            }
+        )
+    return state, binding_sets
+
+
+def _scan_resolve(name: str, state: WorldState, bindings: Bindings) -> dict:
+    """The pre-cache per-leaf path: linear pattern scan, no shared state."""
+
+    if name in ("ALWAYS", "NEVER"):
+        return _evidence(
+            name.lower(), params={}, entities={}, observed={}, result=name == "ALWAYS"
+        )
+    resolver = _RESOLVERS[name.split("(", 1)[0]]
+    for pattern, _formatter in _PREDICATE_PARSERS:
+        match = pattern.fullmatch(name)
+        if match is not None:
+            return resolver(match, state, bindings)
+    raise EvidenceResolutionError(name)
+
+
+def _scan_render(name: str) -> str:
+    """The pre-cache prose path: linear pattern scan per occurrence."""
+
+    if name in ("ALWAYS", "NEVER"):
+        return _render_predicate_name(name)
+    for pattern, formatter in _PREDICATE_PARSERS:
+        match = pattern.fullmatch(name)
+        if match:
+            return formatter(match)
+    return _render_predicate_name(name)
+
+
+@contextmanager
+def per_leaf_evidence() -> Iterator[None]:
+    """Route explain through the uncached, unbatched per-occurrence path."""
+
+    shipped = (
+        explain.resolve_evidence_batch,
+        explain.resolve_evidence,
+        explain._render_predicate_name,
+    )
+    explain.resolve_evidence_batch = lambda names, state, bindings: {}
+    explain.resolve_evidence = _scan_resolve
+    explain._render_predicate_name = _scan_render
+    try:
+        yield
+    finally:
+        (
+            explain.resolve_evidence_batch,
+            explain.resolve_evidence,
+            explain._render_predicate_name,
+        ) = shipped
+
+
+def explain_tick(state: WorldState, binding_sets: List[Bindings]) -> List[dict]:
+    """Explain the builtin stack for every binding set of one tick."""
+
+    return [
+        explain.explain_stack(BUILTIN_TEMPLATES, state, bindings).to_dict()
+        for bindings in binding_sets
+    ]
+
+
+def _best_ms(fn: Callable[[], Any], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = perf_counter()
+        fn()
+        best = min(best, perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--characters", type=int, default=200)
+    parser.add_argument("--places", type=int, default=30)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    state, binding_sets = synthetic_world(args.characters, args.places, seed=args.seed)
+    leaves = explain._template_leaf_names(BUILTIN_TEMPLATES)
+    with per_leaf_evidence():
+        baseline = explain_tick(state, binding_sets)
+        per_leaf_ms = _best_ms(lambda: explain_tick(state, binding_sets), args.repeats)
+    _parse_leaf.cache_clear()
+    _render_predicate_name.cache_clear()
+    payloads_match = explain_tick(state, binding_sets) == baseline
+    batched_ms = _best_ms(lambda: explain_tick(state, binding_sets), args.repeats)
+    print(
+        "\n".join(
+            [
+                f"characters={args.characters}",
+                f"binding_sets={len(binding_sets)}",
+                f"templates={len(BUILTIN_TEMPLATES)}",
+                f"distinct_leaves={len(leaves)}",
+                f"payloads_match={payloads_match}",
+                f"per_leaf_explain_ms={per_leaf_ms:.2f}",
+                f"batched_explain_ms={batched_ms:.2f}",
+                f"speedup={per_leaf_ms / batched_ms:.1f}x",
+                f"parse_cache_entries={_parse_leaf.cache_info().currsize}",
+            ]
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Benchmark hierarchical narrative summaries on a synthetic season.
+
+Builds an in-memory season of synthetic chunks and drives the real
+:class:`SummaryGenerator` through a deterministic mock summary provider that
+counts prompt tokens, so no database or API key is needed. Three phases are
+measured:
+
+* ``legacy``: the single flat season prompt the generator used to build from
+  every chunk of the season (prompt tokens only; it is never sent).
+* ``incremental``: chunks commit one at a time; each commit refreshes the
+  closed scene-window digests (the post-commit ``summary_digest`` job), each
+  episode end builds the episode summary from its digests, and the season
+  summary is built from the episode summaries.
+* ``edit``: one committed chunk is revised and the season regenerated; only
+  its window, its episode and the season are re-summarized.
+
+The in-memory season and mock provider come from
+``tests/summary_test_support.py`` and answer in-process; the mock OpenAI
+server cannot answer free-form ``{summary}`` schemas, so wall times here are
+the generator's own overhead plus ``--latency-ms`` of simulated provider
+latency per call.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from pathlib import Path
+import sys
+import time
+
+# Benchmark this checkout, not whichever installed copy sys.path resolves.
+ROOT = Path(__file__).parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.api_openai import get_token_count  # noqa: E402
+from scripts.summarize_narrative import SummaryGenerator  # noqa: E402
+from tests.summary_test_support import (  # noqa: E402
+    SyntheticSeasonDB,
+    edit_chunk,
+    mock_generator,
+    simulate_commits,
+    synthetic_season,
+)
+
+
+def legacy_season_prompt(generator: SummaryGenerator, db: SyntheticSeasonDB) -> str:
+    """The flat prompt body the season summary used to carry: every chunk."""
+    return generator._prepare_chunks_text(db.get_season_chunks(1), "season")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=1000)
+    parser.add_argument("--episodes", type=int, default=20)
+    parser.add_argument("--window-size", type=int, default=None)
+    parser.add_argument("--words-per-chunk", type=int, default=250)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    # The offline token counter warns once per call when tiktoken has no cache.
+    logging.disable(logging.WARNING)
+
+    db = SyntheticSeasonDB(
+        synthetic_season(
+            args.chunks,
+            args.episodes,
+            words_per_chunk=args.words_per_chunk,
+            seed=args.seed,
+        )
+    )
+    generator, log = mock_generator(
+        db, window_size=args.window_size, latency_seconds=args.latency_ms / 1000
+    )
+
+    legacy_tokens = get_token_count(legacy_season_prompt(generator, db), "TEST")
+    started = time.perf_counter()
+    simulate_commits(generator, db)
+    incremental_seconds = time.perf_counter() - started
+    incremental = (log.count(), log.input_tokens, log.output_tokens)
+    incremental_largest = log.largest_prompt
+
+    log.calls.clear()
+    started = time.perf_counter()
+    generator.generate_season_summary(1)
+    rerun_seconds = time.perf_counter() - started
+    rerun_calls = log.count()
+
+    edit_chunk(db, args.chunks // 2)
+    log.calls.clear()
+    started = time.perf_counter()
+    generator.generate_season_summary(1)
+    edit_seconds = time.perf_counter() - started
+
+    print(f"chunks={args.chunks}")
+    print(f"episodes={len(db.get_season_episodes(1))}")
+    print(f"window_size={generator.scene_window_size}")
+    print(f"legacy_season_prompt_tokens={legacy_tokens}")
+    print(f"incremental_calls={incremental[0]}")
+    print(f"incremental_input_tokens={incremental[1]}")
+    print(f"incremental_output_tokens={incremental[2]}")
+    print(f"incremental_largest_prompt_tokens={incremental_largest}")
+    print(f"incremental_wall_s={incremental_seconds:.3f}")
+    print(f"rerun_calls={rerun_calls}")
+    print(f"rerun_wall_s={rerun_seconds:.3f}")
+    print(
+        "edit_calls="
+        f"digest:{log.count('digest')},"
+        f"episode:{log.count('episode')},"
+        f"season:{log.count('season')}"
+    )
+    print(f"edit_input_tokens={log.input_tokens}")
+    print(f"edit_wall_s={edit_seconds:.3f}")
+
+
+if __name__ == "__main__":
+    main()
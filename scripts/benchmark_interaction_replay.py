@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""Benchmark snapshot-accelerated interaction replay on synthetic threads.
+
+Builds synthetic interaction ledgers (proposal, grants and revocations,
+joins and leaves, lease touches, transitions, terminal stop) with thousands
+of events and times three ways of replaying each one:
+
+* legacy: the pre-snapshot replay, validating every event and every payload
+  with Pydantic (``history()`` + per-event ``model_validate``/``model_copy``).
+* full: the ReplayFold over the whole ledger, validating once at the end.
+* incremental: the ReplayFold restored from a JSON snapshot that stops
+  ``--tail`` events short of the head, folding only the tail.
+
+All three must produce the same ReplayedInteraction. Timings cover the fold
+only; the database saves (reading ``--tail`` rows instead of the whole
+ledger) come on top.
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timedelta, timezone
+import json
+from pathlib import Path
+import random
+import sys
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+from uuid import UUID, uuid4
+
+# Benchmark this checkout, not whichever installed copy sys.path resolves.
+ROOT = Path(__file__).parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from nexus.interactions.models import (  # noqa: E402
+    AuthorizationGrantState,
+    InteractionEvent,
+    InteractionEventType,
+    InteractionStatus,
+    MembershipHistoryState,
+    ReplayedInteraction,
+)
+from nexus.interactions.replay import ReplayFold  # noqa: E402
+
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+HASH = "0" * 64
+
+
+def synthetic_thread(
+    interaction_id: UUID, events: int, *, seed: int = 0
+) -> List[Dict[str, Any]]:
+    """Return ``events`` ledger rows shaped like ``interaction_events``."""
+    rng = random.Random(seed)
+    rows: List[Dict[str, Any]] = []
+    revision = 1
+    next_membership = 1
+    next_grant = 1
+    active: Dict[int, int] = {}  # membership id -> participant entity id
+    live_grants: List[int] = []
+
+    def add(event_type: InteractionEventType, payload: Dict[str, Any]) -> None:
+        rows.append(
+            {
+                "id": len(rows) + 1,
+                "interaction_id": interaction_id,
+                "event_type": event_type.value,
+                "interaction_revision": revision,
+                "actor_participant_entity_id": None,
+                "actor_handler": "bench.handler",
+                "command_id": uuid4(),
+                "command_step": "command",
+                "command_fingerprint": HASH,
+                "payload": payload,
+                "outcome": {},
+                "occurred_at": EPOCH + timedelta(seconds=len(rows)),
+            }
+        )
+
+    def now() -> str:
+        return (EPOCH + timedelta(seconds=len(rows))).isoformat()
+
+    memberships = []
+    for participant in (101, 102):
+        memberships.append(
+            {
+                "membership_id": next_membership,
+                "participant_entity_id": participant,
+                "joined_at": now(),
+                "joined_revision": 1,
+            }
+        )
+        active[next_membership] = participant
+        next_membership += 1
+    add(InteractionEventType.PROPOSED, {"memberships": memberships})
+    add(InteractionEventType.STARTED, {"lease_until": now()})
+
+    while len(rows) < events - 1:
+        roll = rng.random()
+        if roll < 0.3:
+            granted_at = now()
+            add(
+                InteractionEventType.AUTHORIZED,
+                {
+                    "state": "granted",
+                    "id": next_grant,
+                    "grant_id": next_grant,
+                    "participant_entity_id": rng.choice(list(active.values())),
+                    "action": "advance",
+                    "envelope_hash": HASH,
+                    "continuation_id": str(interaction_id),
+                    "interaction_revision": revision,
+                    "granted": True,
+                    "granted_at": granted_at,
+                    "expires_at": (
+                        EPOCH + timedelta(seconds=len(rows) + 60)
+                    ).isoformat(),
+                    "revoked_at": None,
+                },
+            )
+            live_grants.append(next_grant)
+            next_grant += 1
+        elif roll < 0.4 and live_grants:
+            revoked = live_grants[: rng.randint(1, len(live_grants))]
+            del live_grants[: len(revoked)]
+            add(
+                InteractionEventType.AUTHORIZED,
+                {
+                    "state": "revoked",
+                    "grant_ids": revoked,
+                    "participant_entity_id": 101,
+                    "action": "advance",
+                    "envelope_hash": HASH,
+                    "revoked_at": now(),
+                },
+            )
+        elif roll < 0.5:
+            revision += 1
+            add(
+                InteractionEventType.MEMBERSHIP_JOINED,
+                {
+                    "membership_id": next_membership,
+                    "participant_entity_id": 200 + next_membership,
+                    "joined_at": now(),
+                    "joined_revision": revision,
+                },
+            )
+            active[next_membership] = 200 + next_membership
+            next_membership += 1
+        elif roll < 0.6 and len(active) > 2:
+            membership_id = max(active)
+            revision += 1
+            add(
+                InteractionEventType.MEMBERSHIP_LEFT,
+                {
+                    "membership_id": membership_id,
+                    "participant_entity_id": active.pop(membership_id),
+                    "left_at": now(),
+                    "left_revision": revision,
+                },
+            )
+        elif roll < 0.8:
+            add(InteractionEventType.LEASE_TOUCHED, {"lease_until": now()})
+        else:
+            revision += 1
+            add(
+                InteractionEventType.TRANSITIONED,
+                {
+                    "transition_type": f"bench.step{rng.randint(1, 4)}",
+                    "authorization_action": "advance",
+                    "payload": {"amount": rng.randint(1, 100)},
+                    "envelope_hash": HASH,
+                },
+            )
+
+    revision += 1
+    add(
+        InteractionEventType.STOPPED,
+        {
+            "reason": "participant_withdrawal",
+            "closed_memberships": [
+                {
+                    "membership_id": membership_id,
+                    "participant_entity_id": participant,
+                    "left_at": now(),
+                    "left_revision": revision,
+                }
+                for membership_id, participant in sorted(active.items())
+            ],
+        },
+    )
+    return rows
+
+
+def legacy_replay(
+    interaction_id: UUID, rows: List[Dict[str, Any]]
+) -> ReplayedInteraction:
+    """The pre-snapshot replay: Pydantic validation for every event."""
+    events = tuple(InteractionEvent.model_validate(row) for row in rows)
+    memberships: Dict[int, MembershipHistoryState] = {}
+    grants: Dict[int, AuthorizationGrantState] = {}
+    transitions: List[str] = []
+    status = InteractionStatus.PROPOSED
+    revision = 1
+    lease_until = None
+    for event in events:
+        revision = event.interaction_revision
+        payload = event.payload
+        if event.event_type is InteractionEventType.PROPOSED:
+            for item in payload["memberships"]:
+                state = MembershipHistoryState.model_validate(item)
+                memberships[state.membership_id] = state
+        elif event.event_type is InteractionEventType.AUTHORIZED:
+            if payload["state"] == "granted":
+                grant = AuthorizationGrantState.model_validate(
+                    {
+                        key: payload[key]
+                        for key in AuthorizationGrantState.model_fields
+                        if key in payload
+                    }
+                )
+                grants[grant.id] = grant
+            else:
+                revoked_at = datetime.fromisoformat(payload["revoked_at"])
+                for grant_id in payload["grant_ids"]:
+                    grants[int(grant_id)] = grants[int(grant_id)].model_copy(
+                        update={"revoked_at": revoked_at}
+                    )
+        elif event.event_type is InteractionEventType.MEMBERSHIP_JOINED:
+            state = MembershipHistoryState.model_validate(payload)
+            memberships[state.membership_id] = state
+        elif event.event_type is InteractionEventType.MEMBERSHIP_LEFT:
+            membership_id = int(payload["membership_id"])
+            memberships[membership_id] = memberships[membership_id].model_copy(
+                update={
+                    "left_at": datetime.fromisoformat(payload["left_at"]),
+                    "left_revision": int(payload["left_revision"]),
+                }
+            )
+        elif event.event_type is InteractionEventType.LEASE_TOUCHED:
+            lease_until = datetime.fromisoformat(payload["lease_until"])
+        elif event.event_type is InteractionEventType.STARTED:
+            status = InteractionStatus.IN_PROGRESS
+            lease_until = datetime.fromisoformat(payload["lease_until"])
+        elif event.event_type is InteractionEventType.TRANSITIONED:
+            status = InteractionStatus.IN_PROGRESS
+            transitions.append(str(payload["transition_type"]))
+        elif event.event_type is InteractionEventType.STOPPED:
+            status = InteractionStatus.STOPPED
+            lease_until = None
+        for closed in payload.get("closed_memberships", ()):
+            membership_id = int(closed["membership_id"])
+            memberships[membership_id] = memberships[membership_id].model_copy(
+                update={
+                    "left_at": datetime.fromisoformat(closed["left_at"]),
+                    "left_revision": int(closed["left_revision"]),
+                }
+            )
+    history = tuple(memberships[key] for key in sorted(memberships))
+    return ReplayedInteraction(
+        interaction_id=interaction_id,
+        status=status,
+        revision=revision,
+        active_participant_entity_ids=tuple(
+            state.participant_entity_id for state in history if state.left_at is None
+        ),
+        membership_history=history,
+        grants=tuple(grants[key] for key in sorted(grants)),
+        transition_types=tuple(transitions),
+        lease_until=lease_until,
+    )
+
+
+def fold_rows(rows: List[Dict[str, Any]], fold: ReplayFold) -> ReplayFold:
+    for row in rows:
+        if row["id"] > fold.last_event_id:
+            fold.apply(
+                row["id"],
+                row["event_type"],
+                row["interaction_revision"],
+                row["payload"],
+            )
+    return fold
+
+
+def snapshot_at(rows: List[Dict[str, Any]], position: int) -> Dict[str, Any]:
+    """JSON snapshot row after ``position`` events, as the table stores it."""
+    fold = fold_rows(rows[:position], ReplayFold())
+    return {
+        "last_event_id": fold.last_event_id,
+        "state": json.loads(json.dumps(fold.snapshot_state())),
+    }
+
+
+def _best_ms(run: Callable[[], Any], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = perf_counter()
+        run()
+        best = min(best, perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--events",
+        type=int,
+        nargs="+",
+        default=[1000, 5000, 20000],
+        help="Ledger lengths to benchmark (default: 1000 5000 20000)",
+    )
+    parser.add_argument(
+        "--tail",
+        type=int,
+        default=200,
+        help="Events past the latest snapshot (default: 200, the snapshot interval)",
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for count in args.events:
+        interaction_id = uuid4()
+        rows = synthetic_thread(interaction_id, count, seed=args.seed)
+        snapshot = snapshot_at(rows, max(1, len(rows) - args.tail))
+
+        def incremental() -> ReplayedInteraction:
+            fold = ReplayFold.from_snapshot(
+                snapshot["last_event_id"], json.loads(json.dumps(snapshot["state"]))
+            )
+            # Synthetic ids are 1-based positions; the database reads the
+            # same tail with ``id > last_event_id``.
+            tail = rows[snapshot["last_event_id"] :]
+            return fold_rows(tail, fold).to_model(interaction_id)
+
+        expected = legacy_replay(interaction_id, rows)
+        full = fold_rows(rows, ReplayFold()).to_model(interaction_id)
+        parity = expected == full == incremental()
+        legacy_ms = _best_ms(lambda: legacy_replay(interaction_id, rows), args.repeats)
+        full_ms = _best_ms(
+            lambda: fold_rows(rows, ReplayFold()).to_model(interaction_id),
+            args.repeats,
+        )
+        incremental_ms = _best_ms(incremental, args.repeats)
+        prefix = f"events_{count}"
+        print(f"{prefix}_parity={parity}")
+        print(f"{prefix}_legacy_ms={legacy_ms:.2f}")
+        print(f"{prefix}_full_fold_ms={full_ms:.2f}")
+        print(f"{prefix}_incremental_ms={incremental_ms:.2f}")
+        print(f"{prefix}_speedup_full={legacy_ms / full_ms:.1f}x")
+        print(f"{prefix}_speedup_incremental={legacy_ms / incremental_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
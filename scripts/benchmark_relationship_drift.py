@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Benchmark candidate-edge relationship drift against full-graph planning.
+
+Builds a synthetic cast with a dense directed relationship graph and one
+tick's worth of producers (project milestones, hostile and cooperative
+events, co-presence pairs), then plans the tick two ways:
+
+* full: :func:`plan_relationship_drift` over every edge of the graph, as the
+  drains did when they loaded all of ``character_relationships``.
+* candidate: the same planner over only the edges
+  :func:`relationship_drift_candidate_edges` names, as the drains now load.
+
+Both plans must be identical. Row decoding is timed with the graph held as
+driver-shaped rows so the full path pays the per-row quantization it paid on
+a live slot; SQL round trips are reported as statement counts, since no
+database is needed here.
+"""
+
+from __future__ import annotations
+
+import argparse
+from decimal import Decimal
+from pathlib import Path
+import random
+import sys
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+# Benchmark this checkout, not whichever installed copy sys.path resolves.
+ROOT = Path(__file__).parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from nexus.agents.orrery.drift import (  # noqa: E402
+    VALENCE_UPDATE_PAGE_SIZE,
+    CopresencePair,
+    DriftEvent,
+    ProjectMilestone,
+    RelationshipDriftPlan,
+    _quantize_valence,
+    plan_relationship_drift,
+    relationship_drift_candidate_edges,
+)
+from nexus.config.settings_models import OrreryDriftSettings  # noqa: E402
+
+SETTINGS = OrreryDriftSettings.model_validate(
+    {
+        "copresence_rate_per_hour": "0.01",
+        "copresence_max_hours_per_tick": "12",
+        "project_milestone_delta": "0.03",
+        "hostile_events": {"hostile": "-0.2"},
+        "cooperative_events": {"cooperative": "0.1"},
+    }
+)
+
+
+def synthetic_tick(
+    characters: int,
+    edges_per_character: int,
+    *,
+    events: int,
+    milestones: int,
+    colocated: int,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Relationship rows plus one tick's producers over a synthetic cast."""
+    rng = random.Random(seed)
+    ids = list(range(1, characters + 1))
+    rows = []
+    for source in ids:
+        for target in rng.sample(ids, min(edges_per_character + 1, characters)):
+            if target != source:
+                valence = Decimal(rng.randint(-900, 900)) / Decimal(1000)
+                rows.append((source, target, valence))
+    rows = sorted({(row[0], row[1]): row for row in rows}.values())
+
+    def pair() -> tuple[int, int]:
+        first, second = rng.sample(ids, 2)
+        return first, second
+
+    gathered = rng.sample(ids, min(colocated, characters))
+    return {
+        "rows": rows,
+        "project_milestones": tuple(
+            ProjectMilestone(index, *pair()) for index in range(1, milestones + 1)
+        ),
+        "events": tuple(
+            DriftEvent(index, rng.choice(["hostile", "cooperative"]), *pair())
+            for index in range(1, events + 1)
+        ),
+        "copresence_pairs": tuple(
+            CopresencePair(first, second)
+            for index, first in enumerate(gathered)
+            for second in gathered[index + 1 :]
+        ),
+        "elapsed_hours": Decimal("3.5"),
+    }
+
+
+def _producers(tick: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in tick.items() if key != "rows"}
+
+
+def full_plan(tick: Dict[str, Any]) -> RelationshipDriftPlan:
+    relationships = {
+        (source, target): _quantize_valence(valence)
+        for source, target, valence in tick["rows"]
+    }
+    return plan_relationship_drift(
+        relationships=relationships, **_producers(tick), settings=SETTINGS
+    )
+
+
+def candidate_plan(tick: Dict[str, Any]) -> RelationshipDriftPlan:
+    producers = _producers(tick)
+    candidates = set(relationship_drift_candidate_edges(**producers, settings=SETTINGS))
+    # Stands in for the unnest() join: the database returns only candidates.
+    relationships = {
+        (source, target): _quantize_valence(valence)
+        for source, target, valence in tick["rows"]
+        if (source, target) in candidates
+    }
+    return plan_relationship_drift(
+        relationships=relationships, **producers, settings=SETTINGS
+    )
+
+
+def _best_ms(fn: Callable[[], Any], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = perf_counter()
+        fn()
+        best = min(best, perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--characters", type=int, default=2000)
+    parser.add_argument("--edges-per-character", type=int, default=40)
+    parser.add_argument("--events", type=int, default=12)
+    parser.add_argument("--milestones", type=int, default=3)
+    parser.add_argument("--colocated", type=int, default=24)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seeds", type=int, default=5)
+    args = parser.parse_args()
+
+    results: List[str] = []
+    plans_match = True
+    tick: Dict[str, Any] = {}
+    for seed in range(args.seeds):
+        tick = synthetic_tick(
+            args.characters,
+            args.edges_per_character,
+            events=args.events,
+            milestones=args.milestones,
+            colocated=args.colocated,
+            seed=seed,
+        )
+        plans_match = plans_match and full_plan(tick) == candidate_plan(tick)
+
+    producers = _producers(tick)
+    candidates = relationship_drift_candidate_edges(**producers, settings=SETTINGS)
+    plan = full_plan(tick)
+    full_ms = _best_ms(lambda: full_plan(tick), args.repeats)
+    candidate_ms = _best_ms(lambda: candidate_plan(tick), args.repeats)
+    results += [
+        f"characters={args.characters}",
+        f"relationship_rows={len(tick['rows'])}",
+        f"candidate_edges={len(candidates)}",
+        f"planned_edges={len(plan.edges)}",
+        f"plans_match={plans_match}",
+        f"full_plan_ms={full_ms:.2f}",
+        f"candidate_plan_ms={candidate_ms:.2f}",
+        f"per_edge_update_statements={len(plan.edges)}",
+        "batched_update_statements="
+        f"{-(-len(plan.edges) // VALENCE_UPDATE_PAGE_SIZE)}",
+    ]
+    print("\n".join(results))
+
+
+if __name__ == "__main__":
+    main()
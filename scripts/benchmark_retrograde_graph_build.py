@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Profile R3 candidate-graph build time against entity and vocabulary size.
+
+Sweeps a grid of synthetic build inputs (``--entities`` core cards by
+``--vocabulary`` seed-eligible edge types, split across relationships, pair
+tags and event types) and times ``rebuild_candidate_graph`` for each cell in
+``--workers`` spawned worker processes. Every cell is built in two different
+workers with different ``PYTHONHASHSEED`` values; the canonical graph hashes
+must agree, which is the same property ``nexus retrograde-verify-graphs``
+checks against stored graphs. Junction counts scale with entity count so
+the shared-endpoint retry loop is exercised too. No database is needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+from pathlib import Path
+import sys
+from time import perf_counter
+from typing import Any, Callable
+
+# Benchmark this checkout, not whichever installed copy sys.path resolves.
+ROOT = Path(__file__).parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from nexus.agents.orrery.retrograde_graph import (  # noqa: E402
+    canonical_graph_hash,
+    candidate_graph_build_inputs,
+    rebuild_candidate_graph,
+)
+
+ENTITY_KINDS = ("character", "place", "faction")
+EVENT_CATEGORIES = ("interpersonal", "emotional", "conflict", "routine")
+
+
+def synthetic_inputs(entities: int, vocabulary: int) -> dict[str, Any]:
+    """Build inputs for ``entities`` core cards and ``vocabulary`` edge types."""
+
+    cards = [
+        {
+            "kind": ENTITY_KINDS[index % len(ENTITY_KINDS)],
+            "role": "protagonist" if index == 0 else "named_seed_npc",
+            "name": f"Entity {index}",
+        }
+        for index in range(entities)
+    ]
+    per_pool = max(1, vocabulary // 3)
+    event_types = [f"event_{index}" for index in range(per_pool)]
+    return candidate_graph_build_inputs(
+        candidate_scaffolds={"core_entities": cards},
+        vocabulary={  # type: ignore[typeddict-item]
+            "relationship_types": [f"relationship_{i}" for i in range(per_pool)],
+            "multi_entity_tag_definitions": [
+                {
+                    "tag": f"pair_tag_{index}",
+                    "subject_kinds": ["character"],
+                    "object_kinds": [ENTITY_KINDS[index % len(ENTITY_KINDS)]],
+                }
+                for index in range(per_pool)
+            ],
+            "event_types": event_types,
+            "event_type_categories": {
+                event_type: EVENT_CATEGORIES[index % len(EVENT_CATEGORIES)]
+                for index, event_type in enumerate(event_types)
+            },
+        },
+        weird={"raw_min": 0.3, "raw_max": 0.7},
+        generate_candidates=max(6, entities * 2),
+        rng_seed_material=f"benchmark:{entities}:{vocabulary}",
+        junction_count=min(3, entities // 4),
+    )
+
+
+def build_cell(cell: tuple[int, int, int]) -> dict[str, Any]:
+    """Worker entry point: best-of-``repeats`` build time and graph hash."""
+
+    entities, vocabulary, repeats = cell
+    inputs = synthetic_inputs(entities, vocabulary)
+    graph: dict[str, Any] = {}
+
+    def build() -> None:
+        graph.update(rebuild_candidate_graph(inputs))
+
+    return {
+        "entities": entities,
+        "vocabulary": vocabulary,
+        "best_ms": _best_ms(build, repeats),
+        "hash": canonical_graph_hash(graph),
+        "pid": os.getpid(),
+    }
+
+
+def sweep(
+    entity_counts: list[int],
+    vocabulary_counts: list[int],
+    *,
+    repeats: int,
+    workers: int,
+) -> list[dict[str, Any]]:
+    """Build every cell twice in spawned workers; pair up the two runs."""
+
+    cells = [
+        (entities, vocabulary, repeats)
+        for entities in entity_counts
+        for vocabulary in vocabulary_counts
+    ]
+    context = multiprocessing.get_context("spawn")
+    runs = []
+    for hash_seed in ("1", "2"):
+        os.environ["PYTHONHASHSEED"] = hash_seed
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            runs.append(list(pool.map(build_cell, cells)))
+    os.environ.pop("PYTHONHASHSEED", None)
+    return [
+        {**first, "stable": first["hash"] == second["hash"]}
+        for first, second in zip(*runs)
+    ]
+
+
+def _best_ms(fn: Callable[[], Any], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = perf_counter()
+        fn()
+        best = min(best, perf_counter() - started)
+    return best * 1000
+
+
+def _int_list(raw: str) -> list[int]:
+    return [int(value) for value in raw.split(",") if value]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=_int_list, default=[2, 8, 32, 128])
+    parser.add_argument("--vocabulary", type=_int_list, default=[30, 300, 3000])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    started = perf_counter()
+    results = sweep(
+        args.entities, args.vocabulary, repeats=args.repeats, workers=args.workers
+    )
+    elapsed_ms = (perf_counter() - started) * 1000
+    lines = [f"workers={args.workers}", f"cells={len(results)}"]
+    for result in results:
+        lines.append(
+            f"entities={result['entities']} vocabulary={result['vocabulary']} "
+            f"build_ms={result['best_ms']:.3f} stable={result['stable']}"
+        )
+    lines.append(f"hashes_stable={all(result['stable'] for result in results)}")
+    lines.append(f"sweep_ms={elapsed_ms:.1f}")
+    print("\n".join(lines))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""Benchmark scheduled Retrograde maturation against a serial drain.
+
+Builds a synthetic leased batch of single-entity maturation jobs whose
+scene anchors overlap at ``--overlap`` (a job shares its anchor with an
+earlier job with that probability), then drives it two ways through the
+same start/generate/finish phases ``drain_maturation_jobs_sync`` uses:
+
+* serial: start, generate and finish each job in lease order, as the drain
+  does with ``max_parallel_jobs = 1``.
+* scheduled: :func:`run_scheduled_jobs` over the footprint DAG with
+  ``--workers`` pool threads.
+
+``start`` builds the real R3 seed-generation request (template vocabulary,
+``_graph_rng``-keyed candidate graph); ``generate`` answers through a mock
+Skald provider that sleeps ``--latency-ms`` per call for the R4, R5 and R6
+round trips and returns a digest of the graph it was handed; ``finish``
+appends to a commit log standing in for the job table. The two commit logs
+must be identical. No database or API key is needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, field
+from hashlib import sha256
+import json
+from pathlib import Path
+import random
+import sys
+from time import perf_counter, sleep
+from typing import Any, Callable
+
+# Benchmark this checkout, not whichever installed copy sys.path resolves.
+ROOT = Path(__file__).parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from nexus.agents.orrery.retrograde_packet import (  # noqa: E402
+    build_seed_generation_request,
+)
+from nexus.agents.orrery.retrograde_scheduler import (  # noqa: E402
+    ScheduledJob,
+    plan_job_dependencies,
+    run_scheduled_jobs,
+)
+from nexus.agents.orrery.retrograde_vocabulary import (  # noqa: E402
+    enumerate_seed_eligible_vocabulary,
+    normalize_entity_ref,
+)
+
+SKALD_CALLS_PER_JOB = 3  # R4 generation, R5 selection, R6 expansion
+WEIRD = {"level": "medium", "raw": 0.5}
+
+
+@dataclass
+class MockSkald:
+    """Deterministic Skald stand-in with injected per-call latency."""
+
+    latency_seconds: float
+    calls: list[int] = field(default_factory=list)
+
+    def mature(self, key: int, request: dict[str, Any]) -> str:
+        digest = json.dumps(request["candidate_graph"], sort_keys=True)
+        for _ in range(SKALD_CALLS_PER_JOB):
+            if self.latency_seconds:
+                sleep(self.latency_seconds)
+            digest = sha256(digest.encode("utf-8")).hexdigest()
+            self.calls.append(key)
+        return digest
+
+
+def synthetic_batch(jobs: int, overlap: float, seed: int) -> list[dict[str, Any]]:
+    """Leased jobs: one target each plus a scene anchor, some shared."""
+
+    rng = random.Random(seed)
+    batch: list[dict[str, Any]] = []
+    for index in range(jobs):
+        if batch and rng.random() < overlap:
+            anchor = rng.choice(batch)["anchor"]
+        else:
+            anchor = f"Anchor {index}"
+        batch.append({"job_id": index + 1, "target": f"Stub {index}", "anchor": anchor})
+    return batch
+
+
+def scheduled_jobs(batch: list[dict[str, Any]]) -> list[ScheduledJob]:
+    return [
+        ScheduledJob(
+            key=job["job_id"],
+            footprint=frozenset(
+                normalize_entity_ref(name) for name in (job["target"], job["anchor"])
+            ),
+        )
+        for job in batch
+    ]
+
+
+def critical_path(jobs: list[ScheduledJob]) -> int:
+    """Longest dependency chain, in jobs: the floor on scheduled rounds."""
+
+    depth: dict[int, int] = {}
+    for key, predecessors in plan_job_dependencies(jobs).items():
+        depth[key] = 1 + max((depth[p] for p in predecessors), default=0)
+    return max(depth.values(), default=0)
+
+
+def drain(
+    batch: list[dict[str, Any]],
+    *,
+    skald: MockSkald,
+    workers: int,
+) -> list[tuple[int, str]]:
+    """Run the batch; ``workers=0`` is the serial drain. Returns commits."""
+
+    vocabulary = enumerate_seed_eligible_vocabulary()
+    by_id = {job["job_id"]: job for job in batch}
+    commits: list[tuple[int, str]] = []
+
+    def start(key: int) -> tuple[int, dict[str, Any]]:
+        job = by_id[key]
+        scaffolds = {
+            "core_entities": [
+                {
+                    "kind": "character",
+                    "role": "maturation_target",
+                    "name": job["target"],
+                },
+                {"kind": "place", "role": "scene_anchor", "name": job["anchor"]},
+            ],
+            "named_seed_npcs": [],
+            "pressure_axes": [],
+            "trait_hooks": {},
+        }
+        request = build_seed_generation_request(
+            candidate_scaffolds=scaffolds, vocabulary=vocabulary, weird=WEIRD
+        )
+        return key, request
+
+    def generate(prepared: tuple[int, dict[str, Any]]) -> str:
+        return skald.mature(*prepared)
+
+    def finish(key: int, _prepared: Any, future: Any) -> None:
+        commits.append((key, future.result()))
+
+    if workers == 0:
+        for job in batch:
+            prepared = start(job["job_id"])
+            commits.append((job["job_id"], generate(prepared)))
+        return commits
+    run_scheduled_jobs(
+        scheduled_jobs(batch),
+        start=start,
+        generate=generate,
+        finish=finish,
+        max_workers=workers,
+    )
+    return commits
+
+
+def _best_ms(fn: Callable[[], Any], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = perf_counter()
+        fn()
+        best = min(best, perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=12)
+    parser.add_argument("--overlap", type=float, default=0.35)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    batch = synthetic_batch(args.jobs, args.overlap, args.seed)
+    latency = args.latency_ms / 1000
+    serial = drain(batch, skald=MockSkald(latency), workers=0)
+    scheduled = drain(batch, skald=MockSkald(latency), workers=args.workers)
+    serial_ms = _best_ms(
+        lambda: drain(batch, skald=MockSkald(latency), workers=0), args.repeats
+    )
+    scheduled_ms = _best_ms(
+        lambda: drain(batch, skald=MockSkald(latency), workers=args.workers),
+        args.repeats,
+    )
+    print(
+        "\n".join(
+            [
+                f"jobs={args.jobs}",
+                f"workers={args.workers}",
+                f"latency_ms_per_call={args.latency_ms:g}",
+                f"skald_calls={args.jobs * SKALD_CALLS_PER_JOB}",
+                f"critical_path_jobs={critical_path(scheduled_jobs(batch))}",
+                f"commits_match={serial == scheduled}",
+                f"serial_ms={serial_ms:.1f}",
+                f"scheduled_ms={scheduled_ms:.1f}",
+                f"speedup={serial_ms / scheduled_ms:.1f}x",
+            ]
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""Benchmark one resolver tick's stack evaluation with and without the memo.
+
+Builds a synthetic world of ``--actors`` characters (seeded tags, places,
+need debts and pair tags) and evaluates the builtin stacks the way
+``resolve_dry_run`` does: the actor-only stack once per actor, then the
+actor-target stack for ``--targets`` partners of every actor. Each tick is
+run two ways against the same immutable ``WorldState``:
+
+* plain: ``evaluate_stack`` as before, hashing bindings and running every
+  package gate from scratch.
+* memo: one :class:`TickEvaluationContext` shared by every stack, so gates
+  that settle on the actor alone are reused across that actor's targets.
+
+Both must produce identical resolutions. The memo run also reports its
+binding-digest and package-gate hit rates. No database is needed.
+
+Builtin gates are dict-lookup closures costing a few microseconds, about
+what a memo lookup costs, so ``--event-scan N`` models costlier gates: the
+world carries ``N`` recent events and every gate first scans them for the
+actor, the way an un-indexed history predicate would.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import random
+import sys
+from time import perf_counter
+from dataclasses import replace
+from typing import Any, Callable, Optional
+
+# Benchmark this checkout, not whichever installed copy sys.path resolves.
+ROOT = Path(__file__).parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from nexus.agents.orrery.cognition import build_template_stacks  # noqa: E402
+from nexus.agents.orrery.substrate import (  # noqa: E402
+    CompoundCondition,
+    EventRecord,
+    PackageSelection,
+    ProjectPolicy,
+    Resolution,
+    Slot,
+    Template,
+    TickEvaluationContext,
+    WorldState,
+    evaluate_stack,
+)
+from nexus.agents.orrery.templates import BUILTIN_TEMPLATES  # noqa: E402
+
+ACTOR_TAGS = (
+    "leader",
+    "married",
+    "captive",
+    "field_worker",
+    "work_obligation",
+    "seeking_identity",
+    "arcane_caster",
+    "first_aid_trained",
+    "informant_handler",
+    "travel_ready",
+    "route_familiar",
+)
+PAIR_TAGS = ("rival_of", "protects", "owes_debt_to", "confides_in")
+NEEDS = ("rest", "sustenance", "social", "purpose")
+PACKAGE_SELECTION = PackageSelection(
+    mode="stochastic",
+    window_points=6.0,
+    temperature=2.0,
+    exempt_bands=frozenset({"crisis_constraint"}),
+)
+_STACKS = build_template_stacks(BUILTIN_TEMPLATES, ProjectPolicy())
+STACKS = {"actor_only": _STACKS.actor_only, "actor_target": _STACKS.actor_target}
+
+
+def _actor_history_scan(state: WorldState, bindings: Any) -> bool:
+    actor = bindings.get(Slot.ACTOR)
+    return any(event.target_entity_id == actor for event in state.recent_events) or (
+        actor is not None
+    )
+
+
+def scanning_stacks() -> dict[str, tuple[Template, ...]]:
+    """Builtin stacks with an actor history scan ahead of every gate."""
+
+    return {
+        route: tuple(
+            replace(
+                template,
+                package_gate=CompoundCondition(
+                    "AND", (_actor_history_scan, template.package_gate)
+                ),
+            )
+            for template in templates
+        )
+        for route, templates in STACKS.items()
+    }
+
+
+def synthetic_state(actors: int, *, seed: int = 0, event_scan: int = 0) -> WorldState:
+    """A seeded world of ``actors`` characters spread over a few places."""
+
+    rng = random.Random(seed)
+    ids = range(1, actors + 1)
+    places = max(2, actors // 8)
+    pair_tags: dict[tuple[int, int], frozenset[str]] = {}
+    for actor in ids:
+        for _ in range(2):
+            other = rng.randint(1, actors)
+            if other != actor:
+                pair_tags[(actor, other)] = frozenset({rng.choice(PAIR_TAGS)})
+    return WorldState(
+        tags={
+            actor: frozenset(rng.sample(ACTOR_TAGS, rng.randint(0, 3))) for actor in ids
+        },
+        is_active={actor: True for actor in ids},
+        locations={actor: 10_000 + actor % places for actor in ids},
+        trust={(actor, other): rng.randint(-3, 3) for (actor, other) in pair_tags},
+        pair_tags=pair_tags,
+        need_debt_scores={
+            (actor, need): rng.random() * 2.0 for actor in ids for need in NEEDS
+        },
+        recent_events=tuple(
+            EventRecord(
+                event_type="conversation",
+                tick=1000 + seed - index,
+                actor_entity_id=rng.randint(1, actors),
+                target_entity_id=-1,
+            )
+            for index in range(event_scan)
+        ),
+        current_tick=1000 + seed,
+    )
+
+
+def tick_routes(
+    actors: int, targets: int, *, seed: int = 0
+) -> list[tuple[str, dict[Slot, Any]]]:
+    """Actor-only and actor-target bindings in resolver order."""
+
+    rng = random.Random(seed + 1)
+    routes: list[tuple[str, dict[Slot, Any]]] = [
+        ("actor_only", {Slot.ACTOR: actor}) for actor in range(1, actors + 1)
+    ]
+    for actor in range(1, actors + 1):
+        others = [other for other in range(1, actors + 1) if other != actor]
+        for target in sorted(rng.sample(others, min(targets, len(others)))):
+            routes.append(("actor_target", {Slot.ACTOR: actor, Slot.TARGET: target}))
+    return routes
+
+
+def run_tick(
+    state: WorldState,
+    routes: list[tuple[str, dict[Slot, Any]]],
+    *,
+    context: Optional[TickEvaluationContext],
+    stacks: Optional[dict[str, tuple[Template, ...]]] = None,
+) -> list[Optional[Resolution]]:
+    stacks = STACKS if stacks is None else stacks
+    return [
+        evaluate_stack(
+            stacks[route],
+            state,
+            bindings,
+            package_selection=PACKAGE_SELECTION,
+            context=context,
+        )
+        for route, bindings in routes
+    ]
+
+
+def compare(
+    actors: int,
+    targets: int,
+    *,
+    repeats: int,
+    event_scan: int = 0,
+    verify: bool = False,
+) -> dict[str, Any]:
+    """Time both paths for one tick shape and check their resolutions agree.
+
+    The two paths alternate within each repeat so machine noise hits both.
+    """
+
+    state = synthetic_state(actors, event_scan=event_scan)
+    routes = tick_routes(actors, targets)
+    stacks = scanning_stacks() if event_scan else STACKS
+    plain = run_tick(state, routes, context=None, stacks=stacks)
+    context = TickEvaluationContext(state, verify=verify)
+    memo = run_tick(state, routes, context=context, stacks=stacks)
+    stats = context.stats()
+
+    def plain_tick() -> None:
+        run_tick(state, routes, context=None, stacks=stacks)
+
+    def memo_tick() -> None:
+        run_tick(
+            state,
+            routes,
+            context=TickEvaluationContext(state, verify=verify),
+            stacks=stacks,
+        )
+
+    plain_ms = memo_ms = float("inf")
+    for _ in range(repeats):
+        plain_ms = min(plain_ms, _best_ms(plain_tick, 1))
+        memo_ms = min(memo_ms, _best_ms(memo_tick, 1))
+    return {
+        "actors": actors,
+        "targets": targets,
+        "event_scan": event_scan,
+        "stacks": len(routes),
+        "identical": plain == memo,
+        "plain_ms": plain_ms,
+        "memo_ms": memo_ms,
+        "speedup": plain_ms / memo_ms if memo_ms else 0.0,
+        **stats,
+    }
+
+
+def _best_ms(fn: Callable[[], Any], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = perf_counter()
+        fn()
+        best = min(best, perf_counter() - started)
+    return best * 1000
+
+
+def _int_list(raw: str) -> list[int]:
+    return [int(value) for value in raw.split(",") if value]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--actors", type=_int_list, default=[8, 32, 128])
+    parser.add_argument("--targets", type=int, default=6)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--event-scan",
+        type=_int_list,
+        default=[0, 64, 512],
+        help="Recent events every gate scans first; 0 runs the builtin gates.",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Time the memo with memo_parity_check re-evaluation enabled.",
+    )
+    args = parser.parse_args()
+
+    lines = []
+    for event_scan in args.event_scan:
+        for actors in args.actors:
+            result = compare(
+                actors,
+                args.targets,
+                repeats=args.repeats,
+                event_scan=event_scan,
+                verify=args.verify,
+            )
+            lines.append(_result_line(result))
+    print("\n".join(lines))
+
+
+def _result_line(result: dict[str, Any]) -> str:
+    return (
+        f"event_scan={result['event_scan']} "
+        f"actors={result['actors']} stacks={result['stacks']} "
+        f"plain_ms={result['plain_ms']:.2f} memo_ms={result['memo_ms']:.2f} "
+        f"speedup={result['speedup']:.2f} "
+        f"gate_hit_rate={result['gate_hit_rate']:.3f} "
+        f"binding_hash_hit_rate={result['binding_hash_hit_rate']:.3f} "
+        f"identical={result['identical']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
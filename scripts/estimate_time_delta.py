@@ -10,12 +10,24 @@ Usage:
     python estimate_time_delta.py --start 5 --end 5 --write     # Write single chunk
     python estimate_time_delta.py --all --write                 # Process all chunks
     python estimate_time_delta.py --all --write --provider anthropic --model claude-3-7-sonnet
+    python estimate_time_delta.py --all --estimate-cost --input-price 2 --output-price 8
+    python estimate_time_delta.py --all --write --workers 8 \
+        --ledger time_delta.ledger.jsonl
+    python estimate_time_delta.py --all --write --batch-api \
+        --ledger time_delta.ledger.jsonl
 
 Options:
     --provider PROVIDER     LLM provider to use: "anthropic" or "openai" (default: openai)
     --model MODEL           Model name to use (defaults to provider's default model)
     --temperature FLOAT     Model temperature (0.0-1.0, default: 0.1)
     --auto                  Process all chunks automatically without prompting
+    --workers N             Concurrent API calls through the batch engine
+                            (scripts/llm_batch.py)
+    --ledger PATH           Checkpoint ledger; rerunning with it resumes an
+                            interrupted run
+    --estimate-cost         Print prompt token counts (and cost with
+                            --input/--output-price)
+    --batch-api             Use the OpenAI Batch API (requires --ledger)
 
 Database URL:
 postgresql://pythagor@localhost/NEXUS
@@ -54,6 +66,29 @@ try:
 except ImportError:
     tiktoken = None
 
+try:
+    from llm_batch import (
+        BatchRequest,
+        CheckpointLedger,
+        add_batch_arguments,
+        estimate_cost,
+        missing_batch_result,
+        run_openai_batch,
+        run_requests,
+        uses_batch_engine,
+    )
+except ImportError:
+    from scripts.llm_batch import (
+        BatchRequest,
+        CheckpointLedger,
+        add_batch_arguments,
+        estimate_cost,
+        missing_batch_result,
+        run_openai_batch,
+        run_requests,
+        uses_batch_engine,
+    )
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -565,6 +600,7 @@ def parse_arguments() -> argparse.Namespace:
                         help="Process all chunks automatically without prompting")
     parser.add_argument("--verbose", action="store_true",
                         help="Print detailed information including prompts sent to the LLM")
+    add_batch_arguments(parser)
     
     args = parser.parse_args()
     
@@ -572,9 +608,15 @@ def parse_arguments() -> argparse.Namespace:
     if args.start is not None and args.end is None:
         args.end = args.start  # Default end to start if only start is provided
     
-    if not args.test and not args.write:
+    if not args.test and not args.write and not args.estimate_cost:
         parser.error("Must specify either --test or --write mode")
     
+    if args.test and uses_batch_engine(args) and not args.estimate_cost:
+        parser.error("--workers, --ledger and --batch-api need --write")
+
+    if args.batch_api and (args.provider != "openai" or not args.ledger):
+        parser.error("--batch-api needs --provider openai and a --ledger")
+
     if args.primary_only and args.include_all_world_layers:
         parser.error("Cannot specify both --primary-only and --include-all-world-layers")
     
@@ -1428,6 +1470,132 @@ def process_chunk(db: Engine, chunk: NarrativeChunk, test_mode: bool = False,
     return time_delta
 
 
+def build_time_delta_request(db: Engine, chunk: NarrativeChunk,
+                             args: argparse.Namespace) -> BatchRequest:
+    """
+    Build the batch engine request for one primary chunk.
+
+    Unlike process_chunk, the prompt never carries the previous chunk's
+    time_delta annotation: concurrent requests cannot wait for their
+    predecessor's answer, and a prompt that changed once the predecessor was
+    written would miss its own ledger entry on resume.
+    """
+    prev_chunks, next_chunks = get_extended_context_chunks(db, chunk.id)
+    prompt = build_time_estimation_prompt(
+        chunk=chunk,
+        prev_chunks=prev_chunks,
+        next_chunks=next_chunks,
+        prev_chunk_time_delta=None
+    )
+    provider_class = (
+        OpenAIProvider if args.provider.lower() == "openai" else AnthropicProvider
+    )
+    model = args.model or provider_class.DEFAULT_MODEL
+    params: Dict[str, Any] = {"max_output_tokens": args.max_tokens}
+    if args.provider.lower() == "openai" and model.startswith("o"):
+        params["reasoning"] = {"effort": args.reasoning_effort}
+    else:
+        params["temperature"] = args.temperature
+    return BatchRequest(
+        key=str(chunk.id),
+        provider=args.provider.lower(),
+        model=model,
+        prompt=prompt,
+        params=params
+    )
+
+
+def run_batch_engine(
+    db: Engine, chunks: List[NarrativeChunk], args: argparse.Namespace
+) -> int:
+    """
+    Estimate time deltas through the concurrent, resumable batch engine.
+
+    Non-primary chunks get 0 minutes without an API call, as in the
+    sequential loop. Primary chunks are sent on --workers threads (or as one
+    Batch API job) and written in chunk order as their answers arrive.
+    """
+    primary: List[NarrativeChunk] = []
+    zero_layer: List[NarrativeChunk] = []
+    for chunk in chunks:
+        if get_chunk_world_layer(db, chunk.id) == "primary":
+            primary.append(chunk)
+        else:
+            zero_layer.append(chunk)
+
+    requests = [build_time_delta_request(db, chunk, args) for chunk in primary]
+    ledger = CheckpointLedger(args.ledger) if args.ledger else None
+
+    if args.estimate_cost:
+        estimate = estimate_cost(
+            requests,
+            ledger=ledger,
+            default_max_output_tokens=args.max_tokens,
+            input_price_per_mtok=args.input_price,
+            output_price_per_mtok=args.output_price
+        )
+        logger.info(f"Non-primary chunks (0 minutes, no API call): {len(zero_layer)}")
+        for key, value in estimate.as_dict().items():
+            print(f"{key}={value}")
+        return 0
+
+    for chunk in zero_layer:
+        logger.info(
+            f"Chunk #{chunk.id} is not primary - setting time_delta to 0 minutes"
+        )
+        update_chunk_metadata(db, chunk.id, timedelta(minutes=0))
+
+    def call(request: BatchRequest) -> Dict[str, Any]:
+        response = query_llm(
+            prompt=request.prompt,
+            provider=request.provider,
+            model=request.model,
+            temperature=args.temperature,
+            max_tokens=args.max_tokens,
+            reasoning_effort=args.reasoning_effort
+        )
+        return {
+            "text": response.content,
+            "structured_data": response.structured_data,
+            "input_tokens": response.input_tokens,
+            "output_tokens": response.output_tokens
+        }
+
+    def apply(request: BatchRequest, result: Dict[str, Any]) -> None:
+        response = LLMResponse(
+            content=result.get("text") or "",
+            input_tokens=result.get("input_tokens", 0),
+            output_tokens=result.get("output_tokens", 0),
+            model=request.model,
+            structured_data=result.get("structured_data")
+        )
+        time_delta = parse_time_delta(response)
+        if not update_chunk_metadata(db, int(request.key), time_delta):
+            raise RuntimeError(f"Failed to write time_delta for chunk #{request.key}")
+        logger.info(f"Chunk #{request.key}: {format_timedelta(time_delta)}")
+
+    if args.batch_api:
+        outcome = run_openai_batch(
+            openai.OpenAI(),
+            requests,
+            ledger,
+            poll_seconds=args.batch_poll_seconds
+        )
+        logger.info(f"Batch API: {outcome.as_dict()}")
+
+    summary = run_requests(
+        requests,
+        missing_batch_result if args.batch_api else call,
+        apply,
+        ledger=ledger,
+        max_workers=max(1, args.workers)
+    )
+    logger.info(f"Non-primary chunks set to 0 minutes: {len(zero_layer)}")
+    for key, value in summary.as_dict().items():
+        logger.info(f"{key}: {value}")
+    return 1 if summary.failed else 0
+
+
 def main() -> int:
     """Main execution function."""
     # Parse arguments
@@ -1458,6 +1626,9 @@ def main() -> int:
     
     logger.info(f"Processing {len(chunks)} chunks...")
     
+    if uses_batch_engine(args):
+        return run_batch_engine(db, chunks, args)
+
     # Create a cache to store time_delta values across chunks
     time_delta_cache = {}
     
@@ -0,0 +1,558 @@
+#!/usr/bin/env python3
+"""Concurrent, resumable request engine for the LLM maintenance scripts.
+
+map_builder.py and estimate_time_delta.py build one prompt per narrative
+chunk and used to send them one at a time, sleeping between calls; a crash
+or a Ctrl-C halfway through a season threw away every answer already paid
+for. This module runs those prompts through a bounded worker pool and
+records each answer in an append-only JSONL checkpoint ledger keyed by the
+request hash (sha256 of provider, model, request parameters and prompt):
+
+* Calls run on ``max_workers`` threads (the provider clients are
+  synchronous); results are *applied* on the calling thread in request
+  order, so the scripts' interactive prompts and database writes stay
+  sequential.
+* The ledger records a result as soon as the call returns and records an
+  ``applied`` marker once the caller has written it. A restarted run skips
+  applied requests, applies recorded-but-unapplied results without calling
+  the provider, and only calls for what is missing.
+* :func:`estimate_cost` counts prompt tokens (tiktoken, falling back to
+  bytes / 4) and the output caps for a dry run.
+* :func:`run_openai_batch` submits the pending requests through the OpenAI
+  Batch API (``/v1/responses`` lines), polls the batch and fills the ledger
+  from its output file. The batch id is checkpointed too, so a restart
+  resumes polling instead of paying for a second submission. The local mock
+  server (``nexus.api.mock_openai``) implements the files and batches
+  endpoints for tests.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+logger = logging.getLogger("nexus.llm_batch")
+
+DEFAULT_WORKERS = 4
+# Batch API states after which the batch will not change any more.
+BATCH_TERMINAL_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
+BATCH_ENDPOINT = "/v1/responses"
+
+
+@dataclass(frozen=True)
+class BatchRequest:
+    """One prompt to send, identified in the ledger by its hash.
+
+    ``key`` is the caller's label (usually the chunk id) and is not hashed.
+    ``params`` are the Responses API body fields sent with the prompt
+    (``temperature``, ``max_output_tokens``, ``reasoning``, ``text``...);
+    they are part of the hash, so changing the model settings re-asks.
+    """
+
+    key: str
+    provider: str
+    model: str
+    prompt: str
+    params: Mapping[str, Any] = field(default_factory=dict)
+
+    @property
+    def request_hash(self) -> str:
+        identity = json.dumps(
+            {
+                "provider": self.provider,
+                "model": self.model,
+                "params": self.params,
+                "prompt": self.prompt,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class CheckpointLedger:
+    """Append-only JSONL ledger: request hash -> result, applied, batch ids.
+
+    Every event is one fsynced line, so a crash loses at most the line being
+    written; a torn final line is skipped on load.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._applied: set[str] = set()
+        self._batches: Dict[str, List[str]] = {}
+        if self.path.exists():
+            self._load()
+
+    def _load(self) -> None:
+        with self.path.open(encoding="utf-8") as handle:
+            for lineno, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(
+                        "Skipping unreadable ledger line %s:%d", self.path, lineno
+                    )
+                    continue
+                self._replay(entry)
+
+    def _replay(self, entry: Dict[str, Any]) -> None:
+        event = entry.get("event")
+        if event == "result":
+            self._results[entry["hash"]] = entry["result"]
+        elif event == "applied":
+            self._applied.add(entry["hash"])
+        elif event == "batch_submitted":
+            self._batches[entry["batch_id"]] = list(entry["hashes"])
+        elif event == "batch_closed":
+            self._batches.pop(entry["batch_id"], None)
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        entry = {**entry, "recorded_at": _now()}
+        line = json.dumps(entry, sort_keys=True, default=str) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line)
+                handle.flush()
+                os.fsync(handle.fileno())
+            self._replay(entry)
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def result(self, request_hash: str) -> Optional[Dict[str, Any]]:
+        return self._results.get(request_hash)
+
+    def is_applied(self, request_hash: str) -> bool:
+        return request_hash in self._applied
+
+    def record_result(self, request: BatchRequest, result: Dict[str, Any]) -> None:
+        self._append(
+            {
+                "event": "result",
+                "hash": request.request_hash,
+                "key": request.key,
+                "provider": request.provider,
+                "model": request.model,
+                "result": result,
+            }
+        )
+
+    def mark_applied(self, request: BatchRequest) -> None:
+        self._append(
+            {"event": "applied", "hash": request.request_hash, "key": request.key}
+        )
+
+    def open_batches(self) -> Dict[str, List[str]]:
+        """Submitted provider batches whose output has not been collected."""
+        return {batch_id: list(hashes) for batch_id, hashes in self._batches.items()}
+
+    def record_batch(self, batch_id: str, hashes: Sequence[str]) -> None:
+        self._append(
+            {"event": "batch_submitted", "batch_id": batch_id, "hashes": list(hashes)}
+        )
+
+    def close_batch(self, batch_id: str, status: str) -> None:
+        self._append({"event": "batch_closed", "batch_id": batch_id, "status": status})
+
+
+@dataclass
+class RunSummary:
+    """Counts for one :func:`run_requests` pass."""
+
+    requested: int = 0
+    called: int = 0
+    from_ledger: int = 0
+    already_applied: int = 0
+    applied: int = 0
+    failed: int = 0
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def run_requests(
+    requests: Sequence[BatchRequest],
+    call: Callable[[BatchRequest], Dict[str, Any]],
+    apply: Callable[[BatchRequest, Dict[str, Any]], None],
+    *,
+    ledger: Optional[CheckpointLedger] = None,
+    max_workers: int = DEFAULT_WORKERS,
+    stop_on_error: bool = False,
+    record_applied: bool = True,
+) -> RunSummary:
+    """Call pending requests on a bounded pool and apply results in order.
+
+    ``call`` runs on a worker thread and returns a JSON-serialisable result
+    (by convention ``{"text": ..., "input_tokens": ..., "output_tokens": ...}``);
+    ``apply`` runs on this thread, in request order. A failed call is
+    counted and skipped, or ends the run when ``stop_on_error`` is set; an
+    exception from ``apply`` always propagates, since the caller's writes
+    are in an unknown state. Identical requests are called once. Dry runs
+    pass ``record_applied=False``: answers are still checkpointed, but a
+    later real run applies them instead of skipping them.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    summary = RunSummary(requested=len(requests))
+
+    def _call(request: BatchRequest) -> Dict[str, Any]:
+        result = call(request)
+        if ledger is not None:
+            ledger.record_result(request, result)
+        return result
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="llm-batch"
+    )
+    futures: Dict[str, Future] = {}
+    try:
+        for request in requests:
+            request_hash = request.request_hash
+            if ledger is not None and (
+                ledger.is_applied(request_hash)
+                or ledger.result(request_hash) is not None
+            ):
+                continue
+            if request_hash not in futures:
+                futures[request_hash] = executor.submit(_call, request)
+
+        for request in requests:
+            request_hash = request.request_hash
+            if ledger is not None and ledger.is_applied(request_hash):
+                summary.already_applied += 1
+                continue
+            future = futures.get(request_hash)
+            if future is None:
+                result = ledger.result(request_hash) if ledger is not None else None
+                summary.from_ledger += 1
+            else:
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    summary.failed += 1
+                    summary.errors[request.key] = str(exc)
+                    logger.error("Request %s failed: %s", request.key, exc)
+                    if stop_on_error:
+                        break
+                    continue
+                summary.called += 1
+            apply(request, result)
+            summary.applied += 1
+            if ledger is not None and record_applied:
+                ledger.mark_applied(request)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return summary
+
+
+def count_tokens(text: str, model: str) -> int:
+    """Prompt tokens for ``model``: tiktoken when available, else bytes / 4."""
+    try:
+        import tiktoken
+    except ImportError:
+        return len(text.encode("utf-8")) // 4
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+    except KeyError:
+        encoding = tiktoken.get_encoding("cl100k_base")
+    return len(encoding.encode(text))
+
+
+@dataclass
+class CostEstimate:
+    """Token totals (and optional dollar ceiling) for the uncached requests."""
+
+    requests: int
+    cached: int
+    input_tokens: int
+    max_output_tokens: int
+    input_cost: Optional[float] = None
+    output_cost: Optional[float] = None
+
+    @property
+    def total_cost(self) -> Optional[float]:
+        if self.input_cost is None or self.output_cost is None:
+            return None
+        return self.input_cost + self.output_cost
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "total_cost": self.total_cost}
+
+
+def estimate_cost(
+    requests: Iterable[BatchRequest],
+    *,
+    ledger: Optional[CheckpointLedger] = None,
+    default_max_output_tokens: int = 0,
+    input_price_per_mtok: Optional[float] = None,
+    output_price_per_mtok: Optional[float] = None,
+    tokenizer: Callable[[str, str], int] = count_tokens,
+) -> CostEstimate:
+    """Estimate what a run would send, skipping requests the ledger answers.
+
+    Output is bounded by each request's ``max_output_tokens`` (or the
+    default), so the cost is a ceiling. Prices are per million tokens and
+    optional; without them only token counts are reported.
+    """
+    pending: Dict[str, BatchRequest] = {}
+    cached = 0
+    for request in requests:
+        request_hash = request.request_hash
+        if ledger is not None and ledger.result(request_hash) is not None:
+            cached += 1
+        else:
+            pending.setdefault(request_hash, request)
+    input_tokens = sum(tokenizer(r.prompt, r.model) for r in pending.values())
+    output_tokens = sum(
+        int(r.params.get("max_output_tokens") or default_max_output_tokens)
+        for r in pending.values()
+    )
+    estimate = CostEstimate(
+        requests=len(pending),
+        cached=cached,
+        input_tokens=input_tokens,
+        max_output_tokens=output_tokens,
+    )
+    if input_price_per_mtok is not None:
+        estimate.input_cost = input_tokens * input_price_per_mtok / 1_000_000
+    if output_price_per_mtok is not None:
+        estimate.output_cost = output_tokens * output_price_per_mtok / 1_000_000
+    return estimate
+
+
+def batch_request_line(request: BatchRequest) -> Dict[str, Any]:
+    """One Batch API input line: a ``/v1/responses`` call keyed by hash."""
+    return {
+        "custom_id": request.request_hash,
+        "method": "POST",
+        "url": BATCH_ENDPOINT,
+        "body": {
+            "model": request.model,
+            "input": [{"role": "user", "content": request.prompt}],
+            **request.params,
+        },
+    }
+
+
+def response_body_text(body: Mapping[str, Any]) -> str:
+    """Concatenated ``output_text`` parts of a raw Responses API body."""
+    if isinstance(body.get("output_text"), str):
+        return body["output_text"]
+    parts: List[str] = []
+    for item in body.get("output") or []:
+        if item.get("type") != "message":
+            continue
+        for content in item.get("content") or []:
+            if content.get("type") == "output_text":
+                parts.append(content.get("text") or "")
+    return "".join(parts)
+
+
+@dataclass
+class BatchOutcome:
+    """What :func:`run_openai_batch` collected into the ledger."""
+
+    batch_ids: List[str] = field(default_factory=list)
+    submitted: int = 0
+    recorded: int = 0
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _collect_batch(
+    client: Any,
+    batch_id: str,
+    ledger: CheckpointLedger,
+    requests_by_hash: Mapping[str, BatchRequest],
+    outcome: BatchOutcome,
+    *,
+    poll_seconds: float,
+    timeout_seconds: float,
+    sleep: Callable[[float], None],
+) -> None:
+    deadline = time.monotonic() + timeout_seconds
+    batch = client.batches.retrieve(batch_id)
+    while batch.status not in BATCH_TERMINAL_STATES:
+        if time.monotonic() >= deadline:
+            raise TimeoutError(
+                f"Batch {batch_id} still {batch.status} after {timeout_seconds:.0f}s; "
+                "rerun with the same ledger to resume polling"
+            )
+        logger.info(
+            "Batch %s is %s; polling again in %.0fs",
+            batch_id,
+            batch.status,
+            poll_seconds,
+        )
+        sleep(poll_seconds)
+        batch = client.batches.retrieve(batch_id)
+
+    for file_id in (batch.output_file_id, getattr(batch, "error_file_id", None)):
+        if not file_id:
+            continue
+        for line in client.files.content(file_id).text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            request = requests_by_hash.get(entry.get("custom_id"))
+            if request is None:
+                continue
+            response = entry.get("response") or {}
+            if entry.get("error") or response.get("status_code") != 200:
+                detail = entry.get("error") or response.get("body")
+                outcome.errors[request.key] = json.dumps(detail, default=str)
+                continue
+            body = response.get("body") or {}
+            usage = body.get("usage") or {}
+            ledger.record_result(
+                request,
+                {
+                    "text": response_body_text(body),
+                    "input_tokens": usage.get("input_tokens", 0),
+                    "output_tokens": usage.get("output_tokens", 0),
+                },
+            )
+            outcome.recorded += 1
+    ledger.close_batch(batch_id, batch.status)
+
+
+def run_openai_batch(
+    client: Any,
+    requests: Sequence[BatchRequest],
+    ledger: CheckpointLedger,
+    *,
+    poll_seconds: float = 60.0,
+    timeout_seconds: float = 24 * 3600.0,
+    sleep: Callable[[float], None] = time.sleep,
+) -> BatchOutcome:
+    """Answer the requests the ledger lacks through the OpenAI Batch API.
+
+    Open batches recorded by an earlier run are collected first; whatever is
+    still missing afterwards is uploaded as one new batch. Results land in
+    the ledger, so the caller then applies them with :func:`run_requests`.
+    """
+    outcome = BatchOutcome()
+    requests_by_hash = {r.request_hash: r for r in requests}
+    for batch_id in ledger.open_batches():
+        outcome.batch_ids.append(batch_id)
+        _collect_batch(
+            client,
+            batch_id,
+            ledger,
+            requests_by_hash,
+            outcome,
+            poll_seconds=poll_seconds,
+            timeout_seconds=timeout_seconds,
+            sleep=sleep,
+        )
+
+    pending = [
+        request
+        for request_hash, request in requests_by_hash.items()
+        if ledger.result(request_hash) is None and request.key not in outcome.errors
+    ]
+    if not pending:
+        return outcome
+    payload = "".join(json.dumps(batch_request_line(r)) + "\n" for r in pending)
+    upload = client.files.create(
+        file=("llm_batch.jsonl", payload.encode("utf-8")), purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=upload.id, endpoint=BATCH_ENDPOINT, completion_window="24h"
+    )
+    ledger.record_batch(batch.id, [r.request_hash for r in pending])
+    outcome.batch_ids.append(batch.id)
+    outcome.submitted = len(pending)
+    logger.info("Submitted batch %s with %d requests", batch.id, len(pending))
+    _collect_batch(
+        client,
+        batch.id,
+        ledger,
+        requests_by_hash,
+        outcome,
+        poll_seconds=poll_seconds,
+        timeout_seconds=timeout_seconds,
+        sleep=sleep,
+    )
+    return outcome
+
+
+def missing_batch_result(request: BatchRequest) -> Dict[str, Any]:
+    """``call`` for :func:`run_requests` after a batch: never calls out."""
+    raise RuntimeError(f"no batch result for {request.key}")
+
+
+def add_batch_arguments(parser: Any) -> None:
+    """Engine flags shared by the maintenance scripts' argument parsers."""
+    group = parser.add_argument_group("Batch Engine Options")
+    group.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Concurrent API calls; above 1 the batch engine runs the chunks "
+            "(default: 1)"
+        ),
+    )
+    group.add_argument(
+        "--ledger",
+        type=Path,
+        help=(
+            "JSONL checkpoint ledger; a rerun with the same ledger resumes "
+            "where it stopped"
+        ),
+    )
+    group.add_argument(
+        "--estimate-cost",
+        action="store_true",
+        help="Build the prompts, print token counts (and cost with prices) and exit",
+    )
+    group.add_argument(
+        "--input-price",
+        type=float,
+        help="Input price per million tokens for --estimate-cost",
+    )
+    group.add_argument(
+        "--output-price",
+        type=float,
+        help="Output price per million tokens for --estimate-cost",
+    )
+    group.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Send the prompts through the OpenAI Batch API instead of live calls",
+    )
+    group.add_argument(
+        "--batch-poll-seconds",
+        type=float,
+        default=60.0,
+        help="Batch API polling interval (default: 60)",
+    )
+
+
+def uses_batch_engine(args: Any) -> bool:
+    """Whether the parsed flags ask for the engine instead of the legacy loop."""
+    return bool(args.workers > 1 or args.ledger or args.estimate_cost or args.batch_api)
@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""Drive concurrent narrative turns through the gateway and report capacity.
+
+DESTRUCTIVE: the disposable slots named with --slots (1-4; slot 5 is
+forbidden) have their model set to TEST and their incubator and generation
+lease cleared, and with --provision-from they are first dropped and cloned
+from a source database with a story in progress. Repeat the slot database
+names exactly in --confirm (e.g. ``--confirm save_01,save_02``).
+
+The real FastAPI app (nexus.api.narrative) runs in-process behind
+Starlette's TestClient, so no gateway port is involved; the mock OpenAI
+server runs on the TEST provider's base_url with configurable latency and
+narrative length, and every LORE, MEMNON and commit step runs for real
+against Postgres. Each of --sessions concurrent sessions holds its own
+/ws/narrative socket (as the UI does) and plays --turns scripted turns on
+its slot: POST /api/narrative/continue, wait for the session's terminal
+progress frame, then POST /api/narrative/approve/{session_id}. Sessions share
+slots round-robin and take turns on a shared slot, since one story advances
+one turn at a time; a 409 from the slot's generation lease (e.g. background
+work still holding it) is retried and counted.
+
+Reported as key=value lines: turns per minute, p50/p95/p99 turn latency
+(continue to terminal frame) and commit latency (approve round trip), peak
+and saturated-sample share of the db_pool pools (MAX_CONNECTIONS each) plus
+peak Postgres backends per slot, and the websocket fan-out cost measured
+inside ConnectionManager.broadcast. Inputs, turn counts and mock latency
+jitter are seeded, so runs are comparable change to change.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+import json
+import logging
+from pathlib import Path
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+import uvicorn
+from fastapi.testclient import TestClient
+
+# Load-test this checkout, not whichever installed copy sys.path resolves.
+ROOT = Path(__file__).parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from nexus.api import db_pool, mock_openai  # noqa: E402
+from nexus.api.mock_openai import (  # noqa: E402
+    MockQuota,
+    configure_mock_narrative_words,
+    configure_mock_quota,
+)
+from nexus.api.slot_utils import slot_dbname  # noqa: E402
+from nexus.config import load_settings  # noqa: E402
+
+MODEL = "TEST"
+TERMINAL_STATUSES = ("complete", "error")
+STOP_SESSION = "load-test-stop"
+DEFAULT_SCRIPT: List[Dict[str, Any]] = [
+    {"choice": 1},
+    {"user_text": "I keep moving and watch who follows me through the crowd."},
+    {"choice": 2},
+    {"accept_fate": True},
+    {"user_text": "I ask the nearest stranger what changed here tonight."},
+]
+LEASE_RETRY_LIMIT = 200
+LEASE_RETRY_SECONDS = 0.05
+TURN_TIMEOUT_SECONDS = 600.0
+
+
+@dataclass
+class TurnSample:
+    """Timings for one played turn."""
+
+    session: int
+    slot: int
+    turn: int
+    turn_seconds: Optional[float] = None
+    commit_seconds: Optional[float] = None
+    lease_conflicts: int = 0
+    error: Optional[str] = None
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Linearly interpolated ``q``-th percentile (0-100); 0.0 when empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def check_disposable_slots(slots: Sequence[int], confirm: str) -> List[str]:
+    """Return the slot database names, refusing anything not confirmed."""
+    if not slots:
+        raise ValueError("At least one slot is required")
+    if any(slot not in (1, 2, 3, 4) for slot in slots):
+        raise ValueError("Load tests run on disposable slots 1-4; slot 5 is forbidden")
+    dbnames = [slot_dbname(slot) for slot in sorted(set(slots))]
+    confirmed = sorted(name.strip() for name in confirm.split(",") if name.strip())
+    if confirmed != dbnames:
+        raise ValueError(f"--confirm must list exactly: {','.join(dbnames)}")
+    return dbnames
+
+
+def provision_slots(slots: Sequence[int], source_db: Optional[str]) -> None:
+    """Optionally clone ``source_db`` into each slot, then reset it for TEST."""
+    from scripts.new_story_setup import _admin_connect, clone_slot_with_data
+
+    for slot in sorted(set(slots)):
+        if source_db:
+            clone_slot_with_data(slot, source_db, force=True)
+        conn = _admin_connect(slot_dbname(slot))
+        try:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "UPDATE global_variables SET model = %s WHERE id = TRUE", (MODEL,)
+                )
+                cur.execute("DELETE FROM incubator")
+                cur.execute("DELETE FROM narrative_generation_lease")
+        finally:
+            conn.close()
+
+
+class ProgressListener:
+    """One /ws/narrative socket recording when each session's turn ended."""
+
+    def __init__(self, client: TestClient, finished: Dict[str, tuple]) -> None:
+        self._client = client
+        self._finished = finished
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+        self._ready.wait()
+
+    def join(self, timeout: float = 10.0) -> None:
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        with self._client.websocket_connect("/ws/narrative") as websocket:
+            self._ready.set()
+            while True:
+                progress = json.loads(websocket.receive_text())
+                session_id = progress.get("session_id")
+                if session_id == STOP_SESSION:
+                    return
+                if progress.get("status") in TERMINAL_STATUSES:
+                    # Every socket sees every frame; keep the first arrival.
+                    self._finished.setdefault(
+                        session_id, (progress["status"], time.perf_counter())
+                    )
+
+
+class PoolSampler:
+    """Sample db_pool use and Postgres backends on the load-test slots."""
+
+    def __init__(self, dbnames: Sequence[str], interval: float) -> None:
+        self.dbnames = list(dbnames)
+        self.interval = interval
+        self.samples = 0
+        self.saturated_samples = 0
+        self.sync_peak = 0
+        self.async_peak = 0
+        self.backend_peaks: Dict[str, int] = {name: 0 for name in self.dbnames}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        from scripts.new_story_setup import _admin_connect
+
+        conn = _admin_connect()
+        try:
+            while not self._stop.is_set():
+                self.sample(conn)
+                self._stop.wait(self.interval)
+        finally:
+            conn.close()
+
+    def sample(self, conn: Any) -> None:
+        stats = {
+            name: entry
+            for name, entry in db_pool.pool_stats().items()
+            if name in self.dbnames
+        }
+        self.samples += 1
+        if any(
+            max(entry["sync_in_use"], entry["async_in_use"]) >= entry["max"]
+            for entry in stats.values()
+        ):
+            self.saturated_samples += 1
+        for entry in stats.values():
+            self.sync_peak = max(self.sync_peak, entry["sync_in_use"])
+            self.async_peak = max(self.async_peak, entry["async_in_use"])
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT datname, COUNT(*) FROM pg_stat_activity
+                WHERE datname = ANY(%s) GROUP BY datname
+                """,
+                (self.dbnames,),
+            )
+            for name, count in cur.fetchall():
+                self.backend_peaks[name] = max(self.backend_peaks[name], count)
+
+
+def _play_session(
+    client: TestClient,
+    session: int,
+    slot: int,
+    turns: int,
+    script: Sequence[Dict[str, Any]],
+    finished: Dict[str, tuple],
+    samples: List[TurnSample],
+    slot_lock: threading.Lock,
+) -> None:
+    for turn in range(turns):
+        sample = TurnSample(session=session, slot=slot, turn=turn)
+        samples.append(sample)
+        with slot_lock:
+            _play_turn(client, sample, script, finished)
+
+
+def _play_turn(
+    client: TestClient,
+    sample: TurnSample,
+    script: Sequence[Dict[str, Any]],
+    finished: Dict[str, tuple],
+) -> None:
+    slot = sample.slot
+    payload = {**script[(sample.session + sample.turn) % len(script)], "slot": slot}
+    started = time.perf_counter()
+    response = client.post("/api/narrative/continue", json=payload)
+    while response.status_code == 409 and (sample.lease_conflicts < LEASE_RETRY_LIMIT):
+        sample.lease_conflicts += 1
+        time.sleep(LEASE_RETRY_SECONDS)
+        started = time.perf_counter()
+        response = client.post("/api/narrative/continue", json=payload)
+    if response.status_code != 200:
+        sample.error = f"continue {response.status_code}: {response.text[:200]}"
+        return
+    session_id = response.json()["session_id"]
+    deadline = time.monotonic() + TURN_TIMEOUT_SECONDS
+    while session_id not in finished and time.monotonic() < deadline:
+        time.sleep(0.01)
+    if session_id not in finished:
+        sample.error = f"session {session_id} never reached a terminal frame"
+        return
+    status, ended = finished[session_id]
+    if status != "complete":
+        sample.error = f"session {session_id} ended with {status}"
+        return
+    sample.turn_seconds = ended - started
+
+    started = time.perf_counter()
+    response = client.post(
+        f"/api/narrative/approve/{session_id}",
+        json={"commit": True, "slot": slot},
+    )
+    if response.status_code != 200:
+        sample.error = f"approve {response.status_code}: {response.text[:200]}"
+        return
+    sample.commit_seconds = time.perf_counter() - started
+
+
+def _start_mock_server(host: str, port: int) -> tuple:
+    server = uvicorn.Server(
+        uvicorn.Config(mock_openai.app, host=host, port=port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if not thread.is_alive() or time.monotonic() > deadline:
+            raise SystemExit(
+                f"Mock server could not bind {host}:{port}; stop any running "
+                "mock_openai service first"
+            )
+        time.sleep(0.05)
+    return server, thread
+
+
+def run_load(
+    *,
+    slots: Sequence[int],
+    sessions: int,
+    turns: int,
+    script: Sequence[Dict[str, Any]] = DEFAULT_SCRIPT,
+    latency: float = 0.5,
+    jitter: float = 0.1,
+    narrative_words: int = 600,
+    sample_interval: float = 0.05,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Play the scripted load and return the key=value report as a dict."""
+    from nexus.api.narrative import app, manager
+
+    base_url = urlsplit(load_settings().global_.model.api_models["test"].base_url)
+    configure_mock_quota(
+        MockQuota(latency_seconds=latency, latency_jitter_seconds=jitter, seed=seed)
+    )
+    configure_mock_narrative_words(narrative_words)
+    server, server_thread = _start_mock_server(
+        base_url.hostname or "127.0.0.1", base_url.port or 80
+    )
+    sampler = PoolSampler([slot_dbname(slot) for slot in slots], sample_interval)
+    finished: Dict[str, tuple] = {}
+    samples: List[TurnSample] = []
+    slot_locks = {slot: threading.Lock() for slot in slots}
+    fanout_before = (
+        manager.broadcasts,
+        manager.messages_sent,
+        manager.broadcast_seconds,
+    )
+    try:
+        with TestClient(app) as client:
+            listeners = [ProgressListener(client, finished) for _ in range(sessions)]
+            for listener in listeners:
+                listener.start()
+            sampler.start()
+            started = time.perf_counter()
+            workers = [
+                threading.Thread(
+                    target=_play_session,
+                    args=(
+                        client,
+                        index,
+                        slots[index % len(slots)],
+                        turns,
+                        script,
+                        finished,
+                        samples,
+                        slot_locks[slots[index % len(slots)]],
+                    ),
+                )
+                for index in range(sessions)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - started
+            sampler.stop()
+            client.portal.call(
+                manager.broadcast, json.dumps({"session_id": STOP_SESSION})
+            )
+            for listener in listeners:
+                listener.join()
+    finally:
+        server.should_exit = True
+        server_thread.join(10)
+        configure_mock_quota(None)
+        configure_mock_narrative_words(0)
+
+    broadcasts = manager.broadcasts - fanout_before[0] - 1  # minus the stop frame
+    messages = manager.messages_sent - fanout_before[1] - sessions
+    broadcast_seconds = manager.broadcast_seconds - fanout_before[2]
+    turn_times = [s.turn_seconds for s in samples if s.turn_seconds is not None]
+    commit_times = [s.commit_seconds for s in samples if s.commit_seconds is not None]
+    completed = sum(1 for s in samples if s.error is None)
+    report: Dict[str, Any] = {
+        "sessions": sessions,
+        "slots": ",".join(str(slot) for slot in slots),
+        "turns_attempted": len(samples),
+        "turns_completed": completed,
+        "turns_failed": len(samples) - completed,
+        "elapsed_s": round(elapsed, 2),
+        "turns_per_minute": round(completed * 60.0 / elapsed, 2) if elapsed else 0.0,
+        "lease_conflicts": sum(s.lease_conflicts for s in samples),
+    }
+    for label, values in (("turn", turn_times), ("commit", commit_times)):
+        for q in (50, 95, 99):
+            report[f"{label}_p{q}_ms"] = round(percentile(values, q) * 1000, 1)
+    report["pool_max_connections"] = db_pool.MAX_CONNECTIONS
+    report["pool_sync_in_use_peak"] = sampler.sync_peak
+    report["pool_async_in_use_peak"] = sampler.async_peak
+    report["pool_saturated_share"] = round(
+        sampler.saturated_samples / sampler.samples if sampler.samples else 0.0, 3
+    )
+    for name, peak in sampler.backend_peaks.items():
+        report[f"pg_backends_peak_{name}"] = peak
+    report["ws_broadcasts"] = broadcasts
+    report["ws_messages"] = messages
+    report["ws_broadcast_ms_mean"] = round(
+        broadcast_seconds * 1000 / broadcasts if broadcasts > 0 else 0.0, 3
+    )
+    report["ws_broadcast_share_of_wall"] = round(
+        broadcast_seconds / elapsed if elapsed else 0.0, 4
+    )
+    errors = [s.error for s in samples if s.error]
+    if errors:
+        report["first_error"] = errors[0]
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--slots", type=int, nargs="+", required=True, help="Disposable slots (1-4)"
+    )
+    parser.add_argument(
+        "--confirm",
+        required=True,
+        help="Comma-separated slot database names, e.g. save_01,save_02",
+    )
+    parser.add_argument(
+        "--provision-from",
+        metavar="DBNAME",
+        help="Drop each slot and clone this database (a story in progress) into it",
+    )
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument("--turns", type=int, default=5, help="Turns per session")
+    parser.add_argument(
+        "--script",
+        type=Path,
+        help="JSON list of continue payloads (choice/user_text/accept_fate)",
+    )
+    parser.add_argument("--latency", type=float, default=0.5, help="Mock seconds")
+    parser.add_argument("--jitter", type=float, default=0.1, help="Mock seconds")
+    parser.add_argument(
+        "--narrative-words",
+        type=int,
+        default=600,
+        help="Words of mock storyteller prose per turn (default: 600)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    try:
+        check_disposable_slots(args.slots, args.confirm)
+    except ValueError as exc:
+        raise SystemExit(str(exc))
+    script = DEFAULT_SCRIPT
+    if args.script:
+        script = json.loads(args.script.read_text(encoding="utf-8"))
+        if not isinstance(script, list) or not script:
+            raise SystemExit("--script must be a non-empty JSON list")
+
+    logging.getLogger("nexus.api.mock_openai").setLevel(logging.ERROR)
+    provision_slots(args.slots, args.provision_from)
+    report = run_load(
+        slots=args.slots,
+        sessions=args.sessions,
+        turns=args.turns,
+        script=script,
+        latency=args.latency,
+        jitter=args.jitter,
+        narrative_words=args.narrative_words,
+        seed=args.seed,
+    )
+    for key, value in report.items():
+        print(f"{key}={value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,15 @@ Usage Examples:
 
     # Process with overwrite option (even if references already exist)
     python map_builder.py --episode s02e03 --overwrite
+
+    # Estimate tokens and cost before a full run
+    python map_builder.py --all --estimate-cost --input-price 1.1 --output-price 4.4
+
+    # Eight concurrent calls, resumable from the ledger after an interruption
+    python map_builder.py --all --workers 8 --ledger map_builder.ledger.jsonl
+
+    # Send every prompt as one OpenAI Batch API job
+    python map_builder.py --all --batch-api --ledger map_builder.ledger.jsonl
 """
 
 import os
@@ -42,9 +51,20 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 from pydantic import BaseModel, Field, ConfigDict
 
-# Import from api_openai.py
+# Import from api_openai.py and llm_batch.py
 try:
     from api_openai import OpenAIProvider, get_db_connection_string
+    from llm_batch import (
+        BatchRequest,
+        CheckpointLedger,
+        add_batch_arguments,
+        estimate_cost,
+        missing_batch_result,
+        run_openai_batch,
+        run_requests,
+        uses_batch_engine,
+    )
+    from nexus.api.native_structured_output import openai_response_text_format
 except ImportError as e:
     print(f"Error importing from api_openai.py: {e}")
     print("Make sure api_openai.py is in the same directory.")
@@ -212,6 +232,12 @@ def parse_arguments() -> argparse.Namespace:
                           help="Temperature setting (0.0-1.0, default: 0.1)")
     api_group.add_argument("--effort", choices=["low", "medium", "high"], default="medium",
                          help="Reasoning effort for o-prefixed models (default: medium)")
+    api_group.add_argument(
+        "--max-tokens",
+        type=int,
+        default=4000,
+        help="Maximum output tokens per response, reasoning included (default: 4000)"
+    )
     
     # Database options
     db_group = parser.add_argument_group("Database Options")
@@ -234,9 +260,18 @@ def parse_arguments() -> argparse.Namespace:
     selection.add_argument("--all", action="store_true", help="Process all chunks in the database")
     selection.add_argument("--validate", action="store_true", 
                           help="Validate that chunk_metadata.place and place_chunk_references are in sync (no API calls)")
+    add_batch_arguments(parser)
     
     args = parser.parse_args()
     
+    if uses_batch_engine(args) and (args.test or args.validate):
+        parser.error(
+            "--workers, --ledger, --estimate-cost and --batch-api cannot be "
+            "combined with --test or --validate"
+        )
+    if args.batch_api and not args.ledger:
+        parser.error("--batch-api needs a --ledger")
+
     # Set log level
     logger.setLevel(logging.DEBUG if args.test else logging.INFO)
     
@@ -2572,6 +2607,7 @@ def process_chunks(
         api_key=args.api_key,
         model=args.model,
         temperature=args.temperature,
+        max_tokens=args.max_tokens,
         reasoning_effort=args.effort
     )
     
@@ -2616,6 +2652,7 @@ def process_chunks(
                     model=args.model,
                     input=messages,
                     reasoning={"effort": args.effort},
+                    max_output_tokens=args.max_tokens,
                     text_format=LocationAnalysisResult
                 )
             else:
@@ -2623,6 +2660,7 @@ def process_chunks(
                     model=args.model,
                     input=messages,
                     temperature=args.temperature,
+                    max_output_tokens=args.max_tokens,
                     text_format=LocationAnalysisResult
                 )
             
@@ -2641,6 +2679,148 @@ def process_chunks(
             continue
 
 
+def build_location_request(
+    engine: Engine,
+    chunk: NarrativeChunk,
+    places_by_zone: Dict[Zone, List[Place]],
+    prompt_data: Dict[str, Any],
+    args: argparse.Namespace
+) -> BatchRequest:
+    """
+    Build the batch engine request for one chunk.
+
+    The body fields match the sequential loop's responses.parse call, with
+    LocationAnalysisResult expressed as the native text.format schema.
+    """
+    prompt = create_prompt(
+        target_chunk=chunk,
+        previous_chunk=get_previous_chunk(engine, chunk.id),
+        places_by_zone=places_by_zone,
+        prompt_data=prompt_data,
+        engine=engine
+    )
+    params: Dict[str, Any] = {
+        "max_output_tokens": args.max_tokens,
+        "text": {"format": openai_response_text_format(LocationAnalysisResult)}
+    }
+    if args.model.startswith("o"):
+        params["reasoning"] = {"effort": args.effort}
+    else:
+        params["temperature"] = args.temperature
+    return BatchRequest(
+        key=str(chunk.id),
+        provider="openai",
+        model=args.model,
+        prompt=prompt,
+        params=params
+    )
+
+
+def process_chunks_with_engine(
+    engine: Engine,
+    chunks: List[NarrativeChunk],
+    args: argparse.Namespace
+) -> int:
+    """
+    Process chunks through the concurrent, resumable batch engine.
+
+    Prompts are built up front from the places and previous-chunk settings
+    in the database when the run starts; the sequential loop rebuilds each
+    prompt after the previous chunk was written, so places created during
+    this run are only offered to the chunks of a later run. Results are
+    still handled one chunk at a time, in chunk order, so the interactive
+    setting prompts behave as before.
+
+    Returns:
+        Process exit code (1 if any request failed)
+    """
+    prompt_data = load_prompt_data()
+    chunks.sort(key=lambda c: c.id)
+    places_by_zone = get_places_grouped_by_zone(engine)
+    chunks_by_key = {str(chunk.id): chunk for chunk in chunks}
+    requests = [
+        build_location_request(engine, chunk, places_by_zone, prompt_data, args)
+        for chunk in chunks
+    ]
+    ledger = CheckpointLedger(args.ledger) if args.ledger else None
+
+    if args.estimate_cost:
+        estimate = estimate_cost(
+            requests,
+            ledger=ledger,
+            default_max_output_tokens=args.max_tokens,
+            input_price_per_mtok=args.input_price,
+            output_price_per_mtok=args.output_price
+        )
+        for key, value in estimate.as_dict().items():
+            print(f"{key}={value}")
+        return 0
+
+    provider = OpenAIProvider(
+        api_key=args.api_key,
+        model=args.model,
+        temperature=args.temperature,
+        max_tokens=args.max_tokens,
+        reasoning_effort=args.effort
+    )
+
+    def call(request: BatchRequest) -> Dict[str, Any]:
+        messages = [{"role": "user", "content": request.prompt}]
+        if args.model.startswith("o"):
+            response = provider.client.responses.parse(
+                model=args.model,
+                input=messages,
+                reasoning={"effort": args.effort},
+                max_output_tokens=args.max_tokens,
+                text_format=LocationAnalysisResult
+            )
+        else:
+            response = provider.client.responses.parse(
+                model=args.model,
+                input=messages,
+                temperature=args.temperature,
+                max_output_tokens=args.max_tokens,
+                text_format=LocationAnalysisResult
+            )
+        return {
+            "text": response.output_text,
+            "input_tokens": response.usage.input_tokens,
+            "output_tokens": response.usage.output_tokens
+        }
+
+    def apply(request: BatchRequest, result: Dict[str, Any]) -> None:
+        chunk = chunks_by_key[request.key]
+        logger.info(f"Handling result for chunk {chunk.id}")
+        handle_api_result(
+            engine,
+            LocationAnalysisResult.model_validate_json(result["text"]),
+            chunk,
+            get_places_grouped_by_zone(engine),
+            args.dry_run
+        )
+
+    if args.batch_api:
+        outcome = run_openai_batch(
+            provider.client,
+            requests,
+            ledger,
+            poll_seconds=args.batch_poll_seconds
+        )
+        logger.info(f"Batch API: {outcome.as_dict()}")
+
+    summary = run_requests(
+        requests,
+        missing_batch_result if args.batch_api else call,
+        apply,
+        ledger=ledger,
+        max_workers=max(1, args.workers),
+        record_applied=not args.dry_run
+    )
+    for key, value in summary.as_dict().items():
+        logger.info(f"{key}: {value}")
+    return 1 if summary.failed else 0
+
+
 def main():
     """Main entry point for the script."""
     args = parse_arguments()
@@ -2681,6 +2861,8 @@ def main():
     # Process or validate chunks
     if args.validate:
         validate_chunks(engine, chunks, places_by_zone, args)
+    elif uses_batch_engine(args):
+        return process_chunks_with_engine(engine, chunks, args)
     else:
         process_chunks(engine, chunks, places_by_zone, args)
     
@@ -3,11 +3,16 @@
 Database migration runner for NEXUS.
 
 Applies SQL migrations to all slot databases and the template database.
-Tracks applied migrations in a per-database `schema_migrations` table.
+Tracks applied migrations in a per-database `schema_migrations` table, which
+also records each migration's duration, sampled lock-wait time, and the
+tables it held ACCESS EXCLUSIVE locks on. Databases migrate concurrently
+(bounded by --jobs); migrations within one database stay strictly ordered.
 
 Usage:
     python scripts/migrate.py --status          # Show pending migrations
+    python scripts/migrate.py --plan            # Estimate pending work per DB
     python scripts/migrate.py --all             # Apply to all unlocked DBs
+    python scripts/migrate.py --all --jobs 2    # ...at most two DBs at once
     python scripts/migrate.py --slot 5          # Apply to specific slot
     python scripts/migrate.py --template        # Apply to NEXUS_template only
     python scripts/migrate.py --all --dry-run   # Show what would be applied
@@ -16,14 +21,21 @@ Usage:
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import heapq
 import importlib.util
+import json
 import logging
 import os
 import re
+import statistics
 import sys
+import threading
+import time
 from pathlib import Path
 from types import ModuleType
-from typing import List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import psycopg2
 
@@ -33,6 +45,21 @@ logging.basicConfig(
     format="%(levelname)s %(message)s",
 )
 
+_LOG_CONTEXT = threading.local()
+
+
+class _DatabaseLogPrefix(logging.Filter):
+    """Prefix records with the database a parallel worker is migrating."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        dbname = getattr(_LOG_CONTEXT, "dbname", None)
+        if dbname:
+            record.msg = f"[{dbname}] {record.msg}"
+        return True
+
+
+LOG.addFilter(_DatabaseLogPrefix())
+
 # Migration directory relative to this script
 MIGRATIONS_DIR = Path(__file__).parent.parent / "migrations"
 SCRIPT_ONLY_MIGRATIONS = {
@@ -55,6 +82,39 @@ BOOTSTRAP_MIGRATIONS = [
     # 008 is a Python seeding script, not a SQL migration
 ]
 
+# Ledger columns added to schema_migrations by this runner (not by a numbered
+# migration: the runner needs them before it can apply anything).
+LEDGER_COLUMNS = (
+    ("duration_ms", "INTEGER"),
+    ("lock_wait_ms", "INTEGER"),
+    ("exclusive_locks", "JSONB"),
+)
+# Tables at least this large are flagged when a migration takes ACCESS
+# EXCLUSIVE on them: every reader and writer queues behind the migration.
+LARGE_TABLE_BYTES = 64 * 1024 * 1024
+LOCK_SAMPLE_SECONDS = 0.05
+# Estimate for a migration no database has timed yet, absent any history.
+DEFAULT_ESTIMATE_MS = 1000
+DEFAULT_JOBS = 1 + len(SLOT_DBS)
+
+# Statements that take ACCESS EXCLUSIVE on the named table (ALTER TABLE forms
+# that take weaker locks are still listed: the plan errs toward flagging).
+EXCLUSIVE_LOCK_PATTERN = re.compile(
+    r"""\b(?:
+        ALTER\s+TABLE(?:\s+IF\s+EXISTS)?(?:\s+ONLY)?
+      | DROP\s+TABLE(?:\s+IF\s+EXISTS)?
+      | TRUNCATE(?:\s+TABLE)?(?:\s+ONLY)?
+      | LOCK\s+TABLE(?:\s+ONLY)?
+      | VACUUM\s+FULL
+      | CLUSTER
+      | REINDEX\s+TABLE
+    )\s+("?[A-Za-z_][\w$]*"?(?:\."?[A-Za-z_][\w$]*"?)?)""",
+    re.IGNORECASE | re.VERBOSE,
+)
+SQL_COMMENT_PATTERN = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+# Keywords the pattern can capture in place of a table name.
+_NOT_TABLE_NAMES = {"IF", "ON", "ONLY", "CASCADE", "VERBOSE"}
+
 
 def get_connection(dbname: str):
     """Get a database connection."""
@@ -150,10 +210,31 @@ def ensure_tracking_table(conn, dry_run: bool = False) -> bool:
                 )
                 """
             )
+
+        if not dry_run:
+            for column, column_type in LEDGER_COLUMNS:
+                if column not in columns:
+                    cur.execute(
+                        f"ALTER TABLE schema_migrations "
+                        f"ADD COLUMN IF NOT EXISTS {column} {column_type}"
+                    )
     conn.commit()
     return True
 
 
+def ledger_columns(conn) -> Set[str]:
+    """Return the timing columns this database's ledger already has."""
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT column_name FROM information_schema.columns
+            WHERE table_name = 'schema_migrations' AND table_schema = 'public'
+            """
+        )
+        columns = {row[0] for row in cur.fetchall()}
+    return columns & {column for column, _ in LEDGER_COLUMNS}
+
+
 def needs_bootstrap(conn) -> bool:
     """Check if we need to bootstrap existing migrations."""
     with conn.cursor() as cur:
@@ -223,6 +304,122 @@ def _load_python_migration(path: Path) -> ModuleType:
     return module
 
 
+class LockWaitSampler:
+    """Sample how long a backend spends waiting on heavyweight locks.
+
+    Polls ``pg_stat_activity`` for the migrating backend from a side
+    connection. Sampling misses waits shorter than the interval, so the
+    figure is a lower bound; it is None when the side connection fails.
+    """
+
+    def __init__(self, conn, interval: float = LOCK_SAMPLE_SECONDS) -> None:
+        self._dbname = conn.info.dbname
+        self._pid = conn.get_backend_pid()
+        self._interval = interval
+        self._stop = threading.Event()
+        self._waiting_samples = 0
+        self._monitor = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "LockWaitSampler":
+        try:
+            self._monitor = get_connection(self._dbname)
+            self._monitor.autocommit = True
+        except psycopg2.Error as e:
+            LOG.debug("  Lock-wait sampling unavailable: %s", e)
+            return self
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def _sample(self) -> None:
+        with self._monitor.cursor() as cur:
+            while not self._stop.wait(self._interval):
+                cur.execute(
+                    "SELECT wait_event_type = 'Lock' FROM pg_stat_activity "
+                    "WHERE pid = %s",
+                    (self._pid,),
+                )
+                row = cur.fetchone()
+                if row and row[0]:
+                    self._waiting_samples += 1
+
+    def __exit__(self, *_exc: Any) -> bool:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self._monitor is not None:
+            self._monitor.close()
+        return False
+
+    @property
+    def lock_wait_ms(self) -> Optional[int]:
+        if self._monitor is None:
+            return None
+        return round(self._waiting_samples * self._interval * 1000)
+
+
+def exclusive_locks_held(conn) -> List[Dict[str, Any]]:
+    """Tables this connection's open transaction holds ACCESS EXCLUSIVE on.
+
+    SQL migrations run in one transaction, so every lock they took is still
+    held here; Python migrations that commit internally report only the
+    locks of their final transaction.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT n.nspname || '.' || c.relname,
+                   pg_total_relation_size(c.oid),
+                   GREATEST(c.reltuples, 0)::bigint
+            FROM pg_locks l
+            JOIN pg_class c ON c.oid = l.relation
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE l.pid = pg_backend_pid()
+              AND l.locktype = 'relation'
+              AND l.mode = 'AccessExclusiveLock'
+              AND l.granted
+              AND c.relkind IN ('r', 'p', 'm')
+            ORDER BY 2 DESC, 1
+            """
+        )
+        return [
+            {"table": table, "bytes": int(size), "rows": int(rows)}
+            for table, size, rows in cur.fetchall()
+        ]
+
+
+def _format_bytes(size: int) -> str:
+    return f"{size / (1024 * 1024):.0f} MB"
+
+
+def _record_applied(
+    conn,
+    version: str,
+    name: str,
+    *,
+    duration_ms: int,
+    lock_wait_ms: Optional[int],
+    exclusive_locks: List[Dict[str, Any]],
+) -> None:
+    """Stamp the ledger, with timings when its columns exist."""
+    values: Dict[str, Any] = {"version": version, "name": name}
+    available = ledger_columns(conn)
+    for column, value in (
+        ("duration_ms", duration_ms),
+        ("lock_wait_ms", lock_wait_ms),
+        ("exclusive_locks", json.dumps(exclusive_locks)),
+    ):
+        if column in available:
+            values[column] = value
+    with conn.cursor() as cur:
+        cur.execute(
+            f"INSERT INTO schema_migrations ({', '.join(values)}) "
+            f"VALUES ({', '.join(['%s'] * len(values))})",
+            tuple(values.values()),
+        )
+
+
 def apply_migration(
     conn, version: str, name: str, path: Path, dry_run: bool = False
 ) -> bool:
@@ -236,10 +433,12 @@ def apply_migration(
         return True
 
     try:
+        started = time.perf_counter()
         if path.suffix == ".sql":
             sql = path.read_text()
-            with conn.cursor() as cur:
-                cur.execute(sql)
+            with LockWaitSampler(conn) as sampler:
+                with conn.cursor() as cur:
+                    cur.execute(sql)
         elif path.suffix == ".py":
             # Python migrations may need to manage transaction boundaries
             # internally (for example CREATE INDEX CONCURRENTLY), so ensure the
@@ -249,20 +448,39 @@ def apply_migration(
             run = getattr(module, "run", None)
             if run is None:
                 raise RuntimeError(f"Python migration {path.name} has no run(conn)")
-            run(conn)
+            with LockWaitSampler(conn) as sampler:
+                run(conn)
         else:
             raise RuntimeError(f"Unsupported migration type: {path}")
-
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO schema_migrations (version, name)
-                VALUES (%s, %s)
-                """,
-                (version, name),
-            )
+        duration_ms = round((time.perf_counter() - started) * 1000)
+        exclusive_locks = exclusive_locks_held(conn)
+
+        _record_applied(
+            conn,
+            version,
+            name,
+            duration_ms=duration_ms,
+            lock_wait_ms=sampler.lock_wait_ms,
+            exclusive_locks=exclusive_locks,
+        )
         conn.commit()
-        LOG.info("  Applied: %s_%s", version, name)
+        LOG.info("  Applied: %s_%s (%d ms)", version, name, duration_ms)
+        if sampler.lock_wait_ms:
+            LOG.warning(
+                "  %s_%s waited ~%d ms for locks",
+                version,
+                name,
+                sampler.lock_wait_ms,
+            )
+        for lock in exclusive_locks:
+            if lock["bytes"] >= LARGE_TABLE_BYTES:
+                LOG.warning(
+                    "  %s_%s held ACCESS EXCLUSIVE on large table %s (%s)",
+                    version,
+                    name,
+                    lock["table"],
+                    _format_bytes(lock["bytes"]),
+                )
         return True
     except Exception as e:
         if getattr(conn, "autocommit", False):
@@ -349,6 +567,255 @@ def migrate_database(
         conn.close()
 
 
+def _migrate_database_logged(
+    dbname: str, dry_run: bool, skip_locked: bool
+) -> Tuple[int, int]:
+    _LOG_CONTEXT.dbname = dbname
+    try:
+        return migrate_database(dbname, dry_run=dry_run, skip_locked=skip_locked)
+    finally:
+        _LOG_CONTEXT.dbname = None
+
+
+def migrate_databases(
+    targets: Iterable[str],
+    dry_run: bool = False,
+    jobs: int = DEFAULT_JOBS,
+    skip_locked: bool = True,
+) -> Dict[str, Tuple[int, int]]:
+    """
+    Migrate several databases, up to ``jobs`` at a time.
+
+    Each database has its own connection and ledger, so databases are
+    independent; ordering only matters within one database, which a single
+    worker walks in version order. Returns {dbname: (applied, skipped)}.
+    """
+    targets = list(targets)
+    if jobs <= 1 or len(targets) <= 1:
+        return {
+            dbname: migrate_database(dbname, dry_run=dry_run, skip_locked=skip_locked)
+            for dbname in targets
+        }
+    with ThreadPoolExecutor(
+        max_workers=min(jobs, len(targets)), thread_name_prefix="migrate"
+    ) as pool:
+        futures = {
+            dbname: pool.submit(_migrate_database_logged, dbname, dry_run, skip_locked)
+            for dbname in targets
+        }
+        return {dbname: future.result() for dbname, future in futures.items()}
+
+
+# ============================================================================
+# Planning
+# ============================================================================
+
+
+@dataclass
+class PlannedMigration:
+    """One pending migration with its runtime estimate and lock risk."""
+
+    version: str
+    name: str
+    estimate_ms: int
+    estimated_from: str  # "history" or "default"
+    large_exclusive_tables: List[Tuple[str, int]] = field(default_factory=list)
+
+
+@dataclass
+class DatabasePlan:
+    """Pending work for one database; ``status`` explains an empty plan."""
+
+    dbname: str
+    status: str  # ready | missing | locked | error
+    migrations: List[PlannedMigration] = field(default_factory=list)
+    detail: str = ""
+
+    @property
+    def estimate_ms(self) -> int:
+        return sum(migration.estimate_ms for migration in self.migrations)
+
+
+def static_exclusive_tables(text: str) -> Set[str]:
+    """Tables a migration's source names in ACCESS EXCLUSIVE statements."""
+    tables = set()
+    code = SQL_COMMENT_PATTERN.sub(" ", text)
+    for match in EXCLUSIVE_LOCK_PATTERN.finditer(code):
+        table = match.group(1).replace('"', "")
+        if table.upper() in _NOT_TABLE_NAMES:
+            continue
+        tables.add(table if "." in table else f"public.{table}")
+    return tables
+
+
+def load_migration_history(databases: Iterable[str]) -> Dict[str, List[dict]]:
+    """Collect recorded timings per version across every reachable ledger."""
+    history: Dict[str, List[dict]] = {}
+    for dbname in databases:
+        if not db_exists(dbname):
+            continue
+        try:
+            conn = get_connection(dbname)
+        except psycopg2.Error as e:
+            LOG.debug("No migration history from %s: %s", dbname, e)
+            continue
+        try:
+            if "duration_ms" not in ledger_columns(conn):
+                continue
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT version, duration_ms, exclusive_locks
+                    FROM schema_migrations
+                    WHERE duration_ms IS NOT NULL
+                    """
+                )
+                for version, duration_ms, exclusive_locks in cur.fetchall():
+                    history.setdefault(version, []).append(
+                        {
+                            "dbname": dbname,
+                            "duration_ms": int(duration_ms),
+                            "exclusive_locks": exclusive_locks or [],
+                        }
+                    )
+        finally:
+            conn.close()
+    return history
+
+
+def estimate_migration_ms(
+    version: str, history: Dict[str, List[dict]]
+) -> Tuple[int, str]:
+    """Median recorded duration, else the median of all recorded durations."""
+    samples = [entry["duration_ms"] for entry in history.get(version, [])]
+    if samples:
+        return round(statistics.median(samples)), "history"
+    everything = [
+        entry["duration_ms"] for entries in history.values() for entry in entries
+    ]
+    if everything:
+        return round(statistics.median(everything)), "default"
+    return DEFAULT_ESTIMATE_MS, "default"
+
+
+def _relation_sizes(conn, tables: Iterable[str]) -> Dict[str, int]:
+    sizes = {}
+    with conn.cursor() as cur:
+        for table in sorted(set(tables)):
+            cur.execute("SELECT pg_total_relation_size(to_regclass(%s))", (table,))
+            row = cur.fetchone()
+            if row and row[0] is not None:
+                sizes[table] = int(row[0])
+    return sizes
+
+
+def plan_database(dbname: str, history: Dict[str, List[dict]]) -> DatabasePlan:
+    """Read-only plan of one database's pending migrations."""
+    if not db_exists(dbname):
+        return DatabasePlan(dbname, "missing")
+    if is_db_locked(dbname):
+        return DatabasePlan(dbname, "locked")
+    try:
+        conn = get_connection(dbname)
+    except psycopg2.Error as e:
+        return DatabasePlan(dbname, "error", detail=str(e))
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = 'schema_migrations'
+                  AND table_schema = 'public'
+                  AND column_name = 'version'
+                """
+            )
+            tracked = cur.fetchone() is not None
+        # An untracked ledger is bootstrapped on first run, as migrate does.
+        applied = get_applied_migrations(conn) if tracked else set()
+        if not applied:
+            applied = {version for version, _ in BOOTSTRAP_MIGRATIONS}
+        pending = [
+            (version, name, path)
+            for version, name, path in discover_migrations()
+            if version not in applied
+        ]
+        candidates: Dict[str, Set[str]] = {}
+        for version, _name, path in pending:
+            tables = static_exclusive_tables(path.read_text())
+            for entry in history.get(version, []):
+                tables.update(lock["table"] for lock in entry["exclusive_locks"])
+            candidates[version] = tables
+        sizes = _relation_sizes(
+            conn, (table for tables in candidates.values() for table in tables)
+        )
+    finally:
+        conn.close()
+
+    plan = DatabasePlan(dbname, "ready")
+    for version, name, _path in pending:
+        estimate_ms, source = estimate_migration_ms(version, history)
+        plan.migrations.append(
+            PlannedMigration(
+                version,
+                name,
+                estimate_ms,
+                source,
+                sorted(
+                    (
+                        (table, sizes[table])
+                        for table in candidates[version]
+                        if sizes.get(table, 0) >= LARGE_TABLE_BYTES
+                    ),
+                    key=lambda item: -item[1],
+                ),
+            )
+        )
+    return plan
+
+
+def parallel_estimate_ms(estimates: Iterable[int], jobs: int) -> int:
+    """Wall time of per-database estimates on ``jobs`` workers (LPT order)."""
+    workers = [0] * max(1, jobs)
+    for estimate in sorted(estimates, reverse=True):
+        heapq.heapreplace(workers, workers[0] + estimate)
+    return max(workers)
+
+
+def show_plan(targets: List[str], jobs: int) -> None:
+    """Print pending migrations per database with runtime estimates."""
+    history = load_migration_history([TEMPLATE_DB] + SLOT_DBS)
+    plans = [plan_database(dbname, history) for dbname in targets]
+
+    for plan in plans:
+        if plan.status != "ready":
+            detail = f": {plan.detail}" if plan.detail else ""
+            print(f"{plan.dbname}: [{plan.status}{detail}]")
+            continue
+        print(
+            f"{plan.dbname}: {len(plan.migrations)} pending, "
+            f"~{plan.estimate_ms / 1000:.1f}s"
+        )
+        for migration in plan.migrations:
+            line = (
+                f"  [ ] {migration.version}_{migration.name}  "
+                f"~{migration.estimate_ms} ms ({migration.estimated_from})"
+            )
+            if migration.large_exclusive_tables:
+                line += "  ACCESS EXCLUSIVE: " + ", ".join(
+                    f"{table} ({_format_bytes(size)})"
+                    for table, size in migration.large_exclusive_tables
+                )
+            print(line)
+
+    estimates = [plan.estimate_ms for plan in plans if plan.migrations]
+    print()
+    print(f"Serial estimate: ~{sum(estimates) / 1000:.1f}s")
+    print(
+        f"Parallel estimate (--jobs {jobs}): "
+        f"~{parallel_estimate_ms(estimates, jobs) / 1000:.1f}s"
+    )
+
+
 def show_status() -> None:
     """Show migration status for all databases."""
     all_migrations = discover_migrations()
@@ -433,23 +900,41 @@ def main():
         action="store_true",
         help="Show migration status for all databases",
     )
+    target_group.add_argument(
+        "--plan",
+        action="store_true",
+        help="Estimate pending work per database from recorded timings",
+    )
 
     parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Show what would be applied without making changes",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        metavar="N",
+        help=f"Databases to migrate concurrently (default: {DEFAULT_JOBS})",
+    )
 
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     # Default to --status if no target specified
-    if not any([args.all, args.slot, args.template, args.status]):
+    if not any([args.all, args.slot, args.template, args.status, args.plan]):
         args.status = True
 
     if args.status:
         show_status()
         return
 
+    if args.plan:
+        show_plan([TEMPLATE_DB] + SLOT_DBS, args.jobs)
+        return
+
     # Determine target databases
     if args.all:
         targets = [TEMPLATE_DB] + SLOT_DBS
@@ -463,16 +948,18 @@ def main():
     if args.dry_run:
         LOG.info("[DRY-RUN MODE - no changes will be made]")
 
-    total_applied = 0
-    total_skipped = 0
-
-    for dbname in targets:
-        applied, skipped = migrate_database(dbname, dry_run=args.dry_run)
-        total_applied += applied
-        total_skipped += skipped
+    started = time.perf_counter()
+    results = migrate_databases(targets, dry_run=args.dry_run, jobs=args.jobs)
+    total_applied = sum(applied for applied, _ in results.values())
+    total_skipped = sum(skipped for _, skipped in results.values())
 
     LOG.info("")
-    LOG.info("Summary: %d applied, %d skipped/failed", total_applied, total_skipped)
+    LOG.info(
+        "Summary: %d applied, %d skipped/failed in %.1fs",
+        total_applied,
+        total_skipped,
+        time.perf_counter() - started,
+    )
 
     sys.exit(0 if total_skipped == 0 else 1)
 
@@ -4,19 +4,26 @@ Utilities for new-story save slots.
 
 Actions:
   - Create assets tables (`assets.new_story_creator`)
-  - Clone the public schema into a save slot schema (save_02 ... save_05) using pg_dump-based rewrite
+  - Create a save slot database (save_01 ... save_05) from NEXUS_template, via
+    CREATE DATABASE ... TEMPLATE when the template is idle and the
+    pg_dump-based rewrite otherwise
+  - Keep one pre-cloned spare slot database ready (--keep-spare)
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import logging
 import os
 import subprocess
 import tempfile
-from typing import Optional
+import threading
+from typing import List, Optional
 
 import psycopg2
+from psycopg2 import errors as pg_errors
+from psycopg2 import sql
 
 LOG = logging.getLogger("nexus.new_story_setup")
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
@@ -120,7 +127,10 @@ def ensure_global_variables(dbname: str) -> None:
 
 
 def create_slot_schema_only(
-    slot: int, source_db: Optional[str] = None, force: bool = False
+    slot: int,
+    source_db: Optional[str] = None,
+    force: bool = False,
+    keep_spare: bool = False,
 ) -> None:
     """
     Create a per-slot database from the template (no narrative data).
@@ -131,15 +141,22 @@ def create_slot_schema_only(
                    which carries the latest schema plus seed/vocab rows and a
                    fully stamped schema_migrations table.
         force: If True, drop and recreate the target database.
+        keep_spare: If True, take the slot from the pre-cloned spare when one
+                    is ready, and clone a replacement spare in the background.
     """
     if slot < 1 or slot > 5:
         raise ValueError("Slot must be between 1 and 5 (inclusive)")
     target_db = f"save_{slot:02d}"
-    initialize_slot_database(target_db, source_db=source_db, force=force)
+    initialize_slot_database(
+        target_db, source_db=source_db, force=force, keep_spare=keep_spare
+    )
 
 
 def initialize_slot_database(
-    target_db: str, source_db: Optional[str] = None, force: bool = False
+    target_db: str,
+    source_db: Optional[str] = None,
+    force: bool = False,
+    keep_spare: bool = False,
 ) -> None:
     """
     Create ``target_db`` as a fresh story database cloned from the template.
@@ -150,6 +167,11 @@ def initialize_slot_database(
     migrations the template has not seen — without them, migrate.py replays
     already-applied migrations against the post-migration schema and fails
     (e.g. 053 alters factions.power_level, which 058 already dropped).
+
+    The database comes from, in order of preference: the pre-cloned spare
+    (``keep_spare``; a rename), ``CREATE DATABASE ... TEMPLATE`` (a file
+    copy), or the pg_dump/psql rewrite when the template has open sessions.
+    With ``keep_spare`` a replacement spare is cloned in the background.
     """
     # NEXUS_template is the canonical fresh-slot image (schema + seed data)
     source_db = source_db or "NEXUS_template"
@@ -157,24 +179,47 @@ def initialize_slot_database(
     if force:
         # Terminate active connections before dropping
         # Use raw psycopg2 for postgres admin DB (not in slot pool)
-        admin_conn = psycopg2.connect(
-            dbname="postgres",
-            user=os.environ.get("PGUSER", "pythagor"),
-            host=os.environ.get("PGHOST", "localhost"),
-            port=os.environ.get("PGPORT", "5432"),
-        )
+        admin_conn = _admin_connect()
         try:
-            admin_conn.autocommit = True  # Required for pg_terminate_backend
             with admin_conn.cursor() as cur:
-                cur.execute(
-                    "SELECT pg_terminate_backend(pid) FROM pg_stat_activity WHERE datname = %s",
-                    (target_db,),
-                )
+                _terminate_backends(cur, target_db)
         finally:
             admin_conn.close()
         subprocess.run(["dropdb", "--if-exists", target_db], check=False)
         LOG.warning("Dropped database %s if it existed", target_db)
 
+    if keep_spare and _claim_spare_database(target_db, source_db):
+        LOG.info("Created database %s from the pre-cloned spare", target_db)
+    elif clone_template_database(target_db, source_db):
+        LOG.info("Created database %s as a file copy of %s", target_db, source_db)
+    else:
+        _restore_from_dump(target_db, source_db)
+    _require_migration_stamps(source_db, target_db)
+
+    # Ensure global_variables row exists
+    ensure_global_variables(target_db)
+
+    # Apply only migrations newer than the template's stamped baseline
+    if HAS_MIGRATE:
+        LOG.info("Running migrations on %s...", target_db)
+        applied, failed = migrate_database(target_db, skip_locked=False)
+        if failed:
+            LOG.warning("Some migrations failed on %s", target_db)
+        else:
+            LOG.info("Applied %d migrations to %s", applied, target_db)
+    else:
+        LOG.warning(
+            "Migration runner not available - run 'python scripts/migrate.py' manually"
+        )
+
+    LOG.info("Database %s ready", target_db)
+
+    if keep_spare:
+        prepare_spare_database(source_db)
+
+
+def _restore_from_dump(target_db: str, source_db: str) -> None:
+    """Build ``target_db`` from a pg_dump of the template (the slow path)."""
     subprocess.run(["createdb", target_db], check=True)
     LOG.info("Created database %s", target_db)
 
@@ -221,25 +266,6 @@ def initialize_slot_database(
 
     # Copy template data: seed/vocab rows plus schema_migrations stamps.
     _copy_template_data(source_db, target_db)
-    _require_migration_stamps(source_db, target_db)
-
-    # Ensure global_variables row exists
-    ensure_global_variables(target_db)
-
-    # Apply only migrations newer than the template's stamped baseline
-    if HAS_MIGRATE:
-        LOG.info("Running migrations on %s...", target_db)
-        applied, failed = migrate_database(target_db, skip_locked=False)
-        if failed:
-            LOG.warning("Some migrations failed on %s", target_db)
-        else:
-            LOG.info("Applied %d migrations to %s", applied, target_db)
-    else:
-        LOG.warning(
-            "Migration runner not available - run 'python scripts/migrate.py' manually"
-        )
-
-    LOG.info("Database %s ready", target_db)
 
 
 # The template's canonical seed image: the only tables whose ROWS are copied
@@ -306,10 +332,346 @@ def _require_migration_stamps(source_db: str, target_db: str) -> None:
         )
 
 
+# CREATE DATABASE ... STRATEGY exists from PostgreSQL 15. FILE_COPY copies
+# the template's files at the filesystem level instead of WAL-logging every
+# block, which is the fast choice for a small template.
+_FILE_COPY_MIN_SERVER_VERSION = 150000
+
+# A ready spare carries this comment; it is set only once the clone is clean.
+_SPARE_MARKER_PREFIX = "nexus-spare:"
+
+# One spare refill or claim at a time within this process.
+_SPARE_LOCK = threading.Lock()
+
+_NON_SEED_TABLES_SQL = """
+    SELECT format('%%I.%%I', n.nspname, c.relname)
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname IN ('public', 'assets')
+      AND c.relkind IN ('r', 'p')
+      AND NOT c.relispartition
+      AND format('%%I.%%I', n.nspname, c.relname) <> ALL(%(seed)s)
+      AND NOT EXISTS (
+          SELECT 1 FROM pg_depend d
+          WHERE d.classid = 'pg_class'::regclass
+            AND d.objid = c.oid
+            AND d.deptype = 'e'
+      )
+    ORDER BY 1
+"""
+
+# Sequences the dump path would recreate at their start value: everything
+# not owned by an extension or by a seed table (whose setval the data-only
+# dump carries).
+_NON_SEED_SEQUENCES_SQL = """
+    SELECT format('%%I.%%I', n.nspname, c.relname)
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname IN ('public', 'assets')
+      AND c.relkind = 'S'
+      AND NOT EXISTS (
+          SELECT 1 FROM pg_depend d
+          WHERE d.classid = 'pg_class'::regclass
+            AND d.objid = c.oid
+            AND d.deptype = 'e'
+      )
+      AND NOT EXISTS (
+          SELECT 1
+          FROM pg_depend d
+          JOIN pg_class owner ON owner.oid = d.refobjid
+          JOIN pg_namespace owner_ns ON owner_ns.oid = owner.relnamespace
+          WHERE d.classid = 'pg_class'::regclass
+            AND d.objid = c.oid
+            AND d.refclassid = 'pg_class'::regclass
+            AND d.deptype IN ('a', 'i')
+            AND format('%%I.%%I', owner_ns.nspname, owner.relname) = ANY(%(seed)s)
+      )
+    ORDER BY 1
+"""
+
+
+def _admin_connect(dbname: str = "postgres"):
+    """Raw autocommit connection outside the slot pool (admin DB, template, spare)."""
+    conn = psycopg2.connect(
+        dbname=dbname,
+        user=os.environ.get("PGUSER", "pythagor"),
+        host=os.environ.get("PGHOST", "localhost"),
+        port=os.environ.get("PGPORT", "5432"),
+    )
+    conn.autocommit = True
+    return conn
+
+
+def _terminate_backends(cur, dbname: str) -> None:
+    cur.execute(
+        "SELECT pg_terminate_backend(pid) FROM pg_stat_activity WHERE datname = %s",
+        (dbname,),
+    )
+
+
+def _clone_database(target_db: str, source_db: str) -> bool:
+    """``CREATE DATABASE target_db TEMPLATE source_db``.
+
+    Returns False when the source has other sessions, which Postgres refuses
+    to copy from; callers then fall back to pg_dump.
+    """
+    admin_conn = _admin_connect()
+    try:
+        with admin_conn.cursor() as cur:
+            cur.execute("SHOW server_version_num")
+            strategy = (
+                sql.SQL(" STRATEGY FILE_COPY")
+                if int(cur.fetchone()[0]) >= _FILE_COPY_MIN_SERVER_VERSION
+                else sql.SQL("")
+            )
+            try:
+                cur.execute(
+                    sql.SQL("CREATE DATABASE {} TEMPLATE {}{}").format(
+                        sql.Identifier(target_db), sql.Identifier(source_db), strategy
+                    )
+                )
+            except pg_errors.ObjectInUse:
+                LOG.info(
+                    "%s has open sessions; building %s with pg_dump instead",
+                    source_db,
+                    target_db,
+                )
+                return False
+    finally:
+        admin_conn.close()
+    return True
+
+
+def _drop_database(dbname: str) -> None:
+    admin_conn = _admin_connect()
+    try:
+        with admin_conn.cursor() as cur:
+            cur.execute(
+                sql.SQL("DROP DATABASE IF EXISTS {}").format(sql.Identifier(dbname))
+            )
+    finally:
+        admin_conn.close()
+
+
+def _reduce_to_seed_image(target_db: str) -> None:
+    """Make a file-level template copy match what the dump path produces.
+
+    The dump path carries rows for TEMPLATE_SEED_TABLES only and recreates
+    every other sequence at its start value. A template copy carries
+    everything, so empty the non-seed tables (in one TRUNCATE, so foreign
+    keys among them are satisfied) and restart their sequences.
+    """
+    conn = _admin_connect(target_db)
+    try:
+        with conn.cursor() as cur:
+            seed = list(TEMPLATE_SEED_TABLES)
+            cur.execute(_NON_SEED_TABLES_SQL, {"seed": seed})
+            tables: List[str] = [row[0] for row in cur.fetchall()]
+            populated = []
+            for table in tables:
+                cur.execute(
+                    sql.SQL("SELECT EXISTS (SELECT 1 FROM {})").format(sql.SQL(table))
+                )
+                if cur.fetchone()[0]:
+                    populated.append(table)
+            if populated:
+                LOG.info(
+                    "Emptying %d non-seed tables copied from the template: %s",
+                    len(populated),
+                    ", ".join(populated),
+                )
+                cur.execute(
+                    sql.SQL("TRUNCATE {}").format(
+                        sql.SQL(", ").join(sql.SQL(table) for table in tables)
+                    )
+                )
+            cur.execute(_NON_SEED_SEQUENCES_SQL, {"seed": seed})
+            for (sequence,) in cur.fetchall():
+                cur.execute(
+                    sql.SQL("ALTER SEQUENCE {} RESTART").format(sql.SQL(sequence))
+                )
+    finally:
+        conn.close()
+
+
+def clone_template_database(target_db: str, source_db: str) -> bool:
+    """Create ``target_db`` as a file copy of the template, reduced to its seed image.
+
+    Returns False, leaving no ``target_db`` behind, when the fast path cannot
+    be used: the template has open sessions, or its non-seed rows cannot be
+    emptied (e.g. a seed table references one). The caller then builds the
+    database with pg_dump.
+    """
+    if not _clone_database(target_db, source_db):
+        return False
+    try:
+        _reduce_to_seed_image(target_db)
+    except psycopg2.Error as exc:
+        LOG.warning(
+            "Could not reduce the %s copy to its seed image (%s); "
+            "rebuilding %s with pg_dump",
+            source_db,
+            str(exc).strip(),
+            target_db,
+        )
+        _drop_database(target_db)
+        return False
+    return True
+
+
+def _spare_dbname(source_db: str) -> str:
+    return f"{source_db}_spare"
+
+
+def _template_fingerprint(source_db: str) -> str:
+    """Digest of the template's seed image: migration stamps plus seed rows.
+
+    A spare whose fingerprint differs was cloned before the template was
+    migrated or refreshed, and is discarded rather than handed out.
+    """
+    conn = _admin_connect(source_db)
+    try:
+        with conn.cursor() as cur:
+            parts = []
+            for table in TEMPLATE_SEED_TABLES:
+                cur.execute("SELECT to_regclass(%s)", (table,))
+                if cur.fetchone()[0] is None:
+                    parts.append(f"{table}:-")
+                    continue
+                cur.execute(
+                    sql.SQL(
+                        "SELECT md5(COALESCE(string_agg(md5(t::text), '' "
+                        "ORDER BY md5(t::text)), '')) FROM {} t"
+                    ).format(sql.SQL(table))
+                )
+                parts.append(f"{table}:{cur.fetchone()[0]}")
+    finally:
+        conn.close()
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def _spare_marker(cur, spare_db: str) -> Optional[str]:
+    """The ready-marker comment on ``spare_db``, or None if absent or unfinished."""
+    cur.execute(
+        "SELECT shobj_description(oid, 'pg_database') FROM pg_database "
+        "WHERE datname = %s",
+        (spare_db,),
+    )
+    row = cur.fetchone()
+    if row is None or not row[0] or not row[0].startswith(_SPARE_MARKER_PREFIX):
+        return None
+    return row[0][len(_SPARE_MARKER_PREFIX) :]
+
+
+def _claim_spare_database(target_db: str, source_db: str) -> bool:
+    """Rename a ready, current spare to ``target_db``. False if there is none."""
+    if not _SPARE_LOCK.acquire(blocking=False):
+        return False  # a refill is mid-clone; don't wait for it
+    try:
+        spare_db = _spare_dbname(source_db)
+        fingerprint = _template_fingerprint(source_db)
+        admin_conn = _admin_connect()
+        try:
+            with admin_conn.cursor() as cur:
+                marker = _spare_marker(cur, spare_db)
+                if marker is None:
+                    return False
+                if marker != fingerprint:
+                    LOG.info("Discarding %s: cloned from an older template", spare_db)
+                    cur.execute(
+                        sql.SQL("DROP DATABASE IF EXISTS {}").format(
+                            sql.Identifier(spare_db)
+                        )
+                    )
+                    return False
+                _terminate_backends(cur, spare_db)
+                cur.execute(
+                    sql.SQL("ALTER DATABASE {} RENAME TO {}").format(
+                        sql.Identifier(spare_db), sql.Identifier(target_db)
+                    )
+                )
+                cur.execute(
+                    sql.SQL("COMMENT ON DATABASE {} IS NULL").format(
+                        sql.Identifier(target_db)
+                    )
+                )
+        finally:
+            admin_conn.close()
+    except psycopg2.Error as exc:
+        LOG.warning("Could not claim spare for %s: %s", target_db, str(exc).strip())
+        return False
+    finally:
+        _SPARE_LOCK.release()
+    return True
+
+
+def _refill_spare_database(source_db: str, wait: bool = False) -> None:
+    if not _SPARE_LOCK.acquire(blocking=wait):
+        return  # another refill or claim is running
+    spare_db = _spare_dbname(source_db)
+    try:
+        fingerprint = _template_fingerprint(source_db)
+        admin_conn = _admin_connect()
+        try:
+            with admin_conn.cursor() as cur:
+                if _spare_marker(cur, spare_db) == fingerprint:
+                    return
+        finally:
+            admin_conn.close()
+        # Absent, stale, or left unfinished by an interrupted refill.
+        _drop_database(spare_db)
+        if not clone_template_database(spare_db, source_db):
+            LOG.info("Spare %s not prepared; %s is busy", spare_db, source_db)
+            return
+        admin_conn = _admin_connect()
+        try:
+            with admin_conn.cursor() as cur:
+                cur.execute(
+                    sql.SQL("COMMENT ON DATABASE {} IS {}").format(
+                        sql.Identifier(spare_db),
+                        sql.Literal(_SPARE_MARKER_PREFIX + fingerprint),
+                    )
+                )
+        finally:
+            admin_conn.close()
+        LOG.info("Spare %s is ready", spare_db)
+    except Exception:
+        # Runs in the background; a missing spare only costs the next
+        # provisioning a template clone.
+        LOG.exception("Could not prepare spare %s", spare_db)
+    finally:
+        _SPARE_LOCK.release()
+
+
+def prepare_spare_database(
+    source_db: str = "NEXUS_template", background: bool = True
+) -> Optional[threading.Thread]:
+    """Keep one pre-cloned spare of ``source_db`` ready for the next slot.
+
+    The spare (``<source_db>_spare``) is reduced to the seed image and marked
+    ready with a fingerprint of the template's stamps and seed rows, so
+    ``initialize_slot_database(..., keep_spare=True)`` can provision a slot
+    with a rename. Returns the worker thread when ``background`` is set.
+    """
+    if not background:
+        # Waits out a refill already running, then finds the spare current.
+        _refill_spare_database(source_db, wait=True)
+        return None
+    thread = threading.Thread(
+        target=_refill_spare_database,
+        args=(source_db,),
+        name="nexus-spare-slot",
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
 def clone_slot_with_data(slot: int, source_db: str, force: bool = False) -> None:
     """
     Clone a slot by copying all data from source_db into save_XX.
-    Uses pg_dump/pg_restore to avoid template locks on the source DB.
+    Uses CREATE DATABASE ... TEMPLATE when source_db is idle, and
+    pg_dump/psql otherwise (Postgres will not copy a database in use).
     """
     if slot < 1 or slot > 5:
         raise ValueError("Slot must be between 1 and 5 (inclusive)")
@@ -319,6 +681,11 @@ def clone_slot_with_data(slot: int, source_db: str, force: bool = False) -> None
         subprocess.run(["dropdb", "--if-exists", target_db], check=False)
         LOG.warning("Dropped database %s if it existed", target_db)
 
+    if _clone_database(target_db, source_db):
+        _post_clone_cleanup(target_db)
+        LOG.info("Cloned %s into %s (with data, file copy)", source_db, target_db)
+        return
+
     with tempfile.NamedTemporaryFile(delete=False, suffix=".sql") as tmp:
         dump_path = tmp.name
 
@@ -405,10 +772,18 @@ def main():
         action="store_true",
         help="Drop and recreate the target slot database if it exists",
     )
+    parser.add_argument(
+        "--keep-spare",
+        action="store_true",
+        help=(
+            "Provision --slot from the pre-cloned spare when it is current, then "
+            "clone a fresh spare. Without --slot, only prepare the spare."
+        ),
+    )
     args = parser.parse_args()
 
-    if not args.create_assets and not args.slot:
-        parser.error("Specify --create-assets and/or --slot")
+    if not args.create_assets and not args.slot and not args.keep_spare:
+        parser.error("Specify --create-assets, --slot and/or --keep-spare")
 
     if args.create_assets:
         create_assets_tables()
@@ -419,7 +794,15 @@ def main():
                 parser.error("--source is required when --mode=clone")
             clone_slot_with_data(args.slot, source_db=args.source, force=args.force)
         else:
-            create_slot_schema_only(args.slot, source_db=args.source, force=args.force)
+            create_slot_schema_only(
+                args.slot,
+                source_db=args.source,
+                force=args.force,
+                keep_spare=args.keep_spare,
+            )
+    if args.keep_spare and args.mode == "schema":
+        # Wait for the spare here: a daemon thread would die with the CLI.
+        prepare_spare_database(args.source or "NEXUS_template", background=False)
 
 
 if __name__ == "__main__":
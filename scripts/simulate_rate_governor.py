@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Simulate quota-bound LLM traffic against the mock OpenAI server.
+
+Runs concurrent Responses API callers in-process against
+nexus/api/mock_openai.py with a MockQuota installed (per-minute request and
+token quota, 429s with retry-after, response latency) and reports, for an
+ungoverned and a governed client, the throughput achieved against the quota
+and how many 429s the server had to send. Both clients are the OpenAI SDK
+with its default retries; the governed one routes every attempt, retries
+included, through nexus.api.rate_governor.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+import logging
+from pathlib import Path
+import sys
+import time
+from typing import Dict, Optional
+
+import httpx
+import openai
+
+# Simulate this checkout, not whichever installed copy sys.path resolves.
+ROOT = Path(__file__).parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from nexus.api import mock_openai  # noqa: E402
+from nexus.api.mock_openai import MockQuota, configure_mock_quota  # noqa: E402
+from nexus.api.rate_governor import (  # noqa: E402
+    GovernedAsyncTransport,
+    RateGovernor,
+    RateLimits,
+    register_governor,
+    reset_governors,
+)
+
+PROVIDER = "mock"
+MODEL = "TEST"
+
+
+@dataclass
+class SimulationResult:
+    """Outcome of one simulated run."""
+
+    mode: str
+    quota_rpm: float
+    elapsed: float
+    completed: int
+    failed: int
+    server_429s: int
+
+    @property
+    def achieved_rpm(self) -> float:
+        return self.completed * 60.0 / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def utilization(self) -> float:
+        return self.achieved_rpm / self.quota_rpm
+
+    @property
+    def rejections_per_completion(self) -> float:
+        return self.server_429s / max(1, self.completed)
+
+
+async def _caller(
+    client: openai.AsyncOpenAI, deadline: float, counts: Dict[str, int]
+) -> None:
+    while time.monotonic() < deadline:
+        try:
+            await client.responses.create(
+                model=MODEL, input="ping", max_output_tokens=16
+            )
+            counts["completed"] += 1
+        except openai.RateLimitError:
+            counts["failed"] += 1
+
+
+async def run_simulation(
+    *,
+    governed: bool,
+    requests_per_minute: float,
+    tokens_per_minute: Optional[float] = None,
+    callers: int = 32,
+    duration: float = 10.0,
+    latency: float = 0.05,
+    jitter: float = 0.02,
+    window: float = 1.0,
+    max_concurrency: Optional[int] = None,
+    seed: int = 0,
+) -> SimulationResult:
+    """Drive ``callers`` concurrent loops for ``duration`` seconds."""
+    quota = MockQuota(
+        requests_per_minute,
+        tokens_per_minute,
+        window_seconds=window,
+        latency_seconds=latency,
+        latency_jitter_seconds=jitter,
+        seed=seed,
+    )
+    transport: httpx.AsyncBaseTransport = httpx.ASGITransport(app=mock_openai.app)
+    if governed:
+        reset_governors()
+        register_governor(
+            RateGovernor(
+                PROVIDER,
+                MODEL,
+                RateLimits(requests_per_minute, tokens_per_minute, max_concurrency),
+            )
+        )
+        transport = GovernedAsyncTransport(PROVIDER, transport)
+    client = openai.AsyncOpenAI(
+        api_key="mock",
+        base_url="http://mock/v1",
+        http_client=httpx.AsyncClient(transport=transport),
+    )
+    counts = {"completed": 0, "failed": 0}
+    configure_mock_quota(quota)
+    started = time.monotonic()
+    try:
+        await asyncio.gather(
+            *(_caller(client, started + duration, counts) for _ in range(callers))
+        )
+    finally:
+        configure_mock_quota(None)
+        await client.close()
+        if governed:
+            reset_governors()
+    return SimulationResult(
+        mode="governed" if governed else "ungoverned",
+        quota_rpm=requests_per_minute,
+        elapsed=time.monotonic() - started,
+        completed=counts["completed"],
+        failed=counts["failed"],
+        server_429s=quota.rejected,
+    )
+
+
+def _print_result(result: SimulationResult) -> None:
+    prefix = result.mode
+    print(f"{prefix}_completed={result.completed}")
+    print(f"{prefix}_achieved_rpm={result.achieved_rpm:.1f}")
+    print(f"{prefix}_utilization={result.utilization:.3f}")
+    print(f"{prefix}_server_429s={result.server_429s}")
+    print(f"{prefix}_429s_per_completion={result.rejections_per_completion:.2f}")
+    print(f"{prefix}_failed_after_retries={result.failed}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rpm", type=float, default=600, help="Quota requests/min")
+    parser.add_argument("--tpm", type=float, default=None, help="Quota tokens/min")
+    parser.add_argument("--callers", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds/run")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds")
+    parser.add_argument("--jitter", type=float, default=0.02, help="Seconds")
+    parser.add_argument(
+        "--window",
+        type=float,
+        default=1.0,
+        help="Seconds of quota the server lets a burst spend (default: 1)",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="Governed in-flight cap"
+    )
+    args = parser.parse_args()
+
+    # Every mock request is an "unknown" Responses call; keep the log quiet.
+    logging.getLogger("nexus.api.mock_openai").setLevel(logging.ERROR)
+    print(f"quota_rpm={args.rpm:g}")
+    for governed in (False, True):
+        result = asyncio.run(
+            run_simulation(
+                governed=governed,
+                requests_per_minute=args.rpm,
+                tokens_per_minute=args.tpm,
+                callers=args.callers,
+                duration=args.duration,
+                latency=args.latency,
+                jitter=args.jitter,
+                window=args.window,
+                max_concurrency=args.concurrency,
+            )
+        )
+        _print_result(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,9 @@ Features:
 - Episode range support: summarize multiple episodes in one run
 - Database integration: saves structured JSONB to seasons and episodes tables
 - Context-aware: includes padding chunks for better continuity
+- Hierarchical: episodes are summarized from scene-window digests and seasons
+  from stored episode summaries; each level records the hash of its inputs and
+  is reused while that hash is unchanged
 - Structured output: Uses each registry provider's native structured-output transport
   with Pydantic models for consistent results
 
@@ -32,12 +35,14 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
 import logging
 import os
 import re
 import sys
 import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple, Type
 
@@ -224,6 +229,72 @@ class EpisodeSummary(BaseModel):
     )
 
 
+def source_hash(parts: List[str]) -> str:
+    """Content hash of one summary level's ordered inputs."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class SceneWindow:
+    """A run of consecutive chunks in one episode, digested as a unit."""
+
+    season: int
+    episode: int
+    index: int
+    chunks: Tuple[Dict[str, Any], ...]
+    closed: bool
+
+    @property
+    def chunk_ids(self) -> List[int]:
+        return [int(chunk["id"]) for chunk in self.chunks]
+
+    @property
+    def content_hash(self) -> str:
+        return source_hash([f"{chunk['id']}:{chunk['text']}" for chunk in self.chunks])
+
+
+def scene_windows(
+    season: int, episode: int, chunks: List[Dict[str, Any]], size: int
+) -> List[SceneWindow]:
+    """
+    Split an episode's chunks (in id order) into fixed-size scene windows.
+
+    Windows are positional, so a committed chunk only ever changes the last
+    window. A window is closed once it holds ``size`` chunks; the trailing
+    partial window stays open until the episode ends.
+    """
+    ordered = sorted(
+        (chunk for chunk in chunks if not chunk.get("is_context")),
+        key=lambda chunk: int(chunk["id"]),
+    )
+    return [
+        SceneWindow(
+            season=season,
+            episode=episode,
+            index=start // size,
+            chunks=tuple(ordered[start : start + size]),
+            closed=len(ordered[start : start + size]) == size,
+        )
+        for start in range(0, len(ordered), size)
+    ]
+
+
+def _summary_text(summary: Any) -> str:
+    """Extract the prose of a stored JSONB summary."""
+    if isinstance(summary, str):
+        try:
+            summary = json.loads(summary)
+        except json.JSONDecodeError:
+            return summary
+    if isinstance(summary, dict) and "summary" in summary:
+        return str(summary["summary"])
+    return str(summary)
+
+
 class DatabaseManager:
     """Manages database connections and operations."""
 
@@ -1376,6 +1447,176 @@ class DatabaseManager:
             )
             return None
 
+    def get_chunk_position(self, chunk_id: int) -> Optional[Tuple[int, int]]:
+        """Return the (season, episode) a chunk belongs to, if it has metadata."""
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                text(
+                    """
+                    SELECT season, episode
+                    FROM public.chunk_metadata
+                    WHERE chunk_id = :chunk_id
+                      AND season IS NOT NULL
+                      AND episode IS NOT NULL
+                    """
+                ),
+                {"chunk_id": chunk_id},
+            ).fetchone()
+        return (int(row.season), int(row.episode)) if row else None
+
+    def get_season_episodes(self, season: int) -> List[int]:
+        """Episode numbers of a season that hold chunks, in order."""
+        with self.engine.connect() as conn:
+            result = conn.execute(
+                text(
+                    """
+                    SELECT DISTINCT episode
+                    FROM public.chunk_metadata
+                    WHERE season = :season AND episode IS NOT NULL
+                    ORDER BY episode ASC
+                    """
+                ),
+                {"season": season},
+            )
+            return [int(row.episode) for row in result]
+
+    def get_episode_summary(self, season: int, episode: int) -> Optional[dict]:
+        """Return the stored (non-failure) summary for an episode."""
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                text(
+                    """
+                    SELECT summary
+                    FROM public.episodes
+                    WHERE season = :season
+                      AND episode = :episode
+                      AND summary IS NOT NULL
+                      AND COALESCE(summary->>'status', '') <> :failure_status
+                    """
+                ),
+                {
+                    "season": season,
+                    "episode": episode,
+                    "failure_status": SUMMARY_FAILURE_STATUS,
+                },
+            ).fetchone()
+        return row.summary if row else None
+
+    def get_summary_source_hash(
+        self, kind: str, season: int, episode: Optional[int] = None
+    ) -> Optional[str]:
+        """Return the input hash recorded with an episode or season summary."""
+        if kind == "episode":
+            query = text(
+                """
+                SELECT summary_source_hash FROM public.episodes
+                WHERE season = :season AND episode = :episode
+                """
+            )
+        elif kind == "season":
+            query = text(
+                "SELECT summary_source_hash FROM public.seasons WHERE id = :season"
+            )
+        else:
+            raise ValueError(f"Unknown summary kind: {kind!r}")
+        with self.engine.connect() as conn:
+            return conn.execute(query, {"season": season, "episode": episode}).scalar()
+
+    def record_summary_source_hash(
+        self, kind: str, season: int, episode: Optional[int], source: str
+    ) -> None:
+        """Stamp a freshly saved summary with the hash of its inputs."""
+        if kind == "episode":
+            query = text(
+                """
+                UPDATE public.episodes SET summary_source_hash = :source
+                WHERE season = :season AND episode = :episode
+                """
+            )
+        elif kind == "season":
+            query = text(
+                """
+                UPDATE public.seasons SET summary_source_hash = :source
+                WHERE id = :season
+                """
+            )
+        else:
+            raise ValueError(f"Unknown summary kind: {kind!r}")
+        with self.engine.connect() as conn:
+            conn.execute(
+                query, {"season": season, "episode": episode, "source": source}
+            )
+            conn.commit()
+
+    def get_scene_window_digests(
+        self, season: int, episode: int
+    ) -> Dict[int, Dict[str, Any]]:
+        """Stored scene-window digests of an episode, keyed by window index."""
+        with self.engine.connect() as conn:
+            result = conn.execute(
+                text(
+                    """
+                    SELECT window_index, content_hash, digest
+                    FROM public.scene_window_digests
+                    WHERE season = :season AND episode = :episode
+                    """
+                ),
+                {"season": season, "episode": episode},
+            )
+            return {
+                int(row.window_index): {
+                    "content_hash": row.content_hash,
+                    "digest": row.digest,
+                }
+                for row in result
+            }
+
+    def save_scene_window_digest(
+        self,
+        window: SceneWindow,
+        digest: dict,
+        model: str,
+        input_tokens: Optional[int] = None,
+        output_tokens: Optional[int] = None,
+    ) -> None:
+        """Insert or replace the digest of one scene window."""
+        with self.engine.connect() as conn:
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO public.scene_window_digests (
+                        season, episode, window_index, content_hash, chunk_ids,
+                        digest, model, input_tokens, output_tokens
+                    )
+                    VALUES (
+                        :season, :episode, :window_index, :content_hash,
+                        :chunk_ids, CAST(:digest AS jsonb), :model,
+                        :input_tokens, :output_tokens
+                    )
+                    ON CONFLICT (season, episode, window_index) DO UPDATE
+                    SET content_hash = EXCLUDED.content_hash,
+                        chunk_ids = EXCLUDED.chunk_ids,
+                        digest = EXCLUDED.digest,
+                        model = EXCLUDED.model,
+                        input_tokens = EXCLUDED.input_tokens,
+                        output_tokens = EXCLUDED.output_tokens,
+                        updated_at = now()
+                    """
+                ),
+                {
+                    "season": window.season,
+                    "episode": window.episode,
+                    "window_index": window.index,
+                    "content_hash": window.content_hash,
+                    "chunk_ids": window.chunk_ids,
+                    "digest": json.dumps(digest),
+                    "model": model,
+                    "input_tokens": input_tokens,
+                    "output_tokens": output_tokens,
+                },
+            )
+            conn.commit()
+
 
 class SummaryGenerator:
     """
@@ -1419,7 +1660,9 @@ class SummaryGenerator:
         self._max_output_tokens = {
             "episode": summary_settings.episode_max_output_tokens,
             "season": summary_settings.season_max_output_tokens,
+            "digest": summary_settings.digest_max_output_tokens,
         }
+        self.scene_window_size = summary_settings.scene_window_size
         self._request_token_budget = summary_settings.request_token_budget
         self._structured_output_retries = summary_settings.structured_output_retries
         self.is_reasoning_model = self._model_rejects_temperature(model)
@@ -1513,7 +1756,7 @@ class SummaryGenerator:
         Get the appropriate system prompt based on mode.
 
         Args:
-            mode: Either 'season' or 'episode'
+            mode: 'season', 'episode', or 'digest'
 
         Returns:
             System prompt string
@@ -1554,6 +1797,17 @@ You MUST provide a structured output with these exact sections:
 5. CONTINUITY_ELEMENTS: Note important objects, locations, or world states that should be tracked, including their current location/state/condition and any new information revealed.
 
 Be factual, objective, and chronological. Focus on concrete events and states rather than analysis. Your summary must provide all essential details needed to maintain narrative continuity."""
+        elif mode == "digest":
+            return (
+                "You are a narrative continuity AI that digests short runs of "
+                "scenes for an AI storytelling system.\n\n"
+                "Your DIGESTS are combined to write episode summaries, so they "
+                "must preserve every event, character state, and continuity "
+                "detail another AI would need, in chronological order and "
+                "without commentary.\n\n"
+                "Be factual, concise, and concrete. Never invent events that "
+                "are not in the provided scenes."
+            )
         else:
             # Generic fallback
             return """You are a narrative continuity AI that creates structured, factual summaries for an AI storytelling system.
@@ -1650,9 +1904,117 @@ Your summaries will be accessed by another AI to maintain narrative consistency.
         except Exception as e:
             logger.error(f"Error saving prompt to file: {e}")
 
+    def _digest_window(self, window: SceneWindow) -> Tuple[dict, LLMResponse]:
+        """Digest one scene window through the provider."""
+
+        chunks_text = self._prepare_chunks_text(list(window.chunks), "digest")
+        prompt = (
+            "# Scene Window Digest Request\n\n"
+            f"I need a compact digest of scenes from Season {window.season}, "
+            f"Episode {window.episode} (window {window.index + 1} of the "
+            "episode). The digest will be combined with the digests of "
+            "neighbouring windows to write the episode summary, so it must "
+            "stand on its own.\n\n"
+            "## The Narrative Chunks:\n\n"
+            f"{chunks_text}\n\n"
+            "## Important Requirements:\n\n"
+            "1. Record every significant event in chronological order, each "
+            'beginning with "THEN:".\n'
+            "2. Note the state of each character who appears at the end of the "
+            "window, and any objects, locations, or knowledge that changed "
+            "hands or were revealed.\n"
+            "3. Be factual and concrete; do not speculate beyond the scenes "
+            "provided."
+        )
+
+        class DigestModel(BaseModel):
+            summary: str = Field(
+                description=(
+                    "A chronological digest of the scene window capturing "
+                    "events, character states, and continuity details."
+                )
+            )
+
+        parsed, llm_response = self._get_structured_summary(
+            prompt, "digest", DigestModel
+        )
+        return {"summary": parsed.summary}, llm_response
+
+    def _window_digests(
+        self, windows: List[SceneWindow]
+    ) -> List[Tuple[SceneWindow, dict]]:
+        """Return each window's digest, re-digesting only changed windows."""
+
+        if not windows:
+            return []
+        season, episode = windows[0].season, windows[0].episode
+        stored = self.db_manager.get_scene_window_digests(season, episode)
+        digests: List[Tuple[SceneWindow, dict]] = []
+        for window in windows:
+            prior = stored.get(window.index)
+            if prior and prior["content_hash"] == window.content_hash:
+                digests.append((window, prior["digest"]))
+                continue
+            digest, llm_response = self._digest_window(window)
+            logger.info(
+                "Digested S%02dE%02d window %s with %s input and %s output tokens",
+                season,
+                episode,
+                window.index,
+                llm_response.input_tokens,
+                llm_response.output_tokens,
+            )
+            if not self.dry_run:
+                self.db_manager.save_scene_window_digest(
+                    window,
+                    digest,
+                    model=self.model,
+                    input_tokens=llm_response.input_tokens,
+                    output_tokens=llm_response.output_tokens,
+                )
+            digests.append((window, digest))
+        return digests
+
+    def _episode_windows(self, season: int, episode: int) -> List[SceneWindow]:
+        chunks = self.db_manager.get_episode_chunks(
+            season, episode, include_context=False
+        )
+        return scene_windows(season, episode, chunks, self.scene_window_size)
+
+    def refresh_scene_digests(
+        self, season: int, episode: int, include_open: bool = False
+    ) -> List[Tuple[SceneWindow, dict]]:
+        """
+        Bring an episode's scene-window digests up to date.
+
+        Called as chunks commit, so by default only closed windows are
+        digested; the trailing open window is digested when the episode
+        summary is built. Windows whose content hash matches the stored
+        digest are not sent to the model.
+
+        Args:
+            season: The season number
+            episode: The episode number
+            include_open: Also digest the trailing partial window
+
+        Returns:
+            (window, digest) pairs in window order
+
+        Raises:
+            Exception: Provider or database errors propagate to the caller
+        """
+        windows = self._episode_windows(season, episode)
+        if not include_open:
+            windows = [window for window in windows if window.closed]
+        return self._window_digests(windows)
+
     def generate_season_summary(self, season: int) -> Optional[dict]:
         """
-        Generate a comprehensive summary for an entire season.
+        Generate a season summary from its stored episode summaries.
+
+        Missing or stale episode summaries are (re)built first. The season
+        summary is reused when the episode summaries hash the same as the
+        ones it was last built from.
 
         Args:
             season: The season number
@@ -1662,14 +2024,49 @@ Your summaries will be accessed by another AI to maintain narrative consistency.
         """
         logger.info(f"Generating summary for Season {season}")
 
-        # Get all chunks for the season
-        chunks = self.db_manager.get_season_chunks(season)
+        episodes = self.db_manager.get_season_episodes(season)
 
-        if not chunks:
+        if not episodes:
             logger.error(f"No chunks found for Season {season}")
             return None
 
-        logger.info(f"Found {len(chunks)} chunks for Season {season}")
+        logger.info(f"Found {len(episodes)} episodes for Season {season}")
+
+        episode_summaries: List[Tuple[int, Any]] = []
+        for episode in episodes:
+            summary = self.db_manager.get_episode_summary(season, episode)
+            if summary is None or self.db_manager.get_summary_source_hash(
+                "episode", season, episode
+            ):
+                # Built from digests (or missing): refresh if its inputs moved.
+                # Summaries predating hierarchical summarization are kept as-is.
+                summary = self.generate_episode_summary(season, episode)
+            if summary is None:
+                self.last_error = self.last_error or (
+                    f"No summary for S{season:02d}E{episode:02d}"
+                )
+                logger.error(
+                    f"Cannot summarize Season {season} "
+                    f"without S{season:02d}E{episode:02d}"
+                )
+                return None
+            episode_summaries.append((episode, summary))
+
+        season_source = source_hash(
+            [
+                f"{episode}:{json.dumps(summary, sort_keys=True)}"
+                for episode, summary in episode_summaries
+            ]
+        )
+        stored_source = self.db_manager.get_summary_source_hash("season", season)
+        if stored_source == season_source and not self.overwrite:
+            existing = self.db_manager.get_season_summary(season)
+            if existing:
+                logger.info(
+                    f"Season {season} summary is current with its episode "
+                    "summaries; reusing it"
+                )
+                return existing["summary"]
 
         # Get summaries of previous seasons for context
         previous_summaries = self.db_manager.get_previous_season_summaries(season)
@@ -1683,14 +2080,7 @@ Your summaries will be accessed by another AI to maintain narrative consistency.
 
             for prev in previous_summaries:
                 prev_season = prev["season"]
-                prev_summary = prev["summary"]
-
-                # Extract just the summary text from the JSONB object
-                if isinstance(prev_summary, dict) and "summary" in prev_summary:
-                    summary_content = prev_summary["summary"]
-                else:
-                    # Fallback if structure is different
-                    summary_content = str(prev_summary)
+                summary_content = _summary_text(prev["summary"])
 
                 prev_summaries_text += (
                     f"### Season {prev_season} Summary:\n\n{summary_content}\n\n"
@@ -1707,17 +2097,24 @@ Your summaries will be accessed by another AI to maintain narrative consistency.
                 print(prev_summaries_text)
                 print("=" * 80 + "\n")
 
-        # Prepare the prompt
-        chunks_text = self._prepare_chunks_text(chunks, "season")
+        episodes_text = "\n\n".join(
+            f"### S{season:02d}E{episode:02d} Summary:\n\n{_summary_text(summary)}"
+            for episode, summary in episode_summaries
+        )
 
         # Build the main prompt with previous summaries
+        request = (
+            f"I need a comprehensive, structured summary of Season {season} of "
+            "the narrative. Please analyze all the provided episode summaries to "
+            "create a structured season summary following the format specified."
+        )
         prompt = f"""# Narrative Summary Request
 
-I need a comprehensive, structured summary of Season {season} of the narrative. Please analyze all the provided chunks to create a structured season summary following the format specified.
+{request}
 
-{prev_summaries_text}## The Narrative Chunks:
+{prev_summaries_text}## The Episode Summaries:
 
-{chunks_text}
+{episodes_text}
 
 ## Important Requirements:
 
@@ -1767,16 +2164,21 @@ I need a comprehensive, structured summary of Season {season} of the narrative.
                 print(json.dumps(summary_dict, indent=2))
                 print("=" * 80 + "\n")
 
-            # Save to database
+            # Save to database. A summary carrying a source hash was derived
+            # from episode summaries and is replaced, not prompted over.
             success = self.db_manager.save_season_summary(
                 season=season,
                 summary=summary_dict,
                 dry_run=self.dry_run,
-                overwrite=self.overwrite,
+                overwrite=self.overwrite or stored_source is not None,
                 prompt_on_conflict=self.prompt_on_conflict,
             )
 
             if success:
+                if not self.dry_run:
+                    self.db_manager.record_summary_source_hash(
+                        "season", season, None, season_source
+                    )
                 logger.info(f"Successfully saved summary for Season {season}")
                 return summary_dict
             else:
@@ -1790,7 +2192,11 @@ I need a comprehensive, structured summary of Season {season} of the narrative.
 
     def generate_episode_summary(self, season: int, episode: int) -> Optional[dict]:
         """
-        Generate a comprehensive summary for a single episode.
+        Generate an episode summary from its scene-window digests.
+
+        Only windows whose content changed are re-digested, and the episode
+        summary is reused when its windows hash the same as the ones it was
+        last built from.
 
         Args:
             season: The season number
@@ -1810,22 +2216,37 @@ I need a comprehensive, structured summary of Season {season} of the narrative.
         else:
             logger.warning(f"No chunk span found for S{season:02d}E{episode:02d}")
 
-        # Get chunks for the episode
+        # Context chunks from the neighbouring episodes go into the prompt
+        # verbatim; only the episode's own chunks are windowed and hashed.
         chunks = self.db_manager.get_episode_chunks(
             season, episode, include_context=True
         )
+        windows = scene_windows(season, episode, chunks, self.scene_window_size)
+        context_chunks = [c for c in chunks if c.get("is_context", False)]
 
-        if not chunks:
+        if not windows:
             logger.error(f"No chunks found for S{season:02d}E{episode:02d}")
             return None
 
-        # Count main chunks (excluding context)
-        main_chunks = [c for c in chunks if not c.get("is_context", False)]
         logger.info(
-            f"Found {len(main_chunks)} chunks for S{season:02d}E{episode:02d} "
-            f"(plus {len(chunks) - len(main_chunks)} context chunks)"
+            f"Found {sum(len(w.chunks) for w in windows)} chunks in "
+            f"{len(windows)} scene windows for S{season:02d}E{episode:02d} "
+            f"(plus {len(context_chunks)} context chunks)"
         )
 
+        episode_source = source_hash([window.content_hash for window in windows])
+        stored_source = self.db_manager.get_summary_source_hash(
+            "episode", season, episode
+        )
+        if stored_source == episode_source and not self.overwrite:
+            existing = self.db_manager.get_episode_summary(season, episode)
+            if existing:
+                logger.info(
+                    f"S{season:02d}E{episode:02d} summary is current with its "
+                    "scene windows; reusing it"
+                )
+                return existing
+
         # Get previous context based on episode number
         context_text = ""
 
@@ -1847,14 +2268,7 @@ I need a comprehensive, structured summary of Season {season} of the narrative.
 
                 for prev in prev_seasons:
                     prev_season_num = prev["season"]
-                    prev_summary = prev["summary"]
-
-                    # Extract just the summary text from the JSONB object
-                    if isinstance(prev_summary, dict) and "summary" in prev_summary:
-                        summary_content = prev_summary["summary"]
-                    else:
-                        # Fallback if structure is different
-                        summary_content = str(prev_summary)
+                    summary_content = _summary_text(prev["summary"])
 
                     context_text += f"### Season {prev_season_num} Summary:\n\n{summary_content}\n\n"
                     context_text += "-" * 80 + "\n\n"
@@ -1877,16 +2291,8 @@ I need a comprehensive, structured summary of Season {season} of the narrative.
                 prev_episodes = sorted(prev_episodes, key=lambda x: x["episode"])
 
                 for prev in prev_episodes:
-                    prev_episode = prev["episode"]
-                    prev_summary = prev["summary"]
                     prev_slug = prev["slug"]
-
-                    # Extract just the summary text from the JSONB object
-                    if isinstance(prev_summary, dict) and "summary" in prev_summary:
-                        summary_content = prev_summary["summary"]
-                    else:
-                        # Fallback if structure is different
-                        summary_content = str(prev_summary)
+                    summary_content = _summary_text(prev["summary"])
 
                     context_text += f"### {prev_slug} Summary:\n\n{summary_content}\n\n"
                     context_text += "-" * 80 + "\n\n"
@@ -1903,17 +2309,38 @@ I need a comprehensive, structured summary of Season {season} of the narrative.
             print(context_text)
             print("=" * 80 + "\n")
 
-        # Prepare the prompt
-        chunks_text = self._prepare_chunks_text(chunks, "episode")
+        try:
+            digests = self._window_digests(windows)
+        except Exception as e:
+            self.last_error = str(e)
+            logger.error(f"Error digesting scene windows: {e}")
+            return None
+
+        digests_text = "\n\n".join(
+            f"### Scenes {window.chunks[0].get('scene', '?')}-"
+            f"{window.chunks[-1].get('scene', '?')}:\n\n{_summary_text(digest)}"
+            for window, digest in digests
+        )
+        if context_chunks:
+            context_text += (
+                "## Context Chunks From Adjacent Episodes:\n\n"
+                f"{self._prepare_chunks_text(context_chunks, 'episode')}\n\n"
+            )
 
         # Build the main prompt with context
+        request = (
+            f"I need a comprehensive, structured summary of Season {season}, "
+            f"Episode {episode} of the narrative. Please analyze all the provided "
+            "scene digests to create a structured episode summary following the "
+            "format specified."
+        )
         prompt = f"""# Episode Summary Request
 
-I need a comprehensive, structured summary of Season {season}, Episode {episode} of the narrative. Please analyze all the provided chunks to create a structured episode summary following the format specified.
+{request}
 
-{context_text}## The Narrative Chunks:
+{context_text}## The Scene Digests:
 
-{chunks_text}
+{digests_text}
 
 ## Important Requirements:
 
@@ -1972,18 +2399,23 @@ I need a comprehensive, structured summary of Season {season}, Episode {episode}
                 print(json.dumps(summary_dict, indent=2))
                 print("=" * 80 + "\n")
 
-            # Save to database
+            # Save to database. A summary carrying a source hash was derived
+            # from scene digests and is replaced, not prompted over.
             success = self.db_manager.save_episode_summary(
                 season=season,
                 episode=episode,
                 summary=summary_dict,
                 dry_run=self.dry_run,
-                overwrite=self.overwrite,
+                overwrite=self.overwrite or stored_source is not None,
                 chunk_span=chunk_span,
                 prompt_on_conflict=self.prompt_on_conflict,
             )
 
             if success:
+                if not self.dry_run:
+                    self.db_manager.record_summary_source_hash(
+                        "episode", season, episode, episode_source
+                    )
                 logger.info(
                     f"Successfully saved summary for S{season:02d}E{episode:02d}"
                 )
@@ -42,6 +42,14 @@ def _forbid_unopted_postgres_connections(monkeypatch: pytest.MonkeyPatch) -> Non
     monkeypatch.setattr(psycopg2, "connect", fail_connect)
 
 
+@pytest.fixture(autouse=True)
+def _disable_post_commit_runners(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep accept/startup kicks from starting slot-database runner threads."""
+    if _flag_enabled("NEXUS_RUN_POSTGRES"):
+        return
+    monkeypatch.setenv("NEXUS_POST_COMMIT_RUNNER", "0")
+
+
 @pytest.fixture(autouse=True)
 def _isolate_provider_usage(
     monkeypatch: pytest.MonkeyPatch,
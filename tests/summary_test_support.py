@@ -0,0 +1,292 @@
+"""In-memory season, mock summary provider and replay helpers for summary tests.
+
+:func:`mock_generator` drives the real :class:`SummaryGenerator` against a
+:class:`SyntheticSeasonDB`, so hierarchical summarization runs without a
+database or API key. ``scripts/benchmark_hierarchical_summaries.py`` replays
+seasons with the same helpers.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from scripts.api_openai import LLMResponse, get_token_count
+from scripts.summarize_narrative import (
+    EpisodeSlugParser,
+    SceneWindow,
+    SummaryGenerator,
+)
+
+WORDS = [
+    "rain",
+    "neon",
+    "corridor",
+    "signal",
+    "ledger",
+    "captain",
+    "whispered",
+    "vault",
+    "engine",
+    "ashes",
+    "orbit",
+    "promise",
+    "drifted",
+    "quiet",
+    "static",
+    "harbor",
+]
+OUTPUT_WORDS = {"digest": 150, "episode": 450, "season": 700}
+
+
+class SyntheticSeasonDB:
+    """In-memory stand-in for the :class:`DatabaseManager` calls the generator makes.
+
+    Only chunks with ids up to :attr:`committed` are visible, so a benchmark
+    can replay a season commit by commit.
+    """
+
+    def __init__(self, chunks: List[Dict[str, Any]]):
+        self.chunks = {chunk["id"]: chunk for chunk in chunks}
+        self.committed = max(self.chunks) if self.chunks else 0
+        self.digests: Dict[Tuple[int, int], Dict[int, Dict[str, Any]]] = {}
+        self.episode_summaries: Dict[Tuple[int, int], dict] = {}
+        self.season_summaries: Dict[int, dict] = {}
+        self.source_hashes: Dict[Tuple[str, int, Optional[int]], str] = {}
+
+    def _visible(self) -> List[Dict[str, Any]]:
+        return [
+            chunk
+            for chunk_id, chunk in self.chunks.items()
+            if chunk_id <= self.committed
+        ]
+
+    def get_season_chunks(self, season: int) -> List[Dict[str, Any]]:
+        return [chunk for chunk in self._visible() if chunk["season"] == season]
+
+    def get_episode_chunks(
+        self, season: int, episode: int, include_context: bool = True
+    ) -> List[Dict[str, Any]]:
+        visible = self._visible()
+        chunks = [
+            dict(chunk, is_context=False)
+            for chunk in visible
+            if chunk["season"] == season and chunk["episode"] == episode
+        ]
+        if not chunks or not include_context:
+            return chunks
+        # Like DatabaseManager: one chunk either side of the episode, by id.
+        first, last = chunks[0]["id"], chunks[-1]["id"]
+        before = [chunk for chunk in visible if chunk["id"] < first][-1:]
+        after = [chunk for chunk in visible if chunk["id"] > last][:1]
+        return (
+            [dict(chunk, is_context=True) for chunk in before]
+            + chunks
+            + [dict(chunk, is_context=True) for chunk in after]
+        )
+
+    def get_episode_chunk_span(
+        self, season: int, episode: int
+    ) -> Optional[Tuple[int, int]]:
+        ids = [
+            chunk["id"]
+            for chunk in self.get_episode_chunks(season, episode, include_context=False)
+        ]
+        return (min(ids), max(ids)) if ids else None
+
+    def get_chunk_position(self, chunk_id: int) -> Optional[Tuple[int, int]]:
+        chunk = self.chunks.get(chunk_id)
+        return (chunk["season"], chunk["episode"]) if chunk else None
+
+    def get_season_episodes(self, season: int) -> List[int]:
+        return sorted(
+            {chunk["episode"] for chunk in self._visible() if chunk["season"] == season}
+        )
+
+    def get_previous_season_summaries(self, season: int) -> List[Dict[str, Any]]:
+        return [
+            {"season": number, "summary": summary}
+            for number, summary in sorted(self.season_summaries.items())
+            if number < season
+        ]
+
+    def get_previous_episode_summaries(
+        self, season: int, episode: int
+    ) -> List[Dict[str, Any]]:
+        return [
+            {
+                "season": season,
+                "episode": number,
+                "slug": EpisodeSlugParser.format(season, number),
+                "summary": summary,
+            }
+            for (summary_season, number), summary in sorted(
+                self.episode_summaries.items()
+            )
+            if summary_season == season and number < episode
+        ]
+
+    def get_episode_summary(self, season: int, episode: int) -> Optional[dict]:
+        return self.episode_summaries.get((season, episode))
+
+    def get_season_summary(self, season: int) -> Optional[Dict[str, Any]]:
+        summary = self.season_summaries.get(season)
+        return {"season": season, "summary": summary} if summary else None
+
+    def get_summary_source_hash(
+        self, kind: str, season: int, episode: Optional[int] = None
+    ) -> Optional[str]:
+        return self.source_hashes.get((kind, season, episode))
+
+    def record_summary_source_hash(
+        self, kind: str, season: int, episode: Optional[int], source: str
+    ) -> None:
+        self.source_hashes[(kind, season, episode)] = source
+
+    def get_scene_window_digests(
+        self, season: int, episode: int
+    ) -> Dict[int, Dict[str, Any]]:
+        return dict(self.digests.get((season, episode), {}))
+
+    def save_scene_window_digest(
+        self, window: SceneWindow, digest: dict, model: str, **_tokens: Any
+    ) -> None:
+        self.digests.setdefault((window.season, window.episode), {})[window.index] = {
+            "content_hash": window.content_hash,
+            "digest": digest,
+        }
+
+    def save_episode_summary(
+        self, season: int, episode: int, summary: dict, overwrite: bool = False, **_
+    ) -> bool:
+        if (season, episode) in self.episode_summaries and not overwrite:
+            return False
+        self.episode_summaries[(season, episode)] = summary
+        return True
+
+    def save_season_summary(
+        self, season: int, summary: dict, overwrite: bool = False, **_
+    ) -> bool:
+        if season in self.season_summaries and not overwrite:
+            return False
+        self.season_summaries[season] = summary
+        return True
+
+
+@dataclass
+class MockSummaryProvider:
+    """Deterministic structured-summary provider that records token usage."""
+
+    mode: str
+    calls: List[Tuple[str, int, int]]
+    latency_seconds: float = 0.0
+    provider_name: str = "mock"
+
+    def get_structured_completion(self, prompt: str, schema_model: Any):
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        seed = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        rng = random.Random(seed)
+        text = " ".join(rng.choice(WORDS) for _ in range(OUTPUT_WORDS[self.mode]))
+        input_tokens = get_token_count(prompt, "TEST")
+        output_tokens = get_token_count(text, "TEST")
+        self.calls.append((self.mode, input_tokens, output_tokens))
+        return schema_model(summary=text), LLMResponse(
+            content=text,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            model="TEST",
+        )
+
+
+@dataclass
+class CallLog:
+    """Calls made through the mock providers of one generator."""
+
+    calls: List[Tuple[str, int, int]] = field(default_factory=list)
+
+    def count(self, mode: Optional[str] = None) -> int:
+        return sum(1 for call in self.calls if mode in (None, call[0]))
+
+    @property
+    def input_tokens(self) -> int:
+        return sum(call[1] for call in self.calls)
+
+    @property
+    def output_tokens(self) -> int:
+        return sum(call[2] for call in self.calls)
+
+    @property
+    def largest_prompt(self) -> int:
+        return max((call[1] for call in self.calls), default=0)
+
+
+def synthetic_season(
+    chunks: int,
+    episodes: int,
+    *,
+    season: int = 1,
+    words_per_chunk: int = 250,
+    seed: int = 0,
+) -> List[Dict[str, Any]]:
+    """Chunks of synthetic prose spread evenly across ``episodes``."""
+    rng = random.Random(seed)
+    per_episode = max(1, -(-chunks // episodes))
+    rows = []
+    for index in range(chunks):
+        episode = index // per_episode + 1
+        scene = index % per_episode + 1
+        rows.append(
+            {
+                "id": index + 1,
+                "text": " ".join(rng.choice(WORDS) for _ in range(words_per_chunk)),
+                "season": season,
+                "episode": episode,
+                "scene": scene,
+                "slug": f"S{season:02d}E{episode:02d}_{scene:03d}",
+            }
+        )
+    return rows
+
+
+def mock_generator(
+    db: SyntheticSeasonDB,
+    *,
+    window_size: Optional[int] = None,
+    latency_seconds: float = 0.0,
+) -> Tuple[SummaryGenerator, CallLog]:
+    """A real SummaryGenerator whose providers are mock summary providers."""
+    log = CallLog()
+    generator = SummaryGenerator(model="TEST", db_manager=db, prompt_on_conflict=False)
+    if window_size is not None:
+        generator.scene_window_size = window_size
+    generator._providers = {
+        mode: MockSummaryProvider(mode, log.calls, latency_seconds)
+        for mode in ("digest", "episode", "season")
+    }
+    return generator, log
+
+
+def simulate_commits(generator: SummaryGenerator, db: SyntheticSeasonDB) -> None:
+    """Commit every chunk in order, running the summary work each commit triggers."""
+    final_id = db.committed
+    last_of_episode = {}
+    for chunk_id, chunk in sorted(db.chunks.items()):
+        last_of_episode[(chunk["season"], chunk["episode"])] = chunk_id
+    episode_ends = {chunk_id: key for key, chunk_id in last_of_episode.items()}
+    for chunk_id in range(1, final_id + 1):
+        db.committed = chunk_id
+        season, episode = db.get_chunk_position(chunk_id)
+        generator.refresh_scene_digests(season, episode)
+        if chunk_id in episode_ends:
+            generator.generate_episode_summary(season, episode)
+    generator.generate_season_summary(1)
+
+
+def edit_chunk(db: SyntheticSeasonDB, chunk_id: int) -> None:
+    db.chunks[chunk_id] = dict(
+        db.chunks[chunk_id], text=db.chunks[chunk_id]["text"] + " (revised)"
+    )
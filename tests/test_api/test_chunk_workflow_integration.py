@@ -34,6 +34,10 @@ def slot_connection() -> Generator[psycopg2.extensions.connection, None, None]:
     try:
         with conn:
             with conn.cursor() as cur:
+                cur.execute(
+                    "DELETE FROM post_commit_jobs WHERE chunk_id = ANY(%s)",
+                    (list(TEMP_CHUNK_IDS),),
+                )
                 cur.execute(
                     "DELETE FROM narrative_chunks WHERE id = ANY(%s)",
                     (list(TEMP_CHUNK_IDS),),
@@ -42,13 +46,15 @@ def slot_connection() -> Generator[psycopg2.extensions.connection, None, None]:
     finally:
         with conn:
             with conn.cursor() as cur:
+                cur.execute(
+                    "DELETE FROM post_commit_jobs WHERE chunk_id = ANY(%s)",
+                    (list(TEMP_CHUNK_IDS),),
+                )
                 cur.execute(
                     "DELETE FROM narrative_chunks WHERE id = ANY(%s)",
                     (list(TEMP_CHUNK_IDS),),
                 )
         conn.close()
-        with chunk_workflow._queued_embedding_jobs_lock:
-            chunk_workflow._queued_embedding_jobs.discard((TEST_DBNAME, 990001))
 
 
 def test_accept_chunk_queues_background_embedding_with_real_slot_db(
@@ -90,10 +96,16 @@ def test_accept_chunk_queues_background_embedding_with_real_slot_db(
     assert response.embedding_job_id is not None
     assert len(background_tasks.tasks) == 1
 
-    # The in-process scheduler suppresses duplicate queueing while a task is
-    # already pending in this API worker.
+    # The outbox's idempotency key suppresses duplicate queueing across
+    # workers while the embedding job is still live.
     assert scheduler(previous_id) is None
     assert len(background_tasks.tasks) == 1
+    with slot_connection.cursor() as cur:
+        cur.execute(
+            "SELECT kind, state::text FROM post_commit_jobs WHERE chunk_id = %s",
+            (previous_id,),
+        )
+        assert cur.fetchall() == [("chunk_embedding", "queued")]
 
     with slot_connection.cursor() as cur:
         cur.execute(
@@ -18,7 +18,7 @@ from psycopg2 import sql
 from psycopg2.extras import RealDictCursor
 
 from nexus.agents.orrery.events import CommitOrreryTickResult
-from nexus.api import commit_handler_sync, narrative
+from nexus.api import commit_handler_sync, narrative, post_commit_jobs
 from nexus.api.narrative_generation import write_to_incubator
 from nexus.memory.correspondence import (
     persist_staged_correspondence,
@@ -454,6 +454,18 @@ def test_accept_reject_hysteresis_and_digest_undo(
         )
         accepting_chunk_id = int(approval["chunk_id"])
         assert approval["status"] == "committed"
+        # Acceptance only commits the compaction job; the slot runner runs it.
+        assert compaction_calls == []
+        drained = post_commit_jobs.drain_post_commit_jobs_sync(
+            dbname,
+            connect=lambda: _connect(dbname),
+            handlers={
+                "correspondence_compaction": post_commit_jobs.HANDLERS[
+                    "correspondence_compaction"
+                ]
+            },
+        )
+        assert drained.succeeded == 1
         assert len(compaction_calls) == 1
         assert compaction_calls[0]["thread"] != event_loop_thread
         assert "writer secret 5" in compaction_calls[0]["user_prompt"]
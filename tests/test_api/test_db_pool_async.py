@@ -0,0 +1,102 @@
+"""Offline tests for the per-slot asyncpg pool behind the reader routes."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List
+
+import pytest
+
+from nexus.api import db_pool, reader_endpoints
+
+DBNAME = "save_05"
+
+
+class _FakeConnection:
+    def __init__(self, rows: List[Dict[str, Any]]) -> None:
+        self.rows = rows
+        self.fetched: List[tuple] = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def fetch(self, query: str, *args: Any) -> List[Dict[str, Any]]:
+        self.fetched.append((query, args))
+        return self.rows
+
+
+class _FakePool:
+    def __init__(self, conn: _FakeConnection) -> None:
+        self.conn = conn
+        self.terminated = False
+        self.closed = False
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+    def terminate(self) -> None:
+        self.terminated = True
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_pools(monkeypatch: pytest.MonkeyPatch) -> List[_FakePool]:
+    created: List[_FakePool] = []
+
+    async def create_pool(**kwargs: Any) -> _FakePool:
+        assert kwargs["database"] == DBNAME
+        assert kwargs["max_size"] == db_pool.MAX_CONNECTIONS
+        await asyncio.sleep(0)
+        created.append(_FakePool(_FakeConnection([{"id": 1, "summary": "S1"}])))
+        return created[-1]
+
+    monkeypatch.setenv("PGCONNECT_TIMEOUT", "3")
+    monkeypatch.setattr(db_pool.asyncpg, "create_pool", create_pool)
+    monkeypatch.setattr(db_pool, "_async_pools", {})
+    return created
+
+
+def test_concurrent_first_requests_share_one_pool(fake_pools) -> None:
+    async def scenario() -> None:
+        pools = await asyncio.gather(
+            *(db_pool._get_async_pool(DBNAME) for _ in range(5))
+        )
+        assert len({id(p) for p in pools}) == 1
+        await db_pool.close_all_async_pools()
+
+    asyncio.run(scenario())
+    assert len(fake_pools) == 1
+    assert fake_pools[0].closed
+    assert db_pool._async_pools == {}
+
+
+def test_pool_from_a_finished_loop_is_replaced_and_terminated(fake_pools) -> None:
+    asyncio.run(db_pool._get_async_pool(DBNAME))
+    asyncio.run(db_pool._get_async_pool(DBNAME))
+
+    assert len(fake_pools) == 2
+    assert fake_pools[0].terminated
+    assert not fake_pools[1].terminated
+
+    db_pool.close_all_pools()
+    assert fake_pools[1].terminated
+    assert db_pool._async_pools == {}
+
+
+def test_reader_fetch_uses_async_pool_with_positional_params(fake_pools) -> None:
+    async def scenario() -> List[Dict[str, Any]]:
+        pool = await db_pool._get_async_pool(DBNAME)
+        pool.conn.rows = [
+            {"season": 3, "episode": 1, "chunk_span": "[1,9)", "summary": "E1"}
+        ]
+        return await reader_endpoints.get_episodes(3, slot=5)
+
+    assert asyncio.run(scenario())[0]["chunkSpan"] == "[1,9)"
+    query, args = fake_pools[0].conn.fetched[0]
+    assert "WHERE season = $1" in query
+    assert args == (3,)
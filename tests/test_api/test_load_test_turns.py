@@ -0,0 +1,174 @@
+"""Offline tests for the turn load generator and the counters it reads."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import uuid
+
+from fastapi import BackgroundTasks, FastAPI, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+import pytest
+
+from nexus.api import db_pool, mock_openai
+from nexus.api.mock_openai import MockQuota
+from nexus.api.narrative import ConnectionManager
+from scripts.load_test_turns import (
+    STOP_SESSION,
+    ProgressListener,
+    TurnSample,
+    _play_turn,
+    check_disposable_slots,
+    percentile,
+)
+
+
+def test_percentile_interpolates_between_ranks() -> None:
+    values = [4.0, 1.0, 3.0, 2.0]
+
+    assert percentile(values, 50) == 2.5
+    assert percentile(values, 0) == 1.0
+    assert percentile(values, 100) == 4.0
+    assert percentile(values, 95) == pytest.approx(3.85)
+    assert percentile([], 99) == 0.0
+
+
+def test_disposable_slot_guard_requires_exact_confirmation() -> None:
+    assert check_disposable_slots([2, 1, 2], "save_02,save_01") == [
+        "save_01",
+        "save_02",
+    ]
+    with pytest.raises(ValueError, match="slot 5 is forbidden"):
+        check_disposable_slots([5], "save_05")
+    with pytest.raises(ValueError, match="must list exactly"):
+        check_disposable_slots([1, 2], "save_01")
+
+
+def test_pool_stats_reports_sync_and_async_use(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class _SyncPool:
+        closed = False
+        _used = {1: object(), 2: object()}
+        _pool = [object()]
+
+    class _AsyncPool:
+        def get_size(self) -> int:
+            return 6
+
+        def get_idle_size(self) -> int:
+            return 2
+
+    loop = asyncio.new_event_loop()
+    try:
+        task = loop.create_task(asyncio.sleep(0, result=_AsyncPool()))
+        loop.run_until_complete(task)
+        monkeypatch.setattr(db_pool, "_pools", {"save_01": _SyncPool()})
+        monkeypatch.setattr(db_pool, "_async_pools", {"save_02": (loop, task)})
+
+        assert db_pool.pool_stats() == {
+            "save_01": {
+                "sync_in_use": 2,
+                "sync_open": 3,
+                "async_in_use": 0,
+                "async_open": 0,
+                "max": db_pool.MAX_CONNECTIONS,
+            },
+            "save_02": {
+                "sync_in_use": 0,
+                "sync_open": 0,
+                "async_in_use": 4,
+                "async_open": 6,
+                "max": db_pool.MAX_CONNECTIONS,
+            },
+        }
+    finally:
+        loop.close()
+
+
+def test_broadcast_counts_fan_out_per_connection() -> None:
+    class _Socket:
+        def __init__(self) -> None:
+            self.sent: list[str] = []
+
+        async def send_text(self, message: str) -> None:
+            self.sent.append(message)
+
+    manager = ConnectionManager()
+    sockets = [_Socket() for _ in range(3)]
+    manager.active_connections.extend(sockets)
+
+    asyncio.run(manager.send_progress("s1", "complete", {"chunk_id": 2}))
+    asyncio.run(manager.broadcast("ping"))
+
+    assert manager.broadcasts == 2
+    assert manager.messages_sent == 6
+    assert manager.broadcast_seconds > 0
+    assert json.loads(sockets[0].sent[0])["status"] == "complete"
+
+
+def test_mock_pads_narrative_and_admits_latency_only_quotas() -> None:
+    try:
+        mock_openai.configure_mock_narrative_words(120)
+        padded = mock_openai._mock_storyteller_response("prompt")["narrative"]
+        writer = mock_openai._mock_writer_response("prompt")["narrative"]
+    finally:
+        mock_openai.configure_mock_narrative_words(0)
+
+    assert len(padded.split()) == 120
+    assert writer == padded
+    assert len(mock_openai._mock_storyteller_response("p")["narrative"].split()) < 40
+
+    quota = MockQuota(latency_seconds=0.2)
+    assert quota.admit(10_000) == (None, {})
+    assert quota.latency() == 0.2
+
+
+def test_turn_driver_retries_lease_conflicts_and_times_both_phases() -> None:
+    app = FastAPI()
+    manager = ConnectionManager()
+    conflicts = {"left": 2}
+    approved: list[str] = []
+
+    @app.post("/api/narrative/continue")
+    async def continue_narrative(payload: dict, background_tasks: BackgroundTasks):
+        if conflicts["left"]:
+            conflicts["left"] -= 1
+            return JSONResponse(status_code=409, content={"detail": "leased"})
+        session_id = str(uuid.uuid4())
+        background_tasks.add_task(manager.send_progress, session_id, "complete")
+        return {"session_id": session_id, "status": "processing"}
+
+    @app.post("/api/narrative/approve/{session_id}")
+    async def approve(session_id: str, payload: dict):
+        approved.append(session_id)
+        return {"status": "committed"}
+
+    @app.websocket("/ws/narrative")
+    async def progress(websocket: WebSocket):
+        await manager.connect(websocket)
+        try:
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            manager.disconnect(websocket)
+
+    finished: dict = {}
+    sample = TurnSample(session=0, slot=1, turn=0)
+    with TestClient(app) as client:
+        listener = ProgressListener(client, finished)
+        listener.start()
+        worker = threading.Thread(
+            target=_play_turn, args=(client, sample, [{"choice": 1}], finished)
+        )
+        worker.start()
+        worker.join(10)
+        client.portal.call(manager.broadcast, json.dumps({"session_id": STOP_SESSION}))
+        listener.join()
+
+    assert sample.error is None
+    assert sample.lease_conflicts == 2
+    assert sample.turn_seconds is not None and sample.commit_seconds is not None
+    assert list(finished) == approved
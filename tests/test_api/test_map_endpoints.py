@@ -0,0 +1,131 @@
+"""Offline tests for the viewport-bounded map routes."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from nexus.api import map_endpoints
+from nexus.api.map_endpoints import parse_bbox
+from nexus.api.reader_revisions import FeedRevision
+
+
+class _FakeConnection:
+    def __init__(self, has_index: bool = True) -> None:
+        self.has_index = has_index
+        self.calls: List[tuple] = []
+
+    async def fetchval(self, query: str, *args: Any) -> Any:
+        self.calls.append((query, args))
+        if "to_regclass" in query:
+            return "ix_places_coordinates_geometry" if self.has_index else None
+        return b"\x1a\x06places"
+
+    async def fetch(self, query: str, *args: Any) -> List[Dict[str, Any]]:
+        self.calls.append((query, args))
+        geometry = {"type": "Point", "coordinates": [179.5, 10.0]}
+        return [
+            {
+                "id": 4,
+                "name": "Dateline",
+                "type": "fixed_location",
+                "geometry": geometry,
+            }
+        ]
+
+
+@pytest.fixture
+def conn(monkeypatch: pytest.MonkeyPatch) -> _FakeConnection:
+    fake = _FakeConnection()
+
+    @asynccontextmanager
+    async def get_async_connection(dbname: str):
+        assert dbname == "save_05"
+        yield fake
+
+    async def probe(dbname: str, feed: str) -> FeedRevision:
+        assert feed == "places"
+        return FeedRevision("places", 41, 900, "abc123")
+
+    monkeypatch.setattr(map_endpoints, "get_async_connection", get_async_connection)
+    monkeypatch.setattr(map_endpoints, "probe_feed_revision", probe)
+    monkeypatch.setattr(map_endpoints, "_index_checked", set())
+    return fake
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    app.include_router(map_endpoints.router)
+    return TestClient(app)
+
+
+def test_parse_bbox_splits_antimeridian_viewports_and_rejects_garbage() -> None:
+    assert parse_bbox("-10,40,5,52") == [(-10.0, 40.0, 5.0, 52.0)]
+    assert parse_bbox("170,-5,-170,5") == [
+        (170.0, -5.0, 180.0, 5.0),
+        (-180.0, -5.0, -170.0, 5.0),
+    ]
+    for bad in ("1,2,3", "a,b,c,d", "0,50,10,40", "0,0,200,10"):
+        with pytest.raises(HTTPException) as excinfo:
+            parse_bbox(bad)
+        assert excinfo.value.status_code == 400
+
+
+def test_tile_is_served_as_mvt_and_revalidates_with_304(
+    client: TestClient, conn: _FakeConnection
+) -> None:
+    response = client.get("/api/map/tiles/3/4/2?slot=5")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == map_endpoints.MVT_MEDIA_TYPE
+    assert response.content == b"\x1a\x06places"
+    assert conn.calls[-1][1] == (3, 4, 2)
+
+    cached = client.get(
+        "/api/map/tiles/3/4/2?slot=5",
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+    assert cached.status_code == 304
+    assert len(conn.calls) == 2  # index check + one tile query
+
+
+def test_tile_outside_the_grid_is_rejected(client: TestClient) -> None:
+    assert client.get("/api/map/tiles/2/4/0?slot=5").status_code == 400
+    assert client.get("/api/map/tiles/23/0/0?slot=5").status_code == 400
+
+
+def test_bbox_places_bind_one_envelope_per_antimeridian_half(
+    client: TestClient, conn: _FakeConnection
+) -> None:
+    rows = client.get("/api/map/places?bbox=170,-5,-170,5&slot=5").json()
+
+    assert rows == [
+        {
+            "id": 4,
+            "name": "Dateline",
+            "type": "fixed_location",
+            "geometry": {"type": "Point", "coordinates": [179.5, 10.0]},
+        }
+    ]
+    query, args = conn.calls[-1]
+    assert "ST_MakeEnvelope($1, $2, $3, $4, 4326)" in query
+    assert "ST_MakeEnvelope($5, $6, $7, $8, 4326)" in query
+    assert args == (170.0, -5.0, 180.0, 5.0, -180.0, -5.0, -170.0, 5.0)
+
+
+def test_missing_spatial_index_warns_once_per_slot(
+    client: TestClient,
+    conn: _FakeConnection,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    conn.has_index = False
+    with caplog.at_level("WARNING", logger="nexus.api.map_endpoints"):
+        client.get("/api/map/places?bbox=0,0,1,1&slot=5")
+        client.get("/api/map/places?bbox=0,0,1,1&slot=5")
+
+    warnings = [r for r in caplog.records if "migration 115" in r.getMessage()]
+    assert len(warnings) == 1
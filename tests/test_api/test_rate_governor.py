@@ -0,0 +1,236 @@
+"""Tests for the provider/model rate governor and its mock-quota harness."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from nexus.api import rate_governor
+from nexus.api.rate_governor import (
+    GovernedTransport,
+    RateGovernor,
+    RateLimits,
+    request_budget,
+    retry_after_seconds,
+)
+from scripts.simulate_rate_governor import run_simulation
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry():
+    rate_governor.reset_governors()
+    yield
+    rate_governor.reset_governors()
+
+
+def test_request_and_token_buckets_meter_at_the_per_minute_rate() -> None:
+    clock = _Clock()
+    governor = RateGovernor(
+        "openai", "gpt-4.1", RateLimits(requests_per_minute=2), clock=clock
+    )
+
+    assert governor.try_acquire() is not None
+    assert governor.try_acquire() is not None
+    assert governor.try_acquire() is None
+    clock.now += 30  # one request refills every 30s at 2/min
+    assert governor.try_acquire() is not None
+
+    tokens = RateGovernor(
+        "openai", "gpt-4.1", RateLimits(tokens_per_minute=600), clock=clock
+    )
+    assert tokens.try_acquire(tokens=500) is not None
+    assert tokens.try_acquire(tokens=200) is None
+    clock.now += 10
+    assert tokens.try_acquire(tokens=200) is not None
+
+
+def test_concurrency_cap_admits_again_once_a_permit_is_released() -> None:
+    governor = RateGovernor("anthropic", "*", RateLimits(max_concurrency=1))
+
+    first = governor.try_acquire()
+    assert first is not None
+    assert governor.try_acquire() is None
+    first.release()
+    first.release()  # idempotent
+    assert governor.in_flight == 0
+    assert governor.try_acquire() is not None
+
+
+def test_429_pauses_every_caller_for_retry_after_and_halves_the_rate() -> None:
+    clock = _Clock()
+    governor = RateGovernor(
+        "openai", "gpt-4.1", RateLimits(requests_per_minute=600), clock=clock
+    )
+
+    with governor.try_acquire() as permit:
+        permit.observe(429, {"Retry-After": "2"})
+
+    assert governor.try_acquire() is None
+    clock.now += 2.01
+    assert governor.try_acquire() is not None
+    assert governor.stats.throttled == 1
+    assert governor._scale == 0.5
+
+
+def test_headers_clamp_remaining_and_supply_unconfigured_limits() -> None:
+    clock = _Clock()
+    governor = RateGovernor(
+        "openai", "gpt-4.1", RateLimits(requests_per_minute=100), clock=clock
+    )
+
+    governor.observe(
+        200,
+        {
+            "x-ratelimit-limit-requests": "500",
+            "x-ratelimit-remaining-requests": "0",
+            "x-ratelimit-limit-tokens": "30000",
+            "x-ratelimit-remaining-tokens": "29000",
+        },
+    )
+
+    # The configured request budget is a ceiling the header cannot raise.
+    assert governor._buckets["requests"].per_minute == 100
+    assert governor._buckets["tokens"].per_minute == 30000
+    assert governor.try_acquire() is None
+    clock.now += 0.6  # 100/min refills one request every 0.6s
+    assert governor.try_acquire(tokens=29000) is not None
+
+
+def test_retry_after_accepts_milliseconds_seconds_and_dates() -> None:
+    assert retry_after_seconds({"retry-after-ms": "250"}) == 0.25
+    assert retry_after_seconds({"Retry-After": "3"}) == 3.0
+    assert retry_after_seconds({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0
+    assert retry_after_seconds({}) is None
+
+
+def test_limits_merge_model_over_provider_over_default(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from nexus.config.settings_models import APIRateLimitSettings
+
+    config = APIRateLimitSettings.model_validate(
+        {
+            "default": {"max_concurrency": 8},
+            "providers": {
+                "openai": {"requests_per_minute": 500},
+                "openai/gpt-4.1": {"tokens_per_minute": 30000},
+            },
+        }
+    )
+
+    class _Settings:
+        class api:
+            rate_limits = config
+
+    monkeypatch.setattr(rate_governor, "load_settings", lambda: _Settings)
+
+    assert rate_governor.resolve_rate_limits("openai", "gpt-4.1") == RateLimits(
+        500, 30000, 8
+    )
+    assert rate_governor.resolve_rate_limits("anthropic") == RateLimits(None, None, 8)
+
+
+def test_transport_keys_governors_by_model_and_observes_responses(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        rate_governor, "resolve_rate_limits", lambda provider, model: RateLimits()
+    )
+
+    def reply(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, headers={"retry-after-ms": "5000"}, json={})
+
+    client = httpx.Client(
+        transport=GovernedTransport("openai", httpx.MockTransport(reply))
+    )
+    body = {"model": "gpt-4.1", "input": "x" * 400, "max_output_tokens": 50}
+    request = client.build_request("POST", "https://api.test/v1/responses", json=body)
+
+    assert request_budget(request) == ("gpt-4.1", len(request.content) // 4 + 50)
+    assert client.send(request).status_code == 429
+    governor = rate_governor.get_governor("openai", "gpt-4.1")
+    assert governor.stats.requests == 1 and governor.stats.throttled == 1
+    assert governor.in_flight == 0
+    assert governor.try_acquire() is None  # paused for everyone on this key
+    assert rate_governor.get_governor("openai", "gpt-4o").try_acquire() is not None
+
+
+def test_streamed_response_holds_its_permit_until_closed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        rate_governor,
+        "resolve_rate_limits",
+        lambda provider, model: RateLimits(max_concurrency=1),
+    )
+
+    def reply(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=httpx.ByteStream(b"data: [DONE]"))
+
+    client = httpx.Client(
+        transport=GovernedTransport("openai", httpx.MockTransport(reply))
+    )
+    governor = rate_governor.get_governor("openai")
+
+    with client.stream("GET", "https://api.test/v1/models") as response:
+        assert response.status_code == 200
+        assert governor.in_flight == 1
+        assert governor.try_acquire() is None
+    assert governor.in_flight == 0
+
+    client.get("https://api.test/v1/models")
+    assert governor.in_flight == 0
+
+
+def test_governed_clients_keep_environment_proxies(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.test:3128")
+    monkeypatch.delenv("NO_PROXY", raising=False)
+    monkeypatch.delenv("no_proxy", raising=False)
+
+    client = rate_governor.governed_http_client("openai")
+    transport = client._transport_for_url(httpx.URL("https://api.openai.com/v1"))
+    untrusting = rate_governor.governed_http_client("openai", trust_env=False)
+
+    assert isinstance(transport, GovernedTransport)
+    assert type(transport._transport._pool).__name__ == "HTTPProxy"
+    assert (
+        untrusting._transport_for_url(httpx.URL("https://api.openai.com/v1"))
+        is untrusting._transport
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_clients_are_shared_per_provider_and_closed_on_shutdown() -> None:
+    client = rate_governor.governed_async_http_client("anthropic")
+
+    assert rate_governor.governed_async_http_client("anthropic") is client
+    assert rate_governor.governed_async_http_client("openai") is not client
+    await rate_governor.aclose_governed_http_clients()
+    assert client.is_closed
+    assert rate_governor.governed_async_http_client("anthropic") is not client
+    await rate_governor.aclose_governed_http_clients()
+
+
+@pytest.mark.asyncio
+async def test_governed_callers_hold_the_mock_quota_without_a_retry_storm() -> None:
+    settings = dict(
+        requests_per_minute=1200, callers=24, duration=1.5, latency=0.02, jitter=0.01
+    )
+
+    ungoverned = await run_simulation(governed=False, **settings)
+    governed = await run_simulation(governed=True, max_concurrency=8, **settings)
+
+    assert governed.utilization > 0.8
+    assert governed.server_429s <= 5
+    assert governed.failed == 0
+    assert ungoverned.server_429s > 10 * max(1, governed.server_429s)
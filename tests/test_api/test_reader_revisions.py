@@ -0,0 +1,147 @@
+"""Offline tests for reader-feed ETags, 304s and ?since= deltas."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from nexus.api import reader_endpoints, reader_revisions
+from nexus.api.reader_revisions import FeedRevision, etag_matches
+
+PLACES = [
+    {"id": place_id, "name": f"Place {place_id}", "geometry": None}
+    for place_id in (1, 2, 3)
+]
+
+
+@pytest.fixture
+def feed_state(monkeypatch: pytest.MonkeyPatch) -> Dict[str, Any]:
+    """Stand in for the slot database behind /api/places."""
+    state: Dict[str, Any] = {
+        "revision": FeedRevision("places", 41, 900, "abc123"),
+        "changed": [2, 7],
+        "loads": [],
+    }
+
+    async def probe(dbname: str, feed: str) -> FeedRevision:
+        assert (dbname, feed) == ("save_05", "places")
+        return state["revision"]
+
+    async def changed(dbname: str, feed: str, horizon: int) -> List[int]:
+        state["horizon"] = horizon
+        return state["changed"]
+
+    async def fetch_all(dbname: str, query: str, params: tuple = ()) -> List[Dict]:
+        assert "ST_AsGeoJSON(coordinates)" in query
+        ids = params[0] if params else None
+        state["loads"].append(ids)
+        rows = [
+            {
+                **row,
+                "type": "fixed_location",
+                "zone": 1,
+                "summary": None,
+                "inhabitants": None,
+                "history": None,
+                "current_status": None,
+                "secrets": None,
+                "extra_data": None,
+                "created_at": None,
+                "updated_at": None,
+            }
+            for row in PLACES
+        ]
+        return [row for row in rows if ids is None or row["id"] in ids]
+
+    monkeypatch.setattr(reader_revisions, "probe_feed_revision", probe)
+    monkeypatch.setattr(reader_revisions, "changed_row_ids", changed)
+    monkeypatch.setattr(reader_endpoints, "_fetch_all", fetch_all)
+    return state
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    app.include_router(reader_endpoints.router)
+    return TestClient(app)
+
+
+def test_etag_matching_is_weak_and_accepts_lists_and_wildcards() -> None:
+    etag = 'W/"places-abc"'
+    assert etag_matches('"places-abc"', etag)
+    assert etag_matches('W/"zones-x", W/"places-abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"places-abd"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_since_tokens_from_other_databases_or_the_future_are_unusable() -> None:
+    revision = FeedRevision("zones", 41, 900, "f")
+    assert revision.token == "41.900"
+    assert revision.since_horizon("41.850") == 850
+    assert revision.since_horizon("41.901") is None
+    assert revision.since_horizon("42.850") is None
+    assert revision.since_horizon("garbage") is None
+
+
+def test_matching_if_none_match_returns_304_without_loading_rows(
+    client: TestClient, feed_state: Dict[str, Any]
+) -> None:
+    first = client.get("/api/places?slot=5")
+    assert first.status_code == 200
+    assert [row["id"] for row in first.json()] == [1, 2, 3]
+    assert first.headers["X-Nexus-Revision"] == "41.900"
+    assert first.headers["Cache-Control"] == "no-cache"
+
+    again = client.get(
+        "/api/places?slot=5", headers={"If-None-Match": first.headers["ETag"]}
+    )
+    assert again.status_code == 304
+    assert again.content == b""
+    assert feed_state["loads"] == [None]
+
+    feed_state["revision"] = FeedRevision("places", 41, 910, "def456")
+    moved = client.get(
+        "/api/places?slot=5", headers={"If-None-Match": first.headers["ETag"]}
+    )
+    assert moved.status_code == 200
+    assert moved.headers["ETag"] != first.headers["ETag"]
+
+
+def test_since_returns_changed_rows_and_removed_ids(
+    client: TestClient, feed_state: Dict[str, Any]
+) -> None:
+    delta = client.get("/api/places?slot=5&since=41.850").json()
+
+    assert feed_state["horizon"] == 850
+    assert feed_state["loads"] == [[2, 7]]
+    assert delta["revision"] == "41.900"
+    assert delta["full"] is False
+    assert [row["id"] for row in delta["changed"]] == [2]
+    assert delta["removed"] == [7]
+
+
+def test_unusable_since_token_degrades_to_a_full_delta(
+    client: TestClient, feed_state: Dict[str, Any]
+) -> None:
+    delta = client.get("/api/places?slot=5&since=7.850").json()
+
+    assert delta["full"] is True
+    assert [row["id"] for row in delta["changed"]] == [1, 2, 3]
+    assert delta["removed"] == []
+    assert "horizon" not in feed_state
+
+
+def test_slots_without_the_change_log_serve_plain_payloads(
+    client: TestClient, feed_state: Dict[str, Any]
+) -> None:
+    feed_state["revision"] = None
+
+    response = client.get("/api/places?slot=5", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+    assert len(response.json()) == 3
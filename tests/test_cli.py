@@ -2,6 +2,7 @@
 
 import argparse
 from argparse import Namespace
+import copy
 import json
 from pathlib import Path
 import sys
@@ -1668,6 +1669,115 @@ def test_retrograde_embed_history_reports_planner_runtime_error(monkeypatch) ->
     }
 
 
+def test_retrograde_verify_graphs_replays_slot_records_and_packet_files(
+    monkeypatch,
+    tmp_path,
+    capsys,
+) -> None:
+    """Stored graphs and packet files replay together; drift fails policy."""
+
+    from nexus.agents.orrery import retrograde_graph_replay
+    from nexus.agents.orrery.retrograde_graph import canonical_graph_hash
+    from nexus.agents.orrery.retrograde_packet import build_seed_generation_request
+    from nexus.agents.orrery.retrograde_vocabulary import (
+        enumerate_seed_eligible_vocabulary,
+    )
+    from nexus.api import db_pool
+
+    request = build_seed_generation_request(
+        candidate_scaffolds={
+            "core_entities": [
+                {"kind": "character", "role": "protagonist", "name": "Mara"}
+            ]
+        },
+        vocabulary=enumerate_seed_eligible_vocabulary(),
+        weird={"level": "medium", "raw": 0.4},
+    )
+    packet_path = tmp_path / "packet.json"
+    packet_path.write_text(
+        json.dumps({"retrograde_packet": {"seed_generation_request": request}}),
+        encoding="utf-8",
+    )
+    drifted = copy.deepcopy(request["candidate_graph"])
+    drifted["dangling_edges"].reverse()
+    stored = {
+        "id": 9,
+        "source": "maturation",
+        "maturation_job_id": 3,
+        "schema_version": 2,
+        "graph_hash": canonical_graph_hash(drifted),
+        "build_inputs": request["candidate_graph_inputs"],
+        "graph": drifted,
+    }
+    monkeypatch.setattr(
+        db_pool, "get_connection", lambda *args, **kwargs: FakeApplyConnection()
+    )
+    monkeypatch.setattr(
+        retrograde_graph_replay, "load_graph_records", lambda cur: [stored]
+    )
+
+    result = cli.run_retrograde_verify_graphs(
+        Namespace(slot=5, packet=[packet_path], workers=1)
+    )
+
+    assert result["success"] is True
+    assert result["failed_policy"] is True
+    audit = result["retrograde_graph_verification"]
+    assert [item["status"] for item in audit["results"]] == ["drift", "match"]
+    assert audit["results"][1]["source"] == "packet_file"
+
+    cli._print_retrograde_graph_verification(result)
+    output = capsys.readouterr().out
+    assert "v2: 1/2 match, drift=1" in output
+    assert "maturation 9 (v2): drift" in output
+
+
+def test_retrograde_verify_graphs_reports_retired_version_drift(
+    monkeypatch,
+    capsys,
+) -> None:
+    """Drift under a retired graph schema version is informational only."""
+
+    from nexus.agents.orrery import retrograde_graph_replay
+    from nexus.agents.orrery.retrograde_graph import GRAPH_SCHEMA_VERSION
+    from nexus.api import db_pool
+
+    retired = {
+        "id": 11,
+        "source": "maturation",
+        "status": "drift",
+        "schema_version": GRAPH_SCHEMA_VERSION - 1,
+    }
+    audit = {
+        "current_schema_version": GRAPH_SCHEMA_VERSION,
+        "records": 1,
+        "matched": 0,
+        "mismatched": [retired],
+        "regressions": [],
+        "retired_mismatches": [retired],
+        "errors": [],
+    }
+    monkeypatch.setattr(
+        db_pool, "get_connection", lambda *args, **kwargs: FakeApplyConnection()
+    )
+    monkeypatch.setattr(retrograde_graph_replay, "load_graph_records", lambda cur: [])
+    monkeypatch.setattr(
+        retrograde_graph_replay,
+        "verify_graph_records",
+        lambda records, workers: audit,
+    )
+
+    result = cli.run_retrograde_verify_graphs(Namespace(slot=5, packet=None, workers=1))
+
+    assert result["success"] is True
+    assert result["failed_policy"] is False
+    cli._print_retrograde_graph_verification(result)
+    output = capsys.readouterr().out
+    assert "retired schema version (informational)" in output
+    assert f"maturation 11 (v{GRAPH_SCHEMA_VERSION - 1}): drift" in output
+    assert "differs from stored graph" not in output
+
+
 def test_retrograde_persistence_formatter_uses_summary_identity(capsys) -> None:
     """The persistence formatter renders dedicated summary identities."""
 
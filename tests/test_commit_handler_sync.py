@@ -114,15 +114,24 @@ class CommitCursor:
             self.result = (self.connection.child_world_time,)
         elif "FROM chunk_metadata" in normalized:
             self.result = self.connection.parent_metadata
-        elif normalized == (
-            "SELECT id, name, summary FROM characters WHERE name IS NOT NULL"
-        ):
+        elif "current_database()" in normalized:
+            # Untracked slot: the entity lexicon loads uncached every time.
+            self.rows = [
+                {
+                    "dbname": "commit_test",
+                    "db_oid": 1,
+                    "tracked": False,
+                    "current_xid": None,
+                }
+            ]
+            self.result = None
+        elif normalized == "SELECT id, name, summary FROM characters ORDER BY name, id":
             self.rows = [
                 {"id": character_id, "name": name, "summary": None}
                 for name, character_id in sorted(self.connection.characters.items())
             ]
             self.result = None
-        elif normalized == "SELECT character_id, alias FROM character_aliases":
+        elif normalized.startswith("SELECT character_id, alias FROM character_aliases"):
             self.rows = []
             self.result = None
         elif "SELECT id FROM characters WHERE name" in normalized:
@@ -683,43 +692,50 @@ def test_sync_commit_aborts_on_unresolvable_state_update_name(monkeypatch):
     )
 
 
-def test_post_commit_compaction_failure_preserves_success_and_retries(
+def test_post_commit_work_is_enqueued_inside_the_commit_transaction(
     monkeypatch: pytest.MonkeyPatch,
-    caplog: pytest.LogCaptureFixture,
 ) -> None:
-    """Derived compaction cannot turn a durable acceptance into a false 500."""
+    """Follow-up jobs are outbox rows written before the incubator is cleared."""
 
-    attempts = []
-
-    def flaky_compaction(_conn, *, accepting_chunk_id):
-        attempts.append(accepting_chunk_id)
-        if len(attempts) == 1:
-            raise RuntimeError("provider unavailable")
-        return True
+    from nexus.api import presence_audit
 
+    conn = CommitConnection()
+    conn.incubator["new_entities"] = []
+    conn.incubator["entity_updates"] = {}
+    conn.incubator["reference_updates"] = {
+        "characters": [],
+        "places": [],
+        "factions": [],
+    }
+    _patch_sync_commit_runtime(monkeypatch)
+    monkeypatch.setattr(presence_audit, "presence_audit_enabled", lambda: True)
     monkeypatch.setattr(
-        commit_handler_sync,
-        "compact_accepted_correspondence_sync",
-        flaky_compaction,
+        presence_audit,
+        "audit_chunk_presence",
+        lambda *_args, **_kwargs: pytest.fail("audit must not run inline"),
     )
-    connection = object()
 
-    assert (
-        commit_handler_sync._compact_accepted_correspondence_best_effort(
-            connection,
-            accepting_chunk_id=11,
-        )
-        is False
-    )
-    assert (
-        commit_handler_sync._compact_accepted_correspondence_best_effort(
-            connection,
-            accepting_chunk_id=12,
-        )
-        is True
+    chunk_id = commit_incubator_to_database_sync(conn, "outbox-session", slot=5)
+
+    sql = [statement for statement, _params in conn.statements]
+    enqueues = [
+        (index, params)
+        for index, (statement, params) in enumerate(conn.statements)
+        if "INSERT INTO post_commit_jobs" in statement
+    ]
+    assert [params[:3] for _index, params in enqueues] == [
+        ("summary_digest", str(chunk_id), chunk_id),
+        ("presence_audit", str(chunk_id), chunk_id),
+    ]
+    assert json.loads(enqueues[-1][1][3]) == {
+        "parent_chunk_id": conn.incubator["parent_chunk_id"]
+    }
+    clear_index = next(
+        index
+        for index, statement in enumerate(sql)
+        if statement.startswith("DELETE FROM incubator")
     )
-    assert attempts == [11, 12]
-    assert "leaving the uncompacted journal intact for retry" in caplog.text
+    assert enqueues[-1][0] < clear_index
 
 
 def test_bootstrap_commit_seeds_setting_for_next_presence_baseline(
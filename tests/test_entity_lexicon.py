@@ -0,0 +1,176 @@
+"""Tests for the revision-keyed shared entity lexicon."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from nexus.memory import entity_lexicon
+from nexus.memory.entity_lexicon import (
+    clear_entity_lexicon_cache,
+    get_entity_lexicon,
+)
+from scripts.benchmark_entity_lexicon import (
+    detections_match,
+    synthetic_lexicon,
+    synthetic_narrative,
+)
+
+
+class _Result:
+    def __init__(self, rows: List[Dict[str, Any]]) -> None:
+        self._rows = rows
+
+    def mappings(self) -> List[Dict[str, Any]]:
+        return self._rows
+
+
+class _SlotConnection:
+    """SQLAlchemy-connection stand-in answering the lexicon's queries."""
+
+    def __init__(self, *, tracked: bool = True) -> None:
+        self.dbname = "save_01"
+        self.db_oid = 41
+        self.tracked = tracked
+        self.revision: Optional[int] = 3
+        self.bumped_xid: Optional[int] = 900
+        self.current_xid: Optional[str] = None
+        self.characters = [
+            {"id": 1, "name": "Alex", "summary": "Runner"},
+            {"id": 2, "name": "Emilia", "summary": None},
+            {"id": 3, "name": None, "summary": "Unnamed"},
+        ]
+        self.aliases = [
+            {"character_id": 2, "alias": "Em"},
+            {"character_id": 2, "alias": "Emilia"},
+        ]
+        self.places = [{"id": 7, "name": "The Vault", "type": "site", "zone": 1}]
+        self.factions = [{"id": 4, "name": "Dynacorp", "summary": None}]
+        self.row_reads = 0
+
+    def execute(self, statement: Any) -> _Result:
+        sql = str(statement)
+        if "current_database()" in sql:
+            return _Result(
+                [
+                    {
+                        "dbname": self.dbname,
+                        "db_oid": self.db_oid,
+                        "tracked": self.tracked,
+                        "current_xid": self.current_xid,
+                    }
+                ]
+            )
+        if "FROM entity_lexicon_revision" in sql:
+            if self.revision is None:
+                return _Result([])
+            return _Result([{"revision": self.revision, "bumped_xid": self.bumped_xid}])
+        self.row_reads += 1
+        for table, rows in (
+            ("character_aliases", self.aliases),
+            ("characters", self.characters),
+            ("places", self.places),
+            ("factions", self.factions),
+        ):
+            if f"FROM {table}" in sql:
+                return _Result([dict(row) for row in rows])
+        raise AssertionError(f"unexpected query: {sql}")
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    clear_entity_lexicon_cache()
+    yield
+    clear_entity_lexicon_cache()
+
+
+def test_lexicon_is_reused_until_the_revision_moves() -> None:
+    conn = _SlotConnection()
+
+    first = get_entity_lexicon(conn)
+    assert get_entity_lexicon(conn) is first
+    assert conn.row_reads == 4
+    assert first.revision == (41, 3)
+
+    conn.revision = 4
+    conn.characters[0] = {"id": 1, "name": "Alexandra", "summary": "Runner"}
+    second = get_entity_lexicon(conn)
+
+    assert second is not first
+    assert second.character_name(1) == "Alexandra"
+    assert second.character_detector is not first.character_detector
+    assert conn.row_reads == 8
+
+
+def test_recloned_slot_with_the_same_counter_reloads() -> None:
+    conn = _SlotConnection()
+    first = get_entity_lexicon(conn)
+
+    conn.db_oid = 42
+    assert get_entity_lexicon(conn) is not first
+    # A late reader of the old database cannot displace the newer clone.
+    conn.db_oid = 41
+    conn.revision = 9
+    stale_oid = get_entity_lexicon(conn)
+    assert entity_lexicon._LEXICONS["save_01"] is stale_oid
+
+
+def test_bumping_transaction_sees_but_never_caches_its_own_writes() -> None:
+    conn = _SlotConnection()
+    committed = get_entity_lexicon(conn)
+
+    conn.revision = 4
+    conn.current_xid = "900"
+    own_view = get_entity_lexicon(conn)
+
+    assert own_view.revision is None
+    assert own_view is not committed
+    assert entity_lexicon._LEXICONS["save_01"] is committed
+
+
+def test_slots_without_the_revision_table_are_never_cached() -> None:
+    conn = _SlotConnection(tracked=False)
+
+    first = get_entity_lexicon(conn)
+
+    assert first.revision is None
+    assert get_entity_lexicon(conn) is not first
+    assert entity_lexicon._LEXICONS == {}
+
+
+def test_slot_without_the_revision_row_caches_at_revision_zero() -> None:
+    conn = _SlotConnection()
+    conn.revision = None
+
+    first = get_entity_lexicon(conn)
+
+    assert first.revision == (41, 0)
+    assert get_entity_lexicon(conn) is first
+    conn.revision = 1
+    assert get_entity_lexicon(conn) is not first
+
+
+def test_derived_maps_match_the_per_consumer_loaders() -> None:
+    lexicon = get_entity_lexicon(_SlotConnection())
+
+    assert [row["id"] for row in lexicon.named_characters] == [1, 2]
+    assert lexicon.alias_lookup("Alex") == {
+        "alex": ["Alex", "You", "Your", "Yours", "Yourself"],
+        "emilia": ["Em", "Emilia"],
+    }
+    assert lexicon.alias_lookup("Alex") is not lexicon.alias_lookup("Alex")
+    assert lexicon.place_names == {"the vault": "The Vault", "vault": "The Vault"}
+    assert set(lexicon.entity_detector.place_lookup) == {"the vault"}
+    assert set(lexicon.character_detector.character_lookup) == {"alex", "emilia", "em"}
+
+    match = lexicon.entity_detector.detect_entities("Em slipped into the Vault.")
+    assert [row["id"] for row in match.characters] == [2]
+    assert [row["id"] for row in match.places] == [7]
+
+
+def test_cached_detectors_find_what_the_legacy_scans_find() -> None:
+    lexicon = synthetic_lexicon(400, 200, 40, seed=5)
+
+    for seed in range(3):
+        assert detections_match(lexicon, synthetic_narrative(lexicon, seed=seed))
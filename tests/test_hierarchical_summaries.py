@@ -0,0 +1,175 @@
+"""Tests for hierarchical, hash-skipping narrative summaries."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, List, Tuple
+
+from nexus.api.post_commit_jobs import enqueue_accepted_chunk_jobs
+from scripts.summarize_narrative import scene_windows
+from tests.summary_test_support import (
+    SyntheticSeasonDB,
+    edit_chunk,
+    mock_generator,
+    simulate_commits,
+    synthetic_season,
+)
+
+
+def _season(chunks: int = 24, episodes: int = 2) -> SyntheticSeasonDB:
+    return SyntheticSeasonDB(
+        synthetic_season(chunks, episodes, words_per_chunk=20, seed=1)
+    )
+
+
+def test_scene_windows_close_at_size_and_hash_content() -> None:
+    chunks = synthetic_season(10, 1, words_per_chunk=5)
+
+    windows = scene_windows(1, 1, list(reversed(chunks)), 4)
+
+    assert [w.chunk_ids for w in windows] == [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]]
+    assert [w.closed for w in windows] == [True, True, False]
+    chunks[0] = dict(chunks[0], text="changed")
+    changed = scene_windows(1, 1, chunks, 4)
+    assert changed[0].content_hash != windows[0].content_hash
+    assert changed[1].content_hash == windows[1].content_hash
+
+
+def test_commit_refresh_digests_only_closed_windows_once() -> None:
+    db = _season(chunks=10, episodes=1)
+    generator, log = mock_generator(db, window_size=4)
+
+    generator.refresh_scene_digests(1, 1)
+    generator.refresh_scene_digests(1, 1)
+
+    assert log.count("digest") == 2
+    assert sorted(db.digests[(1, 1)]) == [0, 1]
+
+
+def test_season_is_built_from_episode_summaries_and_reused() -> None:
+    db = _season()
+    generator, log = mock_generator(db, window_size=4)
+
+    simulate_commits(generator, db)
+
+    assert (log.count("digest"), log.count("episode"), log.count("season")) == (
+        6,
+        2,
+        1,
+    )
+    season_prompts: List[Tuple[str, Any]] = []
+    provider = generator._providers["season"]
+    original = provider.get_structured_completion
+    provider.get_structured_completion = lambda prompt, schema: (
+        season_prompts.append((prompt, schema)) or original(prompt, schema)
+    )
+    log.calls.clear()
+
+    generator.generate_season_summary(1)
+
+    assert log.calls == [] and season_prompts == []
+    db.source_hashes.pop(("season", 1, None))
+    generator.generate_season_summary(1)
+    (prompt, _schema) = season_prompts[0]
+    assert "## The Episode Summaries" in prompt
+    assert db.chunks[1]["text"] not in prompt
+
+
+def test_edit_resummarizes_one_window_episode_and_season() -> None:
+    db = _season()
+    generator, log = mock_generator(db, window_size=4)
+    simulate_commits(generator, db)
+    first_episode = db.episode_summaries[(1, 1)]
+    log.calls.clear()
+
+    edit_chunk(db, 18)
+    generator.generate_season_summary(1)
+
+    assert (log.count("digest"), log.count("episode"), log.count("season")) == (
+        1,
+        1,
+        1,
+    )
+    assert db.episode_summaries[(1, 1)] is first_episode
+
+
+def test_episode_prompt_keeps_context_chunks_outside_the_hash() -> None:
+    db = _season()
+    generator, log = mock_generator(db, window_size=4)
+    episode_prompts: List[str] = []
+    provider = generator._providers["episode"]
+    original = provider.get_structured_completion
+    provider.get_structured_completion = lambda prompt, schema: (
+        episode_prompts.append(prompt) or original(prompt, schema)
+    )
+
+    generator.generate_episode_summary(1, 2)
+
+    assert "## Context Chunks From Adjacent Episodes" in episode_prompts[0]
+    assert "S01E01_012 [CONTEXT CHUNK]" in episode_prompts[0]
+    windows = scene_windows(1, 2, db.get_episode_chunks(1, 2), 4)
+    assert [window.chunk_ids[0] for window in windows] == [13, 17, 21]
+    edit_chunk(db, 12)
+    log.calls.clear()
+    generator.generate_episode_summary(1, 2)
+    assert log.calls == []
+
+
+def test_summary_db_managers_are_shared_per_database(monkeypatch) -> None:
+    from nexus.api import summary_triggers
+
+    opened: List[Any] = []
+
+    class _Engine:
+        def __init__(self) -> None:
+            self.disposed = False
+
+        def dispose(self) -> None:
+            self.disposed = True
+
+    class _Manager:
+        def __init__(self, db_url: Any = None) -> None:
+            self.db_url = db_url
+            self.engine = _Engine()
+            opened.append(self)
+
+    monkeypatch.setattr(summary_triggers, "DatabaseManager", _Manager)
+    monkeypatch.setattr(summary_triggers, "_db_managers", {})
+
+    first = summary_triggers._open_db_manager(1, None)
+    assert summary_triggers._open_db_manager(1, None) is first
+    assert summary_triggers._open_db_manager(2, None) is not first
+    summary_triggers.dispose_db_managers()
+
+    assert len(opened) == 2
+    assert all(manager.engine.disposed for manager in opened)
+    assert summary_triggers._open_db_manager(1, None) is not first
+
+
+class _Cursor:
+    def __init__(self) -> None:
+        self.rows: List[tuple] = []
+
+    def execute(self, _sql: str, params: tuple) -> None:
+        self.rows.append(params)
+
+    def fetchone(self) -> tuple:
+        return (len(self.rows),)
+
+
+def test_accepted_chunk_enqueues_a_digest_job() -> None:
+    cur = _Cursor()
+
+    job_ids = enqueue_accepted_chunk_jobs(
+        cur,
+        chunk_id=42,
+        parent_chunk_id=41,
+        summary_tasks=[],
+        compact_correspondence=False,
+        audit_presence=False,
+        digest_scenes=True,
+    )
+
+    assert job_ids == [1]
+    assert cur.rows[0][:3] == ("summary_digest", "42", 42)
+    assert json.loads(cur.rows[0][3]) == {}
@@ -55,7 +55,7 @@ def _connect(dbname: str) -> Any:
 
 @pytest.fixture()
 def disposable_interaction_db() -> Iterator[str]:
-    """Clone the template, apply migration 105 twice, then drop the clone."""
+    """Clone the template, apply migrations 105 and 116 twice, then drop it."""
     dbname = f"nexus_test_interactions_{uuid.uuid4().hex[:12]}"
     admin = _connect("postgres")
     admin.autocommit = True
@@ -68,9 +68,12 @@ def disposable_interaction_db() -> Iterator[str]:
                 )
             )
         migration = Path("migrations/105_interaction_threads.sql").read_text()
+        snapshots = Path("migrations/116_interaction_replay_snapshots.sql").read_text()
         with _connect(dbname) as conn, conn.cursor() as cur:
             cur.execute(migration)
             cur.execute(migration)
+            cur.execute(snapshots)
+            cur.execute(snapshots)
         yield dbname
     finally:
         with admin.cursor() as cur:
@@ -768,6 +771,62 @@ def test_cooperative_public_api_flow_replay_equals_live_state(
     )
 
 
+def test_replay_resumes_from_snapshots_and_bulk_audit_matches_live_state(
+    interaction_harness: _InteractionHarness,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from nexus.interactions import service as service_module
+
+    monkeypatch.setattr(service_module, "REPLAY_SNAPSHOT_INTERVAL", 3)
+    harness = interaction_harness
+    interaction_id, _ = _propose(harness)
+    _grant_all(harness, interaction_id, _lifecycle_envelope("start"))
+    _start(harness, interaction_id)
+
+    def touch() -> None:
+        harness.service.touch(
+            harness.handler,
+            interaction_id=interaction_id,
+            lease_until=_utc_now() + timedelta(seconds=90),
+            command_id=uuid.uuid4(),
+        )
+
+    touch()
+    first = harness.service.replay(interaction_id)
+    touch()
+    transition = _transition()
+    _grant_all(harness, interaction_id, transition.authorization_envelope())
+    harness.service.transition(
+        harness.handler,
+        interaction_id=interaction_id,
+        transition=transition,
+        command_id=uuid.uuid4(),
+    )
+    for _ in range(3):
+        touch()
+    replayed = harness.service.replay(interaction_id)
+    with harness.session_factory() as session, session.begin():
+        snapshots = session.execute(
+            text(
+                """
+                SELECT interaction_revision, last_event_id
+                FROM interaction_replay_snapshots
+                WHERE interaction_id = :id
+                ORDER BY interaction_revision
+                """
+            ),
+            {"id": interaction_id},
+        ).all()
+        audit = service_module.audit_interactions(session)
+
+    assert first.lease_until is not None and len(snapshots) == 2
+    assert replayed == harness.service.current_state(interaction_id)
+    assert replayed.transition_types == ("negotiation.counteroffer",)
+    assert audit["interactions"] == audit["matched"] == 1
+    assert audit["mismatched"] == [] and audit["errors"] == []
+    assert audit["snapshots_used"] == 1 and audit["events_folded"] == 0
+
+
 def test_adversarial_public_api_flow_stops_and_replays_exactly(
     interaction_harness: _InteractionHarness,
 ) -> None:
@@ -0,0 +1,54 @@
+"""Offline tests for the incremental interaction replay fold."""
+
+from __future__ import annotations
+
+import json
+import uuid
+
+import pytest
+
+from nexus.cli import build_parser
+from nexus.interactions import InteractionStatus
+from nexus.interactions.replay import ReplayFold
+from scripts.benchmark_interaction_replay import (
+    fold_rows,
+    legacy_replay,
+    snapshot_at,
+    synthetic_thread,
+)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_fold_matches_the_per_event_pydantic_replay(seed: int) -> None:
+    interaction_id = uuid.uuid4()
+    rows = synthetic_thread(interaction_id, 600, seed=seed)
+
+    replayed = fold_rows(rows, ReplayFold()).to_model(interaction_id)
+
+    assert replayed == legacy_replay(interaction_id, rows)
+    assert replayed.status is InteractionStatus.STOPPED
+    assert replayed.active_participant_entity_ids == ()
+
+
+@pytest.mark.parametrize("position", [1, 2, 157, 599])
+def test_resuming_from_a_json_snapshot_equals_the_full_fold(position: int) -> None:
+    interaction_id = uuid.uuid4()
+    rows = synthetic_thread(interaction_id, 600, seed=7)
+    snapshot = snapshot_at(rows, position)
+
+    resumed = ReplayFold.from_snapshot(snapshot["last_event_id"], snapshot["state"])
+    fold_rows(rows[position:], resumed)
+
+    assert resumed.events_folded == len(rows) - position
+    assert resumed.to_model(interaction_id) == fold_rows(rows, ReplayFold()).to_model(
+        interaction_id
+    )
+    # Folding the tail must not mutate the snapshot it was restored from.
+    assert snapshot == json.loads(json.dumps(snapshot_at(rows, position)))
+
+
+def test_audit_interactions_command_is_slot_scoped() -> None:
+    args = build_parser().parse_args(["audit-interactions", "--slot", "2"])
+
+    assert args.command == "audit-interactions"
+    assert args.slot == 2 and args.checkpoint is False
@@ -168,3 +168,10 @@ def test_jobs_cli_reports_counts_and_non_terminal_rows(
         }
         assert payload["non_terminal_jobs"][0]["lease_until"] is None
         assert payload["non_terminal_jobs"][1]["lease_until"] is not None
+        assert payload["post_commit"]["counts"] == {
+            "queued": 0,
+            "leased": 0,
+            "succeeded": 0,
+            "failed": 0,
+        }
+        assert payload["post_commit"]["non_terminal_jobs"] == []
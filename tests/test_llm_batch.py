@@ -0,0 +1,224 @@
+"""Tests for the concurrent, resumable LLM batch engine."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+
+import openai
+import pytest
+from fastapi.testclient import TestClient
+
+from nexus.api.mock_openai import app
+from scripts.llm_batch import (
+    BatchRequest,
+    CheckpointLedger,
+    estimate_cost,
+    missing_batch_result,
+    run_openai_batch,
+    run_requests,
+)
+
+
+def _requests(count: int) -> List[BatchRequest]:
+    return [
+        BatchRequest(
+            key=str(index),
+            provider="openai",
+            model="gpt-4.1",
+            prompt=f"Estimate the minutes elapsed in chunk {index}.",
+            params={"temperature": 0.1, "max_output_tokens": 50},
+        )
+        for index in range(count)
+    ]
+
+
+def _mock_client() -> openai.OpenAI:
+    return openai.OpenAI(
+        api_key="test",
+        base_url="http://testserver/v1",
+        http_client=TestClient(app),
+    )
+
+
+def test_calls_run_concurrently_and_apply_in_request_order(tmp_path: Path) -> None:
+    requests = _requests(6)
+    gate = threading.Barrier(3, timeout=5)
+    applied: List[str] = []
+
+    def call(request: BatchRequest) -> Dict[str, Any]:
+        if int(request.key) < 3:
+            gate.wait()  # only passes if three calls are in flight at once
+        return {"text": f"answer {request.key}"}
+
+    summary = run_requests(
+        requests,
+        call,
+        lambda request, result: applied.append(result["text"]),
+        ledger=CheckpointLedger(tmp_path / "ledger.jsonl"),
+        max_workers=3,
+    )
+
+    assert applied == [f"answer {index}" for index in range(6)]
+    assert summary.called == summary.applied == 6
+
+
+def test_restart_applies_checkpointed_answers_without_calling(tmp_path: Path) -> None:
+    requests = _requests(4)
+    path = tmp_path / "ledger.jsonl"
+    calls: List[str] = []
+
+    def call(request: BatchRequest) -> Dict[str, Any]:
+        calls.append(request.key)
+        return {"text": request.key}
+
+    def crash_on_third(request: BatchRequest, result: Dict[str, Any]) -> None:
+        if request.key == "2":
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        run_requests(requests, call, crash_on_third, ledger=CheckpointLedger(path))
+    assert sorted(calls) == ["0", "1", "2", "3"]
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('{"event": "result", "hash": "torn')
+
+    calls.clear()
+    applied: List[str] = []
+    summary = run_requests(
+        requests,
+        call,
+        lambda request, result: applied.append(result["text"]),
+        ledger=CheckpointLedger(path),
+    )
+
+    assert calls == []
+    assert applied == ["2", "3"]
+    assert summary.already_applied == 2
+    assert summary.from_ledger == 2
+
+
+def test_failed_calls_are_skipped_and_retried_next_run(tmp_path: Path) -> None:
+    requests = _requests(3)
+    path = tmp_path / "ledger.jsonl"
+
+    def flaky(request: BatchRequest) -> Dict[str, Any]:
+        if request.key == "1":
+            raise RuntimeError("429 rate limited")
+        return {"text": request.key}
+
+    first = run_requests(
+        requests, flaky, lambda r, res: None, ledger=CheckpointLedger(path)
+    )
+    second = run_requests(
+        requests,
+        lambda r: {"text": r.key},
+        lambda r, res: None,
+        ledger=CheckpointLedger(path),
+    )
+
+    assert first.failed == 1 and first.errors == {"1": "429 rate limited"}
+    assert second.called == 1 and second.already_applied == 2
+
+
+def test_dry_runs_checkpoint_answers_without_marking_them_applied(
+    tmp_path: Path,
+) -> None:
+    requests = _requests(2)
+    path = tmp_path / "ledger.jsonl"
+    run_requests(
+        requests,
+        lambda r: {"text": r.key},
+        lambda r, res: None,
+        ledger=CheckpointLedger(path),
+        record_applied=False,
+    )
+
+    summary = run_requests(
+        requests,
+        missing_batch_result,
+        lambda r, res: None,
+        ledger=CheckpointLedger(path),
+    )
+
+    assert summary.from_ledger == summary.applied == 2
+
+
+def test_cost_estimate_counts_only_unanswered_requests(tmp_path: Path) -> None:
+    requests = _requests(3)
+    ledger = CheckpointLedger(tmp_path / "ledger.jsonl")
+    ledger.record_result(requests[0], {"text": "0"})
+
+    estimate = estimate_cost(
+        requests + [requests[1]],
+        ledger=ledger,
+        input_price_per_mtok=2.0,
+        output_price_per_mtok=8.0,
+        tokenizer=lambda text, model: 1000,
+    )
+
+    assert (estimate.requests, estimate.cached) == (2, 1)
+    assert (estimate.input_tokens, estimate.max_output_tokens) == (2000, 100)
+    assert estimate.total_cost == pytest.approx(0.0048)
+
+
+def test_batch_api_round_trip_through_the_mock_server(tmp_path: Path) -> None:
+    requests = _requests(3)
+    path = tmp_path / "ledger.jsonl"
+
+    outcome = run_openai_batch(_mock_client(), requests, CheckpointLedger(path))
+
+    ledger = CheckpointLedger(path)
+    assert outcome.submitted == outcome.recorded == 3
+    assert ledger.open_batches() == {}
+    assert all(
+        ledger.result(r.request_hash)["text"] == "[TEST MODE] Mock response"
+        for r in requests
+    )
+    again = run_openai_batch(_mock_client(), requests, ledger)
+    assert again.batch_ids == []
+
+
+def test_restart_polls_an_open_batch_instead_of_resubmitting(tmp_path: Path) -> None:
+    requests = _requests(2)
+    client = _mock_client()
+    lines = "".join(
+        json.dumps(
+            {
+                "custom_id": r.request_hash,
+                "method": "POST",
+                "url": "/v1/responses",
+                "body": {"model": r.model, "input": r.prompt},
+            }
+        )
+        + "\n"
+        for r in requests
+    )
+    upload = client.files.create(file=("in.jsonl", lines.encode()), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=upload.id, endpoint="/v1/responses", completion_window="24h"
+    )
+    ledger = CheckpointLedger(tmp_path / "ledger.jsonl")
+    ledger.record_batch(batch.id, [r.request_hash for r in requests])
+
+    outcome = run_openai_batch(client, requests, CheckpointLedger(ledger.path))
+
+    assert outcome.batch_ids == [batch.id]
+    assert (outcome.submitted, outcome.recorded) == (0, 2)
+
+
+def test_batch_line_failures_are_reported_not_recorded(tmp_path: Path) -> None:
+    bad = BatchRequest(
+        key="bad",
+        provider="openai",
+        model="gpt-4.1",
+        prompt="Estimate the minutes.",
+        params={"temperature": "hot"},
+    )
+    ledger = CheckpointLedger(tmp_path / "ledger.jsonl")
+
+    outcome = run_openai_batch(_mock_client(), [bad], ledger)
+
+    assert outcome.recorded == 0 and "bad" in outcome.errors
+    assert ledger.result(bad.request_hash) is None
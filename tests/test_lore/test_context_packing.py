@@ -0,0 +1,211 @@
+"""Tests for the context packing engine and its structured/Phase 2 callers."""
+
+from __future__ import annotations
+
+import itertools
+import random
+from typing import Any, Dict, List
+
+import pytest
+
+from nexus.agents.lore.utils import chunk_operations, context_packing
+from nexus.agents.lore.utils.context_packing import (
+    PackCandidate,
+    greedy_pack,
+    pack_candidates,
+)
+from nexus.agents.lore.utils.token_budget import TokenBudgetManager
+from nexus.memory import incremental
+from nexus.memory.context_state import ContextStateManager
+from nexus.memory.incremental import IncrementalRetriever
+from nexus.memory.query_memory import QueryMemory
+
+
+def _candidate(key: str, tokens: int, utility: float, **kwargs: Any) -> PackCandidate:
+    return PackCandidate(
+        key=key,
+        kind=kwargs.pop("kind", "chunk"),
+        tokens=tokens,
+        utility=utility,
+        **kwargs,
+    )
+
+
+def test_packing_recovers_utility_a_first_overflow_stop_leaves_behind() -> None:
+    candidates = [
+        _candidate("long", 60, 5.0),
+        _candidate("a", 50, 4.0),
+        _candidate("b", 50, 4.0),
+    ]
+
+    greedy = greedy_pack(candidates, 100, stop_at_overflow=True)
+    packed = pack_candidates(candidates, 100)
+
+    assert [c.key for c in greedy.selected] == ["long"]
+    assert [c.key for c in packed.selected] == ["a", "b"]
+    assert packed.utility == 8.0 and packed.tokens == 100
+
+
+def test_protected_candidates_are_kept_even_when_they_overflow() -> None:
+    baseline = _candidate("baseline", 120, 0.0, kind="characters", required=True)
+    featured = _candidate("featured", 10, 9.0, kind="characters")
+
+    packed = pack_candidates([featured, baseline], 100)
+
+    assert packed.selected == [baseline]
+    assert packed.overflow == 20
+
+
+def test_class_limits_bound_each_class_and_count_protected_tokens() -> None:
+    candidates = [
+        _candidate("base", 30, 0.0, kind="events", required=True),
+        _candidate("e1", 40, 9.0, kind="events"),
+        _candidate("e2", 20, 8.0, kind="events"),
+        _candidate("r1", 40, 1.0, kind="relationships"),
+    ]
+
+    packed = pack_candidates(candidates, 200, class_limits={"events": 60})
+
+    assert {c.key for c in packed.selected} == {"base", "e2", "r1"}
+
+
+def test_packing_matches_brute_force_on_small_instances() -> None:
+    rng = random.Random(20260918)
+    for _ in range(150):
+        candidates = [
+            _candidate(
+                str(index),
+                rng.randint(1, 40),
+                round(rng.uniform(0.1, 10.0), 2),
+                kind=rng.choice(["chunk", "retrograde_summary"]),
+            )
+            for index in range(rng.randint(1, 8))
+        ]
+        capacity = rng.randint(10, 120)
+        limits = {"chunk": rng.randint(5, 80)} if rng.random() < 0.5 else None
+
+        packed = pack_candidates(
+            candidates, capacity, class_limits=limits, resolution=capacity
+        )
+
+        best = 0.0
+        for size in range(len(candidates) + 1):
+            for subset in itertools.combinations(candidates, size):
+                chunk_tokens = sum(c.tokens for c in subset if c.kind == "chunk")
+                if sum(c.tokens for c in subset) > capacity:
+                    continue
+                if limits and chunk_tokens > limits["chunk"]:
+                    continue
+                best = max(best, sum(c.utility for c in subset))
+        assert packed.tokens <= capacity
+        assert packed.utility == pytest.approx(best)
+
+
+def test_coarse_resolution_never_exceeds_capacity() -> None:
+    rng = random.Random(7)
+    candidates = [
+        _candidate(str(index), rng.randint(100, 5000), rng.uniform(0.1, 1.0))
+        for index in range(60)
+    ]
+
+    packed = pack_candidates(candidates, 40_000, resolution=64)
+
+    assert packed.tokens <= 40_000
+    assert packed.tokens > 39_000  # rounding slack is refilled
+
+
+def _entity(name: str, tokens: int, **fields: Any) -> Dict[str, Any]:
+    return {"name": name, "token_count": tokens, **fields}
+
+
+def test_structured_trim_protects_baseline_and_packs_featured_items() -> None:
+    manager = TokenBudgetManager({})
+    entity_data = {
+        "characters": {
+            "baseline": [_entity("Alex", 50)],
+            "featured": [
+                _entity(name, 33, reference_type="mentioned")
+                for name in ("Emilia", "Pete", "Lee")
+            ],
+        },
+        "locations": {
+            "baseline": [],
+            "featured": [_entity("Night City", 70, reference_type="setting")],
+        },
+        "factions": {"baseline": [], "featured": []},
+        "relationships": [],
+        "events": [],
+        "threats": [],
+    }
+
+    trimmed = manager.trim_structured_with_baseline_protection(entity_data, 150)
+
+    # First fit by tier would keep only the setting (70 tokens, then nothing
+    # else fits); three lower-tier characters are worth more together.
+    assert trimmed["characters"]["baseline"] == entity_data["characters"]["baseline"]
+    assert [e["name"] for e in trimmed["characters"]["featured"]] == [
+        "Emilia",
+        "Pete",
+        "Lee",
+    ]
+    assert trimmed["locations"]["featured"] == []
+
+
+class _Memnon:
+    def __init__(self, results: List[Dict[str, Any]]) -> None:
+        self.results = results
+
+    def query_memory(self, **kwargs: Any) -> Dict[str, Any]:
+        return {"results": self.results}
+
+
+def test_raw_input_retrieval_skips_an_oversized_chunk_instead_of_stopping(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        incremental,
+        "estimate_chunk_tokens_batch",
+        lambda texts: [len(text.split()) for text in texts],
+    )
+    results = [
+        {"id": 11, "text": "word " * 90, "score": 0.9},
+        {"id": 12, "text": "word " * 40, "score": 0.8},
+        {"id": 13, "text": "word " * 40, "score": 0.7},
+    ]
+    retriever = IncrementalRetriever(
+        _Memnon(results), ContextStateManager(), QueryMemory()
+    )
+
+    chunks, tokens = retriever.retrieve_from_raw_input("karaoke", budget=100)
+
+    assert [chunk["id"] for chunk in chunks] == [12, 13]
+    assert tokens == 80
+
+    # The dropped chunk was never collected, so a later pass can still take it.
+    retriever.memnon = _Memnon(results[:1])
+    chunks, tokens = retriever.retrieve_from_raw_input("karaoke night", budget=100)
+
+    assert [chunk["id"] for chunk in chunks] == [11]
+    assert tokens == 90
+
+
+def test_token_estimates_fall_back_to_word_counts_without_an_encoding(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: List[List[str]] = []
+
+    def offline(texts: List[str]) -> List[int]:
+        calls.append(texts)
+        raise ConnectionError("o200k_base download failed")
+
+    monkeypatch.setattr(chunk_operations, "calculate_chunk_tokens_batch", offline)
+    monkeypatch.setattr(chunk_operations, "_ENCODING_UNAVAILABLE", False)
+
+    assert chunk_operations.estimate_chunk_tokens_batch(["one two three four"]) == [5]
+    assert chunk_operations.estimate_chunk_tokens("one two") == 2
+    assert len(calls) == 1
+
+
+def test_featured_tiers_double_per_step() -> None:
+    tiers = context_packing.FEATURED_TIER_UTILITY
+    assert all(tiers[p] == 2 * tiers[p + 1] for p in range(1, 8))
@@ -0,0 +1,143 @@
+"""Tests for length-bucketed batch embedding of experiences and summaries."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from nexus.agents.memnon.utils import embedding_manager as em
+from nexus.agents.memnon.utils.embedding_batches import (
+    embed_in_length_buckets,
+    length_buckets,
+)
+from nexus.agents.orrery import retrograde_embedding
+from scripts.benchmark_embedding_batches import (
+    MODEL_KEY,
+    bench_manager,
+    embed_bucketed,
+    embed_loop,
+    max_abs_difference,
+    save_synthetic_model,
+    synthetic_corpus,
+)
+
+
+class _WordCountManager:
+    """Manager stand-in that records each batch and returns [words, index]."""
+
+    def __init__(self, **_kwargs: Any) -> None:
+        self.batches: list[tuple[list[str], int | None]] = []
+
+    def get_available_models(self) -> list[str]:
+        return ["test-embed"]
+
+    def generate_embeddings_batch(
+        self, texts: list[str], _model: str, batch_size: int | None = None
+    ) -> list[list[float]]:
+        self.batches.append((texts, batch_size))
+        return [[float(len(text.split())), float(len(self.batches))] for text in texts]
+
+
+def test_buckets_sort_longest_first_and_respect_the_padded_budget() -> None:
+    lengths = [5, 40, 3, 40, 12, 200, 7, 12]
+
+    buckets = length_buckets(lengths, token_budget=100, max_batch_size=3)
+
+    assert sorted(index for bucket in buckets for index in bucket) == list(
+        range(len(lengths))
+    )
+    assert buckets[0] == (5,)  # 200 tokens exceeds the budget on its own
+    assert buckets[1] == (1, 3)  # 3 x 40 would pad past 100
+    for bucket in buckets:
+        assert [lengths[i] for i in bucket] == sorted(
+            (lengths[i] for i in bucket), reverse=True
+        )
+        assert len(bucket) <= 3
+        assert len(bucket) == 1 or len(bucket) * lengths[bucket[0]] <= 100
+
+
+def test_bucketed_vectors_stay_aligned_with_their_inputs() -> None:
+    texts = ["a b c", "a", "a b c d e f", "a b"]
+    manager = _WordCountManager()
+
+    buckets = embed_in_length_buckets(
+        manager,
+        texts,
+        ["test-embed"],
+        keys=[11, 22, 33, 44],
+        subject="experiences",
+        token_budget=6,
+    )
+
+    aligned = {
+        index: vector[0]
+        for bucket in buckets["test-embed"]
+        for index, vector in zip(bucket.indices, bucket.vectors)
+    }
+    assert aligned == {0: 3.0, 1: 1.0, 2: 6.0, 3: 2.0}
+    assert [len(texts) for texts, _size in manager.batches] == [1, 2, 1]
+    assert all(size == len(texts) for texts, size in manager.batches)
+
+
+def test_a_short_batch_fails_the_whole_set_with_its_keys() -> None:
+    class DroppingManager(_WordCountManager):
+        def generate_embeddings_batch(self, texts, model, batch_size=None):
+            return super().generate_embeddings_batch(texts, model, batch_size)[:-1]
+
+    with pytest.raises(RuntimeError, match=r"summaries \[7, 8\] with model m"):
+        embed_in_length_buckets(
+            DroppingManager(),
+            ["one two", "three"],
+            ["m"],
+            keys=[7, 8],
+            subject="summaries",
+        )
+
+
+def test_shared_manager_is_cached_only_after_a_matching_load(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    constructed: list[_WordCountManager] = []
+
+    class CountingManager(_WordCountManager):
+        def __init__(self, **kwargs: Any) -> None:
+            super().__init__(**kwargs)
+            constructed.append(self)
+
+    monkeypatch.setattr(em, "EmbeddingManager", CountingManager)
+    monkeypatch.setattr(retrograde_embedding, "_MANAGER_CACHE", {})
+    monkeypatch.setattr(
+        retrograde_embedding,
+        "active_memnon_embedding_model_dimensions",
+        lambda: {"other-embed": 2},
+    )
+    settings = {"models": {"test-embed": {"dimensions": 2}}}
+
+    with pytest.raises(RuntimeError, match="did not match configuration"):
+        retrograde_embedding.active_memnon_embedding_manager(settings)
+    monkeypatch.setattr(
+        retrograde_embedding,
+        "active_memnon_embedding_model_dimensions",
+        lambda: {"test-embed": 2},
+    )
+    first = retrograde_embedding.active_memnon_embedding_manager(settings)
+    second = retrograde_embedding.active_memnon_embedding_manager(settings)
+
+    assert first is second
+    assert first[1] == ["test-embed"]
+    assert len(constructed) == 2
+
+
+def test_bucketed_embeddings_match_the_per_text_loop(tmp_path: Path) -> None:
+    torch = pytest.importorskip("torch")
+    torch.manual_seed(0)
+    manager = bench_manager(save_synthetic_model(tmp_path, hidden=32, layers=1))
+    assert manager.get_available_models() == [MODEL_KEY]
+    texts = synthetic_corpus(24, seed=3)
+
+    assert (
+        max_abs_difference(embed_loop(manager, texts), embed_bucketed(manager, texts))
+        < 1e-4
+    )
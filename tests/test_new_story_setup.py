@@ -151,3 +151,51 @@ def test_fresh_database_is_baseline_stamped(
         assert (applied, failed) == (0, 0)
     finally:
         subprocess.run(["dropdb", "--if-exists", _TARGET_DB], check=False)
+
+
+def test_spare_is_claimed_by_rename_and_discarded_when_template_moves(
+    template_db: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A ready spare becomes the slot; one cloned before a template change does not."""
+    monkeypatch.setattr(new_story_setup, "USE_POOL", False)
+    spare_db = f"{template_db}_spare"
+
+    try:
+        new_story_setup.prepare_spare_database(template_db, background=False)
+        new_story_setup.initialize_slot_database(
+            _TARGET_DB, source_db=template_db, keep_spare=True
+        )
+        # Claimed by rename, then refilled in the background; wait for it.
+        new_story_setup.prepare_spare_database(template_db, background=False)
+
+        conn = _connect(_TARGET_DB)
+        try:
+            with conn, conn.cursor() as cur:
+                cur.execute("SELECT COUNT(*) FROM public.narrative_chunks")
+                assert cur.fetchone()[0] == 0
+                cur.execute("SELECT nextval('public.narrative_chunks_id_seq')")
+                assert cur.fetchone()[0] == 1
+        finally:
+            conn.close()
+
+        conn = _connect(template_db)
+        try:
+            with conn, conn.cursor() as cur:
+                cur.execute(
+                    "INSERT INTO public.tags (tag, entity_kind) "
+                    "VALUES ('wary', 'character')"
+                )
+        finally:
+            conn.close()
+        assert not new_story_setup._claim_spare_database(_TARGET_DB, template_db)
+
+        conn = _connect("postgres")
+        try:
+            with conn, conn.cursor() as cur:
+                cur.execute("SELECT 1 FROM pg_database WHERE datname = %s", (spare_db,))
+                assert cur.fetchone() is None
+        finally:
+            conn.close()
+    finally:
+        subprocess.run(["dropdb", "--if-exists", _TARGET_DB], check=False)
+        subprocess.run(["dropdb", "--if-exists", spare_db], check=False)
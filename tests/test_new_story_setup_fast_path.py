@@ -0,0 +1,144 @@
+"""Offline tests for the template-copy and pre-cloned-spare slot paths."""
+
+from __future__ import annotations
+
+from typing import Any, List, Set
+
+import pytest
+from psycopg2 import errors as pg_errors
+
+from scripts import new_story_setup
+
+
+class _FakeCursor:
+    def __init__(self, server_version: int, in_use: bool = False) -> None:
+        self.server_version = server_version
+        self.in_use = in_use
+        self.statements: List[str] = []
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def execute(self, query: Any, params: Any = None) -> None:
+        # Composed SQL needs a live connection to render; its repr is enough.
+        text = query if isinstance(query, str) else repr(query)
+        self.statements.append(text)
+        if "CREATE DATABASE" in text and self.in_use:
+            raise pg_errors.ObjectInUse("source database is being accessed")
+
+    def fetchone(self) -> tuple:
+        return (str(self.server_version),)
+
+
+class _FakeAdminConnection:
+    def __init__(self, cursor: _FakeCursor) -> None:
+        self._cursor = cursor
+        self.closed = False
+
+    def cursor(self) -> _FakeCursor:
+        return self._cursor
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _Provisioning:
+    """Records which provisioning steps initialize_slot_database takes."""
+
+    def __init__(self) -> None:
+        self.steps: List[str] = []
+        self.succeeding: Set[str] = set()
+
+    def attempt(self, step: str) -> bool:
+        self.steps.append(step)
+        return step in self.succeeding
+
+
+@pytest.fixture
+def provisioning(monkeypatch: pytest.MonkeyPatch) -> _Provisioning:
+    recorder = _Provisioning()
+    monkeypatch.setattr(
+        new_story_setup,
+        "_claim_spare_database",
+        lambda target, source: recorder.attempt("claim"),
+    )
+    monkeypatch.setattr(
+        new_story_setup,
+        "clone_template_database",
+        lambda target, source: recorder.attempt("clone"),
+    )
+    monkeypatch.setattr(
+        new_story_setup,
+        "_restore_from_dump",
+        lambda target, source: recorder.attempt("dump"),
+    )
+    monkeypatch.setattr(
+        new_story_setup,
+        "_require_migration_stamps",
+        lambda source, target: recorder.attempt("stamps"),
+    )
+    monkeypatch.setattr(
+        new_story_setup,
+        "prepare_spare_database",
+        lambda source: recorder.attempt("refill"),
+    )
+    monkeypatch.setattr(new_story_setup, "ensure_global_variables", lambda db: None)
+    monkeypatch.setattr(new_story_setup, "HAS_MIGRATE", False)
+    return recorder
+
+
+@pytest.mark.parametrize(
+    ("keep_spare", "succeeding", "expected"),
+    [
+        (False, ["clone"], ["clone", "stamps"]),
+        (False, [], ["clone", "dump", "stamps"]),
+        (True, ["claim"], ["claim", "stamps", "refill"]),
+        (True, ["clone"], ["claim", "clone", "stamps", "refill"]),
+    ],
+)
+def test_provisioning_prefers_spare_then_template_copy_then_dump(
+    provisioning: _Provisioning,
+    keep_spare: bool,
+    succeeding: List[str],
+    expected: List[str],
+) -> None:
+    provisioning.succeeding.update(succeeding)
+
+    new_story_setup.initialize_slot_database(
+        "save_04", source_db="NEXUS_template", keep_spare=keep_spare
+    )
+
+    assert provisioning.steps == expected
+
+
+@pytest.mark.parametrize(
+    ("server_version", "strategy"),
+    [(160002, " STRATEGY FILE_COPY"), (140011, "")],
+)
+def test_template_copy_uses_file_copy_strategy_when_the_server_has_it(
+    monkeypatch: pytest.MonkeyPatch, server_version: int, strategy: str
+) -> None:
+    cursor = _FakeCursor(server_version)
+    monkeypatch.setattr(
+        new_story_setup, "_admin_connect", lambda: _FakeAdminConnection(cursor)
+    )
+
+    assert new_story_setup._clone_database("save_02", "NEXUS_template") is True
+    statement = cursor.statements[-1]
+    assert "CREATE DATABASE" in statement
+    assert "Identifier('NEXUS_template')" in statement
+    assert ("STRATEGY FILE_COPY" in statement) is bool(strategy)
+
+
+def test_template_in_use_falls_back_instead_of_failing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cursor = _FakeCursor(160002, in_use=True)
+    connection = _FakeAdminConnection(cursor)
+    monkeypatch.setattr(new_story_setup, "_admin_connect", lambda: connection)
+
+    assert new_story_setup._clone_database("save_02", "NEXUS_template") is False
+    assert connection.closed
@@ -20,6 +20,7 @@ from __future__ import annotations
 import json
 import os
 import uuid
+from dataclasses import asdict
 from typing import Any
 
 import psycopg2
@@ -28,7 +29,11 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session
 
 from nexus.agents.orrery.events import commit_orrery_tick_sync
-from nexus.agents.orrery.history import adjudication_history
+from nexus.agents.orrery.history import (
+    _ledger_from_log,
+    _ledger_from_rollups,
+    adjudication_history,
+)
 from nexus.agents.orrery.resolver import (
     OrreryResolutionDraft,
     OrreryScenePressureDraft,
@@ -342,3 +347,86 @@ def test_history_is_non_vacuous_on_audited_slots() -> None:
         "no audited slot has adjudication-log rows — the history assertions "
         "are vacuous; repoint HISTORY_SLOTS at a slot with Skald rulings"
     )
+
+
+@pytest.mark.parametrize("slot", HISTORY_SLOTS)
+def test_rollups_match_log_recomputation(slot: int) -> None:
+    engine = create_engine(get_slot_db_url(slot=slot))
+    try:
+        with Session(engine) as session:
+            for limit in (None, 5):
+                from_rollups = _ledger_from_rollups(
+                    session, template_id=None, recent_rulings_limit=limit
+                )
+                from_log = _ledger_from_log(
+                    session,
+                    template_clause="",
+                    params={},
+                    recent_rulings_limit=limit,
+                )
+                assert asdict(from_rollups) == asdict(from_log)
+    finally:
+        engine.dispose()
+
+
+def test_tick_commit_maintains_proposal_rollup_and_streaks() -> None:
+    conn = _connect(WRITE_SLOT)
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT id FROM narrative_chunks ORDER BY id DESC LIMIT 3")
+            later, middle, earlier = (row[0] for row in cur.fetchall())
+            binding_hash = f"rollup-probe-{uuid.uuid4().hex}"
+            proposal_id = f"sleep:{binding_hash}"
+            for tick, action in (
+                (earlier, "defer"),
+                (middle, "defer"),
+                (later, "void"),
+            ):
+                cur.execute(
+                    """
+                    INSERT INTO orrery_adjudication_log (
+                        tick_chunk_id, proposal_id, template_id, binding_hash,
+                        action
+                    ) VALUES (%s, %s, 'sleep', %s, %s)
+                    """,
+                    (tick, proposal_id, binding_hash, action),
+                )
+
+            cur.execute(
+                """
+                SELECT defers, voids, current_streak, last_event, last_tick
+                FROM orrery_adjudication_proposal_rollups
+                WHERE proposal_id = %s
+                """,
+                (proposal_id,),
+            )
+            assert cur.fetchone() == (2, 1, 0, "void", later)
+            cur.execute(
+                """
+                SELECT length, start_tick, end_tick, outcome, outcome_tick
+                FROM orrery_adjudication_defer_streaks WHERE proposal_id = %s
+                """,
+                (proposal_id,),
+            )
+            assert cur.fetchall() == [(2, earlier, middle, "void", later)]
+
+            # Removing the void reopens the streak.
+            cur.execute(
+                """
+                DELETE FROM orrery_adjudication_log
+                WHERE proposal_id = %s AND action = 'void'
+                """,
+                (proposal_id,),
+            )
+            cur.execute(
+                """
+                SELECT current_streak, last_event
+                FROM orrery_adjudication_proposal_rollups
+                WHERE proposal_id = %s
+                """,
+                (proposal_id,),
+            )
+            assert cur.fetchone() == (2, "defer")
+    finally:
+        conn.rollback()
+        conn.close()
@@ -8,7 +8,10 @@ import pytest
 
 from nexus.agents.orrery import templates as template_module
 from nexus.agents.orrery.catalog import (
+    _PARSERS_BY_KIND,
+    _PREDICATE_PARSERS,
     _collect_vocabulary,
+    _register,
     _render_predicate_name,
     _render_state_delta,
     render_catalog,
@@ -133,6 +136,15 @@ def test_catalog_renders_every_predicate_to_prose() -> None:
     )
 
 
+def test_register_rejects_a_duplicate_kind_prefix() -> None:
+    registered = len(_PREDICATE_PARSERS)
+    with pytest.raises(ValueError, match="'has_tag' already has a registered"):
+        _register(r"has_tag\((?P<tag>\w+)\)", lambda m: "shadow")
+
+    assert len(_PREDICATE_PARSERS) == registered
+    assert len(_PARSERS_BY_KIND) == registered
+
+
 def test_catalog_vocabulary_appendix_collects_referenced_terms() -> None:
     """Vocabulary collector finds tags / events / relationships in templates."""
 
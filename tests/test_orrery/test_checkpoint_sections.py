@@ -0,0 +1,100 @@
+"""Unit tests for content-addressed checkpoint capture (migration 120)."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import pytest
+
+from nexus.agents.orrery import reconstruction
+from nexus.agents.orrery.reconstruction import (
+    CHECKPOINT_SECTIONS,
+    capture_state_checkpoint_sync,
+)
+
+
+class _Cursor:
+    def __init__(self, present: list[str], *, applied: Optional[int] = 120) -> None:
+        self.present = present
+        self.applied = applied
+        self.statements: list[tuple[str, Optional[tuple]]] = []
+        self._row: Any = None
+
+    def execute(self, sql: str, params: Optional[tuple] = None) -> None:
+        self.statements.append((sql, params))
+        if "FROM schema_migrations" in sql:
+            self._row = {
+                "database_name": "save_05",
+                "search_path": "{public}",
+                "ledger": (
+                    None
+                    if self.applied is None
+                    else f"<row><applied>{self.applied}</applied></row>"
+                ),
+            }
+        elif "to_regclass" in sql:
+            assert params is not None
+            self._row = {"present": [n for n in params[0] if n in self.present]}
+        elif "INSERT INTO state_checkpoints" in sql:
+            self._row = {"id": 7}
+        else:
+            raise AssertionError(f"Unexpected SQL: {sql}")
+
+    def fetchone(self) -> Any:
+        return self._row
+
+    def sql(self, fragment: str) -> list[str]:
+        return [sql for sql, _ in self.statements if fragment in sql]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_schema_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(reconstruction, "_checkpoint_schema_cache", {})
+
+
+def test_capture_is_one_server_side_statement_over_section_blobs() -> None:
+    cur = _Cursor(["backstory_secrets", "state_checkpoint_sections"])
+
+    assert capture_state_checkpoint_sync(cur, chunk_id=12, label="interval") == 7
+
+    (capture,) = cur.sql("INSERT INTO state_checkpoints")
+    assert "INSERT INTO state_checkpoint_sections" in capture
+    assert "section_hashes" in capture and "sha256" in capture
+    assert all(f"'{section}'" in capture for section in CHECKPOINT_SECTIONS)
+    assert cur.statements[-1][1] == (12, "interval")
+
+
+def test_schema_probe_runs_once_per_migration_ledger() -> None:
+    cur = _Cursor(["state_checkpoint_sections"])
+
+    capture_state_checkpoint_sync(cur, chunk_id=1, label="interval")
+    capture_state_checkpoint_sync(cur, chunk_id=2, label="interval")
+    assert len(cur.sql("unnest(")) == 1
+    assert "'backstory_secrets'" not in cur.sql("INSERT INTO state_checkpoints")[-1]
+
+    cur.applied, cur.present = 121, ["backstory_secrets", "state_checkpoint_sections"]
+    capture_state_checkpoint_sync(cur, chunk_id=3, label="interval")
+    assert len(cur.sql("unnest(")) == 2
+    assert "'backstory_secrets'" in cur.sql("INSERT INTO state_checkpoints")[-1]
+
+
+def test_pre_section_store_schema_keeps_inline_documents() -> None:
+    cur = _Cursor(["backstory_secrets"], applied=119)
+
+    capture_state_checkpoint_sync(cur, chunk_id=4, label="genesis")
+
+    (capture,) = cur.sql("INSERT INTO state_checkpoints")
+    assert "(chunk_id, label, state)" in capture
+    assert "state_checkpoint_sections" not in capture
+
+
+def test_schema_without_migration_ledger_is_probed_every_capture() -> None:
+    cur = _Cursor(["state_checkpoint_sections"], applied=None)
+
+    capture_state_checkpoint_sync(cur, chunk_id=5, label="interval")
+    capture_state_checkpoint_sync(cur, chunk_id=6, label="interval")
+
+    (key_sql, _params) = cur.statements[0]
+    assert "to_regclass('schema_migrations')" in key_sql
+    assert len(cur.sql("unnest(")) == 2
+    assert reconstruction._checkpoint_schema_cache == {}
@@ -176,7 +176,8 @@ def test_verify_skips_checkpoint_that_predates_awareness_section(
         )
         assert base_id is not None
         cur.execute(
-            "UPDATE state_checkpoints SET state = state - 'claim_awareness' "
+            "UPDATE state_checkpoints "
+            "SET section_hashes = section_hashes - 'claim_awareness' "
             "WHERE id = %s",
             (base_id,),
         )
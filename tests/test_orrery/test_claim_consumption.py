@@ -1,5 +1,7 @@
 """Fast contracts for knower-gated claim-consumption predicates."""
 
+import pytest
+
 from nexus.agents.orrery.epistemics import ClaimKnowledge, load_epistemics_hydration
 from nexus.agents.orrery.evidence import resolve_evidence
 from nexus.agents.orrery.resolver import hydrate_world_state
@@ -10,7 +12,7 @@ from nexus.agents.orrery.substrate import (
     knows_claim_about,
     knows_recent_event,
 )
-from tests.test_orrery.test_resolver import FakeSession
+from tests.test_orrery.test_resolver import FakeResult, FakeSession
 
 
 ACTOR = 1
@@ -231,3 +233,120 @@ def test_empty_entity_universe_skips_all_claim_queries() -> None:
     assert session.calls == 0
     assert hydration.claimed_event_scopes == {}
     assert hydration.possessed_claim_knowledge_by_entity == {}
+
+
+class _IndexedSession(FakeSession):
+    """Serve possession from ``claim_possession_index`` alongside the ledgers."""
+
+    def __init__(self, *, indexed_rows, indexed_awareness_rows, **kwargs):
+        super().__init__(**kwargs)
+        self.indexed_rows = indexed_rows
+        self.indexed_awareness_rows = indexed_awareness_rows
+
+    def execute(self, statement, _params=None):
+        sql = str(statement)
+        if "/* orrery:epistemics_hydration:backstory_availability */" in sql:
+            self.executed_sql.append(sql)
+            return FakeResult([{"available": True, "possession_index_available": True}])
+        if "/* orrery:epistemics_hydration:indexed_claims */" in sql:
+            self.executed_sql.append(sql)
+            assert "FROM claim_possession_index p" in sql
+            assert "p.event_chunk_id <= :anchor_chunk_id" in sql
+            assert "p.acquired_chunk_id <= :anchor_chunk_id" in sql
+            assert "world_event_entities" not in sql
+            return FakeResult(self.indexed_rows)
+        if "/* orrery:epistemics_hydration:indexed_awareness */" in sql:
+            self.executed_sql.append(sql)
+            assert "p.claim_id = ANY(:claim_ids)" in sql
+            assert "p.tier <> 'subject'" in sql
+            return FakeResult(self.indexed_awareness_rows)
+        return super().execute(statement, _params)
+
+
+_INDEXED_CLAIM = {
+    "claim_id": 40,
+    "world_event_id": 140,
+    "scope": "bounded",
+    "about_entity_ids": [TARGET],
+}
+_INDEXED_AWARENESS = {
+    "claim_id": 40,
+    "knower_entity_id": ACTOR,
+    "source_tier": "told",
+    "channel": "dyad:associate",
+    "immediate_source_entity_id": TARGET,
+}
+
+
+def test_hydration_reads_possession_index_without_ledger_joins() -> None:
+    """A migrated schema hydrates from the index and skips the ledger queries."""
+
+    session = _IndexedSession(
+        indexed_rows=[_INDEXED_CLAIM],
+        indexed_awareness_rows=[_INDEXED_AWARENESS],
+    )
+    hydration = load_epistemics_hydration(
+        session,
+        entity_ids=(ACTOR, TARGET),
+        recent_event_ids=(),
+        anchor_chunk_id=100,
+    )
+
+    assert hydration.awareness_by_entity == {ACTOR: frozenset({140})}
+    assert hydration.claim_knowledge_by_entity[ACTOR] == (
+        ClaimKnowledge(
+            claim_id=40,
+            world_event_id=140,
+            scope="bounded",
+            source_tier="told",
+            about_entity_ids=frozenset({TARGET}),
+            channel="dyad:associate",
+            immediate_source_entity_id=TARGET,
+        ),
+    )
+    assert not any(
+        "orrery:epistemics_hydration:claims" in sql for sql in session.executed_sql
+    )
+
+
+def test_hydration_parity_check_accepts_matching_ledgers() -> None:
+    """Parity mode replays the ledger joins and returns the indexed result."""
+
+    session = _IndexedSession(
+        indexed_rows=[_INDEXED_CLAIM],
+        indexed_awareness_rows=[_INDEXED_AWARENESS],
+        epistemics_rows=[_INDEXED_CLAIM],
+        epistemics_awareness_rows=[_INDEXED_AWARENESS],
+    )
+    hydration = load_epistemics_hydration(
+        session,
+        entity_ids=(ACTOR, TARGET),
+        recent_event_ids=(),
+        anchor_chunk_id=100,
+        parity_check=True,
+    )
+
+    assert hydration.awareness_by_entity == {ACTOR: frozenset({140})}
+    assert any(
+        "orrery:epistemics_hydration:claims" in sql for sql in session.executed_sql
+    )
+
+
+def test_hydration_parity_check_names_index_drift() -> None:
+    """A stale index is reported by claim and knower instead of served."""
+
+    session = _IndexedSession(
+        indexed_rows=[_INDEXED_CLAIM],
+        indexed_awareness_rows=[],
+        epistemics_rows=[_INDEXED_CLAIM],
+        epistemics_awareness_rows=[_INDEXED_AWARENESS],
+    )
+
+    with pytest.raises(RuntimeError, match=r"pairs \[\(40, 1\)\]"):
+        load_epistemics_hydration(
+            session,
+            entity_ids=(ACTOR, TARGET),
+            recent_event_ids=(),
+            anchor_chunk_id=100,
+            parity_check=True,
+        )
@@ -728,3 +728,67 @@ def test_entity_audit_joins_distorted_delivery_to_real_depth(
     assert delivered_claim_id in knowledge
     assert canonical_claim_id not in knowledge
     assert knowledge[delivered_claim_id]["depth"] == 1
+
+
+def test_possession_index_matches_ledger_hydration_through_mutations(
+    live_connection: Any,
+) -> None:
+    """Migration 122's triggers keep indexed hydration equal to the ledgers."""
+
+    settings = _settings()
+    raw_connection = live_connection.connection.driver_connection
+    with raw_connection.cursor(cursor_factory=RealDictCursor) as cur:
+        cur.execute(
+            "SELECT to_regclass('claim_possession_index') IS NOT NULL AS present"
+        )
+        if not cur.fetchone()["present"]:
+            pytest.skip("slot 5 requires migration 122 for the possession index")
+        source, source_character = _insert_character(cur, "index-source")
+        listener, listener_character = _insert_character(cur, "index-listener")
+        about, _ = _insert_character(cur, "index-about")
+        bystander, _ = _insert_character(cur, "index-bystander")
+        _insert_relationship(cur, source_character, listener_character)
+        mint_chunk, _ = _insert_chunk(cur)
+        claim_id = _insert_claim_about(
+            cur,
+            chunk_id=mint_chunk,
+            source_entity_id=source,
+            about_entity_id=about,
+        )
+        promoted_id = _insert_claim_about(
+            cur,
+            chunk_id=mint_chunk,
+            source_entity_id=about,
+            about_entity_id=bystander,
+        )
+        head_anchor, _ = _insert_chunk(cur, time_delta=timedelta(hours=8))
+        drain_claim_propagation_sync(cur, tick_chunk_id=head_anchor, settings=settings)
+        cur.execute("UPDATE claims SET scope = 'common' WHERE id = %s", (promoted_id,))
+        cur.execute(
+            """
+            INSERT INTO world_event_entities (event_id, role, entity_id)
+            SELECT world_event_id, 'observer', %s FROM claims WHERE id = %s
+            """,
+            (bystander, claim_id),
+        )
+        cur.execute(
+            """
+            DELETE FROM world_event_entities
+            WHERE event_id = (SELECT world_event_id FROM claims WHERE id = %s)
+              AND role = 'target'
+            """,
+            (promoted_id,),
+        )
+
+    for anchor_chunk_id in (mint_chunk, head_anchor, None):
+        hydration = load_epistemics_hydration(
+            live_connection,
+            entity_ids=(source, listener, about, bystander),
+            recent_event_ids=(),
+            anchor_chunk_id=anchor_chunk_id,
+            parity_check=True,
+        )
+        assert promoted_id in {
+            record.claim_id
+            for record in hydration.possessed_claim_knowledge_by_entity[listener]
+        }
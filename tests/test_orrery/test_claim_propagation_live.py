@@ -1126,7 +1126,7 @@ def test_old_checkpoint_without_awareness_section_is_skipped(
         cur.execute(
             """
             UPDATE state_checkpoints
-            SET state = state - 'claim_awareness'
+            SET section_hashes = section_hashes - 'claim_awareness'
             WHERE id = %s
             """,
             (base_checkpoint_id,),
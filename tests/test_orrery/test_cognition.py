@@ -0,0 +1,167 @@
+"""Process-resident Orrery cognition: reuse, invalidation and parity."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+import os
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+
+import nexus.agents.orrery.cognition as cognition_module
+from nexus.agents.orrery.audit import build_catalog
+from nexus.agents.orrery.cognition import (
+    clear_orrery_cognition,
+    load_orrery_cognition,
+    resident_catalog,
+)
+from nexus.agents.orrery.epistemics import EpistemicsPolicy
+from nexus.agents.orrery.substrate import Slot, configure_project_magnitudes
+from nexus.agents.orrery.templates import BUILTIN_TEMPLATES
+from nexus.config.loader import RUNTIME_CONFIG_ENV
+
+
+PROJECTS = {
+    "advance_interval_hours": 24.0,
+    "max_active_per_character": 1,
+    "stall_abandon_threshold": 3,
+    "abandon_after_stalled_world_hours": 168.0,
+    "milestone_magnitude": 0.40,
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache() -> Iterator[None]:
+    clear_orrery_cognition()
+    yield
+    clear_orrery_cognition()
+
+
+def test_consecutive_ticks_share_one_build_matching_inline_setup() -> None:
+    """Equal inputs resolve to the same resident bundle as the inline path."""
+
+    first = load_orrery_cognition(
+        BUILTIN_TEMPLATES, project_settings=dict(PROJECTS), epistemics_settings={}
+    )
+    second = load_orrery_cognition(
+        list(BUILTIN_TEMPLATES),
+        project_settings=dict(PROJECTS),
+        epistemics_settings={},
+    )
+
+    configured = configure_project_magnitudes(BUILTIN_TEMPLATES, first.project_policy)
+    assert second is first
+    assert first.stacks.templates == configured
+    assert first.stacks.actor_only == tuple(
+        t for t in configured if t.required_slots == (Slot.ACTOR,)
+    )
+    assert first.stacks.actor_target == tuple(
+        t for t in configured if t.required_slots == (Slot.ACTOR, Slot.TARGET)
+    )
+    assert first.stacks.unsupported == ()
+    assert sum(
+        len(stack)
+        for stack in (
+            first.stacks.actor_only,
+            first.stacks.actor_target,
+            first.stacks.actor_faction,
+            first.stacks.actor_target_faction,
+        )
+    ) == len(BUILTIN_TEMPLATES)
+
+
+def test_settings_change_rebuilds_configured_stacks() -> None:
+    """A new milestone magnitude is a new digest and new branch magnitudes."""
+
+    before = load_orrery_cognition(
+        BUILTIN_TEMPLATES, project_settings=dict(PROJECTS), epistemics_settings={}
+    )
+    after = load_orrery_cognition(
+        BUILTIN_TEMPLATES,
+        project_settings={**PROJECTS, "milestone_magnitude": 0.55},
+        epistemics_settings={},
+    )
+
+    assert after.digest != before.digest
+    assert after.project_policy.milestone_magnitude == 0.55
+    assert after.stacks.templates == configure_project_magnitudes(
+        BUILTIN_TEMPLATES, after.project_policy
+    )
+    assert after.stacks.templates != before.stacks.templates
+
+
+def test_rebuilt_template_objects_are_never_served_stale_stacks() -> None:
+    """Templates key by identity, so equal ids with new closures rebuild."""
+
+    original = load_orrery_cognition(BUILTIN_TEMPLATES, epistemics_settings={})
+    rebuilt_templates = tuple(
+        replace(template, blurb=template.blurb) for template in BUILTIN_TEMPLATES
+    )
+    rebuilt = load_orrery_cognition(rebuilt_templates, epistemics_settings={})
+
+    assert rebuilt is not original
+    assert rebuilt.stacks.templates[0] is rebuilt_templates[0]
+
+
+def test_omitted_epistemics_reloads_only_when_config_file_changes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """The config-file fallback is read once per file version."""
+
+    config = tmp_path / "nexus.toml"
+    config.write_text("# stand-in\n")
+    monkeypatch.setenv(RUNTIME_CONFIG_ENV, str(config))
+    loads: list[int] = []
+
+    def counted_loader() -> Any:
+        loads.append(1)
+        return EpistemicsPolicy(enabled=True)
+
+    monkeypatch.setattr(cognition_module, "load_epistemics_policy", counted_loader)
+
+    first = load_orrery_cognition(BUILTIN_TEMPLATES)
+    assert load_orrery_cognition(BUILTIN_TEMPLATES) is first
+    stat = config.stat()
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    reloaded = load_orrery_cognition(BUILTIN_TEMPLATES)
+
+    assert len(loads) == 2
+    assert reloaded.digest != first.digest
+    assert reloaded.epistemics_policy == EpistemicsPolicy(enabled=True)
+
+
+def test_resident_catalog_matches_a_fresh_build() -> None:
+    """The dashboard catalog is built once and equals the uncached payload."""
+
+    promote = {"priority_threshold": 80, "magnitude_threshold": 0.35}
+    catalog = resident_catalog(BUILTIN_TEMPLATES, promote_settings=promote)
+
+    assert resident_catalog(BUILTIN_TEMPLATES, promote_settings=promote) is catalog
+    assert catalog == build_catalog(BUILTIN_TEMPLATES, promote_settings=promote)
+
+
+def test_benchmark_inline_setup_matches_resident_cognition() -> None:
+    """The benchmark's pre-cache baseline builds what the cache serves."""
+
+    from scripts.benchmark_cognition_cache import inline_setup, resident_setup
+
+    settings = {
+        "sunhelm": None,
+        "selection": None,
+        "habituation": None,
+        "package_selection": None,
+        "projects": dict(PROJECTS),
+        "epistemics": {"enabled": True},
+    }
+    cognition = resident_setup(settings)
+
+    assert inline_setup(settings) == (
+        cognition.stacks,
+        cognition.need_tuning,
+        cognition.selection,
+        cognition.habituation,
+        cognition.package_selection,
+        cognition.project_policy,
+        cognition.epistemics_policy,
+    )
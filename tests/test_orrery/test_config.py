@@ -96,6 +96,8 @@ def test_orrery_settings_resolve_model_reference() -> None:
     assert settings.orrery.package_selection.window_points == 6.0
     assert settings.orrery.package_selection.temperature == 2.0
     assert settings.orrery.package_selection.exempt_bands == ["crisis_constraint"]
+    assert settings.orrery.package_selection.tick_memo is False
+    assert settings.orrery.package_selection.memo_parity_check is False
     assert settings.orrery.projects.advance_interval_hours == 24.0
     assert settings.orrery.projects.max_active_per_character == 1
     assert settings.orrery.projects.stall_abandon_threshold == 3
@@ -8,12 +8,19 @@ from nexus.agents.orrery.drift import (
     CopresencePair,
     DriftEvent,
     ProjectMilestone,
+    _apply_plan_sync,
     _require_migration_089_async,
     _require_migration_089_sync,
     plan_relationship_drift,
+    relationship_drift_candidate_edges,
     soft_clamp_step,
 )
 from nexus.config.settings_models import OrreryDriftSettings
+from scripts.benchmark_relationship_drift import (
+    candidate_plan,
+    full_plan,
+    synthetic_tick,
+)
 
 
 def _settings(**overrides: object) -> OrreryDriftSettings:
@@ -203,6 +210,86 @@ def test_written_valence_is_quantized_to_twelve_decimal_places() -> None:
     assert edge.new_valence.as_tuple().exponent == -12
 
 
+@pytest.mark.parametrize("seed", range(4))
+def test_candidate_edges_plan_matches_full_graph_plan(seed: int) -> None:
+    tick = synthetic_tick(60, 20, events=8, milestones=2, colocated=12, seed=seed)
+
+    plan = full_plan(tick)
+
+    assert plan.edges
+    assert candidate_plan(tick) == plan
+
+
+def test_copresence_adds_no_candidates_without_elapsed_time() -> None:
+    candidates = relationship_drift_candidate_edges(
+        project_milestones=[],
+        events=[DriftEvent(1, "cooperative", 3, 1), DriftEvent(2, "unrelated", 5, 6)],
+        copresence_pairs=[CopresencePair(7, 8)],
+        elapsed_hours=Decimal("0"),
+        settings=_settings(),
+    )
+
+    assert candidates == ((1, 3), (3, 1))
+
+
+class _UpdateCursor:
+    def __init__(self, existing: set[tuple[int, int]]) -> None:
+        self.existing = existing
+        self.statements: list[tuple[str, list[object]]] = []
+        self.rows: list[dict[str, int]] = []
+
+    def execute(self, sql: str, params: list[object]) -> None:
+        self.statements.append((sql, params))
+        edges = [(params[i], params[i + 1]) for i in range(0, len(params), 3)]
+        self.rows = [
+            {"source_entity_id": source, "target_entity_id": target}
+            for source, target in edges
+            if (source, target) in self.existing
+        ]
+
+    def fetchall(self) -> list[dict[str, int]]:
+        return self.rows
+
+
+def _cooperative_plan() -> object:
+    return plan_relationship_drift(
+        relationships={(1, 2): Decimal("0.1"), (2, 1): Decimal("0.1")},
+        project_milestones=[],
+        events=[DriftEvent(1, "cooperative", 1, 2)],
+        copresence_pairs=[],
+        elapsed_hours=Decimal("0"),
+        settings=_settings(),
+    )
+
+
+def test_plan_is_written_in_one_values_update() -> None:
+    cursor = _UpdateCursor({(1, 2), (2, 1)})
+
+    result = _apply_plan_sync(
+        cursor,
+        plan=_cooperative_plan(),
+        tick_chunk_id=5,
+        world_time=None,
+        epistemics_settings=None,
+    )
+
+    assert result.updated_edges == ((1, 2), (2, 1))
+    assert len(cursor.statements) == 1
+    sql, params = cursor.statements[0]
+    assert "FROM (VALUES" in sql and len(params) == 6
+
+
+def test_batched_update_fails_when_an_edge_disappeared() -> None:
+    with pytest.raises(RuntimeError, match="2->1"):
+        _apply_plan_sync(
+            _UpdateCursor({(1, 2)}),
+            plan=_cooperative_plan(),
+            tick_chunk_id=5,
+            world_time=None,
+            epistemics_settings=None,
+        )
+
+
 class _MigrationGateCursor:
     def execute(self, _sql: str, _params: object) -> None:
         return None
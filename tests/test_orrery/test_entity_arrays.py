@@ -0,0 +1,377 @@
+"""Array kernels must reproduce the scalar copresence and need paths exactly."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import math
+import random
+from typing import Any, Optional
+
+import numpy as np
+import pytest
+
+from nexus.agents.orrery.drift import CopresencePair, copresence_pairs_from_state
+from nexus.agents.orrery.entity_arrays import (
+    accrual_rates,
+    accrue_need_debts,
+    need_applicability,
+    need_severity_levels,
+    need_type_index,
+    severity_thresholds,
+    tag_bitsets,
+)
+from nexus.agents.orrery.needs import (
+    NEED_IMMUNITY_TAGS,
+    NEED_SEVERITY_PREFIX,
+    NEED_TYPES,
+    coerce_need_tuning,
+    effective_debt_score,
+    need_applies_to_tags,
+    severity_for_debt,
+)
+from nexus.agents.orrery.resolver import (
+    _load_need_debt_scores,
+    _present_need_pressure_specs,
+)
+from nexus.agents.orrery.substrate import (
+    INTIMACY_SUPPRESSOR_TAGS,
+    Slot,
+    TravelState,
+    WorldState,
+    count_co_located,
+)
+
+SEEDS = range(25)
+TAGS = tuple(
+    sorted(set().union(*NEED_IMMUNITY_TAGS.values(), INTIMACY_SUPPRESSOR_TAGS))
+) + ("leader", "crowd")
+NOW = datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+
+
+def _random_state(rng: random.Random) -> WorldState:
+    size = rng.randint(0, 40)
+    ids = rng.sample(range(1, 500), size)
+    places = [None] + [rng.randint(1, 1000) for _ in range(rng.randint(1, 6))]
+    return WorldState(
+        tags={
+            entity: frozenset(rng.sample(TAGS, rng.randint(0, 3)))
+            for entity in ids
+            if rng.random() < 0.8
+        },
+        ephemeral_tags={
+            entity: frozenset(rng.sample(TAGS, rng.randint(0, 2)))
+            for entity in ids
+            if rng.random() < 0.4
+        },
+        locations={entity: rng.choice(places) for entity in ids},
+        travel_states={
+            entity: TravelState(status=rng.choice(("in_transit", "at_place")))
+            for entity in ids
+            if rng.random() < 0.2
+        },
+        need_debt_scores={
+            (entity, need): rng.choice((0.0, rng.uniform(-2.0, 30.0)))
+            for entity in ids
+            for need in NEED_TYPES
+            if rng.random() < 0.7
+        },
+    )
+
+
+def _sql_copresence(state: WorldState) -> list[CopresencePair]:
+    """``_COPRESENCE_SQL`` evaluated over the state's characters."""
+
+    def present(entity: int) -> bool:
+        travel = state.travel_states.get(entity)
+        return state.locations[entity] is not None and not (
+            travel and travel.status == "in_transit"
+        )
+
+    return [
+        CopresencePair(first, second)
+        for first in sorted(state.locations)
+        for second in sorted(state.locations)
+        if second > first
+        and present(first)
+        and present(second)
+        and state.locations[first] == state.locations[second]
+    ]
+
+
+def _scalar_co_located(
+    state: WorldState,
+    entity_id: int,
+    with_tag: Optional[str],
+    with_ephemeral: Optional[str],
+) -> int:
+    location_id = state.locations[entity_id]
+    count = 0
+    for other_id, other_location in state.locations.items():
+        if other_id == entity_id or other_location != location_id:
+            continue
+        travel = state.travel_states.get(other_id)
+        if travel and travel.is_in_transit:
+            continue
+        if with_tag and with_tag not in state.tags.get(other_id, frozenset()):
+            continue
+        if with_ephemeral and with_ephemeral not in state.ephemeral_tags.get(
+            other_id, frozenset()
+        ):
+            continue
+        count += 1
+    return count
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_copresence_pairs_match_the_sql_semantics(seed: int) -> None:
+    state = _random_state(random.Random(seed))
+
+    assert list(copresence_pairs_from_state(state)) == _sql_copresence(state)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_count_co_located_matches_the_scalar_scan(seed: int) -> None:
+    rng = random.Random(seed)
+    state = _random_state(rng)
+    arrays = state.entity_arrays()
+
+    # count_co_located rejects a subject without a location before counting.
+    located_ids = [entity for entity, place in state.locations.items() if place]
+    for entity_id in located_ids:
+        for with_tag, with_ephemeral in (
+            (None, None),
+            (rng.choice(TAGS), None),
+            (None, rng.choice(TAGS)),
+            (rng.choice(TAGS), rng.choice(TAGS)),
+        ):
+            expected = _scalar_co_located(state, entity_id, with_tag, with_ephemeral)
+            assert (
+                arrays.co_located_count(
+                    entity_id, with_tag=with_tag, with_ephemeral=with_ephemeral
+                )
+                == expected
+            )
+            travel = state.travel_states.get(entity_id)
+            located = not (travel and travel.is_in_transit)
+            condition = count_co_located(
+                expected, with_tag=with_tag, with_ephemeral=with_ephemeral
+            )
+            assert condition(state, {Slot.ACTOR: entity_id}) is located
+    assert state.entity_arrays() is arrays
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_need_applicability_and_accrual_match_the_scalar_path(seed: int) -> None:
+    rng = random.Random(seed)
+    tuning = coerce_need_tuning(
+        {"accrual_rates": {need: rng.uniform(0.0, 3.0) for need in NEED_TYPES}}
+    )
+    ids = list(range(1, 30))
+    tags = {entity: frozenset(rng.sample(TAGS, rng.randint(0, 3))) for entity in ids}
+    rows = []
+    for _ in range(200):
+        last = rng.choice(
+            (None, NOW, NOW - timedelta(seconds=rng.uniform(-7200, 400_000)))
+        )
+        current = rng.choice((None, NOW, NOW, NOW))
+        debt = rng.choice((0.0, -0.0, rng.uniform(-50.0, 50.0), 1e-300))
+        rows.append((rng.choice(ids), rng.choice(NEED_TYPES), debt, last, current))
+
+    applies = need_applicability(ids, tags)
+    columns = np.array([need_type_index(need) for _, need, _, _, _ in rows])
+    effective = accrue_need_debts(
+        np.array([debt for _, _, debt, _, _ in rows]),
+        np.array(
+            [
+                (current - last).total_seconds() if last and current else 0.0
+                for _, _, _, last, current in rows
+            ]
+        ),
+        accrual_rates(tuning)[columns],
+    ).tolist()
+
+    for (entity, need, debt, last, current), score in zip(rows, effective):
+        assert applies[entity - 1, need_type_index(need)] == need_applies_to_tags(
+            need, tags[entity]
+        )
+        expected = effective_debt_score(
+            need,
+            debt,
+            last_evaluated_at=last,
+            current_world_time=current,
+            tuning=tuning,
+        )
+        assert score == expected
+        assert math.copysign(1.0, score) == math.copysign(1.0, expected)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_severity_levels_match_severity_for_debt(seed: int) -> None:
+    rng = random.Random(seed)
+    # Unordered thresholds too: the scalar path takes the highest level met.
+    tuning = coerce_need_tuning(
+        {
+            "severity_thresholds": {
+                need: {
+                    name: rng.uniform(0.0, 20.0)
+                    for name in ("mild", "moderate", "severe", "critical")
+                }
+                for need in NEED_TYPES
+            }
+        }
+        if seed % 2
+        else {}
+    )
+    debts = np.array(
+        [
+            [rng.choice((0.0, rng.uniform(-1.0, 40.0))) for _ in NEED_TYPES]
+            for _ in range(60)
+        ]
+    )
+
+    levels = need_severity_levels(debts, severity_thresholds(tuning))
+
+    for row, debt_row in enumerate(debts.tolist()):
+        for column, need in enumerate(NEED_TYPES):
+            severity = severity_for_debt(need, debt_row[column], tuning=tuning)
+            assert levels[row, column] == (severity[0] if severity else 0)
+
+
+def _scalar_present_specs(
+    state: WorldState, present_actor_ids: set[int], tuning: Any
+) -> tuple[dict[str, Any], ...]:
+    specs = []
+    for actor_id in sorted(present_actor_ids):
+        for need_type, prefix in NEED_SEVERITY_PREFIX.items():
+            actor_tags = state.tags.get(actor_id, frozenset()) | (
+                state.ephemeral_tags.get(actor_id, frozenset())
+            )
+            if need_type == "intimacy" and INTIMACY_SUPPRESSOR_TAGS & actor_tags:
+                continue
+            debt_score = state.need_debt_scores.get((actor_id, need_type), 0.0)
+            severity = severity_for_debt(need_type, debt_score, tuning=tuning)
+            if severity is None or severity[0] < tuning.pressure.min_severity_level:
+                continue
+            specs.append(
+                {
+                    "actor_entity_id": actor_id,
+                    "need_type": need_type,
+                    "severity_prefix": prefix,
+                    "severity_level": severity[0],
+                    "severity_name": severity[1],
+                    "debt_score": debt_score,
+                }
+            )
+    return tuple(specs)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_present_need_pressure_specs_match_the_scalar_loop(seed: int) -> None:
+    rng = random.Random(seed)
+    state = _random_state(rng)
+    tuning = coerce_need_tuning({"pressure": {"min_severity_level": rng.randint(0, 4)}})
+    present = set(rng.sample(sorted(state.locations), len(state.locations) // 2))
+    present.add(9999)
+
+    specs = _present_need_pressure_specs(
+        state, present_actor_ids=present, need_tuning=tuning
+    )
+
+    assert specs == _scalar_present_specs(state, present, tuning)
+    assert all(type(spec["severity_level"]) is int for spec in specs)
+
+
+def test_present_need_pressure_columns_follow_need_types(monkeypatch) -> None:
+    from nexus.agents.orrery import resolver
+
+    reordered = dict(reversed(list(NEED_SEVERITY_PREFIX.items())))
+    monkeypatch.setattr(resolver, "NEED_SEVERITY_PREFIX", reordered)
+    tuning = coerce_need_tuning({"pressure": {"min_severity_level": 1}})
+    state = WorldState(
+        need_debt_scores={
+            (1, need): 5.0 * index for index, need in enumerate(NEED_TYPES)
+        }
+    )
+
+    specs = _present_need_pressure_specs(
+        state, present_actor_ids={1}, need_tuning=tuning
+    )
+
+    assert specs
+    need_types = [spec["need_type"] for spec in specs]
+    assert need_types == sorted(need_types, key=NEED_TYPES.index)
+    for spec in specs:
+        need_type = spec["need_type"]
+        assert spec["debt_score"] == 5.0 * NEED_TYPES.index(need_type)
+        assert spec["severity_prefix"] == NEED_SEVERITY_PREFIX[need_type]
+        severity = severity_for_debt(need_type, spec["debt_score"], tuning=tuning)
+        assert severity is not None and spec["severity_level"] == severity[0]
+
+
+class _NeedRowsSession:
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.rows = rows
+
+    def execute(self, statement: Any, params: Any = None) -> Any:
+        assert "orrery:need_debt_scores" in str(statement)
+        return self
+
+    def mappings(self) -> list[dict[str, Any]]:
+        return self.rows
+
+
+def test_need_debt_hydration_keeps_row_keys_and_drops_immune_needs() -> None:
+    rows = [
+        {
+            "character_entity_id": 1,
+            "need_type": "SLEEP",
+            "debt_score": 2,
+            "last_evaluated_at": NOW - timedelta(hours=3),
+        },
+        {
+            "character_entity_id": 2,
+            "need_type": "hunger",
+            "debt_score": None,
+            "last_evaluated_at": None,
+        },
+        {
+            "character_entity_id": 2,
+            "need_type": "intimacy",
+            "debt_score": 5.0,
+            "last_evaluated_at": NOW,
+        },
+    ]
+    tuning = coerce_need_tuning({})
+    scores = _load_need_debt_scores(
+        _NeedRowsSession(rows),
+        current_world_time=NOW,
+        need_tuning=tuning,
+        tags_by_entity={2: frozenset({"libido_absent"})},
+    )
+
+    assert scores == {
+        (1, "SLEEP"): 2.0 + 3 * tuning.accrual_rates["sleep"],
+        (2, "hunger"): 0.0,
+    }
+    with pytest.raises(ValueError, match="Unsupported Orrery need type"):
+        _load_need_debt_scores(
+            _NeedRowsSession([dict(rows[0], need_type="boredom")]),
+            current_world_time=NOW,
+            need_tuning=tuning,
+            tags_by_entity={},
+        )
+
+
+def test_tag_bitsets_reject_vocabularies_wider_than_a_word() -> None:
+    with pytest.raises(ValueError, match="at most 64"):
+        tag_bitsets([1], {}, [f"tag_{index}" for index in range(65)])
+
+
+def test_benchmark_scaling_rows_agree_with_the_scalar_tick() -> None:
+    from scripts.benchmark_entity_arrays import compare
+
+    result = compare(200, repeats=1)
+
+    assert result["entities"] == 200
+    assert result["identical"] is True
+    assert result["pairs"] > 0
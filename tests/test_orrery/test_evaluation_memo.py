@@ -0,0 +1,232 @@
+"""Tick-scoped memoization of binding digests and package gates."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+import nexus.agents.orrery.substrate as substrate
+from nexus.agents.orrery.substrate import (
+    ALWAYS,
+    Branch,
+    DriveBand,
+    Slot,
+    Template,
+    TickEvaluationContext,
+    WorldState,
+    coerce_package_selection,
+    evaluate_stack,
+)
+
+STATE = WorldState(tags={1: frozenset({"leader"})}, current_tick=722)
+
+
+def _template(template_id: str, gate: Any, priority: int = 50) -> Template:
+    return Template(
+        id=template_id,
+        priority=priority,
+        drive_band=DriveBand.PROJECT_IDENTITY,
+        blurb="Synthetic memo surface.",
+        required_slots=(Slot.ACTOR, Slot.TARGET),
+        package_gate=gate,
+        branches=(Branch("act", ALWAYS, "{actor} acts on {target}."),),
+    )
+
+
+def _counted_gate(calls: list[Any]) -> Any:
+    def actor_is_leader(state: WorldState, bindings: Any) -> bool:
+        calls.append(bindings[Slot.ACTOR])
+        return "leader" in state.tags.get(bindings[Slot.ACTOR], frozenset())
+
+    return actor_is_leader
+
+
+def test_gate_reading_only_the_actor_is_reused_across_targets() -> None:
+    calls: list[Any] = []
+    stack = (_template("lead", _counted_gate(calls)),)
+    context = TickEvaluationContext(STATE)
+
+    winners = [
+        evaluate_stack(
+            stack, STATE, {Slot.ACTOR: actor, Slot.TARGET: target}, context=context
+        )
+        for actor in (1, 2)
+        for target in (3, 4, 5)
+    ]
+
+    assert [winner is not None for winner in winners] == [True] * 3 + [False] * 3
+    assert calls == [1, 2]
+    stats = context.stats()
+    assert (stats["gate_hits"], stats["gate_misses"]) == (4, 2)
+    assert (stats["binding_hash_hits"], stats["binding_hash_misses"]) == (6, 6)
+
+
+def test_short_circuit_read_sets_are_memoized_per_path() -> None:
+    """An AND that stops on the actor must not answer for one that reads on."""
+
+    def target_is_three(state: WorldState, bindings: Any) -> bool:
+        return bindings.get(Slot.TARGET) == 3
+
+    gate = substrate.CompoundCondition("AND", (_counted_gate([]), target_is_three))
+    context = TickEvaluationContext(STATE)
+
+    outcomes = [
+        context.package_gate(gate, STATE, {Slot.ACTOR: actor, Slot.TARGET: target})
+        for actor, target in ((2, 3), (1, 4), (2, 4), (1, 3), (1, 4))
+    ]
+
+    assert outcomes == [False, False, False, True, False]
+    assert context.stats()["gate_hits"] == 2
+
+
+def test_new_state_object_invalidates_gate_outcomes() -> None:
+    calls: list[Any] = []
+    gate = _counted_gate(calls)
+    context = TickEvaluationContext(STATE)
+    bindings = {Slot.ACTOR: 1, Slot.TARGET: 2}
+    rehydrated = WorldState(current_tick=722)
+
+    assert context.package_gate(gate, STATE, bindings) is True
+    assert context.package_gate(gate, rehydrated, bindings) is False
+    assert context.package_gate(gate, rehydrated, bindings) is False
+    context.invalidate()
+    assert context.package_gate(gate, rehydrated, bindings) is False
+
+    assert calls == [1, 1, 1]
+    assert context.stats()["invalidations"] == 2
+
+
+def test_mutating_gate_still_fails_loudly_through_the_memo() -> None:
+    def mutating_gate(state: WorldState, bindings: Any) -> bool:
+        bindings[Slot.TARGET] = 99
+        return True
+
+    context = TickEvaluationContext(STATE)
+
+    with pytest.raises(RuntimeError, match="pure-predicate contract"):
+        evaluate_stack(
+            (_template("mutating_gate", mutating_gate),),
+            STATE,
+            {Slot.ACTOR: 1, Slot.TARGET: 2},
+            context=context,
+        )
+    assert context.stats()["gate_uncached"] == 1
+
+
+def test_parity_check_catches_a_gate_that_reads_outside_its_inputs() -> None:
+    flips = iter((True, False))
+
+    def impure_gate(state: WorldState, bindings: Any) -> bool:
+        return next(flips)
+
+    context = TickEvaluationContext(STATE, verify=True)
+    bindings = {Slot.ACTOR: 1, Slot.TARGET: 2}
+
+    assert context.package_gate(impure_gate, STATE, bindings) is True
+    with pytest.raises(RuntimeError, match="impure_gate.*disagrees"):
+        context.package_gate(impure_gate, STATE, bindings)
+
+
+def test_gates_that_never_hit_are_bypassed_after_probing() -> None:
+    calls: list[Any] = []
+
+    def pair_gate(state: WorldState, bindings: Any) -> bool:
+        calls.append(bindings[Slot.TARGET])
+        return bindings[Slot.ACTOR] < bindings[Slot.TARGET]
+
+    context = TickEvaluationContext(STATE)
+    probes = substrate._GATE_ADMISSION_PROBES
+    for target in range(probes + 2):
+        context.package_gate(pair_gate, STATE, {Slot.ACTOR: 1, Slot.TARGET: target})
+
+    stats = context.stats()
+    assert len(calls) == probes + 2
+    assert (stats["gate_misses"], stats["gate_uncached"]) == (probes, 2)
+
+
+def test_package_selection_coercion_reads_memo_switches() -> None:
+    raw = {
+        "mode": "argmax",
+        "window_points": 6.0,
+        "temperature": 2.0,
+        "exempt_bands": ["crisis_constraint"],
+        "tick_memo": True,
+        "memo_parity_check": True,
+    }
+
+    policy = coerce_package_selection(raw)
+
+    assert policy is not None
+    assert (policy.tick_memo, policy.memo_parity_check) == (True, True)
+    del raw["tick_memo"], raw["memo_parity_check"]
+    legacy = coerce_package_selection(raw)
+    assert legacy is not None
+    assert (legacy.tick_memo, legacy.memo_parity_check) == (False, False)
+
+
+@pytest.mark.parametrize("event_scan", (0, 16))
+def test_benchmark_memo_tick_matches_plain_tick(event_scan: int) -> None:
+    from scripts.benchmark_tick_evaluation_memo import compare
+
+    result = compare(6, 3, repeats=1, event_scan=event_scan, verify=True)
+
+    assert result["identical"] is True
+    assert result["gate_hits"] > 0
+
+
+def test_resolver_tick_memo_proposes_the_same_drafts() -> None:
+    from nexus.agents.orrery.resolver import resolve_dry_run
+    from nexus.agents.orrery.substrate import PackageSelection
+    from tests.test_orrery.test_resolver import FakeSession
+
+    def leader_gate(state: WorldState, bindings: Any) -> bool:
+        return bindings[Slot.ACTOR] in (7, 8)
+
+    templates = tuple(
+        Template(
+            id=f"candidate_{index}",
+            priority=50 - index,
+            drive_band=DriveBand.PROJECT_IDENTITY,
+            blurb="Synthetic memo surface.",
+            required_slots=(Slot.ACTOR,),
+            package_gate=leader_gate,
+            branches=(Branch("act", ALWAYS, "{actor} acts."),),
+        )
+        for index in range(3)
+    )
+
+    def proposal(tick_memo: bool) -> list[tuple[Any, ...]]:
+        result = resolve_dry_run(
+            FakeSession(
+                active_entity_rows=[{"id": 7}, {"id": 8}],
+                chunk_ref_actor_rows=[{"entity_id": 7}, {"entity_id": 8}],
+                location_rows=[
+                    {"entity_id": 7, "current_location": 10},
+                    {"entity_id": 8, "current_location": 10},
+                ],
+                entity_name_rows=[{"id": 7, "name": "Seven"}, {"id": 8, "name": "Ate"}],
+                max_chunk_id=4242,
+            ),
+            templates,
+            anchor_chunk_id=4242,
+            window_chunks=30,
+            package_selection_settings=PackageSelection(
+                mode="stochastic",
+                window_points=6.0,
+                temperature=2.0,
+                exempt_bands=frozenset(),
+                tick_memo=tick_memo,
+                memo_parity_check=tick_memo,
+            ),
+            epistemics_settings={},
+        )
+        return [
+            (draft.template_id, draft.binding_hash, draft.bindings)
+            for draft in result.resolutions
+        ]
+
+    plain = proposal(False)
+
+    assert len(plain) == 2
+    assert proposal(True) == plain
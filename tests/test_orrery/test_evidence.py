@@ -27,7 +27,9 @@ from nexus.agents.orrery.demo import _all_preset_names, _resolve_preset
 from nexus.agents.orrery.evidence import (
     _RESOLVERS,
     EvidenceResolutionError,
+    _parse_leaf,
     resolve_evidence,
+    resolve_evidence_batch,
 )
 from nexus.agents.orrery.epistemics import ClaimKnowledge
 from nexus.agents.orrery.explain import explain_stack
@@ -389,6 +391,50 @@ def test_always_never_and_unknown_names() -> None:
         resolve_evidence("summon_dragon(@actor)", RICH_STATE, BINDINGS)
 
 
+def test_batch_matches_per_leaf_resolution_and_shares_repeats() -> None:
+    names = [predicate.__name__ for predicate in FACTORY_SWEEP]
+    names += ["ALWAYS", names[0], names[4]]
+
+    batch = resolve_evidence_batch(names, RICH_STATE, BINDINGS)
+
+    assert list(batch) == list(dict.fromkeys(names))
+    for name in names:
+        assert batch[name] == resolve_evidence(name, RICH_STATE, BINDINGS), name
+    # Per-entity derivations are scoped to the batch, not leaked past it.
+    other = WorldState(tags={ACTOR: frozenset({"fugitive"})})
+    assert resolve_evidence(is_hidden().__name__, other, BINDINGS)["matched"] == [
+        "fugitive"
+    ]
+
+
+def test_leaf_names_parse_once() -> None:
+    name = has_need_debt_at_or_above("sleep", 8).__name__
+    _parse_leaf.cache_clear()
+
+    resolve_evidence(name, RICH_STATE, BINDINGS)
+    resolve_evidence(name, RICH_STATE, {Slot.ACTOR: 3})
+    # The batch resolves a repeated name once.
+    resolve_evidence_batch([name, name], RICH_STATE, BINDINGS)
+
+    info = _parse_leaf.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+    with pytest.raises(EvidenceResolutionError, match="matched no catalog parser"):
+        resolve_evidence("has_tag(no_slot_marker)", RICH_STATE, BINDINGS)
+
+
+def test_benchmark_world_explains_identically_per_leaf_and_batched() -> None:
+    from scripts.benchmark_explain_evidence import (
+        explain_tick,
+        per_leaf_evidence,
+        synthetic_world,
+    )
+
+    state, binding_sets = synthetic_world(12, 4, seed=3)
+    with per_leaf_evidence():
+        per_leaf = explain_tick(state, binding_sets)
+    assert explain_tick(state, binding_sets) == per_leaf
+
+
 def test_explain_stack_traces_carry_evidence() -> None:
     """The inspector consumes evidence through the explain payload."""
 
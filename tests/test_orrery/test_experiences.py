@@ -287,8 +287,10 @@ def test_embedding_upsert_binds_each_correct_experience_id(
         def get_available_models(self) -> list[str]:
             return ["test-embed"]
 
-        def generate_embedding(self, text: str, _model: str) -> list[float]:
-            return [float(len(text)), 1.0]
+        def generate_embeddings_batch(
+            self, texts: list[str], _model: str, batch_size: int | None = None
+        ) -> list[list[float]]:
+            return [[float(len(text)), 1.0] for text in texts]
 
     monkeypatch.setattr(
         "nexus.api.db_pool.get_connection",
@@ -319,5 +321,10 @@ def test_embedding_upsert_binds_each_correct_experience_id(
         for sql, params in write_cursor.executions
         if sql.startswith("INSERT INTO character_experience_embeddings_0002d")
     ]
-    assert [params[0] for params in inserts] == [11, 22]
+    # Both experiences share one length bucket, so one statement upserts both;
+    # each id must still be bound to the vector of its own text.
+    assert len(inserts) == 1
+    model, ids, vectors = inserts[0]
+    assert model == "test-embed"
+    assert dict(zip(ids, vectors)) == {11: "[20.0,1.0]", 22: "[24.0,1.0]"}
     assert [row["experience_id"] for row in result] == [11, 22]
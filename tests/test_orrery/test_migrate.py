@@ -31,6 +31,66 @@ def test_discover_migrations_includes_python_and_skips_seed_script(
     ]
 
 
+def test_static_exclusive_tables_reads_lock_taking_statements() -> None:
+    """The planner names tables behind ACCESS EXCLUSIVE statements only."""
+
+    source = """
+    -- ALTER TABLE commented_out ADD COLUMN x int;
+    ALTER TABLE IF EXISTS ONLY narrative_chunks ADD COLUMN y int;
+    DROP TABLE IF EXISTS assets."legacy_traits" CASCADE;
+    TRUNCATE skips;
+    CREATE INDEX ix_places_zone ON places (zone);
+    ALTER TABLE characters ENABLE ALWAYS TRIGGER entity_lexicon_characters;
+    """
+
+    assert migrate.static_exclusive_tables(source) == {
+        "public.narrative_chunks",
+        "assets.legacy_traits",
+        "public.skips",
+        "public.characters",
+    }
+
+
+def test_plan_estimates_from_history_and_packs_databases_onto_workers() -> None:
+    """Estimates use the version's median, then all history, then a default."""
+
+    history = {
+        "116": [{"duration_ms": 100}, {"duration_ms": 300}, {"duration_ms": 200}],
+        "117": [{"duration_ms": 40}],
+    }
+
+    assert migrate.estimate_migration_ms("116", history) == (200, "history")
+    assert migrate.estimate_migration_ms("118", history) == (150, "default")
+    assert migrate.estimate_migration_ms("118", {}) == (
+        migrate.DEFAULT_ESTIMATE_MS,
+        "default",
+    )
+    assert migrate.parallel_estimate_ms([5, 4, 3, 3], jobs=2) == 8
+    assert migrate.parallel_estimate_ms([5, 4, 3, 3], jobs=6) == 5
+    assert migrate.parallel_estimate_ms([5, 4, 3, 3], jobs=1) == 15
+
+
+def test_migrate_databases_runs_databases_concurrently(monkeypatch, caplog) -> None:
+    """Every database gets its own worker; serial runs would break the barrier."""
+
+    import threading
+
+    targets = [migrate.TEMPLATE_DB, "save_01", "save_02"]
+    barrier = threading.Barrier(len(targets), timeout=5)
+
+    def fake_migrate(dbname, dry_run=False, skip_locked=True):
+        barrier.wait()
+        migrate.LOG.info("Migrating %s...", dbname)
+        return (1, 0)
+
+    monkeypatch.setattr(migrate, "migrate_database", fake_migrate)
+    with caplog.at_level("INFO", logger="nexus.migrate"):
+        results = migrate.migrate_databases(targets, jobs=len(targets))
+
+    assert results == {dbname: (1, 0) for dbname in targets}
+    assert "[save_02] Migrating save_02..." in caplog.messages
+
+
 def test_relationship_valence_migration_uses_explicit_mapping() -> None:
     """Issue #213's view column uses an explicit enum-to-int contract."""
 
@@ -426,6 +486,47 @@ def test_acquisition_formation_migration_adds_measured_indexes() -> None:
     assert migration_sql.count("COMMENT ON INDEX") == 2
 
 
+def test_reader_change_log_migration_tracks_every_feed_source() -> None:
+    """Migration 114 logs writes to each reader feed's source tables."""
+
+    migration_sql = (
+        Path(__file__).parent.parent.parent / "migrations" / "114_reader_change_log.sql"
+    ).read_text()
+
+    assert "CREATE TABLE IF NOT EXISTS reader_changes" in migration_sql
+    assert "PRIMARY KEY (feed, row_id)" in migration_sql
+    assert "pg_current_xact_id()::text::bigint" in migration_sql
+    for table, args in (
+        ("places", "'places', 'id'"),
+        ("characters", "'characters', 'id'"),
+        ("assets.character_images", "'characters', 'character_id'"),
+        ("factions", "'factions', 'id'"),
+        ("zones", "'zones', 'id'"),
+        ("chunk_metadata", "'outline', 'chunk_id'"),
+        ("narrative_chunks", "'outline', 'id'"),
+    ):
+        assert (
+            f"AFTER INSERT OR UPDATE OR DELETE ON {table}\n"
+            f"FOR EACH ROW EXECUTE FUNCTION note_reader_change({args});"
+        ) in migration_sql
+
+
+def test_places_viewport_migration_indexes_the_geometry_cast() -> None:
+    """Migration 115 indexes the expression the map viewport routes filter on."""
+
+    migration_sql = (
+        Path(__file__).parent.parent.parent
+        / "migrations"
+        / "115_places_coordinates_gist.sql"
+    ).read_text()
+
+    assert "CREATE INDEX IF NOT EXISTS ix_places_coordinates_geometry" in (
+        migration_sql
+    )
+    assert "ON places USING GIST ((coordinates::geometry))" in migration_sql
+    assert "COMMENT ON INDEX ix_places_coordinates_geometry" in migration_sql
+
+
 def test_scene_weather_migration_adds_closed_override_contract() -> None:
     """Migration 094 stores only the ruled five-value weather vocabulary."""
 
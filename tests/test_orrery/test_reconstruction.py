@@ -64,7 +64,8 @@ def test_checkpoint_captures_every_section_and_is_idempotent() -> None:
             assert checkpoint_id is not None
 
             cur.execute(
-                "SELECT state FROM state_checkpoints WHERE id = %s",
+                "SELECT state_checkpoint_document(state, section_hashes) "
+                "FROM state_checkpoints WHERE id = %s",
                 (checkpoint_id,),
             )
             state = cur.fetchone()[0]
@@ -98,6 +99,41 @@ def test_checkpoint_captures_every_section_and_is_idempotent() -> None:
         conn.close()
 
 
+def test_unchanged_sections_are_stored_once_across_checkpoints() -> None:
+    conn = _connect()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT max(id) FROM narrative_chunks")
+            chunk_id = cur.fetchone()[0]
+            first = capture_state_checkpoint_sync(
+                cur, chunk_id=chunk_id, label="manual"
+            )
+            cur.execute("SELECT count(*) FROM state_checkpoint_sections")
+            stored = cur.fetchone()[0]
+            second = capture_state_checkpoint_sync(
+                cur, chunk_id=chunk_id, label="interval"
+            )
+
+            cur.execute("SELECT count(*) FROM state_checkpoint_sections")
+            assert cur.fetchone()[0] == stored
+            cur.execute(
+                """
+                SELECT state IS NULL, section_hashes,
+                       state_checkpoint_document(state, section_hashes)
+                FROM state_checkpoints WHERE id IN (%s, %s) ORDER BY id
+                """,
+                (first, second),
+            )
+            (inline_a, hashes_a, doc_a), (inline_b, hashes_b, doc_b) = cur.fetchall()
+            assert inline_a and inline_b
+            assert hashes_a == hashes_b
+            assert doc_a == doc_b
+            assert set(doc_a) == set(hashes_a)
+    finally:
+        conn.rollback()
+        conn.close()
+
+
 def test_skald_state_updates_are_ledgered() -> None:
     conn = _connect()
     try:
@@ -202,6 +202,20 @@ def _apply_migration_074(cur: Any) -> None:
     cur.execute(Path("migrations/074_plan_relocation_projects.sql").read_text())
 
 
+def _inline_checkpoint(cur: Any, checkpoint_id: int) -> None:
+    """Rewrite a checkpoint into the pre-migration-120 inline ``state`` shape."""
+
+    cur.execute(
+        """
+        UPDATE state_checkpoints
+        SET state = state_checkpoint_document(state, section_hashes),
+            section_hashes = NULL
+        WHERE id = %s
+        """,
+        (checkpoint_id,),
+    )
+
+
 def _apply_transition(
     cur: Any,
     *,
@@ -479,7 +493,8 @@ def test_post_target_replace_reapplication_is_presence_remainder() -> None:
             )
             assert cur.fetchone() == (later_chunk, "replace", None)
             cur.execute(
-                "SELECT state -> 'entity_tags' FROM state_checkpoints WHERE id = %s",
+                "SELECT state_checkpoint_document(state, section_hashes) "
+                "-> 'entity_tags' FROM state_checkpoints WHERE id = %s",
                 (target_id,),
             )
             target_tags = cur.fetchone()[0]
@@ -1052,7 +1067,10 @@ def test_runtime_maturation_death_replays_without_drift() -> None:
         conn.close()
 
 
-def test_verify_skips_legacy_checkpoint_without_entity_activity() -> None:
+@pytest.mark.parametrize("checkpoint_shape", ["inline", "sections"])
+def test_verify_skips_legacy_checkpoint_without_entity_activity(
+    checkpoint_shape: str,
+) -> None:
     """Pre-section checkpoint documents remain an explicit skip boundary."""
 
     conn = _connect()
@@ -1061,11 +1079,19 @@ def test_verify_skips_legacy_checkpoint_without_entity_activity() -> None:
             head = _head_chunk(cur)
             base_id = capture_state_checkpoint_sync(cur, chunk_id=head, label="manual")
             assert base_id is not None
-            cur.execute(
-                "UPDATE state_checkpoints SET state = state - 'entities' "
-                "WHERE id = %s",
-                (base_id,),
-            )
+            if checkpoint_shape == "inline":
+                _inline_checkpoint(cur, base_id)
+                cur.execute(
+                    "UPDATE state_checkpoints SET state = state - 'entities' "
+                    "WHERE id = %s",
+                    (base_id,),
+                )
+            else:
+                cur.execute(
+                    "UPDATE state_checkpoints "
+                    "SET section_hashes = section_hashes - 'entities' WHERE id = %s",
+                    (base_id,),
+                )
             death_chunk = _fabricate_chunk(
                 cur,
                 None,
@@ -1640,7 +1666,10 @@ def test_verify_catches_unlogged_tag_clear() -> None:
         conn.close()
 
 
-def test_project_transition_window_replays_with_zero_checkpoint_drift() -> None:
+@pytest.mark.parametrize("checkpoint_shape", ["inline", "sections"])
+def test_project_transition_window_replays_with_zero_checkpoint_drift(
+    checkpoint_shape: str,
+) -> None:
     """Every project transition plus a crisis no-op survives checkpoint replay."""
 
     conn = _connect()
@@ -1661,14 +1690,25 @@ def test_project_transition_window_replays_with_zero_checkpoint_drift() -> None:
             # Imported pre-074 checkpoints may lack the additive section.
             # Replay treats that one omission as an empty genesis with an
             # explicit fidelity note, then applies project ledger entries.
-            cur.execute(
-                """
-                UPDATE state_checkpoints
-                SET state = state - 'character_project_states'
-                WHERE id = %s
-                """,
-                (base_id,),
-            )
+            if checkpoint_shape == "inline":
+                _inline_checkpoint(cur, base_id)
+                cur.execute(
+                    """
+                    UPDATE state_checkpoints
+                    SET state = state - 'character_project_states'
+                    WHERE id = %s
+                    """,
+                    (base_id,),
+                )
+            else:
+                cur.execute(
+                    """
+                    UPDATE state_checkpoints
+                    SET section_hashes = section_hashes - 'character_project_states'
+                    WHERE id = %s
+                    """,
+                    (base_id,),
+                )
 
             start_one = _fabricate_chunk(cur, base_time + timedelta(hours=24))
             _apply_transition(
@@ -5,7 +5,7 @@ from typing import Any
 
 import pytest
 
-import nexus.agents.orrery.resolver as resolver_module
+import nexus.agents.orrery.cognition as cognition_module
 from nexus.agents.orrery.audit import explain_dry_run
 from nexus.agents.lore.utils.turn_context import TurnContext
 from nexus.agents.lore.utils.turn_cycle import TurnCycleManager
@@ -57,14 +57,15 @@ def test_resolve_dry_run_with_supplied_epistemics_skips_config_load(
     """A caller-supplied epistemics policy avoids application config I/O."""
 
     load_count = 0
-    original_loader = resolver_module.load_epistemics_policy
+    original_loader = cognition_module.load_epistemics_policy
 
     def counted_loader() -> Any:
         nonlocal load_count
         load_count += 1
         return original_loader()
 
-    monkeypatch.setattr(resolver_module, "load_epistemics_policy", counted_loader)
+    monkeypatch.setattr(cognition_module, "load_epistemics_policy", counted_loader)
+    cognition_module.clear_orrery_cognition()
 
     resolve_dry_run(
         FakeSession(),
@@ -83,14 +84,15 @@ def test_resolve_dry_run_fallback_loads_config_at_most_once(
     """The standalone resolver fallback reads application config only once."""
 
     load_count = 0
-    original_loader = resolver_module.load_epistemics_policy
+    original_loader = cognition_module.load_epistemics_policy
 
     def counted_loader() -> Any:
         nonlocal load_count
         load_count += 1
         return original_loader()
 
-    monkeypatch.setattr(resolver_module, "load_epistemics_policy", counted_loader)
+    monkeypatch.setattr(cognition_module, "load_epistemics_policy", counted_loader)
+    cognition_module.clear_orrery_cognition()
 
     resolve_dry_run(
         FakeSession(),
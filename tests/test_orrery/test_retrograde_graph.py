@@ -8,9 +8,16 @@ it was sampled from.
 
 from __future__ import annotations
 
+import json
+
 import pytest
 
-from nexus.agents.orrery.retrograde_graph import build_candidate_graph
+from nexus.agents.orrery.retrograde_graph import (
+    build_candidate_graph,
+    candidate_graph_build_inputs,
+    canonical_graph_hash,
+    rebuild_candidate_graph,
+)
 
 SCAFFOLDS = {
     "core_entities": [
@@ -101,6 +108,42 @@ def test_graph_is_deterministic_for_identical_inputs() -> None:
     assert _build() == _build()
 
 
+def test_build_inputs_rebuild_the_graph_after_a_jsonb_style_round_trip() -> None:
+    """Key order is lost in jsonb; ordered weight pairs keep the roll exact."""
+
+    graph_settings = {
+        "edge_kind_weights": {"event": 0.5, "relationship": 0.3, "pair_tag": 0.2},
+        "event_open_endpoint_weights": {"place": 0.5, "character": 0.5},
+    }
+    arguments = {
+        "candidate_scaffolds": SCAFFOLDS,
+        "vocabulary": VOCABULARY,
+        "weird": WEIRD,
+        "generate_candidates": 6,
+        "rng_seed_material": "test:mara",
+        "graph_settings": graph_settings,
+        "junction_count": 1,
+    }
+    graph = build_candidate_graph(**arguments)  # type: ignore[arg-type]
+    inputs = candidate_graph_build_inputs(**arguments)  # type: ignore[arg-type]
+    reordered = json.loads(json.dumps(inputs, sort_keys=True))
+
+    assert reordered["graph_settings"]["edge_kind_weights"][0] == ["event", 0.5]
+    assert "summary" not in reordered["candidate_scaffolds"]["core_entities"][0]
+    assert canonical_graph_hash(rebuild_candidate_graph(reordered)) == (
+        canonical_graph_hash(graph)
+    )
+
+
+def test_canonical_hash_ignores_key_order_but_not_edge_order() -> None:
+    graph = _build()
+    reordered = json.loads(json.dumps(graph, sort_keys=True))
+    swapped = dict(graph, dangling_edges=list(reversed(graph["dangling_edges"])))
+
+    assert canonical_graph_hash(reordered) == canonical_graph_hash(graph)
+    assert canonical_graph_hash(swapped) != canonical_graph_hash(graph)
+
+
 def test_shared_entity_junction_is_deterministic_and_kind_compatible() -> None:
     """R3 rolls two distinct edge legs around one shared unknown entity."""
 
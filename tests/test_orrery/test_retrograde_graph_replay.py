@@ -0,0 +1,148 @@
+"""Bulk replay verification of persisted R3 candidate graphs."""
+
+from __future__ import annotations
+
+import copy
+import json
+from typing import Any
+
+import pytest
+
+from nexus.agents.orrery.retrograde_graph import canonical_graph_hash
+from nexus.agents.orrery.retrograde_graph_replay import (
+    packet_graph_record,
+    record_candidate_graph,
+    replay_graph_record,
+    verify_graph_records,
+)
+from nexus.agents.orrery.retrograde_packet import build_seed_generation_request
+from nexus.agents.orrery.retrograde_vocabulary import (
+    enumerate_seed_eligible_vocabulary,
+)
+
+
+def _packet(*names: str) -> dict[str, Any]:
+    request = build_seed_generation_request(
+        candidate_scaffolds={
+            "core_entities": [
+                {"kind": "character", "role": "protagonist", "name": name}
+                for name in names
+            ]
+        },
+        vocabulary=enumerate_seed_eligible_vocabulary(),
+        weird={"level": "high", "raw_min": 0.55, "raw_max": 0.9},
+    )
+    # Stored rows come back from jsonb: same content, keys reordered.
+    return {"seed_generation_request": json.loads(json.dumps(request, sort_keys=True))}
+
+
+def _record(record_id: int, *names: str) -> dict[str, Any]:
+    record = packet_graph_record(_packet(*names), label=str(record_id))
+    return dict(record, id=record_id, source="wizard")
+
+
+class _RecordCursor:
+    def __init__(self, *, table_present: bool = True) -> None:
+        self.table_present = table_present
+        self.inserts: list[tuple[Any, ...]] = []
+        self._row: Any = None
+
+    def execute(self, sql: str, params: Any = None) -> None:
+        if "graph_records_available" in sql:
+            self._row = {"available": self.table_present}
+        elif "record_graph" in sql:
+            self.inserts.append(params)
+            self._row = {"id": 41}
+        else:
+            raise AssertionError(f"unexpected query: {sql}")
+
+    def fetchone(self) -> Any:
+        return self._row
+
+
+def test_record_persists_graph_hash_and_build_inputs() -> None:
+    packet = _packet("Mara")
+    graph = packet["seed_generation_request"]["candidate_graph"]
+    cur = _RecordCursor()
+
+    record_id = record_candidate_graph(
+        cur, packet=packet, source="maturation", maturation_job_id=7
+    )
+
+    assert record_id == 41
+    [(source, job_id, version, graph_hash, inputs, stored)] = cur.inserts
+    assert (source, job_id, version) == ("maturation", 7, 2)
+    assert graph_hash == canonical_graph_hash(graph)
+    assert json.loads(stored) == graph
+    assert json.loads(inputs)["rng_seed_material"] == "retrograde_graph_v1:Mara"
+
+
+def test_record_skips_slots_without_the_table_and_packets_without_inputs() -> None:
+    packet = _packet("Mara")
+    legacy = copy.deepcopy(packet)
+    del legacy["seed_generation_request"]["candidate_graph_inputs"]
+    cur = _RecordCursor(table_present=False)
+
+    assert record_candidate_graph(cur, packet=packet, source="wizard") is None
+    assert (
+        record_candidate_graph(_RecordCursor(), packet=legacy, source="wizard") is None
+    )
+    assert cur.inserts == []
+    with pytest.raises(ValueError, match="source"):
+        record_candidate_graph(cur, packet=packet, source="replay")
+
+
+def test_replay_classifies_match_drift_corruption_and_errors() -> None:
+    match = _record(1, "Mara")
+    drifted = _record(2, "Mara")
+    drifted["graph"]["dangling_edges"].reverse()
+    drifted["graph_hash"] = canonical_graph_hash(drifted["graph"])
+    corrupt = _record(3, "Mara")
+    corrupt["graph"]["weird_roll"]["raw"] = 0.0
+    broken = _record(4, "Mara")
+    broken["build_inputs"]["candidate_scaffolds"]["core_entities"] = []
+
+    statuses = [
+        replay_graph_record(record)["status"]
+        for record in (match, drifted, corrupt, broken)
+    ]
+
+    assert statuses == ["match", "drift", "corrupt", "error"]
+    assert replay_graph_record(match)["entity_count"] == 1
+    assert "at least one core entity" in replay_graph_record(broken)["error"]
+
+
+def test_verify_in_worker_processes_groups_drift_by_schema_version() -> None:
+    records = [_record(index, "Mara", f"Npc {index}") for index in range(1, 5)]
+    retired = records[3]
+    retired["schema_version"] = 1
+    retired["graph"]["schema_version"] = 1
+    retired["graph_hash"] = canonical_graph_hash(retired["graph"])
+
+    report = verify_graph_records(records, workers=2)
+
+    assert [result["id"] for result in report["results"]] == [1, 2, 3, 4]
+    assert report["matched"] == 3
+    assert report["by_schema_version"] == {
+        "1": {"records": 1, "match": 0, "drift": 1, "corrupt": 0, "error": 0},
+        "2": {"records": 3, "match": 3, "drift": 0, "corrupt": 0, "error": 0},
+    }
+    assert [item["id"] for item in report["mismatched"]] == [4]
+    assert report["regressions"] == []
+    assert [item["id"] for item in report["retired_mismatches"]] == [4]
+    [profile] = report["build_profile"]
+    assert (profile["entity_count"], profile["builds"]) == (2, 4)
+
+
+def test_verify_rejects_an_empty_pool() -> None:
+    with pytest.raises(ValueError, match="workers"):
+        verify_graph_records([], workers=0)
+
+
+def test_benchmark_cells_hash_identically_across_hash_seeds() -> None:
+    from scripts.benchmark_retrograde_graph_build import sweep
+
+    [cell] = sweep([4], [12], repeats=1, workers=1)
+
+    assert (cell["entities"], cell["vocabulary"]) == (4, 12)
+    assert cell["stable"] is True
@@ -498,6 +498,7 @@ def test_maturation_persistence_uses_injected_epistemics_settings(
         "enabled": True,
         "claim_event_types": ["threat_issued"],
         "aware_roles": ["actor", "target"],
+        "hydration_parity_check": False,
     }
     settings = retrograde_maturation.load_settings_as_dict()
     settings["orrery"]["epistemics"] = injected_policy
@@ -137,6 +137,9 @@ def test_persist_retrograde_history_executes_when_clear() -> None:
     assert manifest["counters"]["pair_tags_inserted"] == 1
     assert manifest["counters"]["relationships_inserted"] == 1
     assert manifest["retrieval"]["embedding_pending_summary_ids"]
+    assert manifest["graph_record_id"] == 1
+    [(source, job_id, *_rest)] = cur.graph_records
+    assert (source, job_id) == ("wizard", None)
 
 
 def test_persist_retrograde_history_raises_on_blockers() -> None:
@@ -738,6 +738,7 @@ class FakeRetrogradePersistenceCursor:
             int(row["world_event_id"]): dict(row) for row in canonical_rows
         }
         self.inactive_entity_ids = set(inactive_entity_ids or set())
+        self.graph_records: list[tuple[Any, ...]] = []
         self.missing_summary_embedding_models = set(
             missing_summary_embedding_models or set()
         )
@@ -927,18 +928,33 @@ class FakeRetrogradePersistenceCursor:
                 }
             )
             self._result = [{"id": int(params[2])}]
-        elif "SELECT to_regclass" in sql:
-            self._result = [{"checkpoint_table": "backstory_secrets"}]
-        elif "jsonb_build_object" in sql:
-            # #552 single-statement capture: one coherent document.
-            self._result = [{"doc": {}}]
+        elif "FROM schema_migrations" in sql:
+            self._result = [
+                {
+                    "database_name": "retrograde_fake",
+                    "search_path": "{public}",
+                    "ledger": "<row><applied>120</applied></row>",
+                }
+            ]
+        elif "orrery:retrograde:graph_records_available" in sql:
+            self._result = [{"available": True}]
+        elif "orrery:retrograde:record_graph" in sql:
+            assert params is not None
+            self.graph_records.append(tuple(params))
+            self._result = [{"id": len(self.graph_records)}]
+        elif "to_regclass" in sql:
+            assert params is not None
+            self._result = [{"present": list(params[0])}]
+        elif "INSERT INTO state_checkpoints" in sql:
+            # #552 single-statement capture: one coherent document, stored
+            # server-side as content-addressed sections.
+            assert "INSERT INTO state_checkpoint_sections" in sql
+            self._result = [{"id": 904}]
         elif "jsonb_agg(to_jsonb(t))" in sql:
             self._result = [{"state": []}]
         elif "FROM orrery_maturation_jobs" in sql and "persisted" in sql:
             # Issue #552 checkpoint control key: no succeeded jobs in fixture.
             self._result = [{"coalesce": []}]
-        elif "INSERT INTO state_checkpoints" in sql:
-            self._result = [{"id": 904}]
         else:
             raise AssertionError(f"Unexpected SQL: {sql}")
 
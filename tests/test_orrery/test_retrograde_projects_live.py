@@ -587,7 +587,8 @@ def test_wizard_genesis_checkpoint_carries_seeded_project_through_replay(
             )
         cur.execute(
             """
-            SELECT state -> 'character_project_states'
+            SELECT state_checkpoint_document(state, section_hashes)
+                   -> 'character_project_states'
             FROM state_checkpoints WHERE id = %s
             """,
             (base_id,),
@@ -1623,7 +1624,8 @@ def test_checkpoints_without_control_key_keep_legacy_window(
             cur, chunk_id=target_chunk, label="manual"
         )
         cur.execute(
-            "UPDATE state_checkpoints SET state = state - '_maturation_jobs_succeeded' "
+            "UPDATE state_checkpoints "
+            "SET section_hashes = section_hashes - '_maturation_jobs_succeeded' "
             "WHERE id IN (%s, %s)",
             (base_id, target_id),
         )
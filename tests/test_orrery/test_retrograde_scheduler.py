@@ -0,0 +1,292 @@
+"""Footprint-DAG scheduling of leased Retrograde maturation jobs."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Mapping
+
+import pytest
+
+import nexus.agents.orrery.retrograde_maturation as retrograde_maturation
+from nexus.agents.orrery.retrograde_maturation import (
+    _drain_scheduled,
+    _MaturationDraft,
+    _MaturationGeneration,
+)
+from nexus.agents.orrery.retrograde_scheduler import (
+    ScheduledJob,
+    load_maturation_job_footprints,
+    plan_job_dependencies,
+    run_scheduled_jobs,
+)
+from nexus.config.settings_models import OrreryRetrogradeMaturationSettings
+
+
+def _job(key: int, *names: str) -> ScheduledJob:
+    return ScheduledJob(key=key, footprint=frozenset(names))
+
+
+def test_dependencies_point_back_to_every_overlapping_earlier_job() -> None:
+    jobs = [
+        _job(1, "vex", "the drain"),
+        _job(2, "sister anechka"),
+        _job(3, "marlo", "the drain"),
+        _job(4, "vex", "sister anechka"),
+    ]
+
+    assert plan_job_dependencies(jobs) == {1: (), 2: (), 3: (1,), 4: (1, 2)}
+
+
+def test_independent_jobs_generate_concurrently_and_finish_in_lease_order() -> None:
+    """Two disjoint jobs must both be in generate at once to pass the barrier."""
+
+    barrier = threading.Barrier(2, timeout=5)
+    finished: list[tuple[int, str]] = []
+
+    def generate(key: int) -> str:
+        barrier.wait()
+        return f"history-{key}"
+
+    run_scheduled_jobs(
+        [_job(1, "vex"), _job(2, "marlo")],
+        start=lambda key: key,
+        generate=generate,
+        finish=lambda key, _prepared, future: finished.append((key, future.result())),
+        max_workers=2,
+    )
+
+    assert finished == [(1, "history-1"), (2, "history-2")]
+
+
+def test_dependent_job_starts_only_after_its_predecessor_finishes() -> None:
+    events: list[str] = []
+
+    def start(key: int) -> int:
+        events.append(f"start:{key}")
+        return key
+
+    def finish(key: int, _prepared: int, future: Any) -> None:
+        future.result()
+        events.append(f"finish:{key}")
+
+    run_scheduled_jobs(
+        [_job(1, "vex"), _job(2, "marlo"), _job(3, "vex")],
+        start=start,
+        generate=lambda key: key,
+        finish=finish,
+        max_workers=3,
+    )
+
+    assert events.index("start:3") > events.index("finish:1")
+    assert events.index("start:2") < events.index("finish:1")
+    assert [event for event in events if event.startswith("finish")] == [
+        "finish:1",
+        "finish:2",
+        "finish:3",
+    ]
+
+
+def test_jobs_completed_at_start_unblock_dependents_and_skip_finish() -> None:
+    finished: list[int] = []
+
+    run_scheduled_jobs(
+        [_job(1, "vex"), _job(2, "vex")],
+        start=lambda key: None if key == 1 else key,
+        generate=lambda key: key,
+        finish=lambda key, _prepared, future: finished.append(future.result()),
+        max_workers=2,
+    )
+
+    assert finished == [2]
+
+
+def test_generation_errors_surface_through_finish() -> None:
+    outcomes: dict[int, str] = {}
+
+    def generate(key: int) -> str:
+        if key == 1:
+            raise RuntimeError("Skald timed out")
+        return "ok"
+
+    def finish(key: int, _prepared: int, future: Any) -> None:
+        try:
+            outcomes[key] = future.result()
+        except RuntimeError as exc:
+            outcomes[key] = str(exc)
+
+    run_scheduled_jobs(
+        [_job(1, "vex"), _job(2, "vex")],
+        start=lambda key: key,
+        generate=generate,
+        finish=finish,
+        max_workers=2,
+    )
+
+    assert outcomes == {1: "Skald timed out", 2: "ok"}
+
+
+def test_run_rejects_an_empty_pool() -> None:
+    with pytest.raises(ValueError, match="max_workers"):
+        run_scheduled_jobs(
+            [],
+            start=lambda key: key,
+            generate=lambda key: key,
+            finish=lambda *_args: None,
+            max_workers=0,
+        )
+
+
+class _FootprintCursor:
+    """Answers the footprint and project-start relationship queries."""
+
+    def __init__(self) -> None:
+        self._rows: list[Any] = []
+
+    def execute(self, sql: str, params: Any = None) -> None:
+        if "footprint_chunks" in sql:
+            self._rows = [
+                {"id": 10, "raw_text": "Vex slid a chit to Marlo  Quill."},
+                {"id": 11, "raw_text": "Sister Anechka worked alone."},
+            ]
+        elif "footprint_scene" in sql:
+            self._rows = [{"chunk_id": 10, "name": "The Drain"}]
+        elif "project_start_relationships" in sql:
+            self._rows = (
+                [
+                    {
+                        "subject_ref": "Old Hessel",
+                        "object_ref": "Sister Anechka",
+                        "emotional_valence": "-1|wary",
+                    }
+                ]
+                if params == (2,)
+                else []
+            )
+        else:
+            raise AssertionError(f"unexpected query: {sql}")
+
+    def fetchall(self) -> list[Any]:
+        return self._rows
+
+
+def test_footprints_cover_scene_hints_relationships_and_named_leases() -> None:
+    rows = [
+        {
+            "job_id": 1,
+            "entity_id": 1,
+            "entity_name": "Vex",
+            "requesting_chunk_id": 10,
+            "declaration": {
+                "pair_tag_hints": [{"tag": "protects", "other_entity_name": "Rook"}]
+            },
+        },
+        {
+            "job_id": 2,
+            "entity_id": 2,
+            "entity_name": "Sister Anechka",
+            "requesting_chunk_id": 11,
+            "declaration": {},
+        },
+        {
+            "job_id": 3,
+            "entity_id": 3,
+            "entity_name": "Marlo Quill",
+            "requesting_chunk_id": 10,
+            "declaration": {},
+        },
+    ]
+
+    jobs = load_maturation_job_footprints(_FootprintCursor(), rows)
+
+    assert [job.footprint for job in jobs] == [
+        {"vex", "the drain", "marlo quill", "rook"},
+        {"sister anechka", "old hessel"},
+        {"marlo quill", "the drain", "vex"},
+    ]
+    assert plan_job_dependencies(jobs) == {1: (), 2: (), 3: (1,)}
+
+
+class _NullConnection:
+    def __enter__(self) -> "_NullConnection":
+        return self
+
+    def __exit__(self, *_args: Any) -> bool:
+        return False
+
+    def cursor(self, *_args: Any, **_kwargs: Any) -> "_NullConnection":
+        return self
+
+
+def test_scheduled_drain_matches_serial_commits_and_counts_failures(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Loads and commits stay on the drain thread, in lease order."""
+
+    drain_thread = threading.get_ident()
+    rows = [
+        {"job_id": job_id, "entity_kind": "character", "entity_name": name}
+        for job_id, name in ((1, "Vex"), (2, "Marlo"), (3, "Vex"), (4, "Rook"))
+    ]
+    committed: list[int] = []
+    failed: list[int] = []
+
+    monkeypatch.setattr(
+        "nexus.agents.orrery.retrograde_scheduler.load_maturation_job_footprints",
+        lambda _cur, leased: [
+            _job(int(row["job_id"]), row["entity_name"]) for row in leased
+        ],
+    )
+
+    def prepare(_conn: Any, *, row: Mapping[str, Any], **_kwargs: Any) -> Any:
+        assert threading.get_ident() == drain_thread
+        if row["job_id"] == 4:
+            return {"skipped": "already_connected"}
+        return _MaturationDraft(
+            row=row, packet={}, dbname="save_02", retrieval=None, started=0.0
+        )
+
+    def generate(draft: _MaturationDraft, **_kwargs: Any) -> _MaturationGeneration:
+        if draft.row["job_id"] == 2:
+            raise RuntimeError("Skald refused")
+        return _MaturationGeneration(seed_result={}, seed_elapsed=0.0)
+
+    def commit(_conn: Any, draft: _MaturationDraft, *_args: Any, **_kwargs: Any) -> Any:
+        assert threading.get_ident() == drain_thread
+        committed.append(draft.row["job_id"])
+        return {}
+
+    monkeypatch.setattr(retrograde_maturation, "_prepare_maturation", prepare)
+    monkeypatch.setattr(retrograde_maturation, "_generate_maturation", generate)
+    monkeypatch.setattr(retrograde_maturation, "_commit_maturation", commit)
+    monkeypatch.setattr(
+        retrograde_maturation,
+        "_record_maturation_failure",
+        lambda _conn, *, row, **_kwargs: failed.append(row["job_id"]),
+    )
+
+    outcome = _drain_scheduled(
+        _NullConnection(),
+        rows=rows,
+        cfg=OrreryRetrogradeMaturationSettings(max_parallel_jobs=3),
+        settings_dict={},
+        settings=None,
+        slot=2,
+    )
+
+    assert outcome == (3, 1)
+    assert committed == [1, 3]
+    assert failed == [2]
+
+
+def test_benchmark_scheduled_drain_commits_match_serial() -> None:
+    from scripts.benchmark_retrograde_scheduler import (
+        MockSkald,
+        drain,
+        synthetic_batch,
+    )
+
+    batch = synthetic_batch(6, 0.5, seed=3)
+
+    assert drain(batch, skald=MockSkald(0.0), workers=3) == drain(
+        batch, skald=MockSkald(0.0), workers=0
+    )
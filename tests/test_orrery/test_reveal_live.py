@@ -815,7 +815,8 @@ def test_verify_skips_checkpoint_that_predates_backstory_section(
         )
         assert base_id is not None
         cur.execute(
-            "UPDATE state_checkpoints SET state = state - 'backstory_secrets' "
+            "UPDATE state_checkpoints "
+            "SET section_hashes = section_hashes - 'backstory_secrets' "
             "WHERE id = %s",
             (base_id,),
         )
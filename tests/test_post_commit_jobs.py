@@ -0,0 +1,431 @@
+"""Tests for the durable post-commit outbox and its per-slot runner."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from nexus.api import post_commit_jobs
+from nexus.api.post_commit_jobs import (
+    JobHandler,
+    SlotJobRunner,
+    drain_post_commit_jobs_sync,
+    enqueue_accepted_chunk_jobs,
+    enqueue_chunk_embedding,
+    enqueue_post_commit_job,
+    load_post_commit_status_sync,
+)
+
+
+class _Outbox:
+    """In-memory ``post_commit_jobs`` table with a controllable clock."""
+
+    def __init__(self) -> None:
+        self.rows: Dict[int, Dict[str, Any]] = {}
+        self.now = 1000.0
+        self.lock = threading.Lock()
+
+    def connect(self) -> "_Connection":
+        return _Connection(self)
+
+    def by_key(self, kind: str, key: str) -> Dict[str, Any]:
+        return next(
+            row
+            for row in self.rows.values()
+            if row["kind"] == kind and row["idempotency_key"] == key
+        )
+
+
+class _Cursor:
+    def __init__(self, outbox: _Outbox) -> None:
+        self.outbox = outbox
+        self.result: List[Any] = []
+        self.rowcount = 0
+
+    def __enter__(self) -> "_Cursor":
+        return self
+
+    def __exit__(self, *_args: Any) -> bool:
+        return False
+
+    def execute(self, sql: str, params: tuple = ()) -> None:
+        with self.outbox.lock:
+            self._execute(" ".join(sql.split()), params)
+
+    def _execute(self, sql: str, params: tuple) -> None:
+        rows = self.outbox.rows
+        now = self.outbox.now
+        self.result = []
+        self.rowcount = 0
+        if "INSERT INTO post_commit_jobs" in sql:
+            kind, key, chunk_id, payload = params
+            existing = [
+                row
+                for row in rows.values()
+                if row["kind"] == kind and row["idempotency_key"] == key
+            ]
+            if not existing:
+                job_id = len(rows) + 1
+                rows[job_id] = {
+                    "id": job_id,
+                    "kind": kind,
+                    "idempotency_key": key,
+                    "chunk_id": chunk_id,
+                    "payload": json.loads(payload),
+                    "state": "queued",
+                    "attempts": 0,
+                    "available_at": now,
+                    "lease_until": None,
+                    "locked_by": None,
+                    "lease_nonce": None,
+                    "last_error": None,
+                }
+                self.result = [{"id": job_id}]
+            elif "DO UPDATE" in sql and existing[0]["state"] in {"succeeded", "failed"}:
+                existing[0].update(
+                    state="queued", attempts=0, available_at=now, lease_nonce=None
+                )
+                self.result = [{"id": existing[0]["id"]}]
+        elif "/* post_commit:lease */" in sql:
+            kind, limit = params
+            due = [
+                row
+                for row in sorted(
+                    rows.values(), key=lambda r: (r["available_at"], r["id"])
+                )
+                if row["kind"] == kind
+                and (
+                    (row["state"] == "queued" and row["available_at"] <= now)
+                    or (row["state"] == "leased" and row["lease_until"] < now)
+                )
+            ]
+            self.result = [dict(row) for row in due[:limit]]
+        elif sql.startswith("UPDATE post_commit_jobs SET state = 'leased'"):
+            seconds, locked_by, nonce, job_id = params
+            rows[job_id].update(
+                state="leased",
+                lease_until=now + seconds,
+                locked_by=locked_by,
+                lease_nonce=nonce,
+                attempts=rows[job_id]["attempts"] + 1,
+            )
+        elif sql.startswith("UPDATE post_commit_jobs SET state = "):
+            state = sql.split("'")[1]
+            job_id, nonce = params[-2:]
+            row = rows[job_id]
+            if row["state"] != "leased" or row["lease_nonce"] != nonce:
+                return
+            self.rowcount = 1
+            row.update(state=state, lease_until=None)
+            if state == "queued":
+                row.update(available_at=now + params[0], last_error=params[1])
+            elif state == "failed":
+                row["last_error"] = params[0]
+        elif "/* post_commit:next_due */" in sql:
+            pending = [
+                row["available_at"] if row["state"] == "queued" else row["lease_until"]
+                for row in rows.values()
+                if row["state"] in {"queued", "leased"}
+            ]
+            self.result = [(min(pending) - now if pending else None,)]
+        elif "/* post_commit:status */" in sql:
+            counts: Dict[tuple, int] = {}
+            for row in rows.values():
+                counts[(row["kind"], row["state"])] = (
+                    counts.get((row["kind"], row["state"]), 0) + 1
+                )
+            self.result = [
+                {"kind": kind, "state": state, "jobs": jobs}
+                for (kind, state), jobs in counts.items()
+            ]
+        elif "FROM post_commit_jobs WHERE state IN" in sql:
+            self.result = [
+                {key: row[key] for key in ("id", "kind", "state", "last_error")}
+                for row in sorted(rows.values(), key=lambda r: r["id"])
+                if row["state"] in {"queued", "leased", "failed"}
+            ]
+        else:
+            raise AssertionError(f"unexpected query: {sql}")
+
+    def fetchone(self) -> Optional[Any]:
+        return self.result[0] if self.result else None
+
+    def fetchall(self) -> List[Any]:
+        return list(self.result)
+
+
+class _Connection:
+    def __init__(self, outbox: _Outbox) -> None:
+        self.outbox = outbox
+        self.closed = False
+
+    def __enter__(self) -> "_Connection":
+        return self
+
+    def __exit__(self, *_args: Any) -> bool:
+        return False
+
+    def cursor(self, cursor_factory: Any = None) -> _Cursor:
+        return _Cursor(self.outbox)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _drain(outbox: _Outbox, handlers: Dict[str, JobHandler], **kwargs: Any):
+    return drain_post_commit_jobs_sync(
+        "save_05", connect=outbox.connect, handlers=handlers, **kwargs
+    )
+
+
+def test_enqueue_is_idempotent_per_kind_and_key() -> None:
+    outbox = _Outbox()
+    cur = outbox.connect().cursor()
+
+    first = enqueue_post_commit_job(
+        cur, kind="presence_audit", idempotency_key="11", chunk_id=11
+    )
+    assert first == 1
+    assert (
+        enqueue_post_commit_job(
+            cur, kind="presence_audit", idempotency_key="11", chunk_id=11
+        )
+        is None
+    )
+    assert (
+        enqueue_post_commit_job(
+            cur, kind="correspondence_compaction", idempotency_key="11", chunk_id=11
+        )
+        == 2
+    )
+    with pytest.raises(ValueError, match="Unknown post-commit job kind"):
+        enqueue_post_commit_job(cur, kind="bogus", idempotency_key="11", chunk_id=11)
+
+
+def test_embedding_requeues_only_finished_jobs() -> None:
+    outbox = _Outbox()
+    cur = outbox.connect().cursor()
+
+    assert enqueue_chunk_embedding(cur, 7) == 1
+    assert enqueue_chunk_embedding(cur, 7) is None
+    outbox.rows[1].update(state="succeeded", attempts=2)
+
+    assert enqueue_chunk_embedding(cur, 7) == 1
+    assert outbox.rows[1]["state"] == "queued"
+    assert outbox.rows[1]["attempts"] == 0
+
+
+def test_accepted_chunk_jobs_keep_summary_tasks_in_one_ordered_job() -> None:
+    outbox = _Outbox()
+    cur = outbox.connect().cursor()
+    tasks = [
+        SimpleNamespace(kind="episode", season=2, episode=5),
+        SimpleNamespace(kind="season", season=2, episode=None),
+    ]
+
+    job_ids = enqueue_accepted_chunk_jobs(
+        cur,
+        chunk_id=40,
+        parent_chunk_id=39,
+        summary_tasks=tasks,
+        compact_correspondence=False,
+        audit_presence=True,
+    )
+
+    assert job_ids == [1, 2]
+    summary = outbox.by_key("summary", "S02E05+S02")
+    assert [task["kind"] for task in summary["payload"]["tasks"]] == [
+        "episode",
+        "season",
+    ]
+    assert outbox.by_key("presence_audit", "40")["payload"] == {"parent_chunk_id": 39}
+
+
+def test_failures_back_off_exponentially_then_fail_at_the_attempt_cap() -> None:
+    outbox = _Outbox()
+    cur = outbox.connect().cursor()
+    enqueue_post_commit_job(cur, kind="summary", idempotency_key="S01E01", chunk_id=3)
+
+    def boom(_job: Any, _ctx: Any) -> None:
+        raise RuntimeError("provider unavailable")
+
+    handlers = {"summary": JobHandler(boom, max_attempts=3, backoff_seconds=10)}
+    row = outbox.rows[1]
+
+    first = _drain(outbox, handlers)
+    assert (first.retried, row["state"], row["attempts"]) == (1, "queued", 1)
+    assert row["available_at"] == outbox.now + 10
+    assert first.next_due_seconds == 10
+    assert "provider unavailable" in row["last_error"]
+    # Not due yet: nothing is leased.
+    assert _drain(outbox, handlers).retried == 0
+
+    outbox.now += 10
+    assert _drain(outbox, handlers).retried == 1
+    assert row["available_at"] == outbox.now + 20
+
+    outbox.now += 20
+    last = _drain(outbox, handlers)
+    assert (last.failed, row["state"], row["attempts"]) == (1, "failed", 3)
+    assert last.next_due_seconds is None
+
+
+def test_expired_lease_is_resumed_and_stale_runner_cannot_overwrite() -> None:
+    outbox = _Outbox()
+    cur = outbox.connect().cursor()
+    enqueue_post_commit_job(cur, kind="presence_audit", idempotency_key="8", chunk_id=8)
+    row = outbox.rows[1]
+    # A crashed runner left the job leased.
+    row.update(
+        state="leased", lease_until=outbox.now - 1, lease_nonce="dead", attempts=1
+    )
+
+    def steal_lease(_job: Any, _ctx: Any) -> None:
+        # Another runner re-leases the job while this one is still running.
+        row["lease_nonce"] = "other-runner"
+
+    handlers = {"presence_audit": JobHandler(steal_lease, 3, 10)}
+    result = _drain(outbox, handlers)
+
+    assert row["attempts"] == 2
+    assert result.lost_leases == 1
+    assert row["state"] == "leased"
+    assert row["lease_nonce"] == "other-runner"
+
+
+def test_drain_caps_concurrency_per_kind() -> None:
+    outbox = _Outbox()
+    cur = outbox.connect().cursor()
+    for chunk_id in range(1, 7):
+        enqueue_post_commit_job(
+            cur,
+            kind="chunk_embedding",
+            idempotency_key=str(chunk_id),
+            chunk_id=chunk_id,
+        )
+        enqueue_post_commit_job(
+            cur, kind="presence_audit", idempotency_key=str(chunk_id), chunk_id=chunk_id
+        )
+    active: Dict[str, int] = {"chunk_embedding": 0, "presence_audit": 0}
+    peak: Dict[str, int] = dict(active)
+    lock = threading.Lock()
+
+    def tracked(job: Any, _ctx: Any) -> None:
+        with lock:
+            active[job.kind] += 1
+            peak[job.kind] = max(peak[job.kind], active[job.kind])
+        time.sleep(0.01)
+        with lock:
+            active[job.kind] -= 1
+
+    handlers = {
+        "chunk_embedding": JobHandler(tracked, 3, 10, concurrency=1),
+        "presence_audit": JobHandler(tracked, 3, 10, concurrency=2),
+    }
+    result = _drain(outbox, handlers, max_workers=3)
+
+    assert result.succeeded == 12
+    assert peak == {"chunk_embedding": 1, "presence_audit": 2}
+    assert {row["state"] for row in outbox.rows.values()} == {"succeeded"}
+
+
+def test_runner_coalesces_kicks_into_drains() -> None:
+    outbox = _Outbox()
+    cur = outbox.connect().cursor()
+    ran: List[int] = []
+    release = threading.Event()
+
+    def slow(job: Any, _ctx: Any) -> None:
+        release.wait(5)
+        ran.append(job.chunk_id)
+
+    runner = SlotJobRunner(
+        "save_05",
+        connect=outbox.connect,
+        handlers={"presence_audit": JobHandler(slow, 3, 10, concurrency=2)},
+    )
+    enqueue_post_commit_job(cur, kind="presence_audit", idempotency_key="1", chunk_id=1)
+    runner.kick()
+    enqueue_post_commit_job(cur, kind="presence_audit", idempotency_key="2", chunk_id=2)
+    runner.kick()
+    runner.kick()
+    release.set()
+    runner.join(5)
+
+    assert sorted(ran) == [1, 2]
+    assert not runner.running
+    assert (
+        runner.last_result is not None and runner.last_result.next_due_seconds is None
+    )
+
+
+def test_runner_survives_a_base_exception_and_retries_failed_drains(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    outbox = _Outbox()
+    cur = outbox.connect().cursor()
+    enqueue_post_commit_job(cur, kind="presence_audit", idempotency_key="1", chunk_id=1)
+    outcomes: List[BaseException] = [KeyboardInterrupt(), RuntimeError("db down")]
+
+    def flaky_connect() -> Any:
+        if outcomes:
+            raise outcomes.pop(0)
+        return outbox.connect()
+
+    ran: List[int] = []
+    runner = SlotJobRunner(
+        "save_05",
+        connect=flaky_connect,
+        handlers={
+            "presence_audit": JobHandler(
+                lambda job, _ctx: ran.append(job.chunk_id), 3, 10
+            )
+        },
+    )
+    monkeypatch.setattr(post_commit_jobs, "DRAIN_RETRY_SECONDS", 0.01)
+    monkeypatch.setattr(post_commit_jobs, "MIN_RESCHEDULE_SECONDS", 0.01)
+    monkeypatch.setattr(threading, "excepthook", lambda args: None)
+
+    runner.kick()
+    runner.join(5)
+    assert not runner.running  # the interrupted thread deregistered itself
+
+    runner.kick()  # RuntimeError: logged, then retried on a timer
+    deadline = time.monotonic() + 5
+    while ran != [1] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    runner.join(5)
+
+    assert ran == [1]
+    assert outbox.rows[1]["state"] == "succeeded"
+
+
+def test_kicks_are_no_ops_while_runners_are_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv(post_commit_jobs.RUNNER_ENV, "0")
+
+    post_commit_jobs.kick_post_commit_jobs_for_dbname("save_05")
+
+    assert "save_05" not in post_commit_jobs._RUNNERS
+
+
+def test_status_reports_counts_by_kind_and_failures() -> None:
+    outbox = _Outbox()
+    cur = outbox.connect().cursor()
+    enqueue_post_commit_job(cur, kind="summary", idempotency_key="S01E01", chunk_id=1)
+    enqueue_post_commit_job(cur, kind="presence_audit", idempotency_key="1", chunk_id=1)
+    outbox.rows[2].update(state="failed", last_error="RuntimeError: boom")
+
+    status = load_post_commit_status_sync(outbox.connect().cursor())
+
+    assert status["counts"] == {"queued": 1, "leased": 0, "succeeded": 0, "failed": 1}
+    assert status["by_kind"]["presence_audit"]["failed"] == 1
+    assert set(status["by_kind"]) == set(post_commit_jobs.HANDLERS)
+    assert [job["id"] for job in status["non_terminal_jobs"]] == [1]
+    assert status["failed_jobs"][0]["last_error"] == "RuntimeError: boom"
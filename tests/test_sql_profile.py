@@ -0,0 +1,275 @@
+"""Per-tag SQL profiler regression tests."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import threading
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from nexus import cli
+from nexus.telemetry import sql_profile as sql_profile_module
+from nexus.telemetry.sql_profile import (
+    SqlProfile,
+    active_sql_profile,
+    enrich_report,
+    explain_slowest,
+    instrument_engine,
+    is_explainable,
+    load_pg_stat_statements,
+    load_profile_reports,
+    profiling_cursor_class,
+    recorded_sql_profile,
+    sql_profile,
+    statement_tag,
+    summarize_profile_reports,
+)
+
+
+@pytest.fixture
+def profile_config(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    config = sql_profile_module._ProfileConfig(
+        enabled=True,
+        profile_dir=tmp_path / "sql_profile",
+        log_top=3,
+    )
+    monkeypatch.setattr(sql_profile_module, "_config", config)
+    return config.profile_dir
+
+
+class _FakeCursor:
+    """Minimal DBAPI cursor double standing in for a psycopg2 cursor base."""
+
+    def __init__(self, rowcount: int = 3) -> None:
+        self.rowcount = rowcount
+        self.executed: list[tuple[str, Any]] = []
+
+    def execute(self, query: Any, vars: Any = None) -> None:
+        self.executed.append((query, vars))
+
+    def executemany(self, query: Any, vars_list: Any) -> None:
+        self.executed.append((query, list(vars_list)))
+
+
+def test_statement_tag_prefers_orrery_comment_and_buckets_untagged_sql() -> None:
+    assert (
+        statement_tag("\n  /* orrery:entity_activity */\n  SELECT 1 FROM entities")
+        == "orrery:entity_activity"
+    )
+    assert statement_tag("INSERT INTO world_events (id) VALUES (1)") == (
+        "sql:insert:world_events"
+    )
+    assert statement_tag('UPDATE "characters" SET name = %s') == (
+        "sql:update:characters"
+    )
+    assert statement_tag("DELETE FROM incubator WHERE session_id = %s") == (
+        "sql:delete:incubator"
+    )
+    assert statement_tag("-- note\nSELECT * FROM narrative_chunks") == (
+        "sql:select:narrative_chunks"
+    )
+    assert statement_tag("SAVEPOINT x") == "sql:savepoint"
+
+
+def test_is_explainable_rejects_writes_and_locking_reads() -> None:
+    assert is_explainable("/* orrery:pair_tags */ SELECT * FROM entity_pair_tags")
+    assert is_explainable("WITH active AS (SELECT 1) SELECT * FROM active")
+    assert not is_explainable("WITH moved AS (DELETE FROM t RETURNING *) SELECT 1")
+    assert not is_explainable("SELECT * FROM incubator FOR UPDATE")
+    assert not is_explainable("INSERT INTO t VALUES (1)")
+
+
+def test_profile_ranks_tags_by_total_time_and_keeps_slowest_sample() -> None:
+    profile = SqlProfile("tick", slot=2)
+    profile.record("/* orrery:a */ SELECT 1", {"x": 1}, 2.0, 4)
+    profile.record("/* orrery:a */ SELECT 1", {"x": 2}, 5.0, 1)
+    profile.record("/* orrery:b */ SELECT 2", None, 9.0, 0)
+    profile.record("INSERT INTO t VALUES (1)", None, 1.0, -1, failed=True)
+
+    report = profile.report()
+
+    assert [row["tag"] for row in report["tags"]] == [
+        "orrery:b",
+        "orrery:a",
+        "sql:insert:t",
+    ]
+    first_a = report["tags"][1]
+    assert first_a["calls"] == 2
+    assert first_a["rows"] == 5
+    assert first_a["total_ms"] == pytest.approx(7.0)
+    assert first_a["max_ms"] == pytest.approx(5.0)
+    assert report["tags"][2]["errors"] == 1
+    assert report["statements"] == 4
+    assert report["sql_ms"] == pytest.approx(17.0)
+    assert profile.slowest_statement("orrery:a") == (
+        "/* orrery:a */ SELECT 1",
+        {"x": 2},
+        5.0,
+    )
+
+
+def test_sqlalchemy_engine_records_only_inside_an_active_profile() -> None:
+    engine = instrument_engine(create_engine("sqlite://"))
+    instrument_engine(engine)  # idempotent: listeners must not double-count
+    with Session(engine) as session:
+        session.execute(text("CREATE TABLE places (id INTEGER)"))
+        session.execute(text("INSERT INTO places VALUES (1), (2), (3)"))
+        with sql_profile("tick") as profile:
+            rows = session.execute(
+                text("/* orrery:location_classes */ SELECT id FROM places")
+            ).all()
+            session.execute(text("UPDATE places SET id = id + 1"))
+        session.execute(text("/* orrery:location_classes */ SELECT 1"))
+
+    assert len(rows) == 3
+    report = profile.report()
+    tags = {row["tag"]: row for row in report["tags"]}
+    assert set(tags) == {"orrery:location_classes", "sql:update:places"}
+    assert tags["orrery:location_classes"]["calls"] == 1
+    assert tags["sql:update:places"]["rows"] == 3
+    assert active_sql_profile() is None
+
+
+def test_profiling_cursor_wraps_requested_factory_and_times_execute() -> None:
+    cursor_class = profiling_cursor_class(_FakeCursor)
+    assert profiling_cursor_class(_FakeCursor) is cursor_class
+    assert profiling_cursor_class(cursor_class) is cursor_class
+    cursor = cursor_class(rowcount=7)
+
+    cursor.execute("/* orrery:outside */ SELECT 1")
+    with sql_profile("commit") as profile:
+        cursor.execute(b"INSERT INTO world_events VALUES (1)")
+        cursor.executemany("UPDATE entities SET x = %s", [(1,), (2,)])
+
+    tags = {row["tag"]: row for row in profile.report()["tags"]}
+    assert set(tags) == {"sql:insert:world_events", "sql:update:entities"}
+    assert tags["sql:insert:world_events"]["rows"] == 7
+    assert len(cursor.executed) == 3
+
+
+def test_profiles_do_not_leak_into_threads_started_inside_the_scope() -> None:
+    seen: list[Any] = []
+    with sql_profile("tick"):
+        worker = threading.Thread(target=lambda: seen.append(active_sql_profile()))
+        worker.start()
+        worker.join()
+    assert seen == [None]
+
+
+def test_explain_slowest_skips_writes_and_always_rolls_back_savepoints() -> None:
+    profile = SqlProfile("tick")
+    profile.record("/* orrery:slow_read */ SELECT * FROM t WHERE id = %s", (1,), 9, 1)
+    profile.record("/* orrery:slow_write */ UPDATE t SET x = 1", None, 20, 1)
+    profile.record("/* orrery:fast_read */ SELECT 1", None, 1, 1)
+
+    class ExplainCursor(_FakeCursor):
+        def fetchone(self) -> tuple[Any]:
+            statement = self.executed[-1][0]
+            return ([{"Plan": {"Node Type": "Seq Scan"}, "Statement": statement}],)
+
+    cur = ExplainCursor()
+    plans = explain_slowest(profile, cur, limit=1)
+
+    assert list(plans) == ["orrery:slow_read"]
+    explained = [
+        query for query, _ in cur.executed if query.startswith("EXPLAIN (ANALYZE")
+    ]
+    assert explained == [
+        "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) "
+        "/* orrery:slow_read */ SELECT * FROM t WHERE id = %s"
+    ]
+    assert cur.executed[-2][0] == "ROLLBACK TO SAVEPOINT nexus_sql_profile_explain"
+    report = enrich_report(profile.report(), plans=plans)
+    assert report["tags"][1]["plan"]["Plan"]["Node Type"] == "Seq Scan"
+
+
+def test_pg_stat_statements_aggregates_per_tag_and_tolerates_absence() -> None:
+    class StatCursor(_FakeCursor):
+        def __init__(self, available: bool) -> None:
+            super().__init__()
+            self.available = available
+
+        def fetchone(self) -> tuple[bool]:
+            return (self.available,)
+
+        def fetchall(self) -> list[tuple[Any, ...]]:
+            return [
+                ("/* orrery:pair_tags */ SELECT $1", 10, 50.0, 20, 100, 3),
+                ("/* orrery:pair_tags */ SELECT $1, $2", 5, 25.0, 5, 10, 1),
+                ("INSERT INTO world_events VALUES ($1)", 2, 4.0, 2, 1, 0),
+            ]
+
+    assert load_pg_stat_statements(StatCursor(False)) == {}
+    history = load_pg_stat_statements(StatCursor(True))
+    assert history["orrery:pair_tags"]["calls"] == 15
+    assert history["orrery:pair_tags"]["mean_ms"] == pytest.approx(5.0)
+    assert history["sql:insert:world_events"]["shared_blks_hit"] == 1
+
+
+def test_recorded_profile_appends_report_even_when_scope_fails(
+    profile_config: Path,
+) -> None:
+    with recorded_sql_profile("commit", slot=3) as profile:
+        assert profile is not None
+        profile.record("INSERT INTO narrative_chunks VALUES (1)", ("secret",), 3, 1)
+
+    with pytest.raises(RuntimeError):
+        with recorded_sql_profile("commit", slot=3) as profile:
+            profile.record("INSERT INTO narrative_chunks VALUES (2)", None, 5, 1)
+            raise RuntimeError("commit failed")
+
+    day = profile.started_at.date().isoformat()
+    ledger = profile_config / f"sql-profile-{day}.jsonl"
+    assert "secret" not in ledger.read_text(encoding="utf-8")
+    reports = load_profile_reports(day)
+    assert [report["scope"] for report in reports] == ["commit", "commit"]
+
+    summary = summarize_profile_reports(reports, scope="commit", slot=3)
+    assert summary["scopes"] == 2
+    row = summary["tags"][0]
+    assert row["tag"] == "sql:insert:narrative_chunks"
+    assert row["calls"] == 2
+    assert row["ms_per_scope"] == pytest.approx(4.0)
+
+
+def test_recorded_profile_is_a_no_op_when_disabled(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(
+        sql_profile_module,
+        "_config",
+        sql_profile_module._ProfileConfig(
+            enabled=False, profile_dir=tmp_path, log_top=5
+        ),
+    )
+    with recorded_sql_profile("tick") as profile:
+        assert profile is None
+        assert active_sql_profile() is None
+    assert sql_profile_module.sql_profile_connect_kwargs() == {}
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cli_recorded_summary_reads_the_profile_ledger(
+    profile_config: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    with recorded_sql_profile("tick", slot=5) as profile:
+        profile.record("/* orrery:current_tags */ SELECT 1", None, 4, 10)
+    day = profile.started_at.date().isoformat()
+
+    result = cli.run_sql_profile(
+        argparse.Namespace(recorded=True, day=day, scope="tick", slot=5)
+    )
+    assert result["success"] is True
+    assert result["sql_profile"]["tags"][0]["tag"] == "orrery:current_tags"
+
+    cli.emit_output(result, as_json=False)
+    output = capsys.readouterr().out
+    assert "orrery:current_tags" in output
+    assert "Recorded SQL profile: 1 scope(s)" in output
+    json.dumps(result)
@@ -25,11 +25,12 @@ from nexus.agents.lore.logon_utility import LogonUtility
 from nexus.agents.lore.lore import LORE
 from nexus.agents.orrery.retrograde_markers import RETROGRADE_PROLOGUE_MARKER
 from nexus.api import (
-    commit_handler_sync,
     db_pool,
     narrative,
+    post_commit_jobs,
     presence_audit,
     slot_utils,
+    summary_triggers,
 )
 from nexus.api.narrative_generation import generate_narrative_async
 from nexus.config import load_settings_as_dict
@@ -472,7 +473,7 @@ def _install_route_boundaries(
         lambda _slot: None,
     )
     monkeypatch.setattr(
-        commit_handler_sync,
+        summary_triggers,
         "schedule_summary_generation",
         lambda *_args, **_kwargs: None,
     )
@@ -514,6 +515,12 @@ def _accept_pending(session_id: str, chunk_id: int) -> int:
         )
     )
     assert post_commit_thread is None
+    # The route only kicks the slot's runner; drain the committed outbox
+    # here so the presence audit has run before the test inspects it.
+    dbname = slot_utils.require_slot_dbname(slot=5)
+    post_commit_jobs.drain_post_commit_jobs_sync(
+        dbname, slot=5, connect=lambda: _connect(dbname)
+    )
     return accepted_chunk_id
 
 